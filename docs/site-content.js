@@ -1,25 +1,25 @@
 window.DOC_PAGE_CONTENT = {
-  "overview": "<!-- Generated from README.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP\n\n[![PyPI version](https://badge.fury.io/py/pubmed-search-mcp.svg)](https://badge.fury.io/py/pubmed-search-mcp)\n[![Python 3.10+](https://img.shields.io/badge/python-3.10+-blue.svg)](https://www.python.org/downloads/)\n[![License: Apache 2.0](https://img.shields.io/badge/License-Apache%202.0-blue.svg)](https://opensource.org/licenses/Apache-2.0)\n[![MCP](https://img.shields.io/badge/MCP-Compatible-green.svg)](https://modelcontextprotocol.io/)\n[![CI](https://github.com/u9401066/pubmed-search-mcp/actions/workflows/ci.yml/badge.svg)](https://github.com/u9401066/pubmed-search-mcp/actions/workflows/ci.yml)\n\n> **Professional Literature Research Assistant for AI Agents** - More than just an API wrapper\n\n![PubMed Search MCP research workflow](images/research-workflow.svg)\n\nA Domain-Driven Design (DDD) based MCP server that serves as an intelligent research assistant for AI agents, providing task-oriented literature search and analysis capabilities.\n\n**✨ What's Included:**\n\n- 🔧 **45 MCP Tools** - Streamlined PubMed, Europe PMC, CORE, NCBI database access, and **Research Chronicle / Context Graph**\n- 🛡️ **Multi-Agent Service Mode** - Deploy once and serve many agents: per-tenant sessions, caches, and artifacts, bearer-token auth, and per-tenant fair-share limits. See [DEPLOYMENT.md](#/deployment)\n- 🖼️ **OA Figure Extraction** - Pull figure captions, direct image URLs, and PDF links from PMC Open Access articles\n- 📘 **Docs Site** - Browse the complete language-switchable handbook: user workflows, architecture, 45-tool reference, pipeline tutorials, source/broker contracts, integrations and operations, security, and deployment at [u9401066.github.io/pubmed-search-mcp](https://u9401066.github.io/pubmed-search-mcp/)\n- 📖 **GitHub Wiki** - GitHub-native mirror of the same canonical documentation at [github.com/u9401066/pubmed-search-mcp/wiki](https://github.com/u9401066/pubmed-search-mcp/wiki)\n- 📚 **26 Claude Skills** - Ready-to-use workflow guides for AI agents (Claude Code-specific)\n- 📖 **Copilot Instructions** - VS Code GitHub Copilot integration guide\n\n**🌐 Language**: **English** | [繁體中文](#/overview-zh)\n\n**📘 Documentation Map**: README is the quick project entry point. Use the [Docs Site](https://u9401066.github.io/pubmed-search-mcp/) for the best reading experience, the [GitHub Wiki](https://github.com/u9401066/pubmed-search-mcp/wiki) for GitHub-native navigation, and source docs for edits: [User guide](#/user-guide) | [Advanced workflows](#/advanced-workflows) | [Capability-first guide](#/tools-usage-guide) | [Provider data planes](#/semantic-scholar-api) | [BioMCP architecture analysis](#/biomcp-analysis) | [Developer guide](#/developer-guide) | [Complete index](#/quick-reference)\n\n---\n\n## 🚀 Quick Install\n\n### Prerequisites\n\n- **Python 3.10+** — [Download](https://www.python.org/downloads/)\n- **uv** (recommended) — [Install uv](https://docs.astral.sh/uv/getting-started/installation/)\n\n  ```bash\n  # macOS / Linux\n  curl -LsSf https://astral.sh/uv/install.sh | sh\n  # Windows\n  powershell -ExecutionPolicy ByPass -c \"irm https://astral.sh/uv/install.ps1 | iex\"\n  ```\n\n- **NCBI Email** — Required by [NCBI API policy](https://www.ncbi.nlm.nih.gov/books/NBK25497/#chapter2.Usage_Guidelines_and_Requirements). Any valid email address.\n- **NCBI API Key** *(optional)* — [Get one here](https://www.ncbi.nlm.nih.gov/account/settings/) for higher rate limits (10 req/s vs 3 req/s)\n- **OpenAlex API Key** *(optional)* — set `OPENALEX_API_KEY` to use an authenticated credit allocation; without it, requests use OpenAlex's current anonymous casual-use budget. `mailto` is contact metadata, not authentication. Without source-specific emails, the server reuses the configured runtime contact email for OpenAlex, CrossRef, and Unpaywall.\n\n### Install & Run\n\n```bash\n# Option 1: Zero-install with uvx (recommended for trying out)\nuvx pubmed-search-mcp\n\n# Option 2: Add as project dependency\nuv add pubmed-search-mcp\n\n# Option 3: pip install\npip install pubmed-search-mcp\n```\n\n### Python SDK Facade\n\nFor in-process Python integrations, use the stable SDK facade instead of\nimporting MCP tool modules:\n\n```python\nfrom pubmed_search.api import PubMedSearchClient, PubMedSearchConfig\n\nclient = PubMedSearchClient(PubMedSearchConfig(email=\"your@email.com\"))\nresult = await client.unified_search(\"remimazolam ICU sedation\", limit=20)\n\nprint(result.articles)\nprint(result.source_counts)\nprint(result.artifact)  # artifact locator when persistence is enabled\n```\n\nUse `uvx pubmed-search-mcp` or `/mcp` for agent tool discovery. Use the SDK for\nPython package/notebook calls where a typed object is easier than parsing an MCP\nresponse string.\n\n### Choose a Runtime Contract\n\n| Contract | Command | Network and trust boundary |\n| --- | --- | --- |\n| **Local stdio** | `uvx pubmed-search-mcp` | Recommended for one local AI client; no listening MCP port |\n| **Local loopback HTTP** | `pubmed-search-mcp-http --mode local --host 127.0.0.1` | Trusted single-user integration; MCP requests share the durable `default` tenant, and the port must never be published |\n| **Multi-user service** | `pubmed-search-mcp-http --mode service` | Remote/team use behind HTTPS; bearer auth, allowed hosts/origins, and per-principal storage are mandatory |\n\nLocal and service deployments are intentionally separate contracts. Do not turn\nthe local HTTP command into a public service by changing only its bind address.\nThe explicit local profile retains `pmids=\"last\"`, sessions, cache, and exports\nacross MCP requests and reconnects in its durable `default` tenant; this is safe\nonly inside the enforced loopback/Host/Origin boundary. Service mode never\ninherits that trust: it fails closed without a bearer principal. Use\n[DEPLOYMENT.md](#/deployment) for the service environment and Compose profile.\nThe current service profile supports many authenticated principals in one\nserver process; keep one replica until sessions, locks, artifacts, and\nsubscriptions have shared backends.\n\nThe protocol baseline is MCP SDK v2 (`mcp>=2.0,<3`). Modern 2026-07-28 clients\nsend `tools/list` and `tools/call` directly, without an `initialize` handshake or\n`Mcp-Session-Id`. Local mode retains filesystem features. Authenticated service\ncallers cannot load `file:` pipelines, select note `output_dir`/`template_file`,\nor inherit a process-wide pipeline workspace; the service Compose scheduler is\ndisabled. See the [Integrations & Operations Guide](#/troubleshooting) for the\ncapability matrix.\n\n---\n\n## ⚙️ Configuration\n\nThis MCP server works with **any MCP-compatible AI tool**. Choose your preferred client:\n\n### VS Code / Cursor (`.vscode/mcp.json`)\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\nOptional: enable browser-session PDF fallback once and let tools auto-use it:\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"BROWSER_FETCH_CONFIG\": \"{\\\"enabled\\\":true,\\\"auto_enabled\\\":true,\\\"broker_url\\\":\\\"http://127.0.0.1:8766/fetch\\\",\\\"token\\\":\\\"<random-32-byte-token>\\\",\\\"allowed_hosts\\\":[\\\"jamanetwork.com\\\",\\\"*.jamanetwork.com\\\",\\\"nejm.org\\\",\\\"*.nejm.org\\\"]}\"\n      }\n    }\n  }\n}\n```\n\nWith this setting, get_fulltext will automatically try the local broker for institutional or publisher landing pages. Pass allow_browser_session=false only when you want to suppress it for a specific call.\n\nRun the local broker with download interception:\n\n```bash\nuv sync --extra browser-broker\nuv run playwright install chromium\nuv run python -c \"import secrets; print(secrets.token_urlsafe(32))\"\nuv run pubmed-browser-fetch-broker --token \"<same-random-32-byte-token>\"\n```\n\nCopy the generated value into both commands/configurations; never reuse a\npublished example token. If `--token` is omitted, the broker generates and\nprints a high-entropy runtime token. The broker launches a persistent browser\nprofile with download interception enabled. Log in once inside that\nbroker-controlled browser window, and subsequent PDF downloads will be captured\nautomatically without a native \"Save As\" dialog.\n\n### Claude Desktop (`claude_desktop_config.json`)\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n> **Config file location**:\n>\n> - macOS: `~/Library/Application Support/Claude/claude_desktop_config.json`\n> - Windows: `%APPDATA%\\Claude\\claude_desktop_config.json`\n> - Linux: `~/.config/Claude/claude_desktop_config.json`\n\n### Claude Code\n\n```bash\nclaude mcp add pubmed-search -- uvx pubmed-search-mcp\n```\n\nOr add to `.mcp.json` in your project root:\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n### Zed AI (`settings.json`)\n\nZed editor ([z.ai](https://zed.dev)) supports MCP servers natively. Add to your Zed `settings.json`:\n\n```json\n{\n  \"context_servers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n> **Tip**: Open Command Palette → `zed: open settings` to edit, or go to Agent Panel → Settings → \"Add Custom Server\".\n\n### OpenClaw 🦞 (`~/.openclaw/openclaw.json`)\n\n[OpenClaw](https://docs.openclaw.ai/) uses MCP servers via the [mcp-adapter plugin](https://github.com/androidStern-personal/openclaw-mcp-adapter). Install the adapter first:\n\n```bash\nopenclaw plugins install mcp-adapter\n```\n\nThen add to `~/.openclaw/openclaw.json`:\n\n```json\n{\n  \"plugins\": {\n    \"entries\": {\n      \"mcp-adapter\": {\n        \"enabled\": true,\n        \"config\": {\n          \"servers\": [\n            {\n              \"name\": \"pubmed-search\",\n              \"transport\": \"stdio\",\n              \"command\": \"uvx\",\n              \"args\": [\"pubmed-search-mcp\"],\n              \"env\": {\n                \"NCBI_EMAIL\": \"your@email.com\"\n              }\n            }\n          ]\n        }\n      }\n    }\n  }\n}\n```\n\nRestart the gateway after configuration:\n\n```bash\nopenclaw gateway restart\nopenclaw plugins list  # Should show: mcp-adapter | loaded\n```\n\n### Cline (`cline_mcp_settings.json`)\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"S2_API_KEY\": \"your_semantic_scholar_key\",\n        \"PUBMED_SEARCH_DISABLED_SOURCES\": \"\"\n      },\n      \"alwaysAllow\": [],\n      \"disabled\": false\n    }\n  }\n}\n```\n\n### Other MCP Clients\n\nAny MCP-compatible client can use this server via stdio transport:\n\n```bash\n# Command\nuvx pubmed-search-mcp\n\n# With environment variable\nNCBI_EMAIL=your@email.com uvx pubmed-search-mcp\n```\n\n> **Note**: `NCBI_EMAIL` is required by NCBI API policy. Optionally set `NCBI_API_KEY` for higher rate limits (10 req/s vs 3 req/s).\n> 📖 **Detailed Integration Guides**: See [docs/INTEGRATIONS.md](#/troubleshooting) for all environment variables, Copilot Studio setup, Docker deployment, proxy configuration, and troubleshooting.\n\n---\n\n## 🎯 Design Philosophy\n\n> **Core Positioning**: The **intelligent middleware** between AI Agents and academic search engines.\n\n### Why This Server?\n\nOther tools give you raw API access. We give you **vocabulary translation + intelligent routing + research analysis**:\n\n| Challenge | Our Solution |\n| --------- | ------------ |\n| Agent uses ICD codes, PubMed needs MeSH | ✅ **Auto ICD→MeSH conversion** |\n| Multiple databases, different APIs | ✅ **Unified Search** single entry point |\n| Clinical questions need structured search | ✅ **PICO handoff + pipeline** (`parse_pico` validates agent-provided P/I/C/O and returns a runnable `template: pico` pipeline) |\n| Typos in medical terms | ✅ **ESpell auto-correction** |\n| Too many results from one source | ✅ **Parallel multi-source** with dedup |\n| Need to trace research evolution | ✅ **Research Chronicle & Tree** with landmark detection, diagnostics, sub-topic branching, and versioned revisions |\n| Citation context is unclear | ✅ **Citation Tree** forward/backward/network |\n| Can't access full text | ✅ **Multi-source fulltext** (Europe PMC XML, Unpaywall OA locations, institutional direct/EZproxy, CORE, and downloader fallbacks) |\n| Gene/drug info scattered across DBs | ✅ **NCBI Extended** (Gene, PubChem, ClinVar) |\n| Need cutting-edge preprints | ✅ **Preprint search** (arXiv, medRxiv, bioRxiv) with peer-review filtering |\n| Export to reference managers | ✅ **One-click export** (official RIS/MEDLINE/CSL JSON; local RIS/BibTeX/CSV/MEDLINE/JSON) |\n\n### Key Differentiators\n\n1. **Vocabulary Translation Layer** - Agent speaks naturally, we translate to each database's terminology (MeSH, ICD-10, text-mined entities)\n2. **Unified Search Gateway** - One `unified_search()` call, capability-aware dispatch across PubMed, Europe PMC, CORE, OpenAlex, Semantic Scholar, and enabled preprint/commercial sources\n3. **PICO Handoff + Pipeline** - the Agent extracts P/I/C/O, `parse_pico()` validates that structured handoff, and the backend `template: pico` pipeline executes O-aware precision/recall searches\n4. **Research Chronicle & Lineage Tree** - Detect milestones with policy-driven heuristics, identify landmark papers via multi-signal scoring, surface diagnostics, persist versioned revisions you can diff, and visualize research evolution as branching trees by sub-topic\n5. **Citation Network Analysis** - Build multi-level citation trees to map an entire research landscape from a single paper\n6. **Full Research Lifecycle** - From search → discovery → full text → analysis → export, all in one server\n7. **Agent-First Design** - Output optimized for machine decision-making, not human reading\n\n---\n\n## 📡 External APIs & Data Sources\n\nThis MCP server integrates with multiple academic databases and APIs:\n\n### Core Data Sources\n\n| Source | Coverage | Vocabulary | Auto-Convert | Description |\n| ------ | -------- | ---------- | ------------ | ----------- |\n| **NCBI PubMed** | 36M+ articles | MeSH | ✅ Native | Primary biomedical literature |\n| **NCBI Entrez** | Multi-DB | MeSH | ✅ Native | Gene, PubChem, ClinVar |\n| **Europe PMC** | 33M+ | Text-mined | ✅ Extraction | Full text XML access |\n| **CORE** | 200M+ | None | ➡️ Free-text | Open access aggregator |\n| **Semantic Scholar** | Evolving graph + operator datasets | S2 fields / bulk syntax | ✅ Broker-compiled modes | Relevance, bounded bulk, batch, citation graph, and metadata-only release/diff plane; no partition download |\n| **OpenAlex** | Evolving open research graph | Topics / keywords | ✅ Keyword + bounded native semantic | Cursor, cost provenance, entity graph, and declared operator snapshot path; no local index yet |\n| **NIH iCite** | PubMed | N/A | N/A | Citation metrics (RCR) |\n\n> **🔑 Key**: ✅ = Full vocabulary support | ➡️ = Query pass-through (no controlled vocabulary)\n>\n> **ICD Codes**: Auto-detected and converted to MeSH before PubMed search\n\n### Environment Variables\n\n```bash\n# Required\nNCBI_EMAIL=your@email.com          # Required by NCBI policy\n\n# Optional - For higher rate limits\nNCBI_API_KEY=your_ncbi_api_key     # Get from: https://www.ncbi.nlm.nih.gov/account/settings/\nCORE_API_KEY=your_core_api_key     # Get from: https://core.ac.uk/services/api\nCROSSREF_EMAIL=your@email.com      # Optional override; defaults to server/NCBI email\nUNPAYWALL_EMAIL=your@email.com     # Optional override; defaults to server/NCBI email\nS2_API_KEY=your_s2_api_key         # Alias: SEMANTIC_SCHOLAR_API_KEY\nOPENALEX_API_KEY=your_openalex_key # Raises the OpenAlex credit budget; actual grant is response-driven\nPUBMED_SEARCH_DISABLED_SOURCES=    # Example: semantic_scholar\n\n# Optional - Network settings\nHTTP_PROXY=http://proxy:8080       # HTTP proxy for API requests\nHTTPS_PROXY=https://proxy:8080     # HTTPS proxy for API requests\n\n# Optional - Institutional fulltext access\nINSTITUTIONAL_DIRECT_FETCH=true    # Try DOI publisher pages before CORE fallback\nEZPROXY_ENABLED=false              # Enable only after configuring EZPROXY_HOST + cookie\nEZPROXY_HOST=ezproxy.example.edu\nEZPROXY_COOKIE_FILE=/path/to/cookies.json\n\n# Optional - Local note export\nPUBMED_NOTES_DIR=/path/to/wiki/references  # save_literature_notes target folder\nPUBMED_WORKSPACE_DIR=/path/to/project       # fallback: references/ under this workspace\nPUBMED_DATA_DIR=~/.pubmed-search-mcp        # fallback: references/ under this data dir\n```\n\nCrossRef and Unpaywall reuse the runtime server contact email (`NCBI_EMAIL`,\nCLI `--email`, or detected git email) unless a source-specific email is\nconfigured. OpenAlex accepts casual anonymous use and an optional API key; the\nbroker reads its response credit/rate metadata instead of assuming a permanent\n\"polite pool\" quota.\n\nLocal note export resolves directories in this order: `output_dir` argument, `PUBMED_NOTES_DIR`, `PUBMED_WORKSPACE_DIR/references`, `PUBMED_DATA_DIR/references`, then `~/.pubmed-search-mcp/references`.\nThis path/template selection applies only to trusted local mode. Authenticated\nservice notes always use a built-in format below the current tenant's isolated\n`references/` directory.\nFor LLM wiki compatibility, `wiki` and `foam` exports use stable link targets based on PMID, DOI, PMCID, or fallback identifiers; titles remain aliases/display labels, and the response includes `wiki_validation` for unresolved wikilink checks.\n\n## 🔄 How It Works: The Middleware Architecture\n\n```text\n┌─────────────────────────────────────────────────────────────────────────────┐\n│                              AI AGENT                                        │\n│                                                                              │\n│   \"Find papers about I10 hypertension treatment in diabetic patients\"       │\n│                                                                              │\n└─────────────────────────────────┬───────────────────────────────────────────┘\n                                  │\n                                  ▼\n┌─────────────────────────────────────────────────────────────────────────────┐\n│                     🔄 PUBMED SEARCH MCP (MIDDLEWARE)                        │\n│  ┌─────────────────────────────────────────────────────────────────────────┐│\n│  │  1️⃣ VOCABULARY TRANSLATION                                              ││\n│  │     • ICD-10 \"I10\" → MeSH \"Hypertension\"                                ││\n│  │     • \"diabetic\" → MeSH \"Diabetes Mellitus\"                             ││\n│  │     • ESpell: \"hypertention\" → \"hypertension\"                           ││\n│  └─────────────────────────────────────────────────────────────────────────┘│\n│  ┌─────────────────────────────────────────────────────────────────────────┐│\n│  │  2️⃣ INTELLIGENT ROUTING                                                 ││\n│  │     ┌──────────┐  ┌──────────┐  ┌──────────┐  ┌──────────┐             ││\n│  │     │ PubMed   │  │Europe PMC│  │   CORE   │  │ OpenAlex │             ││\n│  │     │  36M+    │  │   33M+   │  │  200M+   │  │  250M+   │             ││\n│  │     │  (MeSH)  │  │(fulltext)│  │  (OA)    │  │(metadata)│             ││\n│  │     └────┬─────┘  └────┬─────┘  └────┬─────┘  └────┬─────┘             ││\n│  │          └──────────────┴──────────────┴──────────────┘                 ││\n│  │                              ▼                                          ││\n│  │  3️⃣ RESULT AGGREGATION: Dedupe + Rank + Enrich                         ││\n│  └─────────────────────────────────────────────────────────────────────────┘│\n└─────────────────────────────────┬───────────────────────────────────────────┘\n                                  │\n                                  ▼\n┌─────────────────────────────────────────────────────────────────────────────┐\n│                         UNIFIED RESULTS                                      │\n│   • 150 unique papers (deduplicated from 4 sources)                          │\n│   • Ranked by relevance + citation impact (RCR)                              │\n│   • Full text links enriched from Europe PMC                                 │\n└─────────────────────────────────────────────────────────────────────────────┘\n```\n\n---\n\n## 🛠️ MCP Tools Overview\n\nIf you want to understand the tool surface as a usable system, do not start by memorizing 45 tool names.\n\nStart with the [Tools Usage Guide](#/tools-usage-guide): it compresses the current 45 tools into 8 capability families, explains the theoretical lower bound, and gives intent-based routing for both humans and agents.\n\n### 🔍 Search & Query Intelligence\n\n![Search and query intelligence workflow](images/search-query-workflow.svg)\n\n```text\n┌─────────────────────────────────────────────────────────────────┐\n│                      SEARCH ENTRY POINT                          │\n├─────────────────────────────────────────────────────────────────┤\n│                                                                  │\n│   unified_search()          ← 🌟 Single entry for all sources    │\n│        │                                                         │\n│        ├── Quick search     → Direct multi-source query          │\n│        ├── Native semantic → Bounded OpenAlex semantic mode    │\n│        ├── Systematic       → Bounded provider bulk/cursor mode  │\n│        ├── PICO hints       → Detects comparison, shows P/I/C/O  │\n│        └── ICD expansion    → Auto ICD→MeSH conversion           │\n│                                                                  │\n│   Sources: PubMed · Europe PMC · CORE · OpenAlex · S2            │\n│   Auto: Deduplicate → Rank → Enrich full-text links              │\n│                                                                  │\n├─────────────────────────────────────────────────────────────────┤\n│   QUERY INTELLIGENCE                                             │\n│                                                                  │\n│   generate_search_queries() → MeSH expansion + synonym discovery │\n│   parse_pico()              → Agent-provided PICO handoff        │\n│   analyze_search_query()    → Query analysis without execution   │\n│                                                                  │\n└─────────────────────────────────────────────────────────────────┘\n```\n\n#### One search entry, three retrieval policies\n\nGeneric literature discovery is intentionally exposed through exactly one MCP\ntool: `unified_search`. Provider-specific APIs remain internal broker\ncapabilities:\n\n```python\n# Default relevance/keyword routing across enabled sources\nunified_search(query=\"treatment resistance\")\n\n# OpenAlex native semantic search (provider maximum 50 results)\nunified_search(\n    query=\"mechanisms of treatment resistance\",\n    sources=\"openalex\",\n    options=\"native_semantic\",\n)\n\n# Deterministic/bounded retrieval: OpenAlex cursor and S2 bulk where selected\nunified_search(\n    query=\"melanoma AND immunotherapy\",\n    sources=\"pubmed,openalex,semantic_scholar\",\n    options=\"systematic\",\n)\n```\n\n`native_semantic` and `systematic` are mutually exclusive and disable the\nmulti-strategy deep-search expansion. Explicit source selections fail before a\nnetwork call when a requested retrieval mode is unsupported; automatic source\nselection retains only capable providers. `limit` remains at most 100 per\nsource, so `systematic` means deterministic, bounded provider execution—not an\nexhaustive systematic-review guarantee. Structured output and artifacts record\n`retrieval_mode` plus per-source `source_metadata` (requested/provider mode,\ncanonical or compiled query, continuation availability, cost/rate metadata,\nand warnings when available).\n\nThe public request boundary is fail-closed. `limit` must be an integer from 1\nthrough 100; unknown or malformed `filters` / `options`, reversed or out-of-range\nyears, and unsupported ranking or output modes return a validation error before\nprovider I/O. In the default deep-search policy, `limit` is one **total budget\nper source** divided across that source's query strategies—not `limit` results\nfor every strategy. Strategy calls use bounded global/per-source concurrency\nand timeouts, and successful sources remain usable when another source times\nout, is rate-limited, or fails.\n\nEurope PMC, Scopus, and Web of Science remain keyword-only in this release;\nexplicit systematic requests for those sources fail before I/O instead of\nmislabeling a single page as systematic coverage.\n\nSee [Source Contracts](#/source-contracts),\n[Semantic Scholar](#/semantic-scholar-api), and\n[OpenAlex](#/openalex-api) for provider limits and operator data-plane\nboundaries.\n\n### 🔬 Discovery Tools (After Finding Key Papers)\n\n![Article discovery and citation workflow](images/discovery-citation-workflow.svg)\n\n```text\n                        Found important paper (PMID)\n                                   │\n           ┌───────────────────────┼───────────────────────┐\n           │                       │                       │\n           ▼                       ▼                       ▼\n    ┌─────────────┐        ┌─────────────┐        ┌─────────────┐\n    │  BACKWARD   │        │  SIMILAR    │        │  FORWARD    │\n    │  ◀──────    │        │  ≈≈≈≈≈≈     │        │  ──────▶    │\n    │             │        │             │        │             │\n    │ get_article │        │find_related │        │find_citing  │\n    │ _references │        │ _articles   │        │ _articles   │\n    │             │        │             │        │             │\n    │ Foundation  │        │  Similar    │        │ Follow-up   │\n    │  papers     │        │   topic     │        │  research   │\n    └─────────────┘        └─────────────┘        └─────────────┘\n\n    fetch_article_details()   → Detailed article metadata\n    get_citation_metrics()    → iCite RCR, citation percentile\n    build_citation_tree()     → Full network visualization (6 formats)\n\n```\n\n### 📚 Full Text, Figure Extraction & Export\n\n![Full text, figures, and biomedical image workflow](images/visual-evidence-workflow.svg)\n\n| Category | Tools |\n| -------- | ----- |\n| **Full Text** | `get_fulltext` → Europe PMC XML when a PMCID is available; DOI-backed Unpaywall, institutional direct/EZproxy, CORE, and downloader fallbacks when needed |\n| **Figures** | `get_article_figures` → Extract figure labels, captions, image URLs, and PDF links from PMC Open Access articles |\n| **Figure-aware Full Text** | `get_fulltext(include_figures=True)` → Embed figure metadata alongside structured fulltext |\n| **Text Mining** | `get_text_mined_terms` → Extract genes, diseases, chemicals |\n| **Export** | `prepare_export` → official RIS/MEDLINE/CSL JSON or local RIS/BibTeX/CSV/MEDLINE/JSON; `save_literature_notes` → local wiki/Foam-compatible/Markdown/MedPaper-style notes plus collection-level CSL JSON |\n\n### 🖼️ OA Figure-First Exploration\n\nUse the PMC Open Access path when an agent needs evidence figures, not just article text:\n\n- `get_article_figures(identifier=\"PMC12086443\")` → Figure labels, captions, image URLs, and PDF/article links\n- `get_fulltext(pmcid=\"PMC7096777\", include_figures=True)` → Structured fulltext with figures inline\n- Figure output preserves article context, so agents can connect each figure back to the sections where it is mentioned\n\n### 🧬 NCBI Extended Databases\n\n![NCBI extended biomedical data workflow](images/ncbi-extended-workflow.svg)\n\n| Tool | Description |\n| ---- | ----------- |\n| `search_gene` | Search NCBI Gene database |\n| `get_gene_details` | Gene details by NCBI Gene ID |\n| `get_gene_literature` | PubMed articles linked to a gene |\n| `search_compound` | Search PubChem compounds |\n| `get_compound_details` | Compound details by PubChem CID |\n| `get_compound_literature` | PubMed articles linked to a compound |\n| `search_clinvar` | Search ClinVar clinical variants |\n\n### 🕰️ Research Chronicle & Lineage Tree\n\n![Research Chronicle Architecture and Lineage Flow](images/research-chronicle-lineage-flow.svg)\n![Evaluation and timeline workflow](images/timeline-evaluation-workflow.svg)\n\n| Tool | Description |\n| ---- | ----------- |\n| `build_research_chronicle` | Build a persisted, versioned chronicle with landmark detection. Output: summary, chronicle_map, timeline, tree, graph, evidence, milestones, mermaid, timeline_mermaid, mindmap, narrative, json |\n| `read_research_chronicle` | Load, list, diff revisions, narrate with citations, analyze milestone distribution, or compare up to five topics |\n\n```python\n# 1. Build from topic (retrieves PubMed, scores landmarks, clusters lineages)\nbuild_research_chronicle(topic=\"remimazolam intraoperative\", output=\"mermaid\", max_events=30)\n\n# 2. Continue an existing chronicle (inherits stored topic and filters to produce Revision N+1)\nbuild_research_chronicle(chronicle_id=\"remimazolam-intraoperative-08c229f3\")\n\n# 3. Read revision diff, milestone analytics, or cross-topic comparison\nread_research_chronicle(action=\"diff\", chronicle_id=\"remimazolam-intraoperative-08c229f3\", from_revision=1)\nread_research_chronicle(action=\"milestones\", chronicle_id=\"remimazolam-intraoperative-08c229f3\")\nread_research_chronicle(action=\"compare\", topics=\"remimazolam intraoperative,propofol intraoperative\")\n```\n\n`mermaid` is the canonical combined view: a horizontal year spine (X-axis) with each\nobserved research line (Y-axis) branching at its earliest dated paper **within the\nretrieved scope**. This is an explainable grouping, not a causal genealogy or a\nclaim about the field's true first paper. Lineages prefer MeSH descriptors and\nauthor keywords shared by multiple papers; singleton-only or insufficient\nsignals trigger a warned research-stage fallback. Same-year display order is\nstable, but does not assert precedence when publication precision cannot prove\nit. `timeline_mermaid` preserves the older flat timeline view. See\n[Advanced Research Workflows (docs/ADVANCED_RESEARCH_WORKFLOWS.md)](#/advanced-workflows) and\n[docs/RESEARCH_CHRONICLE_REFACTOR_SPEC.md](#/research-chronicle-rebuild-spec).\n\nChronicle Mermaid output is built from structured nodes and edges, with safe\nlabel escaping, cycle/orphan repair, collision-resistant IDs, and bounded graph\nsize. It falls back from rich to safe to minimal syntax instead of failing the\nwhole chronicle. `mermaid_validation.json` records every correction, fallback,\nand omitted visual item; `chronicle.mmd` remains pure Mermaid source.\n\nChronicle revisions are immutable and appended atomically. When session\nartifact persistence is enabled, artifact failure is surfaced explicitly while\nthe saved Chronicle revision remains available.\n\nTopic builds send year limits to PubMed before bounded retrieval, then preserve\nthe first and last observed papers while filling the cap with landmarks and\ntemporal spread. The audit records PubMed `returned` / `available` counts and\nwarns when availability is unknown or any retrieval/selection cap makes the\nview non-exhaustive. PubMed errors or a scope with no article evidence do not\npublish an empty revision.\n\nExplicit PMID input is strict (`12345678` or `PMID:12345678`, positive ASCII\ndigits, at most 20 digits); DOI or mixed text is rejected instead of being\ncoerced. Records without a reliable publication date appear as `Undated` after\ndated entries and are excluded from the displayed year span. Entry IDs follow PMID/DOI evidence\nidentity across date or classifier corrections, and topic continuity uses one\nUnicode/case/whitespace canonical key. Multi-signal papers keep one primary\nbranch plus explicit cross-links; overlap of 20% or more is audited as a\nwarning. In revision diffs, absence means `not_observed_in_revision` /\n`removed_from_view`, never conclusive retirement.\n\n### 🏥 Institutional Access & ICD Conversion\n\n![Institutional access workflow](images/institutional-access-workflow.svg)\n\n| Tool | Description |\n| ---- | ----------- |\n| `configure_institutional_access` | Configure institution's link resolver |\n| `get_institutional_link` | Generate OpenURL access link |\n| `list_resolver_presets` | List resolver presets |\n| `test_institutional_access` | Test resolver configuration |\n| `diagnose_institutional_access` | Diagnose direct DOI, EZproxy, and OpenURL handoff paths |\n| `convert_icd_mesh` | Convert between ICD codes and MeSH terms (bidirectional) |\n| `unified_search` | Auto-detect ICD codes in queries and expand them to MeSH |\n\n### 💾 Session Management\n\n![Session and pipeline workflow](images/session-pipeline-workflow.svg)\n\n| Tool | Description |\n| ---- | ----------- |\n| `get_session_pmids` | Retrieve cached PMID lists |\n| `get_cached_article` | Get article from session cache (no API cost) |\n| `get_session_summary` | Session status overview |\n| `read_session` | Facade for PMIDs, cached articles, durable search runs, replay arguments, history, and persistent artifacts |\n\nDynamic MCP resources are also available for agents that can read resources directly:\n\n- `session://context` — active session status\n- `session://last-search` — latest search metadata\n- `session://last-search/pmids` — latest PMID list + CSV form\n- `session://last-search/results` — cached article payloads for the latest search\n\n### Persistent Artifacts\n\nPersistent MCP output artifacts are saved for reusable `unified_search` and\n`get_fulltext` responses when session persistence is configured. Tool responses\nact like index cards: they include enough counts, source warnings, and artifact\nhints for an agent to answer immediately, while the full evidence payload stays\nin files that can be read repeatedly. The compact `artifact` locator includes\n`artifact_id`, `artifact_uri`, `primary_file`, `summary`, file inventory,\n`read_order`, audit status, and exact `read_session(...)` retrieval hints. Set\n`PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true` only when a local MCP client should\nalso receive `local_path` and `manifest_path` directly.\n\nRemote clients that cannot read the server filesystem can retrieve the same\ncontent through the session facade:\n\n```text\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"audit.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"query_strategy.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"results.json\", offset=0, max_chars=200000)\nread_session(action=\"list_artifacts\", include_local_paths=true)\n```\n\n### Recoverable search runs\n\nWhen session management is active, every `unified_search` invocation receives a\nstable run ID. This includes normal searches, validation/planning failures, and\ninline, `saved:<name>`, or `dry_run=true` pipeline execution. Structured results\nand errors attach the `search_run` handoff; Markdown returns the same run ID as\na compact recovery note. Normal literature-result envelopes expose two separate\nmachine contracts:\n\n- `search_status` describes the bounded retrieval outcome: `state`\n  (`completed`, `empty`, `partial`, or `failed`), `bounded=true`,\n  `exhaustive=false`, returned count, attempted/successful/failed/retryable\n  sources, and continuation/unknown-completeness source lists.\n- `search_run` is the recovery handoff: stable `run_id`, journal status,\n  `recoverable`, exact `read_session` inspect/replay arguments, and the artifact\n  URI when one was committed.\n\nThe tenant-scoped `search-run/v1` journal is published before provider I/O or a\nterminal validation response and records the sanitized request, plan,\nphysical per-source or per-pipeline-step attempts, counts, safe failures,\nresult references, and artifact locator when applicable. It reaches a terminal\n`completed`, `partial`, `failed`, or `cancelled` state; a valid zero-result\nsearch is a `completed` run whose `search_status.state` is `empty`. On restart,\nan unfinished `started` / `planned` / `running` entry is recovered once as\n`interrupted` instead of disappearing. A non-dry-run saved pipeline additionally\nkeeps its PipelineStore report/run history; that is complementary to the\ninvocation-level search journal, not a replacement for it.\n\nPipeline replay preserves the original inline or `saved:<name>` argument plus\n`dry_run` / `stop_at`. Pipeline text containing keys, tokens, cookies, passwords,\nor other credential material is rejected and recorded as a failed run; provider\ncredentials belong in server environment/configuration, never pipeline YAML or\nJSON.\n\n```text\nread_session(action=\"search_runs\")\nread_session(action=\"search_runs\", run_status=\"partial\")\nread_session(action=\"search_run\", run_id=\"...\")\nread_session(action=\"replay_search\", run_id=\"...\")\n```\n\n`replay_search` only returns the original credential-free `unified_search`\nkwargs. It never executes a network call automatically; the agent or user must\nreview and explicitly submit them. Provider cursor/token values are retained\nas opaque provenance in `source_metadata` and `query_strategy.json`, but there\nis no public cursor-resume parameter yet, so replay starts a new bounded search.\n\nIf the terminal journal write cannot be recovered, the response reports\n`search_run.status=\"history_unavailable\"`, `history_available=false`, the\nintended terminal status, and a warning. It deliberately omits inspect/replay\nactions because durable recovery is not guaranteed; the search result itself\nmay still be usable.\n\n`unified_search` artifacts use a research envelope. Start with `audit.json` for\nsource-count and completeness warnings, then `query_strategy.json` for the exact\nexecuted plan, and finally `results.json` / `results.toon` for the complete\narticle list. This keeps MCP response tokens small without losing academic\ntraceability.\n\nArtifacts are generated from the already-computed result object, so reading an\nartifact does not rerun searches or fulltext retrieval.\nIf a crash occurs after an artifact directory is atomically published but\nbefore the session index is updated, session reload discovers only complete,\nchecksum-indexed manifests and relinks the orphaned artifact to its search run\nby `search_run_id` (with a conservative query match for older artifacts).\n`read_session` redacts local filesystem paths by default; `local_path` and\n`manifest_path` are server-local paths, not portable client paths. Artifacts\nfrom `get_fulltext` may contain article body text, including subscription or\ninstitutionally accessed content. Store and share them according to publisher,\nlicense, and institutional access terms.\nLarge `get_fulltext` responses are returned inline as a preview when an artifact\nis available; use the artifact locator to retrieve the saved full content.\n\nWhen one source fails but the overall search can continue, JSON responses may\ninclude `source_errors`; markdown responses show a `Source warnings` line. For\nSemantic Scholar HTTP 429s, set `S2_API_KEY` / `SEMANTIC_SCHOLAR_API_KEY`, retry\nlater, or temporarily exclude it with `sources=\"auto,-semantic_scholar\"` or\n`PUBMED_SEARCH_DISABLED_SOURCES=semantic_scholar`.\n\n### Pipeline Management\n\n![Session and pipeline workflow](images/session-pipeline-workflow.svg)\n\n`manage_pipeline` is the primary facade for pipeline CRUD, history, and scheduling. The more specific pipeline tools remain available as compatibility wrappers.\n\n| Tool | Description |\n| ---- | ----------- |\n| `manage_pipeline` | Primary facade for save, list, load, delete, history, and schedule actions |\n| `save_pipeline` | Save a pipeline config for later reuse (YAML/JSON, auto-validated) |\n| `list_pipelines` | List saved pipelines (filter by tag/scope) |\n| `load_pipeline` | Load by saved name; trusted local callers may also load a file |\n| `delete_pipeline` | Delete pipeline and its execution history |\n| `get_pipeline_history` | View execution history with article diff analysis |\n| `schedule_pipeline` | Create, update, or remove recurring pipeline schedules |\n\nAuthenticated service callers use named pipelines in their tenant-derived\nstore; `workspace` and `file:` access are local-only. The service Compose\nprofile does not execute schedules without a separately designed single leader.\n\nStep-by-step tutorials:\n\n- English: [docs/PIPELINE_MODE_TUTORIAL.en.md](#/pipeline-tutorial)\n- 繁體中文: [docs/PIPELINE_MODE_TUTORIAL.md](#/pipeline-tutorial-zh)\n\n### 👁️ Vision & Image Search\n\n![Full text, figures, and biomedical image workflow](images/visual-evidence-workflow.svg)\n\n| Tool | Description |\n| ---- | ----------- |\n| `analyze_figure_for_search` | Handoff an uploaded image, image URL, or data URI to agent vision for search-term extraction |\n| `search_biomedical_images` | Search biomedical images across Open-i (X-ray, microscopy, photos, diagrams) |\n\nUse `analyze_figure_for_search` when the user supplies an image and the agent\nmust interpret its meaning first. The tool returns MCP `ImageContent` plus\ninstructions for the LLM agent to extract English biomedical terms, then\ncontinue with `search_biomedical_images` for similar Open-i images or\n`unified_search` for related papers.\n\n### 📄 Preprint Search\n\nSearch **arXiv**, **medRxiv**, and **bioRxiv** preprint servers via `unified_search` `options` flags:\n\n- `preprints`: Search preprint servers and merge preprints into the main aggregated result set with `article_type=PREPRINT`.\n- `all_types`: Keep non-peer-reviewed content already returned by selected scholarly sources even without a preprint-server crawl.\n\n**Recommended combinations:**\n\n- Empty `options`: Peer-reviewed results only; preprint-like records are filtered.\n- `options=\"preprints\"`: Searches arXiv, medRxiv, and bioRxiv, then ranks/dedupes those preprints with the main results.\n- `options=\"preprints, all_types\"`: Same preprint-server crawl, plus other non-peer-reviewed records from selected sources are retained.\n- `options=\"all_types\"`: No preprint-server crawl, but non-peer-reviewed items from searched sources are retained.\n\n**Preprint detection** — articles are identified as preprints by:\n\n- Article type from source API (OpenAlex, CrossRef, Semantic Scholar)\n- arXiv ID present without PubMed ID\n- Known preprint server source or journal name\n- DOI prefix matching preprint servers (e.g., `10.1101/` → bioRxiv/medRxiv, `10.48550/` → arXiv)\n\n### 🌳 Research Context Graph\n\n`unified_search` can append a lightweight research lineage view built from PMID-backed ranked results:\n\n| Option Flag | Description |\n| ----------- | ----------- |\n| `context_graph` | Append a lightweight Research Context Graph preview from the current PMID-backed ranked set to Markdown output and include `research_context` in JSON output |\n\nThis is useful when an agent needs quick thematic branching without making a second `build_research_chronicle` call.\n\n### 🧪 Clinical-Trial Registry Adjunct\n\nClinicalTrials.gov is never queried implicitly. Add `options=\"trials\"` to a\nMarkdown search when a bounded registry adjunct is useful. It remains separate\nfrom the literature-source plan and source counts; the durable artifact records\nits truncated physical query and outcome under `adjunct_queries`. Structured\nJSON/TOON searches do not run this display-only adjunct.\n\n```python\nunified_search(query=\"remimazolam ICU sedation\", options=\"trials\")\n```\n\n### 📊 Count-First Orientation\n\n`unified_search` can also front-load the existing source coverage and decision hints for agents that want routing help before reading the ranked list:\n\n| Option Flag | Description |\n| ----------- | ----------- |\n| `counts_first` | Add a source-count table, coverage summary, and next-tool recommendations to the response |\n\nExample:\n\n```python\nunified_search(query=\"remimazolam ICU sedation\", options=\"counts_first\")\n```\n\nThis mode is useful when the agent should decide whether to expand a source, inspect the lead PMID, fetch fulltext, extract figures, or pivot into timeline exploration.\n\n### ⏱️ MCP Progress Reporting\n\nWhen the MCP client provides a progress token, `unified_search`, `build_research_chronicle`, `get_fulltext`, and `get_text_mined_terms` emit progress updates for their major phases.\nThis reduces the \"black box\" wait time for agents during longer searches.\nProgress callbacks are best-effort and are not cancelled by the server while a\ntool call is active, which avoids host-side `Canceled: Canceled` messages caused\nby progress-notification backpressure.\n\n---\n\n## 📋 Agent Usage Examples\n\n### 1️⃣ Quick Search (Simplest)\n\n```python\n# Agent just asks naturally - middleware handles everything\nunified_search(query=\"remimazolam ICU sedation\", limit=20)\n\n# Or with clinical codes - auto-converted to MeSH\nunified_search(query=\"I10 treatment in E11.9 patients\")\n#                     ↑ ICD-10           ↑ ICD-10\n#                     Hypertension       Type 2 Diabetes\n```\n\n### 2️⃣ PICO Clinical Question\n\n![PICO clinical search workflow](images/pico-clinical-workflow.svg)\n\n**Simple path** — `unified_search` can search directly (no PICO decomposition):\n\n```python\n# unified_search searches as-is; detects \"A vs B\" pattern and shows PICO hints in metadata\nunified_search(query=\"Is remimazolam better than propofol for ICU sedation?\")\n# → Multi-source keyword search + PICO hint metadata in output\n# ⚠️ This does NOT auto-decompose PICO or expand MeSH!\n# For structured PICO search, use the Agent workflow below\n```\n\n**Agent workflow** — agent-provided PICO + backend pipeline search (recommended for clinical questions):\n\n```text\n┌─────────────────────────────────────────────────────────────────────────┐\n│  \"Is remimazolam better than propofol for ICU sedation?\"                │\n└─────────────────────────────────┬───────────────────────────────────────┘\n                                  │\n                                  ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│                         parse_pico()                                     │\n│  ┌─────────┐  ┌─────────┐  ┌─────────┐  ┌─────────┐                     │\n│  │    P    │  │    I    │  │    C    │  │    O    │                     │\n│  │  ICU    │  │remimaz- │  │propofol │  │sedation │                     │\n│  │patients │  │  olam   │  │         │  │outcomes │                     │\n│  └────┬────┘  └────┬────┘  └────┬────┘  └────┬────┘                     │\n└───────┼────────────┼────────────┼────────────┼──────────────────────────┘\n        │            │            │            │\n        ▼            ▼            ▼            ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│              generate_search_queries() × 4 (parallel)                    │\n│                                                                          │\n│  P → \"Intensive Care Units\"[MeSH]                                        │\n│  I → \"remimazolam\" [Supplementary Concept], \"CNS 7056\"                   │\n│  C → \"Propofol\"[MeSH], \"Diprivan\"                                        │\n│  O → \"Conscious Sedation\"[MeSH], \"Deep Sedation\"[MeSH]                   │\n└─────────────────────────────────┬───────────────────────────────────────┘\n                                  │\n                                  ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│              Agent combines with Boolean logic                           │\n│                                                                          │\n│  (P) AND (I) AND (C) AND (O)  ← High precision                           │\n│  (P) AND (I OR C) AND (O)     ← High recall                              │\n└─────────────────────────────────┬───────────────────────────────────────┘\n                                  │\n                                  ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│              unified_search() (auto multi-source + dedup)                │\n│                                                                          │\n│  PubMed + Europe PMC + CORE + OpenAlex → Auto deduplicate & rank         │\n└─────────────────────────────────────────────────────────────────────────┘\n```\n\n```python\n# Step 1: Agent extracts P/I/C/O, then validates the structured handoff\npico = parse_pico(\n    description=\"Is remimazolam better than propofol for ICU sedation?\",\n    p=\"ICU patients requiring sedation\",\n    i=\"remimazolam\",\n    c=\"propofol\",\n    o=\"sedation efficacy, delirium, hypotension\"\n)\n# Returns validation plus a ready-to-run `template: pico` pipeline.\n\n# Step 2: Get MeSH for each element (parallel!)\ngenerate_search_queries(topic=\"ICU patients\")   # P\ngenerate_search_queries(topic=\"remimazolam\")    # I\ngenerate_search_queries(topic=\"propofol\")       # C\ngenerate_search_queries(topic=\"sedation\")       # O\n\n# Step 3: Either pass expanded fragments back as p_query/i_query/c_query/o_query\n# or let the backend pipeline use the structured P/I/C/O labels.\n\n# Step 4: Search (backend runs O-aware precision/recall searches, dedup, rank)\nunified_search(\n    query=\"Is remimazolam better than propofol for ICU sedation?\",\n    pipeline=pico[\"pipeline\"]\n)\n```\n\n### 3️⃣ Explore from Key Paper\n\n```python\n# Found landmark paper PMID: 33475315\nfind_related_articles(pmid=\"33475315\")   # Similar methodology\nfind_citing_articles(pmid=\"33475315\")    # Who built on this?\nget_article_references(pmid=\"33475315\")  # What's the foundation?\n\n# Build complete research map\nbuild_citation_tree(pmid=\"33475315\", depth=2, output_format=\"mermaid\")\n```\n\n### 4️⃣ Gene/Drug Research\n\n```python\n# Research a gene\nsearch_gene(query=\"BRCA1\", organism=\"human\")\nget_gene_literature(gene_id=\"672\", limit=20)\n\n# Research a drug compound\nsearch_compound(query=\"propofol\")\nget_compound_literature(cid=\"4943\", limit=20)\n```\n\n### 5️⃣ Export Results\n\n```python\n# Export last search results\nprepare_export(pmids=\"last\", format=\"ris\")      # → EndNote/Zotero\nprepare_export(pmids=\"last\", format=\"bibtex\", source=\"local\")  # → LaTeX\nprepare_export(pmids=\"last\", format=\"csl\")      # → CSL JSON from the official NCBI Citation API\nsave_literature_notes(pmids=\"last\")              # → local wiki note + Foam-compatible wikilinks + CSL JSON\nsave_literature_notes(pmids=\"last\", note_format=\"medpaper\", output_dir=\"./references\")\nsave_literature_notes(pmids=\"last\", template_file=\"./reference-template.md\")\n\n# Retrieve full text for a selected paper from the last search\nget_fulltext(pmid=\"12345678\", extended_sources=True)\n```\n\n### 6️⃣ Preprint Search\n\n```python\n# Include preprints alongside peer-reviewed results\nunified_search(query=\"COVID-19 vaccine efficacy\", options=\"preprints\")\n# → Main aggregated results include labelled arXiv, medRxiv, and bioRxiv preprints\n\n# Include preprints and retain non-peer-reviewed items in main results\nunified_search(query=\"CRISPR gene therapy\", options=\"preprints, all_types\")\n# → Preprint-server crawl + non-peer-reviewed items retained in main results\n\n# Only peer-reviewed (default behavior)\nunified_search(\"diabetes treatment\")\n# → Preprints from any source automatically filtered out\n\n# Add a research context graph preview to the same search response\nunified_search(\"remimazolam ICU sedation\", options=\"context_graph\")\n```\n\n### 7️⃣ Pipeline (Reusable Search Plans)\n\n```python\n# Save a template-based pipeline through the primary facade\nmanage_pipeline(\n  action=\"save\",\n    name=\"icu_sedation_weekly\",\n    config=\"template: pico\\nparams:\\n  P: ICU patients\\n  I: remimazolam\\n  C: propofol\\n  O: delirium\",\n    tags=\"anesthesia,sedation\",\n    description=\"Weekly ICU sedation monitoring\"\n)\n\n# Save a custom DAG pipeline\nmanage_pipeline(\n  action=\"save\",\n    name=\"brca1_comprehensive\",\n    config=\"\"\"\nsteps:\n  - id: expand\n    action: expand\n    params: { topic: BRCA1 breast cancer }\n  - id: pubmed\n    action: search\n    params: { query: BRCA1, sources: pubmed, limit: 50 }\n  - id: expanded\n    action: search\n    inputs: [expand]\n    params: { strategy: mesh, sources: pubmed,openalex, limit: 50 }\n  - id: merged\n    action: merge\n    inputs: [pubmed, expanded]\n    params: { method: rrf }\n  - id: enriched\n    action: metrics\n    inputs: [merged]\noutput:\n  limit: 30\n  ranking: quality\n\"\"\"\n)\n\n# Execute a saved pipeline\nunified_search(pipeline=\"saved:icu_sedation_weekly\")\n\n# List & manage\nmanage_pipeline(action=\"list\", tag=\"anesthesia\")\nmanage_pipeline(action=\"load\", source=\"brca1_comprehensive\")  # Review YAML\nmanage_pipeline(action=\"history\", name=\"icu_sedation_weekly\")  # View past runs\n```\n\n---\n\n## 🔍 Search Mode Comparison\n\n```text\n┌─────────────────────────────────────────────────────────────────────────┐\n│                        SEARCH MODE DECISION TREE                         │\n├─────────────────────────────────────────────────────────────────────────┤\n│                                                                          │\n│   \"What kind of search do I need?\"                                       │\n│         │                                                                │\n│         ├── Know exactly what to search?                                 │\n│         │   └── unified_search(query=\"topic keywords\")                   │\n│         │       → Quick, auto-routing to best sources                    │\n│         │                                                                │\n│         ├── Have a clinical question (A vs B)?                           │\n│         │   └── Agent P/I/C/O → parse_pico() handoff                  │\n│         │       → unified_search(template:pico) or expanded Boolean    │\n│         │                                                                │\n│         ├── Need comprehensive systematic coverage?                      │\n│         │   └── generate_search_queries() → parallel search              │\n│         │       → MeSH expansion, multiple strategies, merge             │\n│         │                                                                │\n│         └── Exploring from a key paper?                                  │\n│             └── find_related/citing/references → build_citation_tree     │\n│                 → Citation network, research context                     │\n│                                                                          │\n└─────────────────────────────────────────────────────────────────────────┘\n```\n\n| Mode | Entry Point | Best For | Auto-Features |\n| ---- | ----------- | -------- | ------------- |\n| **Quick** | `unified_search()` | Fast topic search | ICD→MeSH, multi-source, dedup |\n| **PICO** | Agent P/I/C/O -> `parse_pico()` | Clinical questions | Validate handoff -> `template:pico` backend search |\n| **Systematic** | `generate_search_queries()` → `unified_search(options=\"systematic\")` | Reproducible review seed | MeSH/synonyms plus bounded bulk/cursor execution; not an exhaustiveness claim |\n| **Native semantic** | `unified_search(options=\"native_semantic\")` | Conceptual similarity in title/abstract space | Capability validation; OpenAlex semantic mode, max 50 |\n| **Exploration** | `find_*_articles()` | From key paper | Citation network, related |\n\n---\n\n## 🤖 Claude Skills (AI Agent Workflows)\n\nPre-built workflow guides in `.claude/skills/`, divided into **Usage Skills** (for using the MCP server) and **Development Skills** (for maintaining the project):\n\n### 📚 Usage Skills (11) — For AI Agents Using This MCP Server\n\n| Skill | Description |\n| ----- | ----------- |\n| `pubmed-quick-search` | Basic search with filters |\n| `pubmed-systematic-search` | MeSH expansion, comprehensive |\n| `pubmed-pico-search` | Clinical question decomposition |\n| `pubmed-paper-exploration` | Citation tree, related articles |\n| `pubmed-research-chronicle` | Persistent, versioned research evolution |\n| `pubmed-gene-drug-research` | Gene/PubChem/ClinVar |\n| `pubmed-fulltext-access` | Europe PMC, CORE full text |\n| `pubmed-export-citations` | RIS/BibTeX/CSV/CSL export guidance |\n| `pubmed-multi-source-search` | Cross-database unified search |\n| `pubmed-mcp-tools-reference` | Complete tool reference guide |\n| `pipeline-persistence` | Save, load, reuse search plans |\n\n### 🔧 Development Skills (15) — For Project Contributors\n\n| Skill | Description |\n| ----- | ----------- |\n| `changelog-updater` | Auto-update CHANGELOG.md |\n| `code-refactor` | DDD architecture refactoring |\n| `code-reviewer` | Code quality & security review |\n| `ddd-architect` | DDD scaffold for new features |\n| `git-doc-updater` | Sync docs before commits |\n| `git-precommit` | Pre-commit workflow orchestration |\n| `memory-checkpoint` | Save context to Memory Bank |\n| `memory-updater` | Update Memory Bank files |\n| `pdf-asset-extractor` | Extract and inventory citation-ready PDF assets |\n| `project-init` | Initialize new projects |\n| `readme-i18n` | Multilingual README sync |\n| `readme-updater` | Sync README with code changes |\n| `roadmap-updater` | Update ROADMAP.md status |\n| `test-generator` | Generate test suites |\n| `tool-sync` | Keep the MCP registry and generated tool documentation aligned |\n\n> 📁 **Location**: `.claude/skills/*/SKILL.md` (Claude Code-specific, and the single source of truth for repo skills)\n> Do not mirror or split repo skills into `.github/skills/`.\n> These repo skills are project-scoped and should remain version-controlled. Personal cross-project skills belong in a user directory such as `~/.copilot/skills/` or `~/.claude/skills/`, not in this repository.\n\n---\n\n## 🏗️ Architecture (DDD)\n\nThis project uses **Domain-Driven Design (DDD)** architecture, with literature research domain knowledge as the core model.\n\n```text\nsrc/pubmed_search/\n├── domain/                     # Core business logic\n│   └── entities/article.py     # UnifiedArticle, Author, etc.\n├── application/                # Use cases\n│   ├── search/                 # QueryAnalyzer, ResultAggregator\n│   ├── export/                 # Citation export (RIS, BibTeX...)\n│   └── session/                # SessionManager\n├── infrastructure/             # External systems\n│   ├── ncbi/                   # Entrez, iCite, Citation Exporter\n│   ├── sources/                # Europe PMC, CORE, CrossRef...\n│   └── http/                   # HTTP clients\n├── presentation/               # User interfaces\n│   ├── mcp_server/             # MCP tools, prompts, resources\n│   │   └── tools/              # discovery, strategy, pico, export...\n│   └── api/                    # Auxiliary HTTP API routes (not pubmed_search.api)\n└── shared/                     # Cross-cutting concerns\n    ├── exceptions.py           # Unified error handling\n    └── async_utils.py          # Rate limiter, retry, circuit breaker\n```\n\n### Internal Mechanisms (Transparent to Agent)\n\n| Mechanism | Description |\n| --------- | ----------- |\n| **Session** | Auto-create, auto-switch |\n| **Cache** | Auto-cache search results, avoid duplicate API calls |\n| **Rate Limit** | Auto-comply with NCBI API limits (0.34s/0.1s) |\n| **MeSH Lookup** | `generate_search_queries()` auto-queries NCBI MeSH database |\n| **ESpell** | Auto spelling correction (`remifentanyl` → `remifentanil`) |\n| **Query Analysis** | Each suggested query shows how PubMed actually interprets it |\n\n### Vocabulary Translation Layer (Key Feature)\n\n> **Our Core Value**: We are the **intelligent middleware** between Agent and Search Engines, automatically handling vocabulary standardization so Agent doesn't need to know each database's terminology.\n\nDifferent data sources use different controlled vocabulary systems. This server provides automatic conversion:\n\n| API / Database | Vocabulary System | Auto-Conversion |\n| -------------- | ----------------- | --------------- |\n| **PubMed / NCBI** | MeSH (Medical Subject Headings) | ✅ Full support via `expand_with_mesh()` |\n| **ICD Codes** | ICD-10-CM / ICD-9-CM | ✅ Auto-detect & convert to MeSH |\n| **Europe PMC** | Text-mined entities (Gene, Disease, Chemical) | ✅ `get_text_mined_terms()` extraction |\n| **OpenAlex** | Topics / keywords (model-inferred) | ✅ Broker keyword mode; bounded native semantic mode when selected |\n| **Semantic Scholar** | S2 fields / bulk query syntax | ✅ Broker chooses relevance or bounded bulk mode; provider annotations keep provenance |\n| **CORE** | None | ❌ Free-text only |\n| **CrossRef** | None | ❌ Free-text only |\n\n#### Automatic ICD → MeSH Conversion\n\nWhen searching with ICD codes (e.g., `I10` for Hypertension), `unified_search()` automatically:\n\n1. Detects ICD-10/ICD-9 patterns via `detect_and_expand_icd_codes()`\n2. Looks up corresponding MeSH terms from internal mapping (`ICD10_TO_MESH`, `ICD9_TO_MESH`)\n3. Expands query with MeSH synonyms for comprehensive search\n\n```python\n# Agent calls unified_search with clinical terminology\nunified_search(query=\"I10 treatment outcomes\")\n\n# Server auto-expands to PubMed-compatible query\n\"(I10 OR Hypertension[MeSH]) treatment outcomes\"\n```\n\n> 📖 **Full architecture documentation**: [ARCHITECTURE.md](#/architecture)\n\n### MeSH Auto-Expansion + Query Analysis\n\nWhen calling `generate_search_queries(\"remimazolam sedation\")`, internally it:\n\n1. **ESpell Correction** - Fix spelling errors\n2. **MeSH Query** - `Entrez.esearch(db=\"mesh\")` to get standard vocabulary\n3. **Synonym Extraction** - Get synonyms from MeSH Entry Terms\n4. **Query Analysis** - Analyze how PubMed interprets each query\n\n```json\n{\n  \"mesh_terms\": [\n    {\n      \"input\": \"remimazolam\",\n      \"preferred\": \"remimazolam [Supplementary Concept]\",\n      \"synonyms\": [\"CNS 7056\", \"ONO 2745\"]\n    }\n  ],\n  \"all_synonyms\": [\"CNS 7056\", \"ONO 2745\", ...],\n  \"suggested_queries\": [\n    {\n      \"id\": \"q1_title\",\n      \"query\": \"(remimazolam sedation)[Title]\",\n      \"purpose\": \"Exact title match - highest precision\",\n      \"estimated_count\": 8,\n      \"pubmed_translation\": \"\\\"remimazolam sedation\\\"[Title]\"\n    },\n    {\n      \"id\": \"q3_and\",\n      \"query\": \"(remimazolam AND sedation)\",\n      \"purpose\": \"All keywords required\",\n      \"estimated_count\": 561,\n      \"pubmed_translation\": \"(\\\"remimazolam\\\"[Supplementary Concept] OR \\\"remimazolam\\\"[All Fields]) AND (\\\"sedate\\\"[All Fields] OR ...)\"\n    }\n  ]\n}\n```\n\n> **Value of Query Analysis**: Agent thinks `remimazolam AND sedation` only searches these two words, but PubMed actually expands to Supplementary Concept + synonyms, results go from 8 to 561. This helps Agent understand the difference between **intent** and **actual search**.\n\n---\n\n## 🔒 Local HTTPS Demo and Service Deployment\n\nThe bundled self-signed certificates and `curl -k` flow are a **local TLS demo**,\nnot a production security profile. For a shared service, use the authenticated\nservice Compose file and a trusted certificate as described in\n[DEPLOYMENT.md](#/deployment).\n\n### Local HTTPS Smoke Test\n\n```bash\n# Step 1: Generate SSL certificates\n./scripts/generate-ssl-certs.sh\n\n# Step 2: Start HTTPS service (Docker)\n./scripts/start-https-docker.sh up\n\n# Verify deployment\ncurl -k https://localhost/\n```\n\n### HTTPS Endpoints\n\n| Service | URL | Description |\n| ------- | --- | ----------- |\n| MCP | `https://localhost/mcp` | Streamable HTTP MCP endpoint |\n| Health | `https://localhost/health` | Health check |\n| Ready | `https://localhost/ready` | Readiness check |\n| Info | `https://localhost/info` | Runtime transport and endpoint metadata |\n| Exports | `https://localhost/exports` | Local prepared export listing; service mode requires bearer auth and tenant scope |\n\n### Remote MCP Client Configuration\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"url\": \"https://localhost/mcp\"\n    }\n  }\n}\n```\n\n---\n\n## 🏢 Microsoft Copilot Studio Integration\n\nIntegrate PubMed Search MCP with **Microsoft 365 Copilot** (Word, Teams, Outlook)!\n\n### Quick Start\n\n```bash\n# Unpublished local schema/protocol smoke only; never tunnel local mode\npubmed-search-mcp-http --mode local --transport streamable-http \\\n  --copilot-compatible --host 127.0.0.1 --port 8765\n\n# Public Copilot endpoint: authenticated service mode is mandatory\nexport PUBMED_AUTH_TOKENS=\"copilot:$(openssl rand -hex 32)\"\nexport NGROK_DOMAIN=\"your-assigned-domain.ngrok.dev\"\n./scripts/start-copilot-studio.sh --with-ngrok\n```\n\n### Copilot Studio Configuration\n\n| Field | Value |\n| ----- | ----- |\n| **Server name** | `PubMed Search` |\n| **Server URL** | `https://your-server.com/mcp` |\n| **Authentication** | Bearer token for service mode; `None` only for an unpublished local demo |\n\n> 📖 **Full documentation**: [copilot-studio/README.md](https://github.com/u9401066/pubmed-search-mcp/blob/master/copilot-studio/README.md)\n>\n> Use `pubmed-search-mcp-http --copilot-compatible` for packaged Copilot HTTP semantics. `run_server.py` remains a source-tree development wrapper; use `run_copilot.py` only for loopback-only 12-tool primitive-schema smoke tests. That simplified surface still calls the shared runner through `unified_search(query, limit, min_year, max_year, sources, options)` and exposes primitive-schema `read_session` for search-run, replay-argument, and artifact recovery; it does not expose a PubMed-only generic-search alias. The tunnel script requires an assigned `NGROK_DOMAIN`, refuses occupied backend ports, and publishes only after `--mode service` passes readiness and unauthenticated-rejection checks.\n>\n> ⚠️ **Note**: SSE transport deprecated since Aug 2025. Use `streamable-http`.\n\n---\n\n> 📖 **More documentation**:\n>\n> - Architecture → [ARCHITECTURE.md](#/architecture)\n> - Pipeline tutorial (English) → [docs/PIPELINE_MODE_TUTORIAL.en.md](#/pipeline-tutorial)\n> - Pipeline tutorial (zh-TW) → [docs/PIPELINE_MODE_TUTORIAL.md](#/pipeline-tutorial-zh)\n> - Deployment guide → [DEPLOYMENT.md](#/deployment)\n> - Copilot Studio → [copilot-studio/README.md](https://github.com/u9401066/pubmed-search-mcp/blob/master/copilot-studio/README.md)\n\n---\n\n## 🔐 Security\n\n### Security Features\n\n| Layer | Feature | Description |\n| ----- | ------- | ----------- |\n| **HTTPS** | TLS termination | Required for remote credentials; the bundled self-signed profile is local-only |\n| **Bearer authentication** | Stable principal | Mandatory in service mode and used for tenant authorization |\n| **Tenant storage** | Filesystem isolation | Sessions, artifacts, exports, chronicles, and pipelines are stored below the authenticated principal |\n| **Fairness and rate policy** | Tenant concurrency + shared upstream budgets | Prevents one caller from multiplying an upstream API allowance |\n| **Security headers** | Clickjacking/MIME hardening | Reverse-proxy headers complement authentication; they are not CSRF authorization |\n| **Secret handling** | Runtime secret injection | API keys and bearer tokens must come from deployment secrets/environment and must not be committed or logged |\n\nSee [DEPLOYMENT.md](#/deployment) for detailed deployment instructions.\n\n---\n\n## 📤 Export Formats\n\n![Export and local notes workflow](images/export-notes-workflow.svg)\n\nExport your search results in formats compatible with major reference managers:\n\n| Format | Source | Compatible With | Use Case |\n| ------ | ------ | --------------- | -------- |\n| **RIS** | official or local | EndNote, Zotero, Mendeley | Universal import |\n| **MEDLINE** | official or local | PubMed tools | Native PubMed-style archiving |\n| **CSL JSON** | official | Citation processors | Programmatic citation styling |\n| **BibTeX** | local | LaTeX, Overleaf, JabRef | Academic writing |\n| **CSV** | local | Excel, Google Sheets | Data analysis |\n| **JSON** | local | Programmatic access | Custom processing |\n\n### Exported Fields\n\n- **Core**: PMID, Title, Authors, Journal, Year, Volume, Issue, Pages\n- **Identifiers**: DOI, PMC ID, ISSN\n- **Content**: Abstract (HTML tags cleaned)\n- **Metadata**: Language, Publication Type, Keywords\n- **Access**: DOI URL, PMC URL, Full-text availability\n\n### Special Character Handling\n\n- BibTeX exports use **pylatexenc** for proper LaTeX encoding\n- Nordic characters (ø, æ, å), umlauts (ü, ö, ä), and accents are correctly converted\n- Example: `Søren Hansen` → `S{\\o}ren Hansen`\n\n---\n\n## 📚 Citation\n\nGitHub will show **Cite this repository** from [CITATION.cff](https://github.com/u9401066/pubmed-search-mcp/blob/master/CITATION.cff). If you use PubMed Search MCP in research, methods sections, or internal technical reports, prefer the GitHub-generated citation or reuse the repository metadata directly.\n\n```bibtex\n@software{pubmed_search_mcp,\n  title = {PubMed Search MCP},\n  author = {u9401066},\n  url = {https://github.com/u9401066/pubmed-search-mcp}\n}\n```\n\n---\n\n## 📄 License\n\nApache License 2.0 - see [LICENSE](https://github.com/u9401066/pubmed-search-mcp/blob/master/LICENSE)\n\n---\n\n## 🔗 Links\n\n- [GitHub Repository](https://github.com/u9401066/pubmed-search-mcp)\n- [PyPI Package](https://pypi.org/project/pubmed-search-mcp/)\n- [NCBI Entrez Programming Utilities](https://www.ncbi.nlm.nih.gov/books/NBK25497/)\n",
-  "overview-zh": "<!-- Generated from README.zh-TW.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP\n\n[![PyPI version](https://badge.fury.io/py/pubmed-search-mcp.svg)](https://badge.fury.io/py/pubmed-search-mcp)\n[![Python 3.10+](https://img.shields.io/badge/python-3.10+-blue.svg)](https://www.python.org/downloads/)\n[![License: Apache 2.0](https://img.shields.io/badge/License-Apache%202.0-blue.svg)](https://opensource.org/licenses/Apache-2.0)\n[![MCP](https://img.shields.io/badge/MCP-Compatible-green.svg)](https://modelcontextprotocol.io/)\n[![CI](https://github.com/u9401066/pubmed-search-mcp/actions/workflows/ci.yml/badge.svg)](https://github.com/u9401066/pubmed-search-mcp/actions/workflows/ci.yml)\n\n> **AI Agent 的專業文獻研究助理** - 不只是 API 包裝器\n\n![PubMed Search MCP 研究工作流](images/research-workflow.svg)\n\n基於 Domain-Driven Design (DDD) 架構的 MCP 伺服器，作為 AI Agent 的智慧研究助理，提供任務導向的文獻搜尋與分析能力。\n\n**✨ 包含內容：**\n\n- 🔧 **45 個 MCP 工具** - 精簡的 PubMed、Europe PMC、CORE、NCBI 資料庫存取，及**研究編年史 / 脈絡圖**功能\n- 🛡️ **多 Agent 服務模式** - 部署一次供多個 agent 共用：session、快取與 artifact 依租戶隔離，支援 bearer token 認證與各租戶公平配額。詳見 [DEPLOYMENT.md](#/deployment)\n- 🖼️ **OA 圖表擷取** - 從 PMC Open Access 論文直接抽出 figure caption、image URL 與 PDF 連結\n- 📘 **Docs Site** - 完整雙語手冊：使用者工作流、架構、45-tool reference、pipeline 教學、source/broker contracts、整合與維運、安全與部署，入口在 [u9401066.github.io/pubmed-search-mcp](https://u9401066.github.io/pubmed-search-mcp/)\n- 📖 **GitHub Wiki** - 同一組 canonical docs 的 GitHub 內建文件鏡像，入口在 [github.com/u9401066/pubmed-search-mcp/wiki](https://github.com/u9401066/pubmed-search-mcp/wiki)\n- 📚 **26 個 Claude Skills** - AI Agent 可直接使用的工作流程指南（Claude Code 專屬）\n- 📖 **Copilot 整合指南** - VS Code GitHub Copilot 使用說明\n\n**🌐 語言**: [English](#/overview) | **繁體中文**\n\n**📘 文件地圖**：README 是專案入口與快速導覽；[Docs Site](https://u9401066.github.io/pubmed-search-mcp/) 提供最佳閱讀體驗；[GitHub Wiki](https://github.com/u9401066/pubmed-search-mcp/wiki) 提供 GitHub 內建導覽；實際編修以 source docs 為準：[使用者指南](#/user-guide-zh) | [進階研究工作流](#/advanced-workflows-zh) | [能力導向使用指南](#/tools-usage-guide-zh) | [Provider 資料平面](#/semantic-scholar-api) | [BioMCP 架構分析](#/biomcp-analysis) | [開發者指南](#/developer-guide-zh) | [完整工具索引](#/quick-reference)\n\n---\n\n## 🚀 快速安裝\n\n### 前置需求\n\n- **Python 3.10+** — [下載](https://www.python.org/downloads/)\n- **uv**（推薦）— [安裝 uv](https://docs.astral.sh/uv/getting-started/installation/)\n\n  ```bash\n  # macOS / Linux\n  curl -LsSf https://astral.sh/uv/install.sh | sh\n  # Windows\n  powershell -ExecutionPolicy ByPass -c \"irm https://astral.sh/uv/install.ps1 | iex\"\n  ```\n\n- **NCBI Email** — [NCBI API 政策](https://www.ncbi.nlm.nih.gov/books/NBK25497/#chapter2.Usage_Guidelines_and_Requirements)要求，任何有效的電子郵件地址\n- **NCBI API Key**（*選填*）— [在此取得](https://www.ncbi.nlm.nih.gov/account/settings/)，可提高 API 限額（10 req/s vs 3 req/s）\n- **OpenAlex API Key**（*選填*）— 設定 `OPENALEX_API_KEY` 後會使用 authenticated credit allocation；未設定時則依 OpenAlex 當下的匿名 casual-use budget。`mailto` 只是 contact metadata，不是認證。若未設定來源專用 email，server 會把 runtime contact email 重用於 OpenAlex、CrossRef 與 Unpaywall。\n\n### 安裝與執行\n\n```bash\n# 方式 1：使用 uvx 免安裝（推薦新手嘗試用）\nuvx pubmed-search-mcp\n\n# 方式 2：加入專案依賴\nuv add pubmed-search-mcp\n\n# 方式 3：pip 安裝\npip install pubmed-search-mcp\n```\n\n### Python SDK facade\n\n若是在 Python 套件、notebook、或自動化程式中直接呼叫，請使用穩定的\n`pubmed_search.api` facade，不要 import MCP tool module：\n\n```python\nfrom pubmed_search.api import PubMedSearchClient, PubMedSearchConfig\n\nclient = PubMedSearchClient(PubMedSearchConfig(email=\"your@email.com\"))\nresult = await client.unified_search(\"remimazolam ICU sedation\", limit=20)\n\nprint(result.articles)\nprint(result.source_counts)\nprint(result.artifact)  # 啟用 persistence 時會有 artifact locator\n```\n\n`uvx pubmed-search-mcp` 與 `/mcp` 是給 AI agent / MCP client 的工具合約；\nPython SDK 則是給外部 Python code 的 in-process 合約。\n\n### 選擇 runtime 合約\n\n| 合約 | 指令 | 網路與信任邊界 |\n| --- | --- | --- |\n| **本機 stdio** | `uvx pubmed-search-mcp` | 建議給單一本機 AI client；不開啟 MCP listening port |\n| **本機 loopback HTTP** | `pubmed-search-mcp-http --mode local --host 127.0.0.1` | 可信單使用者整合；各 MCP request 共用 durable `default` tenant，且不可對外發布此 port |\n| **多使用者 service** | `pubmed-search-mcp-http --mode service` | 團隊/遠端使用必須置於 HTTPS 後方，並強制 bearer auth、allowed hosts/origins 與 principal-scoped storage |\n\n本機與 service 是刻意分開的合約。不可只改 bind address 就把本機 HTTP\n當成公開服務。顯式 local profile 會把 `pmids=\"last\"`、session、cache 與 export\n保留在 durable `default` tenant，跨 MCP requests 與重連仍可使用；這只在強制\nloopback/Host/Origin 邊界內才安全。Service mode 不繼承此信任，無 bearer\nprincipal 時會 fail closed。完整環境與 Compose profile 見 [DEPLOYMENT.md](#/deployment)。\n目前 service profile 可在單一 server process 服務多個已認證 principal；在 session、\nlock、artifact 與 subscription 都有共享 backend 前，必須維持單副本。\n\nProtocol baseline 是 MCP SDK v2（`mcp>=2.0,<3`）。現代 2026-07-28 client 會直接送\n`tools/list` 與 `tools/call`，不先做 `initialize` handshake，也不依賴 `Mcp-Session-Id`。\n本機模式保留 filesystem 能力；認證 service caller 不能載入 `file:` pipeline、選擇 note\n`output_dir`/`template_file`，也不繼承 process-wide pipeline workspace；service Compose\nscheduler 會停用。完整能力矩陣見 [整合與維運指南](#/troubleshooting)。\n\n---\n\n## ⚙️ 設定方式\n\n本 MCP 伺服器可與**任何 MCP 相容的 AI 工具**配合使用。選擇您偏好的客戶端：\n\n### VS Code / Cursor (`.vscode/mcp.json`)\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n選用：若要在 VS Code 內「設定一次，之後自動使用」browser-session PDF fallback，可直接加一個設定：\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"BROWSER_FETCH_CONFIG\": \"{\\\"enabled\\\":true,\\\"auto_enabled\\\":true,\\\"broker_url\\\":\\\"http://127.0.0.1:8766/fetch\\\",\\\"token\\\":\\\"<random-32-byte-token>\\\",\\\"allowed_hosts\\\":[\\\"jamanetwork.com\\\",\\\"*.jamanetwork.com\\\",\\\"nejm.org\\\",\\\"*.nejm.org\\\"]}\"\n      }\n    }\n  }\n}\n```\n\n設定後，get_fulltext 遇到 institutional resolver 或 publisher landing page 時，會自動嘗試本機 broker。只有在單次呼叫想刻意關掉時，才需要傳 allow_browser_session=false。\n\n本機 broker 的自動下載攔截啟動方式：\n\n```bash\nuv sync --extra browser-broker\nuv run playwright install chromium\nuv run python -c \"import secrets; print(secrets.token_urlsafe(32))\"\nuv run pubmed-browser-fetch-broker --token \"<same-random-32-byte-token>\"\n```\n\n請把產生的值填入命令與 MCP 設定，絕不要重用文件裡的公開範例 token。若省略\n`--token`，broker 會產生並顯示一組高熵 runtime token。這個 broker 會啟動一個\n可重複使用的瀏覽器 profile，並攔截下載事件。你只要在 broker 控制的瀏覽器裡\n登入一次，之後 PDF 下載就會直接落到暫存目錄並回傳給 MCP，不會再跳出手動另存\n對話框。\n\n### Claude Desktop (`claude_desktop_config.json`)\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n> **設定檔位置**：\n>\n> - macOS: `~/Library/Application Support/Claude/claude_desktop_config.json`\n> - Windows: `%APPDATA%\\Claude\\claude_desktop_config.json`\n> - Linux: `~/.config/Claude/claude_desktop_config.json`\n\n### Claude Code\n\n```bash\nclaude mcp add pubmed-search -- uvx pubmed-search-mcp\n```\n\n或在專案根目錄的 `.mcp.json` 中新增：\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n### Zed AI (`settings.json`)\n\nZed 編輯器（[z.ai](https://zed.dev)）原生支援 MCP 伺服器。在 Zed 的 `settings.json` 中新增：\n\n```json\n{\n  \"context_servers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n> **提示**：開啟命令面板 → `zed: open settings` 編輯，或前往 Agent Panel → Settings →「Add Custom Server」。\n\n### OpenClaw 🦞 (`~/.openclaw/openclaw.json`)\n\n[OpenClaw](https://docs.openclaw.ai/) 透過 [mcp-adapter 插件](https://github.com/androidStern-personal/openclaw-mcp-adapter)支援 MCP 伺服器。先安裝 adapter：\n\n```bash\nopenclaw plugins install mcp-adapter\n```\n\n然後新增到 `~/.openclaw/openclaw.json`：\n\n```json\n{\n  \"plugins\": {\n    \"entries\": {\n      \"mcp-adapter\": {\n        \"enabled\": true,\n        \"config\": {\n          \"servers\": [\n            {\n              \"name\": \"pubmed-search\",\n              \"transport\": \"stdio\",\n              \"command\": \"uvx\",\n              \"args\": [\"pubmed-search-mcp\"],\n              \"env\": {\n                \"NCBI_EMAIL\": \"your@email.com\"\n              }\n            }\n          ]\n        }\n      }\n    }\n  }\n}\n```\n\n設定後重啟 gateway：\n\n```bash\nopenclaw gateway restart\nopenclaw plugins list  # 應顯示: mcp-adapter | loaded\n```\n\n### Cline (`cline_mcp_settings.json`)\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      },\n      \"alwaysAllow\": [],\n      \"disabled\": false\n    }\n  }\n}\n```\n\n### 其他 MCP 客戶端\n\n任何 MCP 相容客戶端都可以透過 stdio transport 使用此伺服器：\n\n```bash\n# 指令\nuvx pubmed-search-mcp\n\n# 搭配環境變數\nNCBI_EMAIL=your@email.com uvx pubmed-search-mcp\n```\n\n> **注意**: `NCBI_EMAIL` 是 NCBI API 政策要求的必填項。可選擇性設定 `NCBI_API_KEY` 以獲得更高的 API 限額（10 req/s vs 3 req/s）。\n> 📖 **完整整合指南**：詳見 [docs/INTEGRATIONS.md](#/troubleshooting)，包含所有環境變數、Copilot Studio 設定、Docker 部署、代理設定與疑難排解。\n\n---\n\n## 🎯 設計理念\n\n> **核心定位**：AI Agent 與學術搜尋引擎之間的**智慧中介層**。\n\n### 為什麼選擇這個伺服器？\n\n其他工具給你原始 API 存取。我們給你**詞彙翻譯 + 智慧路由 + 研究分析**：\n\n| 挑戰 | 我們的解決方案 |\n| ---- | -------------- |\n| Agent 用 ICD 碼，PubMed 要 MeSH | ✅ **自動 ICD→MeSH 轉換** |\n| 多資料庫，不同 API | ✅ **Unified Search** 單一入口 |\n| 臨床問題需結構化搜尋 | ✅ **PICO handoff + pipeline** (`parse_pico` 驗證 agent 提供的 P/I/C/O，並回傳可執行的 `template: pico` pipeline) |\n| 醫學術語打錯字 | ✅ **ESpell 自動校正** |\n| 單一來源結果太多 | ✅ **平行多源搜尋** + 去重 |\n| 需要追蹤研究演進脈絡 | ✅ **研究時間軸 & 脈絡樹** + 重要文獻偵測 + diagnostics + 子議題分支 |\n| 引用上下文不清楚 | ✅ **引用樹** 前向/後向/網路分析 |\n| 無法取得全文 | ✅ **多源全文取得**（Europe PMC XML、Unpaywall OA locations、institutional direct/EZproxy、CORE 與 downloader fallbacks） |\n| 基因/藥物資訊散布不同資料庫 | ✅ **NCBI 延伸** (Gene, PubChem, ClinVar) |\n| 匯出到文獻管理軟體 | ✅ **一鍵匯出** (official RIS/MEDLINE/CSL JSON；local RIS/BibTeX/CSV/MEDLINE/JSON) |\n| 需要最新預印本研究 | ✅ **預印本搜尋** (arXiv, medRxiv, bioRxiv) 含同儕審查過濾 |\n\n### 核心差異化\n\n1. **詞彙翻譯層** - Agent 自然語言表達，我們翻譯成各資料庫術語 (MeSH, ICD-10, text-mined entities)\n2. **統一搜尋閘道** - 一個 `unified_search()` 呼叫，依能力分流到 PubMed、Europe PMC、CORE、OpenAlex、Semantic Scholar 與已啟用的預印本／商用來源\n3. **PICO Handoff + Pipeline** - Agent 先抽出 P/I/C/O，`parse_pico()` 驗證這份結構化 handoff，後端 `template: pico` pipeline 執行含 O 的 precision/recall 搜尋\n4. **研究時間軸 & 脈絡樹** - 以 policy-driven 規則自動偵測里程碑，結合多訊號重要文獻評分（引用影響力+多源交叉驗證+引用速度），並輸出 timeline diagnostics 與子議題分支視覺化\n5. **引用網路分析** - 從單篇論文建構多層引用樹，繪製完整研究版圖\n6. **完整研究生命週期** - 從搜尋 → 探索 → 全文 → 分析 → 匯出，一站完成\n7. **Agent-First 設計** - 輸出優化機器決策，非人類閱讀\n\n---\n\n## 📡 外部 API 與資料來源\n\n本 MCP 伺服器整合多個學術資料庫和 API：\n\n### 核心資料來源\n\n| 來源 | 收錄量 | 詞彙系統 | 自動轉換 | 說明 |\n| ---- | ------ | -------- | -------- | ---- |\n| **NCBI PubMed** | 36M+ 文章 | MeSH | ✅ 原生支援 | 主要生醫文獻 |\n| **NCBI Entrez** | 多資料庫 | MeSH | ✅ 原生支援 | Gene, PubChem, ClinVar |\n| **Europe PMC** | 33M+ | Text-mined | ✅ 擷取 | 全文 XML 存取 |\n| **CORE** | 200M+ | 無 | ➡️ 自由文字 | 開放取用聚合器 |\n| **Semantic Scholar** | 持續演進的 graph + operator datasets | S2 fields / bulk syntax | ✅ Broker 編譯模式 | Relevance、bounded bulk、batch、citation graph 與 metadata-only release/diff plane；不下載 partition |\n| **OpenAlex** | 持續演進的開放研究圖譜 | Topics / keywords | ✅ Keyword + bounded native semantic | Cursor、cost provenance、entity graph 與已宣告的 operator snapshot 路徑；尚無 local index |\n| **NIH iCite** | PubMed | N/A | N/A | 引用指標 (RCR) |\n\n> **🔑 說明**: ✅ = 完整詞彙支援 | ➡️ = 查詢直接傳遞（無控制詞彙）\n> **ICD 碼**：自動偵測並在 PubMed 搜尋前轉換為 MeSH\n\n### 環境變數\n\n```bash\n# 必填\nNCBI_EMAIL=your@email.com          # NCBI 政策要求\n\n# 選填 - 提高 API 限額\nNCBI_API_KEY=your_ncbi_api_key     # 取得：https://www.ncbi.nlm.nih.gov/account/settings/\nCORE_API_KEY=your_core_api_key     # 取得：https://core.ac.uk/services/api\nCROSSREF_EMAIL=your@email.com      # 選填覆寫；預設使用 server/NCBI email\nUNPAYWALL_EMAIL=your@email.com     # 選填覆寫；預設使用 server/NCBI email\nS2_API_KEY=your_s2_api_key         # 取得：https://www.semanticscholar.org/product/api\nOPENALEX_API_KEY=your_openalex_key # 提高 OpenAlex credit budget；實際額度依 response\n\n# 選填 - 網路設定\nHTTP_PROXY=http://proxy:8080       # HTTP 代理\nHTTPS_PROXY=https://proxy:8080     # HTTPS 代理\n\n# 選填 - 機構全文存取\nINSTITUTIONAL_DIRECT_FETCH=true    # 在 CORE fallback 前嘗試 DOI publisher page\nEZPROXY_ENABLED=false              # 設好 EZPROXY_HOST + cookie 後才啟用\nEZPROXY_HOST=ezproxy.example.edu\nEZPROXY_COOKIE_FILE=/path/to/cookies.json\n\n# 選填 - 本機筆記匯出\nPUBMED_NOTES_DIR=/path/to/wiki/references  # save_literature_notes 目標資料夾\nPUBMED_WORKSPACE_DIR=/path/to/project       # fallback：使用此 workspace 下的 references/\nPUBMED_DATA_DIR=~/.pubmed-search-mcp        # fallback：使用此 data dir 下的 references/\n```\n\nCrossRef 與 Unpaywall 會重用 runtime server contact email（`NCBI_EMAIL`、CLI\n`--email` 或偵測到的 git email），除非另設來源專用 email。OpenAlex 支援 casual\nanonymous usage 與選填 API key；broker 依 response 的 credit/rate metadata 決策，\n不再假設永久的「polite pool」額度。\n\n本機筆記目錄解析順序是：`output_dir` 參數、`PUBMED_NOTES_DIR`、`PUBMED_WORKSPACE_DIR/references`、`PUBMED_DATA_DIR/references`、最後 `~/.pubmed-search-mcp/references`。\n這套 path/template 選擇只適用於可信任的本機模式。認證 service notes 一律使用內建\nformat，寫到當前 tenant 隔離的 `references/` 目錄。\n為了相容 LLM wiki，`wiki` 與 `foam` 匯出會使用 PMID、DOI、PMCID 或 fallback identifier 作為穩定 link target；title 只作為 alias/display label，回應會包含 `wiki_validation` 方便檢查 unresolved wikilinks。\n\n---\n\n## 🔄 運作原理：中介層架構\n\n```text\n┌─────────────────────────────────────────────────────────────────────────────┐\n│                              AI AGENT                                        │\n│                                                                              │\n│   「找 I10 高血壓在糖尿病患者的治療論文」                                         │\n│                                                                              │\n└─────────────────────────────────────────┬───────────────────────────────────┘\n                                          │\n                                          ▼\n┌─────────────────────────────────────────────────────────────────────────────┐\n│                     🔄 PUBMED SEARCH MCP (中介層)                            │\n│  ┌─────────────────────────────────────────────────────────────────────────┐│\n│  │  1️⃣ 詞彙翻譯                                                            ││\n│  │     • ICD-10 \"I10\" → MeSH \"Hypertension\"                                ││\n│  │     • \"糖尿病\" → MeSH \"Diabetes Mellitus\"                               ││\n│  │     • ESpell: \"hypertention\" → \"hypertension\"                           ││\n│  └─────────────────────────────────────────────────────────────────────────┘│\n│  ┌─────────────────────────────────────────────────────────────────────────┐│\n│  │  2️⃣ 智慧路由                                                            ││\n│  │     ┌──────────┐  ┌──────────┐  ┌──────────┐  ┌──────────┐             ││\n│  │     │ PubMed   │  │Europe PMC│  │   CORE   │  │ OpenAlex │             ││\n│  │     │  36M+    │  │   33M+   │  │  200M+   │  │  250M+   │             ││\n│  │     │  (MeSH)  │  │(全文)    │  │  (OA)    │  │(元資料)  │             ││\n│  │     └────┬─────┘  └────┬─────┘  └────┬─────┘  └────┬─────┘             ││\n│  │          └──────────────┴──────────────┴──────────────┘                 ││\n│  │                              ▼                                          ││\n│  │  3️⃣ 結果聚合：去重 + 排序 + 補充                                         ││\n│  └─────────────────────────────────────────────────────────────────────────┘│\n└─────────────────────────────────────────┬───────────────────────────────────┘\n                                          │\n                                          ▼\n┌─────────────────────────────────────────────────────────────────────────────┐\n│                         統一結果                                              │\n│   • 150 篇唯一論文（從 4 個來源去重）                                          │\n│   • 按相關性 + 引用影響力 (RCR) 排序                                          │\n│   • 全文連結從 Europe PMC 補充                                                │\n└─────────────────────────────────────────────────────────────────────────────┘\n```\n\n---\n\n## 🛠️ MCP 工具概覽\n\n如果你想真正理解這 45 個工具怎麼用，不要從背工具名開始。\n\n先看[工具使用指南](#/tools-usage-guide-zh)：它把目前 45 個工具濃縮成 8 個能力族，說明理論上的最小壓縮邊界，以及人類與 agent 的意圖路由方式。\n\n### 🔍 搜尋與查詢智能\n\n![搜尋與查詢智能流程](images/search-query-workflow.svg)\n\n```text\n┌─────────────────────────────────────────────────────────────────┐\n│                        搜尋入口                                   │\n├─────────────────────────────────────────────────────────────────┤\n│                                                                  │\n│   unified_search()          ← 🌟 單一入口，涵蓋所有來源            │\n│        │                                                         │\n│        ├── 快速搜尋     → 直接多源查詢                             │\n│        ├── Native semantic → 有界 OpenAlex 語意模式                 │\n│        ├── Systematic   → 有界 provider bulk/cursor 模式           │\n│        ├── PICO 提示    → 偵測比較結構，顯示 P/I/C/O               │\n│        └── ICD 擴展     → 自動 ICD→MeSH 轉換                      │\n│                                                                  │\n│   來源: PubMed · Europe PMC · CORE · OpenAlex · S2               │\n│   自動: 去重 → 排序 → 補充全文連結                                  │\n│                                                                  │\n├─────────────────────────────────────────────────────────────────┤\n│   查詢智能                                                        │\n│                                                                  │\n│   generate_search_queries() → MeSH 擴展 + 同義詞發現              │\n│   parse_pico()              → Agent-provided PICO handoff        │\n│   analyze_search_query()    → 查詢分析（不執行搜尋）                │\n│                                                                  │\n└─────────────────────────────────────────────────────────────────┘\n```\n\n#### 單一搜尋入口，三種 retrieval policy\n\n一般文獻發現對外固定只有一個 MCP tool：`unified_search`。Provider-specific\nAPI 保持在 broker 內部，以 capability 而不是新 tool 表達：\n\n```python\n# 預設：在已啟用來源中做 relevance/keyword 路由\nunified_search(query=\"treatment resistance\")\n\n# OpenAlex native semantic（provider 上限 50 筆）\nunified_search(\n    query=\"mechanisms of treatment resistance\",\n    sources=\"openalex\",\n    options=\"native_semantic\",\n)\n\n# 可重現的有界檢索：依來源選用 OpenAlex cursor / S2 bulk\nunified_search(\n    query=\"melanoma AND immunotherapy\",\n    sources=\"pubmed,openalex,semantic_scholar\",\n    options=\"systematic\",\n)\n```\n\n`native_semantic` 與 `systematic` 互斥，並會關閉多策略 deep-search\nexpansion。明確指定不支援該 mode 的來源時，broker 會在發送 network\nrequest 前拒絕；自動選源則只保留有能力的 provider。`limit` 每來源仍最多\n100，所以 `systematic` 指的是 deterministic / bounded provider execution，不是\n「已完整覆蓋系統性回顧」的保證。Structured output 與 artifact 會保存\n`retrieval_mode` 及每來源 `source_metadata`（requested/provider mode、canonical 或\ncompiled query、continuation、cost/rate metadata 與 warnings）。\n\n公開 request boundary 採 fail-closed。`limit` 必須是 1 到 100 的整數；未知或\n格式錯誤的 `filters` / `options`、反向或超出範圍的年份，以及不支援的 ranking\n或 output mode，都會在 provider I/O 前回傳 validation error。預設 deep-search\npolicy 中，`limit` 是分配給每個來源所有 query strategies 的**總額度**，不是每個\nstrategy 都各取 `limit` 筆。Strategy calls 有全域／每來源 concurrency 與 timeout\n上限；單一來源 timeout、rate limit 或失敗時，其他來源的成功結果仍可使用。\n\nEurope PMC、Scopus 與 Web of Science 在本版仍是 keyword-only；明確指定\n這些來源的 systematic 請求會在 I/O 前失敗，不會把單頁結果誤標為\nsystematic coverage。\n\nProvider 上限與 operator data-plane 邊界見[Source Contracts](#/source-contracts)、\n[Semantic Scholar](#/semantic-scholar-api) 與\n[OpenAlex](#/openalex-api)。\n\n### 🔬 探索工具（找到關鍵論文後）\n\n![論文探索與引用流程](images/discovery-citation-workflow.svg)\n\n```text\n                        找到重要論文 (PMID)\n                                   │\n           ┌───────────────────────┼───────────────────────┐\n           │                       │                       │\n           ▼                       ▼                       ▼\n    ┌─────────────┐        ┌─────────────┐        ┌─────────────┐\n    │  往前追溯   │        │   相似主題   │        │  往後追蹤   │\n    │  ◀──────    │        │  ≈≈≈≈≈≈     │        │  ──────▶    │\n    │             │        │             │        │             │\n    │ get_article │        │find_related │        │find_citing  │\n    │ _references │        │ _articles   │        │ _articles   │\n    │             │        │             │        │             │\n    │  基礎論文   │        │  相似主題   │        │  後續研究   │\n    └─────────────┘        └─────────────┘        └─────────────┘\n\n    fetch_article_details()   → 詳細文章元資料\n    get_citation_metrics()    → iCite RCR, 引用百分位\n    build_citation_tree()     → 完整網絡視覺化（6 種格式）\n\n```\n\n### 📚 全文、圖表擷取與匯出\n\n![全文、圖表與生醫圖片流程](images/visual-evidence-workflow.svg)\n\n| 類別 | 工具 |\n| ---- | ---- |\n| **全文** | `get_fulltext` → 有 PMCID 時走 Europe PMC XML；需要 DOI fallback 時再嘗試 Unpaywall、institutional direct/EZproxy、CORE 與 downloader fallback |\n| **圖表擷取** | `get_article_figures` → 從 PMC Open Access 文章抽出圖號、caption、image URL 與 PDF 連結 |\n| **圖表感知全文** | `get_fulltext(include_figures=True)` → 在全文回應中直接附帶圖表 metadata |\n| **文字探勘** | `get_text_mined_terms` → 擷取基因、疾病、化學物質 |\n| **匯出** | `prepare_export` → official RIS/MEDLINE/CSL JSON 或 local RIS/BibTeX/CSV/MEDLINE/JSON；`save_literature_notes` → 本機 wiki/Foam-compatible/Markdown/MedPaper-style 筆記與 collection-level CSL JSON |\n\n### 🖼️ OA 論文圖表優先探索\n\n當 Agent 需要的是證據圖像，而不只是文章全文時，建議優先走 PMC Open Access 圖表工作流：\n\n- `get_article_figures(identifier=\"PMC12086443\")` → 回傳圖號、caption、image URL，以及 PDF/文章連結\n- `get_fulltext(pmcid=\"PMC7096777\", include_figures=True)` → 結構化全文連同 figures 一起回傳\n- 圖表輸出會保留文章脈絡，方便 Agent 把 figure 與文中提及段落綁在一起，而不是只看到孤立圖片\n\n### 🧬 NCBI 延伸資料庫\n\n![NCBI 延伸生醫資料流程](images/ncbi-extended-workflow.svg)\n\n| 工具 | 說明 |\n| ---- | ---- |\n| `search_gene` | 搜尋 NCBI Gene 資料庫 |\n| `get_gene_details` | 依 NCBI Gene ID 取得基因詳情 |\n| `get_gene_literature` | 取得與基因相關的 PubMed 文章 |\n| `search_compound` | 搜尋 PubChem 化合物 |\n| `get_compound_details` | 依 PubChem CID 取得化合物詳情 |\n| `get_compound_literature` | 取得與化合物相關的 PubMed 文章 |\n| `search_clinvar` | 搜尋 ClinVar 臨床變異 |\n\n### 🕰️ 研究編年史 & 脈絡樹\n\n![Research Chronicle 架構與脈絡流程](images/research-chronicle-lineage-flow.svg)\n![評估與時間軸流程](images/timeline-evaluation-workflow.svg)\n\n| 工具 | 說明 |\n| ---- | ---- |\n| `build_research_chronicle` | 建構持久化、可版本比對的研究脈絡，支援重要文獻偵測。格式：summary, chronicle_map, timeline, tree, graph, evidence, milestones, mermaid, timeline_mermaid, mindmap, narrative, json |\n| `read_research_chronicle` | 讀取、列表、版本 diff、有證據支撐的敘述、里程碑分佈分析，或比較最多五個主題 |\n\n```python\n# 1. 依主題建立（自動檢索 PubMed、計算 Landmark 分數並聚類分支）\nbuild_research_chronicle(topic=\"remimazolam intraoperative\", output=\"mermaid\", max_events=30)\n\n# 2. 延續既有編年史（自動繼承前版的 topic 與檢索範圍，建立 Revision N+1）\nbuild_research_chronicle(chronicle_id=\"remimazolam-intraoperative-08c229f3\")\n\n# 3. 讀取版本差異、里程碑分析或多主題比較（讀取儲存資料，不重跑檢索）\nread_research_chronicle(action=\"diff\", chronicle_id=\"remimazolam-intraoperative-08c229f3\", from_revision=1)\nread_research_chronicle(action=\"milestones\", chronicle_id=\"remimazolam-intraoperative-08c229f3\")\nread_research_chronicle(action=\"compare\", topics=\"remimazolam intraoperative,propofol intraoperative\")\n```\n\n`mermaid` 是標準合併圖：以年份作橫向主軸（X 軸），各研究線（Y 軸）從**本次檢索範圍內最早的有日期論文**所在年份分岔。這是可解釋的觀察分組，不是因果譜系，也不代表找到整個領域的真正首篇論文。lineage 優先由多篇論文共同出現的 MeSH descriptor 與作者 keyword 推導；只有 singleton 或訊號不足時，audit 會警告分支只是研究階段 fallback。同年項目的顯示順序雖然固定，但日期 precision 不足時不宣稱先後。舊的平面 timeline 保留為 `timeline_mermaid`。完整指南見 [進階研究工作流 (docs/ADVANCED_RESEARCH_WORKFLOWS.zh-TW.md)](#/advanced-workflows-zh) 與規格 [docs/RESEARCH_CHRONICLE_REFACTOR_SPEC.md](#/research-chronicle-rebuild-spec)。\n\nChronicle Mermaid 由結構化 node/edge 生成，會自動跳脫 label、修正循環與孤兒 parent、避免 ID 碰撞並限制圖形大小；rich 圖失敗時依序降級為 safe 與 minimal syntax，不會讓整份 chronicle 建立失敗。`mermaid_validation.json` 記錄每個 correction、fallback 與被摘要的視覺項目，`chronicle.mmd` 則維持純 Mermaid source。\n\nChronicle revisions 不可變，並以原子操作追加。啟用 session artifact persistence 時，如果 artifact 寫入失敗，回應會明確警告；已保存的 Chronicle revision 仍可讀取。\n\nTopic build 會先把年份限制送到 PubMed，再做有界檢索；輸出上限會保留觀察到的首篇、末篇，並以 landmark 與時間分散度補齊。audit 會記錄 PubMed `returned` / `available` 數量；若總量未知，或檢索／選取上限使內容不是完整 census，就會警告。PubMed 錯誤或範圍內沒有任何論文證據時，不會發布空的 revision。\n\n明確 PMID input 採嚴格格式（`12345678` 或 `PMID:12345678`；正 ASCII 數字、最多 20 位），不會把 DOI 或混合文字強制轉成 PMID。沒有可靠出版日期的記錄會標示為 `Undated`、排列在 dated entries 之後，且不計入顯示的年份範圍。entry ID 依 PMID／DOI 證據身分產生，日期或分類修正後仍保持穩定；topic 延續性則共用同一套 Unicode、大小寫與空白 canonical key。符合多個訊號的論文只指定一個 primary branch，其他關聯保留為 explicit cross-links；重疊達 20% 會產生 audit warning。revision diff 中缺席只代表 `not_observed_in_revision`／`removed_from_view`，不能宣稱研究已退場。\n\n### 🏥 機構訂閱與 ICD 轉換\n\n![機構存取流程](images/institutional-access-workflow.svg)\n\n| 工具 | 說明 |\n| ---- | ---- |\n| `configure_institutional_access` | 設定機構的 Link Resolver |\n| `get_institutional_link` | 產生 OpenURL 存取連結 |\n| `list_resolver_presets` | 列出 Resolver 預設值 |\n| `test_institutional_access` | 測試 Resolver 設定 |\n| `diagnose_institutional_access` | 診斷 direct DOI、EZproxy 與 OpenURL handoff 路徑 |\n| `convert_icd_mesh` | ICD 碼與 MeSH 詞彙雙向轉換 |\n| `unified_search` | 在查詢中自動偵測 ICD 代碼並擴展成 MeSH |\n\n### 💾 Session 管理\n\n![Session 與 Pipeline 流程](images/session-pipeline-workflow.svg)\n\n| 工具 | 說明 |\n| ---- | ---- |\n| `get_session_pmids` | 取得暫存的 PMID 列表 |\n| `get_cached_article` | 從 Session 快取取得文章（不消耗 API） |\n| `get_session_summary` | Session 狀態概覽 |\n| `read_session` | 讀取 PMID、快取文章、持久化 search runs、replay arguments、歷史與 artifacts 的 facade |\n\n若 MCP client 支援直接讀取 resources，也可使用以下動態 session resources：\n\n- `session://context` — 目前 session 狀態\n- `session://last-search` — 最近一次搜尋 metadata\n- `session://last-search/pmids` — 最近一次 PMID 清單與 CSV 形式\n- `session://last-search/results` — 最近一次搜尋對應的快取文章內容\n\n### 📦 Persistent Artifacts\n\n當 session persistence 已設定時，`unified_search` 與 `get_fulltext` 會把可重用的完整輸出保存成 artifact。工具回應會像索引卡：包含足夠的 counts、source warnings 與 artifact hints，讓 agent 可以先回覆使用者；完整 evidence payload 則留在可重複讀取的檔案中。精簡 locator 會包含 `artifact_id`、`artifact_uri`、`primary_file`、`summary`、檔案清單、`read_order`、audit status 與 `read_session(...)` 提示。若本機 MCP client 需要直接拿到 `local_path` / `manifest_path`，才設定 `PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true`。\n\n```text\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"audit.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"query_strategy.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"results.json\", offset=0, max_chars=200000)\nread_session(action=\"list_artifacts\", include_local_paths=true)\n```\n\n### 可回復的 search runs\n\nSession manager 可用時，每一次 `unified_search` invocation 都會取得穩定 run ID，\n包括一般搜尋、validation/planning failure，以及 inline、`saved:<name>` 或\n`dry_run=true` pipeline execution。Structured result 與 error 會附上 `search_run`\nhandoff；Markdown 會以精簡 recovery note 回傳相同 run ID。一般 literature-result\nenvelope 會分開提供兩個 machine contract：\n\n- `search_status` 描述有界檢索結果：`state`（`completed`、`empty`、\n  `partial` 或 `failed`）、`bounded=true`、`exhaustive=false`、回傳筆數、\n  attempted/successful/failed/retryable sources，以及有 continuation 或完整度\n  未知的 source lists。\n- `search_run` 是 recovery handoff：穩定 `run_id`、journal status、\n  `recoverable`、可直接交給 `read_session` 的 inspect/replay arguments，以及成功\n  保存時的 artifact URI。\n\nTenant-scoped `search-run/v1` journal 會在 provider I/O 或 terminal validation\nresponse 前發布，並記錄 sanitized request、plan、每來源或每 pipeline step 的實際\nattempts、counts、安全化 failure、result references，以及適用時的 artifact locator。\n最後狀態為 `completed`、`partial`、`failed` 或 `cancelled`；\n合法的零結果搜尋是 `completed` run，但 `search_status.state` 為 `empty`。Server\n重啟時，尚未結束的 `started` / `planned` / `running` 只會被回復一次為\n`interrupted`，不會無聲消失。非 dry-run 的 saved pipeline 還會另外保留\nPipelineStore report/run history；它補充 invocation-level search journal，不會取代它。\n\nPipeline replay 會保存原本的 inline 或 `saved:<name>` argument，以及 `dry_run` /\n`stop_at`。含有 key、token、cookie、password 或其他 credential material 的 pipeline\ntext 會被拒絕並記成 failed run；provider credentials 必須放在 server\nenvironment/configuration，不能寫進 pipeline YAML/JSON。\n\n```text\nread_session(action=\"search_runs\")\nread_session(action=\"search_runs\", run_status=\"partial\")\nread_session(action=\"search_run\", run_id=\"...\")\nread_session(action=\"replay_search\", run_id=\"...\")\n```\n\n`replay_search` 只回傳原本、已移除 credential 的 `unified_search` kwargs，不會\n自動發出任何 network call；agent 或使用者必須先檢查再明確提交。Provider\ncursor/token 會以 opaque provenance 保存在 `source_metadata` 與\n`query_strategy.json`，但目前尚無公開 cursor-resume 參數，因此 replay 會開始一輪\n新的 bounded search。\n\n如果 terminal journal write 無法復原，response 會回報\n`search_run.status=\"history_unavailable\"`、`history_available=false`、預期 terminal\nstatus 與 warning。此時會刻意省略 inspect/replay actions，因為 durable recovery\n無法保證；搜尋結果本身仍可能可用。\n\n`unified_search` artifacts 會使用 research envelope。建議先讀 `audit.json` 確認 source-counts 與完整性警告，再讀 `query_strategy.json` 檢查實際執行的搜尋策略，最後用 `results.json` / `results.toon` 取回完整文章清單。這樣可以節省 MCP response token，同時保留學術可追溯性。\n\n`read_session` 只讀既有 artifact，不會重跑搜尋或全文擷取。若 crash 發生在 artifact directory 已原子發布、但 session index 尚未更新之間，session reload 只會發現結構完整且 checksum 已索引的 manifests，並透過 `search_run_id` 把 orphan artifact 重新連到 search run；舊 artifact 才使用保守的 query match fallback。遠端 client 應使用 `read_session(action=\"artifact\")` 分段讀取；`local_path` / `manifest_path` 是 MCP server host 上的本機路徑，不是可攜的 client 路徑，且預設會被遮蔽。大型 `get_fulltext` 回應在已有 artifact 時會先回 inline preview；要讀完整內容請使用 artifact locator。`get_fulltext` artifact 可能包含全文、訂閱或機構授權內容，正式環境請依 publisher license、機構條款與 retention policy 處理保存與分享。\n\n當單一來源失敗但整體搜尋仍可繼續時，`unified_search` JSON 會回傳 `source_errors`，Markdown 會顯示 `Source warnings`。Semantic Scholar HTTP 429 可設定 `S2_API_KEY` / `SEMANTIC_SCHOLAR_API_KEY`、稍後重試，或用 `sources=\"auto,-semantic_scholar\"` / `PUBMED_SEARCH_DISABLED_SOURCES=semantic_scholar` 暫時排除。\n\n### 🔁 Pipeline 管理\n\n![Session 與 Pipeline 流程](images/session-pipeline-workflow.svg)\n\n`manage_pipeline` 是 pipeline CRUD、history 與 scheduling 的主要 façade；其他 pipeline tools 仍保留作為相容 wrapper。\n\n| 工具 | 說明 |\n| ---- | ---- |\n| `manage_pipeline` | 主要 façade，統一處理 save、list、load、delete、history、schedule |\n| `save_pipeline` | 保存 Pipeline 配置供後續重複使用（YAML/JSON，自動驗證） |\n| `list_pipelines` | 列出已保存的 Pipeline（可按標籤/範圍過濾） |\n| `load_pipeline` | 以已保存名稱載入；可信任的本機 caller 也可載入檔案 |\n| `delete_pipeline` | 刪除 Pipeline 及其執行歷史 |\n| `get_pipeline_history` | 查看執行歷史與文章 diff 分析 |\n| `schedule_pipeline` | 建立、更新或移除定期執行排程 |\n\n認證 service caller 在 tenant-derived store 中以名稱重用 pipeline；`workspace` 與\n`file:` 存取只限本機。Service Compose 不會執行 schedules，除非另外設計單一 leader。\n\n逐步教學：\n\n- 繁體中文: [docs/PIPELINE_MODE_TUTORIAL.md](#/pipeline-tutorial-zh)\n- English: [docs/PIPELINE_MODE_TUTORIAL.en.md](#/pipeline-tutorial)\n\n### 👁️ 視覺搜尋與圖片搜尋\n\n![全文、圖表與生醫圖片流程](images/visual-evidence-workflow.svg)\n\n| 工具 | 說明 |\n| ---- | ---- |\n| `analyze_figure_for_search` | 將上傳圖片、image URL 或 data URI 交給 agent vision 抽取搜尋詞 |\n| `search_biomedical_images` | 搜尋 Open-i 生物醫學圖片（X 光、顯微鏡、照片、圖表） |\n\n使用者提供圖片、而 agent 需要先判讀圖片語意時，使用\n`analyze_figure_for_search`。這個工具會回傳 MCP `ImageContent` 與給 LLM\nagent 的指令；agent 抽出英文 biomedical terms 後，再接續用\n`search_biomedical_images` 找相似 Open-i 圖片，或用 `unified_search`\n搜尋相關論文。\n\n### 📄 預印本搜尋\n\n透過 `unified_search` 的 `options` 旗標搜尋 **arXiv**、**medRxiv**、**bioRxiv** 預印本伺服器：\n\n- `preprints`: 搜尋預印本伺服器，並把預印本以 `article_type=PREPRINT` 合併進主聚合結果。\n- `all_types`: 即使沒有額外爬預印本伺服器，也保留所選學術來源回傳的非同儕審查內容。\n\n**建議組合：**\n\n- 空白 `options`: 僅同儕審查結果；preprint-like records 會被過濾。\n- `options=\"preprints\"`: 搜尋 arXiv、medRxiv、bioRxiv，並把預印本和主結果一起排名/去重。\n- `options=\"preprints, all_types\"`: 同樣執行預印本伺服器搜尋，並保留其他來源中的非同儕審查內容。\n- `options=\"all_types\"`: 不額外爬預印本伺服器，但保留各來源中的非同儕審查項目。\n\n**預印本偵測方式** — 透過以下條件辨識預印本：\n\n- 來源 API 的文章類型（OpenAlex、CrossRef、Semantic Scholar）\n- 有 arXiv ID 但無 PubMed ID\n- 已知預印本伺服器來源或期刊名稱\n- DOI 前綴匹配預印本伺服器（如 `10.1101/` → bioRxiv/medRxiv、`10.48550/` → arXiv）\n\n### 🌳 研究脈絡圖預覽\n\n`unified_search` 現在可直接在同一次搜尋回應中附帶 PMID-based 的研究脈絡圖預覽：\n\n| 選項旗標 | 說明 |\n| -------- | ---- |\n| `context_graph` | Markdown 輸出附帶由本次 PMID-backed ranked set 產生的輕量 Research Context Graph preview；JSON 輸出附帶 `research_context` 欄位 |\n\n這適合 Agent 在不額外呼叫 `build_research_chronicle` 的情況下，先快速掌握主題分支。\n\n### 🧪 臨床試驗登錄附加區塊\n\n系統不會隱式查詢 ClinicalTrials.gov。只有在 Markdown 搜尋明確加上\n`options=\"trials\"` 時，才會執行有上限的 registry adjunct。它不會混入\nliterature source plan 或 source counts；persistent artifact 會在\n`adjunct_queries` 記錄截短後的 physical query 與執行結果。JSON/TOON\n不執行這個只用於顯示的附加區塊。\n\n```python\nunified_search(query=\"remimazolam ICU sedation\", options=\"trials\")\n```\n\n### 📊 Count-First Orientation\n\n`unified_search` 現在也支援把原本就有的來源覆蓋資訊前移，並加上後續工具建議，讓 Agent 先做路由決策，再深入讀排序後的文章：\n\n| 選項旗標 | 說明 |\n| -------- | ---- |\n| `counts_first` | 在回應前段加入 source-count 表格、coverage 摘要，以及 next-tool 建議 |\n\n範例：\n\n```python\nunified_search(query=\"remimazolam ICU sedation\", options=\"counts_first\")\n```\n\n這個模式特別適合先判斷要不要擴大某個來源、讀 lead PMID、抓全文/圖表，或直接轉進 timeline 探索。\n\n### ⏱️ MCP 進度回報\n\n當 MCP client 提供 progress token 時，`unified_search`、`build_research_chronicle`、`get_fulltext`、`get_text_mined_terms` 都會回報主要階段進度，降低 Agent 長時間等待時的黑箱感。\n進度 callback 採 best-effort，不會在 tool call 仍執行時由 server 主動取消，\n避免 progress notification backpressure 造成 host 顯示 `Canceled: Canceled`。\n\n---\n\n## 📋 Agent 使用範例\n\n### 1️⃣ 快速搜尋（最簡單）\n\n```python\n# Agent 自然語言詢問 - 中介層處理一切\nunified_search(query=\"remimazolam ICU sedation\", limit=20)\n\n# 或使用臨床代碼 - 自動轉換為 MeSH\nunified_search(query=\"I10 treatment in E11.9 patients\")\n#                     ↑ ICD-10           ↑ ICD-10\n#                     高血壓             第二型糖尿病\n```\n\n### 2️⃣ PICO 臨床問題\n\n![PICO 臨床搜尋流程](images/pico-clinical-workflow.svg)\n\n**簡單路徑** — `unified_search` 可直接搜尋（不做 PICO 拆解）：\n\n```python\n# unified_search 直接搜尋；偵測「A vs B」模式並在 metadata 中顯示 PICO 提示\nunified_search(query=\"remimazolam 在 ICU 鎮靜比 propofol 好嗎？\")\n# → 多源關鍵字搜尋 + 輸出中附帶 PICO 提示 metadata\n# ⚠️ 這不會自動拆解 PICO 或擴展 MeSH！\n# 結構化 PICO 搜尋請用下方 Agent 工作流程\n```\n\n**Agent 工作流程** — agent-provided PICO + 後端 pipeline 搜尋（臨床問題建議使用）：\n\n```text\n┌─────────────────────────────────────────────────────────────────────────┐\n│  「remimazolam 在 ICU 鎮靜比 propofol 好嗎？」                            │\n└─────────────────────────────────────────┬───────────────────────────────┘\n                                          │\n                                          ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│                         parse_pico()                                     │\n│  ┌─────────┐  ┌─────────┐  ┌─────────┐  ┌─────────┐                     │\n│  │    P    │  │    I    │  │    C    │  │    O    │                     │\n│  │  ICU    │  │remimaz- │  │propofol │  │ 鎮靜    │                     │\n│  │  病人   │  │  olam   │  │         │  │  結果   │                     │\n│  └────┬────┘  └────┬────┘  └────┬────┘  └────┬────┘                     │\n└───────┼────────────┼────────────┼────────────┼──────────────────────────┘\n        │            │            │            │\n        ▼            ▼            ▼            ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│              generate_search_queries() × 4（平行）                       │\n│                                                                          │\n│  P → \"Intensive Care Units\"[MeSH]                                        │\n│  I → \"remimazolam\" [Supplementary Concept], \"CNS 7056\"                   │\n│  C → \"Propofol\"[MeSH], \"Diprivan\"                                        │\n│  O → \"Conscious Sedation\"[MeSH], \"Deep Sedation\"[MeSH]                   │\n└─────────────────────────────────────────┬───────────────────────────────┘\n                                          │\n                                          ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│              Agent 用 Boolean 邏輯組合                                   │\n│                                                                          │\n│  (P) AND (I) AND (C) AND (O)  ← 高精確度                                 │\n│  (P) AND (I OR C) AND (O)     ← 高召回率                                 │\n└─────────────────────────────────────────┬───────────────────────────────┘\n                                          │\n                                          ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│              unified_search()（自動多源 + 去重）                          │\n│                                                                          │\n│  PubMed + Europe PMC + CORE + OpenAlex → 自動去重排序                     │\n└─────────────────────────────────────────────────────────────────────────┘\n```\n\n```python\n# Step 1: Agent 先抽出 P/I/C/O，再驗證結構化 handoff\npico = parse_pico(\n    description=\"remimazolam 在 ICU 鎮靜比 propofol 好嗎？\",\n    p=\"ICU patients requiring sedation\",\n    i=\"remimazolam\",\n    c=\"propofol\",\n    o=\"sedation efficacy, delirium, hypotension\"\n)\n# 回傳 validation 與可直接交給 unified_search 的 `template: pico` pipeline\n\n# Step 2: 對每個元素取得 MeSH（平行！）\ngenerate_search_queries(topic=\"ICU patients\")   # P\ngenerate_search_queries(topic=\"remimazolam\")    # I\ngenerate_search_queries(topic=\"propofol\")       # C\ngenerate_search_queries(topic=\"sedation\")       # O\n\n# Step 3: 可把擴展後的 fragment 用 p_query/i_query/c_query/o_query 貼回 parse_pico，\n# 或讓後端 pipeline 使用結構化 P/I/C/O label。\n\n# Step 4: 後端執行含 O 的 precision/recall 搜尋、dedup、rank\nunified_search(\n    query=\"remimazolam 在 ICU 鎮靜比 propofol 好嗎？\",\n    pipeline=pico[\"pipeline\"]\n)\n```\n\n### 3️⃣ 從關鍵論文探索\n\n```python\n# 找到里程碑論文 PMID: 33475315\nfind_related_articles(pmid=\"33475315\")   # 類似方法論\nfind_citing_articles(pmid=\"33475315\")    # 誰引用了這篇？\nget_article_references(pmid=\"33475315\")  # 基礎是什麼？\n\n# 建構完整研究脈絡\nbuild_citation_tree(pmid=\"33475315\", depth=2, output_format=\"mermaid\")\n```\n\n### 4️⃣ 基因/藥物研究\n\n```python\n# 研究基因\nsearch_gene(query=\"BRCA1\", organism=\"human\")\nget_gene_literature(gene_id=\"672\", limit=20)\n\n# 研究藥物化合物\nsearch_compound(query=\"propofol\")\nget_compound_literature(cid=\"4943\", limit=20)\n```\n\n### 5️⃣ 匯出結果\n\n```python\n# 匯出上次搜尋結果\nprepare_export(pmids=\"last\", format=\"ris\")      # → EndNote/Zotero\nprepare_export(pmids=\"last\", format=\"bibtex\", source=\"local\")  # → LaTeX\nprepare_export(pmids=\"last\", format=\"csl\")      # → official NCBI Citation API 的 CSL JSON\nsave_literature_notes(pmids=\"last\")              # → 本機 wiki note + Foam-compatible wikilinks + CSL JSON\nsave_literature_notes(pmids=\"last\", note_format=\"medpaper\", output_dir=\"./references\")\nsave_literature_notes(pmids=\"last\", template_file=\"./reference-template.md\")\n\n# 對上次搜尋中的指定文章抓全文\nget_fulltext(pmid=\"12345678\", extended_sources=True)\n```\n\n### 6️⃣ 預印本搜尋\n\n```python\n# 同時搜尋同儕審查文獻與預印本\nunified_search(query=\"COVID-19 vaccine efficacy\", options=\"preprints\")\n# → 主聚合結果會包含已標註的 arXiv、medRxiv、bioRxiv 預印本\n\n# 保留主結果中的非同儕審查內容\nunified_search(query=\"CRISPR gene therapy\", options=\"preprints, all_types\")\n# → 預印本伺服器搜尋 + 主結果保留非同儕審查內容\n\n# 僅同儕審查（預設行為）\nunified_search(\"diabetes treatment\")\n# → 自動過濾來自任何來源的預印本\n\n# 同一個搜尋回應附帶研究脈絡圖預覽\nunified_search(\"remimazolam ICU sedation\", options=\"context_graph\")\n```\n\n### 7️⃣ Pipeline（可重複使用的搜尋計畫）\n\n```python\n# 透過主要 façade 保存模板式 pipeline\nmanage_pipeline(\n  action=\"save\",\n    name=\"icu_sedation_weekly\",\n    config=\"template: pico\\nparams:\\n  P: ICU patients\\n  I: remimazolam\\n  C: propofol\\n  O: delirium\",\n    tags=\"anesthesia,sedation\",\n    description=\"每週 ICU 鎮靜藥物監控\"\n)\n\n# 保存自訂 DAG pipeline\nmanage_pipeline(\n  action=\"save\",\n    name=\"brca1_comprehensive\",\n    config=\"\"\"\nsteps:\n  - id: expand\n    action: expand\n    params: { topic: BRCA1 breast cancer }\n  - id: pubmed\n    action: search\n    params: { query: BRCA1, sources: pubmed, limit: 50 }\n  - id: expanded\n    action: search\n    inputs: [expand]\n    params: { strategy: mesh, sources: pubmed,openalex, limit: 50 }\n  - id: merged\n    action: merge\n    inputs: [pubmed, expanded]\n    params: { method: rrf }\n  - id: enriched\n    action: metrics\n    inputs: [merged]\noutput:\n  limit: 30\n  ranking: quality\n\"\"\"\n)\n\n# 執行已保存的 pipeline\nunified_search(pipeline=\"saved:icu_sedation_weekly\")\n\n# 管理\nmanage_pipeline(action=\"list\", tag=\"anesthesia\")\nmanage_pipeline(action=\"load\", source=\"brca1_comprehensive\")  # 檢視 YAML\nmanage_pipeline(action=\"history\", name=\"icu_sedation_weekly\")  # 查看過去執行\n```\n\n---\n\n## 🔍 搜尋模式比較\n\n```text\n┌─────────────────────────────────────────────────────────────────────────┐\n│                        搜尋模式決策樹                                     │\n├─────────────────────────────────────────────────────────────────────────┤\n│                                                                          │\n│   「我需要什麼樣的搜尋？」                                                 │\n│         │                                                                │\n│         ├── 確切知道要搜什麼？                                            │\n│         │   └── unified_search(query=\"主題關鍵字\")                        │\n│         │       → 快速，自動路由到最佳來源                                 │\n│         │                                                                │\n│         ├── 有臨床問題（A vs B）？                                        │\n│         │   └── Agent P/I/C/O → parse_pico() handoff                  │\n│         │       → unified_search(template:pico) 或擴展 Boolean         │\n│         │                                                                │\n│         ├── 需要全面系統性覆蓋？                                          │\n│         │   └── generate_search_queries() → 平行搜尋                     │\n│         │       → MeSH 擴展，多策略，合併                                 │\n│         │                                                                │\n│         └── 從關鍵論文探索？                                              │\n│             └── find_related/citing/references → build_citation_tree     │\n│                 → 引用網絡，研究脈絡                                      │\n│                                                                          │\n└─────────────────────────────────────────────────────────────────────────┘\n```\n\n| 模式 | 入口 | 適用情境 | 自動功能 |\n| ---- | ---- | -------- | -------- |\n| **快速** | `unified_search()` | 快速主題搜尋 | ICD→MeSH, 多源, 去重 |\n| **PICO** | Agent P/I/C/O → `parse_pico()` | 臨床問題 | 驗證 handoff → `template:pico` 後端搜尋 |\n| **系統** | `generate_search_queries()` → `unified_search(options=\"systematic\")` | 可重現的 review seed | MeSH/同義詞 + 有界 bulk/cursor；不代表已窮盡全庫 |\n| **Native semantic** | `unified_search(options=\"native_semantic\")` | title/abstract 概念相似性 | capability 驗證；OpenAlex semantic，最多 50 |\n| **探索** | `find_*_articles()` | 從關鍵論文 | 引用網絡, 相關 |\n\n---\n\n## 🤖 Claude Skills（AI Agent 工作流程）\n\n預建工作流程指南位於 `.claude/skills/`，分為**使用 Skills**（使用 MCP server）和**開發 Skills**（維護專案）：\n\n### 📚 使用 Skills (11) — 給使用此 MCP Server 的 AI Agent\n\n| Skill | 說明 |\n| ----- | ---- |\n| `pubmed-quick-search` | 基本搜尋含篩選 |\n| `pubmed-systematic-search` | MeSH 擴展，全面性 |\n| `pubmed-pico-search` | 臨床問題分解 |\n| `pubmed-paper-exploration` | 引用樹，相關文章 |\n| `pubmed-research-chronicle` | 持久化、可版本比對的研究脈絡 |\n| `pubmed-gene-drug-research` | Gene/PubChem/ClinVar |\n| `pubmed-fulltext-access` | Europe PMC, CORE 全文 |\n| `pubmed-export-citations` | RIS/BibTeX/CSV/CSL 匯出指引 |\n| `pubmed-multi-source-search` | 跨資料庫統一搜尋 |\n| `pubmed-mcp-tools-reference` | 完整工具參考指南 |\n| `pipeline-persistence` | 保存、載入、重複使用搜尋計畫 |\n\n### 🔧 開發 Skills (15) — 給專案貢獻者\n\n| Skill | 說明 |\n| ----- | ---- |\n| `changelog-updater` | 自動更新 CHANGELOG.md |\n| `code-refactor` | DDD 架構重構 |\n| `code-reviewer` | 程式碼品質與安全審查 |\n| `ddd-architect` | 新功能 DDD 腳手架 |\n| `git-doc-updater` | 提交前同步文件 |\n| `git-precommit` | Pre-commit 工作流程編排 |\n| `memory-checkpoint` | 儲存上下文到 Memory Bank |\n| `memory-updater` | 更新 Memory Bank 檔案 |\n| `pdf-asset-extractor` | 擷取並盤點可引用的 PDF assets |\n| `project-init` | 初始化新專案 |\n| `readme-i18n` | 多語言 README 同步 |\n| `readme-updater` | 同步 README 與程式碼變更 |\n| `roadmap-updater` | 更新 ROADMAP.md 狀態 |\n| `test-generator` | 產生測試套件 |\n| `tool-sync` | 同步 MCP registry 與自動產生的工具文件 |\n\n> 📁 **位置**: `.claude/skills/*/SKILL.md`（Claude Code 專屬，也是 repo skills 的唯一來源）\n> 不要再另外鏡像或拆分到 `.github/skills/`。\n> 這些 repo skills 屬於 project-scoped 自訂內容，應納入版本控制。跨專案的個人 skills 則應放在 `~/.copilot/skills/` 或 `~/.claude/skills/` 之類的使用者目錄，不要提交到本 repository。\n\n---\n\n## 🏗️ 架構（DDD）\n\n本專案採用 **Domain-Driven Design (DDD)** 架構，以文獻研究領域知識為核心模型。\n\n```text\nsrc/pubmed_search/\n├── domain/                     # 核心業務邏輯\n│   └── entities/article.py     # UnifiedArticle, Author 等\n├── application/                # 用例\n│   ├── search/                 # QueryAnalyzer, ResultAggregator\n│   ├── export/                 # 引用匯出（RIS, BibTeX...）\n│   └── session/                # SessionManager\n├── infrastructure/             # 外部系統\n│   ├── ncbi/                   # Entrez, iCite, Citation Exporter\n│   ├── sources/                # Europe PMC, CORE, CrossRef...\n│   └── http/                   # HTTP 客戶端\n├── presentation/               # 使用者介面\n│   ├── mcp_server/             # MCP 工具、prompts、resources\n│   │   └── tools/              # discovery, strategy, pico, export...\n│   └── api/                    # Auxiliary HTTP API routes（不是 pubmed_search.api）\n└── shared/                     # 跨切面關注\n    ├── exceptions.py           # 統一錯誤處理\n    └── async_utils.py          # Rate limiter, retry, circuit breaker\n```\n\n### 內部機制（對 Agent 透明）\n\n| 機制 | 說明 |\n| ---- | ---- |\n| **Session** | 自動建立、自動切換 |\n| **Cache** | 搜尋結果自動快取，避免重複 API 呼叫 |\n| **Rate Limit** | 自動遵守 NCBI API 限制 (0.34s/0.1s) |\n| **MeSH Lookup** | `generate_search_queries()` 自動查詢 NCBI MeSH 資料庫 |\n| **ESpell** | 自動拼字校正（`remifentanyl` → `remifentanil`） |\n| **Query Analysis** | 每個建議查詢都顯示 PubMed 實際如何詮釋 |\n\n### 詞彙轉換層（核心功能）\n\n> **核心價值**：我們是 **Agent 與 Search Engine 之間的智慧中介層**，自動處理詞彙標準化，讓 Agent 無需了解各資料庫的術語系統。\n\n不同資料來源使用不同的控制詞彙系統。本伺服器提供自動轉換：\n\n| API / 資料庫 | 詞彙系統 | 自動轉換 |\n| ------------ | -------- | -------- |\n| **PubMed / NCBI** | MeSH (醫學主題詞表) | ✅ 完整支援 `expand_with_mesh()` |\n| **ICD 碼** | ICD-10-CM / ICD-9-CM | ✅ 自動偵測並轉換為 MeSH |\n| **Europe PMC** | 文字探勘實體 (Gene, Disease, Chemical) | ✅ `get_text_mined_terms()` 擷取 |\n| **OpenAlex** | Topics / keywords（模型推論） | ✅ Broker keyword mode；選取時使用 bounded native semantic mode |\n| **Semantic Scholar** | S2 fields / bulk query syntax | ✅ Broker 選 relevance 或 bounded bulk mode，provider annotation 保留 provenance |\n| **CORE** | 無 | ❌ 僅支援自由文字 |\n| **CrossRef** | 無 | ❌ 僅支援自由文字 |\n\n#### 自動 ICD → MeSH 轉換\n\n當搜尋包含 ICD 碼時（例如 `I10` 代表高血壓），`unified_search()` 會自動：\n\n1. 透過 `detect_and_expand_icd_codes()` 偵測 ICD-10/ICD-9 模式\n2. 從內部映射表查詢對應 MeSH 詞彙 (`ICD10_TO_MESH`, `ICD9_TO_MESH`)\n3. 以 MeSH 同義詞擴展查詢，提供更完整的搜尋結果\n\n```python\n# Agent 使用臨床術語呼叫 unified_search\nunified_search(query=\"I10 treatment outcomes\")\n\n# 伺服器自動擴展為 PubMed 相容查詢\n\"(I10 OR Hypertension[MeSH]) treatment outcomes\"\n```\n\n> 📖 **完整架構說明**：[ARCHITECTURE.md](#/architecture)\n\n### MeSH 自動擴展 + 查詢分析\n\n呼叫 `generate_search_queries(\"remimazolam sedation\")` 時，內部會：\n\n1. **ESpell 校正** - 修正拼字錯誤\n2. **MeSH 查詢** - `Entrez.esearch(db=\"mesh\")` 取得標準詞彙\n3. **同義詞擷取** - 從 MeSH Entry Terms 取得同義詞\n4. **查詢分析** - 分析 PubMed 如何詮釋每個查詢\n\n```json\n{\n  \"mesh_terms\": [\n    {\n      \"input\": \"remimazolam\",\n      \"preferred\": \"remimazolam [Supplementary Concept]\",\n      \"synonyms\": [\"CNS 7056\", \"ONO 2745\"]\n    }\n  ],\n  \"all_synonyms\": [\"CNS 7056\", \"ONO 2745\", ...],\n  \"suggested_queries\": [\n    {\n      \"id\": \"q1_title\",\n      \"query\": \"(remimazolam sedation)[Title]\",\n      \"purpose\": \"精確標題匹配 - 最高精確度\",\n      \"estimated_count\": 8,\n      \"pubmed_translation\": \"\\\"remimazolam sedation\\\"[Title]\"\n    },\n    {\n      \"id\": \"q3_and\",\n      \"query\": \"(remimazolam AND sedation)\",\n      \"purpose\": \"所有關鍵字必須出現\",\n      \"estimated_count\": 561,\n      \"pubmed_translation\": \"(\\\"remimazolam\\\"[Supplementary Concept] OR \\\"remimazolam\\\"[All Fields]) AND (\\\"sedate\\\"[All Fields] OR ...)\"\n    }\n  ]\n}\n```\n\n> **查詢分析的價值**：Agent 認為 `remimazolam AND sedation` 只搜尋這兩個詞，但 PubMed 實際上擴展到 Supplementary Concept + 同義詞，結果從 8 篇變成 561 篇。這幫助 Agent 理解**意圖**與**實際搜尋**的差異。\n\n---\n\n## 🔒 本機 HTTPS 示範與 service 部署\n\n內建自簽憑證與 `curl -k` 流程是**本機 TLS 示範**，不是 production security\nprofile。共用 service 應使用已認證的 service Compose 與可信憑證，見\n[DEPLOYMENT.md](#/deployment)。\n\n### 本機 HTTPS smoke test\n\n```bash\n# Step 1: 生成 SSL 憑證\n./scripts/generate-ssl-certs.sh\n\n# Step 2: 啟動 HTTPS 服務（Docker）\n./scripts/start-https-docker.sh up\n\n# 驗證部署\ncurl -k https://localhost/\n```\n\n### HTTPS 端點\n\n| 服務 | URL | 說明 |\n| ---- | --- | ---- |\n| MCP | `https://localhost/mcp` | Streamable HTTP MCP endpoint |\n| Health | `https://localhost/health` | 健康檢查 |\n| Ready | `https://localhost/ready` | Readiness 檢查 |\n| Info | `https://localhost/info` | Runtime transport 與 endpoint metadata |\n| Exports | `https://localhost/exports` | 本機匯出列表；service mode 必須 bearer auth 並依 tenant 分區 |\n\n### 遠端 MCP client 設定\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"url\": \"https://localhost/mcp\"\n    }\n  }\n}\n```\n\n---\n\n## 🏢 Microsoft Copilot Studio 整合\n\n將 PubMed Search MCP 與 **Microsoft 365 Copilot**（Word, Teams, Outlook）整合！\n\n### Copilot Studio 快速開始\n\n```bash\n# 僅供未發布的本機 schema/protocol smoke；禁止把 local mode 接到 tunnel\npubmed-search-mcp-http --mode local --transport streamable-http \\\n  --copilot-compatible --host 127.0.0.1 --port 8765\n\n# 公開 Copilot endpoint：必須使用 authenticated service mode\nexport PUBMED_AUTH_TOKENS=\"copilot:$(openssl rand -hex 32)\"\nexport NGROK_DOMAIN=\"your-assigned-domain.ngrok.dev\"\n./scripts/start-copilot-studio.sh --with-ngrok\n```\n\n### Copilot Studio 設定\n\n| 欄位 | 值 |\n| ---- | -- |\n| **Server name** | `PubMed Search` |\n| **Server URL** | `https://your-server.com/mcp` |\n| **Authentication** | service mode 使用 bearer token；`None` 僅限未對外發布的本機示範 |\n\n> 📖 **完整文件**: [copilot-studio/README.md](https://github.com/u9401066/pubmed-search-mcp/blob/master/copilot-studio/README.md)\n>\n> 若只需要 Copilot 相容 HTTP 行為，用 `pubmed-search-mcp-http --copilot-compatible`；`run_copilot.py` 只供 loopback 的 12-tool primitive-schema smoke，禁止接到公網 tunnel。精簡 surface 仍透過 `unified_search(query, limit, min_year, max_year, sources, options)` 呼叫共用 runner，並提供 primitive-schema `read_session` 以回讀 search run、replay arguments 與 artifacts；它不提供 PubMed-only generic-search alias。Tunnel 腳本要求已指派的 `NGROK_DOMAIN`、拒絕已占用的 backend port，並只會在 `--mode service` 通過 readiness 與匿名拒絕檢查後公開。\n>\n> ⚠️ **注意**: SSE transport 自 2025 年 8 月起棄用。使用 `streamable-http`。\n\n---\n\n> 📖 **更多文件**:\n>\n> - 架構 → [ARCHITECTURE.md](#/architecture)\n> - Pipeline Mode 教學（繁中） → [docs/PIPELINE_MODE_TUTORIAL.md](#/pipeline-tutorial-zh)\n> - Pipeline Mode 教學（English） → [docs/PIPELINE_MODE_TUTORIAL.en.md](#/pipeline-tutorial)\n> - 部署指南 → [DEPLOYMENT.md](#/deployment)\n> - Copilot Studio → [copilot-studio/README.md](https://github.com/u9401066/pubmed-search-mcp/blob/master/copilot-studio/README.md)\n\n---\n\n## 🔐 安全性\n\n### 安全功能\n\n| 層級 | 功能 | 說明 |\n| ---- | ---- | ---- |\n| **HTTPS** | TLS termination | 遠端憑證必須加密；內建自簽組態僅用於本機 |\n| **Bearer 認證** | 穩定 principal | service mode 強制啟用，並作為 tenant 授權邊界 |\n| **Tenant storage** | 檔案系統隔離 | Session、artifact、export、chronicle 與 pipeline 依已認證 principal 分區 |\n| **公平性與 rate policy** | Tenant concurrency + 共用上游預算 | 避免單一呼叫端倍增外部 API 配額 |\n| **Security headers** | Clickjacking/MIME hardening | Reverse-proxy headers 是認證的補強，不是 CSRF 授權 |\n| **Secret handling** | Runtime secret injection | API key 與 bearer token 必須由部署秘密/環境注入，不可 commit 或寫入 log |\n\n詳見 [DEPLOYMENT.md](#/deployment) 完整部署說明。\n\n---\n\n## 📤 匯出格式\n\n![匯出與本機筆記流程](images/export-notes-workflow.svg)\n\n匯出搜尋結果為各大參考文獻管理軟體相容的格式：\n\n| 格式 | 來源 | 相容軟體 | 用途 |\n| ---- | ---- | -------- | ---- |\n| **RIS** | official 或 local | EndNote, Zotero, Mendeley | 通用匯入 |\n| **MEDLINE** | official 或 local | PubMed tools | PubMed 原生格式存檔 |\n| **CSL JSON** | official | Citation processors | 程式化 citation styling |\n| **BibTeX** | local | LaTeX, Overleaf, JabRef | 學術寫作 |\n| **CSV** | local | Excel, Google Sheets | 資料分析 |\n| **JSON** | local | 程式存取 | 自訂處理 |\n\n### 匯出欄位\n\n- **核心**: PMID, 標題, 作者, 期刊, 年份, 卷期頁碼\n- **識別碼**: DOI, PMC ID, ISSN\n- **內容**: 摘要（HTML 標籤已清除）\n- **詮釋資料**: 語言, 文章類型, 關鍵詞\n- **存取**: DOI URL, PMC URL, 全文可用性\n\n### 特殊字元處理\n\n- BibTeX 匯出使用 **pylatexenc** 進行正確的 LaTeX 編碼\n- 北歐字元 (ø, æ, å)、變音符號 (ü, ö, ä) 和重音符號都能正確轉換\n- 範例: `Søren Hansen` → `S{\\o}ren Hansen`\n\n---\n\n## 📚 引用\n\nGitHub 會根據 [CITATION.cff](https://github.com/u9401066/pubmed-search-mcp/blob/master/CITATION.cff) 顯示 **Cite this repository**。若你在論文、methods section、技術報告或內部研究文件中使用 PubMed Search MCP，建議直接使用 GitHub 產生的引用格式，或重用這份 repository citation metadata。\n\n```bibtex\n@software{pubmed_search_mcp,\n  title = {PubMed Search MCP},\n  author = {u9401066},\n  url = {https://github.com/u9401066/pubmed-search-mcp}\n}\n```\n\n---\n\n## 📄 授權\n\nApache License 2.0 - 詳見 [LICENSE](https://github.com/u9401066/pubmed-search-mcp/blob/master/LICENSE)\n\n---\n\n## 🔗 相關連結\n\n- [GitHub Repository](https://github.com/u9401066/pubmed-search-mcp)\n- [PyPI Package](https://pypi.org/project/pubmed-search-mcp/)\n- [NCBI Entrez Programming Utilities](https://www.ncbi.nlm.nih.gov/books/NBK25497/)\n",
+  "overview": "<!-- Generated from README.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP\n\n[![PyPI version](https://badge.fury.io/py/pubmed-search-mcp.svg)](https://badge.fury.io/py/pubmed-search-mcp)\n[![Python 3.10+](https://img.shields.io/badge/python-3.10+-blue.svg)](https://www.python.org/downloads/)\n[![License: Apache 2.0](https://img.shields.io/badge/License-Apache%202.0-blue.svg)](https://opensource.org/licenses/Apache-2.0)\n[![MCP](https://img.shields.io/badge/MCP-Compatible-green.svg)](https://modelcontextprotocol.io/)\n[![CI](https://github.com/u9401066/pubmed-search-mcp/actions/workflows/ci.yml/badge.svg)](https://github.com/u9401066/pubmed-search-mcp/actions/workflows/ci.yml)\n\n> **Professional Literature Research Assistant for AI Agents** - More than just an API wrapper\n\n![PubMed Search MCP research workflow](images/research-workflow.svg)\n\nA Domain-Driven Design (DDD) based MCP server that serves as an intelligent research assistant for AI agents, providing task-oriented literature search and analysis capabilities.\n\n**✨ What's Included:**\n\n- 🔧 **46 MCP Tools** - Streamlined PubMed, Europe PMC, CORE, NCBI database access, and **Research Chronicle / Context Graph**\n- 🛡️ **Multi-Agent Service Mode** - Deploy once and serve many agents: per-tenant sessions, caches, and artifacts, bearer-token auth, and per-tenant fair-share limits. See [DEPLOYMENT.md](#/deployment)\n- 🖼️ **OA Figure Extraction** - Pull figure captions, direct image URLs, and PDF links from PMC Open Access articles\n- 📘 **Docs Site** - Browse the complete language-switchable handbook: user workflows, architecture, 46-tool reference, pipeline tutorials, source/broker contracts, integrations and operations, security, and deployment at [u9401066.github.io/pubmed-search-mcp](https://u9401066.github.io/pubmed-search-mcp/)\n- 📖 **GitHub Wiki** - GitHub-native mirror of the same canonical documentation at [github.com/u9401066/pubmed-search-mcp/wiki](https://github.com/u9401066/pubmed-search-mcp/wiki)\n- 📚 **26 Claude Skills** - Ready-to-use workflow guides for AI agents (Claude Code-specific)\n- 📖 **Copilot Instructions** - VS Code GitHub Copilot integration guide\n\n**🌐 Language**: **English** | [繁體中文](#/overview-zh)\n\n**📘 Documentation Map**: README is the quick project entry point. Use the [Docs Site](https://u9401066.github.io/pubmed-search-mcp/) for the best reading experience, the [GitHub Wiki](https://github.com/u9401066/pubmed-search-mcp/wiki) for GitHub-native navigation, and source docs for edits: [User guide](#/user-guide) | [Advanced workflows](#/advanced-workflows) | [Capability-first guide](#/tools-usage-guide) | [Provider data planes](#/semantic-scholar-api) | [BioMCP architecture analysis](#/biomcp-analysis) | [Developer guide](#/developer-guide) | [Complete index](#/quick-reference)\n\n---\n\n## 🚀 Quick Install\n\n### Prerequisites\n\n- **Python 3.10+** — [Download](https://www.python.org/downloads/)\n- **uv** (recommended) — [Install uv](https://docs.astral.sh/uv/getting-started/installation/)\n\n  ```bash\n  # macOS / Linux\n  curl -LsSf https://astral.sh/uv/install.sh | sh\n  # Windows\n  powershell -ExecutionPolicy ByPass -c \"irm https://astral.sh/uv/install.ps1 | iex\"\n  ```\n\n- **NCBI Email** — Required by [NCBI API policy](https://www.ncbi.nlm.nih.gov/books/NBK25497/#chapter2.Usage_Guidelines_and_Requirements). Any valid email address.\n- **NCBI API Key** *(optional)* — [Get one here](https://www.ncbi.nlm.nih.gov/account/settings/) for higher rate limits (10 req/s vs 3 req/s)\n- **OpenAlex API Key** *(optional)* — set `OPENALEX_API_KEY` to use an authenticated credit allocation; without it, requests use OpenAlex's current anonymous casual-use budget. `mailto` is contact metadata, not authentication. Without source-specific emails, the server reuses the configured runtime contact email for OpenAlex, CrossRef, and Unpaywall.\n\n### Install & Run\n\n```bash\n# Option 1: Zero-install with uvx (recommended for trying out)\nuvx pubmed-search-mcp\n\n# Option 2: Add as project dependency\nuv add pubmed-search-mcp\n\n# Option 3: pip install\npip install pubmed-search-mcp\n```\n\n### Python SDK Facade\n\nFor in-process Python integrations, use the stable SDK facade instead of\nimporting MCP tool modules:\n\n```python\nfrom pubmed_search.api import PubMedSearchClient, PubMedSearchConfig\n\nclient = PubMedSearchClient(PubMedSearchConfig(email=\"your@email.com\"))\nresult = await client.unified_search(\"remimazolam ICU sedation\", limit=20)\n\nprint(result.articles)\nprint(result.source_counts)\nprint(result.artifact)  # artifact locator when persistence is enabled\n```\n\nUse `uvx pubmed-search-mcp` or `/mcp` for agent tool discovery. Use the SDK for\nPython package/notebook calls where a typed object is easier than parsing an MCP\nresponse string.\n\n### Choose a Runtime Contract\n\n| Contract | Command | Network and trust boundary |\n| --- | --- | --- |\n| **Local stdio** | `uvx pubmed-search-mcp` | Recommended for one local AI client; no listening MCP port |\n| **Local loopback HTTP** | `pubmed-search-mcp-http --mode local --host 127.0.0.1` | Trusted single-user integration; MCP requests share the durable `default` tenant, and the port must never be published |\n| **Multi-user service** | `pubmed-search-mcp-http --mode service` | Remote/team use behind HTTPS; bearer auth, allowed hosts/origins, and per-principal storage are mandatory |\n\nLocal and service deployments are intentionally separate contracts. Do not turn\nthe local HTTP command into a public service by changing only its bind address.\nThe explicit local profile retains `pmids=\"last\"`, sessions, cache, and exports\nacross MCP requests and reconnects in its durable `default` tenant; this is safe\nonly inside the enforced loopback/Host/Origin boundary. Service mode never\ninherits that trust: it fails closed without a bearer principal. Use\n[DEPLOYMENT.md](#/deployment) for the service environment and Compose profile.\nThe current service profile supports many authenticated principals in one\nserver process; keep one replica until sessions, locks, artifacts, and\nsubscriptions have shared backends.\n\nThe protocol baseline is MCP SDK v2 (`mcp>=2.0,<3`). Modern 2026-07-28 clients\nsend `tools/list` and `tools/call` directly, without an `initialize` handshake or\n`Mcp-Session-Id`. Local mode retains filesystem features. Authenticated service\ncallers cannot load `file:` pipelines, select note `output_dir`/`template_file`,\nor inherit a process-wide pipeline workspace; the service Compose scheduler is\ndisabled. See the [Integrations & Operations Guide](#/troubleshooting) for the\ncapability matrix.\n\n---\n\n## ⚙️ Configuration\n\nThis MCP server works with **any MCP-compatible AI tool**. Choose your preferred client:\n\n### VS Code / Cursor (`.vscode/mcp.json`)\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\nOptional: enable browser-session PDF fallback once and let tools auto-use it:\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"BROWSER_FETCH_CONFIG\": \"{\\\"enabled\\\":true,\\\"auto_enabled\\\":true,\\\"broker_url\\\":\\\"http://127.0.0.1:8766/fetch\\\",\\\"token\\\":\\\"<random-32-byte-token>\\\",\\\"allowed_hosts\\\":[\\\"jamanetwork.com\\\",\\\"*.jamanetwork.com\\\",\\\"nejm.org\\\",\\\"*.nejm.org\\\"]}\"\n      }\n    }\n  }\n}\n```\n\nWith this setting, get_fulltext will automatically try the local broker for institutional or publisher landing pages. Pass allow_browser_session=false only when you want to suppress it for a specific call.\n\nRun the local broker with download interception:\n\n```bash\nuv sync --extra browser-broker\nuv run playwright install chromium\nuv run python -c \"import secrets; print(secrets.token_urlsafe(32))\"\nuv run pubmed-browser-fetch-broker --token \"<same-random-32-byte-token>\"\n```\n\nCopy the generated value into both commands/configurations; never reuse a\npublished example token. If `--token` is omitted, the broker generates and\nprints a high-entropy runtime token. The broker launches a persistent browser\nprofile with download interception enabled. Log in once inside that\nbroker-controlled browser window, and subsequent PDF downloads will be captured\nautomatically without a native \"Save As\" dialog.\n\n### Claude Desktop (`claude_desktop_config.json`)\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n> **Config file location**:\n>\n> - macOS: `~/Library/Application Support/Claude/claude_desktop_config.json`\n> - Windows: `%APPDATA%\\Claude\\claude_desktop_config.json`\n> - Linux: `~/.config/Claude/claude_desktop_config.json`\n\n### Claude Code\n\n```bash\nclaude mcp add pubmed-search -- uvx pubmed-search-mcp\n```\n\nOr add to `.mcp.json` in your project root:\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n### Zed AI (`settings.json`)\n\nZed editor ([z.ai](https://zed.dev)) supports MCP servers natively. Add to your Zed `settings.json`:\n\n```json\n{\n  \"context_servers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n> **Tip**: Open Command Palette → `zed: open settings` to edit, or go to Agent Panel → Settings → \"Add Custom Server\".\n\n### OpenClaw 🦞 (`~/.openclaw/openclaw.json`)\n\n[OpenClaw](https://docs.openclaw.ai/) uses MCP servers via the [mcp-adapter plugin](https://github.com/androidStern-personal/openclaw-mcp-adapter). Install the adapter first:\n\n```bash\nopenclaw plugins install mcp-adapter\n```\n\nThen add to `~/.openclaw/openclaw.json`:\n\n```json\n{\n  \"plugins\": {\n    \"entries\": {\n      \"mcp-adapter\": {\n        \"enabled\": true,\n        \"config\": {\n          \"servers\": [\n            {\n              \"name\": \"pubmed-search\",\n              \"transport\": \"stdio\",\n              \"command\": \"uvx\",\n              \"args\": [\"pubmed-search-mcp\"],\n              \"env\": {\n                \"NCBI_EMAIL\": \"your@email.com\"\n              }\n            }\n          ]\n        }\n      }\n    }\n  }\n}\n```\n\nRestart the gateway after configuration:\n\n```bash\nopenclaw gateway restart\nopenclaw plugins list  # Should show: mcp-adapter | loaded\n```\n\n### Cline (`cline_mcp_settings.json`)\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"S2_API_KEY\": \"your_semantic_scholar_key\",\n        \"PUBMED_SEARCH_DISABLED_SOURCES\": \"\"\n      },\n      \"alwaysAllow\": [],\n      \"disabled\": false\n    }\n  }\n}\n```\n\n### Other MCP Clients\n\nAny MCP-compatible client can use this server via stdio transport:\n\n```bash\n# Command\nuvx pubmed-search-mcp\n\n# With environment variable\nNCBI_EMAIL=your@email.com uvx pubmed-search-mcp\n```\n\n> **Note**: `NCBI_EMAIL` is required by NCBI API policy. Optionally set `NCBI_API_KEY` for higher rate limits (10 req/s vs 3 req/s).\n> 📖 **Detailed Integration Guides**: See [docs/INTEGRATIONS.md](#/troubleshooting) for all environment variables, Copilot Studio setup, Docker deployment, proxy configuration, and troubleshooting.\n\n---\n\n## 🎯 Design Philosophy\n\n> **Core Positioning**: The **intelligent middleware** between AI Agents and academic search engines.\n\n### Why This Server?\n\nOther tools give you raw API access. We give you **vocabulary translation + intelligent routing + research analysis**:\n\n| Challenge | Our Solution |\n| --------- | ------------ |\n| Agent uses ICD codes, PubMed needs MeSH | ✅ **Auto ICD→MeSH conversion** |\n| Multiple databases, different APIs | ✅ **Unified Search** single entry point |\n| Clinical questions need structured search | ✅ **PICO handoff + pipeline** (`parse_pico` validates agent-provided P/I/C/O and returns a runnable `template: pico` pipeline) |\n| Typos in medical terms | ✅ **ESpell auto-correction** |\n| Too many results from one source | ✅ **Parallel multi-source** with dedup |\n| Need to trace research evolution | ✅ **Research Chronicle & Tree** with landmark detection, diagnostics, sub-topic branching, and versioned revisions |\n| Citation context is unclear | ✅ **Citation Tree** forward/backward/network |\n| Can't access full text | ✅ **Multi-source fulltext** (Europe PMC XML, Unpaywall OA locations, institutional direct/EZproxy, CORE, and downloader fallbacks) |\n| Gene/drug info scattered across DBs | ✅ **NCBI Extended** (Gene, PubChem, ClinVar) |\n| Need cutting-edge preprints | ✅ **Preprint search** (arXiv, medRxiv, bioRxiv) with peer-review filtering |\n| Export to reference managers | ✅ **One-click export** (official RIS/MEDLINE/CSL JSON; local RIS/BibTeX/CSV/MEDLINE/JSON) |\n\n### Key Differentiators\n\n1. **Vocabulary Translation Layer** - Agent speaks naturally, we translate to each database's terminology (MeSH, ICD-10, text-mined entities)\n2. **Unified Search Gateway** - One `unified_search()` call, capability-aware dispatch across PubMed, Europe PMC, CORE, OpenAlex, Semantic Scholar, and enabled preprint/commercial sources\n3. **PICO Handoff + Pipeline** - the Agent extracts P/I/C/O, `parse_pico()` validates that structured handoff, and the backend `template: pico` pipeline executes O-aware precision/recall searches\n4. **Research Chronicle & Lineage Tree** - Detect milestones with policy-driven heuristics, identify landmark papers via multi-signal scoring, surface diagnostics, persist versioned revisions you can diff, and visualize research evolution as branching trees by sub-topic\n5. **Citation Network Analysis** - Build multi-level citation trees to map an entire research landscape from a single paper\n6. **Full Research Lifecycle** - From search → discovery → full text → analysis → export, all in one server\n7. **Agent-First Design** - Output optimized for machine decision-making, not human reading\n\n---\n\n## 📡 External APIs & Data Sources\n\nThis MCP server integrates with multiple academic databases and APIs:\n\n### Core Data Sources\n\n| Source | Coverage | Vocabulary | Auto-Convert | Description |\n| ------ | -------- | ---------- | ------------ | ----------- |\n| **NCBI PubMed** | 36M+ articles | MeSH | ✅ Native | Primary biomedical literature |\n| **NCBI Entrez** | Multi-DB | MeSH | ✅ Native | Gene, PubChem, ClinVar |\n| **Europe PMC** | 33M+ | Text-mined | ✅ Extraction | Full text XML access |\n| **CORE** | 200M+ | None | ➡️ Free-text | Open access aggregator |\n| **Semantic Scholar** | Evolving graph + operator datasets | S2 fields / bulk syntax | ✅ Broker-compiled modes | Relevance, bounded bulk, batch, citation graph, and metadata-only release/diff plane; no partition download |\n| **OpenAlex** | Evolving open research graph | Topics / keywords | ✅ Keyword + bounded native semantic | Cursor, cost provenance, entity graph, and declared operator snapshot path; no local index yet |\n| **NIH iCite** | PubMed | N/A | N/A | Citation metrics (RCR) |\n\n> **🔑 Key**: ✅ = Full vocabulary support | ➡️ = Query pass-through (no controlled vocabulary)\n>\n> **ICD Codes**: Auto-detected and converted to MeSH before PubMed search\n\n### Environment Variables\n\n```bash\n# Required\nNCBI_EMAIL=your@email.com          # Required by NCBI policy\n\n# Optional - For higher rate limits\nNCBI_API_KEY=your_ncbi_api_key     # Get from: https://www.ncbi.nlm.nih.gov/account/settings/\nCORE_API_KEY=your_core_api_key     # Get from: https://core.ac.uk/services/api\nCROSSREF_EMAIL=your@email.com      # Optional override; defaults to server/NCBI email\nUNPAYWALL_EMAIL=your@email.com     # Optional override; defaults to server/NCBI email\nS2_API_KEY=your_s2_api_key         # Alias: SEMANTIC_SCHOLAR_API_KEY\nOPENALEX_API_KEY=your_openalex_key # Raises the OpenAlex credit budget; actual grant is response-driven\nPUBMED_SEARCH_DISABLED_SOURCES=    # Example: semantic_scholar\n\n# Optional - Network settings\nHTTP_PROXY=http://proxy:8080       # HTTP proxy for API requests\nHTTPS_PROXY=https://proxy:8080     # HTTPS proxy for API requests\n\n# Optional - Institutional fulltext access\nINSTITUTIONAL_DIRECT_FETCH=true    # Try DOI publisher pages before CORE fallback\nEZPROXY_ENABLED=false              # Enable only after configuring EZPROXY_HOST + cookie\nEZPROXY_HOST=ezproxy.example.edu\nEZPROXY_COOKIE_FILE=/path/to/cookies.json\n\n# Optional - Local note export\nPUBMED_NOTES_DIR=/path/to/wiki/references  # save_literature_notes target folder\nPUBMED_WORKSPACE_DIR=/path/to/project       # fallback: references/ under this workspace\nPUBMED_DATA_DIR=~/.pubmed-search-mcp        # fallback: references/ under this data dir\n```\n\nCrossRef and Unpaywall reuse the runtime server contact email (`NCBI_EMAIL`,\nCLI `--email`, or detected git email) unless a source-specific email is\nconfigured. OpenAlex accepts casual anonymous use and an optional API key; the\nbroker reads its response credit/rate metadata instead of assuming a permanent\n\"polite pool\" quota.\n\nLocal note export resolves directories in this order: `output_dir` argument, `PUBMED_NOTES_DIR`, `PUBMED_WORKSPACE_DIR/references`, `PUBMED_DATA_DIR/references`, then `~/.pubmed-search-mcp/references`.\nThis path/template selection applies only to trusted local mode. Authenticated\nservice notes always use a built-in format below the current tenant's isolated\n`references/` directory.\nFor LLM wiki compatibility, `wiki` and `foam` exports use stable link targets based on PMID, DOI, PMCID, or fallback identifiers; titles remain aliases/display labels, and the response includes `wiki_validation` for unresolved wikilink checks.\n\n## 🔄 How It Works: The Middleware Architecture\n\n```text\n┌─────────────────────────────────────────────────────────────────────────────┐\n│                              AI AGENT                                        │\n│                                                                              │\n│   \"Find papers about I10 hypertension treatment in diabetic patients\"       │\n│                                                                              │\n└─────────────────────────────────┬───────────────────────────────────────────┘\n                                  │\n                                  ▼\n┌─────────────────────────────────────────────────────────────────────────────┐\n│                     🔄 PUBMED SEARCH MCP (MIDDLEWARE)                        │\n│  ┌─────────────────────────────────────────────────────────────────────────┐│\n│  │  1️⃣ VOCABULARY TRANSLATION                                              ││\n│  │     • ICD-10 \"I10\" → MeSH \"Hypertension\"                                ││\n│  │     • \"diabetic\" → MeSH \"Diabetes Mellitus\"                             ││\n│  │     • ESpell: \"hypertention\" → \"hypertension\"                           ││\n│  └─────────────────────────────────────────────────────────────────────────┘│\n│  ┌─────────────────────────────────────────────────────────────────────────┐│\n│  │  2️⃣ INTELLIGENT ROUTING                                                 ││\n│  │     ┌──────────┐  ┌──────────┐  ┌──────────┐  ┌──────────┐             ││\n│  │     │ PubMed   │  │Europe PMC│  │   CORE   │  │ OpenAlex │             ││\n│  │     │  36M+    │  │   33M+   │  │  200M+   │  │  250M+   │             ││\n│  │     │  (MeSH)  │  │(fulltext)│  │  (OA)    │  │(metadata)│             ││\n│  │     └────┬─────┘  └────┬─────┘  └────┬─────┘  └────┬─────┘             ││\n│  │          └──────────────┴──────────────┴──────────────┘                 ││\n│  │                              ▼                                          ││\n│  │  3️⃣ RESULT AGGREGATION: Dedupe + Rank + Enrich                         ││\n│  └─────────────────────────────────────────────────────────────────────────┘│\n└─────────────────────────────────┬───────────────────────────────────────────┘\n                                  │\n                                  ▼\n┌─────────────────────────────────────────────────────────────────────────────┐\n│                         UNIFIED RESULTS                                      │\n│   • 150 unique papers (deduplicated from 4 sources)                          │\n│   • Ranked by relevance + citation impact (RCR)                              │\n│   • Full text links enriched from Europe PMC                                 │\n└─────────────────────────────────────────────────────────────────────────────┘\n```\n\n---\n\n## 🛠️ MCP Tools Overview\n\nIf you want to understand the tool surface as a usable system, do not start by memorizing 46 tool names.\n\nStart with the [Tools Usage Guide](#/tools-usage-guide): it compresses the current 46 tools into 8 capability families, explains the theoretical lower bound, and gives intent-based routing for both humans and agents.\n\n### 🔍 Search & Query Intelligence\n\n![Search and query intelligence workflow](images/search-query-workflow.svg)\n\n```text\n┌─────────────────────────────────────────────────────────────────┐\n│                      SEARCH ENTRY POINT                          │\n├─────────────────────────────────────────────────────────────────┤\n│                                                                  │\n│   unified_search()          ← 🌟 Single entry for all sources    │\n│        │                                                         │\n│        ├── Quick search     → Direct multi-source query          │\n│        ├── Native semantic → Bounded OpenAlex semantic mode    │\n│        ├── Systematic       → Bounded provider bulk/cursor mode  │\n│        ├── PICO hints       → Detects comparison, shows P/I/C/O  │\n│        └── ICD expansion    → Auto ICD→MeSH conversion           │\n│                                                                  │\n│   Sources: PubMed · Europe PMC · CORE · OpenAlex · S2            │\n│   Auto: Deduplicate → Rank → Enrich full-text links              │\n│                                                                  │\n├─────────────────────────────────────────────────────────────────┤\n│   QUERY INTELLIGENCE                                             │\n│                                                                  │\n│   generate_search_queries() → MeSH expansion + synonym discovery │\n│   parse_pico()              → Agent-provided PICO handoff        │\n│   analyze_search_query()    → Query analysis without execution   │\n│                                                                  │\n└─────────────────────────────────────────────────────────────────┘\n```\n\n#### One search entry, three retrieval policies\n\nGeneric literature discovery is intentionally exposed through exactly one MCP\ntool: `unified_search`. Provider-specific APIs remain internal broker\ncapabilities:\n\n```python\n# Default relevance/keyword routing across enabled sources\nunified_search(query=\"treatment resistance\")\n\n# OpenAlex native semantic search (provider maximum 50 results)\nunified_search(\n    query=\"mechanisms of treatment resistance\",\n    sources=\"openalex\",\n    options=\"native_semantic\",\n)\n\n# Deterministic/bounded retrieval: OpenAlex cursor and S2 bulk where selected\nunified_search(\n    query=\"melanoma AND immunotherapy\",\n    sources=\"pubmed,openalex,semantic_scholar\",\n    options=\"systematic\",\n)\n```\n\n`native_semantic` and `systematic` are mutually exclusive and disable the\nmulti-strategy deep-search expansion. Explicit source selections fail before a\nnetwork call when a requested retrieval mode is unsupported; automatic source\nselection retains only capable providers. `limit` remains at most 100 per\nsource, so `systematic` means deterministic, bounded provider execution—not an\nexhaustive systematic-review guarantee. Structured output and artifacts record\n`retrieval_mode` plus per-source `source_metadata` (requested/provider mode,\ncanonical or compiled query, continuation availability, cost/rate metadata,\nand warnings when available).\n\nThe public request boundary is fail-closed. `limit` must be an integer from 1\nthrough 100; unknown or malformed `filters` / `options`, reversed or out-of-range\nyears, and unsupported ranking or output modes return a validation error before\nprovider I/O. In the default deep-search policy, `limit` is one **total budget\nper source** divided across that source's query strategies—not `limit` results\nfor every strategy. Strategy calls use bounded global/per-source concurrency\nand timeouts, and successful sources remain usable when another source times\nout, is rate-limited, or fails.\n\nEurope PMC, Scopus, and Web of Science remain keyword-only in this release;\nexplicit systematic requests for those sources fail before I/O instead of\nmislabeling a single page as systematic coverage.\n\nSee [Source Contracts](#/source-contracts),\n[Semantic Scholar](#/semantic-scholar-api), and\n[OpenAlex](#/openalex-api) for provider limits and operator data-plane\nboundaries.\n\n### 🔬 Discovery Tools (After Finding Key Papers)\n\n![Article discovery and citation workflow](images/discovery-citation-workflow.svg)\n\n```text\n                        Found important paper (PMID)\n                                   │\n           ┌───────────────────────┼───────────────────────┐\n           │                       │                       │\n           ▼                       ▼                       ▼\n    ┌─────────────┐        ┌─────────────┐        ┌─────────────┐\n    │  BACKWARD   │        │  SIMILAR    │        │  FORWARD    │\n    │  ◀──────    │        │  ≈≈≈≈≈≈     │        │  ──────▶    │\n    │             │        │             │        │             │\n    │ get_article │        │find_related │        │find_citing  │\n    │ _references │        │ _articles   │        │ _articles   │\n    │             │        │             │        │             │\n    │ Foundation  │        │  Similar    │        │ Follow-up   │\n    │  papers     │        │   topic     │        │  research   │\n    └─────────────┘        └─────────────┘        └─────────────┘\n\n    fetch_article_details()   → Detailed article metadata\n    get_citation_metrics()    → iCite RCR, citation percentile\n    build_citation_tree()     → Full network visualization (6 formats)\n\n```\n\n### 📚 Full Text, Figure Extraction & Export\n\n![Full text, figures, and biomedical image workflow](images/visual-evidence-workflow.svg)\n\n| Category | Tools |\n| -------- | ----- |\n| **Full Text** | `get_fulltext` → Europe PMC XML when a PMCID is available; DOI-backed Unpaywall, institutional direct/EZproxy, CORE, and downloader fallbacks when needed |\n| **Figures** | `get_article_figures` → Extract figure labels, captions, image URLs, and PDF links from PMC Open Access articles |\n| **Figure-aware Full Text** | `get_fulltext(include_figures=True)` → Embed figure metadata alongside structured fulltext |\n| **Text Mining** | `get_text_mined_terms` → Extract genes, diseases, chemicals |\n| **Export** | `prepare_export` → official RIS/MEDLINE/CSL JSON or local RIS/BibTeX/CSV/MEDLINE/JSON; `save_literature_notes` → local wiki/Foam-compatible/Markdown/MedPaper-style notes plus collection-level CSL JSON |\n\n### 🖼️ OA Figure-First Exploration\n\nUse the PMC Open Access path when an agent needs evidence figures, not just article text:\n\n- `get_article_figures(identifier=\"PMC12086443\")` → Figure labels, captions, image URLs, and PDF/article links\n- `get_fulltext(pmcid=\"PMC7096777\", include_figures=True)` → Structured fulltext with figures inline\n- Figure output preserves article context, so agents can connect each figure back to the sections where it is mentioned\n\n### 🧬 NCBI Extended Databases\n\n![NCBI extended biomedical data workflow](images/ncbi-extended-workflow.svg)\n\n| Tool | Description |\n| ---- | ----------- |\n| `search_gene` | Search NCBI Gene database |\n| `get_gene_details` | Gene details by NCBI Gene ID |\n| `get_gene_literature` | PubMed articles linked to a gene |\n| `search_compound` | Search PubChem compounds |\n| `get_compound_details` | Compound details by PubChem CID |\n| `get_compound_literature` | PubMed articles linked to a compound |\n| `search_clinvar` | Search ClinVar clinical variants |\n\n### 🕰️ Research Chronicle & Lineage Tree\n\n![Research Chronicle Architecture and Lineage Flow](images/research-chronicle-lineage-flow.svg)\n![Evaluation and timeline workflow](images/timeline-evaluation-workflow.svg)\n\n| Tool | Description |\n| ---- | ----------- |\n| `build_research_chronicle` | Build a persisted, versioned chronicle with landmark detection. Output: summary, chronicle_map, timeline, tree, graph, evidence, milestones, mermaid, timeline_mermaid, mindmap, narrative, json |\n| `read_research_chronicle` | Load, list, diff revisions, narrate with citations, analyze milestone distribution, or compare up to five topics |\n\n```python\n# 1. Build from topic (retrieves PubMed, scores landmarks, clusters lineages)\nbuild_research_chronicle(topic=\"remimazolam intraoperative\", output=\"mermaid\", max_events=30)\n\n# 2. Continue an existing chronicle (inherits stored topic and filters to produce Revision N+1)\nbuild_research_chronicle(chronicle_id=\"remimazolam-intraoperative-08c229f3\")\n\n# 3. Read revision diff, milestone analytics, or cross-topic comparison\nread_research_chronicle(action=\"diff\", chronicle_id=\"remimazolam-intraoperative-08c229f3\", from_revision=1)\nread_research_chronicle(action=\"milestones\", chronicle_id=\"remimazolam-intraoperative-08c229f3\")\nread_research_chronicle(action=\"compare\", topics=\"remimazolam intraoperative,propofol intraoperative\")\n```\n\n`mermaid` is the canonical combined view: a horizontal year spine (X-axis) with each\nobserved research line (Y-axis) branching at its earliest dated paper **within the\nretrieved scope**. This is an explainable grouping, not a causal genealogy or a\nclaim about the field's true first paper. Lineages prefer MeSH descriptors and\nauthor keywords shared by multiple papers; singleton-only or insufficient\nsignals trigger a warned research-stage fallback. Same-year display order is\nstable, but does not assert precedence when publication precision cannot prove\nit. `timeline_mermaid` preserves the older flat timeline view. See\n[Advanced Research Workflows (docs/ADVANCED_RESEARCH_WORKFLOWS.md)](#/advanced-workflows) and\n[docs/RESEARCH_CHRONICLE_REFACTOR_SPEC.md](#/research-chronicle-rebuild-spec).\n\nChronicle Mermaid output is built from structured nodes and edges, with safe\nlabel escaping, cycle/orphan repair, collision-resistant IDs, and bounded graph\nsize. It falls back from rich to safe to minimal syntax instead of failing the\nwhole chronicle. `mermaid_validation.json` records every correction, fallback,\nand omitted visual item; `chronicle.mmd` remains pure Mermaid source.\n\nChronicle revisions are immutable and appended atomically. When session\nartifact persistence is enabled, artifact failure is surfaced explicitly while\nthe saved Chronicle revision remains available.\n\nTopic builds send year limits to PubMed before bounded retrieval, then preserve\nthe first and last observed papers while filling the cap with landmarks and\ntemporal spread. The audit records PubMed `returned` / `available` counts and\nwarns when availability is unknown or any retrieval/selection cap makes the\nview non-exhaustive. PubMed errors or a scope with no article evidence do not\npublish an empty revision.\n\nExplicit PMID input is strict (`12345678` or `PMID:12345678`, positive ASCII\ndigits, at most 20 digits); DOI or mixed text is rejected instead of being\ncoerced. Records without a reliable publication date appear as `Undated` after\ndated entries and are excluded from the displayed year span. Entry IDs follow PMID/DOI evidence\nidentity across date or classifier corrections, and topic continuity uses one\nUnicode/case/whitespace canonical key. Multi-signal papers keep one primary\nbranch plus explicit cross-links; overlap of 20% or more is audited as a\nwarning. In revision diffs, absence means `not_observed_in_revision` /\n`removed_from_view`, never conclusive retirement.\n\n### 🏥 Institutional Access & ICD Conversion\n\n![Institutional access workflow](images/institutional-access-workflow.svg)\n\n| Tool | Description |\n| ---- | ----------- |\n| `configure_institutional_access` | Configure institution's link resolver |\n| `get_institutional_link` | Generate OpenURL access link |\n| `list_resolver_presets` | List resolver presets |\n| `test_institutional_access` | Test resolver configuration |\n| `diagnose_institutional_access` | Diagnose direct DOI, EZproxy, and OpenURL handoff paths |\n| `convert_icd_mesh` | Convert between ICD codes and MeSH terms (bidirectional) |\n| `unified_search` | Auto-detect ICD codes in queries and expand them to MeSH |\n\n### 💾 Session Management\n\n![Session and pipeline workflow](images/session-pipeline-workflow.svg)\n\n| Tool | Description |\n| ---- | ----------- |\n| `get_session_pmids` | Retrieve cached PMID lists |\n| `get_cached_article` | Get article from session cache (no API cost) |\n| `get_session_summary` | Session status overview |\n| `read_session` | Facade for PMIDs, cached articles, durable search runs, replay arguments, history, and persistent artifacts |\n\nDynamic MCP resources are also available for agents that can read resources directly:\n\n- `session://context` — active session status\n- `session://last-search` — latest search metadata\n- `session://last-search/pmids` — latest PMID list + CSV form\n- `session://last-search/results` — cached article payloads for the latest search\n\n### Persistent Artifacts\n\nPersistent MCP output artifacts are saved for reusable `unified_search` and\n`get_fulltext` responses when session persistence is configured. Tool responses\nact like index cards: they include enough counts, source warnings, and artifact\nhints for an agent to answer immediately, while the full evidence payload stays\nin files that can be read repeatedly. The compact `artifact` locator includes\n`artifact_id`, `artifact_uri`, `primary_file`, `summary`, file inventory,\n`read_order`, audit status, and exact `read_session(...)` retrieval hints. Set\n`PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true` only when a local MCP client should\nalso receive `local_path` and `manifest_path` directly.\n\nRemote clients that cannot read the server filesystem can retrieve the same\ncontent through the session facade:\n\n```text\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"audit.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"query_strategy.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"results.json\", offset=0, max_chars=200000)\nread_session(action=\"list_artifacts\", include_local_paths=true)\n```\n\n### Recoverable search runs\n\nWhen session management is active, every `unified_search` invocation receives a\nstable run ID. This includes normal searches, validation/planning failures, and\ninline, `saved:<name>`, or `dry_run=true` pipeline execution. Structured results\nand errors attach the `search_run` handoff; Markdown returns the same run ID as\na compact recovery note. Normal literature-result envelopes expose two separate\nmachine contracts:\n\n- `search_status` describes the bounded retrieval outcome: `state`\n  (`completed`, `empty`, `partial`, or `failed`), `bounded=true`,\n  `exhaustive=false`, returned count, attempted/successful/failed/retryable\n  sources, and continuation/unknown-completeness source lists.\n- `search_run` is the recovery handoff: stable `run_id`, journal status,\n  `recoverable`, exact `read_session` inspect/replay arguments, and the artifact\n  URI when one was committed.\n\nThe tenant-scoped `search-run/v1` journal is published before provider I/O or a\nterminal validation response and records the sanitized request, plan,\nphysical per-source or per-pipeline-step attempts, counts, safe failures,\nresult references, and artifact locator when applicable. It reaches a terminal\n`completed`, `partial`, `failed`, or `cancelled` state; a valid zero-result\nsearch is a `completed` run whose `search_status.state` is `empty`. On restart,\nan unfinished `started` / `planned` / `running` entry is recovered once as\n`interrupted` instead of disappearing. A non-dry-run saved pipeline additionally\nkeeps its PipelineStore report/run history; that is complementary to the\ninvocation-level search journal, not a replacement for it.\n\nPipeline replay preserves the original inline or `saved:<name>` argument plus\n`dry_run` / `stop_at`. Pipeline text containing keys, tokens, cookies, passwords,\nor other credential material is rejected and recorded as a failed run; provider\ncredentials belong in server environment/configuration, never pipeline YAML or\nJSON.\n\n```text\nread_session(action=\"search_runs\")\nread_session(action=\"search_runs\", run_status=\"partial\")\nread_session(action=\"search_run\", run_id=\"...\")\nread_session(action=\"replay_search\", run_id=\"...\")\n```\n\n`replay_search` only returns the original credential-free `unified_search`\nkwargs. It never executes a network call automatically; the agent or user must\nreview and explicitly submit them. Provider cursor/token values are retained\nas opaque provenance in `source_metadata` and `query_strategy.json`, but there\nis no public cursor-resume parameter yet, so replay starts a new bounded search.\n\nIf the terminal journal write cannot be recovered, the response reports\n`search_run.status=\"history_unavailable\"`, `history_available=false`, the\nintended terminal status, and a warning. It deliberately omits inspect/replay\nactions because durable recovery is not guaranteed; the search result itself\nmay still be usable.\n\n`unified_search` artifacts use a research envelope. Start with `audit.json` for\nsource-count and completeness warnings, then `query_strategy.json` for the exact\nexecuted plan, and finally `results.json` / `results.toon` for the complete\narticle list. This keeps MCP response tokens small without losing academic\ntraceability.\n\nArtifacts are generated from the already-computed result object, so reading an\nartifact does not rerun searches or fulltext retrieval.\nIf a crash occurs after an artifact directory is atomically published but\nbefore the session index is updated, session reload discovers only complete,\nchecksum-indexed manifests and relinks the orphaned artifact to its search run\nby `search_run_id` (with a conservative query match for older artifacts).\n`read_session` redacts local filesystem paths by default; `local_path` and\n`manifest_path` are server-local paths, not portable client paths. Artifacts\nfrom `get_fulltext` may contain article body text, including subscription or\ninstitutionally accessed content. Store and share them according to publisher,\nlicense, and institutional access terms.\nLarge `get_fulltext` responses are returned inline as a preview when an artifact\nis available; use the artifact locator to retrieve the saved full content.\n\nWhen one source fails but the overall search can continue, JSON responses may\ninclude `source_errors`; markdown responses show a `Source warnings` line. For\nSemantic Scholar HTTP 429s, set `S2_API_KEY` / `SEMANTIC_SCHOLAR_API_KEY`, retry\nlater, or temporarily exclude it with `sources=\"auto,-semantic_scholar\"` or\n`PUBMED_SEARCH_DISABLED_SOURCES=semantic_scholar`.\n\n### Pipeline Management\n\n![Session and pipeline workflow](images/session-pipeline-workflow.svg)\n\n`manage_pipeline` is the primary facade for pipeline CRUD, history, and scheduling. The more specific pipeline tools remain available as compatibility wrappers.\n\n| Tool | Description |\n| ---- | ----------- |\n| `manage_pipeline` | Primary facade for save, list, load, delete, history, and schedule actions |\n| `save_pipeline` | Save a pipeline config for later reuse (YAML/JSON, auto-validated) |\n| `list_pipelines` | List saved pipelines (filter by tag/scope) |\n| `load_pipeline` | Load by saved name; trusted local callers may also load a file |\n| `delete_pipeline` | Delete pipeline and its execution history |\n| `get_pipeline_history` | View execution history with article diff analysis |\n| `schedule_pipeline` | Create, update, or remove recurring pipeline schedules |\n\nAuthenticated service callers use named pipelines in their tenant-derived\nstore; `workspace` and `file:` access are local-only. The service Compose\nprofile does not execute schedules without a separately designed single leader.\n\nStep-by-step tutorials:\n\n- English: [docs/PIPELINE_MODE_TUTORIAL.en.md](#/pipeline-tutorial)\n- 繁體中文: [docs/PIPELINE_MODE_TUTORIAL.md](#/pipeline-tutorial-zh)\n\n### 👁️ Vision & Image Search\n\n![Full text, figures, and biomedical image workflow](images/visual-evidence-workflow.svg)\n\n| Tool | Description |\n| ---- | ----------- |\n| `analyze_figure_for_search` | Handoff an uploaded image, image URL, or data URI to agent vision for search-term extraction |\n| `search_biomedical_images` | Search biomedical images across Open-i (X-ray, microscopy, photos, diagrams) |\n\nUse `analyze_figure_for_search` when the user supplies an image and the agent\nmust interpret its meaning first. The tool returns MCP `ImageContent` plus\ninstructions for the LLM agent to extract English biomedical terms, then\ncontinue with `search_biomedical_images` for similar Open-i images or\n`unified_search` for related papers.\n\n### 📄 Preprint Search\n\nSearch **arXiv**, **medRxiv**, and **bioRxiv** preprint servers via `unified_search` `options` flags:\n\n- `preprints`: Search preprint servers and merge preprints into the main aggregated result set with `article_type=PREPRINT`.\n- `all_types`: Keep non-peer-reviewed content already returned by selected scholarly sources even without a preprint-server crawl.\n\n**Recommended combinations:**\n\n- Empty `options`: Peer-reviewed results only; preprint-like records are filtered.\n- `options=\"preprints\"`: Searches arXiv, medRxiv, and bioRxiv, then ranks/dedupes those preprints with the main results.\n- `options=\"preprints, all_types\"`: Same preprint-server crawl, plus other non-peer-reviewed records from selected sources are retained.\n- `options=\"all_types\"`: No preprint-server crawl, but non-peer-reviewed items from searched sources are retained.\n\n**Preprint detection** — articles are identified as preprints by:\n\n- Article type from source API (OpenAlex, CrossRef, Semantic Scholar)\n- arXiv ID present without PubMed ID\n- Known preprint server source or journal name\n- DOI prefix matching preprint servers (e.g., `10.1101/` → bioRxiv/medRxiv, `10.48550/` → arXiv)\n\n### 🌳 Research Context Graph\n\n`unified_search` can append a lightweight research lineage view built from PMID-backed ranked results:\n\n| Option Flag | Description |\n| ----------- | ----------- |\n| `context_graph` | Append a lightweight Research Context Graph preview from the current PMID-backed ranked set to Markdown output and include `research_context` in JSON output |\n\nThis is useful when an agent needs quick thematic branching without making a second `build_research_chronicle` call.\n\n### 🧪 Clinical-Trial Registry Adjunct\n\nClinicalTrials.gov is never queried implicitly. Add `options=\"trials\"` to a\nMarkdown search when a bounded registry adjunct is useful. It remains separate\nfrom the literature-source plan and source counts; the durable artifact records\nits truncated physical query and outcome under `adjunct_queries`. Structured\nJSON/TOON searches do not run this display-only adjunct.\n\n```python\nunified_search(query=\"remimazolam ICU sedation\", options=\"trials\")\n```\n\n### 📊 Count-First Orientation\n\n`unified_search` can also front-load the existing source coverage and decision hints for agents that want routing help before reading the ranked list:\n\n| Option Flag | Description |\n| ----------- | ----------- |\n| `counts_first` | Add a source-count table, coverage summary, and next-tool recommendations to the response |\n\nExample:\n\n```python\nunified_search(query=\"remimazolam ICU sedation\", options=\"counts_first\")\n```\n\nThis mode is useful when the agent should decide whether to expand a source, inspect the lead PMID, fetch fulltext, extract figures, or pivot into timeline exploration.\n\n### ⏱️ MCP Progress Reporting\n\nWhen the MCP client provides a progress token, `unified_search`, `build_research_chronicle`, `get_fulltext`, and `get_text_mined_terms` emit progress updates for their major phases.\nThis reduces the \"black box\" wait time for agents during longer searches.\nProgress callbacks are best-effort and are not cancelled by the server while a\ntool call is active, which avoids host-side `Canceled: Canceled` messages caused\nby progress-notification backpressure.\n\n---\n\n## 📋 Agent Usage Examples\n\n### 1️⃣ Quick Search (Simplest)\n\n```python\n# Agent just asks naturally - middleware handles everything\nunified_search(query=\"remimazolam ICU sedation\", limit=20)\n\n# Or with clinical codes - auto-converted to MeSH\nunified_search(query=\"I10 treatment in E11.9 patients\")\n#                     ↑ ICD-10           ↑ ICD-10\n#                     Hypertension       Type 2 Diabetes\n```\n\n### 2️⃣ PICO Clinical Question\n\n![PICO clinical search workflow](images/pico-clinical-workflow.svg)\n\n**Simple path** — `unified_search` can search directly (no PICO decomposition):\n\n```python\n# unified_search searches as-is; detects \"A vs B\" pattern and shows PICO hints in metadata\nunified_search(query=\"Is remimazolam better than propofol for ICU sedation?\")\n# → Multi-source keyword search + PICO hint metadata in output\n# ⚠️ This does NOT auto-decompose PICO or expand MeSH!\n# For structured PICO search, use the Agent workflow below\n```\n\n**Agent workflow** — agent-provided PICO + backend pipeline search (recommended for clinical questions):\n\n```text\n┌─────────────────────────────────────────────────────────────────────────┐\n│  \"Is remimazolam better than propofol for ICU sedation?\"                │\n└─────────────────────────────────┬───────────────────────────────────────┘\n                                  │\n                                  ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│                         parse_pico()                                     │\n│  ┌─────────┐  ┌─────────┐  ┌─────────┐  ┌─────────┐                     │\n│  │    P    │  │    I    │  │    C    │  │    O    │                     │\n│  │  ICU    │  │remimaz- │  │propofol │  │sedation │                     │\n│  │patients │  │  olam   │  │         │  │outcomes │                     │\n│  └────┬────┘  └────┬────┘  └────┬────┘  └────┬────┘                     │\n└───────┼────────────┼────────────┼────────────┼──────────────────────────┘\n        │            │            │            │\n        ▼            ▼            ▼            ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│              generate_search_queries() × 4 (parallel)                    │\n│                                                                          │\n│  P → \"Intensive Care Units\"[MeSH]                                        │\n│  I → \"remimazolam\" [Supplementary Concept], \"CNS 7056\"                   │\n│  C → \"Propofol\"[MeSH], \"Diprivan\"                                        │\n│  O → \"Conscious Sedation\"[MeSH], \"Deep Sedation\"[MeSH]                   │\n└─────────────────────────────────┬───────────────────────────────────────┘\n                                  │\n                                  ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│              Agent combines with Boolean logic                           │\n│                                                                          │\n│  (P) AND (I) AND (C) AND (O)  ← High precision                           │\n│  (P) AND (I OR C) AND (O)     ← High recall                              │\n└─────────────────────────────────┬───────────────────────────────────────┘\n                                  │\n                                  ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│              unified_search() (auto multi-source + dedup)                │\n│                                                                          │\n│  PubMed + Europe PMC + CORE + OpenAlex → Auto deduplicate & rank         │\n└─────────────────────────────────────────────────────────────────────────┘\n```\n\n```python\n# Step 1: Agent extracts P/I/C/O, then validates the structured handoff\npico = parse_pico(\n    description=\"Is remimazolam better than propofol for ICU sedation?\",\n    p=\"ICU patients requiring sedation\",\n    i=\"remimazolam\",\n    c=\"propofol\",\n    o=\"sedation efficacy, delirium, hypotension\"\n)\n# Returns validation plus a ready-to-run `template: pico` pipeline.\n\n# Step 2: Get MeSH for each element (parallel!)\ngenerate_search_queries(topic=\"ICU patients\")   # P\ngenerate_search_queries(topic=\"remimazolam\")    # I\ngenerate_search_queries(topic=\"propofol\")       # C\ngenerate_search_queries(topic=\"sedation\")       # O\n\n# Step 3: Either pass expanded fragments back as p_query/i_query/c_query/o_query\n# or let the backend pipeline use the structured P/I/C/O labels.\n\n# Step 4: Search (backend runs O-aware precision/recall searches, dedup, rank)\nunified_search(\n    query=\"Is remimazolam better than propofol for ICU sedation?\",\n    pipeline=pico[\"pipeline\"]\n)\n```\n\n### 3️⃣ Explore from Key Paper\n\n```python\n# Found landmark paper PMID: 33475315\nfind_related_articles(pmid=\"33475315\")   # Similar methodology\nfind_citing_articles(pmid=\"33475315\")    # Who built on this?\nget_article_references(pmid=\"33475315\")  # What's the foundation?\n\n# Build complete research map\nbuild_citation_tree(pmid=\"33475315\", depth=2, output_format=\"mermaid\")\n```\n\n### 4️⃣ Gene/Drug Research\n\n```python\n# Research a gene\nsearch_gene(query=\"BRCA1\", organism=\"human\")\nget_gene_literature(gene_id=\"672\", limit=20)\n\n# Research a drug compound\nsearch_compound(query=\"propofol\")\nget_compound_literature(cid=\"4943\", limit=20)\n```\n\n### 5️⃣ Export Results\n\n```python\n# Export last search results\nprepare_export(pmids=\"last\", format=\"ris\")      # → EndNote/Zotero\nprepare_export(pmids=\"last\", format=\"bibtex\", source=\"local\")  # → LaTeX\nprepare_export(pmids=\"last\", format=\"csl\")      # → CSL JSON from the official NCBI Citation API\nsave_literature_notes(pmids=\"last\")              # → local wiki note + Foam-compatible wikilinks + CSL JSON\nsave_literature_notes(pmids=\"last\", note_format=\"medpaper\", output_dir=\"./references\")\nsave_literature_notes(pmids=\"last\", template_file=\"./reference-template.md\")\n\n# Retrieve full text for a selected paper from the last search\nget_fulltext(pmid=\"12345678\", extended_sources=True)\n```\n\n### 6️⃣ Preprint Search\n\n```python\n# Include preprints alongside peer-reviewed results\nunified_search(query=\"COVID-19 vaccine efficacy\", options=\"preprints\")\n# → Main aggregated results include labelled arXiv, medRxiv, and bioRxiv preprints\n\n# Include preprints and retain non-peer-reviewed items in main results\nunified_search(query=\"CRISPR gene therapy\", options=\"preprints, all_types\")\n# → Preprint-server crawl + non-peer-reviewed items retained in main results\n\n# Only peer-reviewed (default behavior)\nunified_search(\"diabetes treatment\")\n# → Preprints from any source automatically filtered out\n\n# Add a research context graph preview to the same search response\nunified_search(\"remimazolam ICU sedation\", options=\"context_graph\")\n```\n\n### 7️⃣ Pipeline (Reusable Search Plans)\n\n```python\n# Save a template-based pipeline through the primary facade\nmanage_pipeline(\n  action=\"save\",\n    name=\"icu_sedation_weekly\",\n    config=\"template: pico\\nparams:\\n  P: ICU patients\\n  I: remimazolam\\n  C: propofol\\n  O: delirium\",\n    tags=\"anesthesia,sedation\",\n    description=\"Weekly ICU sedation monitoring\"\n)\n\n# Save a custom DAG pipeline\nmanage_pipeline(\n  action=\"save\",\n    name=\"brca1_comprehensive\",\n    config=\"\"\"\nsteps:\n  - id: expand\n    action: expand\n    params: { topic: BRCA1 breast cancer }\n  - id: pubmed\n    action: search\n    params: { query: BRCA1, sources: pubmed, limit: 50 }\n  - id: expanded\n    action: search\n    inputs: [expand]\n    params: { strategy: mesh, sources: pubmed,openalex, limit: 50 }\n  - id: merged\n    action: merge\n    inputs: [pubmed, expanded]\n    params: { method: rrf }\n  - id: enriched\n    action: metrics\n    inputs: [merged]\noutput:\n  limit: 30\n  ranking: quality\n\"\"\"\n)\n\n# Execute a saved pipeline\nunified_search(pipeline=\"saved:icu_sedation_weekly\")\n\n# List & manage\nmanage_pipeline(action=\"list\", tag=\"anesthesia\")\nmanage_pipeline(action=\"load\", source=\"brca1_comprehensive\")  # Review YAML\nmanage_pipeline(action=\"history\", name=\"icu_sedation_weekly\")  # View past runs\n```\n\n---\n\n## 🔍 Search Mode Comparison\n\n```text\n┌─────────────────────────────────────────────────────────────────────────┐\n│                        SEARCH MODE DECISION TREE                         │\n├─────────────────────────────────────────────────────────────────────────┤\n│                                                                          │\n│   \"What kind of search do I need?\"                                       │\n│         │                                                                │\n│         ├── Know exactly what to search?                                 │\n│         │   └── unified_search(query=\"topic keywords\")                   │\n│         │       → Quick, auto-routing to best sources                    │\n│         │                                                                │\n│         ├── Have a clinical question (A vs B)?                           │\n│         │   └── Agent P/I/C/O → parse_pico() handoff                  │\n│         │       → unified_search(template:pico) or expanded Boolean    │\n│         │                                                                │\n│         ├── Need comprehensive systematic coverage?                      │\n│         │   └── generate_search_queries() → parallel search              │\n│         │       → MeSH expansion, multiple strategies, merge             │\n│         │                                                                │\n│         └── Exploring from a key paper?                                  │\n│             └── find_related/citing/references → build_citation_tree     │\n│                 → Citation network, research context                     │\n│                                                                          │\n└─────────────────────────────────────────────────────────────────────────┘\n```\n\n| Mode | Entry Point | Best For | Auto-Features |\n| ---- | ----------- | -------- | ------------- |\n| **Quick** | `unified_search()` | Fast topic search | ICD→MeSH, multi-source, dedup |\n| **PICO** | Agent P/I/C/O -> `parse_pico()` | Clinical questions | Validate handoff -> `template:pico` backend search |\n| **Systematic** | `generate_search_queries()` → `unified_search(options=\"systematic\")` | Reproducible review seed | MeSH/synonyms plus bounded bulk/cursor execution; not an exhaustiveness claim |\n| **Native semantic** | `unified_search(options=\"native_semantic\")` | Conceptual similarity in title/abstract space | Capability validation; OpenAlex semantic mode, max 50 |\n| **Exploration** | `find_*_articles()` | From key paper | Citation network, related |\n\n---\n\n## 🤖 Claude Skills (AI Agent Workflows)\n\nPre-built workflow guides in `.claude/skills/`, divided into **Usage Skills** (for using the MCP server) and **Development Skills** (for maintaining the project):\n\n### 📚 Usage Skills (11) — For AI Agents Using This MCP Server\n\n| Skill | Description |\n| ----- | ----------- |\n| `pubmed-quick-search` | Basic search with filters |\n| `pubmed-systematic-search` | MeSH expansion, comprehensive |\n| `pubmed-pico-search` | Clinical question decomposition |\n| `pubmed-paper-exploration` | Citation tree, related articles |\n| `pubmed-research-chronicle` | Persistent, versioned research evolution |\n| `pubmed-gene-drug-research` | Gene/PubChem/ClinVar |\n| `pubmed-fulltext-access` | Europe PMC, CORE full text |\n| `pubmed-export-citations` | RIS/BibTeX/CSV/CSL export guidance |\n| `pubmed-multi-source-search` | Cross-database unified search |\n| `pubmed-mcp-tools-reference` | Complete tool reference guide |\n| `pipeline-persistence` | Save, load, reuse search plans |\n\n### 🔧 Development Skills (15) — For Project Contributors\n\n| Skill | Description |\n| ----- | ----------- |\n| `changelog-updater` | Auto-update CHANGELOG.md |\n| `code-refactor` | DDD architecture refactoring |\n| `code-reviewer` | Code quality & security review |\n| `ddd-architect` | DDD scaffold for new features |\n| `git-doc-updater` | Sync docs before commits |\n| `git-precommit` | Pre-commit workflow orchestration |\n| `memory-checkpoint` | Save context to Memory Bank |\n| `memory-updater` | Update Memory Bank files |\n| `pdf-asset-extractor` | Extract and inventory citation-ready PDF assets |\n| `project-init` | Initialize new projects |\n| `readme-i18n` | Multilingual README sync |\n| `readme-updater` | Sync README with code changes |\n| `roadmap-updater` | Update ROADMAP.md status |\n| `test-generator` | Generate test suites |\n| `tool-sync` | Keep the MCP registry and generated tool documentation aligned |\n\n> 📁 **Location**: `.claude/skills/*/SKILL.md` (Claude Code-specific, and the single source of truth for repo skills)\n> Do not mirror or split repo skills into `.github/skills/`.\n> These repo skills are project-scoped and should remain version-controlled. Personal cross-project skills belong in a user directory such as `~/.copilot/skills/` or `~/.claude/skills/`, not in this repository.\n\n---\n\n## 🏗️ Architecture (DDD)\n\nThis project uses **Domain-Driven Design (DDD)** architecture, with literature research domain knowledge as the core model.\n\n```text\nsrc/pubmed_search/\n├── domain/                     # Core business logic\n│   └── entities/article.py     # UnifiedArticle, Author, etc.\n├── application/                # Use cases\n│   ├── search/                 # QueryAnalyzer, ResultAggregator\n│   ├── export/                 # Citation export (RIS, BibTeX...)\n│   └── session/                # SessionManager\n├── infrastructure/             # External systems\n│   ├── ncbi/                   # Entrez, iCite, Citation Exporter\n│   ├── sources/                # Europe PMC, CORE, CrossRef...\n│   └── http/                   # HTTP clients\n├── presentation/               # User interfaces\n│   ├── mcp_server/             # MCP tools, prompts, resources\n│   │   └── tools/              # discovery, strategy, pico, export...\n│   └── api/                    # Auxiliary HTTP API routes (not pubmed_search.api)\n└── shared/                     # Cross-cutting concerns\n    ├── exceptions.py           # Unified error handling\n    └── async_utils.py          # Rate limiter, retry, circuit breaker\n```\n\n### Internal Mechanisms (Transparent to Agent)\n\n| Mechanism | Description |\n| --------- | ----------- |\n| **Session** | Auto-create, auto-switch |\n| **Cache** | Auto-cache search results, avoid duplicate API calls |\n| **Rate Limit** | Auto-comply with NCBI API limits (0.34s/0.1s) |\n| **MeSH Lookup** | `generate_search_queries()` auto-queries NCBI MeSH database |\n| **ESpell** | Auto spelling correction (`remifentanyl` → `remifentanil`) |\n| **Query Analysis** | Each suggested query shows how PubMed actually interprets it |\n\n### Vocabulary Translation Layer (Key Feature)\n\n> **Our Core Value**: We are the **intelligent middleware** between Agent and Search Engines, automatically handling vocabulary standardization so Agent doesn't need to know each database's terminology.\n\nDifferent data sources use different controlled vocabulary systems. This server provides automatic conversion:\n\n| API / Database | Vocabulary System | Auto-Conversion |\n| -------------- | ----------------- | --------------- |\n| **PubMed / NCBI** | MeSH (Medical Subject Headings) | ✅ Full support via `expand_with_mesh()` |\n| **ICD Codes** | ICD-10-CM / ICD-9-CM | ✅ Auto-detect & convert to MeSH |\n| **Europe PMC** | Text-mined entities (Gene, Disease, Chemical) | ✅ `get_text_mined_terms()` extraction |\n| **OpenAlex** | Topics / keywords (model-inferred) | ✅ Broker keyword mode; bounded native semantic mode when selected |\n| **Semantic Scholar** | S2 fields / bulk query syntax | ✅ Broker chooses relevance or bounded bulk mode; provider annotations keep provenance |\n| **CORE** | None | ❌ Free-text only |\n| **CrossRef** | None | ❌ Free-text only |\n\n#### Automatic ICD → MeSH Conversion\n\nWhen searching with ICD codes (e.g., `I10` for Hypertension), `unified_search()` automatically:\n\n1. Detects ICD-10/ICD-9 patterns via `detect_and_expand_icd_codes()`\n2. Looks up corresponding MeSH terms from internal mapping (`ICD10_TO_MESH`, `ICD9_TO_MESH`)\n3. Expands query with MeSH synonyms for comprehensive search\n\n```python\n# Agent calls unified_search with clinical terminology\nunified_search(query=\"I10 treatment outcomes\")\n\n# Server auto-expands to PubMed-compatible query\n\"(I10 OR Hypertension[MeSH]) treatment outcomes\"\n```\n\n> 📖 **Full architecture documentation**: [ARCHITECTURE.md](#/architecture)\n\n### MeSH Auto-Expansion + Query Analysis\n\nWhen calling `generate_search_queries(\"remimazolam sedation\")`, internally it:\n\n1. **ESpell Correction** - Fix spelling errors\n2. **MeSH Query** - `Entrez.esearch(db=\"mesh\")` to get standard vocabulary\n3. **Synonym Extraction** - Get synonyms from MeSH Entry Terms\n4. **Query Analysis** - Analyze how PubMed interprets each query\n\n```json\n{\n  \"mesh_terms\": [\n    {\n      \"input\": \"remimazolam\",\n      \"preferred\": \"remimazolam [Supplementary Concept]\",\n      \"synonyms\": [\"CNS 7056\", \"ONO 2745\"]\n    }\n  ],\n  \"all_synonyms\": [\"CNS 7056\", \"ONO 2745\", ...],\n  \"suggested_queries\": [\n    {\n      \"id\": \"q1_title\",\n      \"query\": \"(remimazolam sedation)[Title]\",\n      \"purpose\": \"Exact title match - highest precision\",\n      \"estimated_count\": 8,\n      \"pubmed_translation\": \"\\\"remimazolam sedation\\\"[Title]\"\n    },\n    {\n      \"id\": \"q3_and\",\n      \"query\": \"(remimazolam AND sedation)\",\n      \"purpose\": \"All keywords required\",\n      \"estimated_count\": 561,\n      \"pubmed_translation\": \"(\\\"remimazolam\\\"[Supplementary Concept] OR \\\"remimazolam\\\"[All Fields]) AND (\\\"sedate\\\"[All Fields] OR ...)\"\n    }\n  ]\n}\n```\n\n> **Value of Query Analysis**: Agent thinks `remimazolam AND sedation` only searches these two words, but PubMed actually expands to Supplementary Concept + synonyms, results go from 8 to 561. This helps Agent understand the difference between **intent** and **actual search**.\n\n---\n\n## 🔒 Local HTTPS Demo and Service Deployment\n\nThe bundled self-signed certificates and `curl -k` flow are a **local TLS demo**,\nnot a production security profile. For a shared service, use the authenticated\nservice Compose file and a trusted certificate as described in\n[DEPLOYMENT.md](#/deployment).\n\n### Local HTTPS Smoke Test\n\n```bash\n# Step 1: Generate SSL certificates\n./scripts/generate-ssl-certs.sh\n\n# Step 2: Start HTTPS service (Docker)\n./scripts/start-https-docker.sh up\n\n# Verify deployment\ncurl -k https://localhost/\n```\n\n### HTTPS Endpoints\n\n| Service | URL | Description |\n| ------- | --- | ----------- |\n| MCP | `https://localhost/mcp` | Streamable HTTP MCP endpoint |\n| Health | `https://localhost/health` | Health check |\n| Ready | `https://localhost/ready` | Readiness check |\n| Info | `https://localhost/info` | Runtime transport and endpoint metadata |\n| Exports | `https://localhost/exports` | Local prepared export listing; service mode requires bearer auth and tenant scope |\n\n### Remote MCP Client Configuration\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"url\": \"https://localhost/mcp\"\n    }\n  }\n}\n```\n\n---\n\n## 🏢 Microsoft Copilot Studio Integration\n\nIntegrate PubMed Search MCP with **Microsoft 365 Copilot** (Word, Teams, Outlook)!\n\n### Quick Start\n\n```bash\n# Unpublished local schema/protocol smoke only; never tunnel local mode\npubmed-search-mcp-http --mode local --transport streamable-http \\\n  --copilot-compatible --host 127.0.0.1 --port 8765\n\n# Public Copilot endpoint: authenticated service mode is mandatory\nexport PUBMED_AUTH_TOKENS=\"copilot:$(openssl rand -hex 32)\"\nexport NGROK_DOMAIN=\"your-assigned-domain.ngrok.dev\"\n./scripts/start-copilot-studio.sh --with-ngrok\n```\n\n### Copilot Studio Configuration\n\n| Field | Value |\n| ----- | ----- |\n| **Server name** | `PubMed Search` |\n| **Server URL** | `https://your-server.com/mcp` |\n| **Authentication** | Bearer token for service mode; `None` only for an unpublished local demo |\n\n> 📖 **Full documentation**: [copilot-studio/README.md](https://github.com/u9401066/pubmed-search-mcp/blob/master/copilot-studio/README.md)\n>\n> Use `pubmed-search-mcp-http --copilot-compatible` for packaged Copilot HTTP semantics. `run_server.py` remains a source-tree development wrapper; use `run_copilot.py` only for loopback-only 12-tool primitive-schema smoke tests. That simplified surface still calls the shared runner through `unified_search(query, limit, min_year, max_year, sources, options)` and exposes primitive-schema `read_session` for search-run, replay-argument, and artifact recovery; it does not expose a PubMed-only generic-search alias. The tunnel script requires an assigned `NGROK_DOMAIN`, refuses occupied backend ports, and publishes only after `--mode service` passes readiness and unauthenticated-rejection checks.\n>\n> ⚠️ **Note**: SSE transport deprecated since Aug 2025. Use `streamable-http`.\n\n---\n\n> 📖 **More documentation**:\n>\n> - Architecture → [ARCHITECTURE.md](#/architecture)\n> - Pipeline tutorial (English) → [docs/PIPELINE_MODE_TUTORIAL.en.md](#/pipeline-tutorial)\n> - Pipeline tutorial (zh-TW) → [docs/PIPELINE_MODE_TUTORIAL.md](#/pipeline-tutorial-zh)\n> - Deployment guide → [DEPLOYMENT.md](#/deployment)\n> - Copilot Studio → [copilot-studio/README.md](https://github.com/u9401066/pubmed-search-mcp/blob/master/copilot-studio/README.md)\n\n---\n\n## 🔐 Security\n\n### Security Features\n\n| Layer | Feature | Description |\n| ----- | ------- | ----------- |\n| **HTTPS** | TLS termination | Required for remote credentials; the bundled self-signed profile is local-only |\n| **Bearer authentication** | Stable principal | Mandatory in service mode and used for tenant authorization |\n| **Tenant storage** | Filesystem isolation | Sessions, artifacts, exports, chronicles, and pipelines are stored below the authenticated principal |\n| **Fairness and rate policy** | Tenant concurrency + shared upstream budgets | Prevents one caller from multiplying an upstream API allowance |\n| **Security headers** | Clickjacking/MIME hardening | Reverse-proxy headers complement authentication; they are not CSRF authorization |\n| **Secret handling** | Runtime secret injection | API keys and bearer tokens must come from deployment secrets/environment and must not be committed or logged |\n\nSee [DEPLOYMENT.md](#/deployment) for detailed deployment instructions.\n\n---\n\n## 📤 Export Formats\n\n![Export and local notes workflow](images/export-notes-workflow.svg)\n\nExport your search results in formats compatible with major reference managers:\n\n| Format | Source | Compatible With | Use Case |\n| ------ | ------ | --------------- | -------- |\n| **RIS** | official or local | EndNote, Zotero, Mendeley | Universal import |\n| **MEDLINE** | official or local | PubMed tools | Native PubMed-style archiving |\n| **CSL JSON** | official | Citation processors | Programmatic citation styling |\n| **BibTeX** | local | LaTeX, Overleaf, JabRef | Academic writing |\n| **CSV** | local | Excel, Google Sheets | Data analysis |\n| **JSON** | local | Programmatic access | Custom processing |\n\n### Exported Fields\n\n- **Core**: PMID, Title, Authors, Journal, Year, Volume, Issue, Pages\n- **Identifiers**: DOI, PMC ID, ISSN\n- **Content**: Abstract (HTML tags cleaned)\n- **Metadata**: Language, Publication Type, Keywords\n- **Access**: DOI URL, PMC URL, Full-text availability\n\n### Special Character Handling\n\n- BibTeX exports use **pylatexenc** for proper LaTeX encoding\n- Nordic characters (ø, æ, å), umlauts (ü, ö, ä), and accents are correctly converted\n- Example: `Søren Hansen` → `S{\\o}ren Hansen`\n\n---\n\n## 📚 Citation\n\nGitHub will show **Cite this repository** from [CITATION.cff](https://github.com/u9401066/pubmed-search-mcp/blob/master/CITATION.cff). If you use PubMed Search MCP in research, methods sections, or internal technical reports, prefer the GitHub-generated citation or reuse the repository metadata directly.\n\n```bibtex\n@software{pubmed_search_mcp,\n  title = {PubMed Search MCP},\n  author = {u9401066},\n  url = {https://github.com/u9401066/pubmed-search-mcp}\n}\n```\n\n---\n\n## 📄 License\n\nApache License 2.0 - see [LICENSE](https://github.com/u9401066/pubmed-search-mcp/blob/master/LICENSE)\n\n---\n\n## 🔗 Links\n\n- [GitHub Repository](https://github.com/u9401066/pubmed-search-mcp)\n- [PyPI Package](https://pypi.org/project/pubmed-search-mcp/)\n- [NCBI Entrez Programming Utilities](https://www.ncbi.nlm.nih.gov/books/NBK25497/)\n",
+  "overview-zh": "<!-- Generated from README.zh-TW.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP\n\n[![PyPI version](https://badge.fury.io/py/pubmed-search-mcp.svg)](https://badge.fury.io/py/pubmed-search-mcp)\n[![Python 3.10+](https://img.shields.io/badge/python-3.10+-blue.svg)](https://www.python.org/downloads/)\n[![License: Apache 2.0](https://img.shields.io/badge/License-Apache%202.0-blue.svg)](https://opensource.org/licenses/Apache-2.0)\n[![MCP](https://img.shields.io/badge/MCP-Compatible-green.svg)](https://modelcontextprotocol.io/)\n[![CI](https://github.com/u9401066/pubmed-search-mcp/actions/workflows/ci.yml/badge.svg)](https://github.com/u9401066/pubmed-search-mcp/actions/workflows/ci.yml)\n\n> **AI Agent 的專業文獻研究助理** - 不只是 API 包裝器\n\n![PubMed Search MCP 研究工作流](images/research-workflow.svg)\n\n基於 Domain-Driven Design (DDD) 架構的 MCP 伺服器，作為 AI Agent 的智慧研究助理，提供任務導向的文獻搜尋與分析能力。\n\n**✨ 包含內容：**\n\n- 🔧 **46 個 MCP 工具** - 精簡的 PubMed、Europe PMC、CORE、NCBI 資料庫存取，及**研究編年史 / 脈絡圖**功能\n- 🛡️ **多 Agent 服務模式** - 部署一次供多個 agent 共用：session、快取與 artifact 依租戶隔離，支援 bearer token 認證與各租戶公平配額。詳見 [DEPLOYMENT.md](#/deployment)\n- 🖼️ **OA 圖表擷取** - 從 PMC Open Access 論文直接抽出 figure caption、image URL 與 PDF 連結\n- 📘 **Docs Site** - 完整雙語手冊：使用者工作流、架構、46-tool reference、pipeline 教學、source/broker contracts、整合與維運、安全與部署，入口在 [u9401066.github.io/pubmed-search-mcp](https://u9401066.github.io/pubmed-search-mcp/)\n- 📖 **GitHub Wiki** - 同一組 canonical docs 的 GitHub 內建文件鏡像，入口在 [github.com/u9401066/pubmed-search-mcp/wiki](https://github.com/u9401066/pubmed-search-mcp/wiki)\n- 📚 **26 個 Claude Skills** - AI Agent 可直接使用的工作流程指南（Claude Code 專屬）\n- 📖 **Copilot 整合指南** - VS Code GitHub Copilot 使用說明\n\n**🌐 語言**: [English](#/overview) | **繁體中文**\n\n**📘 文件地圖**：README 是專案入口與快速導覽；[Docs Site](https://u9401066.github.io/pubmed-search-mcp/) 提供最佳閱讀體驗；[GitHub Wiki](https://github.com/u9401066/pubmed-search-mcp/wiki) 提供 GitHub 內建導覽；實際編修以 source docs 為準：[使用者指南](#/user-guide-zh) | [進階研究工作流](#/advanced-workflows-zh) | [能力導向使用指南](#/tools-usage-guide-zh) | [Provider 資料平面](#/semantic-scholar-api) | [BioMCP 架構分析](#/biomcp-analysis) | [開發者指南](#/developer-guide-zh) | [完整工具索引](#/quick-reference)\n\n---\n\n## 🚀 快速安裝\n\n### 前置需求\n\n- **Python 3.10+** — [下載](https://www.python.org/downloads/)\n- **uv**（推薦）— [安裝 uv](https://docs.astral.sh/uv/getting-started/installation/)\n\n  ```bash\n  # macOS / Linux\n  curl -LsSf https://astral.sh/uv/install.sh | sh\n  # Windows\n  powershell -ExecutionPolicy ByPass -c \"irm https://astral.sh/uv/install.ps1 | iex\"\n  ```\n\n- **NCBI Email** — [NCBI API 政策](https://www.ncbi.nlm.nih.gov/books/NBK25497/#chapter2.Usage_Guidelines_and_Requirements)要求，任何有效的電子郵件地址\n- **NCBI API Key**（*選填*）— [在此取得](https://www.ncbi.nlm.nih.gov/account/settings/)，可提高 API 限額（10 req/s vs 3 req/s）\n- **OpenAlex API Key**（*選填*）— 設定 `OPENALEX_API_KEY` 後會使用 authenticated credit allocation；未設定時則依 OpenAlex 當下的匿名 casual-use budget。`mailto` 只是 contact metadata，不是認證。若未設定來源專用 email，server 會把 runtime contact email 重用於 OpenAlex、CrossRef 與 Unpaywall。\n\n### 安裝與執行\n\n```bash\n# 方式 1：使用 uvx 免安裝（推薦新手嘗試用）\nuvx pubmed-search-mcp\n\n# 方式 2：加入專案依賴\nuv add pubmed-search-mcp\n\n# 方式 3：pip 安裝\npip install pubmed-search-mcp\n```\n\n### Python SDK facade\n\n若是在 Python 套件、notebook、或自動化程式中直接呼叫，請使用穩定的\n`pubmed_search.api` facade，不要 import MCP tool module：\n\n```python\nfrom pubmed_search.api import PubMedSearchClient, PubMedSearchConfig\n\nclient = PubMedSearchClient(PubMedSearchConfig(email=\"your@email.com\"))\nresult = await client.unified_search(\"remimazolam ICU sedation\", limit=20)\n\nprint(result.articles)\nprint(result.source_counts)\nprint(result.artifact)  # 啟用 persistence 時會有 artifact locator\n```\n\n`uvx pubmed-search-mcp` 與 `/mcp` 是給 AI agent / MCP client 的工具合約；\nPython SDK 則是給外部 Python code 的 in-process 合約。\n\n### 選擇 runtime 合約\n\n| 合約 | 指令 | 網路與信任邊界 |\n| --- | --- | --- |\n| **本機 stdio** | `uvx pubmed-search-mcp` | 建議給單一本機 AI client；不開啟 MCP listening port |\n| **本機 loopback HTTP** | `pubmed-search-mcp-http --mode local --host 127.0.0.1` | 可信單使用者整合；各 MCP request 共用 durable `default` tenant，且不可對外發布此 port |\n| **多使用者 service** | `pubmed-search-mcp-http --mode service` | 團隊/遠端使用必須置於 HTTPS 後方，並強制 bearer auth、allowed hosts/origins 與 principal-scoped storage |\n\n本機與 service 是刻意分開的合約。不可只改 bind address 就把本機 HTTP\n當成公開服務。顯式 local profile 會把 `pmids=\"last\"`、session、cache 與 export\n保留在 durable `default` tenant，跨 MCP requests 與重連仍可使用；這只在強制\nloopback/Host/Origin 邊界內才安全。Service mode 不繼承此信任，無 bearer\nprincipal 時會 fail closed。完整環境與 Compose profile 見 [DEPLOYMENT.md](#/deployment)。\n目前 service profile 可在單一 server process 服務多個已認證 principal；在 session、\nlock、artifact 與 subscription 都有共享 backend 前，必須維持單副本。\n\nProtocol baseline 是 MCP SDK v2（`mcp>=2.0,<3`）。現代 2026-07-28 client 會直接送\n`tools/list` 與 `tools/call`，不先做 `initialize` handshake，也不依賴 `Mcp-Session-Id`。\n本機模式保留 filesystem 能力；認證 service caller 不能載入 `file:` pipeline、選擇 note\n`output_dir`/`template_file`，也不繼承 process-wide pipeline workspace；service Compose\nscheduler 會停用。完整能力矩陣見 [整合與維運指南](#/troubleshooting)。\n\n---\n\n## ⚙️ 設定方式\n\n本 MCP 伺服器可與**任何 MCP 相容的 AI 工具**配合使用。選擇您偏好的客戶端：\n\n### VS Code / Cursor (`.vscode/mcp.json`)\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n選用：若要在 VS Code 內「設定一次，之後自動使用」browser-session PDF fallback，可直接加一個設定：\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"BROWSER_FETCH_CONFIG\": \"{\\\"enabled\\\":true,\\\"auto_enabled\\\":true,\\\"broker_url\\\":\\\"http://127.0.0.1:8766/fetch\\\",\\\"token\\\":\\\"<random-32-byte-token>\\\",\\\"allowed_hosts\\\":[\\\"jamanetwork.com\\\",\\\"*.jamanetwork.com\\\",\\\"nejm.org\\\",\\\"*.nejm.org\\\"]}\"\n      }\n    }\n  }\n}\n```\n\n設定後，get_fulltext 遇到 institutional resolver 或 publisher landing page 時，會自動嘗試本機 broker。只有在單次呼叫想刻意關掉時，才需要傳 allow_browser_session=false。\n\n本機 broker 的自動下載攔截啟動方式：\n\n```bash\nuv sync --extra browser-broker\nuv run playwright install chromium\nuv run python -c \"import secrets; print(secrets.token_urlsafe(32))\"\nuv run pubmed-browser-fetch-broker --token \"<same-random-32-byte-token>\"\n```\n\n請把產生的值填入命令與 MCP 設定，絕不要重用文件裡的公開範例 token。若省略\n`--token`，broker 會產生並顯示一組高熵 runtime token。這個 broker 會啟動一個\n可重複使用的瀏覽器 profile，並攔截下載事件。你只要在 broker 控制的瀏覽器裡\n登入一次，之後 PDF 下載就會直接落到暫存目錄並回傳給 MCP，不會再跳出手動另存\n對話框。\n\n### Claude Desktop (`claude_desktop_config.json`)\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n> **設定檔位置**：\n>\n> - macOS: `~/Library/Application Support/Claude/claude_desktop_config.json`\n> - Windows: `%APPDATA%\\Claude\\claude_desktop_config.json`\n> - Linux: `~/.config/Claude/claude_desktop_config.json`\n\n### Claude Code\n\n```bash\nclaude mcp add pubmed-search -- uvx pubmed-search-mcp\n```\n\n或在專案根目錄的 `.mcp.json` 中新增：\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n### Zed AI (`settings.json`)\n\nZed 編輯器（[z.ai](https://zed.dev)）原生支援 MCP 伺服器。在 Zed 的 `settings.json` 中新增：\n\n```json\n{\n  \"context_servers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n> **提示**：開啟命令面板 → `zed: open settings` 編輯，或前往 Agent Panel → Settings →「Add Custom Server」。\n\n### OpenClaw 🦞 (`~/.openclaw/openclaw.json`)\n\n[OpenClaw](https://docs.openclaw.ai/) 透過 [mcp-adapter 插件](https://github.com/androidStern-personal/openclaw-mcp-adapter)支援 MCP 伺服器。先安裝 adapter：\n\n```bash\nopenclaw plugins install mcp-adapter\n```\n\n然後新增到 `~/.openclaw/openclaw.json`：\n\n```json\n{\n  \"plugins\": {\n    \"entries\": {\n      \"mcp-adapter\": {\n        \"enabled\": true,\n        \"config\": {\n          \"servers\": [\n            {\n              \"name\": \"pubmed-search\",\n              \"transport\": \"stdio\",\n              \"command\": \"uvx\",\n              \"args\": [\"pubmed-search-mcp\"],\n              \"env\": {\n                \"NCBI_EMAIL\": \"your@email.com\"\n              }\n            }\n          ]\n        }\n      }\n    }\n  }\n}\n```\n\n設定後重啟 gateway：\n\n```bash\nopenclaw gateway restart\nopenclaw plugins list  # 應顯示: mcp-adapter | loaded\n```\n\n### Cline (`cline_mcp_settings.json`)\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      },\n      \"alwaysAllow\": [],\n      \"disabled\": false\n    }\n  }\n}\n```\n\n### 其他 MCP 客戶端\n\n任何 MCP 相容客戶端都可以透過 stdio transport 使用此伺服器：\n\n```bash\n# 指令\nuvx pubmed-search-mcp\n\n# 搭配環境變數\nNCBI_EMAIL=your@email.com uvx pubmed-search-mcp\n```\n\n> **注意**: `NCBI_EMAIL` 是 NCBI API 政策要求的必填項。可選擇性設定 `NCBI_API_KEY` 以獲得更高的 API 限額（10 req/s vs 3 req/s）。\n> 📖 **完整整合指南**：詳見 [docs/INTEGRATIONS.md](#/troubleshooting)，包含所有環境變數、Copilot Studio 設定、Docker 部署、代理設定與疑難排解。\n\n---\n\n## 🎯 設計理念\n\n> **核心定位**：AI Agent 與學術搜尋引擎之間的**智慧中介層**。\n\n### 為什麼選擇這個伺服器？\n\n其他工具給你原始 API 存取。我們給你**詞彙翻譯 + 智慧路由 + 研究分析**：\n\n| 挑戰 | 我們的解決方案 |\n| ---- | -------------- |\n| Agent 用 ICD 碼，PubMed 要 MeSH | ✅ **自動 ICD→MeSH 轉換** |\n| 多資料庫，不同 API | ✅ **Unified Search** 單一入口 |\n| 臨床問題需結構化搜尋 | ✅ **PICO handoff + pipeline** (`parse_pico` 驗證 agent 提供的 P/I/C/O，並回傳可執行的 `template: pico` pipeline) |\n| 醫學術語打錯字 | ✅ **ESpell 自動校正** |\n| 單一來源結果太多 | ✅ **平行多源搜尋** + 去重 |\n| 需要追蹤研究演進脈絡 | ✅ **研究時間軸 & 脈絡樹** + 重要文獻偵測 + diagnostics + 子議題分支 |\n| 引用上下文不清楚 | ✅ **引用樹** 前向/後向/網路分析 |\n| 無法取得全文 | ✅ **多源全文取得**（Europe PMC XML、Unpaywall OA locations、institutional direct/EZproxy、CORE 與 downloader fallbacks） |\n| 基因/藥物資訊散布不同資料庫 | ✅ **NCBI 延伸** (Gene, PubChem, ClinVar) |\n| 匯出到文獻管理軟體 | ✅ **一鍵匯出** (official RIS/MEDLINE/CSL JSON；local RIS/BibTeX/CSV/MEDLINE/JSON) |\n| 需要最新預印本研究 | ✅ **預印本搜尋** (arXiv, medRxiv, bioRxiv) 含同儕審查過濾 |\n\n### 核心差異化\n\n1. **詞彙翻譯層** - Agent 自然語言表達，我們翻譯成各資料庫術語 (MeSH, ICD-10, text-mined entities)\n2. **統一搜尋閘道** - 一個 `unified_search()` 呼叫，依能力分流到 PubMed、Europe PMC、CORE、OpenAlex、Semantic Scholar 與已啟用的預印本／商用來源\n3. **PICO Handoff + Pipeline** - Agent 先抽出 P/I/C/O，`parse_pico()` 驗證這份結構化 handoff，後端 `template: pico` pipeline 執行含 O 的 precision/recall 搜尋\n4. **研究時間軸 & 脈絡樹** - 以 policy-driven 規則自動偵測里程碑，結合多訊號重要文獻評分（引用影響力+多源交叉驗證+引用速度），並輸出 timeline diagnostics 與子議題分支視覺化\n5. **引用網路分析** - 從單篇論文建構多層引用樹，繪製完整研究版圖\n6. **完整研究生命週期** - 從搜尋 → 探索 → 全文 → 分析 → 匯出，一站完成\n7. **Agent-First 設計** - 輸出優化機器決策，非人類閱讀\n\n---\n\n## 📡 外部 API 與資料來源\n\n本 MCP 伺服器整合多個學術資料庫和 API：\n\n### 核心資料來源\n\n| 來源 | 收錄量 | 詞彙系統 | 自動轉換 | 說明 |\n| ---- | ------ | -------- | -------- | ---- |\n| **NCBI PubMed** | 36M+ 文章 | MeSH | ✅ 原生支援 | 主要生醫文獻 |\n| **NCBI Entrez** | 多資料庫 | MeSH | ✅ 原生支援 | Gene, PubChem, ClinVar |\n| **Europe PMC** | 33M+ | Text-mined | ✅ 擷取 | 全文 XML 存取 |\n| **CORE** | 200M+ | 無 | ➡️ 自由文字 | 開放取用聚合器 |\n| **Semantic Scholar** | 持續演進的 graph + operator datasets | S2 fields / bulk syntax | ✅ Broker 編譯模式 | Relevance、bounded bulk、batch、citation graph 與 metadata-only release/diff plane；不下載 partition |\n| **OpenAlex** | 持續演進的開放研究圖譜 | Topics / keywords | ✅ Keyword + bounded native semantic | Cursor、cost provenance、entity graph 與已宣告的 operator snapshot 路徑；尚無 local index |\n| **NIH iCite** | PubMed | N/A | N/A | 引用指標 (RCR) |\n\n> **🔑 說明**: ✅ = 完整詞彙支援 | ➡️ = 查詢直接傳遞（無控制詞彙）\n> **ICD 碼**：自動偵測並在 PubMed 搜尋前轉換為 MeSH\n\n### 環境變數\n\n```bash\n# 必填\nNCBI_EMAIL=your@email.com          # NCBI 政策要求\n\n# 選填 - 提高 API 限額\nNCBI_API_KEY=your_ncbi_api_key     # 取得：https://www.ncbi.nlm.nih.gov/account/settings/\nCORE_API_KEY=your_core_api_key     # 取得：https://core.ac.uk/services/api\nCROSSREF_EMAIL=your@email.com      # 選填覆寫；預設使用 server/NCBI email\nUNPAYWALL_EMAIL=your@email.com     # 選填覆寫；預設使用 server/NCBI email\nS2_API_KEY=your_s2_api_key         # 取得：https://www.semanticscholar.org/product/api\nOPENALEX_API_KEY=your_openalex_key # 提高 OpenAlex credit budget；實際額度依 response\n\n# 選填 - 網路設定\nHTTP_PROXY=http://proxy:8080       # HTTP 代理\nHTTPS_PROXY=https://proxy:8080     # HTTPS 代理\n\n# 選填 - 機構全文存取\nINSTITUTIONAL_DIRECT_FETCH=true    # 在 CORE fallback 前嘗試 DOI publisher page\nEZPROXY_ENABLED=false              # 設好 EZPROXY_HOST + cookie 後才啟用\nEZPROXY_HOST=ezproxy.example.edu\nEZPROXY_COOKIE_FILE=/path/to/cookies.json\n\n# 選填 - 本機筆記匯出\nPUBMED_NOTES_DIR=/path/to/wiki/references  # save_literature_notes 目標資料夾\nPUBMED_WORKSPACE_DIR=/path/to/project       # fallback：使用此 workspace 下的 references/\nPUBMED_DATA_DIR=~/.pubmed-search-mcp        # fallback：使用此 data dir 下的 references/\n```\n\nCrossRef 與 Unpaywall 會重用 runtime server contact email（`NCBI_EMAIL`、CLI\n`--email` 或偵測到的 git email），除非另設來源專用 email。OpenAlex 支援 casual\nanonymous usage 與選填 API key；broker 依 response 的 credit/rate metadata 決策，\n不再假設永久的「polite pool」額度。\n\n本機筆記目錄解析順序是：`output_dir` 參數、`PUBMED_NOTES_DIR`、`PUBMED_WORKSPACE_DIR/references`、`PUBMED_DATA_DIR/references`、最後 `~/.pubmed-search-mcp/references`。\n這套 path/template 選擇只適用於可信任的本機模式。認證 service notes 一律使用內建\nformat，寫到當前 tenant 隔離的 `references/` 目錄。\n為了相容 LLM wiki，`wiki` 與 `foam` 匯出會使用 PMID、DOI、PMCID 或 fallback identifier 作為穩定 link target；title 只作為 alias/display label，回應會包含 `wiki_validation` 方便檢查 unresolved wikilinks。\n\n---\n\n## 🔄 運作原理：中介層架構\n\n```text\n┌─────────────────────────────────────────────────────────────────────────────┐\n│                              AI AGENT                                        │\n│                                                                              │\n│   「找 I10 高血壓在糖尿病患者的治療論文」                                         │\n│                                                                              │\n└─────────────────────────────────────────┬───────────────────────────────────┘\n                                          │\n                                          ▼\n┌─────────────────────────────────────────────────────────────────────────────┐\n│                     🔄 PUBMED SEARCH MCP (中介層)                            │\n│  ┌─────────────────────────────────────────────────────────────────────────┐│\n│  │  1️⃣ 詞彙翻譯                                                            ││\n│  │     • ICD-10 \"I10\" → MeSH \"Hypertension\"                                ││\n│  │     • \"糖尿病\" → MeSH \"Diabetes Mellitus\"                               ││\n│  │     • ESpell: \"hypertention\" → \"hypertension\"                           ││\n│  └─────────────────────────────────────────────────────────────────────────┘│\n│  ┌─────────────────────────────────────────────────────────────────────────┐│\n│  │  2️⃣ 智慧路由                                                            ││\n│  │     ┌──────────┐  ┌──────────┐  ┌──────────┐  ┌──────────┐             ││\n│  │     │ PubMed   │  │Europe PMC│  │   CORE   │  │ OpenAlex │             ││\n│  │     │  36M+    │  │   33M+   │  │  200M+   │  │  250M+   │             ││\n│  │     │  (MeSH)  │  │(全文)    │  │  (OA)    │  │(元資料)  │             ││\n│  │     └────┬─────┘  └────┬─────┘  └────┬─────┘  └────┬─────┘             ││\n│  │          └──────────────┴──────────────┴──────────────┘                 ││\n│  │                              ▼                                          ││\n│  │  3️⃣ 結果聚合：去重 + 排序 + 補充                                         ││\n│  └─────────────────────────────────────────────────────────────────────────┘│\n└─────────────────────────────────────────┬───────────────────────────────────┘\n                                          │\n                                          ▼\n┌─────────────────────────────────────────────────────────────────────────────┐\n│                         統一結果                                              │\n│   • 150 篇唯一論文（從 4 個來源去重）                                          │\n│   • 按相關性 + 引用影響力 (RCR) 排序                                          │\n│   • 全文連結從 Europe PMC 補充                                                │\n└─────────────────────────────────────────────────────────────────────────────┘\n```\n\n---\n\n## 🛠️ MCP 工具概覽\n\n如果你想真正理解這 46 個工具怎麼用，不要從背工具名開始。\n\n先看[工具使用指南](#/tools-usage-guide-zh)：它把目前 46 個工具濃縮成 8 個能力族，說明理論上的最小壓縮邊界，以及人類與 agent 的意圖路由方式。\n\n### 🔍 搜尋與查詢智能\n\n![搜尋與查詢智能流程](images/search-query-workflow.svg)\n\n```text\n┌─────────────────────────────────────────────────────────────────┐\n│                        搜尋入口                                   │\n├─────────────────────────────────────────────────────────────────┤\n│                                                                  │\n│   unified_search()          ← 🌟 單一入口，涵蓋所有來源            │\n│        │                                                         │\n│        ├── 快速搜尋     → 直接多源查詢                             │\n│        ├── Native semantic → 有界 OpenAlex 語意模式                 │\n│        ├── Systematic   → 有界 provider bulk/cursor 模式           │\n│        ├── PICO 提示    → 偵測比較結構，顯示 P/I/C/O               │\n│        └── ICD 擴展     → 自動 ICD→MeSH 轉換                      │\n│                                                                  │\n│   來源: PubMed · Europe PMC · CORE · OpenAlex · S2               │\n│   自動: 去重 → 排序 → 補充全文連結                                  │\n│                                                                  │\n├─────────────────────────────────────────────────────────────────┤\n│   查詢智能                                                        │\n│                                                                  │\n│   generate_search_queries() → MeSH 擴展 + 同義詞發現              │\n│   parse_pico()              → Agent-provided PICO handoff        │\n│   analyze_search_query()    → 查詢分析（不執行搜尋）                │\n│                                                                  │\n└─────────────────────────────────────────────────────────────────┘\n```\n\n#### 單一搜尋入口，三種 retrieval policy\n\n一般文獻發現對外固定只有一個 MCP tool：`unified_search`。Provider-specific\nAPI 保持在 broker 內部，以 capability 而不是新 tool 表達：\n\n```python\n# 預設：在已啟用來源中做 relevance/keyword 路由\nunified_search(query=\"treatment resistance\")\n\n# OpenAlex native semantic（provider 上限 50 筆）\nunified_search(\n    query=\"mechanisms of treatment resistance\",\n    sources=\"openalex\",\n    options=\"native_semantic\",\n)\n\n# 可重現的有界檢索：依來源選用 OpenAlex cursor / S2 bulk\nunified_search(\n    query=\"melanoma AND immunotherapy\",\n    sources=\"pubmed,openalex,semantic_scholar\",\n    options=\"systematic\",\n)\n```\n\n`native_semantic` 與 `systematic` 互斥，並會關閉多策略 deep-search\nexpansion。明確指定不支援該 mode 的來源時，broker 會在發送 network\nrequest 前拒絕；自動選源則只保留有能力的 provider。`limit` 每來源仍最多\n100，所以 `systematic` 指的是 deterministic / bounded provider execution，不是\n「已完整覆蓋系統性回顧」的保證。Structured output 與 artifact 會保存\n`retrieval_mode` 及每來源 `source_metadata`（requested/provider mode、canonical 或\ncompiled query、continuation、cost/rate metadata 與 warnings）。\n\n公開 request boundary 採 fail-closed。`limit` 必須是 1 到 100 的整數；未知或\n格式錯誤的 `filters` / `options`、反向或超出範圍的年份，以及不支援的 ranking\n或 output mode，都會在 provider I/O 前回傳 validation error。預設 deep-search\npolicy 中，`limit` 是分配給每個來源所有 query strategies 的**總額度**，不是每個\nstrategy 都各取 `limit` 筆。Strategy calls 有全域／每來源 concurrency 與 timeout\n上限；單一來源 timeout、rate limit 或失敗時，其他來源的成功結果仍可使用。\n\nEurope PMC、Scopus 與 Web of Science 在本版仍是 keyword-only；明確指定\n這些來源的 systematic 請求會在 I/O 前失敗，不會把單頁結果誤標為\nsystematic coverage。\n\nProvider 上限與 operator data-plane 邊界見[Source Contracts](#/source-contracts)、\n[Semantic Scholar](#/semantic-scholar-api) 與\n[OpenAlex](#/openalex-api)。\n\n### 🔬 探索工具（找到關鍵論文後）\n\n![論文探索與引用流程](images/discovery-citation-workflow.svg)\n\n```text\n                        找到重要論文 (PMID)\n                                   │\n           ┌───────────────────────┼───────────────────────┐\n           │                       │                       │\n           ▼                       ▼                       ▼\n    ┌─────────────┐        ┌─────────────┐        ┌─────────────┐\n    │  往前追溯   │        │   相似主題   │        │  往後追蹤   │\n    │  ◀──────    │        │  ≈≈≈≈≈≈     │        │  ──────▶    │\n    │             │        │             │        │             │\n    │ get_article │        │find_related │        │find_citing  │\n    │ _references │        │ _articles   │        │ _articles   │\n    │             │        │             │        │             │\n    │  基礎論文   │        │  相似主題   │        │  後續研究   │\n    └─────────────┘        └─────────────┘        └─────────────┘\n\n    fetch_article_details()   → 詳細文章元資料\n    get_citation_metrics()    → iCite RCR, 引用百分位\n    build_citation_tree()     → 完整網絡視覺化（6 種格式）\n\n```\n\n### 📚 全文、圖表擷取與匯出\n\n![全文、圖表與生醫圖片流程](images/visual-evidence-workflow.svg)\n\n| 類別 | 工具 |\n| ---- | ---- |\n| **全文** | `get_fulltext` → 有 PMCID 時走 Europe PMC XML；需要 DOI fallback 時再嘗試 Unpaywall、institutional direct/EZproxy、CORE 與 downloader fallback |\n| **圖表擷取** | `get_article_figures` → 從 PMC Open Access 文章抽出圖號、caption、image URL 與 PDF 連結 |\n| **圖表感知全文** | `get_fulltext(include_figures=True)` → 在全文回應中直接附帶圖表 metadata |\n| **文字探勘** | `get_text_mined_terms` → 擷取基因、疾病、化學物質 |\n| **匯出** | `prepare_export` → official RIS/MEDLINE/CSL JSON 或 local RIS/BibTeX/CSV/MEDLINE/JSON；`save_literature_notes` → 本機 wiki/Foam-compatible/Markdown/MedPaper-style 筆記與 collection-level CSL JSON |\n\n### 🖼️ OA 論文圖表優先探索\n\n當 Agent 需要的是證據圖像，而不只是文章全文時，建議優先走 PMC Open Access 圖表工作流：\n\n- `get_article_figures(identifier=\"PMC12086443\")` → 回傳圖號、caption、image URL，以及 PDF/文章連結\n- `get_fulltext(pmcid=\"PMC7096777\", include_figures=True)` → 結構化全文連同 figures 一起回傳\n- 圖表輸出會保留文章脈絡，方便 Agent 把 figure 與文中提及段落綁在一起，而不是只看到孤立圖片\n\n### 🧬 NCBI 延伸資料庫\n\n![NCBI 延伸生醫資料流程](images/ncbi-extended-workflow.svg)\n\n| 工具 | 說明 |\n| ---- | ---- |\n| `search_gene` | 搜尋 NCBI Gene 資料庫 |\n| `get_gene_details` | 依 NCBI Gene ID 取得基因詳情 |\n| `get_gene_literature` | 取得與基因相關的 PubMed 文章 |\n| `search_compound` | 搜尋 PubChem 化合物 |\n| `get_compound_details` | 依 PubChem CID 取得化合物詳情 |\n| `get_compound_literature` | 取得與化合物相關的 PubMed 文章 |\n| `search_clinvar` | 搜尋 ClinVar 臨床變異 |\n\n### 🕰️ 研究編年史 & 脈絡樹\n\n![Research Chronicle 架構與脈絡流程](images/research-chronicle-lineage-flow.svg)\n![評估與時間軸流程](images/timeline-evaluation-workflow.svg)\n\n| 工具 | 說明 |\n| ---- | ---- |\n| `build_research_chronicle` | 建構持久化、可版本比對的研究脈絡，支援重要文獻偵測。格式：summary, chronicle_map, timeline, tree, graph, evidence, milestones, mermaid, timeline_mermaid, mindmap, narrative, json |\n| `read_research_chronicle` | 讀取、列表、版本 diff、有證據支撐的敘述、里程碑分佈分析，或比較最多五個主題 |\n\n```python\n# 1. 依主題建立（自動檢索 PubMed、計算 Landmark 分數並聚類分支）\nbuild_research_chronicle(topic=\"remimazolam intraoperative\", output=\"mermaid\", max_events=30)\n\n# 2. 延續既有編年史（自動繼承前版的 topic 與檢索範圍，建立 Revision N+1）\nbuild_research_chronicle(chronicle_id=\"remimazolam-intraoperative-08c229f3\")\n\n# 3. 讀取版本差異、里程碑分析或多主題比較（讀取儲存資料，不重跑檢索）\nread_research_chronicle(action=\"diff\", chronicle_id=\"remimazolam-intraoperative-08c229f3\", from_revision=1)\nread_research_chronicle(action=\"milestones\", chronicle_id=\"remimazolam-intraoperative-08c229f3\")\nread_research_chronicle(action=\"compare\", topics=\"remimazolam intraoperative,propofol intraoperative\")\n```\n\n`mermaid` 是標準合併圖：以年份作橫向主軸（X 軸），各研究線（Y 軸）從**本次檢索範圍內最早的有日期論文**所在年份分岔。這是可解釋的觀察分組，不是因果譜系，也不代表找到整個領域的真正首篇論文。lineage 優先由多篇論文共同出現的 MeSH descriptor 與作者 keyword 推導；只有 singleton 或訊號不足時，audit 會警告分支只是研究階段 fallback。同年項目的顯示順序雖然固定，但日期 precision 不足時不宣稱先後。舊的平面 timeline 保留為 `timeline_mermaid`。完整指南見 [進階研究工作流 (docs/ADVANCED_RESEARCH_WORKFLOWS.zh-TW.md)](#/advanced-workflows-zh) 與規格 [docs/RESEARCH_CHRONICLE_REFACTOR_SPEC.md](#/research-chronicle-rebuild-spec)。\n\nChronicle Mermaid 由結構化 node/edge 生成，會自動跳脫 label、修正循環與孤兒 parent、避免 ID 碰撞並限制圖形大小；rich 圖失敗時依序降級為 safe 與 minimal syntax，不會讓整份 chronicle 建立失敗。`mermaid_validation.json` 記錄每個 correction、fallback 與被摘要的視覺項目，`chronicle.mmd` 則維持純 Mermaid source。\n\nChronicle revisions 不可變，並以原子操作追加。啟用 session artifact persistence 時，如果 artifact 寫入失敗，回應會明確警告；已保存的 Chronicle revision 仍可讀取。\n\nTopic build 會先把年份限制送到 PubMed，再做有界檢索；輸出上限會保留觀察到的首篇、末篇，並以 landmark 與時間分散度補齊。audit 會記錄 PubMed `returned` / `available` 數量；若總量未知，或檢索／選取上限使內容不是完整 census，就會警告。PubMed 錯誤或範圍內沒有任何論文證據時，不會發布空的 revision。\n\n明確 PMID input 採嚴格格式（`12345678` 或 `PMID:12345678`；正 ASCII 數字、最多 20 位），不會把 DOI 或混合文字強制轉成 PMID。沒有可靠出版日期的記錄會標示為 `Undated`、排列在 dated entries 之後，且不計入顯示的年份範圍。entry ID 依 PMID／DOI 證據身分產生，日期或分類修正後仍保持穩定；topic 延續性則共用同一套 Unicode、大小寫與空白 canonical key。符合多個訊號的論文只指定一個 primary branch，其他關聯保留為 explicit cross-links；重疊達 20% 會產生 audit warning。revision diff 中缺席只代表 `not_observed_in_revision`／`removed_from_view`，不能宣稱研究已退場。\n\n### 🏥 機構訂閱與 ICD 轉換\n\n![機構存取流程](images/institutional-access-workflow.svg)\n\n| 工具 | 說明 |\n| ---- | ---- |\n| `configure_institutional_access` | 設定機構的 Link Resolver |\n| `get_institutional_link` | 產生 OpenURL 存取連結 |\n| `list_resolver_presets` | 列出 Resolver 預設值 |\n| `test_institutional_access` | 測試 Resolver 設定 |\n| `diagnose_institutional_access` | 診斷 direct DOI、EZproxy 與 OpenURL handoff 路徑 |\n| `convert_icd_mesh` | ICD 碼與 MeSH 詞彙雙向轉換 |\n| `unified_search` | 在查詢中自動偵測 ICD 代碼並擴展成 MeSH |\n\n### 💾 Session 管理\n\n![Session 與 Pipeline 流程](images/session-pipeline-workflow.svg)\n\n| 工具 | 說明 |\n| ---- | ---- |\n| `get_session_pmids` | 取得暫存的 PMID 列表 |\n| `get_cached_article` | 從 Session 快取取得文章（不消耗 API） |\n| `get_session_summary` | Session 狀態概覽 |\n| `read_session` | 讀取 PMID、快取文章、持久化 search runs、replay arguments、歷史與 artifacts 的 facade |\n\n若 MCP client 支援直接讀取 resources，也可使用以下動態 session resources：\n\n- `session://context` — 目前 session 狀態\n- `session://last-search` — 最近一次搜尋 metadata\n- `session://last-search/pmids` — 最近一次 PMID 清單與 CSV 形式\n- `session://last-search/results` — 最近一次搜尋對應的快取文章內容\n\n### 📦 Persistent Artifacts\n\n當 session persistence 已設定時，`unified_search` 與 `get_fulltext` 會把可重用的完整輸出保存成 artifact。工具回應會像索引卡：包含足夠的 counts、source warnings 與 artifact hints，讓 agent 可以先回覆使用者；完整 evidence payload 則留在可重複讀取的檔案中。精簡 locator 會包含 `artifact_id`、`artifact_uri`、`primary_file`、`summary`、檔案清單、`read_order`、audit status 與 `read_session(...)` 提示。若本機 MCP client 需要直接拿到 `local_path` / `manifest_path`，才設定 `PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true`。\n\n```text\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"audit.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"query_strategy.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"results.json\", offset=0, max_chars=200000)\nread_session(action=\"list_artifacts\", include_local_paths=true)\n```\n\n### 可回復的 search runs\n\nSession manager 可用時，每一次 `unified_search` invocation 都會取得穩定 run ID，\n包括一般搜尋、validation/planning failure，以及 inline、`saved:<name>` 或\n`dry_run=true` pipeline execution。Structured result 與 error 會附上 `search_run`\nhandoff；Markdown 會以精簡 recovery note 回傳相同 run ID。一般 literature-result\nenvelope 會分開提供兩個 machine contract：\n\n- `search_status` 描述有界檢索結果：`state`（`completed`、`empty`、\n  `partial` 或 `failed`）、`bounded=true`、`exhaustive=false`、回傳筆數、\n  attempted/successful/failed/retryable sources，以及有 continuation 或完整度\n  未知的 source lists。\n- `search_run` 是 recovery handoff：穩定 `run_id`、journal status、\n  `recoverable`、可直接交給 `read_session` 的 inspect/replay arguments，以及成功\n  保存時的 artifact URI。\n\nTenant-scoped `search-run/v1` journal 會在 provider I/O 或 terminal validation\nresponse 前發布，並記錄 sanitized request、plan、每來源或每 pipeline step 的實際\nattempts、counts、安全化 failure、result references，以及適用時的 artifact locator。\n最後狀態為 `completed`、`partial`、`failed` 或 `cancelled`；\n合法的零結果搜尋是 `completed` run，但 `search_status.state` 為 `empty`。Server\n重啟時，尚未結束的 `started` / `planned` / `running` 只會被回復一次為\n`interrupted`，不會無聲消失。非 dry-run 的 saved pipeline 還會另外保留\nPipelineStore report/run history；它補充 invocation-level search journal，不會取代它。\n\nPipeline replay 會保存原本的 inline 或 `saved:<name>` argument，以及 `dry_run` /\n`stop_at`。含有 key、token、cookie、password 或其他 credential material 的 pipeline\ntext 會被拒絕並記成 failed run；provider credentials 必須放在 server\nenvironment/configuration，不能寫進 pipeline YAML/JSON。\n\n```text\nread_session(action=\"search_runs\")\nread_session(action=\"search_runs\", run_status=\"partial\")\nread_session(action=\"search_run\", run_id=\"...\")\nread_session(action=\"replay_search\", run_id=\"...\")\n```\n\n`replay_search` 只回傳原本、已移除 credential 的 `unified_search` kwargs，不會\n自動發出任何 network call；agent 或使用者必須先檢查再明確提交。Provider\ncursor/token 會以 opaque provenance 保存在 `source_metadata` 與\n`query_strategy.json`，但目前尚無公開 cursor-resume 參數，因此 replay 會開始一輪\n新的 bounded search。\n\n如果 terminal journal write 無法復原，response 會回報\n`search_run.status=\"history_unavailable\"`、`history_available=false`、預期 terminal\nstatus 與 warning。此時會刻意省略 inspect/replay actions，因為 durable recovery\n無法保證；搜尋結果本身仍可能可用。\n\n`unified_search` artifacts 會使用 research envelope。建議先讀 `audit.json` 確認 source-counts 與完整性警告，再讀 `query_strategy.json` 檢查實際執行的搜尋策略，最後用 `results.json` / `results.toon` 取回完整文章清單。這樣可以節省 MCP response token，同時保留學術可追溯性。\n\n`read_session` 只讀既有 artifact，不會重跑搜尋或全文擷取。若 crash 發生在 artifact directory 已原子發布、但 session index 尚未更新之間，session reload 只會發現結構完整且 checksum 已索引的 manifests，並透過 `search_run_id` 把 orphan artifact 重新連到 search run；舊 artifact 才使用保守的 query match fallback。遠端 client 應使用 `read_session(action=\"artifact\")` 分段讀取；`local_path` / `manifest_path` 是 MCP server host 上的本機路徑，不是可攜的 client 路徑，且預設會被遮蔽。大型 `get_fulltext` 回應在已有 artifact 時會先回 inline preview；要讀完整內容請使用 artifact locator。`get_fulltext` artifact 可能包含全文、訂閱或機構授權內容，正式環境請依 publisher license、機構條款與 retention policy 處理保存與分享。\n\n當單一來源失敗但整體搜尋仍可繼續時，`unified_search` JSON 會回傳 `source_errors`，Markdown 會顯示 `Source warnings`。Semantic Scholar HTTP 429 可設定 `S2_API_KEY` / `SEMANTIC_SCHOLAR_API_KEY`、稍後重試，或用 `sources=\"auto,-semantic_scholar\"` / `PUBMED_SEARCH_DISABLED_SOURCES=semantic_scholar` 暫時排除。\n\n### 🔁 Pipeline 管理\n\n![Session 與 Pipeline 流程](images/session-pipeline-workflow.svg)\n\n`manage_pipeline` 是 pipeline CRUD、history 與 scheduling 的主要 façade；其他 pipeline tools 仍保留作為相容 wrapper。\n\n| 工具 | 說明 |\n| ---- | ---- |\n| `manage_pipeline` | 主要 façade，統一處理 save、list、load、delete、history、schedule |\n| `save_pipeline` | 保存 Pipeline 配置供後續重複使用（YAML/JSON，自動驗證） |\n| `list_pipelines` | 列出已保存的 Pipeline（可按標籤/範圍過濾） |\n| `load_pipeline` | 以已保存名稱載入；可信任的本機 caller 也可載入檔案 |\n| `delete_pipeline` | 刪除 Pipeline 及其執行歷史 |\n| `get_pipeline_history` | 查看執行歷史與文章 diff 分析 |\n| `schedule_pipeline` | 建立、更新或移除定期執行排程 |\n\n認證 service caller 在 tenant-derived store 中以名稱重用 pipeline；`workspace` 與\n`file:` 存取只限本機。Service Compose 不會執行 schedules，除非另外設計單一 leader。\n\n逐步教學：\n\n- 繁體中文: [docs/PIPELINE_MODE_TUTORIAL.md](#/pipeline-tutorial-zh)\n- English: [docs/PIPELINE_MODE_TUTORIAL.en.md](#/pipeline-tutorial)\n\n### 👁️ 視覺搜尋與圖片搜尋\n\n![全文、圖表與生醫圖片流程](images/visual-evidence-workflow.svg)\n\n| 工具 | 說明 |\n| ---- | ---- |\n| `analyze_figure_for_search` | 將上傳圖片、image URL 或 data URI 交給 agent vision 抽取搜尋詞 |\n| `search_biomedical_images` | 搜尋 Open-i 生物醫學圖片（X 光、顯微鏡、照片、圖表） |\n\n使用者提供圖片、而 agent 需要先判讀圖片語意時，使用\n`analyze_figure_for_search`。這個工具會回傳 MCP `ImageContent` 與給 LLM\nagent 的指令；agent 抽出英文 biomedical terms 後，再接續用\n`search_biomedical_images` 找相似 Open-i 圖片，或用 `unified_search`\n搜尋相關論文。\n\n### 📄 預印本搜尋\n\n透過 `unified_search` 的 `options` 旗標搜尋 **arXiv**、**medRxiv**、**bioRxiv** 預印本伺服器：\n\n- `preprints`: 搜尋預印本伺服器，並把預印本以 `article_type=PREPRINT` 合併進主聚合結果。\n- `all_types`: 即使沒有額外爬預印本伺服器，也保留所選學術來源回傳的非同儕審查內容。\n\n**建議組合：**\n\n- 空白 `options`: 僅同儕審查結果；preprint-like records 會被過濾。\n- `options=\"preprints\"`: 搜尋 arXiv、medRxiv、bioRxiv，並把預印本和主結果一起排名/去重。\n- `options=\"preprints, all_types\"`: 同樣執行預印本伺服器搜尋，並保留其他來源中的非同儕審查內容。\n- `options=\"all_types\"`: 不額外爬預印本伺服器，但保留各來源中的非同儕審查項目。\n\n**預印本偵測方式** — 透過以下條件辨識預印本：\n\n- 來源 API 的文章類型（OpenAlex、CrossRef、Semantic Scholar）\n- 有 arXiv ID 但無 PubMed ID\n- 已知預印本伺服器來源或期刊名稱\n- DOI 前綴匹配預印本伺服器（如 `10.1101/` → bioRxiv/medRxiv、`10.48550/` → arXiv）\n\n### 🌳 研究脈絡圖預覽\n\n`unified_search` 現在可直接在同一次搜尋回應中附帶 PMID-based 的研究脈絡圖預覽：\n\n| 選項旗標 | 說明 |\n| -------- | ---- |\n| `context_graph` | Markdown 輸出附帶由本次 PMID-backed ranked set 產生的輕量 Research Context Graph preview；JSON 輸出附帶 `research_context` 欄位 |\n\n這適合 Agent 在不額外呼叫 `build_research_chronicle` 的情況下，先快速掌握主題分支。\n\n### 🧪 臨床試驗登錄附加區塊\n\n系統不會隱式查詢 ClinicalTrials.gov。只有在 Markdown 搜尋明確加上\n`options=\"trials\"` 時，才會執行有上限的 registry adjunct。它不會混入\nliterature source plan 或 source counts；persistent artifact 會在\n`adjunct_queries` 記錄截短後的 physical query 與執行結果。JSON/TOON\n不執行這個只用於顯示的附加區塊。\n\n```python\nunified_search(query=\"remimazolam ICU sedation\", options=\"trials\")\n```\n\n### 📊 Count-First Orientation\n\n`unified_search` 現在也支援把原本就有的來源覆蓋資訊前移，並加上後續工具建議，讓 Agent 先做路由決策，再深入讀排序後的文章：\n\n| 選項旗標 | 說明 |\n| -------- | ---- |\n| `counts_first` | 在回應前段加入 source-count 表格、coverage 摘要，以及 next-tool 建議 |\n\n範例：\n\n```python\nunified_search(query=\"remimazolam ICU sedation\", options=\"counts_first\")\n```\n\n這個模式特別適合先判斷要不要擴大某個來源、讀 lead PMID、抓全文/圖表，或直接轉進 timeline 探索。\n\n### ⏱️ MCP 進度回報\n\n當 MCP client 提供 progress token 時，`unified_search`、`build_research_chronicle`、`get_fulltext`、`get_text_mined_terms` 都會回報主要階段進度，降低 Agent 長時間等待時的黑箱感。\n進度 callback 採 best-effort，不會在 tool call 仍執行時由 server 主動取消，\n避免 progress notification backpressure 造成 host 顯示 `Canceled: Canceled`。\n\n---\n\n## 📋 Agent 使用範例\n\n### 1️⃣ 快速搜尋（最簡單）\n\n```python\n# Agent 自然語言詢問 - 中介層處理一切\nunified_search(query=\"remimazolam ICU sedation\", limit=20)\n\n# 或使用臨床代碼 - 自動轉換為 MeSH\nunified_search(query=\"I10 treatment in E11.9 patients\")\n#                     ↑ ICD-10           ↑ ICD-10\n#                     高血壓             第二型糖尿病\n```\n\n### 2️⃣ PICO 臨床問題\n\n![PICO 臨床搜尋流程](images/pico-clinical-workflow.svg)\n\n**簡單路徑** — `unified_search` 可直接搜尋（不做 PICO 拆解）：\n\n```python\n# unified_search 直接搜尋；偵測「A vs B」模式並在 metadata 中顯示 PICO 提示\nunified_search(query=\"remimazolam 在 ICU 鎮靜比 propofol 好嗎？\")\n# → 多源關鍵字搜尋 + 輸出中附帶 PICO 提示 metadata\n# ⚠️ 這不會自動拆解 PICO 或擴展 MeSH！\n# 結構化 PICO 搜尋請用下方 Agent 工作流程\n```\n\n**Agent 工作流程** — agent-provided PICO + 後端 pipeline 搜尋（臨床問題建議使用）：\n\n```text\n┌─────────────────────────────────────────────────────────────────────────┐\n│  「remimazolam 在 ICU 鎮靜比 propofol 好嗎？」                            │\n└─────────────────────────────────────────┬───────────────────────────────┘\n                                          │\n                                          ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│                         parse_pico()                                     │\n│  ┌─────────┐  ┌─────────┐  ┌─────────┐  ┌─────────┐                     │\n│  │    P    │  │    I    │  │    C    │  │    O    │                     │\n│  │  ICU    │  │remimaz- │  │propofol │  │ 鎮靜    │                     │\n│  │  病人   │  │  olam   │  │         │  │  結果   │                     │\n│  └────┬────┘  └────┬────┘  └────┬────┘  └────┬────┘                     │\n└───────┼────────────┼────────────┼────────────┼──────────────────────────┘\n        │            │            │            │\n        ▼            ▼            ▼            ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│              generate_search_queries() × 4（平行）                       │\n│                                                                          │\n│  P → \"Intensive Care Units\"[MeSH]                                        │\n│  I → \"remimazolam\" [Supplementary Concept], \"CNS 7056\"                   │\n│  C → \"Propofol\"[MeSH], \"Diprivan\"                                        │\n│  O → \"Conscious Sedation\"[MeSH], \"Deep Sedation\"[MeSH]                   │\n└─────────────────────────────────────────┬───────────────────────────────┘\n                                          │\n                                          ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│              Agent 用 Boolean 邏輯組合                                   │\n│                                                                          │\n│  (P) AND (I) AND (C) AND (O)  ← 高精確度                                 │\n│  (P) AND (I OR C) AND (O)     ← 高召回率                                 │\n└─────────────────────────────────────────┬───────────────────────────────┘\n                                          │\n                                          ▼\n┌─────────────────────────────────────────────────────────────────────────┐\n│              unified_search()（自動多源 + 去重）                          │\n│                                                                          │\n│  PubMed + Europe PMC + CORE + OpenAlex → 自動去重排序                     │\n└─────────────────────────────────────────────────────────────────────────┘\n```\n\n```python\n# Step 1: Agent 先抽出 P/I/C/O，再驗證結構化 handoff\npico = parse_pico(\n    description=\"remimazolam 在 ICU 鎮靜比 propofol 好嗎？\",\n    p=\"ICU patients requiring sedation\",\n    i=\"remimazolam\",\n    c=\"propofol\",\n    o=\"sedation efficacy, delirium, hypotension\"\n)\n# 回傳 validation 與可直接交給 unified_search 的 `template: pico` pipeline\n\n# Step 2: 對每個元素取得 MeSH（平行！）\ngenerate_search_queries(topic=\"ICU patients\")   # P\ngenerate_search_queries(topic=\"remimazolam\")    # I\ngenerate_search_queries(topic=\"propofol\")       # C\ngenerate_search_queries(topic=\"sedation\")       # O\n\n# Step 3: 可把擴展後的 fragment 用 p_query/i_query/c_query/o_query 貼回 parse_pico，\n# 或讓後端 pipeline 使用結構化 P/I/C/O label。\n\n# Step 4: 後端執行含 O 的 precision/recall 搜尋、dedup、rank\nunified_search(\n    query=\"remimazolam 在 ICU 鎮靜比 propofol 好嗎？\",\n    pipeline=pico[\"pipeline\"]\n)\n```\n\n### 3️⃣ 從關鍵論文探索\n\n```python\n# 找到里程碑論文 PMID: 33475315\nfind_related_articles(pmid=\"33475315\")   # 類似方法論\nfind_citing_articles(pmid=\"33475315\")    # 誰引用了這篇？\nget_article_references(pmid=\"33475315\")  # 基礎是什麼？\n\n# 建構完整研究脈絡\nbuild_citation_tree(pmid=\"33475315\", depth=2, output_format=\"mermaid\")\n```\n\n### 4️⃣ 基因/藥物研究\n\n```python\n# 研究基因\nsearch_gene(query=\"BRCA1\", organism=\"human\")\nget_gene_literature(gene_id=\"672\", limit=20)\n\n# 研究藥物化合物\nsearch_compound(query=\"propofol\")\nget_compound_literature(cid=\"4943\", limit=20)\n```\n\n### 5️⃣ 匯出結果\n\n```python\n# 匯出上次搜尋結果\nprepare_export(pmids=\"last\", format=\"ris\")      # → EndNote/Zotero\nprepare_export(pmids=\"last\", format=\"bibtex\", source=\"local\")  # → LaTeX\nprepare_export(pmids=\"last\", format=\"csl\")      # → official NCBI Citation API 的 CSL JSON\nsave_literature_notes(pmids=\"last\")              # → 本機 wiki note + Foam-compatible wikilinks + CSL JSON\nsave_literature_notes(pmids=\"last\", note_format=\"medpaper\", output_dir=\"./references\")\nsave_literature_notes(pmids=\"last\", template_file=\"./reference-template.md\")\n\n# 對上次搜尋中的指定文章抓全文\nget_fulltext(pmid=\"12345678\", extended_sources=True)\n```\n\n### 6️⃣ 預印本搜尋\n\n```python\n# 同時搜尋同儕審查文獻與預印本\nunified_search(query=\"COVID-19 vaccine efficacy\", options=\"preprints\")\n# → 主聚合結果會包含已標註的 arXiv、medRxiv、bioRxiv 預印本\n\n# 保留主結果中的非同儕審查內容\nunified_search(query=\"CRISPR gene therapy\", options=\"preprints, all_types\")\n# → 預印本伺服器搜尋 + 主結果保留非同儕審查內容\n\n# 僅同儕審查（預設行為）\nunified_search(\"diabetes treatment\")\n# → 自動過濾來自任何來源的預印本\n\n# 同一個搜尋回應附帶研究脈絡圖預覽\nunified_search(\"remimazolam ICU sedation\", options=\"context_graph\")\n```\n\n### 7️⃣ Pipeline（可重複使用的搜尋計畫）\n\n```python\n# 透過主要 façade 保存模板式 pipeline\nmanage_pipeline(\n  action=\"save\",\n    name=\"icu_sedation_weekly\",\n    config=\"template: pico\\nparams:\\n  P: ICU patients\\n  I: remimazolam\\n  C: propofol\\n  O: delirium\",\n    tags=\"anesthesia,sedation\",\n    description=\"每週 ICU 鎮靜藥物監控\"\n)\n\n# 保存自訂 DAG pipeline\nmanage_pipeline(\n  action=\"save\",\n    name=\"brca1_comprehensive\",\n    config=\"\"\"\nsteps:\n  - id: expand\n    action: expand\n    params: { topic: BRCA1 breast cancer }\n  - id: pubmed\n    action: search\n    params: { query: BRCA1, sources: pubmed, limit: 50 }\n  - id: expanded\n    action: search\n    inputs: [expand]\n    params: { strategy: mesh, sources: pubmed,openalex, limit: 50 }\n  - id: merged\n    action: merge\n    inputs: [pubmed, expanded]\n    params: { method: rrf }\n  - id: enriched\n    action: metrics\n    inputs: [merged]\noutput:\n  limit: 30\n  ranking: quality\n\"\"\"\n)\n\n# 執行已保存的 pipeline\nunified_search(pipeline=\"saved:icu_sedation_weekly\")\n\n# 管理\nmanage_pipeline(action=\"list\", tag=\"anesthesia\")\nmanage_pipeline(action=\"load\", source=\"brca1_comprehensive\")  # 檢視 YAML\nmanage_pipeline(action=\"history\", name=\"icu_sedation_weekly\")  # 查看過去執行\n```\n\n---\n\n## 🔍 搜尋模式比較\n\n```text\n┌─────────────────────────────────────────────────────────────────────────┐\n│                        搜尋模式決策樹                                     │\n├─────────────────────────────────────────────────────────────────────────┤\n│                                                                          │\n│   「我需要什麼樣的搜尋？」                                                 │\n│         │                                                                │\n│         ├── 確切知道要搜什麼？                                            │\n│         │   └── unified_search(query=\"主題關鍵字\")                        │\n│         │       → 快速，自動路由到最佳來源                                 │\n│         │                                                                │\n│         ├── 有臨床問題（A vs B）？                                        │\n│         │   └── Agent P/I/C/O → parse_pico() handoff                  │\n│         │       → unified_search(template:pico) 或擴展 Boolean         │\n│         │                                                                │\n│         ├── 需要全面系統性覆蓋？                                          │\n│         │   └── generate_search_queries() → 平行搜尋                     │\n│         │       → MeSH 擴展，多策略，合併                                 │\n│         │                                                                │\n│         └── 從關鍵論文探索？                                              │\n│             └── find_related/citing/references → build_citation_tree     │\n│                 → 引用網絡，研究脈絡                                      │\n│                                                                          │\n└─────────────────────────────────────────────────────────────────────────┘\n```\n\n| 模式 | 入口 | 適用情境 | 自動功能 |\n| ---- | ---- | -------- | -------- |\n| **快速** | `unified_search()` | 快速主題搜尋 | ICD→MeSH, 多源, 去重 |\n| **PICO** | Agent P/I/C/O → `parse_pico()` | 臨床問題 | 驗證 handoff → `template:pico` 後端搜尋 |\n| **系統** | `generate_search_queries()` → `unified_search(options=\"systematic\")` | 可重現的 review seed | MeSH/同義詞 + 有界 bulk/cursor；不代表已窮盡全庫 |\n| **Native semantic** | `unified_search(options=\"native_semantic\")` | title/abstract 概念相似性 | capability 驗證；OpenAlex semantic，最多 50 |\n| **探索** | `find_*_articles()` | 從關鍵論文 | 引用網絡, 相關 |\n\n---\n\n## 🤖 Claude Skills（AI Agent 工作流程）\n\n預建工作流程指南位於 `.claude/skills/`，分為**使用 Skills**（使用 MCP server）和**開發 Skills**（維護專案）：\n\n### 📚 使用 Skills (11) — 給使用此 MCP Server 的 AI Agent\n\n| Skill | 說明 |\n| ----- | ---- |\n| `pubmed-quick-search` | 基本搜尋含篩選 |\n| `pubmed-systematic-search` | MeSH 擴展，全面性 |\n| `pubmed-pico-search` | 臨床問題分解 |\n| `pubmed-paper-exploration` | 引用樹，相關文章 |\n| `pubmed-research-chronicle` | 持久化、可版本比對的研究脈絡 |\n| `pubmed-gene-drug-research` | Gene/PubChem/ClinVar |\n| `pubmed-fulltext-access` | Europe PMC, CORE 全文 |\n| `pubmed-export-citations` | RIS/BibTeX/CSV/CSL 匯出指引 |\n| `pubmed-multi-source-search` | 跨資料庫統一搜尋 |\n| `pubmed-mcp-tools-reference` | 完整工具參考指南 |\n| `pipeline-persistence` | 保存、載入、重複使用搜尋計畫 |\n\n### 🔧 開發 Skills (15) — 給專案貢獻者\n\n| Skill | 說明 |\n| ----- | ---- |\n| `changelog-updater` | 自動更新 CHANGELOG.md |\n| `code-refactor` | DDD 架構重構 |\n| `code-reviewer` | 程式碼品質與安全審查 |\n| `ddd-architect` | 新功能 DDD 腳手架 |\n| `git-doc-updater` | 提交前同步文件 |\n| `git-precommit` | Pre-commit 工作流程編排 |\n| `memory-checkpoint` | 儲存上下文到 Memory Bank |\n| `memory-updater` | 更新 Memory Bank 檔案 |\n| `pdf-asset-extractor` | 擷取並盤點可引用的 PDF assets |\n| `project-init` | 初始化新專案 |\n| `readme-i18n` | 多語言 README 同步 |\n| `readme-updater` | 同步 README 與程式碼變更 |\n| `roadmap-updater` | 更新 ROADMAP.md 狀態 |\n| `test-generator` | 產生測試套件 |\n| `tool-sync` | 同步 MCP registry 與自動產生的工具文件 |\n\n> 📁 **位置**: `.claude/skills/*/SKILL.md`（Claude Code 專屬，也是 repo skills 的唯一來源）\n> 不要再另外鏡像或拆分到 `.github/skills/`。\n> 這些 repo skills 屬於 project-scoped 自訂內容，應納入版本控制。跨專案的個人 skills 則應放在 `~/.copilot/skills/` 或 `~/.claude/skills/` 之類的使用者目錄，不要提交到本 repository。\n\n---\n\n## 🏗️ 架構（DDD）\n\n本專案採用 **Domain-Driven Design (DDD)** 架構，以文獻研究領域知識為核心模型。\n\n```text\nsrc/pubmed_search/\n├── domain/                     # 核心業務邏輯\n│   └── entities/article.py     # UnifiedArticle, Author 等\n├── application/                # 用例\n│   ├── search/                 # QueryAnalyzer, ResultAggregator\n│   ├── export/                 # 引用匯出（RIS, BibTeX...）\n│   └── session/                # SessionManager\n├── infrastructure/             # 外部系統\n│   ├── ncbi/                   # Entrez, iCite, Citation Exporter\n│   ├── sources/                # Europe PMC, CORE, CrossRef...\n│   └── http/                   # HTTP 客戶端\n├── presentation/               # 使用者介面\n│   ├── mcp_server/             # MCP 工具、prompts、resources\n│   │   └── tools/              # discovery, strategy, pico, export...\n│   └── api/                    # Auxiliary HTTP API routes（不是 pubmed_search.api）\n└── shared/                     # 跨切面關注\n    ├── exceptions.py           # 統一錯誤處理\n    └── async_utils.py          # Rate limiter, retry, circuit breaker\n```\n\n### 內部機制（對 Agent 透明）\n\n| 機制 | 說明 |\n| ---- | ---- |\n| **Session** | 自動建立、自動切換 |\n| **Cache** | 搜尋結果自動快取，避免重複 API 呼叫 |\n| **Rate Limit** | 自動遵守 NCBI API 限制 (0.34s/0.1s) |\n| **MeSH Lookup** | `generate_search_queries()` 自動查詢 NCBI MeSH 資料庫 |\n| **ESpell** | 自動拼字校正（`remifentanyl` → `remifentanil`） |\n| **Query Analysis** | 每個建議查詢都顯示 PubMed 實際如何詮釋 |\n\n### 詞彙轉換層（核心功能）\n\n> **核心價值**：我們是 **Agent 與 Search Engine 之間的智慧中介層**，自動處理詞彙標準化，讓 Agent 無需了解各資料庫的術語系統。\n\n不同資料來源使用不同的控制詞彙系統。本伺服器提供自動轉換：\n\n| API / 資料庫 | 詞彙系統 | 自動轉換 |\n| ------------ | -------- | -------- |\n| **PubMed / NCBI** | MeSH (醫學主題詞表) | ✅ 完整支援 `expand_with_mesh()` |\n| **ICD 碼** | ICD-10-CM / ICD-9-CM | ✅ 自動偵測並轉換為 MeSH |\n| **Europe PMC** | 文字探勘實體 (Gene, Disease, Chemical) | ✅ `get_text_mined_terms()` 擷取 |\n| **OpenAlex** | Topics / keywords（模型推論） | ✅ Broker keyword mode；選取時使用 bounded native semantic mode |\n| **Semantic Scholar** | S2 fields / bulk query syntax | ✅ Broker 選 relevance 或 bounded bulk mode，provider annotation 保留 provenance |\n| **CORE** | 無 | ❌ 僅支援自由文字 |\n| **CrossRef** | 無 | ❌ 僅支援自由文字 |\n\n#### 自動 ICD → MeSH 轉換\n\n當搜尋包含 ICD 碼時（例如 `I10` 代表高血壓），`unified_search()` 會自動：\n\n1. 透過 `detect_and_expand_icd_codes()` 偵測 ICD-10/ICD-9 模式\n2. 從內部映射表查詢對應 MeSH 詞彙 (`ICD10_TO_MESH`, `ICD9_TO_MESH`)\n3. 以 MeSH 同義詞擴展查詢，提供更完整的搜尋結果\n\n```python\n# Agent 使用臨床術語呼叫 unified_search\nunified_search(query=\"I10 treatment outcomes\")\n\n# 伺服器自動擴展為 PubMed 相容查詢\n\"(I10 OR Hypertension[MeSH]) treatment outcomes\"\n```\n\n> 📖 **完整架構說明**：[ARCHITECTURE.md](#/architecture)\n\n### MeSH 自動擴展 + 查詢分析\n\n呼叫 `generate_search_queries(\"remimazolam sedation\")` 時，內部會：\n\n1. **ESpell 校正** - 修正拼字錯誤\n2. **MeSH 查詢** - `Entrez.esearch(db=\"mesh\")` 取得標準詞彙\n3. **同義詞擷取** - 從 MeSH Entry Terms 取得同義詞\n4. **查詢分析** - 分析 PubMed 如何詮釋每個查詢\n\n```json\n{\n  \"mesh_terms\": [\n    {\n      \"input\": \"remimazolam\",\n      \"preferred\": \"remimazolam [Supplementary Concept]\",\n      \"synonyms\": [\"CNS 7056\", \"ONO 2745\"]\n    }\n  ],\n  \"all_synonyms\": [\"CNS 7056\", \"ONO 2745\", ...],\n  \"suggested_queries\": [\n    {\n      \"id\": \"q1_title\",\n      \"query\": \"(remimazolam sedation)[Title]\",\n      \"purpose\": \"精確標題匹配 - 最高精確度\",\n      \"estimated_count\": 8,\n      \"pubmed_translation\": \"\\\"remimazolam sedation\\\"[Title]\"\n    },\n    {\n      \"id\": \"q3_and\",\n      \"query\": \"(remimazolam AND sedation)\",\n      \"purpose\": \"所有關鍵字必須出現\",\n      \"estimated_count\": 561,\n      \"pubmed_translation\": \"(\\\"remimazolam\\\"[Supplementary Concept] OR \\\"remimazolam\\\"[All Fields]) AND (\\\"sedate\\\"[All Fields] OR ...)\"\n    }\n  ]\n}\n```\n\n> **查詢分析的價值**：Agent 認為 `remimazolam AND sedation` 只搜尋這兩個詞，但 PubMed 實際上擴展到 Supplementary Concept + 同義詞，結果從 8 篇變成 561 篇。這幫助 Agent 理解**意圖**與**實際搜尋**的差異。\n\n---\n\n## 🔒 本機 HTTPS 示範與 service 部署\n\n內建自簽憑證與 `curl -k` 流程是**本機 TLS 示範**，不是 production security\nprofile。共用 service 應使用已認證的 service Compose 與可信憑證，見\n[DEPLOYMENT.md](#/deployment)。\n\n### 本機 HTTPS smoke test\n\n```bash\n# Step 1: 生成 SSL 憑證\n./scripts/generate-ssl-certs.sh\n\n# Step 2: 啟動 HTTPS 服務（Docker）\n./scripts/start-https-docker.sh up\n\n# 驗證部署\ncurl -k https://localhost/\n```\n\n### HTTPS 端點\n\n| 服務 | URL | 說明 |\n| ---- | --- | ---- |\n| MCP | `https://localhost/mcp` | Streamable HTTP MCP endpoint |\n| Health | `https://localhost/health` | 健康檢查 |\n| Ready | `https://localhost/ready` | Readiness 檢查 |\n| Info | `https://localhost/info` | Runtime transport 與 endpoint metadata |\n| Exports | `https://localhost/exports` | 本機匯出列表；service mode 必須 bearer auth 並依 tenant 分區 |\n\n### 遠端 MCP client 設定\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"url\": \"https://localhost/mcp\"\n    }\n  }\n}\n```\n\n---\n\n## 🏢 Microsoft Copilot Studio 整合\n\n將 PubMed Search MCP 與 **Microsoft 365 Copilot**（Word, Teams, Outlook）整合！\n\n### Copilot Studio 快速開始\n\n```bash\n# 僅供未發布的本機 schema/protocol smoke；禁止把 local mode 接到 tunnel\npubmed-search-mcp-http --mode local --transport streamable-http \\\n  --copilot-compatible --host 127.0.0.1 --port 8765\n\n# 公開 Copilot endpoint：必須使用 authenticated service mode\nexport PUBMED_AUTH_TOKENS=\"copilot:$(openssl rand -hex 32)\"\nexport NGROK_DOMAIN=\"your-assigned-domain.ngrok.dev\"\n./scripts/start-copilot-studio.sh --with-ngrok\n```\n\n### Copilot Studio 設定\n\n| 欄位 | 值 |\n| ---- | -- |\n| **Server name** | `PubMed Search` |\n| **Server URL** | `https://your-server.com/mcp` |\n| **Authentication** | service mode 使用 bearer token；`None` 僅限未對外發布的本機示範 |\n\n> 📖 **完整文件**: [copilot-studio/README.md](https://github.com/u9401066/pubmed-search-mcp/blob/master/copilot-studio/README.md)\n>\n> 若只需要 Copilot 相容 HTTP 行為，用 `pubmed-search-mcp-http --copilot-compatible`；`run_copilot.py` 只供 loopback 的 12-tool primitive-schema smoke，禁止接到公網 tunnel。精簡 surface 仍透過 `unified_search(query, limit, min_year, max_year, sources, options)` 呼叫共用 runner，並提供 primitive-schema `read_session` 以回讀 search run、replay arguments 與 artifacts；它不提供 PubMed-only generic-search alias。Tunnel 腳本要求已指派的 `NGROK_DOMAIN`、拒絕已占用的 backend port，並只會在 `--mode service` 通過 readiness 與匿名拒絕檢查後公開。\n>\n> ⚠️ **注意**: SSE transport 自 2025 年 8 月起棄用。使用 `streamable-http`。\n\n---\n\n> 📖 **更多文件**:\n>\n> - 架構 → [ARCHITECTURE.md](#/architecture)\n> - Pipeline Mode 教學（繁中） → [docs/PIPELINE_MODE_TUTORIAL.md](#/pipeline-tutorial-zh)\n> - Pipeline Mode 教學（English） → [docs/PIPELINE_MODE_TUTORIAL.en.md](#/pipeline-tutorial)\n> - 部署指南 → [DEPLOYMENT.md](#/deployment)\n> - Copilot Studio → [copilot-studio/README.md](https://github.com/u9401066/pubmed-search-mcp/blob/master/copilot-studio/README.md)\n\n---\n\n## 🔐 安全性\n\n### 安全功能\n\n| 層級 | 功能 | 說明 |\n| ---- | ---- | ---- |\n| **HTTPS** | TLS termination | 遠端憑證必須加密；內建自簽組態僅用於本機 |\n| **Bearer 認證** | 穩定 principal | service mode 強制啟用，並作為 tenant 授權邊界 |\n| **Tenant storage** | 檔案系統隔離 | Session、artifact、export、chronicle 與 pipeline 依已認證 principal 分區 |\n| **公平性與 rate policy** | Tenant concurrency + 共用上游預算 | 避免單一呼叫端倍增外部 API 配額 |\n| **Security headers** | Clickjacking/MIME hardening | Reverse-proxy headers 是認證的補強，不是 CSRF 授權 |\n| **Secret handling** | Runtime secret injection | API key 與 bearer token 必須由部署秘密/環境注入，不可 commit 或寫入 log |\n\n詳見 [DEPLOYMENT.md](#/deployment) 完整部署說明。\n\n---\n\n## 📤 匯出格式\n\n![匯出與本機筆記流程](images/export-notes-workflow.svg)\n\n匯出搜尋結果為各大參考文獻管理軟體相容的格式：\n\n| 格式 | 來源 | 相容軟體 | 用途 |\n| ---- | ---- | -------- | ---- |\n| **RIS** | official 或 local | EndNote, Zotero, Mendeley | 通用匯入 |\n| **MEDLINE** | official 或 local | PubMed tools | PubMed 原生格式存檔 |\n| **CSL JSON** | official | Citation processors | 程式化 citation styling |\n| **BibTeX** | local | LaTeX, Overleaf, JabRef | 學術寫作 |\n| **CSV** | local | Excel, Google Sheets | 資料分析 |\n| **JSON** | local | 程式存取 | 自訂處理 |\n\n### 匯出欄位\n\n- **核心**: PMID, 標題, 作者, 期刊, 年份, 卷期頁碼\n- **識別碼**: DOI, PMC ID, ISSN\n- **內容**: 摘要（HTML 標籤已清除）\n- **詮釋資料**: 語言, 文章類型, 關鍵詞\n- **存取**: DOI URL, PMC URL, 全文可用性\n\n### 特殊字元處理\n\n- BibTeX 匯出使用 **pylatexenc** 進行正確的 LaTeX 編碼\n- 北歐字元 (ø, æ, å)、變音符號 (ü, ö, ä) 和重音符號都能正確轉換\n- 範例: `Søren Hansen` → `S{\\o}ren Hansen`\n\n---\n\n## 📚 引用\n\nGitHub 會根據 [CITATION.cff](https://github.com/u9401066/pubmed-search-mcp/blob/master/CITATION.cff) 顯示 **Cite this repository**。若你在論文、methods section、技術報告或內部研究文件中使用 PubMed Search MCP，建議直接使用 GitHub 產生的引用格式，或重用這份 repository citation metadata。\n\n```bibtex\n@software{pubmed_search_mcp,\n  title = {PubMed Search MCP},\n  author = {u9401066},\n  url = {https://github.com/u9401066/pubmed-search-mcp}\n}\n```\n\n---\n\n## 📄 授權\n\nApache License 2.0 - 詳見 [LICENSE](https://github.com/u9401066/pubmed-search-mcp/blob/master/LICENSE)\n\n---\n\n## 🔗 相關連結\n\n- [GitHub Repository](https://github.com/u9401066/pubmed-search-mcp)\n- [PyPI Package](https://pypi.org/project/pubmed-search-mcp/)\n- [NCBI Entrez Programming Utilities](https://www.ncbi.nlm.nih.gov/books/NBK25497/)\n",
   "user-guide": "<!-- Generated from docs/USER_GUIDE.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP User Guide\n\nThis guide is for people using PubMed Search MCP through an AI client such as VS Code, Claude Desktop, Claude Code, Cursor, Cline, Zed, or Copilot Studio. It explains how to move from a research question to reusable evidence without memorizing every MCP tool.\n\nUse this as the practical entry point, then keep the [Tools Usage Guide](#/tools-usage-guide) and [Quick Reference](#/quick-reference) nearby when you need exact tool names.\n\n## What This Server Is Good For\n\nPubMed Search MCP is an agent-facing literature research server. It is strongest when you want the AI client to plan and execute a biomedical literature workflow instead of only calling PubMed once.\n\nTypical jobs:\n\n- turn a clinical or biomedical question into a PubMed-ready search strategy\n- search multiple scholarly sources through `unified_search`\n- inspect seed papers, related articles, citing articles, references, and citation trees\n- retrieve full text, text-mined terms, article figures, and open-access image links when available\n- export citations or save guided local Markdown/wiki notes\n- save, review, rerun, or schedule repeatable research pipelines\n\nIt is not a replacement for human judgment, institutional access policy, systematic-review protocol design, or clinical decision-making.\n\n## Setup Checklist\n\nMinimum local setup:\n\n```bash\nuvx pubmed-search-mcp\n```\n\nMinimum environment:\n\n```bash\nNCBI_EMAIL=your@email.com\n```\n\n`NCBI_EMAIL` is required because NCBI asks API users to identify themselves. Add `NCBI_API_KEY` when you want higher NCBI rate limits. Add optional source keys only when you use those sources.\nOpenAlex, CrossRef, and Unpaywall reuse the runtime server contact email unless you set `OPENALEX_API_KEY`, `CROSSREF_EMAIL`, or `UNPAYWALL_EMAIL`.\n\nCommon optional values:\n\n```bash\nNCBI_API_KEY=your_ncbi_api_key\nCORE_API_KEY=your_core_api_key\nCROSSREF_EMAIL=your@email.com      # optional override; defaults to server/NCBI email\nUNPAYWALL_EMAIL=your@email.com     # optional override; defaults to server/NCBI email\nPUBMED_NOTES_DIR=/path/to/references\n```\n\nFor client-specific setup, see the [Integration Guide](#/troubleshooting). For HTTP, Docker, Copilot Studio, and GitHub Pages deployment notes, see [Deployment](#/deployment).\n\n## Choose The Right Path\n\n![PubMed Search MCP research workflow](images/research-workflow.svg)\n\n| Goal | Start With | Then Use |\n| --- | --- | --- |\n| Quick search for papers | `unified_search` | `fetch_article_details`, `read_session` |\n| Clinical question | Agent extracts P/I/C/O, then `parse_pico` | `generate_search_queries`, `unified_search` |\n| Improve a noisy query | `analyze_search_query` | `generate_search_queries`, `unified_search` |\n| Explore one important article | `fetch_article_details` | `find_related_articles`, `find_citing_articles`, `get_article_references`, `build_citation_tree` |\n| Read deeper evidence | `get_fulltext` | `get_text_mined_terms`, `get_article_figures` |\n| Search from visual evidence | `analyze_figure_for_search` | `search_biomedical_images`, `unified_search` |\n| Build a research chronicle / lineage tree | `build_research_chronicle` | `read_research_chronicle` |\n| Reopen large outputs | `read_session(action=\"artifact\")` | `read_session(action=\"list_artifacts\")` |\n| Build a local literature library | `prepare_export` | `save_literature_notes` |\n| Reuse a workflow | `manage_pipeline` | `save_pipeline`, `load_pipeline`, `schedule_pipeline` |\n\nThe most important rule: start with the research intent, not the tool menu.\n\n`unified_search` parameters are intentionally agent-friendly strings. Use comma-separated values for `sources`, `filters`, and `options` instead of JSON objects. Examples: `sources=\"auto\"`, `sources=\"auto,-semantic_scholar\"`, `filters=\"year:2020-, clinical:therapy\"`, or `options=\"counts_first,context_graph\"`.\n\n## Daily Workflow\n\n### 1. Start Broad, Then Narrow\n\n![Search and query intelligence workflow](images/search-query-workflow.svg)\n\nAsk the client to run a modest first pass:\n\n```text\nUse PubMed Search MCP to search for recent literature on SGLT2 inhibitors and heart failure with preserved ejection fraction. Start with a broad search, show the query strategy, and keep the result set in session.\n```\n\nThe agent should normally begin with `unified_search`. A good result includes the query used, article identifiers, source provenance, and enough metadata to decide whether to fetch details or refine.\n\nPrefer `read_session` or `get_session_pmids` for follow-up work. Do not ask the model to remember a long PMID list in conversation.\n\n### 2. Use PICO For Clinical Questions\n\nFor clinical comparisons, ask the agent to extract P/I/C/O first and validate that structured handoff:\n\n```text\nExtract P/I/C/O, validate the handoff with parse_pico, propose PubMed search queries, then run the most specific one:\nIn adults with type 2 diabetes and CKD, do SGLT2 inhibitors reduce heart failure hospitalization compared with placebo?\n```\n\nExpected flow:\n\n1. Agent extracts P/I/C/O from the user's clinical question.\n2. `parse_pico(description=..., p=..., i=..., c=..., o=...)` validates the schema and returns a `template: pico` pipeline.\n3. Optional `generate_search_queries` calls expand P/I/C/O into MeSH/synonym fragments.\n4. `unified_search` runs either the returned PICO pipeline or the agent-built Boolean query.\n5. optional `analyze_search_query` if the first query is too broad or too narrow\n\nThe server can validate the PICO handoff, build the backend PICO search plan, and help with MeSH, synonyms, and ICD-to-MeSH expansion. The agent remains responsible for the semantic PICO extraction and should explain why it chose a final query.\n\n### 3. Explore Seed Papers\n\n![Article discovery and citation workflow](images/discovery-citation-workflow.svg)\n\nOnce you have an important PMID, move from search to discovery:\n\n```text\nFor PMID 12345678, fetch details, then find related papers, citing papers, and key references. Summarize why each group matters.\n```\n\nUseful tools:\n\n- `fetch_article_details`\n- `find_related_articles`\n- `find_citing_articles`\n- `get_article_references`\n- `build_citation_tree`\n- `get_citation_metrics`\n\nUse this path when you already trust one seed paper and want to map the surrounding evidence.\n\n### 4. Retrieve Full Text And Figures\n\n![Full text retrieval flow](images/fulltext-retrieval-flow.svg)\n\n![Full text, figures, and biomedical image workflow](images/visual-evidence-workflow.svg)\n\nUse `get_fulltext` when abstracts are not enough. Prefer explicit identifiers such as `pmid=`, `pmcid=`, or `doi=` so the agent does not need to infer identifier type from a raw string. The full-text service follows an identifier-aware policy: Europe PMC XML when a PMCID is available, Unpaywall OA locations for DOI-backed articles, institutional direct/EZproxy when configured, CORE, then optional downloader/browser-session fallbacks. CrossRef is a metadata and publisher-link route, not a hosted full-text source.\n\nUse `get_article_figures` for PMC Open Access articles when the task needs captions, image URLs, or PDF links. Figure extraction depends on open-access availability; a missing figure result is not proof that the article has no figures.\n\nFor image-first work, use the visual tools as a two-step agent workflow:\n\n```text\nAnalyze this uploaded microscopy image with analyze_figure_for_search, extract English search terms, then search related papers and similar biomedical images.\n```\n\n`analyze_figure_for_search` accepts either an image URL or a base64/data-URI image supplied by the MCP client. It returns MCP `ImageContent` plus instructions for the agent to use its own vision capability, extract English biomedical terms, and continue with `search_biomedical_images` or `unified_search`. The server does not perform deep visual diagnosis by itself; the LLM agent performs the image interpretation step.\n\nUse `search_biomedical_images` when the query is already textual and the goal is open biomedical image evidence:\n\n```python\nsearch_biomedical_images(\"chest X-ray pneumonia\", sources=\"openi\", image_type=\"x\", limit=10)\nsearch_biomedical_images(\"histology liver fibrosis\", sources=\"openi\", image_type=\"mc\", license_type=\"by\")\n```\n\nOpen-i expects English medical terms. For non-English user prompts, ask the agent to translate the visual finding or anatomy into English first, then search.\n\nOptional browser fallback requires a separate local broker:\n\n```bash\nuv sync --extra browser-broker\nuv run playwright install chromium\nuv run python -c \"import secrets; print(secrets.token_urlsafe(32))\"\nuv run pubmed-browser-fetch-broker --token \"<same-random-32-byte-token>\"\n```\n\nCopy the generated value into both the broker command and MCP configuration;\nnever use a token copied from public documentation. The broker also enforces a\nloopback bind plus loopback Host and Origin headers.\n\nOnly enable browser-session fallback for hosts you trust and are allowed to access:\n\n```json\n{\n  \"enabled\": true,\n  \"auto_enabled\": true,\n  \"broker_url\": \"http://127.0.0.1:8766/fetch\",\n  \"token\": \"<same-random-32-byte-token>\",\n  \"allowed_hosts\": [\"jamanetwork.com\", \"*.jamanetwork.com\"]\n}\n```\n\n### 5. Build A Research Chronicle Or Lineage Tree\n\n![Research Chronicle Architecture and Lineage Flow](images/research-chronicle-lineage-flow.svg)\n![Evaluation and timeline workflow](images/timeline-evaluation-workflow.svg)\n\nUse the chronicle tools when the question is not just \"what papers exist?\" but \"how did this field develop?\"\n\n```python\n# 1. Build from topic (retrieves PubMed, scores landmarks, clusters lineages)\nbuild_research_chronicle(topic=\"remimazolam intraoperative\", output=\"mermaid\", max_events=30)\n\n# 2. Build from previous search results or explicit PMIDs\nbuild_research_chronicle(pmids=\"last\", topic=\"Selected studies\")\n\n# 3. Continue an existing chronicle (inherits stored topic and filters to produce Revision N+1)\nbuild_research_chronicle(chronicle_id=\"remimazolam-intraoperative-08c229f3\")\n\n# 4. Milestone analysis or cross-topic comparison\nread_research_chronicle(action=\"milestones\", chronicle_id=\"remimazolam-intraoperative-08c229f3\")\nread_research_chronicle(action=\"compare\", topics=\"remimazolam intraoperative,propofol intraoperative\")\n```\n\n`build_research_chronicle` can search by topic or use an explicit PMID set. Its primary axis is chronological and research branches are a secondary projection of the same entries. Use `output=\"mermaid\"` for the canonical horizontal year spine with observed research lines branching at their earliest dated papers in the retrieved scope, or `output=\"chronicle_map\"` for the same coordinate contract as JSON. Topic branches prefer MeSH descriptors and author keywords shared by multiple papers; singleton-only or insufficient signals produce a warned research-stage fallback. `timeline_mermaid` keeps the flat legacy diagram. Other outputs are `summary`, `timeline`, `tree`, `graph`, `evidence`, `milestones`, `mindmap`, `narrative`, and `json`. Use `options=\"context_graph\"` in `unified_search` only for a lightweight preview from the current ranked PMID-backed results. The chronicle is persistent and versioned; see [Advanced Research Workflows](#/advanced-workflows) and [Research Chronicle Rebuild Spec](#/research-chronicle-rebuild-spec).\n\nLineage is an explainable grouping of the retrieved snapshot, not causal ancestry. `earliest_observed_in_scope` does not establish the first publication in the field, and the query, PMID set, year filters, source availability, and result cap all constrain what can be observed. Date precision is retained: same-year or overlapping date intervals can be displayed deterministically, but do not create an inferred `precedes` or `supersedes` relationship.\n\nRevisions are immutable and appended atomically. `action=\"compare\"` resolves normalized exact stored-topic names; ambiguous same-name chronicles require explicit `chronicle_ids`, and duplicate targets are rejected. Build inputs are bounded (`max_events` 1–200, at most 500 unique explicit PMIDs, topic text up to 500 characters), and structured actions return structured errors. If enabled session artifact persistence fails after the Chronicle revision is saved, the response exposes the failure instead of returning a misleading locator.\n\nTopic year filters are applied by PubMed before bounded retrieval. The cap preserves the first and last observed papers, explicit landmarks, and temporal spread; audit output distinguishes `returned` from `available` and warns when coverage is capped or unknown. PubMed errors and zero-evidence results save no revision. Explicit PMID strings require positive ASCII digits (at most 20 digits), while PMID/DOI-based entry identity remains stable across date or classifier corrections. Records without a reliable date are labeled `Undated`, sort after dated entries, and do not expand the displayed year span. Diff absence is always `not_observed_in_revision` / `removed_from_view`, not proven retirement. Multi-signal papers retain one primary branch plus cross-links, with an overlap warning at 20%; landmark ranking never treats detection confidence as scientific importance. Artifact preflight checks the payload actually prepared for persistence.\n\nMermaid labels, IDs, parent links, cycles, duplicates, and visual size are repaired deterministically. If rich syntax is rejected, rendering falls back to safe and then minimal syntax. Inspect `mermaid_validation.json` for corrections, fallback tier, and omitted-item counts; the full coordinate data remains in `chronicle_map.json`.\n\n### 6. Reopen Persistent Query Memory\n\nWhen session persistence is configured through `PUBMED_DATA_DIR`, large reusable outputs from `unified_search` and `get_fulltext` are saved as artifacts. The immediate tool response includes a compact locator instead of forcing the agent to receive every token inline.\n\n```python\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_id=\"...\", artifact_file=\"payload.json\", offset=0, max_chars=200000)\n```\n\nLocal paths are redacted by default because remote clients cannot read the server filesystem. Set `PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true` only for local MCP clients that should receive `local_path` and `manifest_path`. Artifact reads never rerun the search; they read the persisted query/fulltext memory.\n\n### 7. Export Citations Or Local Notes\n\n![Export and local notes workflow](images/export-notes-workflow.svg)\n\nUse `prepare_export` for citation manager handoff. Official PubMed-backed formats are `ris`, `medline`, and `csl`; local rendered formats include `bibtex`, `csv`, and `json`.\n\nCommon examples:\n\n```python\nprepare_export(pmids=\"last\", format=\"ris\")\nprepare_export(pmids=\"last\", format=\"bibtex\", source=\"local\")\nprepare_export(pmids=\"last\", format=\"csl\")\n```\n\nUse `save_literature_notes` when the goal is a note library rather than a citation file:\n\n```python\nsave_literature_notes(pmids=\"last\")\nsave_literature_notes(pmids=\"last\", note_format=\"wiki\")\nsave_literature_notes(pmids=\"last\", note_format=\"medpaper\")\nsave_literature_notes(pmids=\"last\", output_dir=\"./references\")\n```\n\nThe default `note_format` is `wiki`. `unified_search` suggests `save_literature_notes(pmids=\"last\", note_format=\"wiki\")` for PMID-backed result sets, and the generated LLM wiki/Foam links use stable `[[stable-id|title]]` targets based on PMID, DOI, or PMCID instead of title-derived filenames. The response includes `wiki_validation` so agents can detect unresolved wikilinks before editing the note library.\n\nThe `output_dir` example and custom `template_file` are **local-mode features**.\nAn authenticated service caller cannot select a server-host path or read an\narbitrary template file. It omits both arguments, chooses a built-in\n`note_format`, and the server writes below that principal's isolated\n`references/` directory.\n\nIn local mode, directory resolution is:\n\n1. `output_dir`\n2. `PUBMED_NOTES_DIR`\n3. `PUBMED_WORKSPACE_DIR/references`\n4. `PUBMED_DATA_DIR/references`\n5. `~/.pubmed-search-mcp/references`\n\nLocal notes keep verified metadata in frontmatter and sidecar files, then leave summary, relevance, limitations, and follow-up sections editable.\n\n### 8. Save Repeatable Pipelines\n\n![Session and pipeline workflow](images/session-pipeline-workflow.svg)\n\nUse pipelines when a research process should be rerun or audited. Start with the [Pipeline Tutorial](#/pipeline-tutorial).\n\nTypical pipeline jobs:\n\n- rerun a search every week\n- keep a search strategy in versioned text\n- compare pipeline history across runs\n- schedule a recurring literature watch\n\nThe server exposes pipeline operations through `manage_pipeline` and compatibility tools such as `save_pipeline`, `load_pipeline`, `list_pipelines`, `delete_pipeline`, `get_pipeline_history`, and `schedule_pipeline`.\n\nSaved pipelines can be reused from search with `unified_search(pipeline=\"saved:<name>\")`. Pipeline `config` values should be YAML or JSON strings, and scheduled pipelines use standard five-field cron strings.\n\nRuntime boundary: local callers may use `workspace` scope and\n`load_pipeline(source=\"file:...\")`. Authenticated service callers use only their\ntenant-derived saved-pipeline store; it does not inherit the process-wide\nworkspace path, and `file:` sources are rejected. The service Compose profile\nalso disables the in-process scheduler. A service operator must use manual runs\nor design a single external leader/lease before enabling recurring execution.\n\n## Copilot Studio Notes\n\n![Client integration and deployment workflow](images/integration-deployment-workflow.svg)\n\nThere are two Copilot routes:\n\n- public primary MCP surface through authenticated `pubmed-search-mcp-http --mode service --transport streamable-http --copilot-compatible`\n- loopback-only schema smoke: a smaller 12-tool schema through `run_copilot.py`,\n  including primitive-schema `read_session` for search-run, replay-argument,\n  and artifact recovery\n\nOnly the full authenticated service is publishable. Use the simplified surface locally to inspect Copilot Studio schema compatibility, then return to the service launcher for any public endpoint; never tunnel `run_copilot.py`.\n\n## Ask The Agent Well\n\nGood prompts give the agent a task, a scope, and an output shape:\n\n```text\nFind recent systematic reviews about GLP-1 receptor agonists and cardiovascular outcomes in type 2 diabetes. Use PubMed Search MCP, show the search strategy, keep the result PMIDs in session, then export the final set as RIS.\n```\n\n```text\nBuild a citation tree for this seed PMID, separate direct references from citing papers, and identify which papers look like clinical guidelines, RCTs, or meta-analyses.\n```\n\n```text\nSave local wiki notes for the last result set. Use the default wiki format and include a collection-level CSL JSON sidecar.\n```\n\nAvoid vague requests such as \"find everything about cancer.\" Ask for population, intervention, outcome, date range, article type, or the decision you need to make.\n\n## Reliability Boundaries\n\nKeep these limits in mind:\n\n- Search results reflect external source behavior and available metadata.\n- Full text depends on open access, source APIs, publisher pages, and your configured credentials or browser session.\n- Citation counts and citation networks vary by provider and update cadence.\n- Generated summaries are agent interpretation. Bibliographic metadata and source links are the evidence anchor.\n- Commercial connectors should be default-off and credential-gated.\n- Clinical use requires domain review; this server helps gather evidence but does not decide care.\n\n## Troubleshooting First Steps\n\n| Symptom | First Check |\n| --- | --- |\n| Server does not start | Confirm `uvx pubmed-search-mcp` runs in a terminal. |\n| Client cannot find tools | Check the client config path and JSON syntax in [Integration Guide](#/troubleshooting). |\n| NCBI warning or slow responses | Set `NCBI_EMAIL`; optionally add `NCBI_API_KEY`. |\n| Tool call shows `Canceled: Canceled` while progress is updating | Use a build with non-cancelling best-effort progress callbacks; for genuinely long searches, retry with `options=\"shallow\"` or narrower `sources`. |\n| Empty or sparse full text | Try `get_fulltext` on a PMC Open Access article, then check source availability. |\n| A Chronicle Mermaid diagram is simplified or does not render in the client | Read `mermaid_validation.json`; use the pure `chronicle.mmd` source and inspect `chronicle_map.json` for any omitted visual items. |\n| Local notes saved somewhere unexpected | Check `output_dir`, `PUBMED_NOTES_DIR`, `PUBMED_WORKSPACE_DIR`, and `PUBMED_DATA_DIR`. |\n| Service rejects a note path, template, pipeline file, or workspace scope | Omit server-host paths; use built-in note formats and save pipelines by name in the authenticated tenant store. |\n| A scheduled pipeline is saved but does not run in service Compose | The service scheduler is intentionally disabled; run it manually or provide one external leader/lease. |\n| GitHub Pages docs look stale | Run `uv run python scripts/build_docs_site.py` locally, then check the Pages workflow. |\n\n## Where To Go Next\n\n- [Tools Usage Guide](#/tools-usage-guide): capability-first tool routing\n- [Pipeline Tutorial](#/pipeline-tutorial): saved and scheduled workflows\n- [Integration Guide](#/troubleshooting): client configuration and troubleshooting\n- [Deployment](#/deployment): HTTP, Docker, Copilot Studio, and Pages\n- [Developer Guide](#/developer-guide): architecture, contribution flow, and validation\n",
   "user-guide-zh": "<!-- Generated from docs/USER_GUIDE.zh-TW.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP 使用者指南\n\n這份指南給透過 VS Code、Claude Desktop、Claude Code、Cursor、Cline、Zed 或 Copilot Studio 使用 PubMed Search MCP 的使用者。它說明如何從研究問題一路走到可重用的證據輸出，而不是要求你背下所有 MCP tool。\n\n需要精確工具名稱時，再搭配 [工具使用指南](#/tools-usage-guide-zh) 與 [完整工具索引](#/quick-reference)。\n\n## 這個 Server 適合做什麼\n\nPubMed Search MCP 是面向 AI agent 的文獻研究 server。它最擅長的不是單次呼叫 PubMed，而是讓 AI client 規劃並執行一段 biomedical literature workflow。\n\n典型任務：\n\n- 把臨床或生醫問題轉成 PubMed 可用的搜尋策略\n- 透過 `unified_search` 搜尋多個學術來源\n- 追 seed paper、相關文章、引用文章、參考文獻與 citation tree\n- 在可用時取得全文、text-mined terms、文章圖表與 open-access image links\n- 匯出引用檔或保存本機 Markdown/wiki notes\n- 保存、檢視、重跑或排程可重複的研究 pipeline\n\n它不取代人的判讀、機構授權政策、systematic review protocol 設計，也不提供臨床決策。\n\n## 設定檢查表\n\n最低限度本機啟動：\n\n```bash\nuvx pubmed-search-mcp\n```\n\n最低必要環境變數：\n\n```bash\nNCBI_EMAIL=your@email.com\n```\n\n`NCBI_EMAIL` 是 NCBI API policy 需要的使用者識別。需要較高 NCBI rate limit 時再加 `NCBI_API_KEY`。其他來源的 key 只有在你使用那些來源時才需要。\nOpenAlex、CrossRef 與 Unpaywall 會重用 runtime server contact email；若需要覆寫再設定 `OPENALEX_API_KEY`、`CROSSREF_EMAIL` 或 `UNPAYWALL_EMAIL`。\n\n常見可選值：\n\n```bash\nNCBI_API_KEY=your_ncbi_api_key\nCORE_API_KEY=your_core_api_key\nCROSSREF_EMAIL=your@email.com      # 選填覆寫；預設使用 server/NCBI email\nUNPAYWALL_EMAIL=your@email.com     # 選填覆寫；預設使用 server/NCBI email\nPUBMED_NOTES_DIR=/path/to/references\n```\n\n各 client 的設定方式請看 [整合指南](#/troubleshooting)。HTTP、Docker、Copilot Studio 與 GitHub Pages 部署請看 [部署文件](#/deployment)。\n\n## 先選對路徑\n\n![PubMed Search MCP 研究工作流](images/research-workflow.svg)\n\n| 目標 | 從這裡開始 | 接著使用 |\n| --- | --- | --- |\n| 快速找文獻 | `unified_search` | `fetch_article_details`, `read_session` |\n| 臨床問題 | Agent 抽出 P/I/C/O 後呼叫 `parse_pico` | `generate_search_queries`, `unified_search` |\n| 改善太吵或太窄的 query | `analyze_search_query` | `generate_search_queries`, `unified_search` |\n| 從重要文章往外探索 | `fetch_article_details` | `find_related_articles`, `find_citing_articles`, `get_article_references`, `build_citation_tree` |\n| 閱讀更深層證據 | `get_fulltext` | `get_text_mined_terms`, `get_article_figures` |\n| 從視覺證據搜尋 | `analyze_figure_for_search` | `search_biomedical_images`, `unified_search` |\n| 建立研究編年史 / 脈絡樹 | `build_research_chronicle` | `read_research_chronicle` |\n| 重新讀取大型輸出 | `read_session(action=\"artifact\")` | `read_session(action=\"list_artifacts\")` |\n| 建立本機文獻庫 | `prepare_export` | `save_literature_notes` |\n| 重用工作流 | `manage_pipeline` | `save_pipeline`, `load_pipeline`, `schedule_pipeline` |\n\n最重要的規則是：先看研究意圖，不要先看工具清單。\n\n`unified_search` 的參數刻意設計成 agent-friendly strings。`sources`、`filters` 與 `options` 請使用 comma-separated values，不要傳 JSON object。例如：`sources=\"auto\"`、`sources=\"auto,-semantic_scholar\"`、`filters=\"year:2020-, clinical:therapy\"` 或 `options=\"counts_first,context_graph\"`。\n\n## 日常工作流\n\n### 1. 先廣後窄\n\n![搜尋與查詢智能流程](images/search-query-workflow.svg)\n\n可以要求 client 先做中等大小的第一輪搜尋：\n\n```text\nUse PubMed Search MCP to search for recent literature on SGLT2 inhibitors and heart failure with preserved ejection fraction. Start with a broad search, show the query strategy, and keep the result set in session.\n```\n\nAgent 通常應該從 `unified_search` 開始。好的結果會包含使用的 query、article identifiers、source provenance，以及足夠判斷是否要 fetch details 或 refine 的 metadata。\n\n後續處理請優先使用 `read_session` 或 `get_session_pmids`。不要要求模型在對話裡記住一長串 PMID。\n\n### 2. 臨床問題用 PICO\n\n臨床比較問題先做 PICO：\n\n```text\n請先抽出 P/I/C/O，用 parse_pico 驗證 handoff，提出 PubMed 搜尋 query，然後執行最精準的一個：\n在成人第二型糖尿病合併 CKD 病人中，SGLT2 inhibitors 相較 placebo 是否能降低 heart failure hospitalization？\n```\n\n預期流程：\n\n1. Agent 從使用者的臨床問題抽出 P/I/C/O。\n2. `parse_pico(description=..., p=..., i=..., c=..., o=...)` 驗證 schema 並回傳 `template: pico` pipeline。\n3. 可選：用 `generate_search_queries` 將 P/I/C/O 擴展成 MeSH/同義詞 fragments。\n4. `unified_search` 執行回傳的 PICO pipeline，或執行 agent 組好的 Boolean query。\n5. 如果第一個 query 太廣或太窄，可再用 `analyze_search_query`。\n\nServer 能驗證 PICO handoff、建立後端 PICO 搜尋計畫，並協助 MeSH、同義詞與 ICD-to-MeSH 擴展；語意上的 PICO 抽取仍由 agent 負責，agent 也應說明為什麼選擇最後執行的 query。\n\n### 3. 從 Seed Paper 探索\n\n![論文探索與引用流程](images/discovery-citation-workflow.svg)\n\n有重要 PMID 之後，從搜尋切換到探索：\n\n```text\nFor PMID 12345678, fetch details, then find related papers, citing papers, and key references. Summarize why each group matters.\n```\n\n常用工具：\n\n- `fetch_article_details`\n- `find_related_articles`\n- `find_citing_articles`\n- `get_article_references`\n- `build_citation_tree`\n- `get_citation_metrics`\n\n當你已經相信某篇 seed paper 值得追，這條路徑可以快速建立周邊證據地圖。\n\n### 4. 取得全文與圖表\n\n![全文擷取流程](images/fulltext-retrieval-flow.svg)\n\n![全文、圖表與生醫圖片流程](images/visual-evidence-workflow.svg)\n\n摘要不夠時使用 `get_fulltext`。建議使用明確 identifiers，例如 `pmid=`、`pmcid=` 或 `doi=`，避免 agent 從 raw string 推測 identifier type。全文服務會依 identifier-aware policy 選路徑：有 PMCID 時先走 Europe PMC XML；DOI 文章會查 Unpaywall OA locations；依設定嘗試 institutional direct/EZproxy；再落到 CORE、optional downloader 與 browser-session fallback。CrossRef 是 metadata / publisher-link route，不是全文主機。\n\n需要 captions、image URLs 或 PDF links 時，對 PMC Open Access 文章使用 `get_article_figures`。圖表擷取取決於 open-access availability；沒有結果不代表文章一定沒有圖。\n\n圖片優先的任務請把視覺工具當成兩段式 agent workflow：\n\n```text\n請用 analyze_figure_for_search 分析這張上傳的 microscopy image，抽出英文搜尋詞，接著搜尋相關論文與相似 biomedical images。\n```\n\n`analyze_figure_for_search` 可接受 MCP client 提供的 image URL 或 base64/data-URI image。它會回傳 MCP `ImageContent` 加上給 agent 的指令，讓 agent 用自己的 vision capability 解讀圖片、抽出英文 biomedical terms，然後接續呼叫 `search_biomedical_images` 或 `unified_search`。Server 本身不做深度視覺診斷；圖片語意判讀由 LLM agent 負責。\n\n如果已經有文字化的視覺 finding，就直接用 `search_biomedical_images` 找 open biomedical image evidence：\n\n```python\nsearch_biomedical_images(\"chest X-ray pneumonia\", sources=\"openi\", image_type=\"x\", limit=10)\nsearch_biomedical_images(\"histology liver fibrosis\", sources=\"openi\", image_type=\"mc\", license_type=\"by\")\n```\n\nOpen-i 需要英文醫學詞。非英文使用者提示應先由 agent 翻譯成英文 anatomy / finding / modality，再搜尋。\n\nBrowser fallback 需要另外啟動本機 broker：\n\n```bash\nuv sync --extra browser-broker\nuv run playwright install chromium\nuv run python -c \"import secrets; print(secrets.token_urlsafe(32))\"\nuv run pubmed-browser-fetch-broker --token \"<same-random-32-byte-token>\"\n```\n\n請把產生的值同時填入 broker 命令與 MCP 設定，絕不要直接沿用公開文件中的 token。\nBroker 也會強制 loopback bind，並驗證 loopback Host 與 Origin。\n\n只對你信任且有權存取的 host 啟用 browser-session fallback：\n\n```json\n{\n  \"enabled\": true,\n  \"auto_enabled\": true,\n  \"broker_url\": \"http://127.0.0.1:8766/fetch\",\n  \"token\": \"<same-random-32-byte-token>\",\n  \"allowed_hosts\": [\"jamanetwork.com\", \"*.jamanetwork.com\"]\n}\n```\n\n### 5. 建立研究脈絡年表\n\n![Research Chronicle 架構與脈絡流程](images/research-chronicle-lineage-flow.svg)\n![評估與時間軸流程](images/timeline-evaluation-workflow.svg)\n\n當問題不是「有哪些文章？」而是「這個領域怎麼演進？」時，使用 chronicle tools。\n\n```python\n# 1. 依主題建立（自動檢索 PubMed、計算 Landmark 分數並聚類分支）\nbuild_research_chronicle(topic=\"remimazolam intraoperative\", output=\"mermaid\", max_events=30)\n\n# 2. 從既有搜尋結果或自訂 PMID 清單建立\nbuild_research_chronicle(pmids=\"last\", topic=\"Selected studies\")\n\n# 3. 延續既有編年史（自動繼承前版的 topic 與檢索範圍，建立 Revision N+1）\nbuild_research_chronicle(chronicle_id=\"remimazolam-intraoperative-08c229f3\")\n\n# 4. 讀取里程碑分析或多主題比較\nread_research_chronicle(action=\"milestones\", chronicle_id=\"remimazolam-intraoperative-08c229f3\")\nread_research_chronicle(action=\"compare\", topics=\"remimazolam intraoperative,propofol intraoperative\")\n```\n\n`build_research_chronicle` 可以依 topic 搜尋，也可以使用明確 PMID set。主軸是時序，分支 (lineage) 是同一組 entries 的次要投影。`output=\"mermaid\"` 是標準圖：年份構成橫向主軸，各觀察研究線從本次檢索範圍內最早的有日期論文所在年份分岔；`output=\"chronicle_map\"` 則回傳同一座標契約的 JSON。主題分支優先使用多篇論文共同出現的 MeSH descriptor 與作者 keyword；只有 singleton 或語意訊號不足時，audit 會明確標示為研究階段 fallback。`timeline_mermaid` 保留舊的平面圖。其他輸出包括 `summary`、`timeline`、`tree`、`graph`、`evidence`、`milestones`、`mindmap`、`narrative` 與 `json`。`unified_search(options=\"context_graph\")` 只適合本次 PMID-backed ranked results 的輕量預覽。chronicle 本身已持久化且版本化，詳見 [進階研究工作流](#/advanced-workflows-zh) 與 [Research Chronicle Rebuild Spec](#/research-chronicle-rebuild-spec)。\n\nLineage 是本次 retrieved snapshot 的可解釋分組，不是因果祖譜。`earliest_observed_in_scope` 不代表找到整個領域的首篇論文；query、PMID set、年份 filter、來源可用性與結果上限都會限制可觀察範圍。日期 precision 會保留：同年或日期區間重疊的項目可以固定顯示順序，但不會據此推論 `precedes` 或 `supersedes` 關係。\n\nRevision 不可變，並以原子操作追加。`action=\"compare\"` 使用正規化後的完整 stored-topic 名稱；同名對應多個 Chronicle 時必須明確傳 `chronicle_ids`，重複目標會拒絕。Build input 有界限（`max_events` 1–200、明確 PMID 最多 500 個 unique values、topic 最多 500 字元），structured actions 的錯誤也維持結構化。啟用的 session artifact persistence 若在 revision 保存後失敗，回應會揭露失敗，不會回傳誤導性的 locator。\n\nTopic 年份 filter 會先由 PubMed 套用，再進行有界檢索。輸出上限會保留觀察到的首篇、末篇、明確 landmark 與時間分散度；audit 會區分 `returned` 和 `available`，並在 coverage 受限或總量未知時警告。PubMed error 或零篇 evidence 不會保存 revision。明確 PMID 字串只接受正 ASCII 數字且最多 20 位；PMID／DOI evidence identity 則讓 entry ID 在日期或分類修正後保持穩定。沒有可靠日期的記錄標示為 `Undated`、排列在 dated entries 之後，且不擴張顯示的年份範圍。diff 中缺席一律是 `not_observed_in_revision`／`removed_from_view`，不是已證實退場。多訊號論文保留一個 primary branch 加 cross-links，重疊達 20% 會警告；landmark ranking 不會把 detection confidence 當成科學重要性。Artifact preflight 檢查的是實際準備持久化的 payload。\n\nMermaid label、ID、parent link、循環、重複項目與圖形大小都會做 deterministic 修正；rich syntax 被拒絕時，會依序降級為 safe 與 minimal。請從 `mermaid_validation.json` 查看 correction、fallback tier 與 omitted count；完整座標資料仍保存在 `chronicle_map.json`。\n\n### 6. 重新讀取持久化 Query Memory\n\n當透過 `PUBMED_DATA_DIR` 設定 session persistence 時，`unified_search` 與 `get_fulltext` 的大型可重用輸出會保存成 artifact。即時 tool response 只放精簡 locator，不強迫 agent 一次吃完整 token。\n\n```python\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_id=\"...\", artifact_file=\"payload.json\", offset=0, max_chars=200000)\n```\n\nLocal paths 預設會被遮蔽，因為 remote clients 不能讀 MCP server host filesystem。只有本機 MCP client 真的需要 `local_path` 與 `manifest_path` 時，才設定 `PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true`。Artifact read 不會重跑搜尋；它只讀已保存的 query/fulltext memory。\n\n### 7. 匯出引用或本機筆記\n\n![匯出與本機筆記流程](images/export-notes-workflow.svg)\n\n要交給 citation manager 時使用 `prepare_export`。Official PubMed-backed formats 是 `ris`、`medline` 與 `csl`；local rendered formats 包含 `bibtex`、`csv` 與 `json`。\n\n常見範例：\n\n```python\nprepare_export(pmids=\"last\", format=\"ris\")\nprepare_export(pmids=\"last\", format=\"bibtex\", source=\"local\")\nprepare_export(pmids=\"last\", format=\"csl\")\n```\n\n如果目標是 note library，而不是單一引用檔，使用 `save_literature_notes`：\n\n```python\nsave_literature_notes(pmids=\"last\")\nsave_literature_notes(pmids=\"last\", note_format=\"wiki\")\nsave_literature_notes(pmids=\"last\", note_format=\"medpaper\")\nsave_literature_notes(pmids=\"last\", output_dir=\"./references\")\n```\n\n預設 `note_format` 是 `wiki`。`unified_search` 對 PMID-backed result set 會主動建議 `save_literature_notes(pmids=\"last\", note_format=\"wiki\")`；產生的 LLM wiki/Foam links 會使用 PMID、DOI、PMCID 等穩定 identifier 作為 `[[stable-id|title]]` target，而不是從 title 產生檔名。回應也會包含 `wiki_validation`，讓 agent 在編輯 note library 前先檢查 unresolved wikilinks。\n\n`output_dir` 範例與自訂 `template_file` 都是**本機模式能力**。認證 service\ncaller 不能選擇 server host path，也不能讀取任意 template file；應省略這兩個\narguments、選擇內建 `note_format`，由 server 寫入該 principal 隔離的\n`references/` 目錄。\n\n本機模式的輸出目錄解析順序：\n\n1. `output_dir`\n2. `PUBMED_NOTES_DIR`\n3. `PUBMED_WORKSPACE_DIR/references`\n4. `PUBMED_DATA_DIR/references`\n5. `~/.pubmed-search-mcp/references`\n\n本機筆記會把可驗證 metadata 放在 frontmatter 與 sidecar files，summary、relevance、limitations、follow-up sections 則保留給人或 agent 編輯。\n\n### 8. 保存可重跑 Pipeline\n\n![Session 與 Pipeline 流程](images/session-pipeline-workflow.svg)\n\n當研究流程需要重跑或稽核時使用 pipeline。先從 [Pipeline 教學](#/pipeline-tutorial-zh) 開始。\n\n典型 pipeline 任務：\n\n- 每週重跑一次搜尋\n- 用文字版本控管搜尋策略\n- 比較不同 run 的 pipeline history\n- 排程 recurring literature watch\n\nServer 透過 `manage_pipeline` 暴露主要 pipeline operations，也保留 `save_pipeline`、`load_pipeline`、`list_pipelines`、`delete_pipeline`、`get_pipeline_history` 與 `schedule_pipeline` 等相容工具。\n\nSaved pipelines 可以透過 `unified_search(pipeline=\"saved:<name>\")` 重用。Pipeline `config` 應是 YAML 或 JSON string；scheduled pipeline 使用標準 five-field cron string。\n\nRuntime 邊界：本機 caller 可使用 `workspace` scope 與\n`load_pipeline(source=\"file:...\")`。認證 service caller 只使用 tenant-derived saved-pipeline\nstore；它不繼承 process-wide workspace path，並會拒絕 `file:` source。Service Compose\n也預設停用 in-process scheduler；在啟用 recurring execution 前，維運者必須改用手動\nrun，或設計單一 external leader/lease。\n\n## Copilot Studio 注意事項\n\n![Client integration and deployment workflow](images/integration-deployment-workflow.svg)\n\nCopilot 有兩條路：\n\n- 可公開的 primary MCP surface：透過 authenticated `pubmed-search-mcp-http --mode service --transport streamable-http --copilot-compatible`\n- 僅 loopback 的 schema smoke：透過 `run_copilot.py` 檢查較小的 12-tool schema，\n  其中 primitive-schema `read_session` 可回讀 search run、replay arguments 與 artifact\n\n只有完整 authenticated service 可以公開。簡化工具面僅供本機檢查 Copilot Studio schema compatibility；任何 public endpoint 都必須回到 service launcher，禁止 tunnel `run_copilot.py`。\n\n## 怎樣問 Agent 比較好\n\n好的 prompt 會給任務、範圍與輸出形狀：\n\n```text\n請找第二型糖尿病中 GLP-1 receptor agonists 與 cardiovascular outcomes 的近期 systematic reviews。使用 PubMed Search MCP，顯示搜尋策略，把結果 PMID 保存在 session，最後將篩選後集合匯出成 RIS。\n```\n\n```text\n請針對這個 seed PMID 建立 citation tree，分開 direct references 與 citing papers，並標出哪些文章看起來像 clinical guidelines、RCTs 或 meta-analyses。\n```\n\n```text\n請把上一輪結果保存成本機 wiki notes。使用預設 wiki format，並包含 collection-level CSL JSON sidecar。\n```\n\n避免只說「find everything about cancer」。請補上 population、intervention、outcome、date range、article type，或你想支援的決策。\n\n## 可靠性邊界\n\n請記住：\n\n- 搜尋結果取決於外部來源行為與可用 metadata。\n- 全文取決於 open access、source APIs、publisher pages，以及你設定的 credentials 或 browser session。\n- Citation counts 與 citation networks 會因 provider 與更新節奏不同而變動。\n- Generated summaries 是 agent interpretation；bibliographic metadata 與 source links 才是證據錨點。\n- Commercial connectors 應維持 default-off，並由 credentials gate。\n- 臨床用途需要專業審查；這個 server 協助收集證據，不做照護決策。\n\n## 疑難排解第一步\n\n| 症狀 | 先檢查 |\n| --- | --- |\n| Server 無法啟動 | 在 terminal 確認 `uvx pubmed-search-mcp` 能執行。 |\n| Client 找不到 tools | 檢查 [整合指南](#/troubleshooting) 中的 config path 與 JSON syntax。 |\n| NCBI warning 或速度慢 | 設定 `NCBI_EMAIL`；需要時加 `NCBI_API_KEY`。 |\n| 全文為空或很少 | 先對 PMC Open Access article 測 `get_fulltext`，再確認來源可用性。 |\n| Chronicle Mermaid 被簡化或 client 無法呈現 | 先讀 `mermaid_validation.json`；使用純 source 的 `chronicle.mmd`，並從 `chronicle_map.json` 檢查被省略的視覺項目。 |\n| 本機筆記存到非預期位置 | 檢查 `output_dir`、`PUBMED_NOTES_DIR`、`PUBMED_WORKSPACE_DIR` 與 `PUBMED_DATA_DIR`。 |\n| Service 拒絕 note path、template、pipeline file 或 workspace scope | 省略 server-host path；使用內建 note format，並以名稱存入 authenticated tenant store。 |\n| Service Compose 已保存 schedule 但沒有執行 | Service scheduler 刻意預設停用；請手動執行或提供單一 external leader/lease。 |\n| GitHub Pages 文件看起來沒更新 | 本機跑 `uv run python scripts/build_docs_site.py`，再看 Pages workflow。 |\n\n## 下一步\n\n- [工具使用指南](#/tools-usage-guide-zh)：能力導向工具路由\n- [Pipeline 教學](#/pipeline-tutorial-zh)：保存與排程工作流\n- [整合指南](#/troubleshooting)：client 設定與疑難排解\n- [部署文件](#/deployment)：HTTP、Docker、Copilot Studio 與 Pages\n- [開發者指南](#/developer-guide-zh)：架構、貢獻流程與驗證\n",
-  "advanced-workflows": "<!-- Generated from docs/ADVANCED_RESEARCH_WORKFLOWS.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# Advanced Research Workflows\n\nThis page provides a centralized, in-depth guide to the core advanced workflows\nin PubMed Search MCP: **Research Chronicle (Evolution & Lineage Trees)**,\n**Open-i Image Search**, **Uploaded-Image Handoff**, and **Persistent Query Memory**.\n\n## Quick Map\n\n| Need | Start here | Continue with |\n| --- | --- | --- |\n| See how a topic evolved, branched, and settled over time | `build_research_chronicle` | `read_research_chronicle` |\n| Find biomedical images from text (X-ray, histology, CT) | `search_biomedical_images` | `get_article_figures`, `unified_search` |\n| Upload or pass an image and search by its visual meaning | `analyze_figure_for_search` | `search_biomedical_images`, `unified_search` |\n| Re-open large search/fulltext outputs without rerunning | `read_session(action=\"artifact\")` | `read_session(action=\"list_artifacts\")` |\n\n---\n\n## Research Chronicle / Lineage Tree\n\n![Research Chronicle Architecture and Lineage Flow](images/research-chronicle-lineage-flow.svg)\n\n### 1. Core Principles & Epistemic Model\n\nTraditional literature search returns flat lists that cannot answer fundamental\nscientific questions such as: *\"How did this field evolve from early mechanisms\nto modern clinical practice?\"*, *\"Where were the landmark paradigm shifts?\"*,\nand *\"What has changed since my last search?\"*.\n\n**Research Chronicle** is PubMed Search MCP's versioned research evolution system:\n\n- **Chronological Time Spine (X-axis)**: Publication years form the horizontal\n  backbone, ordering scientific milestones chronologically.\n- **Thematic Lineage Branches (Y-axis)**: Distinct research lines are\n  automatically clustered from shared MeSH descriptors and author keywords,\n  branching off from the year of their earliest observed paper.\n- **Single Source of Truth**: All projections (time spine, lineage tree,\n  mindmap, Mermaid diagrams, narrative Markdown, and JSON) originate from the\n  same `ChronicleSnapshot`, ensuring mutual consistency. For a lightweight preview\n  inside a normal search response, use `unified_search(options=\"context_graph\")`\n  (which generates a preview from the current PMID-backed ranked set rather than a full persisted chronicle).\n- **Immutable Versioned Storage**: Each update or continuation atomically\n  appends `Revision N+1`, enabling precise longitudinal diffing.\n- **Epistemic Rigor**: Missing papers in later revisions are classified as\n  `not_observed_in_revision` (absence is not retirement); each snapshot is\n  backed by an automated completeness audit.\n\n![Evaluation and Timeline Workflow](images/timeline-evaluation-workflow.svg)\n\n---\n\n### 2. Dual Tool Facades & Output Modes\n\n#### 🛠️ `build_research_chronicle` — Create or Continue a Chronicle\n\n```python\n# 1. Build from topic (retrieves PubMed, scores landmarks, clusters lineages)\nbuild_research_chronicle(topic=\"remimazolam intraoperative\", max_events=30)\n\n# 2. Build from previous search results or explicit PMIDs\nbuild_research_chronicle(pmids=\"last\", topic=\"My Reading List\")\nbuild_research_chronicle(pmids=\"32417976,34999964,36712948\", topic=\"Selected Studies\")\n\n# 3. Continue an existing chronicle (inherits stored topic and filters to produce Revision N+1)\nbuild_research_chronicle(chronicle_id=\"remimazolam-intraoperative-08c229f3\")\n```\n\n#### 📖 `read_research_chronicle` — Read, Diff, and Analyze Stored Evidence\n\n| Action | Purpose | Example |\n| --- | --- | --- |\n| `load` | Load a stored revision in any format (defaults to latest) | `read_research_chronicle(chronicle_id=\"...\", output=\"mermaid\")` |\n| `list` | List all persisted chronicles with latest revision IDs | `read_research_chronicle(action=\"list\")` |\n| `diff` | Compare two revisions (added, unobserved, role shifts, audit) | `read_research_chronicle(action=\"diff\", chronicle_id=\"...\", from_revision=1)` |\n| `milestones` | Diagnostic overview of milestone types, years, and landmark scores | `read_research_chronicle(action=\"milestones\", chronicle_id=\"...\")` |\n| `compare` | Compare 2–5 topics side-by-side with shared evidence analysis | `read_research_chronicle(action=\"compare\", topics=\"remimazolam,propofol\")` |\n| `narrate` | Render evidence-backed Markdown with citations for writing/reporting | `read_research_chronicle(action=\"narrate\", chronicle_id=\"...\", mode=\"full\")` |\n\n#### 🎨 12 Supported Output Formats (`output` parameter)\n\n| Output Format | Type | Description |\n| --- | :---: | --- |\n| `summary` | Markdown | Default compact summary with chronological spine, research lines, and highlights. |\n| `mermaid` | Diagram | **Canonical X-Y lineage tree**. Horizontal year spine + branching research lines + article blocks. |\n| `mindmap` | Diagram | **Research lineage mindmap**. Radial Mermaid mindmap diagram. |\n| `timeline_mermaid` | Diagram | Flat legacy Mermaid timeline syntax. |\n| `chronicle_map` | JSON | Complete diagram coordinate contract for custom frontend renderers. |\n| `timeline` | JSON | Chronological projection JSON ordered strictly by publication date. |\n| `tree` | JSON | Thematic lineage tree JSON organized into branch and sub-branch hierarchies. |\n| `graph` | JSON | Typed provenance graph (Topic → Branch → Entry → EvidenceArticle). |\n| `evidence` | JSON | Deduplicated evidence articles with per-source counts. |\n| `milestones` | JSON | Milestone distributions, year spread, citation metrics, and landmark rankings. |\n| `narrative` | Markdown | Academic prose narrative with inline PMID/DOI citations. |\n| `json` | JSON | Complete immutable snapshot dictionary. |\n\n---\n\n### 3. Concrete Example: Remimazolam Intraoperative Lineage\n\nThe following diagrams illustrate the research evolution of **Remimazolam in intraoperative anesthesia and sedation** (2020–2026):\n\n#### Example 1: X-Axis Time Spine + Y-Axis Lineage Branches (`output=\"mermaid\"`)\n\n```mermaid\nflowchart LR\n    n_topic[\"Topic: Remimazolam Intraoperative Anesthesia (2020-2026)\"]\n\n    %% X-axis Time Spine\n    n_y2020[\"Year 2020\"]\n    n_y2021[\"Year 2021\"]\n    n_y2022[\"Year 2022\"]\n    n_y2023[\"Year 2023\"]\n    n_y2024[\"Year 2024\"]\n    n_y2025[\"Year 2025\"]\n    n_y2026[\"Year 2026\"]\n\n    n_topic ==> n_y2020\n    n_y2020 --> n_y2021\n    n_y2021 --> n_y2022\n    n_y2022 --> n_y2023\n    n_y2023 --> n_y2024\n    n_y2024 --> n_y2025\n    n_y2025 --> n_y2026\n\n    %% Y-axis Research Lineage Branches\n    b_propofol[\"Branch: Propofol Comparator & Hemodynamics (24 entries)\"]\n    b_remi[\"Branch: Remimazolam Clinical Trials & Indications (3 entries)\"]\n    b_general[\"Branch: General Anesthesia & Complex Surgery (5 entries)\"]\n    b_sedatives[\"Branch: Sedation Depth & Neuromonitoring (6 entries)\"]\n    b_benzo[\"Branch: Benzodiazepines & Reversal (2 entries)\"]\n\n    %% Branch points at earliest observed year\n    n_y2020 --> b_propofol\n    n_y2021 --> b_remi\n    n_y2022 --> b_sedatives\n    n_y2024 --> b_general\n    n_y2025 --> b_benzo\n\n    %% Key Entry Blocks\n    e_2020_phase2[\"[2020-08] Phase 2/3 Trial (PMID: 32417976)<br/>Doi et al. Non-inferior efficacy to propofol, significantly less hypotension\"]\n    e_2021_cardiac[\"[2021-03] Case Study (PMID: 33677710)<br/>Cardiopulmonary bypass cardiac surgery exploration\"]\n    e_2022_sedation[\"[2022-04] Observational Study (PMID: 34999964)<br/>EEG/BIS depth of sedation monitoring indices\"]\n    e_2023_delirium[\"[2023-01] Safety Alert / RCT (PMID: 36712948)<br/>Postoperative delirium reduction in elderly orthopedics\"]\n    e_2023_sleep[\"[2023-08] RCT (PMID: 37055671)<br/>Improved postoperative sleep quality after joint replacement\"]\n    e_2024_rct[\"[2024-03] RCT (PMID: 38541158)<br/>Hemodynamic stability in laparoscopic & thoracoscopic surgery\"]\n    e_2024_meta[\"[2024-07] Meta-Analysis (PMID: 39069837)<br/>Safety meta-analysis across complex surgical procedures\"]\n    e_2025_sr[\"[2025-01] Systematic Review (PMID: 39832842)<br/>Perioperative neurocognitive disorders & organ protection\"]\n    e_2025_tavi[\"[2025-03] RCT (PMID: 39715979)<br/>Transcatheter aortic valve implantation (TAVI) vs sevoflurane\"]\n    e_2026_seizure[\"[2026] Clinical Cohort (PMID: 42299573)<br/>Intraoperative seizure incidence during awake craniotomy\"]\n\n    %% Connect entries to branches and years\n    b_propofol --> e_2020_phase2\n    b_remi --> e_2021_cardiac\n    b_sedatives --> e_2022_sedation\n    b_propofol --> e_2023_delirium\n    b_remi --> e_2023_sleep\n    b_propofol --> e_2024_rct\n    b_propofol --> e_2024_meta\n    b_propofol --> e_2025_sr\n    b_general --> e_2025_tavi\n    b_sedatives --> e_2026_seizure\n\n    n_y2020 -.-> e_2020_phase2\n    n_y2021 -.-> e_2021_cardiac\n    n_y2022 -.-> e_2022_sedation\n    n_y2023 -.-> e_2023_delirium\n    n_y2024 -.-> e_2024_meta\n    n_y2025 -.-> e_2025_tavi\n    n_y2026 -.-> e_2026_seizure\n\n    %% Styles\n    classDef topic fill:#0f172a,color:#ffffff,stroke:#0f172a,stroke-width:2px;\n    classDef spine fill:#dbeafe,color:#1e3a8a,stroke:#2563eb,stroke-width:2px;\n    classDef branch fill:#ecfeff,color:#164e63,stroke:#0891b2,stroke-width:2px;\n    classDef event fill:#ffffff,color:#111827,stroke:#94a3b8,stroke-width:1px;\n    classDef landmark fill:#fef3c7,color:#92400e,stroke:#f59e0b,stroke-width:2px;\n\n    class n_topic topic;\n    class n_y2020,n_y2021,n_y2022,n_y2023,n_y2024,n_y2025,n_y2026 spine;\n    class b_propofol,b_remi,b_general,b_sedatives,b_benzo branch;\n    class e_2021_cardiac,e_2022_sedation,e_2023_delirium,e_2023_sleep,e_2024_rct,e_2025_tavi,e_2026_seizure event;\n    class e_2020_phase2,e_2024_meta,e_2025_sr landmark;\n```\n\n---\n\n#### Example 2: Research Lineage Mindmap (`output=\"mindmap\"`)\n\n```mermaid\nmindmap\n  root[\"Remimazolam Intraoperative Lineage\"]\n    branch_propofol[\"Propofol Comparator Line\"]\n      entry_p1[\"2020 — Phase 2b/3 Landmark Trial (PMID: 32417976)\"]\n      entry_p2[\"Hemodynamics: Significant hypotension reduction\"]\n      entry_p3[\"Injection site pain virtually eliminated\"]\n      entry_p4[\"2024-2025 Multicenter Meta-Analyses\"]\n    branch_neuro[\"Depth of Sedation & Neurocognitive\"]\n      entry_n1[\"EEG / BIS spectral index characteristics\"]\n      entry_n2[\"Postoperative delirium incidence reduction\"]\n      entry_n3[\"Perioperative neurocognitive disorder (PND) mitigation\"]\n    branch_cardio[\"Cardiovascular & Complex Surgery\"]\n      entry_c1[\"Transcatheter aortic valve implantation (TAVI)\"]\n      entry_c2[\"Coronary artery bypass grafting (CABG)\"]\n      entry_c3[\"High-risk critical illness general anesthesia\"]\n    branch_antidote[\"Emergence & Flumazenil Reversal\"]\n      entry_a1[\"Flumazenil specific rapid reversal capability\"]\n      entry_a2[\"Emergence agitation evaluation\"]\n      entry_a3[\"Tissue carboxylesterase-1 (CES-1) rapid hydrolysis\"]\n```\n\n---\n\n#### Example 3: Landmark Paper Bidirectional Citation Tree (`build_citation_tree`)\n\nGrounded on the foundational 2020 trial by **Doi et al. (PMID: 32417976)**:\n\n```mermaid\ngraph TD\n    %% Root Paper\n    pmid_32417976([\"<b>Doi Matsuyuki et al. (2020)</b><br/>Efficacy & safety of remimazolam vs propofol<br/>[PMID: 32417976 | Phase IIb/III Trial]\"])\n\n    %% Forward Citations (Latest Clinical Implementations)\n    pmid_42225960[\"Ni et al. (2026)<br/>Weight-based dose scaling comparison\"]\n    pmid_41987344[\"Kimura et al. (2026)<br/>Pediatric sedation and anesthesia\"]\n    pmid_41954614[\"Morimoto et al. (2026)<br/>Effect-site concentration monitoring (Ce)\"]\n    pmid_41926002[\"Kotani et al. (2026)<br/>Postoperative hemodynamic stability\"]\n\n    %% Backward References (Pharmacological Foundation)\n    pmid_23653886(\"Chitilian et al. (2013)<br/>Novel esterase-cleaved anesthetic development\")\n    pmid_10215689(\"Tuk et al. (1999)<br/>GABAA pharmacodynamic modeling\")\n    pmid_22531340(\"Egan et al. (2012)<br/>Metabolically labile sedative architectures\")\n\n    %% Edges\n    pmid_42225960 --> pmid_32417976\n    pmid_41987344 --> pmid_32417976\n    pmid_41954614 --> pmid_32417976\n    pmid_41926002 --> pmid_32417976\n\n    pmid_32417976 --> pmid_23653886\n    pmid_32417976 --> pmid_10215689\n    pmid_23653886 --> pmid_22531340\n\n    %% Styles\n    style pmid_32417976 fill:#e74c3c,stroke:#c0392b,stroke-width:3px,color:#fff\n    style pmid_42225960 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_41987344 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_41954614 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_41926002 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_23653886 fill:#2ecc71,stroke:#27ae60,color:#fff\n    style pmid_10215689 fill:#2ecc71,stroke:#27ae60,color:#fff\n    style pmid_22531340 fill:#2ecc71,stroke:#27ae60,color:#fff\n```\n\n---\n\n#### Example 4: Topic-to-Topic Comparison (`action=\"compare\"`)\n\nComparing `remimazolam intraoperative` (2020–2026) with `propofol intraoperative` (1991–2026):\n\n```json\n{\n  \"projection\": \"comparison\",\n  \"summary\": {\n    \"earliest_research\": 1991,\n    \"latest_research\": 2026,\n    \"shared_evidence_count\": 7\n  },\n  \"shared_evidence\": [\n    { \"evidence_id\": \"pmid:32417976\", \"shared_by\": [\"remimazolam\", \"propofol\"] },\n    { \"evidence_id\": \"pmid:36712948\", \"shared_by\": [\"remimazolam\", \"propofol\"] },\n    { \"evidence_id\": \"pmid:38494158\", \"shared_by\": [\"remimazolam\", \"propofol\"] },\n    { \"evidence_id\": \"pmid:39832842\", \"shared_by\": [\"remimazolam\", \"propofol\"] }\n  ]\n}\n```\n\n---\n\n## Open-i Biomedical Image Search\n\nUse `search_biomedical_images` when the visual finding is already text and the\ngoal is image evidence from Open-i.\n\n```python\nsearch_biomedical_images(\"chest X-ray pneumonia\", sources=\"openi\", image_type=\"x\", limit=10)\nsearch_biomedical_images(\"histology liver fibrosis\", sources=\"openi\", image_type=\"mc\", license_type=\"by\")\n```\n\nOpen-i expects English medical terminology. For non-English prompts, the agent\nshould first translate anatomy, finding, and modality into English, then call\n`search_biomedical_images`. Open-i is strongest for radiology, microscopy,\nclinical photos, and teaching images; for article-native figures, use\n`get_article_figures` on PMC Open Access articles.\n\n---\n\n## Uploaded Image To Literature Search\n\n`analyze_figure_for_search` is the handoff tool for images supplied by an MCP\nclient. It accepts an image URL or a base64/data-URI image and returns MCP\n`ImageContent` plus instructions for the LLM agent.\n\n```python\nanalyze_figure_for_search(image=\"data:image/png;base64,...\", search_type=\"medical\")\n```\n\nThe server does not perform standalone visual diagnosis. The intended workflow\nis:\n\n1. The MCP client passes the uploaded image or image URL to `analyze_figure_for_search`.\n2. The LLM agent uses its vision capability to describe the image and extract English biomedical search terms.\n3. The agent immediately continues with `search_biomedical_images` for similar biomedical images or `unified_search` for related papers.\n\n---\n\n## Persistent Query Memory\n\nWhen session persistence is configured, large `unified_search` and\n`get_fulltext` outputs can be saved as artifacts. The immediate tool response can\nstay compact while the reusable payload remains available for later reads.\n\n```python\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"audit.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"results.json\", offset=0, max_chars=200000)\n```\n\nArtifacts are query memory, not a second search. Reading them does not rerun\nexternal source calls. Local filesystem paths are redacted by default because\nremote clients cannot read server-local paths. Set\n`PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true` only for local agents.\n\n---\n\n## Verification Status\n\nThe primary 45-tool MCP server directly exposes:\n\n- Research chronicle: `build_research_chronicle`, `read_research_chronicle`\n- Image search: `search_biomedical_images`\n- Uploaded image handoff: `analyze_figure_for_search`\n- Query memory: `read_session(action=\"artifact\")`\n\nThese capabilities are guarded by docs alignment tests, tool registry tests,\nimage-search tests, vision-search tests, timeline tests, and session artifact\ntests.\nremote clients cannot read the server host path. Set\n`PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true` only for local MCP clients that really\nneed `local_path` and `manifest_path`.\n\nFor `unified_search`, artifact files are intentionally richer than the immediate\nMCP response. Read `audit.json` first for completeness warnings, then\n`query_strategy.json` for the executed source/query plan, then `results.json` or\n`results.toon` for the full article list. This keeps response tokens small while\nleaving enough evidence for repeated agent reads, sandboxed clients, and future\nremote artifact backends.\n\n## Verification Status\n\nThe current primary 45-tool MCP server exposes these tools directly:\n\n- Research chronicle: `build_research_chronicle`, `read_research_chronicle`\n- Image search: `search_biomedical_images`\n- Uploaded-image handoff: `analyze_figure_for_search`\n- Query memory: `read_session(action=\"artifact\")`\n\nCoverage is guarded by docs alignment tests, tool registry tests, image-search\ntests, vision-search tests, timeline tests, and session artifact tests.\n",
-  "advanced-workflows-zh": "<!-- Generated from docs/ADVANCED_RESEARCH_WORKFLOWS.zh-TW.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# 進階研究工作流\n\n這頁把 docs site 導覽裡的核心進階工作流集中成同一個入口：**Research Chronicle（研究編年史與脈絡樹）**、**Open-i 圖片搜尋**、**上傳圖片 handoff**，以及**持久化 query memory**。\n\n## 快速對照\n\n| 需求 | 從這裡開始 | 接著使用 |\n| --- | --- | --- |\n| 看一個主題如何隨時間演進、分支與沉澱 | `build_research_chronicle` | `read_research_chronicle` |\n| 用文字找生物醫學圖片（放射線、病理切片） | `search_biomedical_images` | `get_article_figures`, `unified_search` |\n| 上傳圖片，依圖片視覺語意找相關文獻 | `analyze_figure_for_search` | `search_biomedical_images`, `unified_search` |\n| 重新讀取大型搜尋/全文輸出，不重跑外部來源 | `read_session(action=\"artifact\")` | `read_session(action=\"list_artifacts\")` |\n\n---\n\n## 研究編年史 / Research Chronicle\n\n![Research Chronicle 架構與脈絡流程](images/research-chronicle-lineage-flow.svg)\n\n### 1. 核心設計理念與認識論模型\n\n傳統文獻搜尋回傳的是「扁平的列表」，無法回答「這個領域如何從早期地基走向現代臨床應用？」、「關鍵分水嶺在哪裡？」以及「上次搜尋之後有什麼新進展？」。**Research Chronicle** 是 PubMed Search MCP 的核心研究演化系統：\n\n- **以時序為主脊柱（X 軸）**：年代（Years）構成橫向主軸，串聯起整個領域的歷史演進。\n- **以語意分支為組織維度（Y 軸）**：由多篇論文重複出現的 MeSH descriptors 與作者關鍵字自動聚類出研究路線（Research Lines），從該路線最早觀察到的文獻年份分岔展開。\n- **單一事實來源（Single Source of Truth）**：所有輸出（時序、樹狀圖、心智圖、Mermaid、敘事、JSON）均來自同一份 `ChronicleSnapshot`，保證不同檢視角度絕不相互矛盾。如果只是想在一般搜尋回應裡看輕量分支預覽，可使用 `unified_search(options=\"context_graph\")`（只根據本次 PMID-backed ranked set 產生 preview，而非完整的持久化編年史）。\n- **不可變版本持久化（Immutable Revision Store）**：每次重跑同一主題或給定 `chronicle_id` 時，系統以原子鎖寫入 `Revision N+1`，支援版本比對（Diff）。\n- **認識論嚴謹性（Epistemic Audit）**：文獻在不同版本中的缺席嚴格標記為 `not_observed_in_revision`（檢索範圍未觀察到），而非斷言該論文「被學界淘汰」；每份 Chronicle 皆附帶完整度審計報告（Audit）。\n\n![評估與時間軸流程](images/timeline-evaluation-workflow.svg)\n\n---\n\n### 2. 兩大門面工具與輸出格式\n\n#### 🛠️ `build_research_chronicle` — 建立或更新編年史\n\n```python\n# 1. 依主題建立（自動檢索 PubMed、計算 Landmark 分數並聚類分支）\nbuild_research_chronicle(topic=\"remimazolam intraoperative\", max_events=30)\n\n# 2. 從既有搜尋結果或自訂 PMID 清單建立\nbuild_research_chronicle(pmids=\"last\", topic=\"My Reading List\")\nbuild_research_chronicle(pmids=\"32417976,34999964,36712948\", topic=\"Selected Studies\")\n\n# 3. 延續既有編年史（自動繼承前版的 topic 與檢索範圍，建立 Revision N+1）\nbuild_research_chronicle(chronicle_id=\"remimazolam-intraoperative-08c229f3\")\n```\n\n#### 📖 `read_research_chronicle` — 讀取、比對與深度分析（不重跑搜尋）\n\n| Action | 說明 | 適用情境與範例 |\n| --- | --- | --- |\n| `load` | 載入特定版本並以指定格式輸出（預設 latest） | `read_research_chronicle(chronicle_id=\"...\", output=\"mermaid\")` |\n| `list` | 列出已保存的所有編年史清單與最新版本號 | `read_research_chronicle(action=\"list\")` |\n| `diff` | 比較兩個版本（新增、未觀察到、角色轉變、審計狀態） | `read_research_chronicle(action=\"diff\", chronicle_id=\"...\", from_revision=1)` |\n| `milestones` | 統計條目分佈、歷年趨勢、證據品質與重大地基論文 | `read_research_chronicle(action=\"milestones\", chronicle_id=\"...\")` |\n| `compare` | 橫向比對 2–5 個主題編年史（含共同證據分析） | `read_research_chronicle(action=\"compare\", topics=\"remimazolam,propofol\")` |\n| `narrate` | 輸出帶有完整引用（PMID/DOI）的連貫學術敘事 Markdown | `read_research_chronicle(action=\"narrate\", chronicle_id=\"...\", mode=\"full\")` |\n\n#### 🎨 支援的 12 種輸出格式 (`output` 參數)\n\n| 輸出格式 | 類型 | 說明與適用場景 |\n| --- | :---: | --- |\n| `summary` | Markdown | 緊湊摘要（預設）。包含時序主軸、研究分支列表與重大亮點。 |\n| `mermaid` | 圖表 | **標準 X-Y 軸演化樹**。橫向年份軸 + 主題分支 + 論文區塊（Mermaid Flowchart LR）。 |\n| `mindmap` | 圖表 | **研究分支心智圖**。放射狀展示主題聚類與重要文獻（Mermaid Mindmap）。 |\n| `timeline_mermaid` | 圖表 | 平面時序圖（Mermaid Timeline 語法）。 |\n| `chronicle_map` | JSON | 包含完整圖形座標契約的結構化 JSON（前端視覺化與繪圖專用）。 |\n| `timeline` | JSON | 時序投影 JSON，依時間嚴格排列。 |\n| `tree` | JSON | 樹狀分支投影 JSON，依主題與子主題層級組織。 |\n| `graph` | JSON | 型別化 Provenance Graph（Topic → Branch → Entry → EvidenceArticle）。 |\n| `evidence` | JSON | 去重後的完整證據論文清單與各來源計數。 |\n| `milestones` | JSON | 里程碑統計、證據分佈、引用量統計與 Landmark 排名。 |\n| `narrative` | Markdown | 具學術引用的結構化敘事文字。 |\n| `json` | JSON | 包含所有欄位與原始資料的完整快照（Snapshot）。 |\n\n---\n\n### 3. 完整實例示範：Remimazolam 術中應用研究脈絡\n\n以下以新型靜脈麻醉藥 **Remimazolam（瑞馬唑侖）於手術中麻醉與鎮靜** 為實例，展示各項視覺化與分析產出：\n\n#### 範例 1：X 軸時間線 + Y 軸主題分支樹狀圖 (`output=\"mermaid\"`)\n\n```mermaid\nflowchart LR\n    n_topic[\"研究主題: Remimazolam 術中麻醉與鎮靜 (2020-2026)\"]\n\n    %% 橫向時間軸 (X-axis Time Spine)\n    n_y2020[\"2020 年\"]\n    n_y2021[\"2021 年\"]\n    n_y2022[\"2022 年\"]\n    n_y2023[\"2023 年\"]\n    n_y2024[\"2024 年\"]\n    n_y2025[\"2025 年\"]\n    n_y2026[\"2026 年\"]\n\n    n_topic ==> n_y2020\n    n_y2020 --> n_y2021\n    n_y2021 --> n_y2022\n    n_y2022 --> n_y2023\n    n_y2023 --> n_y2024\n    n_y2024 --> n_y2025\n    n_y2025 --> n_y2026\n\n    %% Y 軸研究主題分支 (Y-axis Lineage Branches)\n    b_propofol[\"分支: Propofol 對比試驗與血流動力學 (24 篇)\"]\n    b_remi[\"分支: Remimazolam 適應症與專屬研究 (3 篇)\"]\n    b_general[\"分支: 全身麻醉與複雜心血管術式 (5 篇)\"]\n    b_sedatives[\"分支: 催眠鎮靜機制與腦電深度監測 (6 篇)\"]\n    b_benzo[\"分支: 苯二氮䓬類特性與特異性拮抗 (2 篇)\"]\n\n    %% 分支分岔時間點\n    n_y2020 --> b_propofol\n    n_y2021 --> b_remi\n    n_y2022 --> b_sedatives\n    n_y2024 --> b_general\n    n_y2025 --> b_benzo\n\n    %% 關鍵文獻區塊 (Entry Blocks)\n    e_2020_phase2[\"[2020-08] Phase 2/3 Trial (PMID: 32417976)<br/>Doi et al. 全身麻醉療效不劣於 Propofol，低血壓發生率顯著降低\"]\n    e_2021_cardiac[\"[2021-03] Case Study (PMID: 33677710)<br/>心臟外科體外循環 (CPB) 麻醉初探\"]\n    e_2022_sedation[\"[2022-04] Observational Study (PMID: 34999964)<br/>全身麻醉期間腦電 (EEG/BIS) 鎮靜監測特徵\"]\n    e_2023_delirium[\"[2023-01] Safety Alert / RCT (PMID: 36712948)<br/>老年骨科手術術後譫妄 (Delirium) 預防效果\"]\n    e_2023_sleep[\"[2023-08] RCT (PMID: 37055671)<br/>術中應用改善老年全膝置換術後睡眠品質\"]\n    e_2024_rct[\"[2024-03] RCT (PMID: 38541158)<br/>胸腔鏡與腹腔鏡微創手術血流動力學穩定性\"]\n    e_2024_meta[\"[2024-07] Meta-Analysis (PMID: 39069837)<br/>複雜手術對比丙泊酚安全性統合分析\"]\n    e_2025_sr[\"[2025-01] Systematic Review (PMID: 39832842)<br/>圍術期器官保護與神經認知結局回顧\"]\n    e_2025_tavi[\"[2025-03] RCT (PMID: 39715979)<br/>經導管主動脈瓣置換術 (TAVI) 對比 Sevoflurane\"]\n    e_2026_seizure[\"[2026] Clinical Cohort (PMID: 42299573)<br/>清醒開顱手術 (Awake Craniotomy) 術中癲癇發生率比較\"]\n\n    %% 連接關鍵論文至其分支與時間軸\n    b_propofol --> e_2020_phase2\n    b_remi --> e_2021_cardiac\n    b_sedatives --> e_2022_sedation\n    b_propofol --> e_2023_delirium\n    b_remi --> e_2023_sleep\n    b_propofol --> e_2024_rct\n    b_propofol --> e_2024_meta\n    b_propofol --> e_2025_sr\n    b_general --> e_2025_tavi\n    b_sedatives --> e_2026_seizure\n\n    n_y2020 -.-> e_2020_phase2\n    n_y2021 -.-> e_2021_cardiac\n    n_y2022 -.-> e_2022_sedation\n    n_y2023 -.-> e_2023_delirium\n    n_y2024 -.-> e_2024_meta\n    n_y2025 -.-> e_2025_tavi\n    n_y2026 -.-> e_2026_seizure\n\n    %% 樣式設定\n    classDef topic fill:#0f172a,color:#ffffff,stroke:#0f172a,stroke-width:2px;\n    classDef spine fill:#dbeafe,color:#1e3a8a,stroke:#2563eb,stroke-width:2px;\n    classDef branch fill:#ecfeff,color:#164e63,stroke:#0891b2,stroke-width:2px;\n    classDef event fill:#ffffff,color:#111827,stroke:#94a3b8,stroke-width:1px;\n    classDef landmark fill:#fef3c7,color:#92400e,stroke:#f59e0b,stroke-width:2px;\n\n    class n_topic topic;\n    class n_y2020,n_y2021,n_y2022,n_y2023,n_y2024,n_y2025,n_y2026 spine;\n    class b_propofol,b_remi,b_general,b_sedatives,b_benzo branch;\n    class e_2021_cardiac,e_2022_sedation,e_2023_delirium,e_2023_sleep,e_2024_rct,e_2025_tavi,e_2026_seizure event;\n    class e_2020_phase2,e_2024_meta,e_2025_sr landmark;\n```\n\n---\n\n#### 範例 2：研究分支心智圖 (`output=\"mindmap\"`)\n\n```mermaid\nmindmap\n  root[\"Remimazolam 術中應用研究脈絡\"]\n    branch_propofol[\"Propofol 對比試驗\"]\n      entry_p1[\"2020 — Phase 2b/3 關鍵地基試驗 (PMID: 32417976)\"]\n      entry_p2[\"血流動力學: 低血壓發生率顯著降低\"]\n      entry_p3[\"注射痛 (Injection Pain) 顯著減少\"]\n      entry_p4[\"2024-2025 多中心 Meta-Analysis 統合分析\"]\n    branch_neuro[\"麻醉深度與神經監測\"]\n      entry_n1[\"EEG / BIS 腦電雙頻指數監測指標\"]\n      entry_n2[\"術後譫妄 (Delirium) 發生率降低\"]\n      entry_n3[\"老年圍術期神經認知障礙 (PND) 改善\"]\n    branch_cardio[\"心血管與複雜手術\"]\n      entry_c1[\"經導管主動脈瓣置換術 (TAVI)\"]\n      entry_c2[\"體外循環冠狀動脈搭橋 (CABG)\"]\n      entry_c3[\"重症高風險患者全身麻醉管理\"]\n    branch_antidote[\"甦醒管理與特異性拮抗\"]\n      entry_a1[\"Flumazenil (氟馬西尼) 特異性快速逆轉\"]\n      entry_a2[\"甦醒期躁動 (Emergence Agitation) 評估\"]\n      entry_a3[\"組織羧酸酯酶 (CES-1) 水解特性\"]\n```\n\n---\n\n#### 範例 3：核心關鍵論文雙向引用網絡圖 (`build_citation_tree`)\n\n以 2020 年奠基性臨床試驗 **Doi et al. (PMID: 32417976)** 為根節點，向前追蹤後續最新引用，向後回溯基礎藥理學奠基文獻：\n\n```mermaid\ngraph TD\n    %% Root Paper\n    pmid_32417976([\"<b>Doi Matsuyuki et al. (2020)</b><br/>Efficacy & safety of remimazolam vs propofol<br/>[PMID: 32417976 | Phase IIb/III 關鍵試驗]\"])\n\n    %% 後續前向引用 (Forward Citations - 最新臨床應用)\n    pmid_42225960[\"Ni et al. (2026)<br/>體重調整劑量比例比較\"]\n    pmid_41987344[\"Kimura et al. (2026)<br/>小兒鎮靜與麻醉應用\"]\n    pmid_41954614[\"Morimoto et al. (2026)<br/>效應部位濃度監測 (Ce)\"]\n    pmid_41926002[\"Kotani et al. (2026)<br/>術後血流動力學與器官保護\"]\n\n    %% 基礎後向參考 (Backward References - 藥物研發與藥理地基)\n    pmid_23653886(\"Chitilian et al. (2013)<br/>新型酯鍵代謝麻醉藥物研發\")\n    pmid_10215689(\"Tuk et al. (1999)<br/>GABAA 藥效動力學建模\")\n    pmid_22531340(\"Egan et al. (2012)<br/>代謝不穩定型新型鎮靜劑架構\")\n\n    %% 連線\n    pmid_42225960 --> pmid_32417976\n    pmid_41987344 --> pmid_32417976\n    pmid_41954614 --> pmid_32417976\n    pmid_41926002 --> pmid_32417976\n\n    pmid_32417976 --> pmid_23653886\n    pmid_32417976 --> pmid_10215689\n    pmid_23653886 --> pmid_22531340\n\n    %% 樣式\n    style pmid_32417976 fill:#e74c3c,stroke:#c0392b,stroke-width:3px,color:#fff\n    style pmid_42225960 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_41987344 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_41954614 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_41926002 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_23653886 fill:#2ecc71,stroke:#27ae60,color:#fff\n    style pmid_10215689 fill:#2ecc71,stroke:#27ae60,color:#fff\n    style pmid_22531340 fill:#2ecc71,stroke:#27ae60,color:#fff\n```\n\n---\n\n#### 範例 4：跨主題橫向比較 (`action=\"compare\"`)\n\n比較 `remimazolam intraoperative`（新藥，2020–2026）與 `propofol intraoperative`（經典對照組，1991–2026）：\n\n```json\n{\n  \"projection\": \"comparison\",\n  \"summary\": {\n    \"earliest_research\": 1991,\n    \"latest_research\": 2026,\n    \"shared_evidence_count\": 7\n  },\n  \"shared_evidence\": [\n    { \"evidence_id\": \"pmid:32417976\", \"shared_by\": [\"remimazolam\", \"propofol\"] },\n    { \"evidence_id\": \"pmid:36712948\", \"shared_by\": [\"remimazolam\", \"propofol\"] },\n    { \"evidence_id\": \"pmid:38494158\", \"shared_by\": [\"remimazolam\", \"propofol\"] },\n    { \"evidence_id\": \"pmid:39832842\", \"shared_by\": [\"remimazolam\", \"propofol\"] }\n  ]\n}\n```\n\n---\n\n## Open-i 生醫圖片搜尋\n\n當視覺 finding 已經被文字化，且目標是找 open biomedical image evidence 時，使用 `search_biomedical_images`。\n\n```python\nsearch_biomedical_images(\"chest X-ray pneumonia\", sources=\"openi\", image_type=\"x\", limit=10)\nsearch_biomedical_images(\"histology liver fibrosis\", sources=\"openi\", image_type=\"mc\", license_type=\"by\")\n```\n\nOpen-i 需要英文醫學詞。中文或其他非英文提示應先由 agent 翻譯 anatomy、finding、modality，再呼叫 `search_biomedical_images`。Open-i 適合 radiology、microscopy、clinical photos、teaching images；如果要抓論文本身的圖表，請對 PMC Open Access 文章使用 `get_article_figures`。\n\n---\n\n## 上傳圖片到文獻搜尋\n\n`analyze_figure_for_search` 是給 MCP client 上傳圖片或傳 image URL 時使用的 handoff tool。它接受 image URL 或 base64/data-URI image，回傳 MCP `ImageContent` 與給 LLM agent 的搜尋指令。\n\n```python\nanalyze_figure_for_search(image=\"data:image/png;base64,...\", search_type=\"medical\")\n```\n\nServer 本身不做 standalone visual diagnosis。正確流程是：\n\n1. MCP client 把上傳圖片或 image URL 傳給 `analyze_figure_for_search`。\n2. LLM agent 用自己的 vision capability 判讀圖片，抽出英文 biomedical search terms。\n3. Agent 接著呼叫 `search_biomedical_images` 找相似 biomedical images，或用 `unified_search` 找相關論文。\n\n---\n\n## 持久化 Query Memory\n\n當 session persistence 有設定時，大型 `unified_search` 與 `get_fulltext` 輸出可以保存成 artifact。即時 tool response 可以保持精簡，同時把可重用 payload 留在 session artifact 裡。\n\n```python\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"audit.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"results.json\", offset=0, max_chars=200000)\n```\n\nArtifact 是 query memory，不是第二次搜尋。讀取 artifact 不會重跑外部 source calls。Local filesystem paths 預設會被遮蔽，因為 remote client 不能讀 MCP server host path。只有本機 MCP client 真的需要 `local_path` 與 `manifest_path` 時，才設定 `PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true`。\n\n對 `unified_search` 來說，artifact files 會比即時 MCP response 更完整。建議先讀 `audit.json` 看完整性警告，再讀 `query_strategy.json` 檢查實際來源與搜尋策略，最後用 `results.json` 或 `results.toon` 取回完整文章清單。這能節省 response token，也讓 agent、sandbox client 與未來遠端 artifact backend 都能重複讀取同一份 evidence。\n\n---\n\n## 驗證狀態\n\n目前 primary 45-tool MCP server 直接暴露這些功能：\n\n- Research chronicle: `build_research_chronicle`, `read_research_chronicle`\n- Image search: `search_biomedical_images`\n- 上傳圖片 handoff: `analyze_figure_for_search`\n- Query memory: `read_session(action=\"artifact\")`\n\n這些功能有 docs alignment tests、tool registry tests、image-search tests、vision-search tests、timeline tests、session artifact tests 守住。\n",
+  "advanced-workflows": "<!-- Generated from docs/ADVANCED_RESEARCH_WORKFLOWS.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# Advanced Research Workflows\n\nThis page provides a centralized, in-depth guide to the core advanced workflows\nin PubMed Search MCP: **Research Chronicle (Evolution & Lineage Trees)**,\n**Open-i Image Search**, **Uploaded-Image Handoff**, and **Persistent Query Memory**.\n\n## Quick Map\n\n| Need | Start here | Continue with |\n| --- | --- | --- |\n| See how a topic evolved, branched, and settled over time | `build_research_chronicle` | `read_research_chronicle` |\n| Find biomedical images from text (X-ray, histology, CT) | `search_biomedical_images` | `get_article_figures`, `unified_search` |\n| Upload or pass an image and search by its visual meaning | `analyze_figure_for_search` | `search_biomedical_images`, `unified_search` |\n| Re-open large search/fulltext outputs without rerunning | `read_session(action=\"artifact\")` | `read_session(action=\"list_artifacts\")` |\n\n---\n\n## Research Chronicle / Lineage Tree\n\n![Research Chronicle Architecture and Lineage Flow](images/research-chronicle-lineage-flow.svg)\n\n### 1. Core Principles & Epistemic Model\n\nTraditional literature search returns flat lists that cannot answer fundamental\nscientific questions such as: *\"How did this field evolve from early mechanisms\nto modern clinical practice?\"*, *\"Where were the landmark paradigm shifts?\"*,\nand *\"What has changed since my last search?\"*.\n\n**Research Chronicle** is PubMed Search MCP's versioned research evolution system:\n\n- **Chronological Time Spine (X-axis)**: Publication years form the horizontal\n  backbone, ordering scientific milestones chronologically.\n- **Thematic Lineage Branches (Y-axis)**: Distinct research lines are\n  automatically clustered from shared MeSH descriptors and author keywords,\n  branching off from the year of their earliest observed paper.\n- **Single Source of Truth**: All projections (time spine, lineage tree,\n  mindmap, Mermaid diagrams, narrative Markdown, and JSON) originate from the\n  same `ChronicleSnapshot`, ensuring mutual consistency. For a lightweight preview\n  inside a normal search response, use `unified_search(options=\"context_graph\")`\n  (which generates a preview from the current PMID-backed ranked set rather than a full persisted chronicle).\n- **Immutable Versioned Storage**: Each update or continuation atomically\n  appends `Revision N+1`, enabling precise longitudinal diffing.\n- **Epistemic Rigor**: Missing papers in later revisions are classified as\n  `not_observed_in_revision` (absence is not retirement); each snapshot is\n  backed by an automated completeness audit.\n\n![Evaluation and Timeline Workflow](images/timeline-evaluation-workflow.svg)\n\n---\n\n### 2. Dual Tool Facades & Output Modes\n\n#### 🛠️ `build_research_chronicle` — Create or Continue a Chronicle\n\n```python\n# 1. Build from topic (retrieves PubMed, scores landmarks, clusters lineages)\nbuild_research_chronicle(topic=\"remimazolam intraoperative\", max_events=30)\n\n# 2. Build from previous search results or explicit PMIDs\nbuild_research_chronicle(pmids=\"last\", topic=\"My Reading List\")\nbuild_research_chronicle(pmids=\"32417976,34999964,36712948\", topic=\"Selected Studies\")\n\n# 3. Continue an existing chronicle (inherits stored topic and filters to produce Revision N+1)\nbuild_research_chronicle(chronicle_id=\"remimazolam-intraoperative-08c229f3\")\n```\n\n#### 📖 `read_research_chronicle` — Read, Diff, and Analyze Stored Evidence\n\n| Action | Purpose | Example |\n| --- | --- | --- |\n| `load` | Load a stored revision in any format (defaults to latest) | `read_research_chronicle(chronicle_id=\"...\", output=\"mermaid\")` |\n| `list` | List all persisted chronicles with latest revision IDs | `read_research_chronicle(action=\"list\")` |\n| `diff` | Compare two revisions (added, unobserved, role shifts, audit) | `read_research_chronicle(action=\"diff\", chronicle_id=\"...\", from_revision=1)` |\n| `milestones` | Diagnostic overview of milestone types, years, and landmark scores | `read_research_chronicle(action=\"milestones\", chronicle_id=\"...\")` |\n| `compare` | Compare 2–5 topics side-by-side with shared evidence analysis | `read_research_chronicle(action=\"compare\", topics=\"remimazolam,propofol\")` |\n| `narrate` | Render evidence-backed Markdown with citations for writing/reporting | `read_research_chronicle(action=\"narrate\", chronicle_id=\"...\", mode=\"full\")` |\n\n#### 🎨 12 Supported Output Formats (`output` parameter)\n\n| Output Format | Type | Description |\n| --- | :---: | --- |\n| `summary` | Markdown | Default compact summary with chronological spine, research lines, and highlights. |\n| `mermaid` | Diagram | **Canonical X-Y lineage tree**. Horizontal year spine + branching research lines + article blocks. |\n| `mindmap` | Diagram | **Research lineage mindmap**. Radial Mermaid mindmap diagram. |\n| `timeline_mermaid` | Diagram | Flat legacy Mermaid timeline syntax. |\n| `chronicle_map` | JSON | Complete diagram coordinate contract for custom frontend renderers. |\n| `timeline` | JSON | Chronological projection JSON ordered strictly by publication date. |\n| `tree` | JSON | Thematic lineage tree JSON organized into branch and sub-branch hierarchies. |\n| `graph` | JSON | Typed provenance graph (Topic → Branch → Entry → EvidenceArticle). |\n| `evidence` | JSON | Deduplicated evidence articles with per-source counts. |\n| `milestones` | JSON | Milestone distributions, year spread, citation metrics, and landmark rankings. |\n| `narrative` | Markdown | Academic prose narrative with inline PMID/DOI citations. |\n| `json` | JSON | Complete immutable snapshot dictionary. |\n\n---\n\n### 3. Concrete Example: Remimazolam Intraoperative Lineage\n\nThe following diagrams illustrate the research evolution of **Remimazolam in intraoperative anesthesia and sedation** (2020–2026):\n\n#### Example 1: X-Axis Time Spine + Y-Axis Lineage Branches (`output=\"mermaid\"`)\n\n```mermaid\nflowchart LR\n    n_topic[\"Topic: Remimazolam Intraoperative Anesthesia (2020-2026)\"]\n\n    %% X-axis Time Spine\n    n_y2020[\"Year 2020\"]\n    n_y2021[\"Year 2021\"]\n    n_y2022[\"Year 2022\"]\n    n_y2023[\"Year 2023\"]\n    n_y2024[\"Year 2024\"]\n    n_y2025[\"Year 2025\"]\n    n_y2026[\"Year 2026\"]\n\n    n_topic ==> n_y2020\n    n_y2020 --> n_y2021\n    n_y2021 --> n_y2022\n    n_y2022 --> n_y2023\n    n_y2023 --> n_y2024\n    n_y2024 --> n_y2025\n    n_y2025 --> n_y2026\n\n    %% Y-axis Research Lineage Branches\n    b_propofol[\"Branch: Propofol Comparator & Hemodynamics (24 entries)\"]\n    b_remi[\"Branch: Remimazolam Clinical Trials & Indications (3 entries)\"]\n    b_general[\"Branch: General Anesthesia & Complex Surgery (5 entries)\"]\n    b_sedatives[\"Branch: Sedation Depth & Neuromonitoring (6 entries)\"]\n    b_benzo[\"Branch: Benzodiazepines & Reversal (2 entries)\"]\n\n    %% Branch points at earliest observed year\n    n_y2020 --> b_propofol\n    n_y2021 --> b_remi\n    n_y2022 --> b_sedatives\n    n_y2024 --> b_general\n    n_y2025 --> b_benzo\n\n    %% Key Entry Blocks\n    e_2020_phase2[\"[2020-08] Phase 2/3 Trial (PMID: 32417976)<br/>Doi et al. Non-inferior efficacy to propofol, significantly less hypotension\"]\n    e_2021_cardiac[\"[2021-03] Case Study (PMID: 33677710)<br/>Cardiopulmonary bypass cardiac surgery exploration\"]\n    e_2022_sedation[\"[2022-04] Observational Study (PMID: 34999964)<br/>EEG/BIS depth of sedation monitoring indices\"]\n    e_2023_delirium[\"[2023-01] Safety Alert / RCT (PMID: 36712948)<br/>Postoperative delirium reduction in elderly orthopedics\"]\n    e_2023_sleep[\"[2023-08] RCT (PMID: 37055671)<br/>Improved postoperative sleep quality after joint replacement\"]\n    e_2024_rct[\"[2024-03] RCT (PMID: 38541158)<br/>Hemodynamic stability in laparoscopic & thoracoscopic surgery\"]\n    e_2024_meta[\"[2024-07] Meta-Analysis (PMID: 39069837)<br/>Safety meta-analysis across complex surgical procedures\"]\n    e_2025_sr[\"[2025-01] Systematic Review (PMID: 39832842)<br/>Perioperative neurocognitive disorders & organ protection\"]\n    e_2025_tavi[\"[2025-03] RCT (PMID: 39715979)<br/>Transcatheter aortic valve implantation (TAVI) vs sevoflurane\"]\n    e_2026_seizure[\"[2026] Clinical Cohort (PMID: 42299573)<br/>Intraoperative seizure incidence during awake craniotomy\"]\n\n    %% Connect entries to branches and years\n    b_propofol --> e_2020_phase2\n    b_remi --> e_2021_cardiac\n    b_sedatives --> e_2022_sedation\n    b_propofol --> e_2023_delirium\n    b_remi --> e_2023_sleep\n    b_propofol --> e_2024_rct\n    b_propofol --> e_2024_meta\n    b_propofol --> e_2025_sr\n    b_general --> e_2025_tavi\n    b_sedatives --> e_2026_seizure\n\n    n_y2020 -.-> e_2020_phase2\n    n_y2021 -.-> e_2021_cardiac\n    n_y2022 -.-> e_2022_sedation\n    n_y2023 -.-> e_2023_delirium\n    n_y2024 -.-> e_2024_meta\n    n_y2025 -.-> e_2025_tavi\n    n_y2026 -.-> e_2026_seizure\n\n    %% Styles\n    classDef topic fill:#0f172a,color:#ffffff,stroke:#0f172a,stroke-width:2px;\n    classDef spine fill:#dbeafe,color:#1e3a8a,stroke:#2563eb,stroke-width:2px;\n    classDef branch fill:#ecfeff,color:#164e63,stroke:#0891b2,stroke-width:2px;\n    classDef event fill:#ffffff,color:#111827,stroke:#94a3b8,stroke-width:1px;\n    classDef landmark fill:#fef3c7,color:#92400e,stroke:#f59e0b,stroke-width:2px;\n\n    class n_topic topic;\n    class n_y2020,n_y2021,n_y2022,n_y2023,n_y2024,n_y2025,n_y2026 spine;\n    class b_propofol,b_remi,b_general,b_sedatives,b_benzo branch;\n    class e_2021_cardiac,e_2022_sedation,e_2023_delirium,e_2023_sleep,e_2024_rct,e_2025_tavi,e_2026_seizure event;\n    class e_2020_phase2,e_2024_meta,e_2025_sr landmark;\n```\n\n---\n\n#### Example 2: Research Lineage Mindmap (`output=\"mindmap\"`)\n\n```mermaid\nmindmap\n  root[\"Remimazolam Intraoperative Lineage\"]\n    branch_propofol[\"Propofol Comparator Line\"]\n      entry_p1[\"2020 — Phase 2b/3 Landmark Trial (PMID: 32417976)\"]\n      entry_p2[\"Hemodynamics: Significant hypotension reduction\"]\n      entry_p3[\"Injection site pain virtually eliminated\"]\n      entry_p4[\"2024-2025 Multicenter Meta-Analyses\"]\n    branch_neuro[\"Depth of Sedation & Neurocognitive\"]\n      entry_n1[\"EEG / BIS spectral index characteristics\"]\n      entry_n2[\"Postoperative delirium incidence reduction\"]\n      entry_n3[\"Perioperative neurocognitive disorder (PND) mitigation\"]\n    branch_cardio[\"Cardiovascular & Complex Surgery\"]\n      entry_c1[\"Transcatheter aortic valve implantation (TAVI)\"]\n      entry_c2[\"Coronary artery bypass grafting (CABG)\"]\n      entry_c3[\"High-risk critical illness general anesthesia\"]\n    branch_antidote[\"Emergence & Flumazenil Reversal\"]\n      entry_a1[\"Flumazenil specific rapid reversal capability\"]\n      entry_a2[\"Emergence agitation evaluation\"]\n      entry_a3[\"Tissue carboxylesterase-1 (CES-1) rapid hydrolysis\"]\n```\n\n---\n\n#### Example 3: Landmark Paper Bidirectional Citation Tree (`build_citation_tree`)\n\nGrounded on the foundational 2020 trial by **Doi et al. (PMID: 32417976)**:\n\n```mermaid\ngraph TD\n    %% Root Paper\n    pmid_32417976([\"<b>Doi Matsuyuki et al. (2020)</b><br/>Efficacy & safety of remimazolam vs propofol<br/>[PMID: 32417976 | Phase IIb/III Trial]\"])\n\n    %% Forward Citations (Latest Clinical Implementations)\n    pmid_42225960[\"Ni et al. (2026)<br/>Weight-based dose scaling comparison\"]\n    pmid_41987344[\"Kimura et al. (2026)<br/>Pediatric sedation and anesthesia\"]\n    pmid_41954614[\"Morimoto et al. (2026)<br/>Effect-site concentration monitoring (Ce)\"]\n    pmid_41926002[\"Kotani et al. (2026)<br/>Postoperative hemodynamic stability\"]\n\n    %% Backward References (Pharmacological Foundation)\n    pmid_23653886(\"Chitilian et al. (2013)<br/>Novel esterase-cleaved anesthetic development\")\n    pmid_10215689(\"Tuk et al. (1999)<br/>GABAA pharmacodynamic modeling\")\n    pmid_22531340(\"Egan et al. (2012)<br/>Metabolically labile sedative architectures\")\n\n    %% Edges\n    pmid_42225960 --> pmid_32417976\n    pmid_41987344 --> pmid_32417976\n    pmid_41954614 --> pmid_32417976\n    pmid_41926002 --> pmid_32417976\n\n    pmid_32417976 --> pmid_23653886\n    pmid_32417976 --> pmid_10215689\n    pmid_23653886 --> pmid_22531340\n\n    %% Styles\n    style pmid_32417976 fill:#e74c3c,stroke:#c0392b,stroke-width:3px,color:#fff\n    style pmid_42225960 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_41987344 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_41954614 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_41926002 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_23653886 fill:#2ecc71,stroke:#27ae60,color:#fff\n    style pmid_10215689 fill:#2ecc71,stroke:#27ae60,color:#fff\n    style pmid_22531340 fill:#2ecc71,stroke:#27ae60,color:#fff\n```\n\n---\n\n#### Example 4: Topic-to-Topic Comparison (`action=\"compare\"`)\n\nComparing `remimazolam intraoperative` (2020–2026) with `propofol intraoperative` (1991–2026):\n\n```json\n{\n  \"projection\": \"comparison\",\n  \"summary\": {\n    \"earliest_research\": 1991,\n    \"latest_research\": 2026,\n    \"shared_evidence_count\": 7\n  },\n  \"shared_evidence\": [\n    { \"evidence_id\": \"pmid:32417976\", \"shared_by\": [\"remimazolam\", \"propofol\"] },\n    { \"evidence_id\": \"pmid:36712948\", \"shared_by\": [\"remimazolam\", \"propofol\"] },\n    { \"evidence_id\": \"pmid:38494158\", \"shared_by\": [\"remimazolam\", \"propofol\"] },\n    { \"evidence_id\": \"pmid:39832842\", \"shared_by\": [\"remimazolam\", \"propofol\"] }\n  ]\n}\n```\n\n---\n\n## Open-i Biomedical Image Search\n\nUse `search_biomedical_images` when the visual finding is already text and the\ngoal is image evidence from Open-i.\n\n```python\nsearch_biomedical_images(\"chest X-ray pneumonia\", sources=\"openi\", image_type=\"x\", limit=10)\nsearch_biomedical_images(\"histology liver fibrosis\", sources=\"openi\", image_type=\"mc\", license_type=\"by\")\n```\n\nOpen-i expects English medical terminology. For non-English prompts, the agent\nshould first translate anatomy, finding, and modality into English, then call\n`search_biomedical_images`. Open-i is strongest for radiology, microscopy,\nclinical photos, and teaching images; for article-native figures, use\n`get_article_figures` on PMC Open Access articles.\n\n---\n\n## Uploaded Image To Literature Search\n\n`analyze_figure_for_search` is the handoff tool for images supplied by an MCP\nclient. It accepts an image URL or a base64/data-URI image and returns MCP\n`ImageContent` plus instructions for the LLM agent.\n\n```python\nanalyze_figure_for_search(image=\"data:image/png;base64,...\", search_type=\"medical\")\n```\n\nThe server does not perform standalone visual diagnosis. The intended workflow\nis:\n\n1. The MCP client passes the uploaded image or image URL to `analyze_figure_for_search`.\n2. The LLM agent uses its vision capability to describe the image and extract English biomedical search terms.\n3. The agent immediately continues with `search_biomedical_images` for similar biomedical images or `unified_search` for related papers.\n\n---\n\n## Persistent Query Memory\n\nWhen session persistence is configured, large `unified_search` and\n`get_fulltext` outputs can be saved as artifacts. The immediate tool response can\nstay compact while the reusable payload remains available for later reads.\n\n```python\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"audit.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"results.json\", offset=0, max_chars=200000)\n```\n\nArtifacts are query memory, not a second search. Reading them does not rerun\nexternal source calls. Local filesystem paths are redacted by default because\nremote clients cannot read server-local paths. Set\n`PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true` only for local agents.\n\n---\n\n## Verification Status\n\nThe primary 46-tool MCP server directly exposes:\n\n- Research chronicle: `build_research_chronicle`, `read_research_chronicle`\n- Image search: `search_biomedical_images`\n- Uploaded image handoff: `analyze_figure_for_search`\n- Query memory: `read_session(action=\"artifact\")`\n\nThese capabilities are guarded by docs alignment tests, tool registry tests,\nimage-search tests, vision-search tests, timeline tests, and session artifact\ntests.\nremote clients cannot read the server host path. Set\n`PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true` only for local MCP clients that really\nneed `local_path` and `manifest_path`.\n\nFor `unified_search`, artifact files are intentionally richer than the immediate\nMCP response. Read `audit.json` first for completeness warnings, then\n`query_strategy.json` for the executed source/query plan, then `results.json` or\n`results.toon` for the full article list. This keeps response tokens small while\nleaving enough evidence for repeated agent reads, sandboxed clients, and future\nremote artifact backends.\n\n## Verification Status\n\nThe current primary 46-tool MCP server exposes these tools directly:\n\n- Research chronicle: `build_research_chronicle`, `read_research_chronicle`\n- Image search: `search_biomedical_images`\n- Uploaded-image handoff: `analyze_figure_for_search`\n- Query memory: `read_session(action=\"artifact\")`\n\nCoverage is guarded by docs alignment tests, tool registry tests, image-search\ntests, vision-search tests, timeline tests, and session artifact tests.\n",
+  "advanced-workflows-zh": "<!-- Generated from docs/ADVANCED_RESEARCH_WORKFLOWS.zh-TW.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# 進階研究工作流\n\n這頁把 docs site 導覽裡的核心進階工作流集中成同一個入口：**Research Chronicle（研究編年史與脈絡樹）**、**Open-i 圖片搜尋**、**上傳圖片 handoff**，以及**持久化 query memory**。\n\n## 快速對照\n\n| 需求 | 從這裡開始 | 接著使用 |\n| --- | --- | --- |\n| 看一個主題如何隨時間演進、分支與沉澱 | `build_research_chronicle` | `read_research_chronicle` |\n| 用文字找生物醫學圖片（放射線、病理切片） | `search_biomedical_images` | `get_article_figures`, `unified_search` |\n| 上傳圖片，依圖片視覺語意找相關文獻 | `analyze_figure_for_search` | `search_biomedical_images`, `unified_search` |\n| 重新讀取大型搜尋/全文輸出，不重跑外部來源 | `read_session(action=\"artifact\")` | `read_session(action=\"list_artifacts\")` |\n\n---\n\n## 研究編年史 / Research Chronicle\n\n![Research Chronicle 架構與脈絡流程](images/research-chronicle-lineage-flow.svg)\n\n### 1. 核心設計理念與認識論模型\n\n傳統文獻搜尋回傳的是「扁平的列表」，無法回答「這個領域如何從早期地基走向現代臨床應用？」、「關鍵分水嶺在哪裡？」以及「上次搜尋之後有什麼新進展？」。**Research Chronicle** 是 PubMed Search MCP 的核心研究演化系統：\n\n- **以時序為主脊柱（X 軸）**：年代（Years）構成橫向主軸，串聯起整個領域的歷史演進。\n- **以語意分支為組織維度（Y 軸）**：由多篇論文重複出現的 MeSH descriptors 與作者關鍵字自動聚類出研究路線（Research Lines），從該路線最早觀察到的文獻年份分岔展開。\n- **單一事實來源（Single Source of Truth）**：所有輸出（時序、樹狀圖、心智圖、Mermaid、敘事、JSON）均來自同一份 `ChronicleSnapshot`，保證不同檢視角度絕不相互矛盾。如果只是想在一般搜尋回應裡看輕量分支預覽，可使用 `unified_search(options=\"context_graph\")`（只根據本次 PMID-backed ranked set 產生 preview，而非完整的持久化編年史）。\n- **不可變版本持久化（Immutable Revision Store）**：每次重跑同一主題或給定 `chronicle_id` 時，系統以原子鎖寫入 `Revision N+1`，支援版本比對（Diff）。\n- **認識論嚴謹性（Epistemic Audit）**：文獻在不同版本中的缺席嚴格標記為 `not_observed_in_revision`（檢索範圍未觀察到），而非斷言該論文「被學界淘汰」；每份 Chronicle 皆附帶完整度審計報告（Audit）。\n\n![評估與時間軸流程](images/timeline-evaluation-workflow.svg)\n\n---\n\n### 2. 兩大門面工具與輸出格式\n\n#### 🛠️ `build_research_chronicle` — 建立或更新編年史\n\n```python\n# 1. 依主題建立（自動檢索 PubMed、計算 Landmark 分數並聚類分支）\nbuild_research_chronicle(topic=\"remimazolam intraoperative\", max_events=30)\n\n# 2. 從既有搜尋結果或自訂 PMID 清單建立\nbuild_research_chronicle(pmids=\"last\", topic=\"My Reading List\")\nbuild_research_chronicle(pmids=\"32417976,34999964,36712948\", topic=\"Selected Studies\")\n\n# 3. 延續既有編年史（自動繼承前版的 topic 與檢索範圍，建立 Revision N+1）\nbuild_research_chronicle(chronicle_id=\"remimazolam-intraoperative-08c229f3\")\n```\n\n#### 📖 `read_research_chronicle` — 讀取、比對與深度分析（不重跑搜尋）\n\n| Action | 說明 | 適用情境與範例 |\n| --- | --- | --- |\n| `load` | 載入特定版本並以指定格式輸出（預設 latest） | `read_research_chronicle(chronicle_id=\"...\", output=\"mermaid\")` |\n| `list` | 列出已保存的所有編年史清單與最新版本號 | `read_research_chronicle(action=\"list\")` |\n| `diff` | 比較兩個版本（新增、未觀察到、角色轉變、審計狀態） | `read_research_chronicle(action=\"diff\", chronicle_id=\"...\", from_revision=1)` |\n| `milestones` | 統計條目分佈、歷年趨勢、證據品質與重大地基論文 | `read_research_chronicle(action=\"milestones\", chronicle_id=\"...\")` |\n| `compare` | 橫向比對 2–5 個主題編年史（含共同證據分析） | `read_research_chronicle(action=\"compare\", topics=\"remimazolam,propofol\")` |\n| `narrate` | 輸出帶有完整引用（PMID/DOI）的連貫學術敘事 Markdown | `read_research_chronicle(action=\"narrate\", chronicle_id=\"...\", mode=\"full\")` |\n\n#### 🎨 支援的 12 種輸出格式 (`output` 參數)\n\n| 輸出格式 | 類型 | 說明與適用場景 |\n| --- | :---: | --- |\n| `summary` | Markdown | 緊湊摘要（預設）。包含時序主軸、研究分支列表與重大亮點。 |\n| `mermaid` | 圖表 | **標準 X-Y 軸演化樹**。橫向年份軸 + 主題分支 + 論文區塊（Mermaid Flowchart LR）。 |\n| `mindmap` | 圖表 | **研究分支心智圖**。放射狀展示主題聚類與重要文獻（Mermaid Mindmap）。 |\n| `timeline_mermaid` | 圖表 | 平面時序圖（Mermaid Timeline 語法）。 |\n| `chronicle_map` | JSON | 包含完整圖形座標契約的結構化 JSON（前端視覺化與繪圖專用）。 |\n| `timeline` | JSON | 時序投影 JSON，依時間嚴格排列。 |\n| `tree` | JSON | 樹狀分支投影 JSON，依主題與子主題層級組織。 |\n| `graph` | JSON | 型別化 Provenance Graph（Topic → Branch → Entry → EvidenceArticle）。 |\n| `evidence` | JSON | 去重後的完整證據論文清單與各來源計數。 |\n| `milestones` | JSON | 里程碑統計、證據分佈、引用量統計與 Landmark 排名。 |\n| `narrative` | Markdown | 具學術引用的結構化敘事文字。 |\n| `json` | JSON | 包含所有欄位與原始資料的完整快照（Snapshot）。 |\n\n---\n\n### 3. 完整實例示範：Remimazolam 術中應用研究脈絡\n\n以下以新型靜脈麻醉藥 **Remimazolam（瑞馬唑侖）於手術中麻醉與鎮靜** 為實例，展示各項視覺化與分析產出：\n\n#### 範例 1：X 軸時間線 + Y 軸主題分支樹狀圖 (`output=\"mermaid\"`)\n\n```mermaid\nflowchart LR\n    n_topic[\"研究主題: Remimazolam 術中麻醉與鎮靜 (2020-2026)\"]\n\n    %% 橫向時間軸 (X-axis Time Spine)\n    n_y2020[\"2020 年\"]\n    n_y2021[\"2021 年\"]\n    n_y2022[\"2022 年\"]\n    n_y2023[\"2023 年\"]\n    n_y2024[\"2024 年\"]\n    n_y2025[\"2025 年\"]\n    n_y2026[\"2026 年\"]\n\n    n_topic ==> n_y2020\n    n_y2020 --> n_y2021\n    n_y2021 --> n_y2022\n    n_y2022 --> n_y2023\n    n_y2023 --> n_y2024\n    n_y2024 --> n_y2025\n    n_y2025 --> n_y2026\n\n    %% Y 軸研究主題分支 (Y-axis Lineage Branches)\n    b_propofol[\"分支: Propofol 對比試驗與血流動力學 (24 篇)\"]\n    b_remi[\"分支: Remimazolam 適應症與專屬研究 (3 篇)\"]\n    b_general[\"分支: 全身麻醉與複雜心血管術式 (5 篇)\"]\n    b_sedatives[\"分支: 催眠鎮靜機制與腦電深度監測 (6 篇)\"]\n    b_benzo[\"分支: 苯二氮䓬類特性與特異性拮抗 (2 篇)\"]\n\n    %% 分支分岔時間點\n    n_y2020 --> b_propofol\n    n_y2021 --> b_remi\n    n_y2022 --> b_sedatives\n    n_y2024 --> b_general\n    n_y2025 --> b_benzo\n\n    %% 關鍵文獻區塊 (Entry Blocks)\n    e_2020_phase2[\"[2020-08] Phase 2/3 Trial (PMID: 32417976)<br/>Doi et al. 全身麻醉療效不劣於 Propofol，低血壓發生率顯著降低\"]\n    e_2021_cardiac[\"[2021-03] Case Study (PMID: 33677710)<br/>心臟外科體外循環 (CPB) 麻醉初探\"]\n    e_2022_sedation[\"[2022-04] Observational Study (PMID: 34999964)<br/>全身麻醉期間腦電 (EEG/BIS) 鎮靜監測特徵\"]\n    e_2023_delirium[\"[2023-01] Safety Alert / RCT (PMID: 36712948)<br/>老年骨科手術術後譫妄 (Delirium) 預防效果\"]\n    e_2023_sleep[\"[2023-08] RCT (PMID: 37055671)<br/>術中應用改善老年全膝置換術後睡眠品質\"]\n    e_2024_rct[\"[2024-03] RCT (PMID: 38541158)<br/>胸腔鏡與腹腔鏡微創手術血流動力學穩定性\"]\n    e_2024_meta[\"[2024-07] Meta-Analysis (PMID: 39069837)<br/>複雜手術對比丙泊酚安全性統合分析\"]\n    e_2025_sr[\"[2025-01] Systematic Review (PMID: 39832842)<br/>圍術期器官保護與神經認知結局回顧\"]\n    e_2025_tavi[\"[2025-03] RCT (PMID: 39715979)<br/>經導管主動脈瓣置換術 (TAVI) 對比 Sevoflurane\"]\n    e_2026_seizure[\"[2026] Clinical Cohort (PMID: 42299573)<br/>清醒開顱手術 (Awake Craniotomy) 術中癲癇發生率比較\"]\n\n    %% 連接關鍵論文至其分支與時間軸\n    b_propofol --> e_2020_phase2\n    b_remi --> e_2021_cardiac\n    b_sedatives --> e_2022_sedation\n    b_propofol --> e_2023_delirium\n    b_remi --> e_2023_sleep\n    b_propofol --> e_2024_rct\n    b_propofol --> e_2024_meta\n    b_propofol --> e_2025_sr\n    b_general --> e_2025_tavi\n    b_sedatives --> e_2026_seizure\n\n    n_y2020 -.-> e_2020_phase2\n    n_y2021 -.-> e_2021_cardiac\n    n_y2022 -.-> e_2022_sedation\n    n_y2023 -.-> e_2023_delirium\n    n_y2024 -.-> e_2024_meta\n    n_y2025 -.-> e_2025_tavi\n    n_y2026 -.-> e_2026_seizure\n\n    %% 樣式設定\n    classDef topic fill:#0f172a,color:#ffffff,stroke:#0f172a,stroke-width:2px;\n    classDef spine fill:#dbeafe,color:#1e3a8a,stroke:#2563eb,stroke-width:2px;\n    classDef branch fill:#ecfeff,color:#164e63,stroke:#0891b2,stroke-width:2px;\n    classDef event fill:#ffffff,color:#111827,stroke:#94a3b8,stroke-width:1px;\n    classDef landmark fill:#fef3c7,color:#92400e,stroke:#f59e0b,stroke-width:2px;\n\n    class n_topic topic;\n    class n_y2020,n_y2021,n_y2022,n_y2023,n_y2024,n_y2025,n_y2026 spine;\n    class b_propofol,b_remi,b_general,b_sedatives,b_benzo branch;\n    class e_2021_cardiac,e_2022_sedation,e_2023_delirium,e_2023_sleep,e_2024_rct,e_2025_tavi,e_2026_seizure event;\n    class e_2020_phase2,e_2024_meta,e_2025_sr landmark;\n```\n\n---\n\n#### 範例 2：研究分支心智圖 (`output=\"mindmap\"`)\n\n```mermaid\nmindmap\n  root[\"Remimazolam 術中應用研究脈絡\"]\n    branch_propofol[\"Propofol 對比試驗\"]\n      entry_p1[\"2020 — Phase 2b/3 關鍵地基試驗 (PMID: 32417976)\"]\n      entry_p2[\"血流動力學: 低血壓發生率顯著降低\"]\n      entry_p3[\"注射痛 (Injection Pain) 顯著減少\"]\n      entry_p4[\"2024-2025 多中心 Meta-Analysis 統合分析\"]\n    branch_neuro[\"麻醉深度與神經監測\"]\n      entry_n1[\"EEG / BIS 腦電雙頻指數監測指標\"]\n      entry_n2[\"術後譫妄 (Delirium) 發生率降低\"]\n      entry_n3[\"老年圍術期神經認知障礙 (PND) 改善\"]\n    branch_cardio[\"心血管與複雜手術\"]\n      entry_c1[\"經導管主動脈瓣置換術 (TAVI)\"]\n      entry_c2[\"體外循環冠狀動脈搭橋 (CABG)\"]\n      entry_c3[\"重症高風險患者全身麻醉管理\"]\n    branch_antidote[\"甦醒管理與特異性拮抗\"]\n      entry_a1[\"Flumazenil (氟馬西尼) 特異性快速逆轉\"]\n      entry_a2[\"甦醒期躁動 (Emergence Agitation) 評估\"]\n      entry_a3[\"組織羧酸酯酶 (CES-1) 水解特性\"]\n```\n\n---\n\n#### 範例 3：核心關鍵論文雙向引用網絡圖 (`build_citation_tree`)\n\n以 2020 年奠基性臨床試驗 **Doi et al. (PMID: 32417976)** 為根節點，向前追蹤後續最新引用，向後回溯基礎藥理學奠基文獻：\n\n```mermaid\ngraph TD\n    %% Root Paper\n    pmid_32417976([\"<b>Doi Matsuyuki et al. (2020)</b><br/>Efficacy & safety of remimazolam vs propofol<br/>[PMID: 32417976 | Phase IIb/III 關鍵試驗]\"])\n\n    %% 後續前向引用 (Forward Citations - 最新臨床應用)\n    pmid_42225960[\"Ni et al. (2026)<br/>體重調整劑量比例比較\"]\n    pmid_41987344[\"Kimura et al. (2026)<br/>小兒鎮靜與麻醉應用\"]\n    pmid_41954614[\"Morimoto et al. (2026)<br/>效應部位濃度監測 (Ce)\"]\n    pmid_41926002[\"Kotani et al. (2026)<br/>術後血流動力學與器官保護\"]\n\n    %% 基礎後向參考 (Backward References - 藥物研發與藥理地基)\n    pmid_23653886(\"Chitilian et al. (2013)<br/>新型酯鍵代謝麻醉藥物研發\")\n    pmid_10215689(\"Tuk et al. (1999)<br/>GABAA 藥效動力學建模\")\n    pmid_22531340(\"Egan et al. (2012)<br/>代謝不穩定型新型鎮靜劑架構\")\n\n    %% 連線\n    pmid_42225960 --> pmid_32417976\n    pmid_41987344 --> pmid_32417976\n    pmid_41954614 --> pmid_32417976\n    pmid_41926002 --> pmid_32417976\n\n    pmid_32417976 --> pmid_23653886\n    pmid_32417976 --> pmid_10215689\n    pmid_23653886 --> pmid_22531340\n\n    %% 樣式\n    style pmid_32417976 fill:#e74c3c,stroke:#c0392b,stroke-width:3px,color:#fff\n    style pmid_42225960 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_41987344 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_41954614 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_41926002 fill:#3498db,stroke:#2980b9,color:#fff\n    style pmid_23653886 fill:#2ecc71,stroke:#27ae60,color:#fff\n    style pmid_10215689 fill:#2ecc71,stroke:#27ae60,color:#fff\n    style pmid_22531340 fill:#2ecc71,stroke:#27ae60,color:#fff\n```\n\n---\n\n#### 範例 4：跨主題橫向比較 (`action=\"compare\"`)\n\n比較 `remimazolam intraoperative`（新藥，2020–2026）與 `propofol intraoperative`（經典對照組，1991–2026）：\n\n```json\n{\n  \"projection\": \"comparison\",\n  \"summary\": {\n    \"earliest_research\": 1991,\n    \"latest_research\": 2026,\n    \"shared_evidence_count\": 7\n  },\n  \"shared_evidence\": [\n    { \"evidence_id\": \"pmid:32417976\", \"shared_by\": [\"remimazolam\", \"propofol\"] },\n    { \"evidence_id\": \"pmid:36712948\", \"shared_by\": [\"remimazolam\", \"propofol\"] },\n    { \"evidence_id\": \"pmid:38494158\", \"shared_by\": [\"remimazolam\", \"propofol\"] },\n    { \"evidence_id\": \"pmid:39832842\", \"shared_by\": [\"remimazolam\", \"propofol\"] }\n  ]\n}\n```\n\n---\n\n## Open-i 生醫圖片搜尋\n\n當視覺 finding 已經被文字化，且目標是找 open biomedical image evidence 時，使用 `search_biomedical_images`。\n\n```python\nsearch_biomedical_images(\"chest X-ray pneumonia\", sources=\"openi\", image_type=\"x\", limit=10)\nsearch_biomedical_images(\"histology liver fibrosis\", sources=\"openi\", image_type=\"mc\", license_type=\"by\")\n```\n\nOpen-i 需要英文醫學詞。中文或其他非英文提示應先由 agent 翻譯 anatomy、finding、modality，再呼叫 `search_biomedical_images`。Open-i 適合 radiology、microscopy、clinical photos、teaching images；如果要抓論文本身的圖表，請對 PMC Open Access 文章使用 `get_article_figures`。\n\n---\n\n## 上傳圖片到文獻搜尋\n\n`analyze_figure_for_search` 是給 MCP client 上傳圖片或傳 image URL 時使用的 handoff tool。它接受 image URL 或 base64/data-URI image，回傳 MCP `ImageContent` 與給 LLM agent 的搜尋指令。\n\n```python\nanalyze_figure_for_search(image=\"data:image/png;base64,...\", search_type=\"medical\")\n```\n\nServer 本身不做 standalone visual diagnosis。正確流程是：\n\n1. MCP client 把上傳圖片或 image URL 傳給 `analyze_figure_for_search`。\n2. LLM agent 用自己的 vision capability 判讀圖片，抽出英文 biomedical search terms。\n3. Agent 接著呼叫 `search_biomedical_images` 找相似 biomedical images，或用 `unified_search` 找相關論文。\n\n---\n\n## 持久化 Query Memory\n\n當 session persistence 有設定時，大型 `unified_search` 與 `get_fulltext` 輸出可以保存成 artifact。即時 tool response 可以保持精簡，同時把可重用 payload 留在 session artifact 裡。\n\n```python\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"audit.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"results.json\", offset=0, max_chars=200000)\n```\n\nArtifact 是 query memory，不是第二次搜尋。讀取 artifact 不會重跑外部 source calls。Local filesystem paths 預設會被遮蔽，因為 remote client 不能讀 MCP server host path。只有本機 MCP client 真的需要 `local_path` 與 `manifest_path` 時，才設定 `PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true`。\n\n對 `unified_search` 來說，artifact files 會比即時 MCP response 更完整。建議先讀 `audit.json` 看完整性警告，再讀 `query_strategy.json` 檢查實際來源與搜尋策略，最後用 `results.json` 或 `results.toon` 取回完整文章清單。這能節省 response token，也讓 agent、sandbox client 與未來遠端 artifact backend 都能重複讀取同一份 evidence。\n\n---\n\n## 驗證狀態\n\n目前 primary 46-tool MCP server 直接暴露這些功能：\n\n- Research chronicle: `build_research_chronicle`, `read_research_chronicle`\n- Image search: `search_biomedical_images`\n- 上傳圖片 handoff: `analyze_figure_for_search`\n- Query memory: `read_session(action=\"artifact\")`\n\n這些功能有 docs alignment tests、tool registry tests、image-search tests、vision-search tests、timeline tests、session artifact tests 守住。\n",
   "research-chronicle-rebuild-spec": "<!-- Generated from docs/RESEARCH_CHRONICLE_REFACTOR_SPEC.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# Research Chronicle, Timeline, And Graph Rebuild Spec\n\nStatus: Phases 0-6 implemented (snapshot, evidence, delta, narrative, graph, chronological lineage map, integrity hardening)\nLast updated: 2026-08-12\nScope: this document is now both the design contract and the implementation reference.\n\n## 0. Implementation Status\n\nThe Research Chronicle described below is implemented and shipped.\n\n| Layer | Module |\n| --- | --- |\n| Domain | `src/pubmed_search/domain/entities/chronicle.py` |\n| Application | `src/pubmed_search/application/chronicle/` (`assembler`, `lineage`, `ordering`, `graph`, `mermaid`, `audit`, `projectors`, `narrator`, `differ`, `store`, `service`) |\n| Presentation | `src/pubmed_search/presentation/mcp_server/tools/chronicle.py` |\n| Tests | `tests/test_chronicle.py`, `tests/test_chronicle_mermaid*.py`, `tests/test_chronicle_projection_robustness.py`, `tests/test_chronicle_semantic_hardening.py`, `tests/test_chronicle_revision_integrity.py`, and `tests/test_chronicle_cross_projection_integrity.py` |\n\nThe planned six chronicle tools were consolidated into two, matching the repo's\nfacade convention (`read_session`, `manage_pipeline`):\n\n| Planned tool | Shipped as |\n| --- | --- |\n| `build_research_chronicle` | `build_research_chronicle(topic=..., pmids=..., chronicle_id=...)` |\n| `update_research_chronicle` | `build_research_chronicle(chronicle_id=...)` — writes revision N+1 |\n| `load_research_chronicle` | `read_research_chronicle(action=\"load\", ...)` |\n| `list_research_chronicles` | `read_research_chronicle(action=\"list\", ...)` |\n| `diff_research_chronicle` | `read_research_chronicle(action=\"diff\", ...)` |\n| `narrate_research_chronicle` | `read_research_chronicle(action=\"narrate\", ...)` |\n\nThe three timeline tools were also folded in rather than kept alongside the\nchronicle, superseding section 12's backward-compatibility note:\n\n| Retired tool | Replacement |\n| --- | --- |\n| `build_research_timeline` | `build_research_chronicle` |\n| `analyze_timeline_milestones` | `read_research_chronicle(action=\"milestones\")` |\n| `compare_timelines` | `read_research_chronicle(action=\"compare\", topics=\"a,b\")` |\n\nBecause chronicles are persisted, milestone analysis and comparison read stored\nevidence instead of re-running a search, and comparison additionally reports the\nevidence articles two topics share. Topic comparison uses a normalized exact\nstored-topic match. If more than one Chronicle has that topic, the request is\nreported as ambiguous and must use distinct Chronicle IDs instead. The hardened\n`application/timeline/` components feed the chronicle assembler as its evidence\nprovider.\n\n### Final Integrity Semantics\n\n- Topic builds pass year filters to PubMed before bounded retrieval. Final\n  selection pins the first and last observed events, ranks explicit landmark\n  importance/citations, and fills remaining capacity by temporal spread.\n  Source coverage records `returned` and `available`; capped samples,\n  downstream selection, and unknown availability produce warnings.\n- PubMed error sentinels and zero-article scopes publish no revision. Explicit\n  PMID input accepts only ASCII digits with an optional `PMID:` prefix and\n  supported separators; DOI or arbitrary mixed text is not coerced.\n- Entry IDs use PMID, then DOI, as stable evidence identity across date and\n  classifier corrections. Chronicle derivation, exact topic lookup,\n  comparison, and continuity share one NFC/case-folded/whitespace-collapsed\n  canonical topic key while preserving the stored display topic.\n- Semantic lineage gives each paper one primary branch and retains other\n  selected-signal matches as explicit cross-links. Overlap at or above 20% of\n  all or assigned entries is an audit warning, not evidence of cleanly\n  separated or causal lineages.\n- Entry `confidence` is milestone-detection confidence. Landmark ranking uses\n  explicit landmark importance and citation count fallback; detection\n  confidence is excluded from scientific-importance ordering.\n- Revision absence is always observational: `not_observed_in_revision` and\n  `removed_from_view`. The legacy `retired` field is only a compatibility alias\n  and is never conclusive retirement.\n- Artifact-bundle preflight checks the names emitted by the actual payload\n  builder plus the store-generated manifest. It verifies preparation, not\n  persistence success.\n\n### Chronology Is The Primary Axis\n\nThe chronicle stores entries, branches, and a typed graph; the linear timeline\nand the branch tree are both *projections*, so there is no storage-level choice\nbetween them. The product decision is that **chronology is the primary axis and\nbranches are the secondary organizing dimension** - that is what makes the\nartifact a chronicle rather than a taxonomy. The default `output=\"summary\"`\ntherefore leads with the chronological spine and lists research lines beneath it.\n\nThe canonical visual projection is now the **chronicle map**. It keeps one\nhorizontal year spine and anchors every observed research line at the year of\nits earliest dated paper **within the retrieved scope**; this does not establish\nthe field's first publication. Entries within a branch retain both global\nchronological order and branch-local order. These branches are explainable\ngroupings of the selected evidence, not causal ancestry. Semantic branches\nprefer distinctive MeSH descriptors and author keywords shared by multiple\npapers; a singleton term is not sufficient. If signals cannot support at least\ntwo branches with adequate coverage, the system falls back to deterministic\nresearch-stage branches and emits an audit warning. A stage fallback must not be\ndescribed as discovered semantic topic evolution.\n\nChronology preserves year/month/day precision. A deterministic display order\nmay place two records from the same year, but `precedes` or `supersedes` is only\nasserted when their reported date intervals prove the relationship. The topic\nquery or PMID set, source availability, year filters, and result limits remain\npart of the interpretation boundary for every Chronicle.\n\nAlso fixed during implementation: `build_research_timeline(pmids=\"last\")`\nresolved session PMIDs instead of passing the `\"last\"` sentinel through to PMID\nfetch; the behavior carried over to `build_research_chronicle`.\n\n## 1. Purpose\n\nThe project exposed useful research-evolution features, but the terms\n`timeline`, `research tree`, `context graph`, `citation tree`, and `research\nchronicle` had drifted across code and documentation. This spec records the\nimplemented consolidation and its compatibility boundaries.\n\nThe main decision is:\n\n> **Research Chronicle** is the durable, versioned, evidence-backed source of\n> truth for one retrieval-bounded snapshot. Timeline, lineage tree, context\n> graph, citation graph, and narrative outputs are projections from chronicle or\n> graph data, not separate competing source-of-truth models.\n\n## 2. Canonical Terminology\n\n| Term | Current status | Canonical meaning |\n| --- | --- | --- |\n| Research Timeline | Retired as an MCP tool | A chronological milestone view. Now the `timeline` projection of a chronicle. |\n| Research Lineage Tree | Implemented as `ResearchTree` | A deterministic, retrieval-bounded branch projection using shared semantic signals or an explicit research-stage fallback. It is neither causal genealogy nor a general knowledge graph. |\n| Research Context Graph Preview | Implemented as `unified_search(options=\"context_graph\")` | A lightweight preview synthesized from the current ranked PMID-backed search results. It is not persisted and is not a full graph. |\n| Citation Tree | Implemented as `build_citation_tree` | A single-seed citation network using forward/backward citation relationships. |\n| Research Chronicle | Implemented | A persisted, versioned, evidence-backed record of the selected retrieval scope, with entries, evidence bundles, typed provenance graph, revisions, deltas, audit files, and projections. |\n\nDocumentation must reserve **Research Chronicle** for the persisted,\nevidence-backed artifact. `timeline`, `tree`, and `chronicle_map` are projections;\n`unified_search(options=\"context_graph\")` remains a non-persisted preview.\n\n## 3. Pre-Rebuild Implementation Audit (Historical)\n\n> This section preserves the audit inputs that motivated the rebuild. It does\n> not describe the current MCP surface; see Section 0 for the shipped modules\n> and Section 8 for current tool outputs.\n\n### 3.1 Historical MCP Surface\n\n| Capability | Current entry point | Files | Notes |\n| --- | --- | --- | --- |\n| Timeline | `build_research_timeline` | `src/pubmed_search/presentation/mcp_server/tools/timeline.py` | Returns a string in `text`, `tree`, `mindmap`, `mermaid`, `json`, `json_tree`, `timeline_js`, or `d3`. |\n| Timeline analysis | `analyze_timeline_milestones` | same | Returns JSON string with distribution, periods, diagnostics, optional landmark studies, and activity by year. |\n| Timeline comparison | `compare_timelines` | same | Compares two to five topics. |\n| Context graph preview | `unified_search(options=\"context_graph\")` | `unified_helpers.py`, `unified_execution.py`, `unified_formatting.py` | Builds a temporary timeline/tree from up to 20 ranked PMIDs and includes preview text / JSON `research_context`. |\n| Citation tree | `build_citation_tree` | `src/pubmed_search/presentation/mcp_server/tools/citation_tree.py` | Produces citation graph formats: `cytoscape`, `g6`, `d3`, `vis`, `graphml`, `mermaid`. |\n\n### 3.2 Historical Domain And Application Types\n\n- `domain/entities/timeline.py`\n  - `MilestoneType`\n  - `EvidenceLevel`\n  - `LandmarkScore`\n  - `TimelineEvent`\n  - `TimelinePeriod`\n  - `ResearchTimeline`\n- `domain/entities/research_tree.py`\n  - `ResearchBranch`\n  - `ResearchTree`\n- `application/timeline/`\n  - `TimelineBuilder`\n  - `MilestoneDetector`\n  - `LandmarkScorer`\n  - `build_research_tree`\n  - milestone/landmark policies and diagnostics helpers\n\n### 3.3 Pre-Rebuild Gaps\n\nThese are rebuild inputs, not incidental polish:\n\n- No `ChronicleSnapshot`, `ChronicleEntry`, `EvidenceBundle`, revision store,\n  diff model, narrative model, or chronicle MCP tools exist in `src/`.\n- `pmids=\"last\"` is documented for timeline workflows but currently normalizes\n  to `[\"last\"]` and is passed to PMID fetch instead of resolving session PMIDs.\n- `build_research_timeline(output_format=\"d3\")` returns timeline nodes but no\n  links, so it is not a complete graph contract.\n- `ResearchTree.to_text_tree()` still contains mojibake-like connector strings;\n  tests do not assert clean tree connectors.\n- `ResearchTimeline.to_mermaid()` / `to_json_timeline()` and\n  `ResearchTree.to_text_tree()` / `to_mermaid_mindmap()` are presentation\n  projections living on domain entities.\n- `citation_tree.py` contains traversal, graph construction, and format\n  converters inside the MCP presentation layer. This violates the DDD boundary:\n  MCP tools should be thin wrappers over application services.\n- Context graph preview is silently omitted when ranked results lack PMIDs,\n  timeline building emits no events, or the builder raises an exception.\n- Current timeline artifacts are not persisted with the research artifact\n  envelope used by `unified_search`.\n\n## 4. Implemented Architecture\n\n### 4.1 Layering\n\nThe implementation preserves the repo's DDD direction:\n\n```text\npresentation/mcp_server/tools\n  -> application/chronicle\n  -> application/timeline and application/citation_graph ports\n  -> domain/entities\n  -> infrastructure adapters\n```\n\nBusiness logic must not live in MCP tool functions. Tool modules validate\ninputs, call application services, format responses, and attach artifact\nlocators.\n\n### 4.2 Modules\n\n```text\nsrc/pubmed_search/\n  domain/entities/\n    chronicle.py\n    research_graph.py\n  application/chronicle/\n    __init__.py\n    assembler.py\n    audit.py\n    differ.py\n    graph.py\n    lineage.py\n    mermaid.py\n    narrator.py\n    ordering.py\n    projectors.py\n    service.py\n    store.py\n  application/citation_graph/\n    __init__.py\n    builder.py\n    formatters.py\n    models.py\n  presentation/mcp_server/tools/\n    chronicle.py\n```\n\n`application/citation_graph` extracts the current citation traversal and format\nconversion logic from `presentation/mcp_server/tools/citation_tree.py`. The\nexisting MCP tool remains, but becomes a wrapper.\n\n### 4.3 Application Ports\n\nThe chronicle service should depend on small ports, not concrete tool modules:\n\n- `ArticleEvidenceProvider`\n  - Search by topic.\n  - Fetch details by PMID.\n  - Resolve `pmids=\"last\"` from session state.\n  - Attach source-count and query-strategy metadata when available.\n- `CitationGraphProvider`\n  - Build citation neighborhoods from seed PMIDs.\n  - Return typed graph nodes/edges.\n- `SessionProvenanceProvider`\n  - Read search history, artifact locators, and pipeline run identifiers.\n- `ChronicleArtifactStore`\n  - Persist chronicle artifact envelopes.\n  - Read by `artifact_id` / `artifact_uri`.\n  - Support remote-safe pagination through `read_session`.\n\n## 5. Target Domain Model\n\n### 5.1 ChronicleSnapshot\n\n`ChronicleSnapshot` is the immutable source-of-truth object for one chronicle\nrevision. Stored revisions are never overwritten; next-revision allocation and\npublication occur under a per-Chronicle process/thread-safe lock with atomic\nfile publication.\n\nRequired fields:\n\n- `schema_version: Literal[\"research-chronicle/v1\"]`\n- `chronicle_id: str`\n- `topic: str`\n- `revision: int`\n- `created_at: str`\n- `updated_at: str`\n- `input_scope: ChronicleInputScope`\n- `entries: list[ChronicleEntry]`\n- `branches: list[ChronicleBranch]`\n- `graph: ChronicleGraph`\n- `audit: ChronicleAudit`\n- `metadata: dict[str, Any]`\n\n### 5.2 ChronicleInputScope\n\nCaptures how the chronicle was produced:\n\n- `mode: Literal[\"topic\", \"pmids\", \"session\", \"artifact\", \"pipeline\"]`\n- `query: str | None`\n- `pmids: list[str]`\n- `source_artifact_uris: list[str]`\n- `pipeline_run_ids: list[str]`\n- `filters: dict[str, Any]`\n- `source_counts: dict[str, Any]`\n\nThis scope is a scientific interpretation boundary. In particular,\n`earliest_observed_in_scope` means the earliest dated record among the retrieved\ncandidates after these constraints; it is not a claim about the first paper in\nthe full field.\n\n### 5.3 ChronicleEntry\n\nOne interpretable research event or claim.\n\nRequired fields:\n\n- `entry_id: str`\n- `entry_type: Literal[\"milestone\", \"evidence_shift\", \"guideline\", \"safety\", \"method\", \"controversy\", \"background\"]`\n- `title: str`\n- `time_start: str`\n- `time_end: str | None`\n- `summary_claim: str`\n- `branch_id: str | None`\n- `confidence: float`\n- `status: Literal[\"active\", \"superseded\", \"contested\", \"background\"]`\n- `evidence: EvidenceBundle`\n- `tags: list[str]`\n- `provenance: dict[str, Any]`\n\nEvery entry must have at least one supporting, updating, or contradicting\narticle unless its status is explicitly `background`.\n\n`entry_id` is evidence-identity-stable: PMID is preferred, DOI is the secondary\nidentity, and publication date or milestone classification is excluded from the\nseed. Continuing an older Chronicle reuses unambiguous historical IDs by\nevidence identity so corrections appear as updates.\n\n### 5.4 EvidenceBundle\n\nEvidence must be structured so narratives can cite concrete sources.\n\nRequired fields:\n\n- `supporting_articles: list[EvidenceArticle]`\n- `contradicting_articles: list[EvidenceArticle]`\n- `updating_articles: list[EvidenceArticle]`\n- `verification_summary: dict[str, Any]`\n- `source_coverage: dict[str, Any]`\n\n`EvidenceArticle` fields:\n\n- `pmid: str | None`\n- `doi: str | None`\n- `pmcid: str | None`\n- `title: str`\n- `year: int | None`\n- `source: str`\n- `journal: str | None`\n- `article_type: str | None`\n- `citation_count: int | None`\n- `rcr: float | None`\n- `claim_excerpt: str | None`\n- `fulltext_artifact_uri: str | None`\n- `figure_links: list[dict[str, str]]`\n- `reference_verification_status: str | None`\n\n### 5.5 ChronicleBranch\n\nBranches organize entries into readable research lines.\n\nRequired fields:\n\n- `branch_id: str`\n- `name: str`\n- `description: str`\n- `parent_branch_id: str | None`\n- `entry_ids: list[str]`\n- `confidence: float`\n- `tags: list[str]`\n\nSemantic branches require a distinguishing MeSH/keyword signal observed in more\nthan one paper. Singleton-only or otherwise insufficient signals use the\ndeterministic research-stage fallback and must produce an audit warning. Branch\nmembership is observational organization, not evidence of causal descent; the\ninterface may later support additional clustering methods without changing that\ninterpretation rule.\n\nWhen one paper matches several selected signals, the tree records one primary\nassignment and retains secondary memberships as explicit `cross_signal_links`\nin lineage diagnostics. An overlap ratio at or above 0.20, measured over all\nentries or assigned entries, produces a warning that the branches are not\ncleanly separated.\n\n### 5.6 ChronicleGraph\n\nThe graph is typed and auditable. It is not a generic unbounded knowledge graph.\n\nNode types:\n\n- `Topic`\n- `Branch`\n- `ChronicleEntry`\n- `EvidenceArticle`\n- `SessionEvent`\n- `PipelineRun`\n- `Artifact`\n\nEdge types:\n\n- `precedes`\n- `branches_from`\n- `supports`\n- `contradicts`\n- `updates`\n- `supersedes`\n- `observed_in_session`\n- `derived_from_pipeline_run`\n- `persisted_as_artifact`\n\nInvariants:\n\n- `supports`, `contradicts`, and `updates` connect `EvidenceArticle` to\n  `ChronicleEntry`.\n- `precedes` and `supersedes` connect `ChronicleEntry` to `ChronicleEntry`.\n- `precedes` and `supersedes` are emitted only when reported date precision\n  proves the temporal order; stable display order is not sufficient.\n- `branches_from` connects `Branch` to `Branch`.\n- `observed_in_session` connects `SessionEvent` to evidence or entries.\n- `persisted_as_artifact` connects snapshots/projections to artifact nodes.\n- Graph builders must dedupe nodes by stable IDs.\n\n## 6. Projection Contract\n\nThe chronicle is source of truth. These projections may be materialized:\n\n| Projection | Purpose | Contract |\n| --- | --- | --- |\n| `timeline` | Chronological milestone/event list | JSON object plus text/mermaid renderers. |\n| `lineage_tree` | Branch-oriented view | JSON tree plus text/mindmap renderers. |\n| `chronicle_map` | Combined chronological and lineage view | Horizontal year anchors, ordered entry IDs, earliest-observed-in-scope branch points, global/branch display order, lineage basis, and Mermaid `flowchart LR` renderer. It does not assert causal branching or same-year precedence. |\n| `context_preview` | Lightweight inline preview for `unified_search` | Max 20 PMID-backed records, never advertised as complete. |\n| `citation_graph` | Seed or chronicle-wide citation relationships | Nodes + edges, all supported graph formats. |\n| `narrative` | Evidence-backed prose | Every substantive claim cites entry IDs and PMIDs/DOIs. |\n| `delta_report` | Revision comparison | Added/updated/not-observed entries, evidence flips, branch changes, unresolved conflicts. `retired` is a compatibility alias for `not_observed_in_revision` / `removed_from_view`, not a conclusive lifecycle claim. |\n\nThe retired timeline tool concepts remain available through Chronicle output\nmodes. `timeline_mermaid` is the bounded flat compatibility view; `mermaid` is\nthe canonical combined chronological-lineage map.\n\n## 7. Artifact Envelope Contract\n\nWhen session artifact persistence is enabled, Chronicle outputs use the existing\nartifact-as-token-offload pattern. Inline MCP responses are index cards; full\nevidence belongs in files retrievable through `read_session`. The immutable\nChronicle revision store is separate: a revision may be saved successfully even\nif preparation or persistence of the optional session artifact later fails.\n\nPreflight derives its file-name evidence from the concrete artifact payload\nbuilder, then adds the manifest generated by the artifact store. Passing\npreflight means the payload was prepared completely; only the persistence\nresult/locator can establish that it was written.\n\nEach successfully persisted Chronicle artifact uses schema\n`research-chronicle-artifact/v1` and writes:\n\n- `manifest.json`\n- `snapshot.json`\n- `chronicle_map.json`\n- `chronicle.mmd`\n- `mermaid_validation.json`\n- `timeline.json`\n- `lineage_tree.json`\n- `graph.json`\n- `evidence.json`\n- `milestones.json`\n- `audit.json`\n- `narrative.md`\n- `response.md`\n\nOn artifact success, the inline response includes:\n\n- `chronicle_id`\n- `revision`\n- `topic`\n- event/entry counts\n- source coverage summary\n- audit status\n- warnings\n- artifact locator with `artifact_id`, `artifact_uri`, file inventory, read\n  order, and paged `read_session(...)` examples\n\nIf artifact persistence was enabled but returns no locator or raises after the\nrevision was saved, Markdown exposes a warning and structured output includes\n`artifact.status=\"failed\"`. The response must not imply that the artifact exists.\n\nRemote clients and sandboxed agents must be able to retrieve every file via:\n\n```text\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"audit.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"snapshot.json\", offset=0, max_chars=200000)\n```\n\nLocal filesystem paths remain optional debug metadata and are redacted by\ndefault.\n\n## 8. MCP API Design\n\n### 8.1 Current Tools\n\nCurrent tools remain:\n\n- `build_research_chronicle`\n- `read_research_chronicle`\n- `unified_search(options=\"context_graph\")`\n- `build_citation_tree`\n\nThe Chronicle wrappers validate arguments, call `ChronicleService`, format the\nrequested projection, and attach artifact locators. Retrieval, assembly,\nlineage inference, repair, audit, persistence, and comparison remain in the\napplication layer.\n\n### 8.2 Chronicle Tool Surface\n\n- `build_research_chronicle(topic=None, pmids=None, max_events=30,\n  min_year=None, max_year=None, chronicle_id=None, output=\"summary\")`\n- `read_research_chronicle(action=\"load\", chronicle_id=None, revision=None,\n  from_revision=None, to_revision=None, topic=None, topics=None,\n  chronicle_ids=None, output=\"summary\", mode=\"brief\", limit=20)`\n\nRead actions are `load`, `list`, `diff`, `narrate`, `milestones`, and `compare`.\nRebuilding with an existing `chronicle_id` writes revision N+1, so separate\nupdate/diff/narrate MCP tools are unnecessary.\n\nCurrent bounds are enforced in both the MCP schema and runtime validation:\n`max_events` 1–200, up to 500 unique explicit PMIDs, topic text up to 500\ncharacters, list limits 1–100, positive revisions, and comparisons of 2–5\ndistinct Chronicles. `topics=...` comparison uses normalized exact stored-topic\nmatching; zero matches are not found, multiple matches are ambiguous, and\ncallers can disambiguate with `chronicle_ids=...`.\n\nTopic-mode `min_year` / `max_year` filters are sent to PubMed before the bounded\nfetch and are also defended locally. Zero usable articles and PubMed error\nsentinels return an error without allocating a revision. Explicit PMID tokens\nare strict and never inferred by stripping non-digits from DOI or mixed text.\n\n### 8.3 Output Modes\n\nStructured modes should be parseable without stripping prose:\n\n- `summary`: compact Markdown + artifact locator\n- `json`: `ChronicleSnapshot` JSON\n- `chronicle_map`: combined horizontal-spine/lineage projection JSON\n- `timeline`: timeline projection JSON\n- `tree`: lineage tree projection JSON\n- `graph`: typed graph JSON\n- `narrative`: evidence-backed Markdown\n- `delta`: revision delta JSON\n- `mermaid`: combined horizontal-spine/lineage Mermaid flowchart\n- `timeline_mermaid`: legacy flat Mermaid timeline\n\nIf a tool returns Markdown plus JSON for compatibility, the structured payload\nmust also be present in the prepared artifact bundle and, on successful\npersistence, in the stored artifact.\n\nValidation and not-found errors for JSON projections and structured read actions\nremain JSON rather than switching to prose.\n\n## 9. Audit And Completeness Requirements\n\n`ChronicleAudit` must report:\n\n- input counts: requested PMIDs, retrieved articles, excluded articles\n- source coverage: returned/available counts per source where known\n- evidence coverage: entries with supporting evidence, conflicting evidence,\n  missing identifiers, missing year, missing DOI/PMID\n- branch coverage: empty branches, orphan entries, unassigned entries\n- lineage semantics: MeSH/keyword basis, semantic coverage, selected signals,\n  singleton rejection, and explicit research-stage fallback warnings\n- Mermaid renderability: deterministic structural validation, correction list,\n  rich/safe/minimal tier, source digest, and omitted visual item counts\n- graph integrity: invalid edge endpoints, duplicate node IDs, invariant\n  violations\n- chronology checks: impossible dates, earliest-observed scope provenance, and\n  supersedes/precedes edges unsupported by reported date precision\n- narrative checks: claims without entry IDs or evidence IDs\n- artifact bundle/preflight checks: required prepared files, schema versions,\n  and read order (not a claim that persistence itself succeeded)\n- selection semantics: chronological boundaries, landmark/citation priority,\n  temporal spread, and warnings whenever retrieval or output caps prevent an\n  exhaustive view\n- lineage overlap: primary assignment, secondary cross-links, and a warning at\n  20% overlap among all or assigned entries\n- ranking semantics: milestone-detection confidence is reported separately and\n  excluded from landmark-importance ordering\n\nAudit findings use `pass`, `warn`, or `fail` with actionable messages.\n\n### 9.1 Mermaid repair contract\n\nThe canonical renderer consumes the structured `chronicle_map` instead of\nconcatenating user text into Mermaid syntax. It normalizes controls and bidi\ncharacters, entity-escapes delimiters inside quoted labels, assigns opaque\ncollision-resistant node IDs, removes cyclic parents, repairs orphan branches,\ndeduplicates repeated visual entries, and caps graph size. Serialization then\nfalls through `rich -> safe -> minimal`; a rendering failure must never abort\nchronicle creation. Any omitted content or fallback tier is disclosed in\n`mermaid_validation.json`, while the complete records remain in JSON artifacts.\n\n`chronicle.mmd` is pure Mermaid source. Markdown fences and persistent-artifact\nnotes belong only in `response.md` or the inline response. CI uses Mermaid\n11.16.1 to parse and render current rich, repaired, safe, minimal, timeline, and\nmindmap fixtures to SVG; documentation rendering isolates failures per diagram\nand preserves the failed source visibly.\n\n## 10. Completed Rebuild Phases\n\nThe following phase list records the shipped Chronicle implementation. Earlier\nproposals for six separate MCP tools were consolidated into the two-tool facade.\n\n### Phase 0: Documentation And Contract Alignment\n\n- Align the spec, README, user docs, docs site, and agent routing language.\n- Distinguish Chronicle projections from context-graph previews and citation trees.\n\n### Phase 1: Current Feature Hardening\n\n- Resolve `pmids=\"last\"` through session state and validate output modes.\n- Preserve article MeSH, keyword, publication, and identifier context across the\n  timeline boundary.\n- Add regression coverage for timeline, tree, graph, and citation projections.\n\n### Phase 2: Chronicle Snapshot Foundation\n\n- Add Chronicle domain entities, serialization, store/index, and monotonic revisions.\n- Assemble snapshots from topic searches, explicit PMIDs, and session PMIDs.\n- Persist `research-chronicle-artifact/v1` envelopes and expose build/read facades.\n\n### Phase 3: Evidence And Delta\n\n- Preserve evidence bundles and source coverage.\n- Add revision update and diff services behind build/read actions.\n\n### Phase 4: Narrative And Graph Analytics\n\n- Add evidence-backed narrative generation with strict citation IDs.\n- Add typed graph and milestone analytics behind application services.\n- Expose narrative, milestones, and comparisons as read actions.\n\n### Phase 5: Chronological Lineage Map And Mermaid Hardening\n\n- Derive explainable topic branches from MeSH descriptors and author keywords,\n  with an explicit research-stage fallback.\n- Add the horizontal `chronicle_map` coordinate contract and canonical Mermaid\n  flowchart.\n- Add deterministic repair, bounded output, rich/safe/minimal fallback,\n  validation artifacts, per-diagram docs isolation, and real Mermaid SVG CI.\n\n### Phase 6: Scientific And Persistence Integrity Hardening\n\n- Treat the first dated record as earliest-observed-in-scope provenance without\n  masking its actual milestone type; preserve ordinary papers from explicit\n  PMID sets.\n- Reject singleton semantic signals, preserve biomedical slash terms, and make\n  stage fallback warnings explicit.\n- Share precision-aware chronology across projections, graph, audit, and\n  narrative; do not infer temporal edges for equal or overlapping precision.\n- Make revisions immutable and atomically allocated, use exact topic comparison\n  with explicit ambiguity, expand revision diffs, and surface artifact failure.\n- Bound MCP inputs and keep structured-action errors machine-readable.\n\n## 11. Acceptance And Regression Tests\n\n### Surface Regression Tests\n\n- `build_research_chronicle(pmids=\"last\")` resolves the previous search PMID\n  list or returns a clear error when no last search exists.\n- Build/read support every documented output mode and reject unknown modes.\n- Timeline, lineage tree, Chronicle map, and graph projections share stable\n  Chronicle entry IDs.\n- Context graph preview covers: no PMID results, empty timeline, builder\n  exception, 20-PMID cap, JSON `research_context`, and provenance metadata.\n- Citation tree tool-level tests cover: `forward`, `backward`, `both`, depth\n  recursion, duplicate suppression, invalid direction, invalid format,\n  `cytoscape`, `g6`, `d3`, `vis`, `graphml`, and `mermaid`.\n\n### Chronicle Tests\n\n- Chronicle entities round-trip through JSON without losing required fields.\n- Chronicle graph invariants reject invalid edges.\n- Store creates monotonic revisions and stable `chronicle_id`.\n- Concurrent revision allocation is atomic and stored revisions cannot be\n  overwritten.\n- Snapshot assembly preserves source counts, query strategy, PMIDs, and\n  artifact provenance.\n- PubMed errors/no-results publish no revision; year filters reach PubMed;\n  returned/available counts and capped/unknown coverage remain auditable.\n- Event caps preserve chronological boundaries, landmark importance, and\n  temporal spread without using detection confidence as importance.\n- PMID/DOI entry identity and canonical topic normalization remain stable across\n  reclassification, correction, lookup, comparison, and continuation.\n- Diff absence is non-conclusive and semantic overlap preserves cross-links,\n  warning at the 20% threshold.\n- Projection outputs are generated from the same snapshot and reference the same\n  entry IDs.\n- Audit catches missing evidence, duplicate IDs, missing required artifact\n  bundle files, unsupported chronology edges, projection membership mismatch,\n  and narrative claims without evidence IDs.\n- Earliest-observed provenance, singleton fallback, exact/ambiguous comparison,\n  and structured validation errors have focused regression coverage.\n- MCP wrappers reject malformed PMID strings, return compact summaries with\n  artifact locators and remote-safe `read_session` hints, and preflight the\n  actual artifact payload.\n\n## 12. Backward Compatibility\n\n- The retired one-shot timeline MCP tools are replaced by\n  `build_research_chronicle` and `read_research_chronicle`; their concepts remain\n  available as chronicle projections.\n- Keep citation-tree tool names and formats stable.\n- Keep MCP Markdown responses readable and structured modes parseable.\n- Keep `unified_search(options=\"context_graph\")` as preview-only.\n- Resolve `pmids=\"last\"` through session state before Chronicle retrieval.\n\n## 13. Documentation Rules\n\nAfter this spec lands:\n\n- `README.md` and `README.zh-TW.md` are entry points, not detailed specs.\n- `docs/TOOLS_USAGE_GUIDE*.md` define current tool routing.\n- `docs/ADVANCED_RESEARCH_WORKFLOWS*.md` show user workflows.\n- This file defines the implemented Chronicle contract and its historical rationale.\n- Generated docs in `docs/site-content/` and `docs/site-content.js` must be\n  rebuilt from canonical sources.\n- Agent instructions should use this terminology:\n  - \"timeline/lineage tree\" for Chronicle projections\n  - \"context graph preview\" for `unified_search(options=\"context_graph\")`\n  - \"citation tree\" for `build_citation_tree`\n  - \"Research Chronicle\" only for the persisted/versioned artifact\n\n## 14. Subagent Audit Inputs\n\nThis spec incorporates three independent read-only audits:\n\n- Implementation/API audit: confirmed current MCP surfaces, lack of chronicle\n  code, DDD boundary issues, `pmids=\"last\"` gap, and context graph preview\n  semantics.\n- Documentation audit: found stale format lists, overloaded chronicle wording,\n  context graph wording that needs constraints, and stale public draft/tool\n  counts.\n- Test audit: found missing output-format, context graph boundary, citation tree\n  contract, real projection, and chronicle persistence tests.\n\n## 15. Decision Summary\n\nThe implementation does not grow another mode-heavy timeline tool. It uses a\nChronicle bounded context with typed, persisted, auditable, retrieval-bounded\nsnapshots. Timeline, tree, chronological-lineage map, graph, and narrative views\nare projections from that source of truth; their branches remain observational,\nnot causal claims, while MCP tools remain thin application wrappers.\n",
   "developer-guide": "<!-- Generated from docs/DEVELOPER_GUIDE.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP Developer Guide\n\nThis guide is for maintainers and contributors. It explains how the codebase is organized, where behavior belongs, how documentation is generated, and which validation commands protect the integration surface.\n\nRead this with [Architecture](#/architecture), [AGENTS.md](https://github.com/u9401066/pubmed-search-mcp/blob/master/AGENTS.md), and the [Tools Usage Guide](#/tools-usage-guide).\n\n## Repository Contract\n\nPubMed Search MCP is a Python MCP server with Domain-Driven Design boundaries:\n\n![DDD and runtime boundaries](images/ddd-runtime-boundaries.svg)\n\n```text\npresentation -> application -> domain\n                  application -> infrastructure\n```\n\nThe presentation layer exposes MCP tools, prompts, resources, and HTTP compatibility behavior. It should stay thin. Workflow orchestration belongs in `src/pubmed_search/application/`. Domain concepts belong in `src/pubmed_search/domain/`. External APIs, storage adapters, cache implementations, and provider-specific clients belong in `src/pubmed_search/infrastructure/`.\n\nShared rules:\n\n- use `uv` and `uv run`\n- fix root causes instead of layering wrapper patches\n- keep MCP tool functions as adapters over application services\n- update docs, generated tool indexes, and site payloads when behavior changes\n- avoid duplicating agent rules across `.github/`, `.clinerules/`, and `AGENTS.md`\n\n## Runtime Surfaces\n\n| Surface | Entry | Purpose |\n| --- | --- | --- |\n| Local MCP stdio | `uvx pubmed-search-mcp` or `uv run python -m pubmed_search.presentation.mcp_server` | Default local client mode |\n| Local Streamable HTTP | `pubmed-search-mcp-http --mode local --host 127.0.0.1` | Trusted single-user loopback integrations |\n| Authenticated service | `pubmed-search-mcp-http --mode service` | Fail-closed multi-user HTTP with principal-scoped state |\n| Full Copilot-compatible HTTP | `pubmed-search-mcp-http --mode service --transport streamable-http --copilot-compatible` | Authenticated remote primary MCP surface with Copilot-compatible HTTP semantics |\n| Python SDK facade | `from pubmed_search.api import PubMedSearchClient` | In-process Python package, notebook, and app integrations |\n| Simplified Copilot smoke | `uv run python run_copilot.py` | Loopback-only local schema/protocol validation; never a public tunnel |\n| Browser fetch broker | `uv run pubmed-browser-fetch-broker --token ...` | Optional local Playwright broker for authenticated PDF download capture |\n| Static docs site | `docs/index.html` plus generated payload | GitHub Pages documentation surface |\n\nDo not treat these as separate products. MCP tools, the Python SDK facade, and the HTTP CLI are separate contracts over the same core capabilities. `run_server.py` is a source-tree development wrapper; installed packages should use `pubmed-search-mcp-http`. `run_copilot.py` intentionally exposes a simplified Copilot-specific surface, but it is loopback-only and must never be placed behind a public tunnel. Remote Copilot deployments use authenticated `--mode service`.\n\nThe MCP contract uses SDK v2. Current clients call `tools/list` and `tools/call`\nwithout `initialize` or `Mcp-Session-Id`; legacy compatibility must never be\nused for identity or tenant selection. Keep every service request authorized by\nits bearer principal.\n\n## Code Map\n\n```text\nsrc/pubmed_search/\n├── domain/          # entities, value objects, domain services\n├── application/     # orchestration for search, export, timeline, pipeline, session\n├── infrastructure/  # NCBI, Europe PMC, CORE, OpenAlex, CrossRef, cache, HTTP, sources\n├── presentation/    # MCP server, HTTP API, browser broker entry point\n└── shared/          # settings, async helpers, errors, profiling\n```\n\nImportant presentation files:\n\n- `presentation/mcp_server/server.py`: server creation, DI container, stdio startup, background API\n- `presentation/mcp_server/tool_registry.py`: authoritative primary tool registry\n- `presentation/mcp_server/tools/*.py`: MCP adapters\n- `presentation/mcp_server/copilot_tools.py`: simplified Copilot Studio surface\n- `presentation/mcp_server/http_compat.py`: Copilot HTTP compatibility middleware\n- `presentation/mcp_server/http_cli.py`: packaged Streamable HTTP/SSE launcher\n- `presentation/browser_fetch_broker.py`: local browser broker CLI\n\nImportant documentation files:\n\n- `scripts/count_mcp_tools.py`: regenerates the tool index from the registry\n- `scripts/build_docs_site.py`: generates `docs/site-content/*.md` and `docs/site-content.js`\n- `docs/PYTHON_SDK_AND_HTTP_CLI_DESIGN.md`: records the separated MCP, SDK, and HTTP CLI contracts\n- `docs/site.js`: client-side docs router and language switch\n- `tests/test_docs_site_sync.py`: verifies generated docs payloads match canonical Markdown\n\n## Adding Or Changing MCP Tools\n\nUse this sequence for primary MCP tools:\n\n1. Put business logic in domain/application/infrastructure, not in the tool wrapper.\n2. Add or update the MCP adapter under `src/pubmed_search/presentation/mcp_server/tools/`.\n3. Register the tool in `tool_registry.py` with the right category and description.\n4. Add or update unit tests around the service behavior and presentation adapter.\n5. If the behavior is also available through the Python SDK, update `pubmed_search.api`, `application.unified`, and SDK contract tests.\n6. Regenerate the tool index:\n\n   ```bash\n   uv run python scripts/count_mcp_tools.py --update-docs\n   ```\n\n7. Update capability docs if the user-facing behavior changed.\n8. Rebuild the docs site:\n\n   ```bash\n   uv run python scripts/build_docs_site.py\n   ```\n\n9. Run the narrowest relevant tests first, then broader checks if the registry, docs, SDK facade, transport, or generated artifacts changed.\n\nThe generated `TOOLS_INDEX.md` should be treated as an output of the registry, not a hand-maintained source.\n\nUse `uv run python scripts/count_mcp_tools.py --json` as the source of truth for the current tool count and category count. Do not hand-count tools in docs or comments.\n\n## Adding A Source Connector\n\nSource connectors belong behind infrastructure boundaries. Keep provider-specific concerns out of MCP tool files.\n\nRecommended flow:\n\n1. Add the provider client or adapter under `infrastructure/sources/` or the appropriate infrastructure package.\n2. Model any stable cross-source concept in domain/application before it reaches presentation.\n3. Gate commercial or credentialed connectors behind explicit settings.\n4. Make the connector default-off if it depends on licensed access.\n5. Add mocked tests for CI. Keep live integration tests opt-in with\n   `PUBMED_RUN_LIVE_TESTS=1 uv run pytest -m integration` (PowerShell: set\n   `$env:PUBMED_RUN_LIVE_TESTS='1'` first).\n6. Update source contracts and user docs with rate limits, rights expectations, optional keys, and provenance behavior.\n\nDo not silently add a provider to `source=\"all\"` if it can fail without credentials or has licensing constraints.\n\n## Search And Session Behavior\n\n`unified_search` is the public text-literature search entry point. Query intelligence tools such as `parse_pico`, `generate_search_queries`, and `analyze_search_query` help the agent plan before execution. `parse_pico` is an agent-provided schema handoff: the agent extracts P/I/C/O, and the server validates that structure and returns a runnable PICO pipeline.\n\nSession tools exist so follow-up actions can reuse the latest result set. User docs should encourage `pmids=\"last\"` and session reads instead of conversational PMID memory. Code changes that affect session IDs, cached article shape, or follow-up semantics should include tests that cover multi-step workflows.\n\n## Export And Local Notes\n\nThe export layer belongs under `application/export/`. Presentation tools should not manually assemble RIS, BibTeX, CSL JSON, or Markdown note layouts.\n\nBoundary rules:\n\n- `prepare_export` is for citation and dataset exports.\n- `save_literature_notes` is for local note workflows.\n- Local note defaults use wiki-note semantics.\n- Foam-compatible wikilinks, MedPaper-style layouts, CSL JSON, and user templates are export profiles, not presentation-only behavior.\n- Directory resolution must stay documented: `output_dir`, `PUBMED_NOTES_DIR`, `PUBMED_WORKSPACE_DIR/references`, `PUBMED_DATA_DIR/references`, then `~/.pubmed-search-mcp/references`.\n- That directory/template resolution is local-only. Authenticated service tools\n  must reject caller-selected `output_dir` and `template_file`, then write built-in\n  formats below the installed tenant session root.\n\nWhen note export behavior changes, update user docs, generated docs, skills or packaged references that describe the same behavior, and tests.\n\n## Pipeline Workflows\n\nPipeline behavior is an application capability, not a shell-script feature. Canonical tutorials live in:\n\n- `docs/PIPELINE_MODE_TUTORIAL.en.md`\n- `docs/PIPELINE_MODE_TUTORIAL.md`\n\n`scripts/build_docs_site.py` also syncs these into `.claude/skills/pipeline-persistence/references/` for agent bundles and VSIX integrations that do not read `docs/site-content/`.\n\nPipeline changes should consider:\n\n- schema compatibility\n- validation errors\n- execution history\n- local versus authenticated-service storage: a tenant-derived store must not\n  inherit the process-wide workspace, and service callers cannot load `file:`\n- scheduler ownership: the service Compose profile is disabled until there is\n  a single leader/lease rather than one scheduler per worker\n- scheduling behavior\n- docs site routing\n- packaged tutorial copies\n\n## Documentation System\n\n![Documentation publishing flow](images/docs-publishing-flow.svg)\n\nCanonical Markdown sources remain in the repository. The static site embeds generated copies so GitHub Pages can serve the docs without a backend.\n\nGeneration pipeline:\n\n```bash\nuv run python scripts/count_mcp_tools.py --update-docs\nuv run python scripts/build_docs_site.py\nuv run python scripts/build_github_wiki.py --output build/github-wiki\n```\n\nGenerated outputs:\n\n- `src/pubmed_search/presentation/mcp_server/TOOLS_INDEX.md`\n- `docs/site-content/*.md`\n- `docs/site-content.js`\n- selected `.claude/skills/.../references/*.md` pipeline tutorial copies\n- `build/github-wiki/*.md` for the GitHub Wiki sync workflow\n\nWhen adding a docs page:\n\n1. Add the canonical Markdown file.\n2. Add it to `PAGES` in `scripts/build_docs_site.py`.\n3. Add matching metadata in `docs/site.js`.\n4. Rebuild the site payload.\n5. Run `uv run pytest tests/test_docs_site_sync.py -q`.\n\nThe docs site language switch is client-side state. English and Traditional Chinese pages should share a `group` in `docs/site.js` so the switch can map between translations.\n\nThe GitHub Wiki is generated from the same canonical docs by `scripts/build_github_wiki.py` and pushed by `.github/workflows/wiki.yml` to the separate wiki repository. If a page should appear in the Wiki, add it to the wiki builder `PAGES` list as well as the docs-site `PAGES` and `docs/site.js` metadata when appropriate.\n\n## Validation\n\nFor narrow changes, run the smallest useful check first. For integration surfaces, use the repo baseline:\n\n```bash\nuv run pytest -q\nuv run mypy src/ tests/\nuv run python scripts/check_async_tests.py\n```\n\nCommon focused checks:\n\n```bash\nuv run python scripts/count_mcp_tools.py --json\nuv run ruff check src/ tests/ scripts/ run_server.py run_copilot.py\nuv run pytest tests/test_docs_site_sync.py -q\nuv run python scripts/count_mcp_tools.py --update-docs\nuv run python scripts/build_docs_site.py\nuv run pubmed-search-mcp --help\nuv run pubmed-browser-fetch-broker --help\n```\n\nRun the full baseline when you change registry behavior, generated docs, public tool schemas, transport behavior, export behavior, session shape, or shared infrastructure.\n\n`tests/test_docs_site_sync.py` proves generated site payloads match canonical Markdown sources. It does not prove the Markdown facts match runtime behavior, so registry and tool-surface changes still need the count script and focused behavior tests.\n\n## GitHub Pages Deployment\n\nThe `Deploy Docs Site` workflow rebuilds the tool index and docs payload on `main` or `master` when docs, scripts, README files, deployment docs, architecture docs, or MCP server presentation files change.\n\nThe live site is served from the `docs/` artifact by GitHub Pages. If the deployed site looks stale:\n\n1. Confirm local generation is clean.\n2. Confirm the changed source path is included in `.github/workflows/pages.yml`.\n3. Check the latest Pages workflow run.\n4. Confirm `docs/site-content.js` includes the expected slug.\n\n## Common Mistakes\n\n| Mistake | Better Move |\n| --- | --- |\n| Put workflow logic directly in an MCP tool function | Add an application service and keep the tool thin |\n| Hand-edit `TOOLS_INDEX.md` | Update `tool_registry.py`, then regenerate |\n| Add docs source but forget `PAGES` or `docs/site.js` | Add both metadata paths and run docs sync tests |\n| Describe a source as always available | Document keys, rate limits, rights, and default-off behavior |\n| Add browser fallback without host restrictions | Require tokens and `allowed_hosts` |\n| Change note output shape without docs | Update user docs, generated docs, templates, and tests |\n| Treat Copilot simplified tools as the primary surface | Keep primary behavior aligned with the primary tool registry |\n\n## Release Hygiene\n\nBefore publishing or pushing integration-heavy changes:\n\n1. Regenerate tool and docs payloads.\n2. Run focused tests and the repo validation baseline.\n3. Inspect `git status --short` and stage only intentional files.\n4. Confirm generated files changed for source changes that require generation.\n5. Push and check GitHub Actions, especially the Pages workflow when docs changed.\n",
   "developer-guide-zh": "<!-- Generated from docs/DEVELOPER_GUIDE.zh-TW.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP 開發者指南\n\n這份指南給 maintainer 與 contributor。它說明 codebase 組織、行為應放在哪一層、文件如何生成，以及哪些驗證命令保護整合面。\n\n請搭配 [架構文件](#/architecture)、[AGENTS.md](https://github.com/u9401066/pubmed-search-mcp/blob/master/AGENTS.md) 與 [工具使用指南](#/tools-usage-guide-zh) 閱讀。\n\n## Repository 契約\n\nPubMed Search MCP 是 Python MCP server，架構遵守 Domain-Driven Design 邊界：\n\n![DDD 與 runtime 邊界](images/ddd-runtime-boundaries.svg)\n\n```text\npresentation -> application -> domain\n                  application -> infrastructure\n```\n\nPresentation layer 負責 MCP tools、prompts、resources 與 HTTP compatibility behavior。這層應保持 thin wrapper。Workflow orchestration 放在 `src/pubmed_search/application/`。Domain concepts 放在 `src/pubmed_search/domain/`。外部 API、storage adapters、cache implementations 與 provider-specific clients 放在 `src/pubmed_search/infrastructure/`。\n\n共享規則：\n\n- 使用 `uv` 與 `uv run`\n- 修 root cause，不疊臨時 wrapper patch\n- MCP tool functions 只做 application services 的 adapter\n- 行為改變時同步更新 docs、generated tool indexes 與 site payloads\n- 不要在 `.github/`、`.clinerules/` 與 `AGENTS.md` 重複 agent 規則\n\n## Runtime Surfaces\n\n| Surface | Entry | 用途 |\n| --- | --- | --- |\n| Local MCP stdio | `uvx pubmed-search-mcp` 或 `uv run python -m pubmed_search.presentation.mcp_server` | 預設本機 client 模式 |\n| Local Streamable HTTP | `pubmed-search-mcp-http --mode local --host 127.0.0.1` | 可信任的單使用者 loopback 整合 |\n| Authenticated service | `pubmed-search-mcp-http --mode service` | Fail-closed 多使用者 HTTP 與 principal-scoped state |\n| Full Copilot-compatible HTTP | `pubmed-search-mcp-http --mode service --transport streamable-http --copilot-compatible` | 經認證的遠端 primary MCP surface，並加上 Copilot-compatible HTTP semantics |\n| Python SDK facade | `from pubmed_search.api import PubMedSearchClient` | Python package、notebook、app 的 in-process integration |\n| Simplified Copilot smoke | `uv run python run_copilot.py` | 僅 loopback 本機 schema/protocol 驗證；禁止接公網 tunnel |\n| Browser fetch broker | `uv run pubmed-browser-fetch-broker --token ...` | 可選的本機 Playwright broker，用於 authenticated PDF download capture |\n| Static docs site | `docs/index.html` 加 generated payload | GitHub Pages 文件網站 |\n\n\nMCP tools、Python SDK facade、HTTP CLI 是同一組核心能力上的三個獨立 contract，不是三個彼此分裂的產品。`run_server.py` 只保留為 source-tree development wrapper；installed package 與遠端部署應使用 `pubmed-search-mcp-http`。`run_copilot.py` 則刻意暴露 Copilot-specific simplified surface，但只允許 loopback，禁止放在公網 tunnel 後；遠端 Copilot 一律使用 authenticated `--mode service`。\n\nMCP contract 使用 SDK v2。當前 client 會不透過 `initialize` 或 `Mcp-Session-Id`，直接呼叫\n`tools/list` 與 `tools/call`；legacy compatibility 絕不能用來識別身分或選擇 tenant。\nService 每個 request 都必須以 bearer principal 授權。\n\n## Code Map\n\n```text\nsrc/pubmed_search/\n├── domain/          # entities, value objects, domain services\n├── application/     # search, export, timeline, pipeline, session orchestration\n├── infrastructure/  # NCBI, Europe PMC, CORE, OpenAlex, CrossRef, cache, HTTP, sources\n├── presentation/    # MCP server, HTTP API, browser broker entry point\n└── shared/          # settings, async helpers, errors, profiling\n```\n\n重要 presentation 檔案：\n\n- `presentation/mcp_server/server.py`：server creation、DI container、stdio startup、background API\n- `presentation/mcp_server/tool_registry.py`：primary tool registry 的權威來源\n- `presentation/mcp_server/tools/*.py`：MCP adapters\n- `presentation/mcp_server/copilot_tools.py`：Copilot Studio simplified surface\n- `presentation/mcp_server/http_compat.py`：Copilot HTTP compatibility middleware\n- `presentation/browser_fetch_broker.py`：local browser broker CLI\n\n重要文件檔案：\n\n- `scripts/count_mcp_tools.py`：從 registry 重新生成 tool index\n- `scripts/build_docs_site.py`：生成 `docs/site-content/*.md` 與 `docs/site-content.js`\n- `docs/site.js`：client-side docs router 與 language switch\n- `tests/test_docs_site_sync.py`：確認 generated docs payloads 與 canonical Markdown 一致\n\n## 新增或修改 MCP Tools\n\nPrimary MCP tools 建議流程：\n\n1. 把 business logic 放在 domain/application/infrastructure，不放在 tool wrapper。\n2. 在 `src/pubmed_search/presentation/mcp_server/tools/` 新增或更新 MCP adapter。\n3. 在 `tool_registry.py` 登錄 tool，選對 category 與 description。\n4. 增加或更新 service behavior 與 presentation adapter 的 tests。\n5. 重新生成 tool index：\n\n   ```bash\n   uv run python scripts/count_mcp_tools.py --update-docs\n   ```\n\n6. 如果 user-facing behavior 改變，同步更新 capability docs。\n7. 重建 docs site：\n\n   ```bash\n   uv run python scripts/build_docs_site.py\n   ```\n\n8. 先跑最小相關測試；如果 registry、docs、transport 或 generated artifacts 改變，再跑更廣的驗證。\n\n`TOOLS_INDEX.md` 是 registry 的生成結果，不應手動維護。\n\n目前 tool count 與 category count 的 source of truth 是 `uv run python scripts/count_mcp_tools.py --json`。不要在 docs 或 comments 手數工具。\n\n## 新增 Source Connector\n\nSource connector 必須待在 infrastructure boundary 後面。Provider-specific concerns 不應流進 MCP tool files。\n\n建議流程：\n\n1. 在 `infrastructure/sources/` 或對應 infrastructure package 加 provider client 或 adapter。\n2. 任何穩定的跨來源概念，先在 domain/application 建模，再進 presentation。\n3. Commercial 或 credentialed connectors 要用 explicit settings gate。\n4. 依賴 licensed access 的 connector 預設保持 default-off。\n5. CI 使用 mocked tests；live integration tests 必須明確 opt-in：先設定\n   `PUBMED_RUN_LIVE_TESTS=1`（PowerShell 用 `$env:PUBMED_RUN_LIVE_TESTS='1'`），\n   再執行 `uv run pytest -m integration`。\n6. 更新 source contracts 與 user docs，說明 rate limits、rights expectations、optional keys 與 provenance behavior。\n\n如果某 provider 沒 credential 會失敗或有授權限制，不要默默加進 `source=\"all\"`。\n\n## Search 與 Session 行為\n\n`unified_search` 是公開文字文獻搜尋入口。`parse_pico`、`generate_search_queries` 與 `analyze_search_query` 等 query intelligence tools 協助 agent 在執行搜尋前規劃。`parse_pico` 是 agent-provided schema handoff：agent 抽出 P/I/C/O，server 驗證該結構並回傳可執行的 PICO pipeline。\n\nSession tools 的存在，是讓 follow-up actions 重用最新 result set。User docs 應鼓勵使用 `pmids=\"last\"` 與 session reads，而不是讓模型靠對話記憶 PMID。任何影響 session IDs、cached article shape 或 follow-up semantics 的變更，都應包含多步驟 workflow tests。\n\n## Export 與本機 Notes\n\nExport layer 屬於 `application/export/`。Presentation tools 不應手動組 RIS、BibTeX、CSL JSON 或 Markdown note layouts。\n\n邊界規則：\n\n- `prepare_export` 負責 citation 與 dataset exports。\n- `save_literature_notes` 負責 local note workflows。\n- Local note defaults 使用 wiki-note semantics。\n- Foam-compatible wikilinks、MedPaper-style layouts、CSL JSON 與 user templates 是 export profiles，不是 presentation-only behavior。\n- 輸出目錄解析順序必須保持文件化：`output_dir`、`PUBMED_NOTES_DIR`、`PUBMED_WORKSPACE_DIR/references`、`PUBMED_DATA_DIR/references`、`~/.pubmed-search-mcp/references`。\n- 這套 directory/template resolution 只屬於本機模式。Authenticated service tools 必須拒絕\n  caller-selected `output_dir` 與 `template_file`，並將內建 format 寫到 installed tenant\n  session root 之下。\n\nNote export 行為改變時，要同步更新 user docs、generated docs、描述同一行為的 skills 或 packaged references，以及 tests。\n\n## Pipeline Workflows\n\nPipeline behavior 是 application capability，不是 shell script feature。Canonical tutorials 位於：\n\n- `docs/PIPELINE_MODE_TUTORIAL.en.md`\n- `docs/PIPELINE_MODE_TUTORIAL.md`\n\n`scripts/build_docs_site.py` 會另外同步到 `.claude/skills/pipeline-persistence/references/`，讓不讀 `docs/site-content/` 的 agent bundles 與 VSIX integrations 仍能取得教學。\n\nPipeline 變更需要同時考慮：\n\n- schema compatibility\n- validation errors\n- execution history\n- scheduling behavior\n- local 與 authenticated-service storage：tenant-derived store 不能繼承 process-wide\n  workspace，service caller 不能載入 `file:`\n- scheduler ownership：在具備單一 leader/lease 前，service Compose profile 必須停用，不能\n  每個 worker 各自執行 scheduler\n- docs site routing\n- packaged tutorial copies\n\n## Documentation System\n\n![文件發布流程](images/docs-publishing-flow.svg)\n\nCanonical Markdown sources 仍在 repo 裡。Static site 會 embed generated copies，讓 GitHub Pages 不需要 backend 也能服務文件。\n\n生成流程：\n\n```bash\nuv run python scripts/count_mcp_tools.py --update-docs\nuv run python scripts/build_docs_site.py\nuv run python scripts/build_github_wiki.py --output build/github-wiki\n```\n\nGenerated outputs：\n\n- `src/pubmed_search/presentation/mcp_server/TOOLS_INDEX.md`\n- `docs/site-content/*.md`\n- `docs/site-content.js`\n- 選定的 `.claude/skills/.../references/*.md` pipeline tutorial copies\n- `build/github-wiki/*.md`，供 GitHub Wiki sync workflow 使用\n\n新增 docs page 時：\n\n1. 新增 canonical Markdown file。\n2. 加到 `scripts/build_docs_site.py` 的 `PAGES`。\n3. 在 `docs/site.js` 加對應 metadata。\n4. 重建 site payload。\n5. 執行 `uv run pytest tests/test_docs_site_sync.py -q`。\n\nDocs site 的 language switch 是 client-side state。英文與繁中頁應在 `docs/site.js` 共用同一個 `group`，這樣切換語言時才能映射到對應翻譯。\n\nGitHub Wiki 也由同一批 canonical docs 生成：`scripts/build_github_wiki.py` 會輸出 wiki-friendly Markdown，`.github/workflows/wiki.yml` 再推到獨立的 wiki repository。若新頁面也要出現在 Wiki，除了 docs site 的 `PAGES` 與 `docs/site.js` metadata，需要同步加入 wiki builder 的 `PAGES`。\n\n## Validation\n\n窄變更先跑最小有效檢查。整合面變更使用 repo baseline：\n\n```bash\nuv run pytest -q\nuv run mypy src/ tests/\nuv run python scripts/check_async_tests.py\n```\n\n常見 focused checks：\n\n```bash\nuv run python scripts/count_mcp_tools.py --json\nuv run ruff check src/ tests/ scripts/ run_server.py run_copilot.py\nuv run pytest tests/test_docs_site_sync.py -q\nuv run python scripts/count_mcp_tools.py --update-docs\nuv run python scripts/build_docs_site.py\nuv run pubmed-search-mcp --help\nuv run pubmed-browser-fetch-broker --help\n```\n\n當你改到 registry behavior、generated docs、public tool schemas、transport behavior、export behavior、session shape 或 shared infrastructure，就要跑完整 baseline。\n\n`tests/test_docs_site_sync.py` 只能證明 generated site payloads 和 canonical Markdown sources 一致；它不證明 Markdown 裡的事實和 runtime behavior 一致。因此 registry 與 tool-surface 變更仍要跑 count script 與 focused behavior tests。\n\n## GitHub Pages 部署\n\n`Deploy Docs Site` workflow 會在 `main` 或 `master` 上，針對 docs、scripts、README、deployment docs、architecture docs 或 MCP server presentation files 變更時，重建 tool index 與 docs payload。\n\nLive site 由 GitHub Pages 發布 `docs/` artifact。如果 deployed site 看起來過期：\n\n1. 確認本機 generation 是乾淨的。\n2. 確認變更的 source path 有包含在 `.github/workflows/pages.yml`。\n3. 檢查最新 Pages workflow run。\n4. 確認 `docs/site-content.js` 包含預期 slug。\n\n## 常見錯誤\n\n| 錯誤 | 更好的做法 |\n| --- | --- |\n| 把 workflow logic 寫進 MCP tool function | 新增 application service，讓 tool 保持 thin |\n| 手動改 `TOOLS_INDEX.md` | 改 `tool_registry.py` 後重新生成 |\n| 新增 docs source 但忘了 `PAGES` 或 `docs/site.js` | 同步加入兩個 metadata 位置，並跑 docs sync tests |\n| 把 source 描述成永遠可用 | 說明 keys、rate limits、rights 與 default-off behavior |\n| 加 browser fallback 但沒限制 host | 要求 token 與 `allowed_hosts` |\n| 改 note output shape 卻不改 docs | 更新 user docs、generated docs、templates 與 tests |\n| 把 Copilot simplified tools 當 primary surface | Primary behavior 應對齊 primary tool registry |\n\n## Release Hygiene\n\n發佈或推送 integration-heavy changes 前：\n\n1. 重新生成 tool 與 docs payloads。\n2. 執行 focused tests 與 repo validation baseline。\n3. 檢查 `git status --short`，只 stage intentional files。\n4. 確認需要 generation 的 source changes 有對應 generated files。\n5. Push 後檢查 GitHub Actions，docs changed 時尤其要看 Pages workflow。\n",
   "python-sdk-http-cli-design": "<!-- Generated from docs/PYTHON_SDK_AND_HTTP_CLI_DESIGN.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# Python SDK And HTTP CLI Design\n\nStatus: implemented as a compatibility-first application facade.\n\n## Problem\n\nThe package already works well as an MCP server, but Python callers previously\nhad to choose between low-level `LiteratureSearcher` imports and presentation\ninternals under `pubmed_search.presentation.mcp_server.tools`. That made the\nexternal package API hard to describe and encouraged callers to depend on MCP\ntool modules.\n\nThe HTTP server was also documented through the source-tree `run_server.py`\nscript, which is not an installed package entry point.\n\n## Contracts\n\nThe project now has three explicit external contracts:\n\n| Contract | Entry | Audience |\n| --- | --- | --- |\n| MCP tool surface | `uvx pubmed-search-mcp` and `/mcp` | AI agents and MCP clients |\n| Python SDK facade | `from pubmed_search.api import PubMedSearchClient` | Python packages and notebooks |\n| HTTP MCP server CLI | `pubmed-search-mcp-http --mode service --transport streamable-http` | Authenticated remote MCP deployments |\n\nThese contracts are related but separate. The auxiliary HTTP cache API is not\nthe Python SDK, and the Python SDK is not a replacement for MCP tool discovery.\n\n## Design\n\n`pubmed_search.api` is a lightweight facade. Importing it must not load MCP SDK v2 `MCPServer`,\nHTTP clients, settings, YAML, or source registries. The client creates\nruntime dependencies lazily when a method is called.\n\n`pubmed_search.application.unified` owns the stable request/service contract for\nunified search. It accepts an injected runner so application and SDK callers do\nnot import MCP presentation modules at import time.\n\n`pubmed_search.presentation.mcp_server.tools.unified_runner` remains in the\npresentation layer because it still formats MCP-compatible strings, reports\nMCP SDK v2 progress, records request-scoped MCP session state, and persists\ntenant-owned session artifacts.\nThe MCP tool wrapper injects its module-level dependencies into the runner so\nexisting tests and private patch points remain compatible.\n\n## Deferred Work\n\nThe full unified-search execution stack still has presentation-side behavior:\nsession notification, artifact persistence, response formatting, and source\nrunner wiring. Moving those into pure application services should happen with\nports for progress, session recording, artifact writing, and source execution.\nThat migration can be staged without breaking the SDK facade added here.\n\n## Verification\n\nThe compatibility contract is covered by:\n\n- `tests/test_public_api_facade.py`\n- `tests/test_package_entrypoints.py`\n- `tests/test_import_surface.py::test_public_api_import_keeps_mcp_and_http_lazy`\n- existing unified-search MCP tests that patch presentation module hook points\n",
-  "architecture": "<!-- Generated from ARCHITECTURE.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP - 系統架構文件\n\n> Current architecture reference for the active codebase and deployment surface.\n\n## 系統總覽\n\nPubMed Search MCP 是一個以 Domain-Driven Design 為核心的 MCP 伺服器，提供 45 個 MCP tools、session 快取、pipeline 持久化與排程，以及 stdio 與 HTTP 兩種 transport。\n\n目前的公開入口已收斂為：\n\n- `unified_search`: 唯一的文字文獻搜尋入口\n- `get_fulltext`: 唯一的公開全文入口\n- `parse_pico`, `generate_search_queries`, `analyze_search_query`: query intelligence; `parse_pico` validates agent-provided P/I/C/O and returns a runnable PICO pipeline.\n- `find_related_articles`, `find_citing_articles`, `get_article_references`, `build_citation_tree`: 探索層\n\n## 產品視角\n\n如果從產品而不是程式碼看，這個系統主要在服務三類任務：\n\n| 使用者 / 情境 | 他想完成什麼 | 典型入口 |\n| --- | --- | --- |\n| 臨床工作者 | 快速回答臨床問題、比較治療、追研究證據 | Agent P/I/C/O -> `parse_pico` -> `unified_search(template:pico)` |\n| 研究者 / 學生 | 找代表性文獻、讀全文、追引用與主題發展脈絡、匯出引用 | `unified_search`, `get_fulltext`, `build_research_chronicle`, `prepare_export` |\n| AI agent / workflow builder | 把搜尋、判讀、匯出、排程串成可重跑流程 | `unified_search`, `read_session`, `manage_pipeline` |\n\n這個文件後面會談 DDD 與 transport，但產品上真正交付的是一條研究工作流：\n\n1. 定義問題\n2. 擴展查詢\n3. 搜尋與篩選\n4. 深入閱讀與探索\n5. 產出可重用結果\n\n## 使用者旅程圖\n\n```mermaid\njourney\n    title 從研究問題到可重用輸出的使用者旅程\n    section 定義問題\n      用自然語言描述主題: 5: User\n      用 PICO、ICD 或關鍵詞收斂問題: 4: User, Agent\n    section 搜尋與擴展\n      產生 MeSH、同義詞與查詢策略: 5: Agent, MCP\n      執行多來源搜尋並快取結果: 5: MCP\n    section 深入判讀\n      看相關文章、被引用與參考文獻: 5: User, Agent\n      讀全文、圖表、研究編年史與指標: 4: User, Agent\n    section 整理與重用\n      匯出 RIS 或 BibTeX: 5: User\n      保存 pipeline 供後續重跑: 4: User, Team\n```\n\n這張圖故意不提模組名稱，因為它要回答的是「使用者一路上感受到什麼能力」，而不是「工程上哪些 package 參與了」。\n\n## 功能地圖\n\n```mermaid\nflowchart TB\n  subgraph Discover[1. 發現研究]\n    D1[Quick search<br/>unified_search]\n    D2[Structured query building<br/>agent PICO handoff / generate_search_queries / analyze_search_query]\n    D3[ICD to MeSH expansion<br/>convert_icd_mesh / auto-detect in unified_search]\n  end\n\n  subgraph Understand[2. 理解證據]\n    U1[Article exploration<br/>related / citing / references / citation tree]\n    U2[Full text and figures<br/>get_fulltext / get_article_figures / text-mined terms]\n    U3[Impact and evolution<br/>citation metrics / versioned research chronicle]\n  end\n\n  subgraph Specialize[3. 延伸查詢]\n    S1[Gene, compound, variant research]\n    S2[Biomedical image search]\n    S3[Institutional access fallback]\n  end\n\n  subgraph Reuse[4. 重用與協作]\n    R1[Session cache and follow-up actions]\n    R2[Export citations and datasets]\n    R3[Save / load / review pipelines]\n  end\n\n  Discover --> Understand\n  Understand --> Specialize\n  Understand --> Reuse\n  Specialize --> Reuse\n```\n\n功能地圖的重點是把「產品能力區塊」先分清楚：\n\n- `Discover` 負責把模糊問題變成候選文獻\n- `Understand` 負責把候選文獻變成可判讀的證據脈絡\n- `Specialize` 負責把一般搜尋延伸到特定資料域\n- `Reuse` 負責把一次性的研究操作轉成可保存、可分享、可重跑的資產\n\n下面的技術架構圖，則是在回答這些產品能力分別由哪一層系統承接。\n\n## 快速架構圖\n\n![DDD 與 runtime 邊界](images/ddd-runtime-boundaries.svg)\n\n```mermaid\nflowchart LR\n  Client[Human / AI Client]\n  MCP[MCP Server<br/>presentation/mcp_server]\n  API[Background HTTP API<br/>health / cache / exports]\n  App[Application Layer<br/>search chronicle timeline pipeline export]\n  Broker[Capability-aware Literature Broker<br/>one unified_search facade]\n  Domain[Domain Layer<br/>article chronicle timeline pipeline entities]\n  Infra[Infrastructure Layer<br/>NCBI / Europe PMC / CORE / OpenAlex / Unpaywall / institutional]\n  DataPlane[Operator Data Plane<br/>release manifest / diff / snapshot checkpoint]\n  Store[Session + Pipeline + Chronicle Store]\n\n  Client --> MCP\n  MCP --> App\n  MCP --> API\n  App --> Broker\n  Broker --> Domain\n  Broker --> Infra\n  DataPlane --> Infra\n  App --> Store\n```\n\n這張圖的重點不是列出每個模組，而是先讓讀者快速抓到三件事：\n\n- 所有使用者互動都先進入 MCP presentation layer\n- 真正的工作流編排在 application layer\n- 外部資料源與持久化能力都被隔離在 infrastructure / store 邊界之外\n- 通用文獻搜尋只有 `unified_search`；provider relevance/bulk/semantic/cursor\n  都是 capability-aware broker 的內部 execution mode\n- 大型 dataset/snapshot 是 operator data plane，絕不在 MCP request 中下載\n\n### Provider-aware broker 的實際資料流\n\n```mermaid\nflowchart LR\n  Request[unified_search request] --> Normalize[Strict options / filters validation]\n  Normalize --> Journal[Start tenant search-run journal]\n  Journal --> Cap[SourceCapabilities validation]\n  Cap -->|default| Relevance[Keyword / relevance adapters]\n  Cap -->|native_semantic| OASem[OpenAlex search.semantic]\n  Cap -->|systematic| Bounded[OpenAlex cursor / S2 bulk]\n  Relevance --> Page[SourceSearchPage raw DTO envelope]\n  OASem --> Page\n  Bounded --> Page\n  Page --> Map[Single provider mapper boundary]\n  Map --> Merge[Dedup / rank / provenance]\n  Merge --> Outcome[search_status + source_metadata]\n  Outcome --> Artifact[Optional atomic artifact publish]\n  Artifact --> Commit[Terminal search-run commit]\n  Outcome -->|persistence disabled| Commit\n  Commit --> Result[Articles + recovery handoff]\n```\n\n`SourceCapabilities` 目前提供 search modes、pagination、page/mode limits、\nbatch limit、counts/provenance 與 operator data-plane status；planner 會在 I/O 前\n拒絕明確且不相容的 source/mode。Normalization 也會 fail-closed：未知／格式錯誤的\nfilter 或 option、非 `1..100` 的 limit、反向／越界年份及不支援的 ranking/output\n不會被靜默忽略。`SourceSearchPage` 保留 raw provider items、\ntotal、opaque continuation、canonical query、cost、warnings 與 safe metadata，\n直到 domain mapper 只做一次轉換。JSON/TOON 和 artifact 的\n`source_metadata`／`query_strategy.json` 會保留實際 requested/provider mode、\ncompiled query、continuation 與 cost/rate diagnostics。\n\n`options=\"native_semantic\"` 與 `options=\"systematic\"` 互斥並關閉多策略 deep\nexpansion；public per-source `limit` 仍最多 100。因此 systematic 是 bounded\nretrieval policy，不代表已下載全 corpus 或保證 systematic-review exhaustiveness。\n一般 deep mode 則把同一個 per-source `limit` 分配到該來源的所有 strategies，\n並以全域／每來源 semaphore、strategy timeout 與 clipping 保證 budget 不因 query\nexpansion 倍增。單一來源失敗只形成 source-scoped error，其他成功來源仍可形成\npartial response。\n\nStructured `search_status` 明確回報 `completed`／`empty`／`partial`／`failed`、\n`bounded=true`、`exhaustive=false`、source sets 與 continuation/unknown-completeness。\nContinuation token/cursor 目前只保留為 provenance；公開 `unified_search` 尚未提供\ncursor-resume input。\nSemantic Scholar dataset client 本輪只處理 release/dataset/diff metadata；\nOpenAlex 只宣告官方 snapshot 路徑可供 operator 規劃，兩者都尚未形成 runtime local\nindex。ClinicalKey AI 則以獨立 governance policy 保持 default-off、\nentitlement/contract gated、metadata-only、zero-persistence，且不註冊為 source/tool。\n\n> **DDD 遷移註記**：上述 capability planning/execution 目前仍實作在\n> `presentation/mcp_server/tools/unified_planning.py` 與\n> `unified_execution.py`；`application/unified` 現階段只是 injected-runner\n> facade。這是已知技術債。目標是把不依賴 MCP progress/session/renderer 的純\n> planner 與 broker core 下移 application，presentation 僅保留 transport adapter。\n\n## 全文擷取流程\n\n![全文擷取流程](images/fulltext-retrieval-flow.svg)\n\n`get_fulltext` 不是固定三段式 API 呼叫，而是 identifier-aware 的 retrieval policy：有 PMCID 時優先嘗試 Europe PMC XML；有 DOI 時查 Unpaywall OA locations；若仍沒有正文，會依設定嘗試 institutional direct/EZproxy fetch、CORE，以及 extended PDF retrieval fallback。Browser-session broker 只在本機 broker 已啟用、token 與 allowed hosts 合格，且該 fallback 被允許時才會參與。\n\n## 設計原則\n\n| 原則 | 說明 |\n| --- | --- |\n| Agent-First | 回傳格式優先支援 AI agent 決策與後續工具編排 |\n| Task-Oriented | 工具以研究工作流分組，不直接暴露每個底層 API client |\n| Domain-Driven | 查詢、文章、chronicle、timeline、pipeline 等核心概念在 domain/application 中建模 |\n| Multi-Source | PubMed 為核心，並整合 Europe PMC、CORE、OpenAlex、Semantic Scholar、CrossRef、first-class preprint sources |\n| Capability-Aware | Query intent 先轉成 provider-neutral plan，再依 source 的 mode/filter/page/cost/rights 能力編譯；不支援的條件不會被無聲忽略 |\n| Rights-Aware Data Plane | Live API、local snapshot 與 licensed evidence 各自有 retention、provenance、cost 與 operator 邊界 |\n| Session-Aware | 搜尋結果會自動快取於 session，支援後續全文、匯出與探索 |\n\n## 目前的 DDD 結構\n\n```text\nsrc/pubmed_search/\n├── domain/\n│   ├── entities/\n│   │   ├── article.py\n│   │   ├── chronicle.py\n│   │   ├── figure.py\n│   │   ├── image.py\n│   │   ├── pipeline.py\n│   │   ├── research_tree.py\n│   │   └── timeline.py\n│   ├── services/\n│   └── value_objects/\n├── application/\n│   ├── chronicle/\n│   ├── export/\n│   ├── image_search/\n│   ├── pipeline/\n│   ├── search/\n│   ├── session/\n│   └── timeline/\n├── infrastructure/\n│   ├── cache/\n│   ├── http/\n│   ├── ncbi/\n│   ├── pubtator/\n│   └── sources/\n├── presentation/\n│   ├── api/\n│   └── mcp_server/\n└── shared/\n```\n\n## 分層關係\n\n```text\nPresentation\n  ├─ mcp_server/server.py\n  ├─ mcp_server/tool_registry.py\n  ├─ mcp_server/tools/*.py\n  ├─ mcp_server/prompts.py\n  ├─ mcp_server/resources.py\n  └─ api/server.py\n\nApplication\n  ├─ chronicle/   immutable revision 組裝、lineage、projection、audit、diff、narration 與 Mermaid 修復\n  ├─ search/      查詢分析、語意增強、多源整合、重現性/排序\n  ├─ timeline/    timeline 建構、policy-driven milestone 分析、landmark scoring、diagnostics 聚合\n  ├─ pipeline/    executor、schema、validator、runner、store、report、templates\n  ├─ export/      引用輸出工作流\n  ├─ session/     session 管理\n  └─ image_search 視覺查詢建議\n\nDomain\n  ├─ UnifiedArticle / ChronicleSnapshot / ChronicleEntry / ChronicleBranch / ChronicleGraph\n  ├─ Figure / Timeline / Pipeline entities\n  └─ value objects / domain services\n\nInfrastructure\n  ├─ ncbi/        Entrez / iCite / exporter\n  ├─ fulltext/    fulltext registry 與 identifier-aware orchestration policy\n  ├─ sources/     Europe PMC / CORE / OpenAlex / Semantic Scholar / CrossRef / Unpaywall / Open-i / preprints / institutional direct-EZproxy / browser-session client\n  ├─ scheduling/  APScheduler-backed pipeline scheduling\n  ├─ pubtator/    semantic enhancement / entity extraction\n  └─ http/        shared HTTP client concerns\n\nShared\n  ├─ settings.py  Pydantic Settings runtime configuration\n  └─ async / error / profiling helpers\n```\n\n依賴方向維持由外向內：presentation → application → domain，infrastructure 實作外部整合並由上層組合使用。\n\nTimeline 子系統目前拆分為：\n\n- `timeline_builder.py`：timeline orchestration、landmark score 掛載、timeline-level diagnostics 聚合\n- `milestone_detector.py`：milestone detection orchestration 與 TimelineEvent 建構\n- `milestone_policy.py`：regex、publication type、citation threshold policy tables\n- `diagnostics.py`：把 event-level detection/landmark 診斷整理成 MCP 可用的穩定 payload\n- `landmark_policy.py` / `landmark_scorer.py`：多訊號 landmark scoring policy 與計分實作\n\nChronicle 子系統在 timeline evidence provider 之上建立不可變 revision，並由同一份\n`ChronicleSnapshot` 投影出 timeline、tree、narrative、graph 與 `chronicle_map`。其中\n`chronicle_map` 以橫向年份主軸保留論文先後，再依重複出現的 MeSH／關鍵詞訊號切出\n主題分支；branch point 只代表「本次範圍內最早觀察到」，不宣稱因果或全領域首創。\n\nMermaid 輸出會先做 deterministic label／結構正規化，再依 `rich → safe → minimal`\n降級；完整座標與省略診斷仍保留在 `chronicle_map.json` 與\n`mermaid_validation.json`。Runtime 不依賴 Node.js，而 CI 使用固定 Mermaid 11.16.1\n與 jsdom 26.1.0 對文件及 smoke fixtures 執行真實 parse／SVG render，避免只有字串\nlint 通過但客戶端仍無法顯示。\n\n```mermaid\nflowchart TB\n    Presentation[Presentation]\n    Application[Application]\n    Domain[Domain]\n    Infrastructure[Infrastructure]\n\n    Presentation --> Application\n    Application --> Domain\n    Application --> Infrastructure\n    Infrastructure -. implements external integrations .-> Domain\n```\n\n## MCP 伺服器組成\n\n`presentation/mcp_server/` 是目前的 MCP 入口，主要模組如下：\n\n```text\npresentation/mcp_server/\n├── server.py          MCP server 建立、DI container、stdio 啟動、背景 HTTP API\n├── tool_registry.py   45 tools / 16 categories 的權威 registry\n├── tools/             實際 MCP tool 實作\n├── session_tools.py   session 相關 tools 與 resources\n├── prompts.py         預設 prompt workflow\n├── resources.py       filter / category / tool resources\n├── instructions.py    server 指令與 agent 使用說明\n├── copilot_tools.py   Copilot Studio 簡化 schema 專用 tool surface\n└── http_compat.py     Copilot HTTP compatibility middleware\n```\n\n```mermaid\nflowchart LR\n  Server[server.py]\n  Registry[tool_registry.py]\n  Tools[tools/*.py]\n  Session[session_tools.py]\n  Prompts[prompts.py]\n  Resources[resources.py]\n  Copilot[copilot_tools.py]\n  Compat[http_compat.py]\n\n  Server --> Registry\n  Server --> Tools\n  Server --> Session\n  Server --> Prompts\n  Server --> Resources\n  Server --> Copilot\n  Server --> Compat\n  Registry --> Tools\n```\n\n這張圖比較接近維護者視角：`server.py` 是裝配中心，`tool_registry.py` 決定公開 surface，`tools/` 與 `session_tools.py` 提供實際能力，而 Copilot 相容層是額外分支，不是主架構本體。\n\n## 工具分類\n\n目前 registry 定義 16 個 category、45 個公開 MCP tools：\n\n| 類別 | 工具數 | 代表工具 |\n| --- | --- | --- |\n| 搜尋工具 | 1 | `unified_search` |\n| 查詢智能 | 3 | `parse_pico`, `generate_search_queries`, `analyze_search_query` |\n| 文章探索 | 5 | `fetch_article_details`, `find_related_articles`, `find_citing_articles` |\n| 引用驗證 | 1 | `verify_reference_list` |\n| 全文工具 | 2 | `get_fulltext`, `get_text_mined_terms` |\n| 圖表擷取 | 1 | `get_article_figures` |\n| NCBI 延伸 | 7 | `search_gene`, `search_compound`, `search_clinvar` |\n| 引用網絡 | 1 | `build_citation_tree` |\n| 匯出工具 | 2 | `prepare_export`, `save_literature_notes` |\n| Session 管理 | 5 | `read_session`, `get_session_pmids`, `get_cached_article`, `get_session_summary`, `get_session_log` |\n| 機構訂閱 | 5 | `configure_institutional_access`, `get_institutional_link`, `diagnose_institutional_access` |\n| 視覺搜索 | 1 | `analyze_figure_for_search` |\n| ICD 轉換 | 1 | `convert_icd_mesh` |\n| 研究編年史 | 2 | `build_research_chronicle`, `read_research_chronicle` |\n| 圖片搜尋 | 1 | `search_biomedical_images` |\n| Pipeline 管理 | 7 | `manage_pipeline`, `save_pipeline`, `list_pipelines`, `load_pipeline`, `delete_pipeline`, `get_pipeline_history`, `schedule_pipeline` |\n\n## Runtime 與多 Agent 服務模型\n\n這個 server 將執行邊界分成三個明確合約，不以單純改 bind address 來互換：\n\n| 合約 | 身分/狀態 | 網路邊界 |\n| --- | --- | --- |\n| 本機 stdio | 單一本機使用者與 local store | 無 MCP listening port；背景 auxiliary HTTP 預設關閉 |\n| 本機 loopback HTTP | 可信單使用者；跨 request 共用 durable `default` tenant | 僅能 loopback；container bind 必須顯式 opt-in 且 host 只 publish loopback |\n| 多使用者 service | bearer token principal 與 principal-scoped store | 遠端 HTTPS；auth、resource URL、Host/Origin allowlist 全部 fail closed |\n\nProtocol baseline 是 MCP SDK v2。現代 2026-07-28 request model 直接送\n`tools/list` / `tools/call`，不建立 `initialize` handshake，也不依賴\n`Mcp-Session-Id`。Legacy transport compatibility 只是 protocol adapter，不能成為身分、租戶或\ndurability 邊界。\n\n```mermaid\nflowchart LR\n  A1[Agent A<br/>Bearer token A]\n  A2[Agent B<br/>Bearer token B]\n  Stdio[本機 stdio]\n  LocalHTTP[本機 loopback HTTP]\n  MW[Service tenancy middleware<br/>驗證 bearer principal + 公平配額]\n  REG[SessionManagerRegistry]\n  SA[(tenant A store)]\n  SB[(tenant B store)]\n  SD[(durable default tenant)]\n\n  A1 --> MW\n  A2 --> MW\n  Stdio --> SD\n  LocalHTTP --> SD\n  MW --> REG\n  REG --> SA\n  REG --> SB\n```\n\nLocal stdio 與顯式 `--mode local` 的 loopback HTTP 都是單使用者合約，使用 durable\n`default` tenant，因此 `pmids=\"last\"`、session、cache 與 export 可跨 MCP requests\n保留。Service mode 只接受已驗證的 bearer principal 作為 tenant 與授權邊界；\n匿名 service request 會 fail closed。\nMCP transport session identifier 不是身分、不用於租戶授權，也不能賦予持久化權限。\n\n| 關注點 | 模組 |\n| --- | --- |\n| 租戶身分與 context 綁定 | `shared/tenancy.py` |\n| 每租戶 session 池與儲存根目錄 | `application/session/registry.py` |\n| Bearer token 驗證 | `infrastructure/auth/static_tokens.py` |\n| 每請求綁定 + 公平配額 | `presentation/mcp_server/tenancy.py` |\n| 輔助 HTTP API 守門 | `presentation/mcp_server/http_security.py` |\n\n上游速率限制刻意維持全域（NCBI 依 API key 計量），每租戶並行上限則負責公平性。\n實際設定與運維細節見 [DEPLOYMENT.md](#/deployment) 的「多 Agent 正式服務」章節。\n\n> `presentation/api/server.py` 的 FastAPI 輔助伺服器是單租戶的歷史元件，\n> 不在多 agent MCP 路徑上，也未被任何 launcher 掛載。\n\n## Runtime 設定與來源治理\n目前 runtime config 已集中到 `shared/settings.py`，由 Pydantic Settings 解析環境變數，避免 presentation / infrastructure 各自直接讀取 `os.environ`。\n多來源搜尋也已改為 registry-driven：`infrastructure/sources/registry.py` 統一管理來源 metadata、`auto/all/-source` expression 解析、default-off 商業來源 gating，以及 `PUBMED_SEARCH_DISABLED_SOURCES` 全域停用機制。\n\n全文路徑也已開始同樣的抽層：`application/fulltext/registry.py` 定義 retrieval policy 與 source metadata，`application/fulltext/service.py` 承接 identifier-aware orchestration；`infrastructure/sources/fulltext_registry.py` 與 `fulltext_service.py` 只是歷史 import path 的 compatibility re-export。`get_fulltext` tool 只保留 normalization、progress/log bridge、factory wiring 與 response formatting。\n\n## 搜尋流程\n\n`unified_search` 的高階流程如下：\n\n```text\nunified_search(query or pipeline)\n  → mode-aware normalization\n  → start search-run/v1 journal\n  → capability validation / credential-bearing pipeline rejection\n  → query: analyze / enhance / dispatch / dedupe / rank\n  → pipeline: parse inline or load saved / dry-run or execute / checkpoint steps\n  → optional artifact publish + terminal run commit\n  → session cache + formatted response\n```\n\n```mermaid\nsequenceDiagram\n  participant U as User / Agent\n  participant M as MCP Tool\n  participant Q as QueryAnalyzer\n  participant S as Source Clients\n  participant P as Pipeline Executor\n  participant J as SearchRun Journal\n  participant A as Artifact / Session Store\n\n  U->>M: unified_search(query or pipeline)\n  M->>M: mode-aware normalization\n  M->>J: start(run_id, sanitized request)\n  M->>M: validate capability / pipeline credentials\n  alt Literature broker mode\n    M->>Q: analyze / enrich query\n    Q-->>M: source plan + rewritten query\n    M->>J: persist resolved provider plan\n    M->>S: parallel search\n    S-->>M: typed pages / source-scoped errors\n    M->>J: checkpoint source attempts\n    M->>M: dedupe / rank / enrich\n    M->>A: atomically publish optional artifact\n  else Inline / saved / dry-run pipeline mode\n    M->>J: persist safe pipeline plan snapshot\n    M->>P: execute or dry-run pipeline\n    P-->>M: articles + typed step outcomes\n    M->>J: checkpoint pipeline step attempts\n  end\n  M->>J: terminal commit + result references\n  M-->>U: search_status + search_run handoff + results\n```\n\n當 session management 啟用時，每次 `unified_search` 都會取得 stable run ID，包括\n一般搜尋、validation/planning failure、inline pipeline、`saved:<name>` 與 pipeline\n`dry_run=true`。Run 會橫跨 plan、source/pipeline-step attempts、result references 與\n適用時的 artifact locator。有效零結果是 journal\n`completed`、但 `search_status.state=\"empty\"`；source-scoped failure 可形成\n`partial`；planning/execution exception 與 cancellation 也有 terminal record。重啟\n時尚未結束的 active run 只會轉成一次 `interrupted`。`read_session` 的\n`search_runs`／`search_run`／`replay_search` actions 可檢視及取回已移除 credential\n的 exact kwargs；replay 本身不執行搜尋。非 dry-run saved pipeline 仍會額外寫入\nPipelineStore report/run history，描述 saved workflow 的長期執行；search-run journal\n則描述這一次 facade invocation。\n\n含 key、token、cookie、password 或 secret 的 pipeline config 會在 execution 前被\n拒絕並記為 failed run，provider credentials 只能來自 server configuration。若 terminal\ncommit 無法復原，handoff 會明確標成 `history_unavailable`／\n`history_available=false` 並省略 inspect/replay actions；這表示 durable history\n無法保證，不代表已回傳的 evidence 自動失效。\n\nArtifact directory 先原子發布、session index 後更新。若兩者之間 crash，reload\n會驗證完整 manifest/checksum，重新索引 published orphan，再以 `search_run_id`\n連回 journal；舊 artifact 才使用保守的同 query fallback。\n\n支援的主要來源：\n\n- PubMed\n- Europe PMC\n- CORE\n- OpenAlex\n- Semantic Scholar\n- CrossRef\n- Preprint sources: arXiv / medRxiv / bioRxiv can be enabled with `options=\"preprints\"` or explicit source selection; they return main `UnifiedArticle` entries with `article_type=PREPRINT` and are deduplicated/ranked with the rest of the result set.\n\n```mermaid\nflowchart TD\n  Query[Raw Query]\n  Intent[Intent / Complexity Analysis]\n  Expand[MeSH / synonym / semantic expansion]\n  Select[Source selection]\n  Parallel[Parallel source execution]\n  Merge[Deduplicate + merge]\n  Rank[Ranking + enrichment]\n  Cache[Session cache]\n  Result[Final MCP response]\n\n  Query --> Intent\n  Intent --> Expand\n  Expand --> Select\n  Select --> Parallel\n  Parallel --> Merge\n  Merge --> Rank\n  Rank --> Cache\n  Cache --> Result\n```\n\n## Session 與 HTTP API\n\n![Session cache and auxiliary HTTP API workflow](images/session-cache-and-http-api.svg)\n\n```mermaid\nflowchart LR\n  StdIO[stdio client<br/>VS Code / Claude Desktop]\n  HTTP[HTTP client<br/>Copilot Studio / remote MCP]\n  Server[PubMed Search MCP]\n  Session[Session Cache]\n  API[HTTP API endpoints]\n\n  StdIO --> Server\n  HTTP --> Server\n  Server --> Session\n  Session --> API\n```\n\nstdio 模式預設**不會**啟動背景 HTTP API。只有本機整合明確設定\n`PUBMED_STDIO_AUX_HTTP=1` 時，才開啟 loopback auxiliary read-only API；主要\nexternal contract 仍是 stdio tool surface：\n\n- `/health`\n- `/api/cached_article/{pmid}`\n- `/api/cached_articles?pmids=...`\n- `/api/session/summary`\n\nHTTP 模式由 `pubmed-search-mcp-http` 建立額外 routes，並提供：\n\n- MCP endpoint: `/mcp`（streamable-http）或 `/sse` + `/messages`（legacy SSE）\n- `/health`\n- `/ready`\n- `/download/{export_id}`\n- `/exports`\n- `/info`\n\nService mode 中，會讀取 tenant/session 或 export 的 auxiliary routes 必須與\n`/mcp` 使用同一 bearer principal；只有 liveness/readiness 可保持未認證。\n\n## Pipeline 架構與狀態\n\nPipeline 系統已經不是純設計稿，而是可保存、驗證、排程、回看歷史的實作能力：\n\n### 已實作\n\n- `manage_pipeline` facade 與 legacy wrappers\n- `save_pipeline`\n- `list_pipelines`\n- `load_pipeline`\n- `delete_pipeline`\n- `get_pipeline_history`\n- `schedule_pipeline`\n- 本機 workspace/global 雙層儲存；authenticated service 只使用 tenant-global root\n- Pydantic schema parsing + semantic auto-fix\n- APScheduler-backed persisted scheduling（local opt-in；service Compose 預設停用）\n- `StoredPipelineRunner` 執行已保存 pipeline 並寫回 run/report artifacts\n- built-in templates: `pico`, `comprehensive`, `exploration`, `gene_drug`\n\n### 尚待下一波重構\n\n- fulltext downloader 內部的 discovery / fetch / extract phase 還可再進一步拆清楚\n- pipeline facade 已落地，但 legacy wrappers 仍保留作為相容層\n\n### 儲存模型\n\n```text\nLocal workspace scope:\n  {workspace}/.pubmed-search/pipelines/{name}.yaml\n  {workspace}/.pubmed-search/pipeline_runs/{name}/*.json\n\nLocal global scope:\n  ~/.pubmed-search-mcp/pipelines/{name}.yaml\n  ~/.pubmed-search-mcp/pipeline_runs/{name}/*.json\n  ~/.pubmed-search-mcp/schedules.json\n\nAuthenticated service tenant scope:\n  {PUBMED_DATA_DIR}/tenants/{principal}/pipelines/{name}.yaml\n  {PUBMED_DATA_DIR}/tenants/{principal}/pipeline_runs/{name}/*.json\n  # no inherited process-wide workspace and no caller-supplied file: reads\n```\n\n`unified_search` 仍是唯一的搜尋執行入口；pipeline 管理工具負責保存、載入、回看歷史與 APScheduler-backed 排程介面。Authenticated service\n的 derived store 刻意不繼承 process-wide workspace，`file:` source 也會被拒絕。\nService Compose 不啟動 scheduler；未來若啟用，必須有單一 leader 或 distributed lease。\n\n```mermaid\nflowchart LR\n  Draft[Pipeline config]\n  Validate[Validate / auto-fix]\n  Save[manage_pipeline save]\n  List[list_pipelines]\n  Load[load_pipeline]\n  Execute[Use loaded plan to call tools]\n  History[get_pipeline_history]\n  Schedule[schedule_pipeline<br/>APScheduler-backed]\n\n  Draft --> Validate --> Save\n  Save --> List\n  List --> Load\n  Load --> Execute\n  Execute --> History\n  Load --> Schedule\n```\n\n## Copilot Studio 相容層\n\n目前有兩條 HTTP 路線：\n\n| 路線 | 說明 | 適用情境 |\n| --- | --- | --- |\n| `pubmed-search-mcp-http --mode service --transport streamable-http --copilot-compatible` | 以 bearer principal 保護完整 45-tool surface，開啟 Copilot HTTP compatibility | 唯一可公開的 Copilot service 路線 |\n| `run_copilot.py` | 啟用簡化 schema 的 loopback-only 本機 smoke | 本機檢查 schema 相容性；禁止接公網 tunnel |\n\n`http_compat.py` 會把部分 HTTP 202 responses 正規化為 Copilot 可接受的 200 JSON responses。\n\n```mermaid\nflowchart TD\n  Publish{要建立 public endpoint?}\n  Full[pubmed-search-mcp-http\\n--mode service\\n--copilot-compatible]\n  Simplified[run_copilot.py\\nloopback smoke only]\n  Studio[Copilot Studio]\n\n  Publish -->|是| Full\n  Publish -->|否，只檢查 schema| Simplified\n  Simplified -->|確認後回到 authenticated service| Full\n  Full --> Studio\n```\n\n`run_copilot.py` 沒有 multi-user service identity/storage contract；即使 tunnel\n只轉發到 loopback，也不得將它公開。Ngrok helper 會要求\n`PUBMED_AUTH_TOKENS` 與已指派的 `NGROK_DOMAIN`，確認 backend port 未被占用，\n並在 `--mode service` 通過 readiness 與匿名拒絕檢查後才建立 tunnel。\n\n## HTTPS 部署拓撲\n\n推薦的遠端部署架構：\n\n```text\nMCP Client / Copilot Studio\n  → HTTPS reverse proxy (Nginx / cloud LB)\n  → PubMed Search MCP HTTP server\n  → /mcp\n```\n\n```mermaid\nflowchart LR\n    Client[MCP Client / Copilot Studio]\n    Proxy[HTTPS Reverse Proxy<br/>Nginx / Cloud LB]\n    MCPHTTP[pubmed-search-mcp-http<br/>streamable-http]\n    Endpoint[\"/mcp\"]\n    Utility[\"/health · /ready · /info · /exports\"]\n\n    Client --> Proxy\n    Proxy --> Endpoint\n    Proxy --> Utility\n    Endpoint --> MCPHTTP\n    Utility --> MCPHTTP\n```\n\n目前推薦 transport 是 `streamable-http`。SSE 僅保留相容用途，不再是預設部署路線。\n\n## 相關文件\n\n- [DEPLOYMENT.md](#/deployment): 實際部署與啟動方式\n- [docs/INTEGRATIONS.md](#/troubleshooting): 各 MCP client 設定\n- [docs/REPO_SEPARATION_PRINCIPLES.md](REPO_SEPARATION_PRINCIPLES.md): structural / semantic、policy / runtime、tool / service 的 repo 級分離原則\n- [docs/PIPELINE_PERSISTENCE_DESIGN.md](PIPELINE_PERSISTENCE_DESIGN.md): pipeline 詳細設計與未完成部分\n- [src/pubmed_search/presentation/mcp_server/TOOLS_INDEX.md](#/quick-reference): 工具索引\n",
+  "architecture": "<!-- Generated from ARCHITECTURE.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP - 系統架構文件\n\n> Current architecture reference for the active codebase and deployment surface.\n\n## 系統總覽\n\nPubMed Search MCP 是一個以 Domain-Driven Design 為核心的 MCP 伺服器，提供 46 個 MCP tools、session 快取、pipeline 持久化與排程，以及 stdio 與 HTTP 兩種 transport。\n\n目前的公開入口已收斂為：\n\n- `unified_search`: 唯一的文字文獻搜尋入口；`unified_search_batch` 只是它的多查詢變體批次形式（共用 planner、broker 與 ranking）\n- `get_fulltext`: 唯一的公開全文入口\n- `parse_pico`, `generate_search_queries`, `analyze_search_query`: query intelligence; `parse_pico` validates agent-provided P/I/C/O and returns a runnable PICO pipeline.\n- `find_related_articles`, `find_citing_articles`, `get_article_references`, `build_citation_tree`: 探索層\n\n## 產品視角\n\n如果從產品而不是程式碼看，這個系統主要在服務三類任務：\n\n| 使用者 / 情境 | 他想完成什麼 | 典型入口 |\n| --- | --- | --- |\n| 臨床工作者 | 快速回答臨床問題、比較治療、追研究證據 | Agent P/I/C/O -> `parse_pico` -> `unified_search(template:pico)` |\n| 研究者 / 學生 | 找代表性文獻、讀全文、追引用與主題發展脈絡、匯出引用 | `unified_search`, `get_fulltext`, `build_research_chronicle`, `prepare_export` |\n| AI agent / workflow builder | 把搜尋、判讀、匯出、排程串成可重跑流程 | `unified_search`, `read_session`, `manage_pipeline` |\n\n這個文件後面會談 DDD 與 transport，但產品上真正交付的是一條研究工作流：\n\n1. 定義問題\n2. 擴展查詢\n3. 搜尋與篩選\n4. 深入閱讀與探索\n5. 產出可重用結果\n\n## 使用者旅程圖\n\n```mermaid\njourney\n    title 從研究問題到可重用輸出的使用者旅程\n    section 定義問題\n      用自然語言描述主題: 5: User\n      用 PICO、ICD 或關鍵詞收斂問題: 4: User, Agent\n    section 搜尋與擴展\n      產生 MeSH、同義詞與查詢策略: 5: Agent, MCP\n      執行多來源搜尋並快取結果: 5: MCP\n    section 深入判讀\n      看相關文章、被引用與參考文獻: 5: User, Agent\n      讀全文、圖表、研究編年史與指標: 4: User, Agent\n    section 整理與重用\n      匯出 RIS 或 BibTeX: 5: User\n      保存 pipeline 供後續重跑: 4: User, Team\n```\n\n這張圖故意不提模組名稱，因為它要回答的是「使用者一路上感受到什麼能力」，而不是「工程上哪些 package 參與了」。\n\n## 功能地圖\n\n```mermaid\nflowchart TB\n  subgraph Discover[1. 發現研究]\n    D1[Quick search<br/>unified_search]\n    D2[Structured query building<br/>agent PICO handoff / generate_search_queries / analyze_search_query]\n    D3[ICD to MeSH expansion<br/>convert_icd_mesh / auto-detect in unified_search]\n  end\n\n  subgraph Understand[2. 理解證據]\n    U1[Article exploration<br/>related / citing / references / citation tree]\n    U2[Full text and figures<br/>get_fulltext / get_article_figures / text-mined terms]\n    U3[Impact and evolution<br/>citation metrics / versioned research chronicle]\n  end\n\n  subgraph Specialize[3. 延伸查詢]\n    S1[Gene, compound, variant research]\n    S2[Biomedical image search]\n    S3[Institutional access fallback]\n  end\n\n  subgraph Reuse[4. 重用與協作]\n    R1[Session cache and follow-up actions]\n    R2[Export citations and datasets]\n    R3[Save / load / review pipelines]\n  end\n\n  Discover --> Understand\n  Understand --> Specialize\n  Understand --> Reuse\n  Specialize --> Reuse\n```\n\n功能地圖的重點是把「產品能力區塊」先分清楚：\n\n- `Discover` 負責把模糊問題變成候選文獻\n- `Understand` 負責把候選文獻變成可判讀的證據脈絡\n- `Specialize` 負責把一般搜尋延伸到特定資料域\n- `Reuse` 負責把一次性的研究操作轉成可保存、可分享、可重跑的資產\n\n下面的技術架構圖，則是在回答這些產品能力分別由哪一層系統承接。\n\n## 快速架構圖\n\n![DDD 與 runtime 邊界](images/ddd-runtime-boundaries.svg)\n\n```mermaid\nflowchart LR\n  Client[Human / AI Client]\n  MCP[MCP Server<br/>presentation/mcp_server]\n  API[Background HTTP API<br/>health / cache / exports]\n  App[Application Layer<br/>search chronicle timeline pipeline export]\n  Broker[Capability-aware Literature Broker<br/>one unified_search facade]\n  Domain[Domain Layer<br/>article chronicle timeline pipeline entities]\n  Infra[Infrastructure Layer<br/>NCBI / Europe PMC / CORE / OpenAlex / Unpaywall / institutional]\n  DataPlane[Operator Data Plane<br/>release manifest / diff / snapshot checkpoint]\n  Store[Session + Pipeline + Chronicle Store]\n\n  Client --> MCP\n  MCP --> App\n  MCP --> API\n  App --> Broker\n  Broker --> Domain\n  Broker --> Infra\n  DataPlane --> Infra\n  App --> Store\n```\n\n這張圖的重點不是列出每個模組，而是先讓讀者快速抓到三件事：\n\n- 所有使用者互動都先進入 MCP presentation layer\n- 真正的工作流編排在 application layer\n- 外部資料源與持久化能力都被隔離在 infrastructure / store 邊界之外\n- 通用文獻搜尋只有 `unified_search`；provider relevance/bulk/semantic/cursor\n  都是 capability-aware broker 的內部 execution mode\n- 大型 dataset/snapshot 是 operator data plane，絕不在 MCP request 中下載\n\n### Provider-aware broker 的實際資料流\n\n```mermaid\nflowchart LR\n  Request[unified_search request] --> Normalize[Strict options / filters validation]\n  Normalize --> Journal[Start tenant search-run journal]\n  Journal --> Cap[SourceCapabilities validation]\n  Cap -->|default| Relevance[Keyword / relevance adapters]\n  Cap -->|native_semantic| OASem[OpenAlex search.semantic]\n  Cap -->|systematic| Bounded[OpenAlex cursor / S2 bulk]\n  Relevance --> Page[SourceSearchPage raw DTO envelope]\n  OASem --> Page\n  Bounded --> Page\n  Page --> Map[Single provider mapper boundary]\n  Map --> Merge[Dedup / rank / provenance]\n  Merge --> Outcome[search_status + source_metadata]\n  Outcome --> Artifact[Optional atomic artifact publish]\n  Artifact --> Commit[Terminal search-run commit]\n  Outcome -->|persistence disabled| Commit\n  Commit --> Result[Articles + recovery handoff]\n```\n\n`SourceCapabilities` 目前提供 search modes、pagination、page/mode limits、\nbatch limit、counts/provenance 與 operator data-plane status；planner 會在 I/O 前\n拒絕明確且不相容的 source/mode。Normalization 也會 fail-closed：未知／格式錯誤的\nfilter 或 option、非 `1..100` 的 limit、反向／越界年份及不支援的 ranking/output\n不會被靜默忽略。`SourceSearchPage` 保留 raw provider items、\ntotal、opaque continuation、canonical query、cost、warnings 與 safe metadata，\n直到 domain mapper 只做一次轉換。JSON/TOON 和 artifact 的\n`source_metadata`／`query_strategy.json` 會保留實際 requested/provider mode、\ncompiled query、continuation 與 cost/rate diagnostics。\n\n`options=\"native_semantic\"` 與 `options=\"systematic\"` 互斥並關閉多策略 deep\nexpansion；public per-source `limit` 仍最多 100。因此 systematic 是 bounded\nretrieval policy，不代表已下載全 corpus 或保證 systematic-review exhaustiveness。\n一般 deep mode 則把同一個 per-source `limit` 分配到該來源的所有 strategies，\n並以全域／每來源 semaphore、strategy timeout 與 clipping 保證 budget 不因 query\nexpansion 倍增。單一來源失敗只形成 source-scoped error，其他成功來源仍可形成\npartial response。\n\nStructured `search_status` 明確回報 `completed`／`empty`／`partial`／`failed`、\n`bounded=true`、`exhaustive=false`、source sets 與 continuation/unknown-completeness。\nContinuation token/cursor 目前只保留為 provenance；公開 `unified_search` 尚未提供\ncursor-resume input。\nSemantic Scholar dataset client 本輪只處理 release/dataset/diff metadata；\nOpenAlex 只宣告官方 snapshot 路徑可供 operator 規劃，兩者都尚未形成 runtime local\nindex。ClinicalKey AI 則以獨立 governance policy 保持 default-off、\nentitlement/contract gated、metadata-only、zero-persistence，且不註冊為 source/tool。\n\n> **DDD 遷移註記**：上述 capability planning/execution 目前仍實作在\n> `presentation/mcp_server/tools/unified_planning.py` 與\n> `unified_execution.py`；`application/unified` 現階段只是 injected-runner\n> facade。這是已知技術債。目標是把不依賴 MCP progress/session/renderer 的純\n> planner 與 broker core 下移 application，presentation 僅保留 transport adapter。\n\n## 全文擷取流程\n\n![全文擷取流程](images/fulltext-retrieval-flow.svg)\n\n`get_fulltext` 不是固定三段式 API 呼叫，而是 identifier-aware 的 retrieval policy：有 PMCID 時優先嘗試 Europe PMC XML；有 DOI 時查 Unpaywall OA locations；若仍沒有正文，會依設定嘗試 institutional direct/EZproxy fetch、CORE，以及 extended PDF retrieval fallback。Browser-session broker 只在本機 broker 已啟用、token 與 allowed hosts 合格，且該 fallback 被允許時才會參與。\n\n## 設計原則\n\n| 原則 | 說明 |\n| --- | --- |\n| Agent-First | 回傳格式優先支援 AI agent 決策與後續工具編排 |\n| Task-Oriented | 工具以研究工作流分組，不直接暴露每個底層 API client |\n| Domain-Driven | 查詢、文章、chronicle、timeline、pipeline 等核心概念在 domain/application 中建模 |\n| Multi-Source | PubMed 為核心，並整合 Europe PMC、CORE、OpenAlex、Semantic Scholar、CrossRef、first-class preprint sources |\n| Capability-Aware | Query intent 先轉成 provider-neutral plan，再依 source 的 mode/filter/page/cost/rights 能力編譯；不支援的條件不會被無聲忽略 |\n| Rights-Aware Data Plane | Live API、local snapshot 與 licensed evidence 各自有 retention、provenance、cost 與 operator 邊界 |\n| Session-Aware | 搜尋結果會自動快取於 session，支援後續全文、匯出與探索 |\n\n## 目前的 DDD 結構\n\n```text\nsrc/pubmed_search/\n├── domain/\n│   ├── entities/\n│   │   ├── article.py\n│   │   ├── chronicle.py\n│   │   ├── figure.py\n│   │   ├── image.py\n│   │   ├── pipeline.py\n│   │   ├── research_tree.py\n│   │   └── timeline.py\n│   ├── services/\n│   └── value_objects/\n├── application/\n│   ├── chronicle/\n│   ├── export/\n│   ├── image_search/\n│   ├── pipeline/\n│   ├── search/\n│   ├── session/\n│   └── timeline/\n├── infrastructure/\n│   ├── cache/\n│   ├── http/\n│   ├── ncbi/\n│   ├── pubtator/\n│   └── sources/\n├── presentation/\n│   ├── api/\n│   └── mcp_server/\n└── shared/\n```\n\n## 分層關係\n\n```text\nPresentation\n  ├─ mcp_server/server.py\n  ├─ mcp_server/tool_registry.py\n  ├─ mcp_server/tools/*.py\n  ├─ mcp_server/prompts.py\n  ├─ mcp_server/resources.py\n  └─ api/server.py\n\nApplication\n  ├─ chronicle/   immutable revision 組裝、lineage、projection、audit、diff、narration 與 Mermaid 修復\n  ├─ search/      查詢分析、語意增強、多源整合、重現性/排序\n  ├─ timeline/    timeline 建構、policy-driven milestone 分析、landmark scoring、diagnostics 聚合\n  ├─ pipeline/    executor、schema、validator、runner、store、report、templates\n  ├─ export/      引用輸出工作流\n  ├─ session/     session 管理\n  └─ image_search 視覺查詢建議\n\nDomain\n  ├─ UnifiedArticle / ChronicleSnapshot / ChronicleEntry / ChronicleBranch / ChronicleGraph\n  ├─ Figure / Timeline / Pipeline entities\n  └─ value objects / domain services\n\nInfrastructure\n  ├─ ncbi/        Entrez / iCite / exporter\n  ├─ fulltext/    fulltext registry 與 identifier-aware orchestration policy\n  ├─ sources/     Europe PMC / CORE / OpenAlex / Semantic Scholar / CrossRef / Unpaywall / Open-i / preprints / institutional direct-EZproxy / browser-session client\n  ├─ scheduling/  APScheduler-backed pipeline scheduling\n  ├─ pubtator/    semantic enhancement / entity extraction\n  └─ http/        shared HTTP client concerns\n\nShared\n  ├─ settings.py  Pydantic Settings runtime configuration\n  └─ async / error / profiling helpers\n```\n\n依賴方向維持由外向內：presentation → application → domain，infrastructure 實作外部整合並由上層組合使用。\n\nTimeline 子系統目前拆分為：\n\n- `timeline_builder.py`：timeline orchestration、landmark score 掛載、timeline-level diagnostics 聚合\n- `milestone_detector.py`：milestone detection orchestration 與 TimelineEvent 建構\n- `milestone_policy.py`：regex、publication type、citation threshold policy tables\n- `diagnostics.py`：把 event-level detection/landmark 診斷整理成 MCP 可用的穩定 payload\n- `landmark_policy.py` / `landmark_scorer.py`：多訊號 landmark scoring policy 與計分實作\n\nChronicle 子系統在 timeline evidence provider 之上建立不可變 revision，並由同一份\n`ChronicleSnapshot` 投影出 timeline、tree、narrative、graph 與 `chronicle_map`。其中\n`chronicle_map` 以橫向年份主軸保留論文先後，再依重複出現的 MeSH／關鍵詞訊號切出\n主題分支；branch point 只代表「本次範圍內最早觀察到」，不宣稱因果或全領域首創。\n\nMermaid 輸出會先做 deterministic label／結構正規化，再依 `rich → safe → minimal`\n降級；完整座標與省略診斷仍保留在 `chronicle_map.json` 與\n`mermaid_validation.json`。Runtime 不依賴 Node.js，而 CI 使用固定 Mermaid 11.16.1\n與 jsdom 26.1.0 對文件及 smoke fixtures 執行真實 parse／SVG render，避免只有字串\nlint 通過但客戶端仍無法顯示。\n\n```mermaid\nflowchart TB\n    Presentation[Presentation]\n    Application[Application]\n    Domain[Domain]\n    Infrastructure[Infrastructure]\n\n    Presentation --> Application\n    Application --> Domain\n    Application --> Infrastructure\n    Infrastructure -. implements external integrations .-> Domain\n```\n\n## MCP 伺服器組成\n\n`presentation/mcp_server/` 是目前的 MCP 入口，主要模組如下：\n\n```text\npresentation/mcp_server/\n├── server.py          MCP server 建立、DI container、stdio 啟動、背景 HTTP API\n├── tool_registry.py   46 tools / 16 categories 的權威 registry\n├── tools/             實際 MCP tool 實作\n├── session_tools.py   session 相關 tools 與 resources\n├── prompts.py         預設 prompt workflow\n├── resources.py       filter / category / tool resources\n├── instructions.py    server 指令與 agent 使用說明\n├── copilot_tools.py   Copilot Studio 簡化 schema 專用 tool surface\n└── http_compat.py     Copilot HTTP compatibility middleware\n```\n\n```mermaid\nflowchart LR\n  Server[server.py]\n  Registry[tool_registry.py]\n  Tools[tools/*.py]\n  Session[session_tools.py]\n  Prompts[prompts.py]\n  Resources[resources.py]\n  Copilot[copilot_tools.py]\n  Compat[http_compat.py]\n\n  Server --> Registry\n  Server --> Tools\n  Server --> Session\n  Server --> Prompts\n  Server --> Resources\n  Server --> Copilot\n  Server --> Compat\n  Registry --> Tools\n```\n\n這張圖比較接近維護者視角：`server.py` 是裝配中心，`tool_registry.py` 決定公開 surface，`tools/` 與 `session_tools.py` 提供實際能力，而 Copilot 相容層是額外分支，不是主架構本體。\n\n## 工具分類\n\n目前 registry 定義 16 個 category、46 個公開 MCP tools：\n\n| 類別 | 工具數 | 代表工具 |\n| --- | --- | --- |\n| 搜尋工具 | 1 | `unified_search` |\n| 查詢智能 | 3 | `parse_pico`, `generate_search_queries`, `analyze_search_query` |\n| 文章探索 | 5 | `fetch_article_details`, `find_related_articles`, `find_citing_articles` |\n| 引用驗證 | 1 | `verify_reference_list` |\n| 全文工具 | 2 | `get_fulltext`, `get_text_mined_terms` |\n| 圖表擷取 | 1 | `get_article_figures` |\n| NCBI 延伸 | 7 | `search_gene`, `search_compound`, `search_clinvar` |\n| 引用網絡 | 1 | `build_citation_tree` |\n| 匯出工具 | 2 | `prepare_export`, `save_literature_notes` |\n| Session 管理 | 5 | `read_session`, `get_session_pmids`, `get_cached_article`, `get_session_summary`, `get_session_log` |\n| 機構訂閱 | 5 | `configure_institutional_access`, `get_institutional_link`, `diagnose_institutional_access` |\n| 視覺搜索 | 1 | `analyze_figure_for_search` |\n| ICD 轉換 | 1 | `convert_icd_mesh` |\n| 研究編年史 | 2 | `build_research_chronicle`, `read_research_chronicle` |\n| 圖片搜尋 | 1 | `search_biomedical_images` |\n| Pipeline 管理 | 7 | `manage_pipeline`, `save_pipeline`, `list_pipelines`, `load_pipeline`, `delete_pipeline`, `get_pipeline_history`, `schedule_pipeline` |\n\n## Runtime 與多 Agent 服務模型\n\n這個 server 將執行邊界分成三個明確合約，不以單純改 bind address 來互換：\n\n| 合約 | 身分/狀態 | 網路邊界 |\n| --- | --- | --- |\n| 本機 stdio | 單一本機使用者與 local store | 無 MCP listening port；背景 auxiliary HTTP 預設關閉 |\n| 本機 loopback HTTP | 可信單使用者；跨 request 共用 durable `default` tenant | 僅能 loopback；container bind 必須顯式 opt-in 且 host 只 publish loopback |\n| 多使用者 service | bearer token principal 與 principal-scoped store | 遠端 HTTPS；auth、resource URL、Host/Origin allowlist 全部 fail closed |\n\nProtocol baseline 是 MCP SDK v2。現代 2026-07-28 request model 直接送\n`tools/list` / `tools/call`，不建立 `initialize` handshake，也不依賴\n`Mcp-Session-Id`。Legacy transport compatibility 只是 protocol adapter，不能成為身分、租戶或\ndurability 邊界。\n\n```mermaid\nflowchart LR\n  A1[Agent A<br/>Bearer token A]\n  A2[Agent B<br/>Bearer token B]\n  Stdio[本機 stdio]\n  LocalHTTP[本機 loopback HTTP]\n  MW[Service tenancy middleware<br/>驗證 bearer principal + 公平配額]\n  REG[SessionManagerRegistry]\n  SA[(tenant A store)]\n  SB[(tenant B store)]\n  SD[(durable default tenant)]\n\n  A1 --> MW\n  A2 --> MW\n  Stdio --> SD\n  LocalHTTP --> SD\n  MW --> REG\n  REG --> SA\n  REG --> SB\n```\n\nLocal stdio 與顯式 `--mode local` 的 loopback HTTP 都是單使用者合約，使用 durable\n`default` tenant，因此 `pmids=\"last\"`、session、cache 與 export 可跨 MCP requests\n保留。Service mode 只接受已驗證的 bearer principal 作為 tenant 與授權邊界；\n匿名 service request 會 fail closed。\nMCP transport session identifier 不是身分、不用於租戶授權，也不能賦予持久化權限。\n\n| 關注點 | 模組 |\n| --- | --- |\n| 租戶身分與 context 綁定 | `shared/tenancy.py` |\n| 每租戶 session 池與儲存根目錄 | `application/session/registry.py` |\n| Bearer token 驗證 | `infrastructure/auth/static_tokens.py` |\n| 每請求綁定 + 公平配額 | `presentation/mcp_server/tenancy.py` |\n| 輔助 HTTP API 守門 | `presentation/mcp_server/http_security.py` |\n\n上游速率限制刻意維持全域（NCBI 依 API key 計量），每租戶並行上限則負責公平性。\n實際設定與運維細節見 [DEPLOYMENT.md](#/deployment) 的「多 Agent 正式服務」章節。\n\n> `presentation/api/server.py` 的 FastAPI 輔助伺服器是單租戶的歷史元件，\n> 不在多 agent MCP 路徑上，也未被任何 launcher 掛載。\n\n## Runtime 設定與來源治理\n目前 runtime config 已集中到 `shared/settings.py`，由 Pydantic Settings 解析環境變數，避免 presentation / infrastructure 各自直接讀取 `os.environ`。\n多來源搜尋也已改為 registry-driven：`infrastructure/sources/registry.py` 統一管理來源 metadata、`auto/all/-source` expression 解析、default-off 商業來源 gating，以及 `PUBMED_SEARCH_DISABLED_SOURCES` 全域停用機制。\n\n全文路徑也已開始同樣的抽層：`application/fulltext/registry.py` 定義 retrieval policy 與 source metadata，`application/fulltext/service.py` 承接 identifier-aware orchestration；`infrastructure/sources/fulltext_registry.py` 與 `fulltext_service.py` 只是歷史 import path 的 compatibility re-export。`get_fulltext` tool 只保留 normalization、progress/log bridge、factory wiring 與 response formatting。\n\n## 搜尋流程\n\n`unified_search` 的高階流程如下：\n\n```text\nunified_search(query or pipeline)\n  → mode-aware normalization\n  → start search-run/v1 journal\n  → capability validation / credential-bearing pipeline rejection\n  → query: analyze / enhance / dispatch / dedupe / rank\n  → pipeline: parse inline or load saved / dry-run or execute / checkpoint steps\n  → optional artifact publish + terminal run commit\n  → session cache + formatted response\n```\n\n```mermaid\nsequenceDiagram\n  participant U as User / Agent\n  participant M as MCP Tool\n  participant Q as QueryAnalyzer\n  participant S as Source Clients\n  participant P as Pipeline Executor\n  participant J as SearchRun Journal\n  participant A as Artifact / Session Store\n\n  U->>M: unified_search(query or pipeline)\n  M->>M: mode-aware normalization\n  M->>J: start(run_id, sanitized request)\n  M->>M: validate capability / pipeline credentials\n  alt Literature broker mode\n    M->>Q: analyze / enrich query\n    Q-->>M: source plan + rewritten query\n    M->>J: persist resolved provider plan\n    M->>S: parallel search\n    S-->>M: typed pages / source-scoped errors\n    M->>J: checkpoint source attempts\n    M->>M: dedupe / rank / enrich\n    M->>A: atomically publish optional artifact\n  else Inline / saved / dry-run pipeline mode\n    M->>J: persist safe pipeline plan snapshot\n    M->>P: execute or dry-run pipeline\n    P-->>M: articles + typed step outcomes\n    M->>J: checkpoint pipeline step attempts\n  end\n  M->>J: terminal commit + result references\n  M-->>U: search_status + search_run handoff + results\n```\n\n當 session management 啟用時，每次 `unified_search` 都會取得 stable run ID，包括\n一般搜尋、validation/planning failure、inline pipeline、`saved:<name>` 與 pipeline\n`dry_run=true`。Run 會橫跨 plan、source/pipeline-step attempts、result references 與\n適用時的 artifact locator。有效零結果是 journal\n`completed`、但 `search_status.state=\"empty\"`；source-scoped failure 可形成\n`partial`；planning/execution exception 與 cancellation 也有 terminal record。重啟\n時尚未結束的 active run 只會轉成一次 `interrupted`。`read_session` 的\n`search_runs`／`search_run`／`replay_search` actions 可檢視及取回已移除 credential\n的 exact kwargs；replay 本身不執行搜尋。非 dry-run saved pipeline 仍會額外寫入\nPipelineStore report/run history，描述 saved workflow 的長期執行；search-run journal\n則描述這一次 facade invocation。\n\n含 key、token、cookie、password 或 secret 的 pipeline config 會在 execution 前被\n拒絕並記為 failed run，provider credentials 只能來自 server configuration。若 terminal\ncommit 無法復原，handoff 會明確標成 `history_unavailable`／\n`history_available=false` 並省略 inspect/replay actions；這表示 durable history\n無法保證，不代表已回傳的 evidence 自動失效。\n\nArtifact directory 先原子發布、session index 後更新。若兩者之間 crash，reload\n會驗證完整 manifest/checksum，重新索引 published orphan，再以 `search_run_id`\n連回 journal；舊 artifact 才使用保守的同 query fallback。\n\n支援的主要來源：\n\n- PubMed\n- Europe PMC\n- CORE\n- OpenAlex\n- Semantic Scholar\n- CrossRef\n- Preprint sources: arXiv / medRxiv / bioRxiv can be enabled with `options=\"preprints\"` or explicit source selection; they return main `UnifiedArticle` entries with `article_type=PREPRINT` and are deduplicated/ranked with the rest of the result set.\n\n```mermaid\nflowchart TD\n  Query[Raw Query]\n  Intent[Intent / Complexity Analysis]\n  Expand[MeSH / synonym / semantic expansion]\n  Select[Source selection]\n  Parallel[Parallel source execution]\n  Merge[Deduplicate + merge]\n  Rank[Ranking + enrichment]\n  Cache[Session cache]\n  Result[Final MCP response]\n\n  Query --> Intent\n  Intent --> Expand\n  Expand --> Select\n  Select --> Parallel\n  Parallel --> Merge\n  Merge --> Rank\n  Rank --> Cache\n  Cache --> Result\n```\n\n## Session 與 HTTP API\n\n![Session cache and auxiliary HTTP API workflow](images/session-cache-and-http-api.svg)\n\n```mermaid\nflowchart LR\n  StdIO[stdio client<br/>VS Code / Claude Desktop]\n  HTTP[HTTP client<br/>Copilot Studio / remote MCP]\n  Server[PubMed Search MCP]\n  Session[Session Cache]\n  API[HTTP API endpoints]\n\n  StdIO --> Server\n  HTTP --> Server\n  Server --> Session\n  Session --> API\n```\n\nstdio 模式預設**不會**啟動背景 HTTP API。只有本機整合明確設定\n`PUBMED_STDIO_AUX_HTTP=1` 時，才開啟 loopback auxiliary read-only API；主要\nexternal contract 仍是 stdio tool surface：\n\n- `/health`\n- `/api/cached_article/{pmid}`\n- `/api/cached_articles?pmids=...`\n- `/api/session/summary`\n\nHTTP 模式由 `pubmed-search-mcp-http` 建立額外 routes，並提供：\n\n- MCP endpoint: `/mcp`（streamable-http）或 `/sse` + `/messages`（legacy SSE）\n- `/health`\n- `/ready`\n- `/download/{export_id}`\n- `/exports`\n- `/info`\n\nService mode 中，會讀取 tenant/session 或 export 的 auxiliary routes 必須與\n`/mcp` 使用同一 bearer principal；只有 liveness/readiness 可保持未認證。\n\n## Pipeline 架構與狀態\n\nPipeline 系統已經不是純設計稿，而是可保存、驗證、排程、回看歷史的實作能力：\n\n### 已實作\n\n- `manage_pipeline` facade 與 legacy wrappers\n- `save_pipeline`\n- `list_pipelines`\n- `load_pipeline`\n- `delete_pipeline`\n- `get_pipeline_history`\n- `schedule_pipeline`\n- 本機 workspace/global 雙層儲存；authenticated service 只使用 tenant-global root\n- Pydantic schema parsing + semantic auto-fix\n- APScheduler-backed persisted scheduling（local opt-in；service Compose 預設停用）\n- `StoredPipelineRunner` 執行已保存 pipeline 並寫回 run/report artifacts\n- built-in templates: `pico`, `comprehensive`, `exploration`, `gene_drug`\n\n### 尚待下一波重構\n\n- fulltext downloader 內部的 discovery / fetch / extract phase 還可再進一步拆清楚\n- pipeline facade 已落地，但 legacy wrappers 仍保留作為相容層\n\n### 儲存模型\n\n```text\nLocal workspace scope:\n  {workspace}/.pubmed-search/pipelines/{name}.yaml\n  {workspace}/.pubmed-search/pipeline_runs/{name}/*.json\n\nLocal global scope:\n  ~/.pubmed-search-mcp/pipelines/{name}.yaml\n  ~/.pubmed-search-mcp/pipeline_runs/{name}/*.json\n  ~/.pubmed-search-mcp/schedules.json\n\nAuthenticated service tenant scope:\n  {PUBMED_DATA_DIR}/tenants/{principal}/pipelines/{name}.yaml\n  {PUBMED_DATA_DIR}/tenants/{principal}/pipeline_runs/{name}/*.json\n  # no inherited process-wide workspace and no caller-supplied file: reads\n```\n\n`unified_search` 仍是唯一的搜尋執行入口；pipeline 管理工具負責保存、載入、回看歷史與 APScheduler-backed 排程介面。Authenticated service\n的 derived store 刻意不繼承 process-wide workspace，`file:` source 也會被拒絕。\nService Compose 不啟動 scheduler；未來若啟用，必須有單一 leader 或 distributed lease。\n\n```mermaid\nflowchart LR\n  Draft[Pipeline config]\n  Validate[Validate / auto-fix]\n  Save[manage_pipeline save]\n  List[list_pipelines]\n  Load[load_pipeline]\n  Execute[Use loaded plan to call tools]\n  History[get_pipeline_history]\n  Schedule[schedule_pipeline<br/>APScheduler-backed]\n\n  Draft --> Validate --> Save\n  Save --> List\n  List --> Load\n  Load --> Execute\n  Execute --> History\n  Load --> Schedule\n```\n\n## Copilot Studio 相容層\n\n目前有兩條 HTTP 路線：\n\n| 路線 | 說明 | 適用情境 |\n| --- | --- | --- |\n| `pubmed-search-mcp-http --mode service --transport streamable-http --copilot-compatible` | 以 bearer principal 保護完整 46-tool surface，開啟 Copilot HTTP compatibility | 唯一可公開的 Copilot service 路線 |\n| `run_copilot.py` | 啟用簡化 schema 的 loopback-only 本機 smoke | 本機檢查 schema 相容性；禁止接公網 tunnel |\n\n`http_compat.py` 會把部分 HTTP 202 responses 正規化為 Copilot 可接受的 200 JSON responses。\n\n```mermaid\nflowchart TD\n  Publish{要建立 public endpoint?}\n  Full[pubmed-search-mcp-http\\n--mode service\\n--copilot-compatible]\n  Simplified[run_copilot.py\\nloopback smoke only]\n  Studio[Copilot Studio]\n\n  Publish -->|是| Full\n  Publish -->|否，只檢查 schema| Simplified\n  Simplified -->|確認後回到 authenticated service| Full\n  Full --> Studio\n```\n\n`run_copilot.py` 沒有 multi-user service identity/storage contract；即使 tunnel\n只轉發到 loopback，也不得將它公開。Ngrok helper 會要求\n`PUBMED_AUTH_TOKENS` 與已指派的 `NGROK_DOMAIN`，確認 backend port 未被占用，\n並在 `--mode service` 通過 readiness 與匿名拒絕檢查後才建立 tunnel。\n\n## HTTPS 部署拓撲\n\n推薦的遠端部署架構：\n\n```text\nMCP Client / Copilot Studio\n  → HTTPS reverse proxy (Nginx / cloud LB)\n  → PubMed Search MCP HTTP server\n  → /mcp\n```\n\n```mermaid\nflowchart LR\n    Client[MCP Client / Copilot Studio]\n    Proxy[HTTPS Reverse Proxy<br/>Nginx / Cloud LB]\n    MCPHTTP[pubmed-search-mcp-http<br/>streamable-http]\n    Endpoint[\"/mcp\"]\n    Utility[\"/health · /ready · /info · /exports\"]\n\n    Client --> Proxy\n    Proxy --> Endpoint\n    Proxy --> Utility\n    Endpoint --> MCPHTTP\n    Utility --> MCPHTTP\n```\n\n目前推薦 transport 是 `streamable-http`。SSE 僅保留相容用途，不再是預設部署路線。\n\n## 相關文件\n\n- [DEPLOYMENT.md](#/deployment): 實際部署與啟動方式\n- [docs/INTEGRATIONS.md](#/troubleshooting): 各 MCP client 設定\n- [docs/REPO_SEPARATION_PRINCIPLES.md](REPO_SEPARATION_PRINCIPLES.md): structural / semantic、policy / runtime、tool / service 的 repo 級分離原則\n- [docs/PIPELINE_PERSISTENCE_DESIGN.md](PIPELINE_PERSISTENCE_DESIGN.md): pipeline 詳細設計與未完成部分\n- [src/pubmed_search/presentation/mcp_server/TOOLS_INDEX.md](#/quick-reference): 工具索引\n",
   "pipeline-tutorial": "<!-- Generated from docs/PIPELINE_MODE_TUTORIAL.en.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# Pipeline Mode Tutorial\n\n> Status: current API tutorial\n> Last updated: 2026-08-09\n> Language: **English** | [繁體中文](#/pipeline-tutorial-zh)\n\nThis document only describes pipeline mode behavior that is currently implemented and supported. It does not repeat older RFC or design-draft material. The focus is what you can execute now, save now, schedule now, and inspect through history now.\n\n## Pipeline Mode Quick Start\n\n![Pipeline entry points and execution workflow](images/pipeline-entrypoints-and-dag.svg)\n\nPipeline mode currently has 3 practical entry points:\n\n1. Pass YAML or JSON directly into `unified_search(..., pipeline=\"...\")`\n2. Save the config first with `manage_pipeline` or `save_pipeline`, then run it with `saved:<name>`\n3. Save it first, then schedule recurring runs with `schedule_pipeline` or `manage_pipeline(action=\"schedule\")`\n\n> **Choose the runtime first.** Trusted local stdio/loopback callers can use\n> project workspace scope, `file:` sources, and the in-process scheduler.\n> Authenticated service callers use only their principal-scoped saved-pipeline\n> store: no process-wide workspace scope or `file:` reads. The service Compose\n> profile disables the scheduler until an operator supplies a single external\n> leader/lease.\n\n### Smallest usable example: inline template\n\n```python\nunified_search(\n    query=\"\",\n    pipeline=\"\"\"\ntemplate: pico\nparams:\n  P: ICU patients requiring mechanical ventilation\n  I: remimazolam\n  C: propofol\n  O: sedation adequacy\noutput:\n  format: markdown\n  limit: 20\n  ranking: balanced\n\"\"\",\n)\n```\n\nNotes:\n\n- `unified_search` still requires `query` in the function signature, but once `pipeline` is set, ordinary search parameters are generally ignored. The safe pattern is `query=\"\"`.\n- `output_format=\"json\"` forces structured JSON. `output.format: json` inside the pipeline also returns structured JSON.\n- `dry_run=True` previews the resolved DAG without external searches. `stop_at=\"<step_id>\"` executes only through that step.\n\n### Smallest usable example: save first, then execute\n\n```python\nmanage_pipeline(\n    action=\"save\",\n    name=\"icu_remi_vs_propofol\",\n    config=\"\"\"\ntemplate: pico\nparams:\n  P: ICU patients requiring mechanical ventilation\n  I: remimazolam\n  C: propofol\n  O: delirium, sedation quality\noutput:\n  limit: 25\n  ranking: quality\n\"\"\",\n    tags=\"icu,sedation,remimazolam\",\n    description=\"ICU sedation comparison\",\n)\n\nunified_search(query=\"\", pipeline=\"saved:icu_remi_vs_propofol\")\n```\n\n### Structured output and continuation tools\n\nPipeline reports now include filter diagnostics and next-step handoffs. At the bottom of a Markdown report, the recommended continuation tools are:\n\n- `get_session_pmids()` for the run PMID set\n- `prepare_export(pmids=\"last\", format=\"ris\")` for Zotero/EndNote/Mendeley-style citation handoff\n- `save_literature_notes(pmids=\"last\", note_format=\"wiki\")` for local wiki/Foam-compatible Markdown notes\n\nUse structured JSON when another agent or extension should consume articles directly:\n\n```yaml\noutput:\n  format: json\n  limit: 20\n  ranking: quality\n```\n\nThe JSON response contains `summary`, `steps`, per-step `metadata`, and structured `articles`.\n\n### Which entry point to use\n\n| Situation | Recommended entry point |\n| ---- | -------- |\n| You only want to run it once quickly | inline `unified_search(..., pipeline=\"...\")` |\n| You want to reuse the same search strategy | `manage_pipeline(action=\"save\")` |\n| You want history diffs or local scheduling | save first, then use `saved:<name>` or `schedule_pipeline` |\n| A trusted local caller wants to load a YAML file | `load_pipeline(source=\"file:path/to/pipeline.yaml\")` |\n| An authenticated service caller wants reuse | save in the tenant store, then use `saved:<name>` |\n\n## Template Pipeline Tutorial\n\nTemplate pipelines cover roughly 80% of normal use cases. The YAML is not sent directly into the executor as-is. It is first expanded into a real step DAG.\n\n### 4 templates currently available\n\n| Template | Required parameters | Common optional parameters | Purpose |\n| -------- | -------- | ------------ | ---- |\n| `pico` | `P`, `I` | `C`, `O`, `sources`, `limit` | Clinical comparison question |\n| `comprehensive` | `query` | `sources`, `limit`, `min_year`, `max_year` | Broad multi-source search |\n| `exploration` | `pmid` | `limit` | Explore outward from one seed paper |\n| `gene_drug` | `term` | `sources`, `limit`, `min_year`, `max_year` | Gene- or drug-focused search |\n\n### `params` vs `template_params`\n\n- The shortest inline YAML usually uses `params`\n- `save_pipeline`, `manage_pipeline(save)`, and `load_pipeline` also accept `template_params`\n- When a saved pipeline is loaded, the system will often output it as `template_params`\n\nRecommendation:\n\n- Use `params` for handwritten inline pipelines\n- Use `template_params` for YAML that you want to save long term or review more formally\n\n### `pico`\n\n```yaml\ntemplate: pico\nparams:\n  P: ICU patients requiring sedation\n  I: remimazolam\n  C: propofol\n  O: delirium incidence, time to extubation\n  sources: pubmed,europe_pmc\n  limit: 30\noutput:\n  ranking: quality\n```\n\nThis expands automatically into:\n\n```text\npico -> search_p\n     -> search_i\n     -> search_c   # Only appears when C is provided\n     -> merged -> enriched\n```\n\n### `comprehensive`\n\n```yaml\ntemplate: comprehensive\ntemplate_params:\n  query: CRISPR gene therapy clinical trials\n  sources: pubmed,openalex,europe_pmc\n  limit: 30\n  min_year: 2020\noutput:\n  ranking: quality\n```\n\nThe correct field today is `query`, not `topic`.\n\nThis runs `expand` first, then launches the original query and expanded query in parallel, and finally performs merge + metrics.\n\n### `exploration`\n\n```yaml\ntemplate: exploration\nparams:\n  pmid: \"37076210\"\n  limit: 25\noutput:\n  ranking: impact\n```\n\nThis pulls `related`, `citing`, and `references` from the same seed paper.\n\n### `gene_drug`\n\n```yaml\ntemplate: gene_drug\ntemplate_params:\n  term: BRCA1 targeted therapy PARP inhibitors\n  sources: pubmed,openalex\n  limit: 20\n  min_year: 2020\noutput:\n  ranking: recency\n```\n\nThe correct field today is `term`, not `topic`.\n\n### Example files\n\nYou can directly inspect these examples:\n\n- `data/pipeline_examples/pico_remimazolam_vs_propofol.yaml`\n- `data/pipeline_examples/comprehensive_crispr_therapy.yaml`\n- `data/pipeline_examples/exploration_seed_paper.yaml`\n- `data/pipeline_examples/gene_drug_brca1.yaml`\n\n## Custom DAG Tutorial\n\n![Custom pipeline DAG workflow](images/custom-pipeline-dag.svg)\n\nWhen templates are not enough, define `steps` directly.\n\n### Minimum structure\n\n```yaml\nname: ai_anesthesiology_scan\nsteps:\n  - id: expand\n    action: expand\n    params:\n      topic: artificial intelligence anesthesiology\n\n  - id: search_original\n    action: search\n    params:\n      query: artificial intelligence anesthesiology\n      sources: pubmed,openalex\n      limit: 60\n      min_year: 2020\n\n  - id: search_mesh\n    action: search\n    inputs: [expand]\n    params:\n      strategy: mesh\n      sources: pubmed,europe_pmc\n      limit: 60\n      min_year: 2020\n\n  - id: merged\n    action: merge\n    inputs: [search_original, search_mesh]\n    params:\n      method: rrf\n\n  - id: enriched\n    action: metrics\n    inputs: [merged]\n\n  - id: filtered\n    action: filter\n    inputs: [enriched]\n    params:\n      min_year: 2021\n      has_abstract: true\n\noutput:\n  format: markdown\n  limit: 30\n  ranking: quality\n```\n\n### Step fields to remember\n\n| Field | Required? | Meaning |\n| ---- | ------ | ---- |\n| `id` | Recommended | It will be auto-fixed if missing, but you should name it yourself |\n| `action` | Required | Only a fixed action set is currently accepted |\n| `params` | Depends on action | Each action expects different parameters |\n| `inputs` | Depends on action | Can only reference steps defined earlier |\n| `on_error` | Optional | `skip` or `abort`, default is `skip` |\n\n### Actions currently available\n\n| Action | Common params | Meaning |\n| ------ | ----------- | ---- |\n| `search` | `query`, `sources`, `limit`, `min_year`, `max_year` | General literature search |\n| `pico` | `P`, `I`, `C`, `O` | Build PICO elements and a combined query |\n| `expand` | `topic` | Perform semantic expansion and MeSH strategy generation |\n| `details` | `pmids` | Fetch detailed article metadata |\n| `related` | `pmid`, `limit` | Find related articles |\n| `citing` | `pmid`, `limit` | Find citing articles |\n| `references` | `pmid`, `limit` | Find references |\n| `metrics` | none | Add iCite metrics |\n| `merge` | `method=union / intersection / rrf` | Merge multiple result streams |\n| `filter` | `min_year`, `max_year`, `article_types`, `min_citations`, `has_abstract` | Post-processing filters with diagnostics |\n\n### Shared globals and variables\n\nUse `globals` for step parameter defaults and `variables` for `${name}` placeholders. Step-level params override globals.\n\n```yaml\nname: reusable_remi_pipeline\nglobals:\n  sources: pubmed,europe_pmc\n  limit: ${per_step_limit}\n  min_year: ${start_year}\nvariables:\n  topic: remimazolam ICU sedation\n  per_step_limit: 50\n  start_year: 2020\nsteps:\n  - id: search_topic\n    action: search\n    params:\n      query: ${topic}\n  - id: filtered\n    action: filter\n    inputs: [search_topic]\n    params:\n      article_types: [RCT, systematic review]\n      has_abstract: true\noutput:\n  limit: 20\n  ranking: quality\n```\n\n`article_types` accepts canonical values such as `randomized-controlled-trial` and common aliases such as `RCT`, `randomized controlled trial`, `systematic review`, and `meta analysis`. Unknown article type requests fail closed with a warning instead of silently disabling the filter. The filter report shows before/after counts, exclusion reasons, mappings, and examples of excluded articles.\n\n### How `search` consumes upstream outputs\n\n`search` does not always need its own `query`. It can derive the query from an upstream step:\n\n- When upstream is `pico`, you can use `element: P|I|C|O`\n- When upstream is `pico`, you can also use `use_combined: precision|recall|intervention_outcome|comparison_outcome`\n- When upstream is `expand`, you can use `strategy: mesh` or another strategy name\n\n### Dry-run and partial execution\n\nUse `dry_run=True` before long pipelines or while editing variables:\n\n```python\nunified_search(query=\"\", pipeline=\"<yaml>\", dry_run=True)\n```\n\nUse `stop_at` to inspect an intermediate result set:\n\n```python\nunified_search(query=\"\", pipeline=\"<yaml>\", stop_at=\"merged\")\n```\n\n`stop_at` is inclusive: the named step runs, downstream steps are skipped. This is useful when you want to inspect a PICO merge before adding filters or metrics.\n\n### Full DAG example\n\nFor a longer multi-step example, see:\n\n- `data/pipeline_examples/ai_in_anesthesiology.yaml`\n\n## `manage_pipeline` usage\n\n`manage_pipeline` is the recommended facade today. Legacy tools still exist, but new tutorials should prefer the facade.\n\n### `action=\"list\"`\n\n```python\nmanage_pipeline()\nmanage_pipeline(action=\"list\")\nmanage_pipeline(action=\"list\", tag=\"sedation\")\nmanage_pipeline(action=\"list\", scope=\"workspace\")\n```\n\n### `action=\"save\"`\n\n```python\nmanage_pipeline(\n    action=\"save\",\n    name=\"weekly_remimazolam\",\n    config=\"\"\"\ntemplate: comprehensive\ntemplate_params:\n  query: remimazolam ICU sedation\n  sources: pubmed,openalex,europe_pmc\n  limit: 30\n\"\"\",\n    tags=\"sedation,icu\",\n    description=\"Weekly remimazolam surveillance\",\n    scope=\"workspace\",\n)\n```\n\n`config` must parse to a YAML/JSON mapping, not a list or scalar. If a client has trouble quoting multi-line YAML through `manage_pipeline(action=\"save\")`, call `save_pipeline(name=..., config=...)` with the same YAML string; both tools use the same validator.\n\n`scope` behavior:\n\n- local `workspace`: saved under `.pubmed-search/pipelines/` inside the project\n- local `global`: saved under the user data directory `~/.pubmed-search-mcp/pipelines/`\n- local `auto`: save to workspace when available, otherwise global\n- authenticated service: the tenant-derived store deliberately has no\n  process-wide workspace root; `auto` resolves to that principal's isolated\n  data root and `workspace` is unavailable\n\n### `action=\"load\"`\n\n```python\nmanage_pipeline(action=\"load\", source=\"weekly_remimazolam\")\nmanage_pipeline(action=\"load\", source=\"saved:weekly_remimazolam\")\nmanage_pipeline(action=\"load\", source=\"file:data/pipeline_examples/pico_remimazolam_vs_propofol.yaml\")\n```\n\n`load_pipeline` and `manage_pipeline(load)` currently support:\n\n- saved names\n- `saved:<name>`\n- local-only `file:path/to/pipeline.yaml`\n\nAuthenticated service callers cannot read `file:` paths from the server host;\nsave the YAML by name first. Direct URL loading is not currently part of the\nsupported contract.\n\n### `action=\"delete\"`\n\n```python\nmanage_pipeline(action=\"delete\", name=\"weekly_remimazolam\")\n```\n\n### `action=\"history\"`\n\n```python\nmanage_pipeline(action=\"history\", name=\"weekly_remimazolam\", limit=10)\n```\n\n### `action=\"schedule\"`\n\n```python\nmanage_pipeline(\n    action=\"schedule\",\n    name=\"weekly_remimazolam\",\n    cron=\"0 9 * * 1\",\n    diff_mode=True,\n    notify=True,\n)\n```\n\n### Legacy tool mapping\n\n| Facade | Legacy tool |\n| ------ | ------ |\n| `manage_pipeline(action=\"save\", ...)` | `save_pipeline(...)` |\n| `manage_pipeline(action=\"list\", ...)` | `list_pipelines(...)` |\n| `manage_pipeline(action=\"load\", ...)` | `load_pipeline(...)` |\n| `manage_pipeline(action=\"delete\", ...)` | `delete_pipeline(...)` |\n| `manage_pipeline(action=\"history\", ...)` | `get_pipeline_history(...)` |\n| `manage_pipeline(action=\"schedule\", ...)` | `schedule_pipeline(...)` |\n\n## Schedule and History\n\n### Recommended flow\n\n1. Save the pipeline first\n2. Use `unified_search(query=\"\", pipeline=\"saved:<name>\")` for manual execution\n3. Use `schedule_pipeline(...)` or `manage_pipeline(action=\"schedule\", ...)` for recurring runs\n4. Use `get_pipeline_history(name=\"...\")` or facade `history` to inspect run history\n\n### Scheduling\n\nThe examples below require a trusted local process with the scheduler enabled.\n`docker-compose.service.yml` disables the in-process scheduler. Storing schedule\nmetadata in a service does not make it execute; use manual runs or provide one\nexternal leader/lease before enabling recurring execution.\n\n```python\nschedule_pipeline(name=\"weekly_remimazolam\", cron=\"0 9 * * 1\")\nschedule_pipeline(name=\"monthly_crispr_review\", cron=\"0 8 1 * *\")\nschedule_pipeline(name=\"watch_icu_sedation\", cron=\"0 */6 * * *\")\n```\n\nCron format is the standard 5-field form:\n\n```text\nminute hour day month weekday\n```\n\nTo remove a schedule:\n\n```python\nschedule_pipeline(name=\"weekly_remimazolam\", cron=\"\")\n```\n\n### History\n\n```python\nget_pipeline_history(name=\"weekly_remimazolam\", limit=5)\nmanage_pipeline(action=\"history\", name=\"weekly_remimazolam\", limit=5)\n```\n\nHistory shows:\n\n- execution time\n- total article count\n- how many articles were added compared with the previous run\n- how many were removed\n- success or failure status\n\n### Current limitations\n\n- There is no standalone `list_schedules()` MCP tool yet\n- If you want stable history and diffs, prefer saved pipelines over one-off inline pipelines\n- Service mode stays single-process/single-replica, and its Compose profile does\n  not run scheduled pipelines\n\n## Common errors and auto-fix behavior\n\nAuto-fix currently happens mainly during schema parsing and semantic validation. In practice, the system first repairs data shape and then repairs meaning when possible.\n\n### Cases that are auto-fixed\n\n| Problem | Input | Auto-fixed result |\n| ---- | ---- | -------- |\n| action alias | `find` | `search` |\n| action typo | `searc` | `search` |\n| template alias | `clinical` | `pico` |\n| template typo | `comprehensiv` | `comprehensive` |\n| single-string inputs | `inputs: s1` | `inputs: [s1]` |\n| non-dict params | `params: \"oops\"` | `params: {}` |\n| missing step id | `id: \"\"` | auto-filled as `step_1` and similar |\n| duplicate step id | `search`, `search` | second one becomes `search_2` |\n| reference to missing step | `inputs: [missing]` | that reference is removed |\n| reference to future step | `inputs: [later_step]` | that reference is removed |\n| invalid `on_error` | `retry` | `skip` |\n| invalid output format | `xml` | `markdown` |\n| mistyped output ranking | `impac` | `impact` |\n| invalid output limit | `0` or negative | `20` |\n\n`output.format: json` is valid and is no longer auto-fixed to Markdown.\n\n### Cases that are not auto-fixed and will fail\n\n| Problem | Why it fails |\n| ---- | ---- |\n| template name is completely unrecognizable | no alias or fuzzy match applies |\n| action name is completely unrecognizable | no alias or fuzzy match applies |\n| template is missing required parameters | for example, `pico` without `P` or `I` |\n| there are no `steps` and no `template` | nothing executable remains |\n| more than 20 steps | exceeds the system limit |\n\n### One intentionally broken example\n\n```yaml\ntemplate: clinical\ntemplate_params:\n  P: ICU patients\n  I: remimazolam\noutput:\n  format: xml\n  limit: 0\n  ranking: impac\n```\n\nThe system currently auto-fixes it to the equivalent of:\n\n```yaml\ntemplate: pico\ntemplate_params:\n  P: ICU patients\n  I: remimazolam\noutput:\n  format: markdown\n  limit: 20\n  ranking: impact\n```\n\n### Practical recommendations\n\n1. If you want auto-fix, history, and scheduling, save first and run second.\n2. Use inline template pipelines only for small parameter sets. For review and versioning, save YAML files.\n3. Start custom DAGs from the smallest runnable graph, then add `merge`, `metrics`, and `filter` incrementally.\n4. In local mode, use `scope=\"workspace\"` when the pipeline should be shared in a trusted repo.\n5. In local mode, use `scope=\"global\"` for your own reusable search habits across projects.\n6. In authenticated service mode, omit workspace/file paths and reuse named pipelines from the current tenant store.\n7. Keep Zotero Keeper integration outside PubMed MCP core. PubMed MCP should produce RIS/CSL/JSON/wiki notes; Zotero Keeper or another external client should handle Zotero import, duplicate policy, and library-specific behavior.\n",
   "pipeline-tutorial-zh": "<!-- Generated from docs/PIPELINE_MODE_TUTORIAL.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# Pipeline Mode Tutorial\n\n> Status: current API tutorial\n> Last updated: 2026-08-09\n> Language: [English](#/pipeline-tutorial) | **繁體中文**\n\n這份文件只描述目前真的可用的 pipeline mode 行為，不重複 RFC 設計稿。重點是直接可執行、可保存、可排程、可查歷史。\n\n## Pipeline Mode 快速上手\n\n![Pipeline entry points and execution workflow](images/pipeline-entrypoints-and-dag.svg)\n\nPipeline mode 有 3 種最常用入口：\n\n1. 直接把 YAML/JSON 丟給 `unified_search(..., pipeline=\"...\")`\n2. 先用 `manage_pipeline` 或 `save_pipeline` 保存，再用 `saved:<name>` 執行\n3. 保存後交給 `schedule_pipeline` 或 `manage_pipeline(action=\"schedule\")` 定期跑\n\n> **先選擇 runtime。** 可信任的本機 stdio/loopback caller 可使用 project workspace\n> scope、`file:` source 與 in-process scheduler。認證 service caller 只使用當前\n> principal 隔離的 saved-pipeline store：不存取 process-wide workspace，也不讀\n> `file:`。Service Compose 會停用 scheduler，直到維運者提供單一 external leader/lease。\n\n### 最短可用範例: inline template\n\n```python\nunified_search(\n    query=\"\",\n    pipeline=\"\"\"\ntemplate: pico\nparams:\n  P: ICU patients requiring mechanical ventilation\n  I: remimazolam\n  C: propofol\n  O: sedation adequacy\noutput:\n  format: markdown\n  limit: 20\n  ranking: balanced\n\"\"\",\n)\n```\n\n注意:\n\n- `unified_search` 在函式簽名上仍要求 `query`，但只要設定了 `pipeline`，一般搜尋參數會被忽略。保守寫法就是 `query=\"\"`。\n- `output_format=\"json\"` 會強制回 structured JSON。pipeline 內的 `output.format: json` 也會回 structured JSON。\n- `dry_run=True` 會預覽解析後的 DAG，不做外部搜尋。`stop_at=\"<step_id>\"` 則只執行到指定 step。\n\n### 最短可用範例: 先保存再執行\n\n```python\nmanage_pipeline(\n    action=\"save\",\n    name=\"icu_remi_vs_propofol\",\n    config=\"\"\"\ntemplate: pico\nparams:\n  P: ICU patients requiring mechanical ventilation\n  I: remimazolam\n  C: propofol\n  O: delirium, sedation quality\noutput:\n  limit: 25\n  ranking: quality\n\"\"\",\n    tags=\"icu,sedation,remimazolam\",\n    description=\"ICU sedation comparison\",\n)\n\nunified_search(query=\"\", pipeline=\"saved:icu_remi_vs_propofol\")\n```\n\n### Structured output 與後續工具\n\nPipeline Markdown report 會包含 filter diagnostics，也會在底部附上後續 handoff 建議：\n\n- `get_session_pmids()` 取回這次 run 的 PMID set\n- `prepare_export(pmids=\"last\", format=\"ris\")` 交給 Zotero/EndNote/Mendeley 類引用管理器\n- `save_literature_notes(pmids=\"last\", note_format=\"wiki\")` 存成本機 wiki/Foam-compatible Markdown 筆記\n\n如果要讓另一個 agent 或 extension 直接吃結構化文章資料，用 JSON：\n\n```yaml\noutput:\n  format: json\n  limit: 20\n  ranking: quality\n```\n\nJSON 回應會包含 `summary`、`steps`、每個 step 的 `metadata`、以及 structured `articles`。\n\n### 什麼時候用哪一種\n\n| 情境 | 推薦入口 |\n| ---- | -------- |\n| 只想快速跑一次 | inline `unified_search(..., pipeline=\"...\")` |\n| 想重複使用同一個搜尋策略 | `manage_pipeline(action=\"save\")` |\n| 想看歷史 diff 或本機排程 | 先保存，再用 `saved:<name>` / `schedule_pipeline` |\n| 可信任的本機 caller 想從 YAML 檔載入 | `load_pipeline(source=\"file:path/to/pipeline.yaml\")` |\n| 認證 service caller 要重用 | 存入 tenant store，再用 `saved:<name>` |\n\n## Template Pipeline 教學\n\nTemplate pipeline 適合 80% 的常見需求。它不是把 YAML 原封不動送進 executor，而是先展開成真正的 step DAG。\n\n### 目前可用的 4 個 templates\n\n| Template | 必填參數 | 常用可選參數 | 用途 |\n| -------- | -------- | ------------ | ---- |\n| `pico` | `P`, `I` | `C`, `O`, `sources`, `limit` | 臨床比較問題 |\n| `comprehensive` | `query` | `sources`, `limit`, `min_year`, `max_year` | 多來源全面搜尋 |\n| `exploration` | `pmid` | `limit` | 從一篇 seed paper 往外探索 |\n| `gene_drug` | `term` | `sources`, `limit`, `min_year`, `max_year` | 基因或藥物主題搜尋 |\n\n### `params` 與 `template_params`\n\n- inline YAML 最短寫法用 `params`\n- `save_pipeline` / `manage_pipeline(save)` / `load_pipeline` 也接受 `template_params`\n- 載入已保存 pipeline 時，系統通常會輸出成 `template_params`\n\n建議:\n\n- 手寫 inline pipeline 時用 `params`\n- 要長期保存或 review 的 YAML，用 `template_params` 可讀性比較穩定\n\n### `pico`\n\n```yaml\ntemplate: pico\nparams:\n  P: ICU patients requiring sedation\n  I: remimazolam\n  C: propofol\n  O: delirium incidence, time to extubation\n  sources: pubmed,europe_pmc\n  limit: 30\noutput:\n  ranking: quality\n```\n\n這會自動展開成:\n\n```text\npico -> search_p\n     -> search_i\n     -> search_c   # 只有設定 C 才會出現\n     -> merged -> enriched\n```\n\n### `comprehensive`\n\n```yaml\ntemplate: comprehensive\ntemplate_params:\n  query: CRISPR gene therapy clinical trials\n  sources: pubmed,openalex,europe_pmc\n  limit: 30\n  min_year: 2020\noutput:\n  ranking: quality\n```\n\n注意目前正確欄位是 `query`，不是 `topic`。\n\n這會先做 `expand`，再平行跑原始查詢與擴展查詢，最後 merge + metrics。\n\n### `exploration`\n\n```yaml\ntemplate: exploration\nparams:\n  pmid: \"37076210\"\n  limit: 25\noutput:\n  ranking: impact\n```\n\n這會從同一篇 seed paper 同步拉 `related`、`citing`、`references`。\n\n### `gene_drug`\n\n```yaml\ntemplate: gene_drug\ntemplate_params:\n  term: BRCA1 targeted therapy PARP inhibitors\n  sources: pubmed,openalex\n  limit: 20\n  min_year: 2020\noutput:\n  ranking: recency\n```\n\n注意目前正確欄位是 `term`，不是 `topic`。\n\n### 範例檔\n\n目前可直接參考這些範例:\n\n- `data/pipeline_examples/pico_remimazolam_vs_propofol.yaml`\n- `data/pipeline_examples/comprehensive_crispr_therapy.yaml`\n- `data/pipeline_examples/exploration_seed_paper.yaml`\n- `data/pipeline_examples/gene_drug_brca1.yaml`\n\n## Custom DAG 教學\n\n![Custom pipeline DAG workflow](images/custom-pipeline-dag.svg)\n\n當 template 不夠時，直接寫 `steps`。\n\n### 最小結構\n\n```yaml\nname: ai_anesthesiology_scan\nsteps:\n  - id: expand\n    action: expand\n    params:\n      topic: artificial intelligence anesthesiology\n\n  - id: search_original\n    action: search\n    params:\n      query: artificial intelligence anesthesiology\n      sources: pubmed,openalex\n      limit: 60\n      min_year: 2020\n\n  - id: search_mesh\n    action: search\n    inputs: [expand]\n    params:\n      strategy: mesh\n      sources: pubmed,europe_pmc\n      limit: 60\n      min_year: 2020\n\n  - id: merged\n    action: merge\n    inputs: [search_original, search_mesh]\n    params:\n      method: rrf\n\n  - id: enriched\n    action: metrics\n    inputs: [merged]\n\n  - id: filtered\n    action: filter\n    inputs: [enriched]\n    params:\n      min_year: 2021\n      has_abstract: true\n\noutput:\n  format: markdown\n  limit: 30\n  ranking: quality\n```\n\n### 每個 step 要記得的事\n\n| 欄位 | 必要性 | 說明 |\n| ---- | ------ | ---- |\n| `id` | 建議必填 | 不填也會 auto-fix，但最好自己取名 |\n| `action` | 必填 | 目前只接受固定 action 集合 |\n| `params` | 視 action 而定 | 各 action 需要的參數不同 |\n| `inputs` | 視 action 而定 | 只能引用前面已定義的 step |\n| `on_error` | 可選 | `skip` 或 `abort`，預設 `skip` |\n\n### 目前可用 actions\n\n| Action | 常用 params | 說明 |\n| ------ | ----------- | ---- |\n| `search` | `query`, `sources`, `limit`, `min_year`, `max_year` | 一般文獻搜尋 |\n| `pico` | `P`, `I`, `C`, `O` | 建立 PICO elements 與組合 query |\n| `expand` | `topic` | 做語意擴展與 MeSH strategy |\n| `details` | `pmids` | 補抓文章詳情 |\n| `related` | `pmid`, `limit` | 找 related articles |\n| `citing` | `pmid`, `limit` | 找 citing articles |\n| `references` | `pmid`, `limit` | 找 references |\n| `metrics` | 無需額外 params | 補 iCite metrics |\n| `merge` | `method=union / intersection / rrf` | 合併多路結果 |\n| `filter` | `min_year`, `max_year`, `article_types`, `min_citations`, `has_abstract` | 帶 diagnostics 的後處理篩選 |\n\n### Shared globals 與 variables\n\n`globals` 是每個 step 會繼承的預設 params；`variables` 可以在字串中用 `${name}` 替換。step 自己的 params 會覆蓋 globals。\n\n```yaml\nname: reusable_remi_pipeline\nglobals:\n  sources: pubmed,europe_pmc\n  limit: ${per_step_limit}\n  min_year: ${start_year}\nvariables:\n  topic: remimazolam ICU sedation\n  per_step_limit: 50\n  start_year: 2020\nsteps:\n  - id: search_topic\n    action: search\n    params:\n      query: ${topic}\n  - id: filtered\n    action: filter\n    inputs: [search_topic]\n    params:\n      article_types: [RCT, systematic review]\n      has_abstract: true\noutput:\n  limit: 20\n  ranking: quality\n```\n\n`article_types` 支援 canonical 值，例如 `randomized-controlled-trial`，也支援常見 alias，例如 `RCT`、`randomized controlled trial`、`systematic review`、`meta analysis`。未知 article type 會 fail closed 並附 warning，不會默默關掉 type filter。Filter report 會顯示篩選前後數量、排除原因、article type mapping、以及被排除文章範例。\n\n### `search` 會怎麼吃上游結果\n\n`search` 不一定要自己寫 `query`，它也能從上游 step 導出 query:\n\n- 上游是 `pico` 時，可用 `element: P|I|C|O`\n- 上游是 `pico` 時，也可用 `use_combined: precision|recall|intervention_outcome|comparison_outcome`\n- 上游是 `expand` 時，可用 `strategy: mesh` 或其他 strategy 名稱\n\n### Dry-run 與部分執行\n\n長 pipeline 或正在調整 variables 時，先用 `dry_run=True`：\n\n```python\nunified_search(query=\"\", pipeline=\"<yaml>\", dry_run=True)\n```\n\n要查看中間結果，用 `stop_at`：\n\n```python\nunified_search(query=\"\", pipeline=\"<yaml>\", stop_at=\"merged\")\n```\n\n`stop_at` 是 inclusive：指定的 step 會執行，下游 step 會跳過。這很適合先檢查 PICO merge，再決定要不要加 filter 或 metrics。\n\n### 完整 DAG 範例\n\n完整多步驟範例可看:\n\n- `data/pipeline_examples/ai_in_anesthesiology.yaml`\n\n## manage_pipeline 用法\n\n`manage_pipeline` 是目前最推薦的 facade。舊工具仍保留，但新教學都以 facade 為主。\n\n### `action=\"list\"`\n\n```python\nmanage_pipeline()\nmanage_pipeline(action=\"list\")\nmanage_pipeline(action=\"list\", tag=\"sedation\")\nmanage_pipeline(action=\"list\", scope=\"workspace\")\n```\n\n### `action=\"save\"`\n\n```python\nmanage_pipeline(\n    action=\"save\",\n    name=\"weekly_remimazolam\",\n    config=\"\"\"\ntemplate: comprehensive\ntemplate_params:\n  query: remimazolam ICU sedation\n  sources: pubmed,openalex,europe_pmc\n  limit: 30\n\"\"\",\n    tags=\"sedation,icu\",\n    description=\"Weekly remimazolam surveillance\",\n    scope=\"workspace\",\n)\n```\n\n`config` 必須 parse 成 YAML/JSON mapping，不能是 list 或 scalar。如果某個 client 很難正確 quote 多行 YAML 給 `manage_pipeline(action=\"save\")`，可以改用 `save_pipeline(name=..., config=...)` 傳同一段 YAML；兩個工具共用同一套 validator。\n\n`scope` 行為:\n\n- 本機 `workspace`：存在專案底下 `.pubmed-search/pipelines/`\n- 本機 `global`：存在使用者資料目錄 `~/.pubmed-search-mcp/pipelines/`\n- 本機 `auto`：有 workspace 就存 workspace，否則 global\n- 認證 service：tenant-derived store 刻意沒有 process-wide workspace root；\n  `auto` 會解析到該 principal 隔離的 data root，`workspace` 不可用\n\n### `action=\"load\"`\n\n```python\nmanage_pipeline(action=\"load\", source=\"weekly_remimazolam\")\nmanage_pipeline(action=\"load\", source=\"saved:weekly_remimazolam\")\nmanage_pipeline(action=\"load\", source=\"file:data/pipeline_examples/pico_remimazolam_vs_propofol.yaml\")\n```\n\n目前 `load_pipeline` / `manage_pipeline(load)` 支援:\n\n- 已保存名稱\n- `saved:<name>`\n- 僅本機的 `file:path/to/pipeline.yaml`\n\n認證 service caller 不能從 server host 讀取 `file:` path；請先以名稱存入 YAML。\n目前不承諾直接從 URL 載入。\n\n### `action=\"delete\"`\n\n```python\nmanage_pipeline(action=\"delete\", name=\"weekly_remimazolam\")\n```\n\n### `action=\"history\"`\n\n```python\nmanage_pipeline(action=\"history\", name=\"weekly_remimazolam\", limit=10)\n```\n\n### `action=\"schedule\"`\n\n```python\nmanage_pipeline(\n    action=\"schedule\",\n    name=\"weekly_remimazolam\",\n    cron=\"0 9 * * 1\",\n    diff_mode=True,\n    notify=True,\n)\n```\n\n### 舊工具對照\n\n| Facade | 舊工具 |\n| ------ | ------ |\n| `manage_pipeline(action=\"save\", ...)` | `save_pipeline(...)` |\n| `manage_pipeline(action=\"list\", ...)` | `list_pipelines(...)` |\n| `manage_pipeline(action=\"load\", ...)` | `load_pipeline(...)` |\n| `manage_pipeline(action=\"delete\", ...)` | `delete_pipeline(...)` |\n| `manage_pipeline(action=\"history\", ...)` | `get_pipeline_history(...)` |\n| `manage_pipeline(action=\"schedule\", ...)` | `schedule_pipeline(...)` |\n\n## Schedule 與 History\n\n### 正確流程\n\n1. 先保存 pipeline\n2. 手動執行用 `unified_search(query=\"\", pipeline=\"saved:<name>\")`\n3. 定期執行用 `schedule_pipeline(...)` 或 `manage_pipeline(action=\"schedule\", ...)`\n4. 看歷史用 `get_pipeline_history(name=\"...\")` 或 facade 的 `history`\n\n### 排程\n\n下列範例需要已啟用 scheduler 的可信任本機 process。`docker-compose.service.yml`\n會停用 in-process scheduler；在 service 中存下 schedule metadata 不代表它會自動執行。\n啟用 recurring execution 前，請改用手動 run 或提供單一 external leader/lease。\n\n```python\nschedule_pipeline(name=\"weekly_remimazolam\", cron=\"0 9 * * 1\")\nschedule_pipeline(name=\"monthly_crispr_review\", cron=\"0 8 1 * *\")\nschedule_pipeline(name=\"watch_icu_sedation\", cron=\"0 */6 * * *\")\n```\n\nCron 格式是標準 5 欄位:\n\n```text\nminute hour day month weekday\n```\n\n移除排程:\n\n```python\nschedule_pipeline(name=\"weekly_remimazolam\", cron=\"\")\n```\n\n### history\n\n```python\nget_pipeline_history(name=\"weekly_remimazolam\", limit=5)\nmanage_pipeline(action=\"history\", name=\"weekly_remimazolam\", limit=5)\n```\n\nhistory 會顯示:\n\n- 執行時間\n- 文章總數\n- 相較前一次新增多少篇\n- 移除多少篇\n- 成功或失敗狀態\n\n### 現況限制\n\n- 目前沒有獨立的 `list_schedules()` MCP tool\n- 想要穩定追蹤 history / diff，請優先使用「已保存 pipeline」而不是臨時 inline pipeline\n- Service mode 保持單 process/單 replica，且其 Compose profile 不執行 scheduled pipelines\n\n## 常見錯誤與 Auto-fix 行為\n\n目前 auto-fix 主要發生在 schema parse 與 semantic validation。也就是說，系統會先修資料形狀，再修語意問題。\n\n### 會自動修正的情況\n\n| 問題 | 輸入 | 修正結果 |\n| ---- | ---- | -------- |\n| action alias | `find` | `search` |\n| action typo | `searc` | `search` |\n| template alias | `clinical` | `pico` |\n| template typo | `comprehensiv` | `comprehensive` |\n| 單一字串 inputs | `inputs: s1` | `inputs: [s1]` |\n| 非 dict 的 params | `params: \"oops\"` | `params: {}` |\n| 缺少 step id | `id: \"\"` | 自動補 `step_1` 之類 |\n| 重複 step id | `search`, `search` | 第二個改成 `search_2` |\n| 引用不存在的 step | `inputs: [missing]` | 該引用移除 |\n| 引用未來 step | `inputs: [later_step]` | 該引用移除 |\n| `on_error` 非法 | `retry` | `skip` |\n| output format 非法 | `xml` | `markdown` |\n| output ranking typo | `impac` | `impact` |\n| output limit 非法 | `0` 或負數 | `20` |\n\n`output.format: json` 是合法格式，不會再被 auto-fix 成 Markdown。\n\n### 不會自動修正，會直接報錯的情況\n\n| 問題 | 原因 |\n| ---- | ---- |\n| template 名稱完全無法辨識 | 沒有 alias 或 fuzzy match 可套用 |\n| action 名稱完全無法辨識 | 沒有 alias 或 fuzzy match 可套用 |\n| template 缺少必要參數 | 例如 `pico` 沒有 `P` 或 `I` |\n| 沒有任何 steps 也沒有 template | 無法執行 |\n| steps 超過 20 | 超過系統上限 |\n\n### 一個故意寫錯的範例\n\n```yaml\ntemplate: clinical\ntemplate_params:\n  P: ICU patients\n  I: remimazolam\noutput:\n  format: xml\n  limit: 0\n  ranking: impac\n```\n\n目前系統會自動把它修成等價於:\n\n```yaml\ntemplate: pico\ntemplate_params:\n  P: ICU patients\n  I: remimazolam\noutput:\n  format: markdown\n  limit: 20\n  ranking: impact\n```\n\n### 實務建議\n\n1. 想吃到 auto-fix、history、schedule，先保存再跑。\n2. Template pipeline 只在參數很簡單時 inline；要 review / 版本控管就存 YAML。\n3. 自訂 DAG 先從最小可跑版本開始，再逐步加 `merge`、`metrics`、`filter`。\n4. 本機模式需要在可信任 repo 共用時，用 `scope=\"workspace\"`。\n5. 本機模式只是自己跨專案重用時，用 `scope=\"global\"`。\n6. 認證 service mode 省略 workspace/file paths，並從當前 tenant store 重用 named pipeline。\n7. Zotero Keeper 整合維持在 PubMed MCP core 外部。PubMed MCP 只負責產生 RIS/CSL/JSON/wiki notes；Zotero 匯入、duplicate policy、library-specific 行為交給 Zotero Keeper 或其他外部 client。\n",
-  "tools-usage-guide": "<!-- Generated from docs/TOOLS_USAGE_GUIDE.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP Tools Usage Guide\n\nCapability-first guide for using the 45-tool PubMed Search MCP surface without treating the tool list as a menu to memorize.\n\n**Language**: **English** | [繁體中文](#/tools-usage-guide-zh)\n\n## Reading Order\n\n1. Start with the capability family that matches the user intent.\n2. Use session tools to reuse the latest result set instead of asking the model to remember PMIDs.\n3. Export citations or notes only after the evidence set is clear.\n4. Use the raw [tools index](#/quick-reference) only when you need exact tool names.\n\n## The 8 Capability Families\n\n![PubMed Search MCP capability map](images/tool-capability-map.svg)\n\n| Capability | Primary Tools | Use When |\n| --- | --- | --- |\n| Search entry | `unified_search` | The user wants papers, articles, or a first pass over a topic. |\n| Query intelligence | `analyze_search_query`, `parse_pico`, `generate_search_queries` | The query needs MeSH, agent-provided PICO handoff, synonym expansion, or strategy planning. |\n| Discovery | `fetch_article_details`, `find_related_articles`, `find_citing_articles`, `get_article_references`, `build_citation_tree` | The user has seed PMIDs and wants context, related work, or citation lineage. |\n| Full text and figures | `get_fulltext`, `get_text_mined_terms`, `get_article_figures` | The user needs article body text, evidence sections, entities, captions, or image URLs. |\n| External biomedical data | `search_gene`, `get_gene_details`, `search_compound`, `get_compound_details`, `search_clinvar` | The research question moves from papers into NCBI gene, compound, or clinical variant data. |\n| Evaluation and research evolution | `get_citation_metrics`, `build_research_chronicle`, `read_research_chronicle` | The user asks what matters, what changed over time, or how fields compare. |\n| Persistence and sessions | `read_session`, `get_session_pmids`, `get_cached_article`, `get_session_summary`, pipeline tools | The user wants to resume, repeat, audit, schedule, or save a search workflow. |\n| Export and local notes | `prepare_export`, `save_literature_notes` | The user wants Zotero/EndNote/BibTeX files or local Markdown/wiki notes. |\n\n## Intent Routing\n\n| User Intent | Recommended Flow |\n| --- | --- |\n| Quick literature search | `unified_search(query=..., limit=...)` |\n| Clinical comparison | Agent P/I/C/O -> `parse_pico` -> `unified_search(pipeline=\"template: pico...\")` |\n| Systematic review seed | `analyze_search_query` -> `generate_search_queries` -> `unified_search(options=\"systematic\")` -> `save_pipeline` |\n| Provider-native semantic retrieval | `unified_search(sources=\"openalex\", options=\"native_semantic\")` |\n| Important paper exploration | `fetch_article_details` -> `find_related_articles` / `find_citing_articles` / `get_article_references` |\n| Full-text synthesis | `get_fulltext` -> `get_text_mined_terms` -> structured summary |\n| Zotero handoff | `prepare_export(pmids=\"last\", format=\"ris\")` or Zotero Keeper import tools |\n| Local knowledge-base notes | `save_literature_notes(pmids=\"last\")` |\n| Repeatable search workflow | `save_pipeline` -> `unified_search(pipeline=\"saved:<name>\")` |\n\nZotero Keeper should remain an external integration boundary. PubMed Search MCP produces official RIS/MEDLINE/CSL JSON exports, local RIS/BibTeX/CSV/MEDLINE/JSON exports, and local wiki notes; Zotero Keeper or another client owns Zotero import, duplicate handling, and library-specific policies.\n\n## Capability Workflow Diagrams\n\nEach feature family has a workflow diagram so users and developers can see where a tool sits in the larger research path.\n\n### Search Entry And Query Intelligence\n\n![Search and query intelligence workflow](images/search-query-workflow.svg)\n\nUse this path for `unified_search`, `parse_pico`, `generate_search_queries`, `analyze_search_query`, and ICD-aware search preparation. The important boundary is that the agent performs semantic PICO extraction, while `parse_pico` validates the structured handoff and returns a backend `template: pico` pipeline.\n\nThere is exactly one generic literature-search tool. Choose its retrieval\npolicy with `options` instead of looking for provider-specific search tools:\n\n| Policy | Example | Contract |\n| --- | --- | --- |\n| Default | `unified_search(query=\"sepsis biomarkers\")` | Relevance/keyword routing across the normal capable source plan. |\n| Native semantic | `unified_search(query=\"mechanisms of resistance\", sources=\"openalex\", options=\"native_semantic\")` | OpenAlex title/abstract semantic retrieval; provider maximum 50. |\n| Systematic | `unified_search(query=\"melanoma AND immunotherapy\", sources=\"pubmed,openalex,semantic_scholar\", options=\"systematic\")` | Deterministic, bounded provider execution: OpenAlex cursor and Semantic Scholar bulk where selected. |\n\n`native_semantic` and `systematic` are mutually exclusive. Both disable the\nmulti-strategy deep-search expansion so the selected provider-native plan stays\nauditable. An explicit unsupported source/mode combination fails before the\nnetwork call; automatic routing retains capable sources only. The public\n`limit` remains at most 100 per source, so `systematic` is a reproducible\nretrieval primitive, not proof of exhaustive systematic-review coverage.\n\nInput validation is strict and occurs before provider I/O. `limit` must be an\ninteger in `1..100`; filter tokens must use supported `key:value` forms; year\nbounds must be within 1000–2100 and ordered; and unknown option flags, ranking\nmodes, or output formats are rejected instead of silently ignored. In normal\ndeep mode, the same public `limit` is the **total budget for one source across\nall of its generated strategies**. The broker allocates that budget across the\nstrategies, clips over-returning adapters, and applies bounded global and\nper-source concurrency plus strategy deadlines.\n\nJSON/TOON output and persistent artifacts preserve `retrieval_mode` and\nper-source `source_metadata`, including requested/provider mode, canonical or\ncompiled query, opaque continuation token/cursor when returned, cost/rate\nmetadata, and warnings. Continuation data is currently provenance only: the\npublic facade has no cursor-resume argument. Consult\n[Source Contracts](#/source-contracts),\n[Semantic Scholar](#/semantic-scholar-api), and [OpenAlex](#/openalex-api)\nbefore interpreting provider totals or continuing a search.\n\nFor agent decisions on a normal result envelope, prefer the structured\n`search_status` object over rendered text length. It labels the retrieval as\nbounded and non-exhaustive and\nseparates `completed`, valid `empty`, `partial`, and all-source `failed`\noutcomes. It also reports returned count, attempted/successful/failed/retryable\nsources, continuation sources, and sources whose completeness is unknown.\n\nClinicalTrials.gov is an explicit adjunct, not another literature-search leg.\nUse `options=\"trials\"` only when a Markdown response should include up to three\nrelated registry records. The request is never made by default, does not affect\narticle ranking/source counts, and is recorded separately in the search\nartifact. JSON/TOON output does not run the display-only adjunct.\n\n### Article Discovery And Citation Mapping\n\n![Article discovery and citation workflow](images/discovery-citation-workflow.svg)\n\nUse this path once you have one or more seed PMIDs. It covers `fetch_article_details`, `find_related_articles`, `find_citing_articles`, `get_article_references`, `build_citation_tree`, and `get_citation_metrics`.\n\n### Reference Verification\n\n![Reference verification workflow](images/reference-verification-workflow.svg)\n\nUse `verify_reference_list` when a manuscript, bibliography, or generated answer needs PubMed-backed citation checking. Treat matches and mismatches as an audit trail, not as prose-only summary.\n\n### Full Text, Figures, And Image Evidence\n\n![Full text, figures, and biomedical image workflow](images/visual-evidence-workflow.svg)\n\nUse this path for `get_fulltext`, `get_text_mined_terms`, `get_article_figures`, `analyze_figure_for_search`, and `search_biomedical_images`. Full text, figure metadata, and image search are separate evidence channels with different availability limits.\n\nUse `analyze_figure_for_search` when the user provides an image URL or uploaded image payload and wants the agent to infer search terms from the visual content. The tool returns MCP `ImageContent`; the LLM agent performs the visual interpretation and should immediately continue with `search_biomedical_images` or `unified_search`.\n\nUse `search_biomedical_images` when the visual question is already textual. Open-i is the current primary source, supports filters such as `image_type`, `collection`, `article_type`, `specialty`, `license_type`, `search_fields`, and requires English medical terminology.\n\n### External Biomedical Data\n\n![NCBI extended biomedical data workflow](images/ncbi-extended-workflow.svg)\n\nUse this path for `search_gene`, `get_gene_details`, `get_gene_literature`, `search_compound`, `get_compound_details`, `get_compound_literature`, and `search_clinvar` when the question moves beyond papers into NCBI biomedical records.\n\n### Evaluation, Timeline, And Comparison\n\n![Research Chronicle Architecture and Lineage Flow](images/research-chronicle-lineage-flow.svg)\n![Evaluation and timeline workflow](images/timeline-evaluation-workflow.svg)\n\nUse this path for `get_citation_metrics`, `build_research_chronicle`, and `read_research_chronicle` when the user asks what mattered, when the field changed, or how topics diverged.\n\n`build_research_chronicle` is the single research-evolution tool. It accepts `topic=...`, explicit comma-separated `pmids=...`, or an existing `chronicle_id=...`, detects milestone-like papers, and can return `summary`, `chronicle_map`, `timeline`, `tree`, `graph`, `evidence`, `milestones`, `mermaid`, `timeline_mermaid`, `mindmap`, `narrative`, or `json`. `mermaid` combines a horizontal year spine and lineage branches; `chronicle_map` is its JSON coordinate contract. Use `read_research_chronicle(action=\"milestones\")` for milestone distribution diagnostics and `read_research_chronicle(action=\"compare\", topics=\"a,b\")` for up to five topic tracks.\n\nUse precise terms:\n\n- **Timeline**: chronological milestone projection.\n- **Lineage tree**: retrieval-bounded branch projection from timeline events, not a causal genealogy.\n- **Chronicle map**: one horizontal time spine with observed lines anchored at their earliest dated papers in the retrieved scope. Semantic branches require a signal shared by multiple papers; singleton-only or insufficient MeSH/keyword support produces a warned research-stage fallback. Same-year layout does not imply precedence when date precision cannot establish it.\n- **Context graph preview**: `unified_search(options=\"context_graph\")`, a lightweight preview from the current PMID-backed ranked set.\n- **Citation tree**: `build_citation_tree`, a single-seed forward/backward citation network.\n- **Research Chronicle**: `build_research_chronicle` / `read_research_chronicle`, the persistent, versioned, evidence-backed record. See [Advanced Research Workflows](#/advanced-workflows) and [Research Chronicle Rebuild Spec](#/research-chronicle-rebuild-spec).\n\n### Research Chronicle\n\nUse `build_research_chronicle` whenever the user asks how a field evolved. It replaces the older one-shot timeline tools: each immutable revision is appended atomically with a monotonic number, so re-running it later lets you diff revisions and answer \"what changed since last time\".\n\nChronology is the primary axis and research branches are a secondary projection of the same stored entries. Branches describe patterns observed in the selected query/PMID/source/year scope, not causal descent. `earliest_observed_in_scope` identifies the earliest dated retrieved candidate only; it does not establish the field's true first report. Date-precision intervals must be disjoint before the graph can assert `precedes` or `supersedes`.\n\nEach chronicle entry carries a one-sentence claim with inline citations, its supporting/contradicting/updating evidence, a branch (lineage) assignment, and a confidence score. A typed provenance graph links Topic → Branch → Entry → EvidenceArticle and is validated against edge invariants. The audit reports evidence coverage, identifier coverage, branch coverage, semantic-lineage basis/coverage, graph integrity, chronology gaps, and per-source retrieval counts.\n\nTopic mode applies `min_year` / `max_year` in the PubMed request before the relevance-capped fetch. Final event selection pins the first and last observed papers, prioritizes explicit landmark importance/citations, then fills the remaining capacity across the largest temporal gaps. Audit source coverage distinguishes PubMed `returned` from `available` and warns for capped samples, downstream selection, or unknown availability. An upstream PubMed error or zero article evidence returns an error and publishes no Chronicle revision.\n\nPMID input accepts only ASCII digits with an optional `PMID:` prefix and explicit separators; DOI or arbitrary mixed identifier text is rejected. Entry IDs use PMID, then DOI, as stable evidence identity so date and milestone reclassification becomes an update rather than false remove/add churn. Chronicle derivation, topic lookup, comparison, and continuity share a Unicode-normalized, case-folded, whitespace-collapsed topic key while preserving the stored display topic.\n\nA paper matching several selected semantic signals has one primary branch and explicit secondary cross-links in lineage diagnostics. If at least 20% of all or assigned entries overlap, the audit warns that branches are not cleanly separated. `confidence` remains milestone-detection confidence; landmark ordering uses explicit landmark importance and falls back to citation count, never detection confidence.\n\n- `build_research_chronicle(topic=...)` or `build_research_chronicle(pmids=\"last\")` atomically creates revision N+1. When session artifact persistence is enabled, it also writes a `research-chronicle-artifact/v1` bundle; a write failure is visible in Markdown or as `artifact.status=\"failed\"` in structured output, while the revision remains saved.\n- `build_research_chronicle(chronicle_id=...)` re-runs the continued revision's own topic/PMID set and filters to produce revision N+1 reflecting research movement cleanly.\n- `read_research_chronicle(action=\"list\")` lists stored chronicles.\n- `read_research_chronicle(chronicle_id=..., output=\"mermaid\"|\"mindmap\"|\"chronicle_map\"|\"tree\"|\"timeline\"|\"graph\"|\"evidence\")` reads one revision or the combined map.\n- `read_research_chronicle(action=\"diff\", chronicle_id=..., from_revision=1)` reports added, updated, and absent entries plus evidence and branch churn. The legacy `retired` key is a compatibility alias for `not_observed_in_revision` / `removed_from_view`; absence is never conclusive retirement.\n- `read_research_chronicle(action=\"narrate\", chronicle_id=..., mode=\"full\")` renders prose where every claim cites its entry ID and article identifiers.\n- `read_research_chronicle(action=\"compare\", topics=\"a,b\")` uses normalized exact stored-topic names. Multiple chronicles with the same topic are reported as ambiguous; pass distinct `chronicle_ids` instead. Duplicate targets are not a valid comparison.\n\nThe public schema and runtime checks bound Chronicle requests: `max_events` is 1–200, an explicit set has at most 500 unique PMIDs, topic text has at most 500 characters, list limits are 1–100, and comparisons contain 2–5 distinct chronicles. JSON projections and structured read actions keep validation/not-found errors structured.\n\nArtifact preflight audits the names produced by the actual artifact payload builder (plus the store-generated manifest), rather than trusting a parallel declared list. It validates preparation only; persistence success is reported separately by the artifact locator/status.\n\n### Session, Pipeline, And Scheduled Reuse\n\n![Session and pipeline workflow](images/session-pipeline-workflow.svg)\n\nUse this path for `read_session`, `get_session_pmids`, `get_cached_article`, `get_session_summary`, `get_session_log`, `manage_pipeline`, `save_pipeline`, `list_pipelines`, `load_pipeline`, `delete_pipeline`, `get_pipeline_history`, and `schedule_pipeline`.\n\nLocal and service capabilities are intentionally different. A trusted local\ncaller may use workspace scope, `file:` pipeline sources, and the in-process\nscheduler. An authenticated service caller can only read saved pipelines from\nits tenant-derived store; process-wide workspace/file reads are blocked, and\nthe service Compose profile disables scheduling unless an operator supplies a\nsingle external leader/lease.\n\n### Institutional Access\n\n![Institutional access workflow](images/institutional-access-workflow.svg)\n\nUse this path for `configure_institutional_access`, `get_institutional_link`, `list_resolver_presets`, `test_institutional_access`, and `diagnose_institutional_access`. OpenURL is a browser handoff; direct DOI and EZproxy paths become agent-fetchable only when the environment is configured and access is permitted.\n\n### Export And Local Notes\n\n![Export and local notes workflow](images/export-notes-workflow.svg)\n\nUse this path for `prepare_export` and `save_literature_notes`. Citation exports are for reference managers; local notes are editable literature-review artifacts with machine-readable metadata.\n\n## Persistent Query Memory For Large Outputs\n\nWhen session persistence is configured, `unified_search` and `get_fulltext`\nwrite complete reusable outputs to artifacts and return a compact locator in\nthe tool response. Treat the response as an index card: it has enough counts,\nwarnings, and artifact hints for the agent to answer immediately, while the\ncomplete evidence payload stays in retrievable files. Use the session facade for\nremote clients, and set `PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true` only for\nlocal MCP clients that should receive direct server paths:\n\n```python\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"audit.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"results.json\", offset=0, max_chars=200000)\n```\n\nWhen session management is active, every `unified_search` invocation includes a\nstable `search_run.run_id`: normal search, validation/planning failure, inline\npipeline, `saved:<name>`, and pipeline `dry_run=true`. The tenant-scoped\n`search-run/v1` journal is written before provider I/O or a terminal validation\nresponse and retains a credential-sanitized replay request, normalized plan,\nper-source or per-pipeline-step attempts, safe failure details, compact result\nreferences, warnings, and an artifact locator when applicable. Structured\nresponses attach the handoff and Markdown adds a compact run note.\n\nSuccessful, zero-result, partial, planning/execution failure, and cancelled\ninvocations therefore leave inspectable state. A valid zero-result run has\njournal status `completed` while `search_status.state` is `empty`; an unfinished\nactive run is changed to `interrupted` once during restart recovery. A non-dry-\nrun saved pipeline additionally keeps its PipelineStore report/run history.\nPipelineStore history and the invocation journal are complementary.\n\n```python\nread_session(action=\"search_runs\")\nread_session(action=\"search_runs\", run_status=\"partial\", history_limit=20)\nread_session(action=\"search_run\", run_id=\"...\")\nread_session(action=\"replay_search\", run_id=\"...\")\n```\n\n`replay_search` is intentionally read-only. It returns exact, credential-free\n`unified_search` kwargs and `automatic_execution=false`; an agent must review\nand explicitly call `unified_search` to run them. Pipeline replay includes its\ninline or `saved:<name>` argument plus `dry_run` / `stop_at`. Pipeline text that\ncontains credentials is rejected as a failed run; use server environment\nconfiguration for provider keys, tokens, cookies, and secrets. Because there is no public\ncursor-resume input yet, opaque cursor/token provenance cannot resume a page in\nplace and replay begins a new bounded request.\n\nIf the terminal history commit cannot be recovered, the bounded handoff changes\nto `status=\"history_unavailable\"` with `history_available=false`, the intended\nstatus, and a warning. Inspect/replay actions are omitted in that degraded state\nbecause durable recovery cannot be promised.\n\n`unified_search` artifacts use a research envelope. Start with `audit.json` to\ncheck completeness warnings, then `query_strategy.json` for the exact query\nplan, and `results.json` / `results.toon` for the full result list. This avoids\nspending MCP response tokens on long article lists while still making the run\nauditable and reproducible.\n\nArtifact publication and session indexing are separate atomic boundaries. On\nsession reload, the store discovers only complete checksum-indexed manifests\nthat are missing from the session index and relinks a recovered search artifact\nby `search_run_id`; a conservative same-query fallback exists for older\nartifacts that predate that metadata.\n\n`local_path` and `manifest_path` are paths on the MCP server host. `read_session`\nredacts local paths by default unless `include_local_paths=true` is requested.\nLarge `get_fulltext` responses are capped inline when an artifact exists; use\nthe locator to read the saved full content. This is persistent query memory:\nagents can reopen the exact saved search/fulltext output by artifact ID without\nrerunning the external source call. Full-text artifacts can contain article body\ntext, so handle storage and sharing according to publisher, license, and\ninstitutional access terms.\n\nIf a source fails but the search can continue, `unified_search` may return\n`source_errors` in JSON or `Source warnings` in markdown. Semantic Scholar HTTP\n429 warnings usually mean the workflow should set `S2_API_KEY` /\n`SEMANTIC_SCHOLAR_API_KEY`, retry later, or exclude the source.\n\n## Local Wiki Note Export\n\n![Export and local notes workflow](images/export-notes-workflow.svg)\n\nUse `save_literature_notes` when the user wants a guided, semi-structured file output after search. This is better than asking an agent to assemble a Markdown note with a generic write-file operation.\n\nDefault behavior:\n\n```python\nsave_literature_notes(pmids=\"last\")\n```\n\nThe default `note_format` is `wiki`. It writes one `.md` file per article with:\n\n- YAML frontmatter for title, PMID, DOI, PMCID, journal, year, citation key, aliases, and tags\n- Foam-compatible wikilinks in the generated index note\n- stable wiki/Foam link targets based on PMID, DOI, PMCID, or a fallback identifier; article titles stay as link labels and aliases\n- a `wiki_validation` report showing emitted wikilinks and any unresolved targets\n- triage fields for status, relevance, and decision\n- summary, key findings, methods/population, limitations, and follow-up question sections\n- source links to PubMed, DOI, and PMC when available\n- by default, a collection-level `references.csl.json` sidecar when notes or index artifacts are created\n\nWhen `unified_search` returns PMID-backed results, its next-tool suggestions include:\n\n```python\nsave_literature_notes(pmids=\"last\", note_format=\"wiki\")\n```\n\nThat gives agents a local LLM-wiki handoff without requiring them to invent filenames or wikilinks from the search response.\n\nSupported note formats:\n\n| Format | Link Style | Layout | Best For |\n| --- | --- | --- | --- |\n| `wiki` | `[[stable-id|title]]` | default guided literature note | Foam, Obsidian-style, and general wiki workflows |\n| `foam` | `[[stable-id|title]]` | same compatible profile as `wiki` | existing Foam-specific users |\n| `markdown` | `` `[title](note.md)` `` | same guided sections | plain Markdown repositories |\n| `medpaper` | `[[citation_key|title]]` | per-reference directory containing `<citation_key>.md` plus `metadata.json` | MedPaper-style or Zotero Keeper-compatible reference libraries |\n\nLocal-mode directory resolution:\n\n1. `output_dir`, if provided\n2. `PUBMED_NOTES_DIR`\n3. `PUBMED_WORKSPACE_DIR/references`\n4. `PUBMED_DATA_DIR/references`\n5. `~/.pubmed-search-mcp/references`\n\nAuthenticated service callers do not participate in that host-path resolution.\nThey cannot supply `output_dir` or `template_file`; notes use a built-in format\nand stay below the current principal's isolated `references/` directory.\n\n## Good Markdown Note Shape\n\nA good literature note should separate verified bibliographic data from human or agent interpretation:\n\n```markdown\n---\ntitle: \"Article title\"\npmid: \"12345678\"\ndoi: \"10.xxxx/example\"\ncitation_key: \"smith2024_12345678\"\nsource: \"PubMed\"\nnote_format: \"wiki\"\ntags: [\"literature\", \"pubmed\"]\naliases: [\"smith2024_12345678\", \"Article title\", \"12345678\", \"Smith 2024\"]\n---\n\n# Article title\n\n## Metadata\n- PMID: [12345678](https://pubmed.ncbi.nlm.nih.gov/12345678/)\n- DOI: [10.xxxx/example](https://doi.org/10.xxxx/example)\n- Journal: Journal name\n- Year: 2024\n- Authors: Smith J; Doe J\n\n## Triage\n- Status:\n- Relevance:\n- Decision:\n\n## Summary\n-\n\n## Key Findings\n-\n\n## Methods And Population\n-\n\n## Limitations\n-\n\n## Follow Up Questions\n-\n\n## Citation\n- Smith J; Doe J. Article title. Journal name. 2024. doi:10.xxxx/example\n```\n\nKeep verified metadata machine-readable in frontmatter and sidecars. Keep interpretation editable in body sections.\n\n## Custom Templates\n\nIn trusted local mode, use `template_file` when a user has a house style:\n\n```python\nsave_literature_notes(\n    pmids=\"last\",\n    output_dir=\"./references\",\n    template_file=\"./reference-template.md\"\n)\n```\n\nAvailable placeholders include `{title}`, `{pmid}`, `{doi}`, `{pmc_id}`, `{journal}`, `{journal_abbrev}`, `{year}`, `{volume}`, `{issue}`, `{pages}`, `{authors}`, `{abstract}`, `{citation_key}`, `{reference_id}`, `{note_format}`, `{created}`, `{pubmed_url}`, `{doi_url}`, `{citation}`, `{keywords}`, `{mesh_terms}`, and `{csl_json}`.\n\nFor an authenticated service, choose one of the built-in note formats instead;\nreading an arbitrary template from the server filesystem is rejected.\n\n## Pipeline And Packaged Agent References\n\nPipeline tutorials live canonically in:\n\n- `docs/PIPELINE_MODE_TUTORIAL.en.md`\n- `docs/PIPELINE_MODE_TUTORIAL.md`\n\n`scripts/build_docs_site.py` also syncs those tutorials into `.claude/skills/pipeline-persistence/references/` so external agent bundles and VSIX packages that do not ship `docs/site-content/` can still read them.\n",
-  "tools-usage-guide-zh": "<!-- Generated from docs/TOOLS_USAGE_GUIDE.zh-TW.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP 工具使用指南\n\n這是一份能力導向指南，目標是讓 agent 和使用者不用死背 45 個 MCP tool，也能穩定選到正確流程。\n\n**語言**: [English](#/tools-usage-guide) | **繁體中文**\n\n## 閱讀順序\n\n1. 先用使用者意圖對應能力族。\n2. 用 session tools 取回上一輪結果，不要要求模型記住所有 PMID。\n3. 先確認 evidence set，再匯出引用或本機筆記。\n4. 需要查精確工具名時，再看[完整工具索引](#/quick-reference)。\n\n## 8 個能力族\n\n![PubMed Search MCP 能力族地圖](images/tool-capability-map.svg)\n\n| 能力 | 主要工具 | 何時使用 |\n| --- | --- | --- |\n| 搜尋入口 | `unified_search` | 使用者要找論文、文章、或先對主題做第一輪搜尋。 |\n| 查詢智能 | `analyze_search_query`, `parse_pico`, `generate_search_queries` | 需要 MeSH、agent-provided PICO handoff、同義詞擴展、或搜尋策略。 |\n| 論文探索 | `fetch_article_details`, `find_related_articles`, `find_citing_articles`, `get_article_references`, `build_citation_tree` | 已有 seed PMID，要查脈絡、相關研究、引用網路。 |\n| 全文與圖表 | `get_fulltext`, `get_text_mined_terms`, `get_article_figures` | 需要文章段落、證據區段、實體標註、caption 或 image URL。 |\n| 外部生醫資料 | `search_gene`, `get_gene_details`, `search_compound`, `get_compound_details`, `search_clinvar` | 問題從文獻延伸到 NCBI gene、compound、clinical variant。 |\n| 評估與研究演化 | `get_citation_metrics`, `build_research_chronicle`, `read_research_chronicle` | 使用者問哪些重要、領域如何演進、或多主題比較。 |\n| 持久化與 session | `read_session`, `get_session_pmids`, `get_cached_article`, `get_session_summary`, pipeline tools | 使用者要恢復、重跑、審計、排程、保存搜尋流程。 |\n| 匯出與本機筆記 | `prepare_export`, `save_literature_notes` | 使用者要 Zotero/EndNote/BibTeX，或本機 Markdown/wiki 筆記。 |\n\n## 意圖路由\n\n| 使用者意圖 | 建議流程 |\n| --- | --- |\n| 快速搜尋文獻 | `unified_search(query=..., limit=...)` |\n| 臨床 A vs B 比較 | Agent P/I/C/O -> `parse_pico` -> `unified_search(pipeline=\"template: pico...\")` |\n| 系統性回顧起手式 | `analyze_search_query` -> `generate_search_queries` -> `unified_search(options=\"systematic\")` -> `save_pipeline` |\n| Provider-native 語意檢索 | `unified_search(sources=\"openalex\", options=\"native_semantic\")` |\n| 深挖重要論文 | `fetch_article_details` -> `find_related_articles` / `find_citing_articles` / `get_article_references` |\n| 全文 synthesis | `get_fulltext` -> `get_text_mined_terms` -> 結構化摘要 |\n| Zotero handoff | `prepare_export(pmids=\"last\", format=\"ris\")` 或 Zotero Keeper import tools |\n| 本機知識庫筆記 | `save_literature_notes(pmids=\"last\")` |\n| 可重複搜尋流程 | `save_pipeline` -> `unified_search(pipeline=\"saved:<name>\")` |\n\nZotero Keeper 應維持在外部整合邊界。PubMed Search MCP 負責產生 official RIS/MEDLINE/CSL JSON、local RIS/BibTeX/CSV/MEDLINE/JSON 匯出與本機 wiki notes；Zotero 匯入、duplicate 處理、library-specific policy 交給 Zotero Keeper 或其他 client。\n\n## 能力工作流程圖\n\n每個功能族都補上 workflow 圖，讓使用者與開發者能看出工具在完整研究流程中的位置。\n\n### 搜尋入口與查詢智能\n\n![搜尋與查詢智能流程](images/search-query-workflow.svg)\n\n這條路徑涵蓋 `unified_search`、`parse_pico`、`generate_search_queries`、`analyze_search_query` 與 ICD-aware search preparation。重點邊界是：agent 負責語意上的 PICO 抽取，`parse_pico` 驗證結構化 handoff 並回傳後端 `template: pico` pipeline。\n\n通用文獻搜尋只有一個 tool。使用 `options` 選 retrieval policy，不要尋找\nprovider-specific search tool：\n\n| Policy | 範例 | 合約 |\n| --- | --- | --- |\n| 預設 | `unified_search(query=\"sepsis biomarkers\")` | 在一般有能力的 source plan 中做 relevance/keyword 路由。 |\n| Native semantic | `unified_search(query=\"mechanisms of resistance\", sources=\"openalex\", options=\"native_semantic\")` | OpenAlex title/abstract 語意檢索；provider 最多 50 筆。 |\n| Systematic | `unified_search(query=\"melanoma AND immunotherapy\", sources=\"pubmed,openalex,semantic_scholar\", options=\"systematic\")` | 可稽核的有界 provider execution；選到時用 OpenAlex cursor 與 Semantic Scholar bulk。 |\n\n`native_semantic` 與 `systematic` 互斥。兩者都會關閉多策略 deep-search\nexpansion，保留可稽核的 provider-native plan。明確 source/mode 不相容時，系統在\nnetwork call 前拒絕；自動路由則只保留有能力的 source。Public `limit` 每 source\n仍最多 100，所以 `systematic` 是可重現的 retrieval primitive，不是已窮盡所有\nsystematic-review evidence 的證明。\n\nInput validation 會在 provider I/O 前嚴格執行。`limit` 必須是 `1..100` 的整數；\nfilter token 必須使用支援的 `key:value`；year bounds 必須在 1000–2100 內且順序\n正確；未知 option、ranking mode 或 output format 會直接被拒絕，不會無聲忽略。\n一般 deep mode 中，公開 `limit` 是單一 source 所有 generated strategies 共用的\n**總額度**。Broker 會把額度分配到 strategies、裁切超額 adapter response，並套用\n有界的全域／每來源 concurrency 與 strategy deadline。\n\nJSON/TOON 與 persistent artifact 會保存 `retrieval_mode` 及每來源\n`source_metadata`，包括 requested/provider mode、canonical 或 compiled query、\nprovider 回傳的 opaque continuation token/cursor、cost/rate metadata 與 warnings。\nContinuation data 目前只作為 provenance；公開 facade 尚無 cursor-resume argument。\n解讀 provider total 或繼續擷取前，請先看\n[Source Contracts](#/source-contracts)、[Semantic Scholar](#/semantic-scholar-api) 與\n[OpenAlex](#/openalex-api)。\n\nAgent 對一般 result envelope 做決策時，應以 structured `search_status` 為準，不要用\nrendered text 長度判斷。它會明確標示 bounded、non-exhaustive，區分\n`completed`、合法的 `empty`、\n`partial` 與所有來源皆失敗的 `failed`，並列出 returned count、\nattempted/successful/failed/retryable sources、有 continuation 的 sources 與完整度未知\n的 sources。\n\nClinicalTrials.gov 是明確選擇的 adjunct，不是另一個 literature-search leg。\n只有需要 Markdown 回應附帶最多三筆相關 registry records 時才使用\n`options=\"trials\"`。預設不會發出請求，不影響 article ranking/source\ncounts，並在 search artifact 中獨立記錄。JSON/TOON 不執行這個僅用於顯示的 adjunct。\n\n### 論文探索與引用脈絡\n\n![論文探索與引用流程](images/discovery-citation-workflow.svg)\n\n已有 seed PMID 後使用這條路徑。它涵蓋 `fetch_article_details`、`find_related_articles`、`find_citing_articles`、`get_article_references`、`build_citation_tree` 與 `get_citation_metrics`。\n\n### 引用驗證\n\n![引用驗證流程](images/reference-verification-workflow.svg)\n\n當 manuscript、bibliography 或 agent 產生的回答需要 PubMed-backed citation checking 時，使用 `verify_reference_list`。match / mismatch 應視為 audit trail，而不是只看生成摘要。\n\n### 全文、圖表與圖片證據\n\n![全文、圖表與生醫圖片流程](images/visual-evidence-workflow.svg)\n\n這條路徑涵蓋 `get_fulltext`、`get_text_mined_terms`、`get_article_figures`、`analyze_figure_for_search` 與 `search_biomedical_images`。全文、figure metadata、image search 是不同證據通道，各自有不同可得性限制。\n\n當使用者提供 image URL 或上傳圖片 payload，且需要 agent 從視覺內容推論搜尋詞時，使用 `analyze_figure_for_search`。這個 tool 會回傳 MCP `ImageContent`；實際圖片語意解讀由 LLM agent 完成，agent 應接續呼叫 `search_biomedical_images` 或 `unified_search`。\n\n當視覺問題已經文字化時，直接用 `search_biomedical_images`。目前主要來源是 Open-i，支援 `image_type`、`collection`、`article_type`、`specialty`、`license_type`、`search_fields` 等 filter，且需要英文醫學術語。\n\n### 外部生醫資料\n\n![NCBI 延伸生醫資料流程](images/ncbi-extended-workflow.svg)\n\n當問題從文獻延伸到 NCBI biomedical records 時，使用 `search_gene`、`get_gene_details`、`get_gene_literature`、`search_compound`、`get_compound_details`、`get_compound_literature` 與 `search_clinvar`。\n\n### 評估、時間軸與比較\n\n![Research Chronicle 架構與脈絡流程](images/research-chronicle-lineage-flow.svg)\n![評估與時間軸流程](images/timeline-evaluation-workflow.svg)\n\n使用者問「哪些重要」、「領域何時改變」、「不同主題如何分歧」時，使用 `get_citation_metrics`、`build_research_chronicle` 與 `read_research_chronicle`。\n\n`build_research_chronicle` 是唯一的研究演化工具。它接受 `topic=...`、明確的 comma-separated `pmids=...` 或既有的 `chronicle_id=...`，會偵測 milestone-like papers，並可回傳 `summary`、`chronicle_map`、`timeline`、`tree`、`graph`、`evidence`、`milestones`、`mermaid`、`timeline_mermaid`、`mindmap`、`narrative` 或 `json`。`mermaid` 把橫向年份主軸與 lineage 分支畫在同一張圖；`chronicle_map` 是同一座標契約的 JSON。`read_research_chronicle(action=\"milestones\")` 用於里程碑分佈 diagnostics；`read_research_chronicle(action=\"compare\", topics=\"a,b\")` 用於最多五個 topic tracks 的比較。\n\n用詞請保持精準：\n\n- **Timeline**：按時間排序的 milestone projection。\n- **Lineage tree**：由 timeline events 產生、受檢索範圍限制的分支投影，不是因果祖譜。\n- **Chronicle map**：單一橫向時間主軸，各觀察研究線錨定在本次檢索範圍內最早的有日期論文；語意分支必須有多篇論文共同支持的訊號，只有 singleton 或 MeSH/keyword 訊號不足時會產生 audit warning 並退回研究階段分類。同年排列在日期 precision 不足時不代表先後。\n- **Context graph preview**：`unified_search(options=\"context_graph\")`，只根據本次 PMID-backed ranked set 產生輕量預覽。\n- **Citation tree**：`build_citation_tree`，從單一 seed PMID 建立 forward/backward citation network。\n- **Research Chronicle**：`build_research_chronicle` / `read_research_chronicle`，持久化、版本化、有證據支撐的研究紀錄；詳見 [進階研究工作流](#/advanced-workflows-zh) 與 [Research Chronicle Rebuild Spec](#/research-chronicle-rebuild-spec)。\n\n### 研究編年史 (Research Chronicle)\n\n當使用者要的不是一次性快照，而是一份可以持續回頭維護的研究脈絡時，使用 `build_research_chronicle`。它取代了舊的一次性 timeline 工具：每個不可變 revision 都以原子操作和遞增編號追加，之後重跑就能做版本比對，回答「上次之後改變了什麼」。主軸是時序，分支是同一組 stored entries 的次要投影。\n\n分支描述選定 query / PMID / source / year 範圍裡觀察到的模式，不是因果演化。`earliest_observed_in_scope` 只標示 retrieved candidates 中最早的有日期文章，不證明它是整個領域的 first report。只有在日期 precision 所代表的區間互不重疊時，graph 才會宣稱 `precedes` 或 `supersedes`。\n\n每個 chronicle entry 都帶有一句附引用的 claim、supporting / contradicting / updating 證據、所屬研究分支 (lineage)，以及 confidence。型別化 provenance graph 以 Topic → Branch → Entry → EvidenceArticle 相連，並依 edge invariants 驗證。audit 會回報證據覆蓋率、識別碼覆蓋率、分支覆蓋率、語意 lineage 的依據與覆蓋率、graph 完整性、時序缺口與各來源回傳量。\n\nTopic mode 會在 relevance-capped fetch 前，先把 `min_year`／`max_year` 套用到 PubMed request。最後的 event selection 固定保留觀察到的首篇與末篇，優先選明確的 landmark importance／citation，再用最大的時間缺口補足容量。source coverage audit 會區分 PubMed `returned` 與 `available`，並針對 capped sample、後續選取或未知總量提出警告。PubMed upstream error 或零篇論文證據會直接回錯，不發布 Chronicle revision。\n\nPMID input 只接受 ASCII digits、可選的 `PMID:` prefix 與明確分隔符；DOI 或任意混合 identifier text 會被拒絕。entry ID 先依 PMID、再依 DOI 作為穩定 evidence identity，因此日期與 milestone 分類修正會成為 update，而不是假的 remove/add churn。Chronicle ID derivation、topic lookup、compare 與 continuity 共用 Unicode normalization、case-folding、空白折疊後的 topic key，但保留已儲存的顯示名稱。\n\n同時符合多個 semantic signals 的論文會有一個 primary branch，並在 lineage diagnostics 保留 explicit secondary cross-links。若全部 entries 或已分派 entries 的重疊比例至少 20%，audit 會警告 branches 並非清楚分離。`confidence` 只代表 milestone detection confidence；landmark ranking 使用明確的 landmark importance，缺少時才退回 citation count，絕不使用 detection confidence。\n\n- `build_research_chronicle(topic=...)` 或 `build_research_chronicle(pmids=\"last\")`：以原子操作建立 revision N+1。啟用 session artifact persistence 時也會寫入 `research-chronicle-artifact/v1` bundle；若寫入失敗，Markdown 或 structured output 的 `artifact.status=\"failed\"` 會明確揭露，而 revision 仍已保存。\n- `build_research_chronicle(chronicle_id=...)`：只傳 `chronicle_id` 即可自動沿用前一版的 topic/PMID 與檢索條件再跑一次，產出乾淨反映研究進展的 Revision N+1。\n- `read_research_chronicle(action=\"list\")`：列出已儲存的 chronicles。\n- `read_research_chronicle(chronicle_id=..., output=\"mermaid\"|\"mindmap\"|\"chronicle_map\"|\"tree\"|\"timeline\"|\"graph\"|\"evidence\")`：讀取單一 revision 或合併圖。\n- `read_research_chronicle(action=\"diff\", chronicle_id=..., from_revision=1)`：回報新增、更新與本次缺席的 entries，以及證據／分支變化。舊的 `retired` key 只是 `not_observed_in_revision`／`removed_from_view` 的相容 alias；缺席絕不等於已證實退場。\n- `read_research_chronicle(action=\"narrate\", chronicle_id=..., mode=\"full\")`：產出每句 claim 都附 entry ID 與文獻識別碼的敘述。\n- `read_research_chronicle(action=\"compare\", topics=\"a,b\")`：使用正規化後的完整 stored-topic 名稱。同名對應多個 Chronicle 時會回報 ambiguity，需改傳不同的 `chronicle_ids`；重複目標不構成有效比較。\n\nPublic schema 與 runtime validation 都限制 Chronicle request：`max_events` 1–200、明確 set 最多 500 個 unique PMIDs、topic 最多 500 字元、list limit 1–100、compare 需 2–5 個不同 Chronicles。JSON projections 與 structured read actions 的 validation / not-found 錯誤也維持結構化。\n\nArtifact preflight 會檢查實際 artifact payload builder 產出的檔名（再加上 store 產生的 manifest），而不是信任另一份平行常數清單。這只驗證 payload preparation；是否真的持久化成功，仍由 artifact locator／status 另外回報。\n\n### Session、Pipeline 與排程重用\n\n![Session 與 Pipeline 流程](images/session-pipeline-workflow.svg)\n\n這條路徑涵蓋 `read_session`、`get_session_pmids`、`get_cached_article`、`get_session_summary`、`get_session_log`、`manage_pipeline`、`save_pipeline`、`list_pipelines`、`load_pipeline`、`delete_pipeline`、`get_pipeline_history` 與 `schedule_pipeline`。\n\n本機與 service 能力刻意不同。可信任的本機 caller 可使用 workspace scope、`file:`\npipeline source 與 in-process scheduler。認證 service caller 只能讀取 tenant-derived store 中\n已保存的 pipeline；process-wide workspace/file reads 會被阻擋，service Compose 也停用\nscheduler，除非維運者另外提供單一 external leader/lease。\n\n### 機構存取\n\n![機構存取流程](images/institutional-access-workflow.svg)\n\n這條路徑涵蓋 `configure_institutional_access`、`get_institutional_link`、`list_resolver_presets`、`test_institutional_access` 與 `diagnose_institutional_access`。OpenURL 是 browser handoff；direct DOI 與 EZproxy 只有在環境已設定、且使用者有權存取時才是 agent-fetchable。\n\n### 匯出與本機筆記\n\n![匯出與本機筆記流程](images/export-notes-workflow.svg)\n\n這條路徑涵蓋 `prepare_export` 與 `save_literature_notes`。Citation exports 供 reference manager 使用；local notes 則是帶有 machine-readable metadata、可被人與 agent 後續編輯的 literature-review artifacts。\n\n## 大型輸出的持久化 Query Memory\n\n當 session persistence 已設定時，`unified_search` 與 `get_fulltext` 會把完整可重用輸出保存為 artifact，tool response 只回傳精簡 locator。請把 tool response 視為索引卡：它會有足夠的 counts、warnings 與 artifact hints 讓 agent 先回覆使用者；完整 evidence payload 則留在可重複讀取的 artifact files。Remote client 請透過 `read_session` facade 讀取；只有本機 MCP client 真的需要 server path 時，才設定 `PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true`：\n\n```python\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"audit.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"results.json\", offset=0, max_chars=200000)\n```\n\nSession management 啟用時，每一次 `unified_search` invocation 都會帶有穩定的\n`search_run.run_id`：一般搜尋、validation/planning failure、inline pipeline、\n`saved:<name>` 與 pipeline `dry_run=true`。Tenant-scoped `search-run/v1` journal 會在\nprovider I/O 或 terminal validation response 前寫入，保存已移除 credentials 的\nreplay request、normalized plan、每來源或每 pipeline step attempts、安全化 failure\ndetails、精簡 result references、warnings，以及適用時的 artifact locator。\nStructured response 會附 handoff，Markdown 則加入精簡 run note。\n\n因此成功、零結果、partial、planning/execution failure 與 cancelled invocation 都能\n被檢查。合法零結果的 journal status 是 `completed`，同時\n`search_status.state` 是 `empty`；server restart 時，未完成的 active run 只會被轉成\n`interrupted` 一次。非 dry-run saved pipeline 還會另外保存 PipelineStore report/run\nhistory；PipelineStore history 與 invocation journal 是互補關係。\n\n```python\nread_session(action=\"search_runs\")\nread_session(action=\"search_runs\", run_status=\"partial\", history_limit=20)\nread_session(action=\"search_run\", run_id=\"...\")\nread_session(action=\"replay_search\", run_id=\"...\")\n```\n\n`replay_search` 刻意保持 read-only。它回傳精確且不含 credential 的\n`unified_search` kwargs 與 `automatic_execution=false`；agent 必須先檢查，再明確\n呼叫 `unified_search`。Pipeline replay 會包含 inline 或 `saved:<name>` argument，\n以及 `dry_run` / `stop_at`。包含 credentials 的 pipeline text 會被拒絕並記成 failed\nrun；provider key、token、cookie 與 secret 應放在 server environment\nconfiguration。因為目前沒有公開 cursor-resume input，opaque cursor/token\nprovenance 無法就地續頁，replay 會開始新的 bounded request。\n\n如果 terminal history commit 無法復原，bounded handoff 會變成\n`status=\"history_unavailable\"`，並帶有 `history_available=false`、預期 status 與\nwarning。Degraded state 會省略 inspect/replay actions，因為 durable recovery\n無法保證。\n\n`unified_search` artifacts 會使用 research envelope。建議先讀 `audit.json` 確認完整性警告，再讀 `query_strategy.json` 檢查實際搜尋策略，最後用 `results.json` / `results.toon` 取回完整結果清單。這樣不需要把長篇 article list 塞進 MCP response token，也保留可審計、可重現的搜尋紀錄。\n\nArtifact publication 與 session indexing 是兩個獨立的 atomic boundaries。Session\nreload 時，store 只會發現 session index 缺少、但結構完整且 checksum 已索引的\nmanifests，再透過 `search_run_id` 把 recovered search artifact 連回 run；只有早於該\nmetadata 的舊 artifacts 才使用保守的同 query fallback。\n\n`local_path` 與 `manifest_path` 是 MCP server host 上的路徑，預設會被遮蔽。大型 `get_fulltext` 在已有 artifact 時會先回 inline preview；完整內容請用 locator 讀取。這就是持久化 query memory：agent 可以用 artifact ID 重新打開同一份已保存的 search/fulltext output，不必重跑外部來源呼叫。全文 artifact 可能包含文章正文，保存與分享時請遵守 publisher license 與機構授權條款。\n\n## 本機 Wiki Note 匯出\n\n![匯出與本機筆記流程](images/export-notes-workflow.svg)\n\n搜尋完成後，如果使用者要留下受指引、半格式化、可被 agent 繼續編輯的檔案，使用 `save_literature_notes`。這比讓 agent 用一般 write file 自己拼 Markdown 穩定。\n\n預設呼叫：\n\n```python\nsave_literature_notes(pmids=\"last\")\n```\n\n預設 `note_format` 是 `wiki`，每篇文章會輸出一個 `.md`，包含：\n\n- YAML frontmatter：title、PMID、DOI、PMCID、journal、year、citation key、aliases、tags\n- 產生 index note 時使用 Foam-compatible wikilinks\n- wiki/Foam link target 使用 PMID、DOI、PMCID 或 fallback identifier；title 只作為 link label 與 alias\n- 回應會包含 `wiki_validation`，列出產生的 wikilinks 與 unresolved targets\n- triage 欄位：status、relevance、decision\n- summary、key findings、methods/population、limitations、follow-up questions\n- PubMed、DOI、PMC source links\n- 預設會在 notes 或 index artifacts 建立時寫出 collection-level `references.csl.json` sidecar，方便接引用管理器\n\n當 `unified_search` 回傳 PMID-backed results 時，next-tool suggestions 會主動包含：\n\n```python\nsave_literature_notes(pmids=\"last\", note_format=\"wiki\")\n```\n\n這讓 agent 能直接交接到本機 LLM wiki，不需要自己從搜尋結果發明檔名或 wikilink。\n\n支援格式：\n\n| Format | 連結樣式 | 排版 | 適合情境 |\n| --- | --- | --- | --- |\n| `wiki` | `[[stable-id|title]]` | 預設 guided literature note | Foam、Obsidian-style、一般 wiki workflow |\n| `foam` | `[[stable-id|title]]` | 與 `wiki` 相容 | 既有 Foam 使用者 |\n| `markdown` | `` `[title](note.md)` `` | 同樣 guided sections | 純 Markdown repo |\n| `medpaper` | `[[citation_key|title]]` | per-reference directory，內含 `<citation_key>.md` 與 `metadata.json` | MedPaper-style 或 Zotero Keeper-compatible reference library |\n\n本機模式的目錄解析順序：\n\n1. `output_dir`\n2. `PUBMED_NOTES_DIR`\n3. `PUBMED_WORKSPACE_DIR/references`\n4. `PUBMED_DATA_DIR/references`\n5. `~/.pubmed-search-mcp/references`\n\n認證 service caller 不會進入這套 host-path resolution。它們不能傳入 `output_dir` 或\n`template_file`；筆記必須使用內建 format，並保存在當前 principal 隔離的\n`references/` 目錄下。\n\n## 好的 Markdown 文獻筆記排版\n\n好的文獻筆記要把「可驗證書目資料」和「人/agent 的判讀」分開：\n\n```markdown\n---\ntitle: \"Article title\"\npmid: \"12345678\"\ndoi: \"10.xxxx/example\"\ncitation_key: \"smith2024_12345678\"\nsource: \"PubMed\"\nnote_format: \"wiki\"\ntags: [\"literature\", \"pubmed\"]\naliases: [\"smith2024_12345678\", \"Article title\", \"12345678\", \"Smith 2024\"]\n---\n\n# Article title\n\n## Metadata\n- PMID: [12345678](https://pubmed.ncbi.nlm.nih.gov/12345678/)\n- DOI: [10.xxxx/example](https://doi.org/10.xxxx/example)\n- Journal: Journal name\n- Year: 2024\n- Authors: Smith J; Doe J\n\n## Triage\n- Status:\n- Relevance:\n- Decision:\n\n## Summary\n-\n\n## Key Findings\n-\n\n## Methods And Population\n-\n\n## Limitations\n-\n\n## Follow Up Questions\n-\n\n## Citation\n- Smith J; Doe J. Article title. Journal name. 2024. doi:10.xxxx/example\n```\n\nfrontmatter 和 sidecar 放 verified metadata；正文區塊留給摘要、判讀、限制、後續問題。\n\n## 自訂 Template\n\n在可信任的本機模式中，使用者有自己的排版時，用 `template_file`：\n\n```python\nsave_literature_notes(\n    pmids=\"last\",\n    output_dir=\"./references\",\n    template_file=\"./reference-template.md\"\n)\n```\n\n可用 placeholder 包含 `{title}`, `{pmid}`, `{doi}`, `{pmc_id}`, `{journal}`, `{journal_abbrev}`, `{year}`, `{volume}`, `{issue}`, `{pages}`, `{authors}`, `{abstract}`, `{citation_key}`, `{reference_id}`, `{note_format}`, `{created}`, `{pubmed_url}`, `{doi_url}`, `{citation}`, `{keywords}`, `{mesh_terms}`, `{csl_json}`。\n\n認證 service 請改用內建 note format；server 會拒絕從 host filesystem 讀取任意 template。\n\n## Pipeline 與 Agent Bundle 參考文件\n\nPipeline tutorial 的正式來源是：\n\n- `docs/PIPELINE_MODE_TUTORIAL.en.md`\n- `docs/PIPELINE_MODE_TUTORIAL.md`\n\n`scripts/build_docs_site.py` 會另外同步到 `.claude/skills/pipeline-persistence/references/`，讓不會打包 `docs/site-content/` 的外部 agent bundle 或 VSIX 也能讀到。\n",
-  "quick-reference": "<!-- Generated from src/pubmed_search/presentation/mcp_server/TOOLS_INDEX.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP - Tools Index\n\nQuick reference for all 45 available MCP tools. Auto-generated from `tool_registry.py`.\n\nUse `docs/TOOLS_USAGE_GUIDE.md` for the capability-first usage manual, not just the raw inventory.\n\n---\n\n## Capability Compression\n\nThe current surface is 45 tools, but the practical comprehension model is 8 capability families.\n\n- Theoretical lower bound without removing capability: 6 multiplexed meta-tools\n- Practical minimum for human/agent understanding: 8 capability families\n- Recommended reading order: capability guide first, inventory second\n\n## 搜尋工具\n\nUnified multi-source literature search gateway\n\n| Tool | Description |\n| --- | --- |\n| `unified_search` | Unified Search - Single entry point for multi-source academic search. |\n\n## 查詢智能\n\nMeSH expansion, agent-provided PICO handoff, and query analysis\n\n| Tool | Description |\n| --- | --- |\n| `parse_pico` | Validate agent-provided PICO elements and return a runnable search plan. |\n| `generate_search_queries` | Gather search intelligence for a topic - returns RAW MATERIALS for Agent to decide. |\n| `analyze_search_query` | Analyze a search query without executing the search. |\n\n## 文章探索\n\n相關文章、引用網路\n\n| Tool | Description |\n| --- | --- |\n| `fetch_article_details` | Fetch detailed information for one or more PubMed articles. |\n| `find_related_articles` | Find articles related to a given PubMed article. |\n| `find_citing_articles` | Find articles that cite a given PubMed article. |\n| `get_article_references` | Get the references (bibliography) of a PubMed article. |\n| `get_citation_metrics` | Get citation metrics from NIH iCite for articles. |\n\n## 全文工具\n\n全文取得與文本挖掘\n\n| Tool | Description |\n| --- | --- |\n| `get_fulltext` | Enhanced multi-source fulltext retrieval. |\n| `get_text_mined_terms` | Get text-mined annotations from Europe PMC. |\n\n## NCBI 延伸\n\nGene, PubChem, ClinVar\n\n| Tool | Description |\n| --- | --- |\n| `search_gene` | Search NCBI Gene database for gene information. |\n| `get_gene_details` | Get detailed information about a gene by NCBI Gene ID. |\n| `get_gene_literature` | Get PubMed articles linked to a gene. |\n| `search_compound` | Search PubChem for chemical compounds. |\n| `get_compound_details` | Get detailed information about a compound by PubChem CID. |\n| `get_compound_literature` | Get PubMed articles linked to a compound. |\n| `search_clinvar` | Search ClinVar for clinical variants. |\n\n## 引用網絡\n\n引用樹建構與探索\n\n| Tool | Description |\n| --- | --- |\n| `build_citation_tree` | Build a citation tree (network) from a single article. |\n\n## 匯出工具\n\n引用格式匯出與本機文獻筆記保存\n\n| Tool | Description |\n| --- | --- |\n| `prepare_export` | Export citations to reference manager formats. |\n| `save_literature_notes` | Save searched articles as guided local wiki/Foam/Markdown notes. |\n\n## Session 管理\n\nPMID 暫存與歷史\n\n| Tool | Description |\n| --- | --- |\n| `read_session` | Read session data through a single facade. |\n| `get_session_pmids` | 取得 session 中暫存的 PMID 列表。 |\n| `get_cached_article` | 從 session 快取取得文章詳情。 |\n| `get_session_summary` | 取得當前 session 的摘要資訊。 |\n| `get_session_log` | 取得當前 session 的 activity log 與搜尋歷史摘要。 |\n\n## 機構訂閱\n\nOpenURL Link Resolver\n\n| Tool | Description |\n| --- | --- |\n| `configure_institutional_access` | Configure your institution's link resolver for full-text access. |\n| `get_institutional_link` | Generate institutional access link (OpenURL) for an article. |\n| `list_resolver_presets` | List available institutional link resolver presets. |\n| `test_institutional_access` | Test your institutional link resolver configuration. |\n| `diagnose_institutional_access` | Diagnose why institutional fulltext access succeeds or fails for an article. |\n\n## 視覺搜索\n\n圖片分析與搜索 (實驗性)\n\n| Tool | Description |\n| --- | --- |\n| `analyze_figure_for_search` | Analyze a scientific figure or image for literature search. |\n\n## ICD 轉換\n\nICD-10 與 MeSH 轉換\n\n| Tool | Description |\n| --- | --- |\n| `convert_icd_mesh` | Convert between ICD codes and MeSH terms (bidirectional). |\n\n## 引用驗證\n\nReference list verification with PubMed evidence\n\n| Tool | Description |\n| --- | --- |\n| `verify_reference_list` | Verify a plain-text reference list against PubMed evidence. |\n\n## 圖表擷取\n\n文章圖表與視覺資料擷取\n\n| Tool | Description |\n| --- | --- |\n| `get_article_figures` | Get structured figure metadata (label, caption, image URL) and PDF links from a PMC Open Access arti |\n\n## 研究編年史\n\n研究演化脈絡：持久化、可版本比對、證據支撐的時序主軸與分支投影\n\n| Tool | Description |\n| --- | --- |\n| `build_research_chronicle` | Build a persisted, versioned, evidence-backed Research Chronicle. |\n| `read_research_chronicle` | Read stored Research Chronicles: load, list, diff, narrate, analyze, compare. |\n\n## 圖片搜尋\n\n生物醫學圖片搜尋\n\n| Tool | Description |\n| --- | --- |\n| `search_biomedical_images` | Search biomedical images across Open-i and Europe PMC. |\n\n## Pipeline 管理\n\nPipeline 持久化、載入、排程\n\n| Tool | Description |\n| --- | --- |\n| `manage_pipeline` | Manage saved pipelines through a single facade. |\n| `save_pipeline` | Save a pipeline configuration for later reuse. |\n| `list_pipelines` | List all saved pipeline configurations. |\n| `load_pipeline` | Load a pipeline configuration for review or editing. |\n| `delete_pipeline` | Delete a saved pipeline configuration and its execution history. |\n| `get_pipeline_history` | Get execution history for a saved pipeline. |\n| `schedule_pipeline` | Schedule a saved pipeline for periodic execution. |\n\n---\n\n## 檔案結構\n\n```text\nmcp_server/\n├── server.py           # Server 創建與配置\n├── instructions.py     # AI Agent 使用說明\n├── tool_registry.py    # 工具註冊中心\n├── session_tools.py    # Session 管理工具\n├── resources.py        # MCP Resources\n├── prompts.py          # MCP Prompts\n├── TOOLS_INDEX.md      # 本檔案 (工具索引)\n└── tools/              # 工具實作\n    ├── __init__.py     # 統一入口\n    ├── _common.py      # 共用工具函數\n    ├── unified.py      # unified_search\n    ├── discovery.py    # 搜尋與探索\n    ├── strategy.py     # MeSH/查詢策略\n    ├── pico.py         # Agent-provided PICO handoff\n    ├── export.py       # 匯出工具\n    ├── europe_pmc.py   # Europe PMC 全文\n    ├── core.py         # CORE 開放取用\n    ├── ncbi_extended.py # Gene/PubChem/ClinVar\n    ├── citation_tree.py # 引用網路\n    ├── openurl.py      # 機構訂閱\n    ├── vision_search.py # 視覺搜索\n    └── icd.py          # ICD 轉換工具\n```\n\n---\n\n*Total: 45 tools in 16 categories*\n*Auto-generated by `scripts/count_mcp_tools.py --update-docs`*\n",
+  "tools-usage-guide": "<!-- Generated from docs/TOOLS_USAGE_GUIDE.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP Tools Usage Guide\n\nCapability-first guide for using the 46-tool PubMed Search MCP surface without treating the tool list as a menu to memorize.\n\n**Language**: **English** | [繁體中文](#/tools-usage-guide-zh)\n\n## Reading Order\n\n1. Start with the capability family that matches the user intent.\n2. Use session tools to reuse the latest result set instead of asking the model to remember PMIDs.\n3. Export citations or notes only after the evidence set is clear.\n4. Use the raw [tools index](#/quick-reference) only when you need exact tool names.\n\n## The 8 Capability Families\n\n![PubMed Search MCP capability map](images/tool-capability-map.svg)\n\n| Capability | Primary Tools | Use When |\n| --- | --- | --- |\n| Search entry | `unified_search`, `unified_search_batch` | The user wants papers, articles, or a first pass over a topic. |\n| Query intelligence | `analyze_search_query`, `parse_pico`, `generate_search_queries` | The query needs MeSH, agent-provided PICO handoff, synonym expansion, or strategy planning. |\n| Discovery | `fetch_article_details`, `find_related_articles`, `find_citing_articles`, `get_article_references`, `build_citation_tree` | The user has seed PMIDs and wants context, related work, or citation lineage. |\n| Full text and figures | `get_fulltext`, `get_text_mined_terms`, `get_article_figures` | The user needs article body text, evidence sections, entities, captions, or image URLs. |\n| External biomedical data | `search_gene`, `get_gene_details`, `search_compound`, `get_compound_details`, `search_clinvar` | The research question moves from papers into NCBI gene, compound, or clinical variant data. |\n| Evaluation and research evolution | `get_citation_metrics`, `build_research_chronicle`, `read_research_chronicle` | The user asks what matters, what changed over time, or how fields compare. |\n| Persistence and sessions | `read_session`, `get_session_pmids`, `get_cached_article`, `get_session_summary`, pipeline tools | The user wants to resume, repeat, audit, schedule, or save a search workflow. |\n| Export and local notes | `prepare_export`, `save_literature_notes` | The user wants Zotero/EndNote/BibTeX files or local Markdown/wiki notes. |\n\n## Intent Routing\n\n| User Intent | Recommended Flow |\n| --- | --- |\n| Quick literature search | `unified_search(query=..., limit=...)` |\n| Clinical comparison | Agent P/I/C/O -> `parse_pico` -> `unified_search(pipeline=\"template: pico...\")` |\n| Systematic review seed | `analyze_search_query` -> `generate_search_queries` -> `unified_search(options=\"systematic\")` -> `save_pipeline` |\n| Several query variants at once | `generate_search_queries` -> `unified_search_batch(queries=[...])` (shared dedup/enrichment, fused ranking) |\n| Provider-native semantic retrieval | `unified_search(sources=\"openalex\", options=\"native_semantic\")` |\n| Important paper exploration | `fetch_article_details` -> `find_related_articles` / `find_citing_articles` / `get_article_references` |\n| Full-text synthesis | `get_fulltext` -> `get_text_mined_terms` -> structured summary |\n| Zotero handoff | `prepare_export(pmids=\"last\", format=\"ris\")` or Zotero Keeper import tools |\n| Local knowledge-base notes | `save_literature_notes(pmids=\"last\")` |\n| Repeatable search workflow | `save_pipeline` -> `unified_search(pipeline=\"saved:<name>\")` |\n\nZotero Keeper should remain an external integration boundary. PubMed Search MCP produces official RIS/MEDLINE/CSL JSON exports, local RIS/BibTeX/CSV/MEDLINE/JSON exports, and local wiki notes; Zotero Keeper or another client owns Zotero import, duplicate handling, and library-specific policies.\n\n## Capability Workflow Diagrams\n\nEach feature family has a workflow diagram so users and developers can see where a tool sits in the larger research path.\n\n### Search Entry And Query Intelligence\n\n![Search and query intelligence workflow](images/search-query-workflow.svg)\n\nUse this path for `unified_search`, `parse_pico`, `generate_search_queries`, `analyze_search_query`, and ICD-aware search preparation. The important boundary is that the agent performs semantic PICO extraction, while `parse_pico` validates the structured handoff and returns a backend `template: pico` pipeline.\n\nThere is exactly one generic literature-search tool. Choose its retrieval\npolicy with `options` instead of looking for provider-specific search tools:\n\n| Policy | Example | Contract |\n| --- | --- | --- |\n| Default | `unified_search(query=\"sepsis biomarkers\")` | Relevance/keyword routing across the normal capable source plan. |\n| Native semantic | `unified_search(query=\"mechanisms of resistance\", sources=\"openalex\", options=\"native_semantic\")` | OpenAlex title/abstract semantic retrieval; provider maximum 50. |\n| Systematic | `unified_search(query=\"melanoma AND immunotherapy\", sources=\"pubmed,openalex,semantic_scholar\", options=\"systematic\")` | Deterministic, bounded provider execution: OpenAlex cursor and Semantic Scholar bulk where selected. |\n\n`native_semantic` and `systematic` are mutually exclusive. Both disable the\nmulti-strategy deep-search expansion so the selected provider-native plan stays\nauditable. An explicit unsupported source/mode combination fails before the\nnetwork call; automatic routing retains capable sources only. The public\n`limit` remains at most 100 per source, so `systematic` is a reproducible\nretrieval primitive, not proof of exhaustive systematic-review coverage.\n\nInput validation is strict and occurs before provider I/O. `limit` must be an\ninteger in `1..100`; filter tokens must use supported `key:value` forms; year\nbounds must be within 1000–2100 and ordered; and unknown option flags, ranking\nmodes, or output formats are rejected instead of silently ignored. In normal\ndeep mode, the same public `limit` is the **total budget for one source across\nall of its generated strategies**. The broker allocates that budget across the\nstrategies, clips over-returning adapters, and applies bounded global and\nper-source concurrency plus strategy deadlines.\n\nJSON/TOON output and persistent artifacts preserve `retrieval_mode` and\nper-source `source_metadata`, including requested/provider mode, canonical or\ncompiled query, opaque continuation token/cursor when returned, cost/rate\nmetadata, and warnings. Continuation data is currently provenance only: the\npublic facade has no cursor-resume argument. Consult\n[Source Contracts](#/source-contracts),\n[Semantic Scholar](#/semantic-scholar-api), and [OpenAlex](#/openalex-api)\nbefore interpreting provider totals or continuing a search.\n\nFor agent decisions on a normal result envelope, prefer the structured\n`search_status` object over rendered text length. It labels the retrieval as\nbounded and non-exhaustive and\nseparates `completed`, valid `empty`, `partial`, and all-source `failed`\noutcomes. It also reports returned count, attempted/successful/failed/retryable\nsources, continuation sources, and sources whose completeness is unknown.\n\nClinicalTrials.gov is an explicit adjunct, not another literature-search leg.\nUse `options=\"trials\"` only when a Markdown response should include up to three\nrelated registry records. The request is never made by default, does not affect\narticle ranking/source counts, and is recorded separately in the search\nartifact. JSON/TOON output does not run the display-only adjunct.\n\n### Article Discovery And Citation Mapping\n\n![Article discovery and citation workflow](images/discovery-citation-workflow.svg)\n\nUse this path once you have one or more seed PMIDs. It covers `fetch_article_details`, `find_related_articles`, `find_citing_articles`, `get_article_references`, `build_citation_tree`, and `get_citation_metrics`.\n\n### Reference Verification\n\n![Reference verification workflow](images/reference-verification-workflow.svg)\n\nUse `verify_reference_list` when a manuscript, bibliography, or generated answer needs PubMed-backed citation checking. Treat matches and mismatches as an audit trail, not as prose-only summary.\n\n### Full Text, Figures, And Image Evidence\n\n![Full text, figures, and biomedical image workflow](images/visual-evidence-workflow.svg)\n\nUse this path for `get_fulltext`, `get_text_mined_terms`, `get_article_figures`, `analyze_figure_for_search`, and `search_biomedical_images`. Full text, figure metadata, and image search are separate evidence channels with different availability limits.\n\nUse `analyze_figure_for_search` when the user provides an image URL or uploaded image payload and wants the agent to infer search terms from the visual content. The tool returns MCP `ImageContent`; the LLM agent performs the visual interpretation and should immediately continue with `search_biomedical_images` or `unified_search`.\n\nUse `search_biomedical_images` when the visual question is already textual. Open-i is the current primary source, supports filters such as `image_type`, `collection`, `article_type`, `specialty`, `license_type`, `search_fields`, and requires English medical terminology.\n\n### External Biomedical Data\n\n![NCBI extended biomedical data workflow](images/ncbi-extended-workflow.svg)\n\nUse this path for `search_gene`, `get_gene_details`, `get_gene_literature`, `search_compound`, `get_compound_details`, `get_compound_literature`, and `search_clinvar` when the question moves beyond papers into NCBI biomedical records.\n\n### Evaluation, Timeline, And Comparison\n\n![Research Chronicle Architecture and Lineage Flow](images/research-chronicle-lineage-flow.svg)\n![Evaluation and timeline workflow](images/timeline-evaluation-workflow.svg)\n\nUse this path for `get_citation_metrics`, `build_research_chronicle`, and `read_research_chronicle` when the user asks what mattered, when the field changed, or how topics diverged.\n\n`build_research_chronicle` is the single research-evolution tool. It accepts `topic=...`, explicit comma-separated `pmids=...`, or an existing `chronicle_id=...`, detects milestone-like papers, and can return `summary`, `chronicle_map`, `timeline`, `tree`, `graph`, `evidence`, `milestones`, `mermaid`, `timeline_mermaid`, `mindmap`, `narrative`, or `json`. `mermaid` combines a horizontal year spine and lineage branches; `chronicle_map` is its JSON coordinate contract. Use `read_research_chronicle(action=\"milestones\")` for milestone distribution diagnostics and `read_research_chronicle(action=\"compare\", topics=\"a,b\")` for up to five topic tracks.\n\nUse precise terms:\n\n- **Timeline**: chronological milestone projection.\n- **Lineage tree**: retrieval-bounded branch projection from timeline events, not a causal genealogy.\n- **Chronicle map**: one horizontal time spine with observed lines anchored at their earliest dated papers in the retrieved scope. Semantic branches require a signal shared by multiple papers; singleton-only or insufficient MeSH/keyword support produces a warned research-stage fallback. Same-year layout does not imply precedence when date precision cannot establish it.\n- **Context graph preview**: `unified_search(options=\"context_graph\")`, a lightweight preview from the current PMID-backed ranked set.\n- **Citation tree**: `build_citation_tree`, a single-seed forward/backward citation network.\n- **Research Chronicle**: `build_research_chronicle` / `read_research_chronicle`, the persistent, versioned, evidence-backed record. See [Advanced Research Workflows](#/advanced-workflows) and [Research Chronicle Rebuild Spec](#/research-chronicle-rebuild-spec).\n\n### Research Chronicle\n\nUse `build_research_chronicle` whenever the user asks how a field evolved. It replaces the older one-shot timeline tools: each immutable revision is appended atomically with a monotonic number, so re-running it later lets you diff revisions and answer \"what changed since last time\".\n\nChronology is the primary axis and research branches are a secondary projection of the same stored entries. Branches describe patterns observed in the selected query/PMID/source/year scope, not causal descent. `earliest_observed_in_scope` identifies the earliest dated retrieved candidate only; it does not establish the field's true first report. Date-precision intervals must be disjoint before the graph can assert `precedes` or `supersedes`.\n\nEach chronicle entry carries a one-sentence claim with inline citations, its supporting/contradicting/updating evidence, a branch (lineage) assignment, and a confidence score. A typed provenance graph links Topic → Branch → Entry → EvidenceArticle and is validated against edge invariants. The audit reports evidence coverage, identifier coverage, branch coverage, semantic-lineage basis/coverage, graph integrity, chronology gaps, and per-source retrieval counts.\n\nTopic mode applies `min_year` / `max_year` in the PubMed request before the relevance-capped fetch. Final event selection pins the first and last observed papers, prioritizes explicit landmark importance/citations, then fills the remaining capacity across the largest temporal gaps. Audit source coverage distinguishes PubMed `returned` from `available` and warns for capped samples, downstream selection, or unknown availability. An upstream PubMed error or zero article evidence returns an error and publishes no Chronicle revision.\n\nPMID input accepts only ASCII digits with an optional `PMID:` prefix and explicit separators; DOI or arbitrary mixed identifier text is rejected. Entry IDs use PMID, then DOI, as stable evidence identity so date and milestone reclassification becomes an update rather than false remove/add churn. Chronicle derivation, topic lookup, comparison, and continuity share a Unicode-normalized, case-folded, whitespace-collapsed topic key while preserving the stored display topic.\n\nA paper matching several selected semantic signals has one primary branch and explicit secondary cross-links in lineage diagnostics. If at least 20% of all or assigned entries overlap, the audit warns that branches are not cleanly separated. `confidence` remains milestone-detection confidence; landmark ordering uses explicit landmark importance and falls back to citation count, never detection confidence.\n\n- `build_research_chronicle(topic=...)` or `build_research_chronicle(pmids=\"last\")` atomically creates revision N+1. When session artifact persistence is enabled, it also writes a `research-chronicle-artifact/v1` bundle; a write failure is visible in Markdown or as `artifact.status=\"failed\"` in structured output, while the revision remains saved.\n- `build_research_chronicle(chronicle_id=...)` re-runs the continued revision's own topic/PMID set and filters to produce revision N+1 reflecting research movement cleanly.\n- `read_research_chronicle(action=\"list\")` lists stored chronicles.\n- `read_research_chronicle(chronicle_id=..., output=\"mermaid\"|\"mindmap\"|\"chronicle_map\"|\"tree\"|\"timeline\"|\"graph\"|\"evidence\")` reads one revision or the combined map.\n- `read_research_chronicle(action=\"diff\", chronicle_id=..., from_revision=1)` reports added, updated, and absent entries plus evidence and branch churn. The legacy `retired` key is a compatibility alias for `not_observed_in_revision` / `removed_from_view`; absence is never conclusive retirement.\n- `read_research_chronicle(action=\"narrate\", chronicle_id=..., mode=\"full\")` renders prose where every claim cites its entry ID and article identifiers.\n- `read_research_chronicle(action=\"compare\", topics=\"a,b\")` uses normalized exact stored-topic names. Multiple chronicles with the same topic are reported as ambiguous; pass distinct `chronicle_ids` instead. Duplicate targets are not a valid comparison.\n\nThe public schema and runtime checks bound Chronicle requests: `max_events` is 1–200, an explicit set has at most 500 unique PMIDs, topic text has at most 500 characters, list limits are 1–100, and comparisons contain 2–5 distinct chronicles. JSON projections and structured read actions keep validation/not-found errors structured.\n\nArtifact preflight audits the names produced by the actual artifact payload builder (plus the store-generated manifest), rather than trusting a parallel declared list. It validates preparation only; persistence success is reported separately by the artifact locator/status.\n\n### Session, Pipeline, And Scheduled Reuse\n\n![Session and pipeline workflow](images/session-pipeline-workflow.svg)\n\nUse this path for `read_session`, `get_session_pmids`, `get_cached_article`, `get_session_summary`, `get_session_log`, `manage_pipeline`, `save_pipeline`, `list_pipelines`, `load_pipeline`, `delete_pipeline`, `get_pipeline_history`, and `schedule_pipeline`.\n\nLocal and service capabilities are intentionally different. A trusted local\ncaller may use workspace scope, `file:` pipeline sources, and the in-process\nscheduler. An authenticated service caller can only read saved pipelines from\nits tenant-derived store; process-wide workspace/file reads are blocked, and\nthe service Compose profile disables scheduling unless an operator supplies a\nsingle external leader/lease.\n\n### Institutional Access\n\n![Institutional access workflow](images/institutional-access-workflow.svg)\n\nUse this path for `configure_institutional_access`, `get_institutional_link`, `list_resolver_presets`, `test_institutional_access`, and `diagnose_institutional_access`. OpenURL is a browser handoff; direct DOI and EZproxy paths become agent-fetchable only when the environment is configured and access is permitted.\n\n### Export And Local Notes\n\n![Export and local notes workflow](images/export-notes-workflow.svg)\n\nUse this path for `prepare_export` and `save_literature_notes`. Citation exports are for reference managers; local notes are editable literature-review artifacts with machine-readable metadata.\n\n## Persistent Query Memory For Large Outputs\n\nWhen session persistence is configured, `unified_search` and `get_fulltext`\nwrite complete reusable outputs to artifacts and return a compact locator in\nthe tool response. Treat the response as an index card: it has enough counts,\nwarnings, and artifact hints for the agent to answer immediately, while the\ncomplete evidence payload stays in retrievable files. Use the session facade for\nremote clients, and set `PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true` only for\nlocal MCP clients that should receive direct server paths:\n\n```python\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"audit.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"results.json\", offset=0, max_chars=200000)\n```\n\nWhen session management is active, every `unified_search` invocation includes a\nstable `search_run.run_id`: normal search, validation/planning failure, inline\npipeline, `saved:<name>`, and pipeline `dry_run=true`. The tenant-scoped\n`search-run/v1` journal is written before provider I/O or a terminal validation\nresponse and retains a credential-sanitized replay request, normalized plan,\nper-source or per-pipeline-step attempts, safe failure details, compact result\nreferences, warnings, and an artifact locator when applicable. Structured\nresponses attach the handoff and Markdown adds a compact run note.\n\nSuccessful, zero-result, partial, planning/execution failure, and cancelled\ninvocations therefore leave inspectable state. A valid zero-result run has\njournal status `completed` while `search_status.state` is `empty`; an unfinished\nactive run is changed to `interrupted` once during restart recovery. A non-dry-\nrun saved pipeline additionally keeps its PipelineStore report/run history.\nPipelineStore history and the invocation journal are complementary.\n\n```python\nread_session(action=\"search_runs\")\nread_session(action=\"search_runs\", run_status=\"partial\", history_limit=20)\nread_session(action=\"search_run\", run_id=\"...\")\nread_session(action=\"replay_search\", run_id=\"...\")\n```\n\n`replay_search` is intentionally read-only. It returns exact, credential-free\n`unified_search` kwargs and `automatic_execution=false`; an agent must review\nand explicitly call `unified_search` to run them. Pipeline replay includes its\ninline or `saved:<name>` argument plus `dry_run` / `stop_at`. Pipeline text that\ncontains credentials is rejected as a failed run; use server environment\nconfiguration for provider keys, tokens, cookies, and secrets. Because there is no public\ncursor-resume input yet, opaque cursor/token provenance cannot resume a page in\nplace and replay begins a new bounded request.\n\nIf the terminal history commit cannot be recovered, the bounded handoff changes\nto `status=\"history_unavailable\"` with `history_available=false`, the intended\nstatus, and a warning. Inspect/replay actions are omitted in that degraded state\nbecause durable recovery cannot be promised.\n\n`unified_search` artifacts use a research envelope. Start with `audit.json` to\ncheck completeness warnings, then `query_strategy.json` for the exact query\nplan, and `results.json` / `results.toon` for the full result list. This avoids\nspending MCP response tokens on long article lists while still making the run\nauditable and reproducible.\n\nArtifact publication and session indexing are separate atomic boundaries. On\nsession reload, the store discovers only complete checksum-indexed manifests\nthat are missing from the session index and relinks a recovered search artifact\nby `search_run_id`; a conservative same-query fallback exists for older\nartifacts that predate that metadata.\n\n`local_path` and `manifest_path` are paths on the MCP server host. `read_session`\nredacts local paths by default unless `include_local_paths=true` is requested.\nLarge `get_fulltext` responses are capped inline when an artifact exists; use\nthe locator to read the saved full content. This is persistent query memory:\nagents can reopen the exact saved search/fulltext output by artifact ID without\nrerunning the external source call. Full-text artifacts can contain article body\ntext, so handle storage and sharing according to publisher, license, and\ninstitutional access terms.\n\nIf a source fails but the search can continue, `unified_search` may return\n`source_errors` in JSON or `Source warnings` in markdown. Semantic Scholar HTTP\n429 warnings usually mean the workflow should set `S2_API_KEY` /\n`SEMANTIC_SCHOLAR_API_KEY`, retry later, or exclude the source.\n\n## Local Wiki Note Export\n\n![Export and local notes workflow](images/export-notes-workflow.svg)\n\nUse `save_literature_notes` when the user wants a guided, semi-structured file output after search. This is better than asking an agent to assemble a Markdown note with a generic write-file operation.\n\nDefault behavior:\n\n```python\nsave_literature_notes(pmids=\"last\")\n```\n\nThe default `note_format` is `wiki`. It writes one `.md` file per article with:\n\n- YAML frontmatter for title, PMID, DOI, PMCID, journal, year, citation key, aliases, and tags\n- Foam-compatible wikilinks in the generated index note\n- stable wiki/Foam link targets based on PMID, DOI, PMCID, or a fallback identifier; article titles stay as link labels and aliases\n- a `wiki_validation` report showing emitted wikilinks and any unresolved targets\n- triage fields for status, relevance, and decision\n- summary, key findings, methods/population, limitations, and follow-up question sections\n- source links to PubMed, DOI, and PMC when available\n- by default, a collection-level `references.csl.json` sidecar when notes or index artifacts are created\n\nWhen `unified_search` returns PMID-backed results, its next-tool suggestions include:\n\n```python\nsave_literature_notes(pmids=\"last\", note_format=\"wiki\")\n```\n\nThat gives agents a local LLM-wiki handoff without requiring them to invent filenames or wikilinks from the search response.\n\nSupported note formats:\n\n| Format | Link Style | Layout | Best For |\n| --- | --- | --- | --- |\n| `wiki` | `[[stable-id|title]]` | default guided literature note | Foam, Obsidian-style, and general wiki workflows |\n| `foam` | `[[stable-id|title]]` | same compatible profile as `wiki` | existing Foam-specific users |\n| `markdown` | `` `[title](note.md)` `` | same guided sections | plain Markdown repositories |\n| `medpaper` | `[[citation_key|title]]` | per-reference directory containing `<citation_key>.md` plus `metadata.json` | MedPaper-style or Zotero Keeper-compatible reference libraries |\n\nLocal-mode directory resolution:\n\n1. `output_dir`, if provided\n2. `PUBMED_NOTES_DIR`\n3. `PUBMED_WORKSPACE_DIR/references`\n4. `PUBMED_DATA_DIR/references`\n5. `~/.pubmed-search-mcp/references`\n\nAuthenticated service callers do not participate in that host-path resolution.\nThey cannot supply `output_dir` or `template_file`; notes use a built-in format\nand stay below the current principal's isolated `references/` directory.\n\n## Good Markdown Note Shape\n\nA good literature note should separate verified bibliographic data from human or agent interpretation:\n\n```markdown\n---\ntitle: \"Article title\"\npmid: \"12345678\"\ndoi: \"10.xxxx/example\"\ncitation_key: \"smith2024_12345678\"\nsource: \"PubMed\"\nnote_format: \"wiki\"\ntags: [\"literature\", \"pubmed\"]\naliases: [\"smith2024_12345678\", \"Article title\", \"12345678\", \"Smith 2024\"]\n---\n\n# Article title\n\n## Metadata\n- PMID: [12345678](https://pubmed.ncbi.nlm.nih.gov/12345678/)\n- DOI: [10.xxxx/example](https://doi.org/10.xxxx/example)\n- Journal: Journal name\n- Year: 2024\n- Authors: Smith J; Doe J\n\n## Triage\n- Status:\n- Relevance:\n- Decision:\n\n## Summary\n-\n\n## Key Findings\n-\n\n## Methods And Population\n-\n\n## Limitations\n-\n\n## Follow Up Questions\n-\n\n## Citation\n- Smith J; Doe J. Article title. Journal name. 2024. doi:10.xxxx/example\n```\n\nKeep verified metadata machine-readable in frontmatter and sidecars. Keep interpretation editable in body sections.\n\n## Custom Templates\n\nIn trusted local mode, use `template_file` when a user has a house style:\n\n```python\nsave_literature_notes(\n    pmids=\"last\",\n    output_dir=\"./references\",\n    template_file=\"./reference-template.md\"\n)\n```\n\nAvailable placeholders include `{title}`, `{pmid}`, `{doi}`, `{pmc_id}`, `{journal}`, `{journal_abbrev}`, `{year}`, `{volume}`, `{issue}`, `{pages}`, `{authors}`, `{abstract}`, `{citation_key}`, `{reference_id}`, `{note_format}`, `{created}`, `{pubmed_url}`, `{doi_url}`, `{citation}`, `{keywords}`, `{mesh_terms}`, and `{csl_json}`.\n\nFor an authenticated service, choose one of the built-in note formats instead;\nreading an arbitrary template from the server filesystem is rejected.\n\n## Pipeline And Packaged Agent References\n\nPipeline tutorials live canonically in:\n\n- `docs/PIPELINE_MODE_TUTORIAL.en.md`\n- `docs/PIPELINE_MODE_TUTORIAL.md`\n\n`scripts/build_docs_site.py` also syncs those tutorials into `.claude/skills/pipeline-persistence/references/` so external agent bundles and VSIX packages that do not ship `docs/site-content/` can still read them.\n",
+  "tools-usage-guide-zh": "<!-- Generated from docs/TOOLS_USAGE_GUIDE.zh-TW.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP 工具使用指南\n\n這是一份能力導向指南，目標是讓 agent 和使用者不用死背 46 個 MCP tool，也能穩定選到正確流程。\n\n**語言**: [English](#/tools-usage-guide) | **繁體中文**\n\n## 閱讀順序\n\n1. 先用使用者意圖對應能力族。\n2. 用 session tools 取回上一輪結果，不要要求模型記住所有 PMID。\n3. 先確認 evidence set，再匯出引用或本機筆記。\n4. 需要查精確工具名時，再看[完整工具索引](#/quick-reference)。\n\n## 8 個能力族\n\n![PubMed Search MCP 能力族地圖](images/tool-capability-map.svg)\n\n| 能力 | 主要工具 | 何時使用 |\n| --- | --- | --- |\n| 搜尋入口 | `unified_search`、`unified_search_batch` | 使用者要找論文、文章、或先對主題做第一輪搜尋。 |\n| 查詢智能 | `analyze_search_query`, `parse_pico`, `generate_search_queries` | 需要 MeSH、agent-provided PICO handoff、同義詞擴展、或搜尋策略。 |\n| 論文探索 | `fetch_article_details`, `find_related_articles`, `find_citing_articles`, `get_article_references`, `build_citation_tree` | 已有 seed PMID，要查脈絡、相關研究、引用網路。 |\n| 全文與圖表 | `get_fulltext`, `get_text_mined_terms`, `get_article_figures` | 需要文章段落、證據區段、實體標註、caption 或 image URL。 |\n| 外部生醫資料 | `search_gene`, `get_gene_details`, `search_compound`, `get_compound_details`, `search_clinvar` | 問題從文獻延伸到 NCBI gene、compound、clinical variant。 |\n| 評估與研究演化 | `get_citation_metrics`, `build_research_chronicle`, `read_research_chronicle` | 使用者問哪些重要、領域如何演進、或多主題比較。 |\n| 持久化與 session | `read_session`, `get_session_pmids`, `get_cached_article`, `get_session_summary`, pipeline tools | 使用者要恢復、重跑、審計、排程、保存搜尋流程。 |\n| 匯出與本機筆記 | `prepare_export`, `save_literature_notes` | 使用者要 Zotero/EndNote/BibTeX，或本機 Markdown/wiki 筆記。 |\n\n## 意圖路由\n\n| 使用者意圖 | 建議流程 |\n| --- | --- |\n| 快速搜尋文獻 | `unified_search(query=..., limit=...)` |\n| 臨床 A vs B 比較 | Agent P/I/C/O -> `parse_pico` -> `unified_search(pipeline=\"template: pico...\")` |\n| 系統性回顧起手式 | `analyze_search_query` -> `generate_search_queries` -> `unified_search(options=\"systematic\")` -> `save_pipeline` |\n| 一次跑多個查詢變體 | `generate_search_queries` -> `unified_search_batch(queries=[...])`（共用去重與 enrichment，並回傳融合排序） |\n| Provider-native 語意檢索 | `unified_search(sources=\"openalex\", options=\"native_semantic\")` |\n| 深挖重要論文 | `fetch_article_details` -> `find_related_articles` / `find_citing_articles` / `get_article_references` |\n| 全文 synthesis | `get_fulltext` -> `get_text_mined_terms` -> 結構化摘要 |\n| Zotero handoff | `prepare_export(pmids=\"last\", format=\"ris\")` 或 Zotero Keeper import tools |\n| 本機知識庫筆記 | `save_literature_notes(pmids=\"last\")` |\n| 可重複搜尋流程 | `save_pipeline` -> `unified_search(pipeline=\"saved:<name>\")` |\n\nZotero Keeper 應維持在外部整合邊界。PubMed Search MCP 負責產生 official RIS/MEDLINE/CSL JSON、local RIS/BibTeX/CSV/MEDLINE/JSON 匯出與本機 wiki notes；Zotero 匯入、duplicate 處理、library-specific policy 交給 Zotero Keeper 或其他 client。\n\n## 能力工作流程圖\n\n每個功能族都補上 workflow 圖，讓使用者與開發者能看出工具在完整研究流程中的位置。\n\n### 搜尋入口與查詢智能\n\n![搜尋與查詢智能流程](images/search-query-workflow.svg)\n\n這條路徑涵蓋 `unified_search`、`parse_pico`、`generate_search_queries`、`analyze_search_query` 與 ICD-aware search preparation。重點邊界是：agent 負責語意上的 PICO 抽取，`parse_pico` 驗證結構化 handoff 並回傳後端 `template: pico` pipeline。\n\n通用文獻搜尋只有一個 tool。使用 `options` 選 retrieval policy，不要尋找\nprovider-specific search tool：\n\n| Policy | 範例 | 合約 |\n| --- | --- | --- |\n| 預設 | `unified_search(query=\"sepsis biomarkers\")` | 在一般有能力的 source plan 中做 relevance/keyword 路由。 |\n| Native semantic | `unified_search(query=\"mechanisms of resistance\", sources=\"openalex\", options=\"native_semantic\")` | OpenAlex title/abstract 語意檢索；provider 最多 50 筆。 |\n| Systematic | `unified_search(query=\"melanoma AND immunotherapy\", sources=\"pubmed,openalex,semantic_scholar\", options=\"systematic\")` | 可稽核的有界 provider execution；選到時用 OpenAlex cursor 與 Semantic Scholar bulk。 |\n\n`native_semantic` 與 `systematic` 互斥。兩者都會關閉多策略 deep-search\nexpansion，保留可稽核的 provider-native plan。明確 source/mode 不相容時，系統在\nnetwork call 前拒絕；自動路由則只保留有能力的 source。Public `limit` 每 source\n仍最多 100，所以 `systematic` 是可重現的 retrieval primitive，不是已窮盡所有\nsystematic-review evidence 的證明。\n\nInput validation 會在 provider I/O 前嚴格執行。`limit` 必須是 `1..100` 的整數；\nfilter token 必須使用支援的 `key:value`；year bounds 必須在 1000–2100 內且順序\n正確；未知 option、ranking mode 或 output format 會直接被拒絕，不會無聲忽略。\n一般 deep mode 中，公開 `limit` 是單一 source 所有 generated strategies 共用的\n**總額度**。Broker 會把額度分配到 strategies、裁切超額 adapter response，並套用\n有界的全域／每來源 concurrency 與 strategy deadline。\n\nJSON/TOON 與 persistent artifact 會保存 `retrieval_mode` 及每來源\n`source_metadata`，包括 requested/provider mode、canonical 或 compiled query、\nprovider 回傳的 opaque continuation token/cursor、cost/rate metadata 與 warnings。\nContinuation data 目前只作為 provenance；公開 facade 尚無 cursor-resume argument。\n解讀 provider total 或繼續擷取前，請先看\n[Source Contracts](#/source-contracts)、[Semantic Scholar](#/semantic-scholar-api) 與\n[OpenAlex](#/openalex-api)。\n\nAgent 對一般 result envelope 做決策時，應以 structured `search_status` 為準，不要用\nrendered text 長度判斷。它會明確標示 bounded、non-exhaustive，區分\n`completed`、合法的 `empty`、\n`partial` 與所有來源皆失敗的 `failed`，並列出 returned count、\nattempted/successful/failed/retryable sources、有 continuation 的 sources 與完整度未知\n的 sources。\n\nClinicalTrials.gov 是明確選擇的 adjunct，不是另一個 literature-search leg。\n只有需要 Markdown 回應附帶最多三筆相關 registry records 時才使用\n`options=\"trials\"`。預設不會發出請求，不影響 article ranking/source\ncounts，並在 search artifact 中獨立記錄。JSON/TOON 不執行這個僅用於顯示的 adjunct。\n\n### 論文探索與引用脈絡\n\n![論文探索與引用流程](images/discovery-citation-workflow.svg)\n\n已有 seed PMID 後使用這條路徑。它涵蓋 `fetch_article_details`、`find_related_articles`、`find_citing_articles`、`get_article_references`、`build_citation_tree` 與 `get_citation_metrics`。\n\n### 引用驗證\n\n![引用驗證流程](images/reference-verification-workflow.svg)\n\n當 manuscript、bibliography 或 agent 產生的回答需要 PubMed-backed citation checking 時，使用 `verify_reference_list`。match / mismatch 應視為 audit trail，而不是只看生成摘要。\n\n### 全文、圖表與圖片證據\n\n![全文、圖表與生醫圖片流程](images/visual-evidence-workflow.svg)\n\n這條路徑涵蓋 `get_fulltext`、`get_text_mined_terms`、`get_article_figures`、`analyze_figure_for_search` 與 `search_biomedical_images`。全文、figure metadata、image search 是不同證據通道，各自有不同可得性限制。\n\n當使用者提供 image URL 或上傳圖片 payload，且需要 agent 從視覺內容推論搜尋詞時，使用 `analyze_figure_for_search`。這個 tool 會回傳 MCP `ImageContent`；實際圖片語意解讀由 LLM agent 完成，agent 應接續呼叫 `search_biomedical_images` 或 `unified_search`。\n\n當視覺問題已經文字化時，直接用 `search_biomedical_images`。目前主要來源是 Open-i，支援 `image_type`、`collection`、`article_type`、`specialty`、`license_type`、`search_fields` 等 filter，且需要英文醫學術語。\n\n### 外部生醫資料\n\n![NCBI 延伸生醫資料流程](images/ncbi-extended-workflow.svg)\n\n當問題從文獻延伸到 NCBI biomedical records 時，使用 `search_gene`、`get_gene_details`、`get_gene_literature`、`search_compound`、`get_compound_details`、`get_compound_literature` 與 `search_clinvar`。\n\n### 評估、時間軸與比較\n\n![Research Chronicle 架構與脈絡流程](images/research-chronicle-lineage-flow.svg)\n![評估與時間軸流程](images/timeline-evaluation-workflow.svg)\n\n使用者問「哪些重要」、「領域何時改變」、「不同主題如何分歧」時，使用 `get_citation_metrics`、`build_research_chronicle` 與 `read_research_chronicle`。\n\n`build_research_chronicle` 是唯一的研究演化工具。它接受 `topic=...`、明確的 comma-separated `pmids=...` 或既有的 `chronicle_id=...`，會偵測 milestone-like papers，並可回傳 `summary`、`chronicle_map`、`timeline`、`tree`、`graph`、`evidence`、`milestones`、`mermaid`、`timeline_mermaid`、`mindmap`、`narrative` 或 `json`。`mermaid` 把橫向年份主軸與 lineage 分支畫在同一張圖；`chronicle_map` 是同一座標契約的 JSON。`read_research_chronicle(action=\"milestones\")` 用於里程碑分佈 diagnostics；`read_research_chronicle(action=\"compare\", topics=\"a,b\")` 用於最多五個 topic tracks 的比較。\n\n用詞請保持精準：\n\n- **Timeline**：按時間排序的 milestone projection。\n- **Lineage tree**：由 timeline events 產生、受檢索範圍限制的分支投影，不是因果祖譜。\n- **Chronicle map**：單一橫向時間主軸，各觀察研究線錨定在本次檢索範圍內最早的有日期論文；語意分支必須有多篇論文共同支持的訊號，只有 singleton 或 MeSH/keyword 訊號不足時會產生 audit warning 並退回研究階段分類。同年排列在日期 precision 不足時不代表先後。\n- **Context graph preview**：`unified_search(options=\"context_graph\")`，只根據本次 PMID-backed ranked set 產生輕量預覽。\n- **Citation tree**：`build_citation_tree`，從單一 seed PMID 建立 forward/backward citation network。\n- **Research Chronicle**：`build_research_chronicle` / `read_research_chronicle`，持久化、版本化、有證據支撐的研究紀錄；詳見 [進階研究工作流](#/advanced-workflows-zh) 與 [Research Chronicle Rebuild Spec](#/research-chronicle-rebuild-spec)。\n\n### 研究編年史 (Research Chronicle)\n\n當使用者要的不是一次性快照，而是一份可以持續回頭維護的研究脈絡時，使用 `build_research_chronicle`。它取代了舊的一次性 timeline 工具：每個不可變 revision 都以原子操作和遞增編號追加，之後重跑就能做版本比對，回答「上次之後改變了什麼」。主軸是時序，分支是同一組 stored entries 的次要投影。\n\n分支描述選定 query / PMID / source / year 範圍裡觀察到的模式，不是因果演化。`earliest_observed_in_scope` 只標示 retrieved candidates 中最早的有日期文章，不證明它是整個領域的 first report。只有在日期 precision 所代表的區間互不重疊時，graph 才會宣稱 `precedes` 或 `supersedes`。\n\n每個 chronicle entry 都帶有一句附引用的 claim、supporting / contradicting / updating 證據、所屬研究分支 (lineage)，以及 confidence。型別化 provenance graph 以 Topic → Branch → Entry → EvidenceArticle 相連，並依 edge invariants 驗證。audit 會回報證據覆蓋率、識別碼覆蓋率、分支覆蓋率、語意 lineage 的依據與覆蓋率、graph 完整性、時序缺口與各來源回傳量。\n\nTopic mode 會在 relevance-capped fetch 前，先把 `min_year`／`max_year` 套用到 PubMed request。最後的 event selection 固定保留觀察到的首篇與末篇，優先選明確的 landmark importance／citation，再用最大的時間缺口補足容量。source coverage audit 會區分 PubMed `returned` 與 `available`，並針對 capped sample、後續選取或未知總量提出警告。PubMed upstream error 或零篇論文證據會直接回錯，不發布 Chronicle revision。\n\nPMID input 只接受 ASCII digits、可選的 `PMID:` prefix 與明確分隔符；DOI 或任意混合 identifier text 會被拒絕。entry ID 先依 PMID、再依 DOI 作為穩定 evidence identity，因此日期與 milestone 分類修正會成為 update，而不是假的 remove/add churn。Chronicle ID derivation、topic lookup、compare 與 continuity 共用 Unicode normalization、case-folding、空白折疊後的 topic key，但保留已儲存的顯示名稱。\n\n同時符合多個 semantic signals 的論文會有一個 primary branch，並在 lineage diagnostics 保留 explicit secondary cross-links。若全部 entries 或已分派 entries 的重疊比例至少 20%，audit 會警告 branches 並非清楚分離。`confidence` 只代表 milestone detection confidence；landmark ranking 使用明確的 landmark importance，缺少時才退回 citation count，絕不使用 detection confidence。\n\n- `build_research_chronicle(topic=...)` 或 `build_research_chronicle(pmids=\"last\")`：以原子操作建立 revision N+1。啟用 session artifact persistence 時也會寫入 `research-chronicle-artifact/v1` bundle；若寫入失敗，Markdown 或 structured output 的 `artifact.status=\"failed\"` 會明確揭露，而 revision 仍已保存。\n- `build_research_chronicle(chronicle_id=...)`：只傳 `chronicle_id` 即可自動沿用前一版的 topic/PMID 與檢索條件再跑一次，產出乾淨反映研究進展的 Revision N+1。\n- `read_research_chronicle(action=\"list\")`：列出已儲存的 chronicles。\n- `read_research_chronicle(chronicle_id=..., output=\"mermaid\"|\"mindmap\"|\"chronicle_map\"|\"tree\"|\"timeline\"|\"graph\"|\"evidence\")`：讀取單一 revision 或合併圖。\n- `read_research_chronicle(action=\"diff\", chronicle_id=..., from_revision=1)`：回報新增、更新與本次缺席的 entries，以及證據／分支變化。舊的 `retired` key 只是 `not_observed_in_revision`／`removed_from_view` 的相容 alias；缺席絕不等於已證實退場。\n- `read_research_chronicle(action=\"narrate\", chronicle_id=..., mode=\"full\")`：產出每句 claim 都附 entry ID 與文獻識別碼的敘述。\n- `read_research_chronicle(action=\"compare\", topics=\"a,b\")`：使用正規化後的完整 stored-topic 名稱。同名對應多個 Chronicle 時會回報 ambiguity，需改傳不同的 `chronicle_ids`；重複目標不構成有效比較。\n\nPublic schema 與 runtime validation 都限制 Chronicle request：`max_events` 1–200、明確 set 最多 500 個 unique PMIDs、topic 最多 500 字元、list limit 1–100、compare 需 2–5 個不同 Chronicles。JSON projections 與 structured read actions 的 validation / not-found 錯誤也維持結構化。\n\nArtifact preflight 會檢查實際 artifact payload builder 產出的檔名（再加上 store 產生的 manifest），而不是信任另一份平行常數清單。這只驗證 payload preparation；是否真的持久化成功，仍由 artifact locator／status 另外回報。\n\n### Session、Pipeline 與排程重用\n\n![Session 與 Pipeline 流程](images/session-pipeline-workflow.svg)\n\n這條路徑涵蓋 `read_session`、`get_session_pmids`、`get_cached_article`、`get_session_summary`、`get_session_log`、`manage_pipeline`、`save_pipeline`、`list_pipelines`、`load_pipeline`、`delete_pipeline`、`get_pipeline_history` 與 `schedule_pipeline`。\n\n本機與 service 能力刻意不同。可信任的本機 caller 可使用 workspace scope、`file:`\npipeline source 與 in-process scheduler。認證 service caller 只能讀取 tenant-derived store 中\n已保存的 pipeline；process-wide workspace/file reads 會被阻擋，service Compose 也停用\nscheduler，除非維運者另外提供單一 external leader/lease。\n\n### 機構存取\n\n![機構存取流程](images/institutional-access-workflow.svg)\n\n這條路徑涵蓋 `configure_institutional_access`、`get_institutional_link`、`list_resolver_presets`、`test_institutional_access` 與 `diagnose_institutional_access`。OpenURL 是 browser handoff；direct DOI 與 EZproxy 只有在環境已設定、且使用者有權存取時才是 agent-fetchable。\n\n### 匯出與本機筆記\n\n![匯出與本機筆記流程](images/export-notes-workflow.svg)\n\n這條路徑涵蓋 `prepare_export` 與 `save_literature_notes`。Citation exports 供 reference manager 使用；local notes 則是帶有 machine-readable metadata、可被人與 agent 後續編輯的 literature-review artifacts。\n\n## 大型輸出的持久化 Query Memory\n\n當 session persistence 已設定時，`unified_search` 與 `get_fulltext` 會把完整可重用輸出保存為 artifact，tool response 只回傳精簡 locator。請把 tool response 視為索引卡：它會有足夠的 counts、warnings 與 artifact hints 讓 agent 先回覆使用者；完整 evidence payload 則留在可重複讀取的 artifact files。Remote client 請透過 `read_session` facade 讀取；只有本機 MCP client 真的需要 server path 時，才設定 `PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true`：\n\n```python\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"audit.json\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\", artifact_file=\"results.json\", offset=0, max_chars=200000)\n```\n\nSession management 啟用時，每一次 `unified_search` invocation 都會帶有穩定的\n`search_run.run_id`：一般搜尋、validation/planning failure、inline pipeline、\n`saved:<name>` 與 pipeline `dry_run=true`。Tenant-scoped `search-run/v1` journal 會在\nprovider I/O 或 terminal validation response 前寫入，保存已移除 credentials 的\nreplay request、normalized plan、每來源或每 pipeline step attempts、安全化 failure\ndetails、精簡 result references、warnings，以及適用時的 artifact locator。\nStructured response 會附 handoff，Markdown 則加入精簡 run note。\n\n因此成功、零結果、partial、planning/execution failure 與 cancelled invocation 都能\n被檢查。合法零結果的 journal status 是 `completed`，同時\n`search_status.state` 是 `empty`；server restart 時，未完成的 active run 只會被轉成\n`interrupted` 一次。非 dry-run saved pipeline 還會另外保存 PipelineStore report/run\nhistory；PipelineStore history 與 invocation journal 是互補關係。\n\n```python\nread_session(action=\"search_runs\")\nread_session(action=\"search_runs\", run_status=\"partial\", history_limit=20)\nread_session(action=\"search_run\", run_id=\"...\")\nread_session(action=\"replay_search\", run_id=\"...\")\n```\n\n`replay_search` 刻意保持 read-only。它回傳精確且不含 credential 的\n`unified_search` kwargs 與 `automatic_execution=false`；agent 必須先檢查，再明確\n呼叫 `unified_search`。Pipeline replay 會包含 inline 或 `saved:<name>` argument，\n以及 `dry_run` / `stop_at`。包含 credentials 的 pipeline text 會被拒絕並記成 failed\nrun；provider key、token、cookie 與 secret 應放在 server environment\nconfiguration。因為目前沒有公開 cursor-resume input，opaque cursor/token\nprovenance 無法就地續頁，replay 會開始新的 bounded request。\n\n如果 terminal history commit 無法復原，bounded handoff 會變成\n`status=\"history_unavailable\"`，並帶有 `history_available=false`、預期 status 與\nwarning。Degraded state 會省略 inspect/replay actions，因為 durable recovery\n無法保證。\n\n`unified_search` artifacts 會使用 research envelope。建議先讀 `audit.json` 確認完整性警告，再讀 `query_strategy.json` 檢查實際搜尋策略，最後用 `results.json` / `results.toon` 取回完整結果清單。這樣不需要把長篇 article list 塞進 MCP response token，也保留可審計、可重現的搜尋紀錄。\n\nArtifact publication 與 session indexing 是兩個獨立的 atomic boundaries。Session\nreload 時，store 只會發現 session index 缺少、但結構完整且 checksum 已索引的\nmanifests，再透過 `search_run_id` 把 recovered search artifact 連回 run；只有早於該\nmetadata 的舊 artifacts 才使用保守的同 query fallback。\n\n`local_path` 與 `manifest_path` 是 MCP server host 上的路徑，預設會被遮蔽。大型 `get_fulltext` 在已有 artifact 時會先回 inline preview；完整內容請用 locator 讀取。這就是持久化 query memory：agent 可以用 artifact ID 重新打開同一份已保存的 search/fulltext output，不必重跑外部來源呼叫。全文 artifact 可能包含文章正文，保存與分享時請遵守 publisher license 與機構授權條款。\n\n## 本機 Wiki Note 匯出\n\n![匯出與本機筆記流程](images/export-notes-workflow.svg)\n\n搜尋完成後，如果使用者要留下受指引、半格式化、可被 agent 繼續編輯的檔案，使用 `save_literature_notes`。這比讓 agent 用一般 write file 自己拼 Markdown 穩定。\n\n預設呼叫：\n\n```python\nsave_literature_notes(pmids=\"last\")\n```\n\n預設 `note_format` 是 `wiki`，每篇文章會輸出一個 `.md`，包含：\n\n- YAML frontmatter：title、PMID、DOI、PMCID、journal、year、citation key、aliases、tags\n- 產生 index note 時使用 Foam-compatible wikilinks\n- wiki/Foam link target 使用 PMID、DOI、PMCID 或 fallback identifier；title 只作為 link label 與 alias\n- 回應會包含 `wiki_validation`，列出產生的 wikilinks 與 unresolved targets\n- triage 欄位：status、relevance、decision\n- summary、key findings、methods/population、limitations、follow-up questions\n- PubMed、DOI、PMC source links\n- 預設會在 notes 或 index artifacts 建立時寫出 collection-level `references.csl.json` sidecar，方便接引用管理器\n\n當 `unified_search` 回傳 PMID-backed results 時，next-tool suggestions 會主動包含：\n\n```python\nsave_literature_notes(pmids=\"last\", note_format=\"wiki\")\n```\n\n這讓 agent 能直接交接到本機 LLM wiki，不需要自己從搜尋結果發明檔名或 wikilink。\n\n支援格式：\n\n| Format | 連結樣式 | 排版 | 適合情境 |\n| --- | --- | --- | --- |\n| `wiki` | `[[stable-id|title]]` | 預設 guided literature note | Foam、Obsidian-style、一般 wiki workflow |\n| `foam` | `[[stable-id|title]]` | 與 `wiki` 相容 | 既有 Foam 使用者 |\n| `markdown` | `` `[title](note.md)` `` | 同樣 guided sections | 純 Markdown repo |\n| `medpaper` | `[[citation_key|title]]` | per-reference directory，內含 `<citation_key>.md` 與 `metadata.json` | MedPaper-style 或 Zotero Keeper-compatible reference library |\n\n本機模式的目錄解析順序：\n\n1. `output_dir`\n2. `PUBMED_NOTES_DIR`\n3. `PUBMED_WORKSPACE_DIR/references`\n4. `PUBMED_DATA_DIR/references`\n5. `~/.pubmed-search-mcp/references`\n\n認證 service caller 不會進入這套 host-path resolution。它們不能傳入 `output_dir` 或\n`template_file`；筆記必須使用內建 format，並保存在當前 principal 隔離的\n`references/` 目錄下。\n\n## 好的 Markdown 文獻筆記排版\n\n好的文獻筆記要把「可驗證書目資料」和「人/agent 的判讀」分開：\n\n```markdown\n---\ntitle: \"Article title\"\npmid: \"12345678\"\ndoi: \"10.xxxx/example\"\ncitation_key: \"smith2024_12345678\"\nsource: \"PubMed\"\nnote_format: \"wiki\"\ntags: [\"literature\", \"pubmed\"]\naliases: [\"smith2024_12345678\", \"Article title\", \"12345678\", \"Smith 2024\"]\n---\n\n# Article title\n\n## Metadata\n- PMID: [12345678](https://pubmed.ncbi.nlm.nih.gov/12345678/)\n- DOI: [10.xxxx/example](https://doi.org/10.xxxx/example)\n- Journal: Journal name\n- Year: 2024\n- Authors: Smith J; Doe J\n\n## Triage\n- Status:\n- Relevance:\n- Decision:\n\n## Summary\n-\n\n## Key Findings\n-\n\n## Methods And Population\n-\n\n## Limitations\n-\n\n## Follow Up Questions\n-\n\n## Citation\n- Smith J; Doe J. Article title. Journal name. 2024. doi:10.xxxx/example\n```\n\nfrontmatter 和 sidecar 放 verified metadata；正文區塊留給摘要、判讀、限制、後續問題。\n\n## 自訂 Template\n\n在可信任的本機模式中，使用者有自己的排版時，用 `template_file`：\n\n```python\nsave_literature_notes(\n    pmids=\"last\",\n    output_dir=\"./references\",\n    template_file=\"./reference-template.md\"\n)\n```\n\n可用 placeholder 包含 `{title}`, `{pmid}`, `{doi}`, `{pmc_id}`, `{journal}`, `{journal_abbrev}`, `{year}`, `{volume}`, `{issue}`, `{pages}`, `{authors}`, `{abstract}`, `{citation_key}`, `{reference_id}`, `{note_format}`, `{created}`, `{pubmed_url}`, `{doi_url}`, `{citation}`, `{keywords}`, `{mesh_terms}`, `{csl_json}`。\n\n認證 service 請改用內建 note format；server 會拒絕從 host filesystem 讀取任意 template。\n\n## Pipeline 與 Agent Bundle 參考文件\n\nPipeline tutorial 的正式來源是：\n\n- `docs/PIPELINE_MODE_TUTORIAL.en.md`\n- `docs/PIPELINE_MODE_TUTORIAL.md`\n\n`scripts/build_docs_site.py` 會另外同步到 `.claude/skills/pipeline-persistence/references/`，讓不會打包 `docs/site-content/` 的外部 agent bundle 或 VSIX 也能讀到。\n",
+  "quick-reference": "<!-- Generated from src/pubmed_search/presentation/mcp_server/TOOLS_INDEX.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP - Tools Index\n\nQuick reference for all 46 available MCP tools. Auto-generated from `tool_registry.py`.\n\nUse `docs/TOOLS_USAGE_GUIDE.md` for the capability-first usage manual, not just the raw inventory.\n\n---\n\n## Capability Compression\n\nThe current surface is 46 tools, but the practical comprehension model is 8 capability families.\n\n- Theoretical lower bound without removing capability: 6 multiplexed meta-tools\n- Practical minimum for human/agent understanding: 8 capability families\n- Recommended reading order: capability guide first, inventory second\n\n## 搜尋工具\n\nUnified multi-source literature search gateway\n\n| Tool | Description |\n| --- | --- |\n| `unified_search` | Unified Search - Single entry point for multi-source academic search. |\n| `unified_search_batch` | Run several unified_search query variants as one batch. |\n\n## 查詢智能\n\nMeSH expansion, agent-provided PICO handoff, and query analysis\n\n| Tool | Description |\n| --- | --- |\n| `parse_pico` | Validate agent-provided PICO elements and return a runnable search plan. |\n| `generate_search_queries` | Gather search intelligence for a topic - returns RAW MATERIALS for Agent to decide. |\n| `analyze_search_query` | Analyze a search query without executing the search. |\n\n## 文章探索\n\n相關文章、引用網路\n\n| Tool | Description |\n| --- | --- |\n| `fetch_article_details` | Fetch detailed information for one or more PubMed articles. |\n| `find_related_articles` | Find articles related to a given PubMed article. |\n| `find_citing_articles` | Find articles that cite a given PubMed article. |\n| `get_article_references` | Get the references (bibliography) of a PubMed article. |\n| `get_citation_metrics` | Get citation metrics from NIH iCite for articles. |\n\n## 全文工具\n\n全文取得與文本挖掘\n\n| Tool | Description |\n| --- | --- |\n| `get_fulltext` | Enhanced multi-source fulltext retrieval. |\n| `get_text_mined_terms` | Get text-mined annotations from Europe PMC. |\n\n## NCBI 延伸\n\nGene, PubChem, ClinVar\n\n| Tool | Description |\n| --- | --- |\n| `search_gene` | Search NCBI Gene database for gene information. |\n| `get_gene_details` | Get detailed information about a gene by NCBI Gene ID. |\n| `get_gene_literature` | Get PubMed articles linked to a gene. |\n| `search_compound` | Search PubChem for chemical compounds. |\n| `get_compound_details` | Get detailed information about a compound by PubChem CID. |\n| `get_compound_literature` | Get PubMed articles linked to a compound. |\n| `search_clinvar` | Search ClinVar for clinical variants. |\n\n## 引用網絡\n\n引用樹建構與探索\n\n| Tool | Description |\n| --- | --- |\n| `build_citation_tree` | Build a citation tree (network) from a single article. |\n\n## 匯出工具\n\n引用格式匯出與本機文獻筆記保存\n\n| Tool | Description |\n| --- | --- |\n| `prepare_export` | Export citations to reference manager formats. |\n| `save_literature_notes` | Save searched articles as guided local wiki/Foam/Markdown notes. |\n\n## Session 管理\n\nPMID 暫存與歷史\n\n| Tool | Description |\n| --- | --- |\n| `read_session` | Read session data through a single facade. |\n| `get_session_pmids` | 取得 session 中暫存的 PMID 列表。 |\n| `get_cached_article` | 從 session 快取取得文章詳情。 |\n| `get_session_summary` | 取得當前 session 的摘要資訊。 |\n| `get_session_log` | 取得當前 session 的 activity log 與搜尋歷史摘要。 |\n\n## 機構訂閱\n\nOpenURL Link Resolver\n\n| Tool | Description |\n| --- | --- |\n| `configure_institutional_access` | Configure your institution's link resolver for full-text access. |\n| `get_institutional_link` | Generate institutional access link (OpenURL) for an article. |\n| `list_resolver_presets` | List available institutional link resolver presets. |\n| `test_institutional_access` | Test your institutional link resolver configuration. |\n| `diagnose_institutional_access` | Diagnose why institutional fulltext access succeeds or fails for an article. |\n\n## 視覺搜索\n\n圖片分析與搜索 (實驗性)\n\n| Tool | Description |\n| --- | --- |\n| `analyze_figure_for_search` | Analyze a scientific figure or image for literature search. |\n\n## ICD 轉換\n\nICD-10 與 MeSH 轉換\n\n| Tool | Description |\n| --- | --- |\n| `convert_icd_mesh` | Convert between ICD codes and MeSH terms (bidirectional). |\n\n## 引用驗證\n\nReference list verification with PubMed evidence\n\n| Tool | Description |\n| --- | --- |\n| `verify_reference_list` | Verify a plain-text reference list against PubMed evidence. |\n\n## 圖表擷取\n\n文章圖表與視覺資料擷取\n\n| Tool | Description |\n| --- | --- |\n| `get_article_figures` | Get structured figure metadata (label, caption, image URL) and PDF links from a PMC Open Access arti |\n\n## 研究編年史\n\n研究演化脈絡：持久化、可版本比對、證據支撐的時序主軸與分支投影\n\n| Tool | Description |\n| --- | --- |\n| `build_research_chronicle` | Build a persisted, versioned, evidence-backed Research Chronicle. |\n| `read_research_chronicle` | Read stored Research Chronicles: load, list, diff, narrate, analyze, compare. |\n\n## 圖片搜尋\n\n生物醫學圖片搜尋\n\n| Tool | Description |\n| --- | --- |\n| `search_biomedical_images` | Search biomedical images across Open-i and Europe PMC. |\n\n## Pipeline 管理\n\nPipeline 持久化、載入、排程\n\n| Tool | Description |\n| --- | --- |\n| `manage_pipeline` | Manage saved pipelines through a single facade. |\n| `save_pipeline` | Save a pipeline configuration for later reuse. |\n| `list_pipelines` | List all saved pipeline configurations. |\n| `load_pipeline` | Load a pipeline configuration for review or editing. |\n| `delete_pipeline` | Delete a saved pipeline configuration and its execution history. |\n| `get_pipeline_history` | Get execution history for a saved pipeline. |\n| `schedule_pipeline` | Schedule a saved pipeline for periodic execution. |\n\n---\n\n## 檔案結構\n\n```text\nmcp_server/\n├── server.py           # Server 創建與配置\n├── instructions.py     # AI Agent 使用說明\n├── tool_registry.py    # 工具註冊中心\n├── session_tools.py    # Session 管理工具\n├── resources.py        # MCP Resources\n├── prompts.py          # MCP Prompts\n├── TOOLS_INDEX.md      # 本檔案 (工具索引)\n└── tools/              # 工具實作\n    ├── __init__.py     # 統一入口\n    ├── _common.py      # 共用工具函數\n    ├── unified.py      # unified_search\n    ├── discovery.py    # 搜尋與探索\n    ├── strategy.py     # MeSH/查詢策略\n    ├── pico.py         # Agent-provided PICO handoff\n    ├── export.py       # 匯出工具\n    ├── europe_pmc.py   # Europe PMC 全文\n    ├── core.py         # CORE 開放取用\n    ├── ncbi_extended.py # Gene/PubChem/ClinVar\n    ├── citation_tree.py # 引用網路\n    ├── openurl.py      # 機構訂閱\n    ├── vision_search.py # 視覺搜索\n    └── icd.py          # ICD 轉換工具\n```\n\n---\n\n*Total: 46 tools in 16 categories*\n*Auto-generated by `scripts/count_mcp_tools.py --update-docs`*\n",
   "source-contracts": "<!-- Generated from docs/SOURCE_CONTRACTS.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# Source Contracts\n\nContract reference for every upstream corpus, resolver, and access layer used by PubMed Search MCP.\n\nThis document answers seven operational questions for each source:\n\n1. What role does the source play in the product?\n2. What repo-side rate policy do we enforce in code?\n3. Which credential is required or optional?\n4. Whether the source gives direct full text, figure access, or only metadata.\n5. Whether licensing is uniform or article-level.\n6. Whether provenance is direct or indirect.\n7. What an agent should and should not promise to a user.\n\n## Contract Semantics\n\n![Source contracts and provenance map](images/source-contracts-provenance-map.svg)\n\n| Term | Meaning in this repo |\n| ---- | -------------------- |\n| Direct provenance | The API is the primary host or canonical service for the returned object type. |\n| Indirect provenance | The API is an aggregator, mirror, resolver, or metadata graph that points to upstream hosts. |\n| Full text access | The source can return article body text or a direct OA/fulltext link, not just metadata. |\n| Figure access | The source can return structured figure metadata or image URLs. |\n| License posture | Whether the source exposes a stable license model or only passes through article-level licenses. |\n\n## Unified Search Broker\n\n`unified_search` is the broker boundary for literature discovery. The broker is\nan in-process orchestration layer, not another upstream proxy: it validates one\nrequest, selects registered adapters, executes independent providers in\nparallel, and returns one provenance-preserving result envelope.\n\n```mermaid\nflowchart LR\n    request[\"Normalize and validate request\"] --> planner[\"Registry-backed source planner\"]\n    planner --> scheduler[\"Concurrent broker scheduler\"]\n    scheduler --> pubmed[\"PubMed\"]\n    scheduler --> epmc[\"Europe PMC\"]\n    scheduler --> knowledge_graph[\"OpenAlex and Semantic Scholar\"]\n    scheduler --> oa[\"CORE and preprint servers\"]\n    scheduler --> licensed[\"Scopus and Web of Science<br/>explicit opt-in\"]\n    pubmed --> envelope[\"SourceAdapterResult envelopes\"]\n    epmc --> envelope\n    knowledge_graph --> envelope\n    oa --> envelope\n    licensed --> envelope\n    envelope --> merge[\"Identifier-first deduplication and ranking\"]\n    merge --> response[\"Results, provenance, counts, and partial failures\"]\n```\n\nThe broker has six explicit stages:\n\n1. **Normalize and validate.** Parse query options, year bounds, result limits,\n   source expressions, and disabled-source policy before any network call.\n   Invalid limits, malformed/unknown filter or option tokens, reversed/out-of-\n   range years, and unsupported output/ranking modes fail closed; the broker\n   never silently broadens a request by dropping a typo.\n2. **Plan.** Resolve `auto`, `all`, explicit lists, exclusions such as\n   `auto,-semantic_scholar`, and the optional preprint expansion through the\n   central source registry. Enrichment-only sources cannot satisfy a primary\n   search by themselves.\n3. **Schedule.** Fan out independent adapters concurrently while retaining a\n   bounded per-source deadline. In deep mode, one public per-source `limit` is\n   allocated across all strategies for that source, with global and per-source\n   concurrency guards; it is not multiplied by the number of strategies. A\n   slow or failed provider cannot discard good results returned by another\n   provider.\n4. **Protect providers.** Reuse a process-wide conservative rate budget per\n   upstream service, then apply source-specific concurrency, retry/backoff,\n   timeout, and circuit-breaker policy. Creating another client instance never\n   creates another upstream quota.\n5. **Normalize and merge.** Convert every adapter outcome into the same\n   `ok` / `empty` / `partial` / `error` contract. Deduplicate by DOI, PMID,\n   PMCID, OpenAlex, Semantic Scholar, CORE, or arXiv identifiers before using a\n   normalized-title fallback.\n6. **Report and checkpoint.** Return ranked articles together with\n   queried/responded sources, per-source counts, retryable error metadata,\n   provenance, reproducibility diagnostics, structured bounded-search status,\n   a search-run recovery handoff, and durable artifact hints when the caller is\n   allowed to write them.\n\n### Capability and data-plane model\n\nThe broker does not treat every provider as an interchangeable HTTP search\nbox. The current machine-readable `SourceCapabilities` manifest declares\nsearch modes, pagination types, maximum page and per-mode sizes, batch limit,\ncounts/provenance support, and operator data-plane status. Access tier remains\non `SourceDefinition`; the stricter ClinicalKey retention/operation allowlist\nuses a separate application governance policy. A unified machine-readable\nrights/retention/health/cost schema remains follow-up work and is not implied\nby the prose table below. A provider-neutral plan is compiled into physical\nqueries only after the implemented capabilities are validated.\n\n```mermaid\nflowchart LR\n    intent[Provider-neutral query intent] --> capability[Source capability + governance policy]\n    capability --> compiler[Provider query compiler]\n    compiler --> live[Bounded live API pages]\n    compiler --> local[Operator-managed local data plane]\n    live --> page[Source search page + usage/provenance]\n    local --> page\n    page --> evidence[UnifiedArticle / graph edge / Chronicle evidence]\n```\n\nUnsupported filters must produce a structured warning or fail the requested\nmode. They are never silently discarded. Full-corpus ingestion is an operator\njob with manifest/checkpoint/atomic-publish semantics, not work performed\ninside an MCP request.\n\nThe manifest currently exposes these stable keys:\n\n| Key | Meaning |\n| --- | --- |\n| `search_modes` | `keyword`, `relevance`, `semantic`, `systematic`, or `enrichment` |\n| `pagination` | `page`, `offset`, `cursor`, `token`, or `none` |\n| `max_page_size` / `mode_limits` | Provider-side request bounds, not a promise that one MCP response materializes that many rows |\n| `batch_limit` | Safe provider batch maximum when implemented |\n| `operator_data_plane` | `none`, `metadata_only`, or `provider_available`; the latter two do not prove a local index exists |\n| `supports_counts` / `supports_provenance` | Whether the adapter contract can preserve these diagnostics |\n\n### Retrieval policies on the single search facade\n\n`unified_search` accepts three provider-neutral policies:\n\n| Request | Planner behavior | Provider-specific execution |\n| --- | --- | --- |\n| default | Normal auto/explicit/all source plan | Keyword/relevance adapters |\n| `options=\"native_semantic\"` | Explicit capability mismatch fails before I/O; auto keeps capable sources | OpenAlex `search.semantic`, at most 50 |\n| `options=\"systematic\"` | Selects sources declaring systematic support; disables multi-strategy deep expansion | PubMed executes the supplied Boolean strategy; OpenAlex uses a bounded cursor; Semantic Scholar uses bounded bulk |\n\nThe two explicit modes are mutually exclusive. The public per-source `limit`\nis capped at 100, so systematic mode is deterministic and bounded, not a\nfull-corpus or systematic-review completeness claim. Every adapter outcome\ncontributes `source_metadata`: `requested_mode`, `provider_mode`,\n`total_available`, canonical/compiled query, continuation availability,\nwarnings, and safe cost/rate fields where the upstream returns them. Opaque\ncursor/token values are also retained when a provider supplies them. The same\nmetadata is retained in `query_strategy.json` and artifact summaries, but the\npublic facade does not yet accept a continuation/cursor-resume input.\nEurope PMC, Scopus, and Web of Science currently expose one-page keyword\nadapters only; an explicit systematic request naming one of them fails before\nI/O rather than pretending that one page is systematic coverage. Their keyword\nartifacts still retain provider counts when available and the exact compiled\nphysical query (`TITLE-ABS-KEY(...)` or `TS=(...)` for licensed connectors).\nAuto-mode PubTator terminology lookups use an in-memory TTL cache whose keys\nare opaque and tenant-scoped; raw candidate terms and principals are never\nstored in cache keys. Explicit native-semantic/systematic modes do not call\nPubTator at all.\n\n### Source-selection invariants\n\n- An explicit source selection is a contract. `sources=\"openalex\"` never\n  silently substitutes PubMed when OpenAlex returns zero records.\n- Auto-relaxation may broaden a PubMed query only when PubMed was part of the\n  plan. It reuses the successful relaxed response instead of issuing the same\n  PubMed request twice.\n- `PUBMED_SEARCH_DISABLED_SOURCES` is a kill switch for explicit, automatic,\n  `all`, and `options=\"preprints\"` selection paths.\n- An empty successful response is reported as `empty`, not as an outage. A\n  provider timeout, transport failure, exhausted 429 response, or invalid\n  adapter result remains source-scoped so the overall response can be\n  `partial`.\n- Crossref and other enrichment adapters run only after primary discovery and\n  cannot be selected as the sole search corpus.\n\n### Structured outcome and durable recovery contract\n\nNormal JSON and TOON result envelopes expose a `search_status` object intended\nfor agent routing. It distinguishes `completed`, valid `empty`, `partial`, and\nfailed federation outcomes, while declaring `bounded=true` and\n`exhaustive=false`. It also includes returned count, attempted/successful/\nfailed/retryable source sets, continuation-capable sources, and sources whose\ncompleteness remains unknown. Source-scoped failures remain in `source_errors`;\nrendered response length is not an outcome signal.\n\nAt the managed MCP boundary, every `unified_search` invocation gets a\ntenant-scoped `search-run/v1` envelope: normal retrieval, validation/planning\nfailure, inline pipeline, `saved:<name>`, and pipeline `dry_run=true`. The stable\nrun ID is published before provider I/O or a terminal validation response, and\nthe journal checkpoints:\n\n1. credential-sanitized replay kwargs and request, including `pipeline`,\n   `dry_run`, and `stop_at` where used;\n2. the resolved provider plan, or a bounded hash/length/mode snapshot for a\n   pipeline plan, before execution;\n3. per-source logical/physical query provenance or per-pipeline-step status,\n   counts, warnings, and safe failure metadata;\n4. compact result references and the artifact locator when applicable at\n   terminal commit.\n\nTerminal journal states are `completed`, `partial`, `failed`, `cancelled`, and\nrestart-recovered `interrupted`. A valid empty response is a `completed` journal\nrun whose `search_status.state` is `empty`. Malformed requests are retained as\nfailed validation runs rather than disappearing. On restart, an active\n`started` / `planned` / `running` run is marked `interrupted` once so an agent\ncan distinguish process loss from an upstream empty result. A non-dry-run saved\npipeline additionally writes the normal PipelineStore report/run history;\nPipelineStore history describes the saved workflow over time, while the search\njournal describes this particular `unified_search` invocation.\n\nCredential-bearing pipeline YAML/JSON is rejected before execution and the\nattempt is terminalized as a failed search run. Keys, tokens, cookies,\npasswords, and secrets belong in server configuration, not pipeline text.\n\nAgents recover state through the existing `read_session` facade—no second\ngeneric search tool is introduced:\n\n```text\nread_session(action=\"search_runs\", run_status=\"partial\")\nread_session(action=\"search_run\", run_id=\"...\")\nread_session(action=\"replay_search\", run_id=\"...\")\n```\n\n`replay_search` returns exact allowed `unified_search` kwargs after recursive\ncredential redaction and sets `automatic_execution=false`. It does not call an\nupstream provider; an agent must explicitly submit a new search. Because the\ncurrent facade has no public cursor-resume parameter, stored cursor/token\nprovenance supports audit but not in-place page continuation.\n\nIf the terminal journal write fails and cannot be read back or converted to a\ndurable failure, the response uses the explicit degraded handoff\n`status=\"history_unavailable\"`, `history_available=false`, intended status, and\na warning. It omits inspect/replay actions because recovery is not guaranteed;\nthis storage state does not retroactively invalidate already returned evidence.\n\nArtifact publication is atomic but precedes session-index persistence. During\nsession reload, `ArtifactStore.discover()` accepts only structurally complete,\nchecksum-indexed manifests under the expected tenant/session subtree, restores\npublished-but-unindexed artifacts, and relinks a search artifact by\n`search_run_id`. A conservative exact-query fallback is limited to older\nartifacts without that identifier.\n\n### Adding another API\n\nA new adapter should be admitted only when it adds a distinct corpus,\nidentifier authority, or legal-access path. It must register aliases and\ncapabilities, declare credentials and a conservative upstream policy, emit the\nshared result/error envelope, preserve canonical identifiers and licenses, and\nship contract, timeout, 429, empty-result, deduplication, and partial-failure\ntests. This prevents a larger source list from merely multiplying duplicate\nrecords and rate-limit failures.\n\n## Search And Discovery Sources\n\n| Source | Product role | Repo-side rate policy | Credentials | Full text / figures | License posture | Indirect provenance |\n| ------ | ------------ | --------------------- | ----------- | ------------------- | --------------- | ------------------- |\n| PubMed / NCBI Entrez | Primary biomedical search, identifiers, abstracts, citation links | 0.34 s between requests without key, 0.1 s with key in Entrez base client | `NCBI_EMAIL` required by policy, `NCBI_API_KEY` optional | Metadata and abstracts direct; full text is indirect via PMC, DOI, LinkOut, or downstream resolvers | No single article-content license; metadata and abstract visibility follow NCBI plus publisher rights | Low for PubMed records themselves; higher once you pivot to PMC/LinkOut for content |\n| Europe PMC | Search, OA/fulltext discovery, fullTextXML, text-mined terms | 0.1 s minimum interval | No API key; email is used for polite identification | Direct OA fullTextXML for supported records; can surface PMC-backed figures/full text | Article-level OA licenses vary by record | Yes. Europe PMC aggregates PubMed plus partner sources and mirrors OA content |\n| OpenAlex | Broad discovery, OA indicators, entity graph, inferred topics/keywords, journal context | Keyword client uses a shared budget; native semantic mode has a separate 1 RPS contract; cursor traversal is bounded by pages/results/time/cost | Casual anonymous use; `OPENALEX_API_KEY` raises the credit budget. Actual limits/cost come from response headers/meta | No hosted full text; only OA location hints and metadata | Metadata is CC0; linked full text/figures retain their original rights | Yes. OpenAlex aggregates and infers graph metadata; semantic/topics must retain provider provenance |\n| Semantic Scholar | Cross-domain relevance/bulk discovery, batch enrichment, citation graph, OA PDF hints; release/diff manifests live in the operator data plane | Authenticated keys begin conservatively at one shared request/second; unauthenticated calls use an unstable shared pool; exhausted 429s enter cooldown | `S2_API_KEY` or `SEMANTIC_SCHOLAR_API_KEY` optional for live calls and required for dataset partition/diff URLs | No hosted full text in live search; may expose `openAccessPdf` hints. Dataset content rights are release/record specific | Preserve each release README/license; linked article/full-text rights do not become uniform | Yes. Metadata, machine annotations and OA hints are aggregated or inferred |\n| CORE | Large OA aggregator for repositories and full-text-enabled outputs | 6.0 s without key, 2.5 s with key | `CORE_API_KEY` optional but strongly recommended | Can return OA records and full-text-backed outputs when repositories expose them | Repository-specific; no single global content license | Yes. CORE aggregates thousands of repositories and providers |\n| Crossref | DOI registry, title lookup, funder metadata, references, enrichment | 0.05 s minimum interval | `CROSSREF_EMAIL` optional but recommended for polite pool | No direct full text; metadata and DOI resolution only | Metadata only; full-text rights remain with publisher or OA host | Yes. Crossref points to publisher and registry records rather than hosting article content |\n| arXiv | Preprint discovery across quantitative biology, statistics, computing, and adjacent fields | 3.0 s minimum interval and one in-flight request | No API key | Abstract metadata plus direct arXiv PDF links | Record-level arXiv license; do not infer peer review or downstream reuse rights | Low for arXiv records; published-version matching is an indirect DOI/title link |\n| medRxiv / bioRxiv | Medical and biological preprint discovery with local filtering of date-based API results | Shared provider budget and a 20 s broker-side source deadline; no fixed repo interval | No API key | Abstract metadata and preprint URLs/PDF links where supplied | Article-level preprint license; not evidence of peer review | Low for native preprint records; published-version matching is indirect |\n| Scopus | Licensed bibliographic and citation discovery; default off and never silently added to `auto` | 0.2 s minimum interval; maximum 25 records per adapter request | `SCOPUS_ENABLED=true` plus `SCOPUS_API_KEY`; optional institutional token | Metadata, identifiers, citation fields, and links; no repository-hosted article body | Elsevier API/subscription terms and the caller's institutional entitlements | Low for the Scopus index record; linked publisher content remains indirect |\n| Web of Science | Licensed bibliographic and citation discovery; default off and never silently added to `auto` | 0.2 s minimum interval; maximum 25 records per adapter request | `WEB_OF_SCIENCE_ENABLED=true` plus `WEB_OF_SCIENCE_API_KEY` | Metadata, identifiers, citation fields, and links; no repository-hosted article body | Clarivate API/subscription terms and the caller's institutional entitlements | Low for the Web of Science record; linked publisher content remains indirect |\n| NCBI Extended (Gene, PubChem, ClinVar) | Structured gene, compound, and variant data outside PubMed | 0.34 s without key, 0.1 s with key | `NCBI_EMAIL` required by policy, `NCBI_API_KEY` optional | No article full text; structured database records only | Database-record specific; not a literature full-text source | Low. These are canonical NCBI databases, but not direct article-body providers |\n\n## OA Resolution, Full Text, And Visual Sources\n\n| Source | Product role | Repo-side rate policy | Credentials | Full text / figures | License posture | Indirect provenance |\n| ------ | ------------ | --------------------- | ----------- | ------------------- | --------------- | ------------------- |\n| Unpaywall | Legal OA resolver used for enrichment and download fallback | 0.1 s minimum interval | `UNPAYWALL_EMAIL` expected | No hosted full text; returns legal OA locations and license hints | License comes from the chosen OA location | Yes. Unpaywall is a resolver over repositories and publisher OA endpoints |\n| PMC Open Access / FigureClient | Structured figure extraction and PMC-backed visual retrieval | 0.2 s minimum interval in figure client | No dedicated key | Direct figure metadata and image URLs only for PMC Open Access-compatible articles | Article-level OA license; figure reuse depends on the article's license | Mixed. FigureClient uses Europe PMC XML, PMC efetch XML, and PMC BioC fallback |\n| FulltextDownloader chain | PDF/fulltext link collection and fallback routing | Concurrency-limited downloader with per-source fallbacks; no single shared interval | No single key; downstream keys come from CORE, Unpaywall, and source-specific services | Can return direct PDF links, text, or structured sections depending on the source | License varies by the final OA host | Yes. This layer is intentionally indirect and should cite the final host it selected |\n| Open-i | Biomedical image discovery across image-bearing biomedical articles | 1.0 s minimum interval | No API key | Image metadata and URLs; not general article full text | Supports license filtering by CC-style Open-i license codes | Yes. Open-i is an image-focused aggregator rather than the canonical publisher host |\n| ClinicalTrials.gov | Explicit `options=\"trials\"` Markdown adjunct; never an implicit literature-search leg | One bounded request, three displayed records, 0.5 s prefetch budget | No key | Structured registry records only; no article full text | Registry data, not article-license content | Low. Canonical trial registry, but not a paper/full-text source; query/outcome are stored separately under artifact `adjunct_queries` |\n| OpenURL resolver | Institutional subscription handoff | No outbound fetch in resolver builder itself | `OPENURL_RESOLVER` or preset config | Subscription access handoff only; not a content corpus | Governed by your institution's subscription agreements | Yes. This is a redirect/access layer, not a source of record |\n\n## Licensed AI Evidence Adapters\n\n| Source | Runtime role | Enablement | Retention | MCP/search posture |\n| --- | --- | --- | --- | --- |\n| ClinicalKey AI | Default-off application/data-plane contract adapter for licensed citation metadata | Explicit enabled, entitlement-confirmed, contract-acknowledged flags plus operator-held OAuth client credentials | Ephemeral; metadata allowlist only. Raw chunks, summaries, tokens and licensed payloads never enter session/cache/artifacts/exports | Not registered as a source or tool. Differential diagnosis, conversation and stateful article APIs are excluded. See [ClinicalKey AI boundary](#/clinicalkey-ai) |\n\n## Contract Rules For Agents\n\n1. Treat PubMed, Europe PMC, and NCBI Extended as canonical for their native record types, but do not imply full text unless the workflow pivots into PMC, OA links, or an institutional resolver.\n2. Treat OpenAlex, Semantic Scholar, CORE, Crossref, and Unpaywall as discovery, enrichment, or access-routing layers. When they surface a link, preserve the upstream host in the final answer.\n3. Treat figure extraction as PMC Open Access scoped. If a PMID has no resolvable PMCID, do not promise figure extraction.\n4. Treat license fields as article-level unless a source has an explicit platform-level rule. OA status does not automatically mean reusable figures.\n5. Treat `optional key` as throughput control, not an authorization promise. A key may improve rate limits without changing rights.\n6. When a source is indirect, include both the surfacing source and the canonical host when presenting evidence trails or download links.\n7. Treat machine-inferred topics, TLDRs, semantic similarity, citation intent,\n   and AI-curated citations as provider annotations, not as author claims or a\n   substitute for the original paper.\n8. Never route licensed/clinical AI content into persistence, export, training,\n   embeddings, or multi-user access merely because an API credential exists.\n\n## Practical Examples\n\n| Need | Prefer | Why |\n| ---- | ------ | --- |\n| Highest-trust biomedical identifiers | PubMed / NCBI Entrez | Canonical PMID-first workflow |\n| Structured OA XML | Europe PMC | Direct fullTextXML support |\n| OA figure extraction | PMC Open Access via FigureClient | Direct figure metadata and image URLs |\n| Broad OA corpus expansion | CORE or OpenAlex | Aggregated discovery beyond PubMed |\n| Legal OA link resolution | Unpaywall | Best OA location plus license hints |\n| DOI metadata and references | Crossref | Canonical DOI registry enrichment |\n| Institutional subscription handoff | OpenURL | Access layer, not corpus |\n",
   "semantic-scholar-api": "<!-- Generated from docs/SEMANTIC_SCHOLAR_API.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# Semantic Scholar：Live Search 與 Dataset Data Plane\n\n> Verified against the official service on **2026-08-14**. Semantic Scholar is\n> an internal provider of `unified_search`; it is not a separate MCP search\n> tool.\n\n## 決策摘要\n\n本專案把 Semantic Scholar 分成兩條彼此隔離的路徑：\n\n1. **Live query plane**：Graph API 的 relevance search、bounded bulk search、\n   batch enrichment、citations、references 與 recommendations。\n2. **Operator data plane**：Datasets API 的 release catalog、manifest 與\n   incremental diff。大型 partition 不會在 MCP request 中下載。\n\nMCP 的通用文獻搜尋入口仍只有 `unified_search`。`semantic_scholar` 是\nbroker 內部 source key；不得新增 `search_semantic_scholar`、\n`dataset_search` 或其他 provider-shaped MCP tool。\n\n### 本輪 runtime 狀態\n\n| 能力 | 已落地行為 | 公開邊界 |\n| --- | --- | --- |\n| Relevance | `SourceSearchPage` 保留 raw DTO、`total`、offset/`next` 與 warnings，之後只 map 一次 | `unified_search(sources=\"semantic_scholar\")` |\n| Systematic | `options=\"systematic\"` 將一般 Boolean 的 `AND` / `OR` / `NOT` 編譯成 S2 bulk `+` / `|` / `-`，保留 quoted phrase 與 logical/physical query | 同一個 `unified_search`；public `limit <= 100` |\n| Batch | client 支援最多 500 個 paper IDs，保留 response 順序與 null slots | infrastructure/application enrichment capability；不是 MCP tool |\n| Dataset metadata | 可列 release、讀 release/dataset/diff manifest；signed file URLs 不出現在 repr/error | operator-side metadata client；不下載 partition、沒有 local index |\n\nS2 bulk compiler 遇到 PubMed field tag（例如 `[Title/Abstract]`）、不平衡引號或\n括號會在 network call 前 fail closed。它不會猜測無法等價轉換的 provider syntax。\n一般 `unified_search` 的 public limit 上限是 100；Graph API bulk 的單頁 1,000\n與大型搜尋空間是 provider capability，不會自動放大一次 MCP 回應。\n\n## 官方契約\n\n- [API tutorial](https://www.semanticscholar.org/product/api/tutorial)\n- [API overview and key request](https://www.semanticscholar.org/product/api)\n- [Graph API OpenAPI](https://api.semanticscholar.org/graph/v1/swagger.json)\n- [Datasets API](https://api.semanticscholar.org/api-docs/datasets)\n- [API licence](https://www.semanticscholar.org/product/api/license)\n- [Dataset licence surface](https://api.semanticscholar.org/license/)\n\n官方服務可能在文件更新後調整 quota、release 或資料集清單。程式應依\nresponse、manifest 與 license metadata 做決策，不把本頁的觀察值當永久 SLA。\n\n## Live query plane\n\n### Relevance search\n\n`GET /graph/v1/paper/search` 適合一般自然語言檢索：\n\n- 單頁 `limit <= 100`\n- offset 視窗最多 1,000 筆\n- plain-text relevance query；不要把 provider-specific Boolean syntax 假設成\n  普通 search 的共同語法\n- 只請求必要 `fields`，避免 10 MB response 上限與 token 浪費\n- envelope 應保存 `total`、`offset`、`next`，不能在正規化時丟棄\n\n### Bulk search\n\n`GET /graph/v1/paper/search/bulk` 適合由 broker 判定的 bounded systematic\nretrieval：\n\n- 支援 Boolean、phrase、wildcard、fuzzy/proximity 等 bulk syntax\n- token pagination，單頁最多 1,000 筆\n- 官方搜尋空間上限很大，不代表本專案可以無界擷取\n- broker 必須同時施加 `max_results`、`max_pages`、time budget 與 repeated-token\n  防護\n- systematic/reproducible plan 優先使用 deterministic sort，並保存 logical\n  query、compiled physical query 與 page token provenance\n\nBulk search 是 `unified_search` 的內部 execution mode，不是新的 tool。\n\n實際呼叫方式：\n\n```python\nunified_search(\n    query='melanoma AND (immunotherapy OR \"targeted therapy\") NOT review',\n    sources=\"semantic_scholar\",\n    options=\"systematic\",\n    limit=100,\n    output_format=\"json\",\n)\n```\n\nStructured output 的 `source_metadata.semantic_scholar` 會標示\n`requested_mode=\"systematic\"`、`provider_mode=\"bulk\"`、logical/physical\nquery、continuation 是否可用、bounded/pages/sort 與 warnings。Continuation\n目前是 audit metadata，不是另一個公開 paging tool。\n\n### Batch enrichment\n\n`POST /graph/v1/paper/batch` 每次最多 500 個 identifiers。適合在跨來源去重後\n補齊 S2 ID、citation metrics 或 OA hints，避免 N+1 singleton requests。partial\n或 missing IDs 必須保留對位結果，不可把資料缺口當成整批失敗。\n\n### Citation graph\n\nCitations/references 可補 `contexts`、`intents` 與 `isInfluential`。這些欄位是\nprovider annotations，不是原論文的作者主張；寫入 Research Chronicle 或\ncitation graph 時要保留：\n\n- provider 與 endpoint\n- fetched timestamp\n- source/target paper identifiers\n- annotation type\n- 缺失或 publisher elision 的狀態\n\n## Rate limit 與 resilience\n\n- 無 key 請求使用共享池，可能在低流量時仍收到 429；它不是可靠 SLA。\n- 新 API key 通常從跨 endpoints 合計約 1 request/second 起步，實際 grant 以\n  帳號設定與 response 為準。\n- `S2_API_KEY` 與 `SEMANTIC_SCHOLAR_API_KEY` 都可設定；只以\n  `x-api-key` header 傳送，不可出現在 URL、log、artifact 或 error detail。\n- 所有 client instances 共用同一 upstream budget；429 尊重 `Retry-After`，\n  exhausted retry 要進 cooldown，避免 parallel retry storm。\n- live provider 失敗時 `unified_search` 應回 structured source warning，而不是\n  把 mapper exception 偽裝成成功的零結果。\n\n## Dataset data plane\n\nDatasets API 用於可重現的大型本地資料流程，不用來直接回答 MCP request。\n\n### Release 與 manifest\n\n- release catalog 與 release metadata 可公開讀取\n- partition 的 temporary download URLs 與 diffs 需要有效 `x-api-key`\n- 每次 ingestion 保存 release ID、dataset name、原始 README/license URL、\n  manifest hash 與接受時間\n- release 頻率與 dataset 規模只視為觀察值，不硬編成 SLA\n\n常見 dataset 包含 papers、abstracts、authors、citations、paper IDs、venues、\nSPECTER embeddings、S2ORC 與 TLDR；實際清單以該 release manifest 為準。\n\n### Incremental diff\n\n`/datasets/v1/diffs/{start}/to/{end}/{dataset}` 的語意是：\n\n- update records 依 primary key upsert/replace\n- delete records 移除\n- 逐 release transactional apply\n- 成功 publish index 後才 advance checkpoint\n- presigned URL 過期時重取 manifest，不把 URL 當持久 identifier\n\n### 大檔安全\n\n- JSON/JSONL partition 必須 streaming decode，不可整檔載入記憶體\n- 下載前做 disk preflight，使用高 entropy staging directory\n- 驗證 hash/size 後 atomic publish；失敗時舊 index 仍可讀\n- 預設只規劃 selective biomedical profile；S2ORC、全文與億級 embeddings 全部\n  opt-in\n- Dataset metadata 的授權與底層論文／全文權利分開記錄；不得把 dataset access\n  推論成所有 content 可任意再散布\n\n上述下載、checkpoint、atomic publish 與 selective local profile 是下一階段\noperator ingestion contract；本輪只完成 metadata-only client。不得把\n`operator_data_plane=\"metadata_only\"` 解讀成已經存在可供搜尋的 local S2 index。\n\n## 正規化邊界\n\nProvider payload 只正規化一次：\n\n```text\nofficial response DTO\n  -> source response envelope\n  -> deterministic provider mapper\n  -> UnifiedArticle / citation edge\n  -> aggregation, ranking, Chronicle\n```\n\nClient 不應先改成 PubMed-like dictionary，再交給期待原生 S2 schema 的 mapper。\nEnvelope 至少要保留：\n\n- `items`\n- `total`\n- `next_token` / `offset`\n- query mode 與 compiled query\n- access path (`live_api` / future local index)\n- warnings、usage 與 fetched timestamp\n\n目前共用 `SourceSearchPage` 已落地 `items`、`total`、continuation、\nquery/mode、cost、warnings 與 metadata；完整 usage timestamp/local snapshot\nreference 仍屬後續一致化項目。\n\n## Data rights 與 evidence semantics\n\n- Semantic Scholar 提供 metadata、graph annotations 與 OA hints；OA URL 的實際\n  license 仍取決於最終 host。\n- TLDR 是 machine-generated，不能當原文 evidence。\n- SPECTER embeddings 適合 candidate retrieval，不是 factual evidence。\n- S2ORC/full text 必須依 release 與原始文章權利處理。\n- final answer 應引用原始論文；不要把 provider summary 當可替代的學術引用。\n\n## 測試契約\n\nDeterministic tests 必須涵蓋：\n\n- runtime search tool group exact 等於 `['unified_search']`\n- raw S2 fixture 經 client、runner、mapper 後保留 S2 ID、authors、DOI/PMID、OA\n  與 citation metrics\n- relevance limit/total/next；bulk token termination、repeat detection 與 budgets\n- batch 500 boundary、partial IDs\n- dataset release/manifest/diff auth、schema drift 與 checkpoint replay\n- 429 cooldown、timeout、5xx retry/circuit breaker\n- secret redaction 與 source failure 不被轉成「成功空集合」\n\nGated live smoke 只能取少量 results 或只讀 release catalog；一般 CI 不下載 dataset partition。\n",
   "openalex-api": "<!-- Generated from docs/OPENALEX_API.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# OpenAlex：Capability-aware Search、Cursor 與 Snapshot\n\n> Verified against the official service on **2026-08-14**. OpenAlex is an\n> internal source of `unified_search`; it is not a separate MCP search tool.\n\n## 決策摘要\n\nOpenAlex 在本專案有三種不同尺度：\n\n1. **Keyword API**：一般跨領域 discovery。\n2. **Native semantic API**：使用者或 planner 明確需要語意檢索時的 bounded mode。\n3. **Snapshot/sync data plane**：operator 管理的大型本地資料流程。\n\nCursor、semantic 與 snapshot 都是 broker/application capability，不新增\n`search_openalex`、`semantic_search` 或 `snapshot_search` MCP tool；通用文獻搜尋\n仍只有 `unified_search`。\n\n### 本輪 runtime 狀態\n\n| 能力 | 已落地行為 | 公開邊界 |\n| --- | --- | --- |\n| Keyword | raw works DTO 經 `SourceSearchPage` 只 map 一次；`per_page <= 100`、root-only `select` | `unified_search(sources=\"openalex\")` |\n| Native semantic | `options=\"native_semantic\"` 選 `search.semantic`；2,000 chars、50 results、獨立 1 RPS limiter | 同一個 `unified_search` |\n| Systematic | `options=\"systematic\"` 使用 publication-date ascending 的 bounded cursor traversal | 同一個 `unified_search`；public `limit <= 100` |\n| Cost/provenance | 保存 safe `x_query` / OQL、`meta.cost_usd` 與 allowlisted rate headers；低 credit 產生 warning | JSON/TOON `source_metadata` 與 artifact query strategy |\n| Snapshot | registry 宣告 provider 有 operator data plane | 尚未實作 local snapshot downloader/index adapter |\n\n有 API key 時，本 repo 以 `Authorization: Bearer ...` 傳送，避免 secret 進入\nquery string；`mailto` 仍是非秘密 contact hint。Key 在 settings 中以 secret\n型別保存，只有建立 client 時解包。\n\n## 官方契約\n\n- [API endpoints](https://help.openalex.org/api/endpoints/)\n- [Authentication and budgets](https://help.openalex.org/api/authentication/)\n- [Searching](https://help.openalex.org/api/searching/)\n- [Semantic search](https://help.openalex.org/api/semantic-search/)\n- [Filtering](https://help.openalex.org/api/filtering/)\n- [Paging and cursor](https://help.openalex.org/api/paging/)\n- [Selecting fields](https://help.openalex.org/api/selecting-fields/)\n- [Errors](https://help.openalex.org/api/errors/)\n- [Snapshot](https://help.openalex.org/access/snapshot/)\n- [Sync](https://help.openalex.org/access/sync/)\n- [Full-text rights](https://help.openalex.org/access/fulltext/)\n\nOpenAlex 的 budget/pricing 與 corpus size 會變動。程式以 response headers、\n`meta.cost_usd`、manifest 與當前 operator plan 為準，不把文件快照寫成永久 SLA。\n\n## Endpoint families\n\nOpenAlex 不只 `/works`。目前主要 entity families 包括 works、authors、sources、\ninstitutions、publishers、funders、awards、topics/subfields/fields/domains、keywords、\nSDGs，以及 vocabulary endpoints。`concepts` 已 deprecated；新知識工作流應優先\n使用 topics/keywords，並標記它們是 OpenAlex model inference。\n\n本 repo 的文獻 broker 以 `/works` 為主；其他 entity metadata 應作 enrichment 或\nResearch Chronicle/knowledge graph 的明確 section，不直接擴張 MCP 搜尋工具表面。\n\n## Keyword search\n\nWorks `search` 查 title、abstract 與可用 full text。重要限制：\n\n- supported `per_page <= 100`；舊有 200 頁面大小不得再使用\n- basic paging 視窗最多 10,000；更深的 bounded traversal 使用 cursor\n- OR values 每組最多 100\n- `select` 只能選 root-level fields，不能 dotted nested select\n- URL 長度有限；大型 OR query 要由 compiler 分塊、union/dedup 並保存 physical\n  query provenance\n- `search`、`search.exact`、`search.semantic` 一次只能使用一種\n\n為避免大 payload，works search 只取 mapper 所需 root fields，例如 identifiers、\ntitle/display name、abstract inverted index、publication date/year、authorships、\nprimary location、OA locations、citation count 與 type。\n\n## Native semantic search\n\n`search.semantic` 使用 title/abstract embeddings。官方限制：\n\n- input 最多 2,000 characters\n- 最多 50 results\n- 1 request/second\n- 只有 works endpoint\n- 部分 filters 不支援，包括官方列出的 country/citation-related filters\n\nSemantic mode 必須是 capability-aware plan：\n\n1. validate query length、limit 與 filters；\n2. 使用獨立 shared limiter；\n3. 保存 mode、canonical query 與 warnings；\n4. 若 policy 允許 fallback keyword，必須明示語意改變，不能 silent fallback。\n\n目前明確指定不支援 semantic mode 的 source 會在 network call 前拒絕；未指定\n`sources` 時 planner 只保留／補入有 semantic capability 的 OpenAlex。Runtime\n不做 silent keyword fallback：\n\n```python\nunified_search(\n    query=\"mechanisms of treatment resistance\",\n    sources=\"openalex\",\n    options=\"native_semantic\",\n    limit=50,\n    output_format=\"json\",\n)\n```\n\n## Cursor 與 bounded pagination\n\nCursor 起始為 `cursor=*`，每頁使用 `meta.next_cursor`，null 表示終止。Broker\n必須：\n\n- 設定 max pages/results/time/cost\n- 偵測 repeated cursor\n- partial failure 時回傳已取得資料與 structured warning\n- 把 opaque cursor 視為短期 continuation/checkpoint，不當永久 record ID\n- 保存 `meta.count`、`meta.x_query`、`meta.cost_usd` 與 page provenance\n\n官方明示不應用 cursor 下載整個 corpus；整庫與本地 mirror 使用 snapshot。\n\n`options=\"systematic\"` 會以 `publication_date:asc` 執行 bounded cursor，\n並保存 `pages_fetched`、`bounded`、canonical query、continuation 與 cost。\n由於 public `unified_search limit <= 100`，目前這是有界 reproducibility mode，\n不是通往全 corpus 的隱藏下載路徑。\n\n## Authentication、credits 與 resilience\n\n- anonymous casual usage 仍可運作，但 budget 很小且不是 SLA。\n- API key 提供較高的日 credit budget；上游可接受 query param 或 Bearer，本 repo\n  固定使用 Bearer，避免把 key 放進 loggable URL。\n- 最大 request rate 與 daily credits 是兩個不同限制；低於 RPS 仍可能耗盡 credits。\n- 保存並解析 `X-RateLimit-Limit`、`Remaining`、`Credits-Used`、`Reset` 與\n  `meta.cost_usd`，讓 broker 做 bounded budget 決策。\n- 400 不重試；429/5xx 遵守 Retry-After/backoff/circuit breaker。\n- 多 worker service 不能讓每個 process 各自放大同一 credential budget；正式水平\n  擴展需要 shared ledger/limiter。\n\n## Snapshot 與 sync data plane\n\nPublic snapshot 提供壓縮 JSONL/Parquet，規模是數百 GB、解壓後數 TB；不屬於預設\n安裝或 MCP request 路徑。\n\n- manifest 最後發布；指定 format/entity 的 manifest 存在才代表 release 完成\n- 下載前後重取 manifest；若 release 改變，不 commit 混合版本\n- partitions 依 updated date 移動，local index 以 OpenAlex ID upsert\n- 必須 reconciliation 消失／deleted records；不能自行猜 merged aliases\n- current snapshot 與 API shape 大致相同，但不是所有欄位完全一致\n- 預設只規劃 selective profile；full corpus、content、TEI/PDF 全部 opt-in\n\n這些 snapshot/sync 條目是後續 operator contract。本輪 registry 的\n`operator_data_plane=\"provider_available\"` 只表示官方路徑存在；repo 尚未宣稱已\n建立 manifest checkpoint、downloader 或可搜尋的 local OpenAlex index。\n\nOpenAlex metadata 是 CC0，但 linked PDF/full text 保留原始 copyright/license。\nMetadata openness 不能推導出全文或 figure 的再散布權。\n\n## 正規化與 provenance\n\nOpenAlex payload 只 map 一次：\n\n```text\nOpenAlex response DTO + meta/rate headers\n  -> source response envelope\n  -> article mapper\n  -> UnifiedArticle\n  -> aggregation / ranking / Chronicle\n```\n\n不得先把原生 authorships/IDs/OA fields 改成 PubMed-like dict，再交給期待原生\nOpenAlex schema 的 mapper。Envelope 應保留：\n\n- items、total、next cursor\n- keyword/semantic mode\n- canonical `x_query` 與 physical chunks\n- cost/rate metadata\n- access path、fetched/release time\n- unsupported-filter/fallback warnings\n\nTopics、keywords 與 related-work signals 要標記 `inferred_by_openalex`；它們可協助\nbranching/ranking，但不能被敘述成作者明示的研究結論。\n\n## 測試契約\n\n- runtime search tool group exact 等於 `['unified_search']`\n- raw fixture 經 client→runner→mapper 保留 OpenAlex ID、authors、DOI/PMID、OA、\n  article type 與 citation metrics\n- 所有 list endpoints page size <=100\n- root-only select、OR 100、URL chunk union/dedup\n- cursor null/repeat/resume/budget/partial failure\n- semantic 2,000-char、50-result、1-RPS 與 unsupported filters\n- cost/rate headers、429 reset、400 no-retry、5xx backoff\n- snapshot manifest-before/after consistency、atomic publish、partition reconciliation\n\nGated live smoke 最多查少量 keyword records；semantic/cursor smoke 只有在 operator\n明確提供 key 與 budget 時才執行，永不以 live cursor 擷取整庫。\n",
   "clinicalkey-ai": "<!-- Generated from docs/CLINICALKEY_AI_INTEGRATION.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# ClinicalKey AI：Licensed Evidence Data-plane Boundary\n\n| Field | Value |\n| --- | --- |\n| Status | Default-off application/data-plane adapter; not an MCP source/tool |\n| Upstream API | ClinicalKey AI Public API 1.0.0 (OpenAPI 3.0.3) |\n| Verified | 2026-08-14 |\n| Public base URL | `https://api-us.digital.elsevier.com/knowledge/clinicalkey/ai` |\n| Token URL | `https://access.identity.elsevier.com/realms/digital/protocol/openid-connect/token` |\n\n## 結論\n\nClinicalKey AI 目前**不**註冊成 `unified_search` source，也**不**新增任何\n`search_clinicalkey*`、conversation 或 diagnosis MCP tool。\n\n本 repo 第一階段只提供 default-off、credential-gated、zero-persistence 的\napplication/data-plane adapter，讓取得正式 entitlement 的 operator 可以做合約\n驗證與 synthetic integration。它不會寫入 session、cache、pipeline、scheduler、\nartifact、notes、Research Chronicle 或 export。\n\n在 Elsevier 書面確認 MCP、retention、multi-user、end-user identity 與 institutional\nterms 前，不得把這個 adapter 接到 runtime MCP surface。\n\n## 為什麼不是 literature search source\n\nClinicalKey AI citations API 是 AI-curated clinical answer/citation RAG，不是完整、\n可重現的書目索引：\n\n- 單一問題回傳 curated citations，不宣稱 systematic coverage\n- response 可能包含 proprietary chunks、summary 與 copyright metadata\n- v2 需要真實 end-user identity/persona\n- ClinicalKey/Elsevier 的存取、retention 與 AI-system 條款取決於 operator 的\n  entitlement/order form\n- differential-diagnosis 路徑還涉及 PHI、BAA、clinical decision safety\n\n因此把它和 PubMed/OpenAlex/S2 records 無差別 merge、rank、persist 或 export，會\n同時破壞 evidence semantics、reproducibility 與授權邊界。\n\n## 官方參考\n\n- [ClinicalKey AI Public API](https://developer.digital.elsevier.com/documentation/knowledge_clinicalkey-ai-public)\n- [Accessing APIs](https://developer.digital.elsevier.com/Guides/Getting_Started/accessing_apis)\n- [Creating credentials](https://developer.digital.elsevier.com/Guides/Getting_Started/creating_credentials)\n- [Client Credentials flow](https://developer.digital.elsevier.com/Guides/Authentication_and_Authorization/Using_Credentials/requests_by_flow/ClientCredentials_flow_request)\n- [Refreshing access tokens](https://developer.digital.elsevier.com/Guides/Authentication_and_Authorization/Using_Credentials/requests_by_flow/Refreshing-access-tokens)\n- [Credential security](https://developer.digital.elsevier.com/Guides/Managing_Credentials/manage_credentials_securely)\n- [Rate limits](https://developer.digital.elsevier.com/Guides/Usage-and-rate-limits/Understanding-rate-limits)\n- [Rate-limit response headers](https://developer.digital.elsevier.com/Guides/Usage-and-rate-limits/Check-rate-limits-using-API-requests)\n- [Handling 429](https://developer.digital.elsevier.com/Guides/Usage-and-rate-limits/Handling-429-response-errors)\n- [Elsevier API Service Agreement](https://dev.elsevier.com/api_service_agreement.html)\n- [Clinical Solutions terms](https://www.elsevier.com/legal/elsevier-clinical-solutions-terms-and-conditions-of-supply)\n- [ClinicalKey AI product safety](https://www.elsevier.support/clinicalkeyai/answer/how-does-clinicalkey-ai-address-product-safety)\n\n「Public API」表示公開的 API documentation，不表示匿名、免費或已授權存取。官方\nonboarding 要求 licensed API access；無 Bearer 呼叫 `/healthcheck` 也會得到 401。\n\n## OAuth client-credentials 契約\n\nToken request 為 form-encoded：\n\n```text\ngrant_type=client_credentials\nclient_id=<operator secret>\nclient_secret=<operator secret>\n```\n\nClient 必須：\n\n- 依 token response 的 `expires_in`，使用 monotonic clock 與安全 skew\n- concurrent callers 共用 single-flight refresh\n- 不假設一定有 refresh token；到期時重新執行 client-credentials flow\n- 401 只 invalidate token 並 retry 一次\n- 不自行猜測 scope\n- client secret/access token 僅存在記憶體與 operator secret store/env\n- 不把 secret/token 放進 URL、log、exception、artifact 或測試 snapshot\n\n官方頁面對 token 5 或 15 分鐘的文字不一致，所以程式不得硬編任一值。\n\n## Citations endpoints\n\n### v1\n\n`POST /api/v1/citations`\n\n```json\n{\"question\": \"a non-PHI clinical evidence question\"}\n```\n\n除 Bearer token 外沒有 end-user headers。\n\n### v2\n\n`POST /api/v2/citations` 使用相同 body，另要求：\n\n- `End-User-Id`\n- `End-User-Persona`\n- optional `Secondary-Org-Id`\n\nPersona 沒有公開 enum。不得把 MCP transport session、隨機 tenant hash 或 local\nusername 冒充 Elsevier end user；mapping 必須由 institution/Elsevier 明確提供。\n\n### Tolerant response parsing\n\n公開 OpenAPI 有 wrapper/unwrapped example、required/property、PMID type 與 citation\nmap key 不一致。Parser 必須容忍：\n\n- `result` wrapper 有或沒有\n- PMID 是 integer 或 string\n- citation map keys 是 integer-like strings\n- optional/partial references\n- error payload 額外或缺少欄位\n- `references` 是 map-of-lists、plain list，或每筆外包 `result` / `_source`\n\n目前 adapter 會把 map-of-lists flatten 成一個有順序的 citation batch，依\nDOI/PMID/provider identifier 去重，並保留 `provider_reference_count` 與\n`dropped_reference_count`。每筆輸出只可能有 `reference_id`、title/container、\nauthors、DOI、PMID、provider identifier/type、publication date 與已移除 query/\nfragment 的 safe href。Question、generated answer 與 raw provider payload 不會\n進入回傳 dataclass。\n\nHTTP 2xx 不等於成功：若 body 是 `status=\"error\"` 或其他 documented error\nenvelope，adapter 會以 sanitized response error fail closed，不回傳空 citation\nbatch，也不把 provider error text、question 或 licensed content放進 exception。\n\n允許抽取的最小 metadata 只有 DOI、PMID、title、authors、publication date 與必要\nprovider identifier/href。`chunk_text`、summary、breadcrumbs、content properties、\ncopyrighted snippets 與原始 licensed payload 必須在 adapter boundary 丟棄。\n\n若未來獲得書面核准，這些 DOI/PMID 仍應再向 PubMed、Crossref 或 OpenAlex取得公開\nmetadata；final answer 引用原始文獻，而不是引用 ClinicalKey AI 回應。\n\n## Data-governance policy\n\nClinicalKey AI policy 固定為：\n\n| Dimension | Contract |\n| --- | --- |\n| Access tier | Licensed clinical evidence |\n| Default state | Disabled |\n| MCP registration | Forbidden in this phase |\n| Retention | Ephemeral / metadata allowlist only |\n| Raw response persistence | Forbidden |\n| Session/cache/artifact/export | Forbidden |\n| Pipeline/scheduler | Forbidden |\n| Auto dispatch | Forbidden |\n| Systematic coverage claim | Forbidden |\n| PHI | Forbidden |\n| Training/embedding/vectorization | Forbidden without explicit written rights |\n\nRuntime enablement 必須同時具有：\n\n```text\nCLINICALKEY_AI_ENABLED=true\nCLINICALKEY_AI_ENTITLEMENT_CONFIRMED=true\nCLINICALKEY_AI_CONTRACT_ACKNOWLEDGED=true\nCLINICALKEY_AI_CLIENT_ID=...\nCLINICALKEY_AI_CLIENT_SECRET=...\n```\n\n這些 flags 不是法律授權本身；它們只是 operator 已完成外部審查的 fail-closed\nassertion。任何一項缺少時 adapter 必須拒絕執行。\n\n## 明確不實作的 endpoints\n\n### Differential diagnosis\n\n不得實作：\n\n- `/api/v2/differential-diagnosis`\n- `/api/v2/differential-diagnosis/streaming`\n\n它們接收 patient summary、EHR/notes context、retrieval context、trace/session IDs，\n並需要 `Shared-Key`。這超出 literature research MCP 範圍，涉及 PHI/BAA、臨床\n決策、醫材/法規與病人安全。response 中的 `deidentification` boolean 不是資料已\n符合 operator 法律義務的保證。\n\n### Conversation 與 article state\n\n`/conversation` 與 `/article` 路徑也不在第一階段，因為它們可能建立 Elsevier\n端 history/state 或帶出 proprietary content，容易和本 repo 的 session/persistence\n語意混淆。\n\n## Rate limit\n\nClinicalKey AI 沒有公開固定 RPS。不要從 portal examples 猜 quota。Client 應：\n\n- 以 concurrency 1 起步\n- 共用 credential-wide limiter\n- 解析 `X-RateLimit-Limit-N`、`Remaining-N`、`Reset-N`\n- 429 依 reset/Retry-After bounded cooldown，不 parallel retry\n- 403/422 不 retry；401 refresh once；5xx 使用 bounded jitter/circuit breaker\n\n多 worker deployment 若要共用同一 credential，需要 distributed budget；\nprocess-local limiter 不能宣稱是完整的 institution-wide quota enforcement。\n\n## 測試與 live gate\n\n一般 CI 只使用 synthetic fixtures：\n\n- `expires_in`/skew/single-flight\n- 401 refresh once，403/422 no retry，429 reset/cooldown\n- v2 end-user headers\n- wrapper/schema drift、PMID int/string、partial references\n- raw chunk stripping與 output allowlist\n- secret/token log redaction\n- session、artifact、export、pipeline、scheduler 零持久化\n- runtime MCP tool count/search group完全不因 enable flags 改變\n- HTTP 200 error union fail closed、map-of-lists flatten 與 duplicate/drop counts\n\nLive smoke 必須在獨立 explicit gate 中執行，只能使用 non-PHI synthetic question，\n不保存 response；沒有 entitlement secrets 時直接 skip。\n\n## 未來升級條件\n\n只有在 Elsevier/機構以書面確認下列問題後，才重新審查是否接到\n`unified_search`：\n\n1. MCP/connector/RAG 使用是否在實際 order/API agreement 允許；\n2. single-user 與 multi-user deployment 的 Authorized User 邊界；\n3. end-user persona/ID/tenant contract；\n4. DOI/PMID metadata retention、rehydration 與 export 權利；\n5. PHI/BAA 明確範圍；\n6. quota/reset/header 契約。\n\n即使通過，最多也只能是 explicit-only、enrichment-only companion：不 auto、不\n單獨 primary search、不提供 systematic coverage、不 persistence，且仍不新增第二個\n通用搜尋 tool。\n",
   "biomcp-analysis": "<!-- Generated from docs/BIOMCP_ARCHITECTURE_ANALYSIS.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# BioMCP 架構分析與本專案採用決策\n\n> **驗證快照**：2026-08-14（Asia/Taipei）\n>\n> **分析對象**：[genomoncology/biomcp](https://github.com/genomoncology/biomcp) `main`，commit [`be42795030ea836e948c3ad872fc681e41420ef2`](https://github.com/genomoncology/biomcp/commit/be42795030ea836e948c3ad872fc681e41420ef2)\n>\n> **當日 GitHub 指標**：591 stars、113 forks；這是透過 [GitHub REST repository endpoint](https://api.github.com/repos/genomoncology/biomcp) 讀取的時間點快照，會持續變動，不應寫成永久產品規格。\n>\n> **用途**：辨識可借鏡的架構概念，並定義如何以 PubMed Search MCP 的 DDD、Research Chronicle、可重現搜尋與多人服務安全模型實作；不是逐檔移植或功能競賽。\n\n## 1. 結論先行\n\nBioMCP 最值得學的不是「接了很多 API」，而是把多來源生醫資料轉成可供人與 agent 使用的**操作語言與證據合約**：\n\n- 用一致 grammar 將 discovery、detail、pivot、batch 與 local study 組成可預測流程。\n- 用 counts-first 與 selectable sections 控制 token 與上游成本。\n- 在回應中提供 `next_commands`、section-level sources 與 degraded state，讓下一步與來源責任可追蹤。\n- 將線上 API、local bulk data、health、rate limits、skills、contract tests 與 release artifacts 視為同一產品面。\n- 明確區分程式碼授權與上游資料權利，不把「能查」誤解為「能重散布」。\n\n本專案應採用這些**底層概念**，但不照搬 BioMCP 的 entity/tool 數量或 shell command surface。以下邊界維持不變：\n\n1. **唯一通用文獻搜尋 MCP tool 是 `unified_search`。** 新文獻來源必須接在 source registry、application planner 與 broker 後方，不能新增 `search_pubmed`、`search_openalex`、`search_semantic_scholar` 或 `search_clinicalkey` 等平行入口。\n2. `search_gene`、`search_compound`、`search_clinvar` 是 NCBI structured-entity lookup，不是另一組 generic literature search；其文獻延伸仍應回到 `unified_search` 或既有 discovery tools。\n3. DDD 目標仍是 presentation 只做 transport/schema、application 負責 use case 與 orchestration、domain 定義來源無關的證據合約、infrastructure 實作 API 與 data plane。現況的 unified planner/executor 尚位於 `presentation/mcp_server/tools/`，而 `SourceCapabilities` 位於 infrastructure registry；這是本輪沒有假裝消失的遷移技術債，不是已完成的分層成果。\n4. Research Chronicle 是本專案的長期差異化能力：版本化、可 diff、可重建、證據支撐的研究演進，不退化成一次性的 entity card 或 next-command 清單。\n5. 遠端多人部署必須 fail closed：認證 principal、tenant isolation、全域上游預算與 per-tenant fairness 都是必要條件。BioMCP 的 Host allowlist 可借鏡，但不能取代認證或 TLS。\n6. 上游資料的 license、terms、retention、redistribution 與 attribution 必須成為 source contract；專案本身的 Apache-2.0 不會覆蓋上游資料權利。\n\n### 1.1 本輪已落地與後續邊界\n\n本分析同時是採用決策與 implementation ledger。下列項目已不是「建議」，\n而是本輪 production contract：\n\n| 已落地 | 本專案的實作方式 |\n| --- | --- |\n| Capability honesty | registry 的 `SourceCapabilities` 宣告 search modes、pagination、page/mode limits、batch limit、counts/provenance 與 operator data-plane status；planner 在 I/O 前驗證 explicit source/mode |\n| 單一 raw page seam | application `SourceSearchPage` 保留 provider DTO、total、opaque continuation、canonical query、cost、warnings 與 metadata，OpenAlex/S2 各自只經過一次 domain mapper |\n| Provider-native modes | 同一 `unified_search` 以 `options=\"native_semantic\"` 選 OpenAlex semantic，以 `options=\"systematic\"` 選 OpenAlex bounded cursor / S2 bounded bulk；兩者互斥且關閉多策略 deep expansion |\n| Semantic Scholar 能力 | relevance offset/window、Boolean-to-bulk compiler、opaque token loop、500-ID ordered batch，以及 metadata-only release/dataset/diff client |\n| OpenAlex 能力 | root-only select、每頁 100、semantic 2,000 chars/50 results/1 RPS、bounded cursor、safe OQL/`x_query`、cost/rate headers 與低 credit warning |\n| Agent/audit envelope | structured output 與 artifact 保存 `retrieval_mode`、每來源 `source_metadata`、logical/physical query、continuation、cost/rate 與 warnings |\n| Surface regression | registry、runtime tools/list、Copilot hook policy 與 docs contract 鎖定 generic literature search 只有 `unified_search` |\n| Licensed clinical governance | ClinicalKey AI 是 default-off、entitlement/contract/end-user gated、metadata allowlist、zero-persistence 的 application/data-plane adapter；不註冊 tool/source |\n\n下列仍是**後續工作**，不能從上述能力推論已完成：\n\n- 現有 rate limiter 是同 process 的 credential-wide 保護；跨 process／replica 的\n  shared distributed quota ledger 與 per-tenant provider fairness 尚未落地。\n- Semantic Scholar 只有 metadata manifest client，OpenAlex 只有官方 snapshot\n  capability 宣告；partition downloader、checkpoint、atomic publish、local index\n  與 runtime local-index adapter 尚未落地。\n- ClinicalKey 有 machine-checkable operation/retention allowlist，但所有 open、\n  commercial、institutional sources 共用的 rights/retention/redistribution schema\n  尚未完成；目前仍需同時遵守 source docs 與上游合約。\n\n## 2. 分析方法與可信度邊界\n\n本文件以 BioMCP 官方 repository、官方網站內容的 repository source，以及 executable specs 為依據：\n\n- [README](https://github.com/genomoncology/biomcp/blob/main/README.md)：產品定位、grammar、entities、sources、sections、rate-limit 與 deployment 摘要。\n- [Technical overview](https://github.com/genomoncology/biomcp/blob/main/architecture/technical/overview.md)：runtime、article federation、ranking、verification 與 release lanes。\n- [Source integration architecture](https://github.com/genomoncology/biomcp/blob/main/architecture/technical/source-integration.md)：source、section、provenance、graceful degradation 與 local-data contracts。\n- [MCP executable spec](https://github.com/genomoncology/biomcp/blob/main/spec/surface/mcp.md)：實際 advertised tools、read-only boundary、probes、Host policy 與 contract gates。\n- [Search-all workflow](https://github.com/genomoncology/biomcp/blob/main/docs/how-to/search-all-workflow.md) 與 [cross-entity pivots](https://github.com/genomoncology/biomcp/blob/main/docs/how-to/cross-entity-pivots.md)：agent 操作語意。\n- [Data sources](https://github.com/genomoncology/biomcp/blob/main/docs/reference/data-sources.md)、[source licensing](https://github.com/genomoncology/biomcp/blob/main/docs/reference/source-licensing.md) 與 [machine-readable sources inventory](https://github.com/genomoncology/biomcp/blob/main/docs/reference/sources.json)：來源、限制與資料權利。\n- [Skills](https://github.com/genomoncology/biomcp/blob/main/docs/getting-started/skills.md)、[release process](https://github.com/genomoncology/biomcp/blob/main/docs/reference/release-process.md)、[CI workflow](https://github.com/genomoncology/biomcp/blob/main/.github/workflows/ci.yml) 與 [release workflow](https://github.com/genomoncology/biomcp/blob/main/.github/workflows/release.yml)：agent guidance 與供應鏈工程。\n\nREADME、architecture note 與 executable spec 偶爾代表不同演進時間點。例如 technical overview 仍以單一 `biomcp` MCP command tool 描述主要 boundary，但目前 MCP spec 已驗證 `biomcp` escape hatch、typed `search`／`get`，以及少數專用 typed tools 同時存在。遇到這類差異時，本分析以**可執行 contract 與目前 source**優先，並把「one grammar」解讀為 UX 收斂，而不是字面上的單一 MCP tool。\n\n本文件不以 stars、來源數或工具數推論檢索品質；檢索 recall、precision、latency 與 source availability 仍需用固定 corpus、request-contract fixtures 與 opt-in live smoke 驗證。\n\n## 3. BioMCP 的系統形狀\n\n### 3.1 Rust runtime 與 Python/docs contract lanes\n\nBioMCP 的正式查詢 runtime 是單一 Rust binary。Python package `biomcp-cli` 是平台 binary 的包裝與散布路徑，不參與查詢處理；repository 的 Python 則主要服務 contract tests、docs 與 release tooling。官方依據見 [technical overview](https://github.com/genomoncology/biomcp/blob/main/architecture/technical/overview.md)、[`Cargo.toml`](https://github.com/genomoncology/biomcp/blob/main/Cargo.toml)、[`pyproject.toml`](https://github.com/genomoncology/biomcp/blob/main/pyproject.toml) 與 [`Makefile`](https://github.com/genomoncology/biomcp/blob/main/Makefile)。\n\n| Lane | BioMCP 的責任 | 合約價值 | 本專案的解讀 |\n| --- | --- | --- | --- |\n| Rust runtime | CLI、stdio MCP、Streamable HTTP、source clients、rendering、local study | 單 binary、快啟動、跨平台 artifact | 不需為追求形式一致而重寫；Python async 與現有 DDD 更符合本 repo 的維護成本 |\n| PyPI wrapper | 散布平台 binary | 安裝體驗與 runtime 解耦 | 本專案直接散布 Python package，仍應維持 installed entrypoint 與 source-tree wrapper 的 contract tests |\n| Python contract lane | CLI/MCP/docs contract、static/runtime assertions | 與 Rust unit tests 互補，避免單一 layer 假綠 | 可借鏡「跨層 contract lane」，但用 pytest、mypy、MCP in-memory tests 與 generated-doc sync 實作 |\n| Executable Markdown specs | 以穩定輸入／輸出片段驗證 surface | 規格可讀且可執行 | 適合少量關鍵 user journeys；不取代 domain/unit tests |\n| Release lane | stage、seal、promote、platform smoke、checksums | exact bytes 與 public install 可驗證 | 值得採用 manifest／hash／artifact smoke 思維，不必複製全部 Rust 發行矩陣 |\n\n### 3.2 三種 runtime mode\n\nBioMCP 同一 binary 支援：\n\n- CLI：一次 command、一次輸出。\n- `biomcp serve`：本機 stdio MCP。\n- `biomcp serve-http`：共用 Streamable HTTP `/mcp`，另有 `/health`、`/readyz` 與 `/` probes。\n\n這種「同核心、多 transport」值得保留。本專案已進一步把信任模型拆成本機 stdio、本機 loopback HTTP 與 authenticated service；這比只區分 transport 更適合多人服務。BioMCP 的 HTTP 操作方式見 [remote HTTP guide](https://github.com/genomoncology/biomcp/blob/main/docs/getting-started/remote-http.md)。\n\n## 4. One grammar：優點與不可誤讀之處\n\nBioMCP 的核心 grammar 是：\n\n```text\nsearch <entity> [filters]     -> discovery\ndiscover <query>             -> concept resolution\nget <entity> <id> [sections] -> focused detail\n<entity> <helper> <id>       -> cross-entity pivot\nenrich <genes>               -> gene-set enrichment\nbatch <entity> <ids>         -> bounded parallel detail\nsearch all [typed slots]     -> counts-first orientation\nskill <workflow>             -> agent playbook\nstudy <operation>            -> local dataset analytics\n```\n\n它的價值是讓 agent 能預測「先定向、再聚焦、再 pivot」；不是要求所有產品都把 payload 壓成 shell string。對 MCP 而言，typed schema 可在呼叫前驗證 entity、sections 與 limit，通常比單一自由字串更安全。\n\n本專案應採用的是**一致的工作流語意**：\n\n```text\nunified_search              -> 唯一 generic literature discovery\nquery-intelligence tools    -> 結構化問題與查詢規劃，不執行第二套搜尋\ndiscovery/fulltext tools    -> 由已知 PMID/DOI 往引用、全文、圖表延伸\nstructured-entity tools     -> Gene/PubChem/ClinVar 精確資料查詢\npipeline/session/export     -> 可重現、可續接、可交付\nResearch Chronicle          -> 持久且可版本比較的研究演進\n```\n\n因此，「BioMCP one grammar」不應被翻譯成新增 `search_article`、`search_trial`、`search_all` 等公開 literature-search tools，也不應把 application orchestration 放進 presentation shell parser。\n\n## 5. BioMCP entity 與 source surface\n\n下表依 2026-08-14 的 [BioMCP README entity/source table](https://github.com/genomoncology/biomcp/blob/main/README.md#entities-and-sources) 整理。來源清單是 routing 能力，不代表每一來源在每次呼叫都成功，也不代表資料可自由重散布。\n\n| Entity | Detail / search | 主要上游或 local source | Grammar 範例 | 對本專案的意義 |\n| --- | --- | --- | --- | --- |\n| `gene` | gettable | MyGene.info、UniProt、Reactome、QuickGO、STRING、GTEx、HPA、DGIdb、ClinGen、NIH Reporter、DisGeNET、GTR | `get gene BRAF pathways hpa` | 借鏡 section composition；不擴張 generic search surface |\n| `variant` | gettable | MyVariant.info、ClinVar、gnomAD v4、CIViC、CGI、OncoKB、cBioPortal、GWAS Catalog、AlphaGenome | `get variant \"BRAF V600E\" clinvar` | 精確 identity 與 source status 值得學；臨床解讀須保持證據邊界 |\n| `article` | gettable | PubMed、PubTator3、Europe PMC、PMC OA、NCBI ID Converter、Semantic Scholar | `search article -g BRAF` | 最接近 `unified_search`；採用 federation／provenance，不新增第二個 article search tool |\n| `trial` | gettable | ClinicalTrials.gov API v2、NCI CTS | `search trial -c melanoma` | 本 repo 只在 `options=\"trials\"` 明確選擇時作關聯 evidence adjunct；不混充 peer-reviewed article |\n| `diagnostic` | gettable | GTR local bulk、WHO IVD local CSV、optional OpenFDA device | `get diagnostic ... regulatory` | local snapshot + source version 很有價值；需權利與 freshness metadata |\n| `drug` | gettable | MyChem.info、DDInter、EMA、WHO PQ、ChEMBL、Open Targets、Drugs@FDA、OpenFDA、CIViC | `drug interactions warfarin` | section/provider outcomes 可借鏡；避免把 safety 缺資料解讀為安全 |\n| `disease` | gettable | MyDisease.info、Monarch、MONDO、Open Targets、Reactome、CIViC、SEER、NIH Reporter、DisGeNET、GTR/WHO IVD | `get disease \"Lynch syndrome\" genes` | ontology resolution 與 pivot 可透過 query intelligence／pipeline 表達 |\n| `pathway` | gettable | Reactome、KEGG、WikiPathways、g:Profiler、Enrichr | `get pathway hsa05200 genes` | source rights 差異很大；不能只標「open API」 |\n| `protein` | gettable | UniProt、InterPro、STRING、ComplexPortal、PDB、AlphaFold | `get protein P15056 complexes` | section-first detail 模式可借鏡 |\n| `adverse-event` | gettable | OpenFDA FAERS/MAUDE/recalls、CDC WONDER VAERS aggregates | `search adverse-event --drug ...` | 必須附上觀察性資料限制與非因果聲明 |\n| `pgx` | gettable | CPIC、PharmGKB | `get pgx CYP2D6 recommendations` | credential/terms/clinical-use disclaimer 都應進 capability contract |\n| `gwas` | search-only | GWAS Catalog | `search gwas --trait ...` | BioMCP 明確禁止虛構 `get`，這種 capability honesty 值得採用 |\n| `phenotype` | search-only | Monarch HPO semantic similarity | `search phenotype \"HP:0001250\"` | typed capability 比憑名稱猜工具更可靠 |\n\nBioMCP 的 entity breadth 適合 precision-medicine orientation；本專案的核心則是**文獻證據工作流**。評估新 entity 時，優先問它是否改善 query expansion、article verification、context graph、Chronicle 或 export，而不是能否再多列一個 MCP tool。\n\n## 6. Article federation：最直接可借鏡的部分\n\n### 6.1 Planning 與 routing\n\nBioMCP 的相容預設 article federation 會平行規劃 PubTator3、Europe PMC、PubMed，並在條件相容時加入 Semantic Scholar；顯式 source selection 或 Europe PMC-only filters 會改變 routing。詳細 contract 見 [technical overview 的 Article Federation](https://github.com/genomoncology/biomcp/blob/main/architecture/technical/overview.md#article-federation-and-front-door-validation)。\n\n值得採用的不是固定 provider 名單，而是四個 planning 原則：\n\n1. 先驗證查詢與 filter/source capability，避免把不支援的 filter 默默丟棄。\n2. planner 決定 source legs；source client 不自行猜整體研究意圖。\n3. 每個 leg 都回報 `ok`、`empty`、`partial`、`degraded` 或 `unavailable`，結果列與來源狀態分開。\n4. 明確 source selection 會改變 enrichment 與排名語意，因此必須寫入 audit/query strategy。\n\n本專案已有 source registry、auto/explicit/all selection、parallel execution、source errors/statuses 與 deep-search planning；本輪再加入 machine-readable search mode、paging、page/mode limit、batch 與 operator data-plane capabilities。尚未收斂進同一 plan 的是跨 process rate budget、通用 rights/retention schema 與 provider health/freshness。\n\n### 6.2 Identity、dedup 與 ranking\n\nBioMCP 以 PMID、PMCID、DOI 做跨來源 identity dedup，保存 `matched_sources` 與 source-local position；在 federated pool 足夠時，先對單一來源做 contribution cap，再進 lexical/semantic/hybrid local ranking，避免 merge order 變成隱性來源優先順序。\n\n本專案已有 normalized article model、dedup、RRF/quality ranking、source disagreement 與 reproducibility score。建議採用：\n\n- dedup 後保留每個 identifier 的觀測來源與衝突，不只保留「勝出」紀錄。\n- 在 audit 中記錄 source-local rank、merge method、cap、ranking signals 與缺失值處理。\n- source balancing 是可設定 policy，不是為了平均而犧牲明顯相關性。\n- semantic score、citation count、OA 與 peer-review status 都是不同 evidence dimensions，不合併成無法解釋的單一真值。\n\n### 6.3 Progressive result envelope\n\nBioMCP JSON 會用 `_meta.next_commands` 與 `_meta.section_sources` 讓 agent 看到下一步與 section provenance。本專案已在 `unified_search` 與多個 discovery/fulltext surfaces 提供 `next_tools`、`next_commands`、`section_provenance`、`source_counts`、`source_errors` 及 artifact summary。\n\n採用方向是**收斂語意與型別**，不是再新增 metadata 別名：\n\n- `section_provenance` 為 canonical 名稱，內含 surfacing source、canonical host、direct/derived、upstream sources、fields 與狀態。\n- `next_tools` 保留 typed arguments，`next_commands` 只作人類可讀／相容投影；不可要求 agent 解析自由字串才知道下一步。\n- 被 response cap 省略的內容要有 artifact URI、omission reason 與完整結果位置。\n- `empty` 與 `failed` 必須可區分；未觀察到資料不是不存在的證明。\n\n## 7. Agent UX：counts-first、sections、pivots 與 skills\n\n### 7.1 Counts-first\n\nBioMCP 的 `search all --counts-only` 先回傳各 entity/section 的量與 next step，避免一開始灌入長表；`--debug-plan` 顯示實際執行的 typed legs。官方說明見 [search-all workflow](https://github.com/genomoncology/biomcp/blob/main/docs/how-to/search-all-workflow.md)。\n\n本專案已支援 `unified_search(options=\"counts_first\")`，會附上 source counts、coverage 與 next-tool recommendations。需要補強的不是另一個 `search_all`，而是：\n\n- 對 approximate、provider total、materialized rows、deduplicated rows 分別命名。\n- counts-first 仍保存 query strategy 與 artifact，讓後續 full search 可重用同一 plan。\n- 加入 bounded `debug_plan`／decision trace 時，只公開安全的 route/capability 決策，不洩漏 token、內部檔案路徑或其他 tenant 狀態。\n\n### 7.2 Selectable sections\n\nBioMCP 的 `get <entity> <id> [sections]` 讓 summary card 保持小，昂貴或受限 sections 明確 opt in。這個模式對本專案的對應不是 article search tool 拆分，而是：\n\n- `compact`、`counts_first` 與 output cap 提供第一層 progressive disclosure。\n- fulltext、figures、text-mined terms、citation graph、metrics 與 Chronicle 由專用 follow-up tool 延遲取得。\n- artifact bundle 保存完整 machine-readable evidence，MCP immediate response 只回傳當前任務所需部分。\n\n### 7.3 Cross-entity pivots\n\nBioMCP 的 pivot 讓已知 gene/variant/drug/disease/article 直接轉到 trials、articles、pathways、structures 等，不需重建 query；但官方也提醒 richer filters 時應回到 fresh search。見 [cross-entity pivot guide](https://github.com/genomoncology/biomcp/blob/main/docs/how-to/cross-entity-pivots.md)。\n\n本專案應以現有能力實作「pivot 語意」，而不是複製 helper 數量：\n\n- `next_tools` 對已知 PMID 指向 citations、references、fulltext、figures、metrics、export 或 Chronicle。\n- gene/compound/ClinVar 的 structured result 產生可稽核的 query suggestion，再交給 `unified_search`。\n- 複雜多步 pivot 保存成 pipeline DAG，跨對話使用 session/artifact，而不是依賴 agent memory。\n- 跨時間的 pivot 進 Research Chronicle revision；不能把一次性的 graph traversal 當作研究演進結論。\n\n### 7.4 Skills 與 worked examples\n\nBioMCP 內嵌 guide、schemas 與 17 個 worked examples，可 list/render/install，並以 manifest/hash 判斷 installed skill 是否 current、stale 或 locally modified。見 [Skills guide](https://github.com/genomoncology/biomcp/blob/main/docs/getting-started/skills.md) 與 [`skills/AUTHORING.md`](https://github.com/genomoncology/biomcp/blob/main/skills/AUTHORING.md)。\n\n本 repo 已有 Claude skills、Cline workflows、Copilot agent/hooks 與 Codex harness。應採用的改善是：\n\n- canonical workflow 只有一份，其他 agent bundle 以 generated/package copy 同步，不手工分叉規則。\n- skill schema 與工具 registry 一起驗證；tool rename/removal 會使 CI 失敗。\n- worked examples 應覆蓋 quick search、PICO、systematic search、fulltext、citation verification、Research Chronicle、tenant-safe pipeline 與 export。\n- installed bundle 可加入版本／hash manifest，但必須保留使用者本地修改與清楚的 stale repair 路徑。\n\n## 8. Local study data 與 offline data plane\n\nBioMCP 的 `study` family 可下載 cBioPortal-style datasets，執行 cohort、survival、compare、co-occurrence 與 chart，並用 `BIOMCP_STUDY_DIR` 固定資料根目錄。這不是 API fallback 而已，而是可重現的 local analysis plane。官方說明見 [README Local study analytics](https://github.com/genomoncology/biomcp/blob/main/README.md#local-study-analytics) 與 [cBioPortal study article](https://github.com/genomoncology/biomcp/blob/main/docs/blog/cbioportal-study-analytics.md)。\n\n本專案值得採用「local data plane」，但範圍應聚焦文獻證據：\n\n- Semantic Scholar 已有 release/dataset/diff metadata-only client；OpenAlex\n  snapshot 目前只有 capability/docs boundary。後續 downloader/index 只建立\n  **顯式 operator workflow**，不在一般 `unified_search` 背景偷偷下載大型資料集。\n- 每個 snapshot 記錄 provider、release id/date、schema、files、hash、license/terms URL、取得時間、增量起訖與 indexing version。\n- online live search、local snapshot search 與 cache replay 必須在 provenance 中可區分。\n- Research Chronicle revision 應綁定 query strategy 與 source snapshot version，讓日後 diff 能辨識「研究真的新增」與「來源資料更新／重建索引」。\n- commercial/institutional source 不能因為能呼叫 API 就進共用 local corpus；ClinicalKey、Scopus、Web of Science 等必須依合約限制 cache、retention 與 redistribution。\n\n不建議直接加入 BioMCP 的完整 cBioPortal analytics/chart surface。除非未來明確把產品範圍擴到 cohort analytics，否則它會稀釋 literature-search DDD；目前可透過 pipeline export、外部分析器或獨立 plugin 整合。\n\n## 9. Health、rate limits 與 remote security\n\n### 9.1 BioMCP 現況\n\nBioMCP 提供 API/local-data health、HTTP `/health` 與 `/readyz`。其 limiter 是 process-local；多 worker 的官方建議是共用一個 `serve-http` process，讓 workers 共享同一 quota。Semantic Scholar 有 key 與 keyless 不同 cadence；其他 sources 也有個別 credentials。見 [README API keys / multi-worker deployment](https://github.com/genomoncology/biomcp/blob/main/README.md#multi-worker-deployment) 與 [API Keys guide](https://github.com/genomoncology/biomcp/blob/main/docs/getting-started/api-keys.md)。\n\nHTTP security 方面，loopback 預設只允許 local Host，non-loopback bind 要求 `--allowed-hosts` 或顯式 unsafe override；但 BioMCP 清楚聲明 Host check **不提供 authentication、TLS 或 encryption**，遠端要放在 authenticated TLS proxy 或 private network 後。這項誠實邊界值得肯定，詳見 [MCP spec Host contract](https://github.com/genomoncology/biomcp/blob/main/spec/surface/mcp.md#streamable-http-host-headers-default-to-a-safe-boundary)。\n\n### 9.2 本專案必須更嚴格\n\n| 面向 | BioMCP pattern | 本專案現況／要求 | 決策 |\n| --- | --- | --- | --- |\n| Liveness/readiness | `/health`、`/readyz` | `/health`、`/ready`、`/info` | 採用 capability-aware readiness；避免 probe 觸發昂貴 live calls |\n| Host policy | loopback safe default、non-loopback allowlist | local/service profiles、Host/Origin allowlists | 保留並測試；Host 不是 authentication |\n| Authentication | 外部 proxy/private network | service mode bearer principal，fail closed | 不採用無內建 auth 的 remote profile |\n| TLS | 外部 termination | 正式 service 強制 public HTTPS metadata 與 trusted proxy boundary | 維持外部 TLS termination，但明確驗證 forwarding trust |\n| State | 多數 process/local | principal-scoped sessions、artifacts、exports、chronicles、pipelines | 本專案優勢，不能為水平擴充而退回 shared default tenant |\n| Rate limit | process-local provider limiter | 目前同 process credential-wide limiter + per-tenant request concurrency；distributed upstream ledger 尚缺 | 加入跨 process broker/fair-share；不能只靠每 client sleep |\n| Horizontal scale | 共用單 HTTP process | 目前單 replica，缺 shared session/lock/leader | 維持明確限制，完成 shared state 前不宣稱 stateless scale-out |\n\n### 9.3 建議的 broker contract\n\nBroker 應是 application/infrastructure 交界的共用服務，而不是每個 source client 各自 sleep：\n\n- 以 provider + credential identity 建立 global budget；相同 API key 的 tenants 共用真實上游配額。\n- per-tenant queue/concurrency 做公平性，避免單一 agent 壟斷。\n- 尊重 `Retry-After`、rate-limit headers、daily credit/budget 與 provider hard limits。\n- bounded exponential backoff + jitter，只重試可安全重試的 status/transport errors。\n- circuit breaker 區分 provider outage、quota exhausted、credential rejected、invalid request 與 internal failure。\n- request coalescing、cache、batch/bulk/cursor paging 降低重複呼叫，但不跨 tenant 洩漏受限 payload。\n- health 顯示 capability state 與最近錯誤類型，不顯示 secret、完整 query 或其他 principal 的用量。\n- audit 保存 route、attempts、wait、degraded reason 與 materialized count；避免保存 bearer/API key。\n\n## 10. 資料權利與 provenance\n\nBioMCP 本身是 MIT，但官方 [Source Licensing and Terms](https://github.com/genomoncology/biomcp/blob/main/docs/reference/source-licensing.md) 明確指出 provider 並非同一授權；repository-only captured responses 也不能在沒有逐來源 rights record 時任意重散布。這是本專案應完整採用的觀念。\n\n建議把現有 `access_tier` 擴展成可驗證的 rights profile：\n\n| Rights class | 例子 | Cache / artifact 原則 | 對使用者的揭露 |\n| --- | --- | --- | --- |\n| Public domain / CC0 metadata | NCBI metadata、OpenAlex（依其目前條款） | 可依 provider policy 建本地 index；仍保存版本與 attribution | source、snapshot、查詢日期 |\n| Open with attribution/share-alike | Reactome、UniProt、部分 aggregated data | 保留 attribution；衍生輸出檢查 ShareAlike／嵌入來源 | license URL、upstream provenance |\n| Custom API license | Semantic Scholar 等 | 遵守 rate、retention、repackaging 限制；bulk dataset 另看 dataset terms | key mode、usage/redistribution caveat |\n| Institutional/commercial | ClinicalKey、Scopus、Web of Science | default off；tenant/credential scoped；禁止未授權共用 corpus | entitlement、retention、不可重散布提醒 |\n| Article-level full text | Europe PMC/PMC OA、publisher PDF | 每篇依 license 處理；metadata 可開放不代表 PDF 可重散布 | OA status、license、resolver/source |\n| Sensitive aggregate/clinical context | adverse-event、patient-oriented APIs | 最小化輸入與 retention；不得重識別；不輸出未支持的臨床結論 | data limitation、非因果／非醫療建議 |\n\n每個 source/section outcome 至少要帶：\n\n- `source_key`、canonical provider/host、direct/indirect/derived。\n- request mode：live API、bulk snapshot、cache replay、institutional resolver。\n- source status、degraded/error classification、retrieved_at。\n- dataset release/schema/index version（適用時）。\n- license/terms/attribution URL 與 redistribution class。\n- identifier evidence 與 conflicts；不要讓 aggregator 名稱抹掉原始 provider。\n\n## 11. Skills、tests 與 release engineering\n\n### 11.1 Deterministic request contracts\n\nBioMCP 將 routine tests 從 public-upstream availability 中拆出：request value、source request plan、fixture response/status mapping、entity orchestration、renderer/envelope 各自可 deterministic 驗證；live provider checks 留在 opt-in/release lane。設計依據見 [Request-Contract Test Architecture](https://github.com/genomoncology/biomcp/blob/main/architecture/technical/request-contract-test-architecture.md)。\n\n本專案應採用的測試層：\n\n1. Domain/unit：query normalization、dedup identity、ranking、rights policy、source outcome state machine。\n2. Infrastructure request contract：method/path/params/headers（secret redacted）、paging/batch、rate headers、status mapping、bounded body。\n3. Application orchestration：planner legs、partial failure、fallback、broker fairness、artifact/Chronicle persistence。\n4. MCP contract：`tools/list`、schema、唯一 generic search invariant、tool annotations、structured output/provenance。\n5. HTTP/service edge：auth、Host/Origin、tenant isolation、path traversal、quota、response cap、health/readiness。\n6. Smoke：local stdio、local Streamable HTTP、authenticated service、packaged install。\n7. Opt-in live：各 provider 小型 canary，允許合理的 unavailable/rate-limit 分類，不把內容 exact match 當 routine gate。\n\nCaptured fixtures 必須最小化、去識別化、標明來源與 rights；沒有重散布權時使用 synthetic contract fixture 或 private CI artifact，不應直接 commit 完整商業 payload。\n\n### 11.2 Release artifacts\n\nBioMCP 的 stage/promote 流程會先對 exact source SHA 建置私有 candidate、產生 manifest/hash/signing evidence，再經 protected approval 發布 immutable versioned bytes；公開各平台安裝 smoke 成功後才移動 `latest`。見 [Release Process](https://github.com/genomoncology/biomcp/blob/main/docs/reference/release-process.md) 與 [release workflow](https://github.com/genomoncology/biomcp/blob/main/.github/workflows/release.yml)。\n\n本專案可漸進採用：\n\n- 版本、lockfile、package metadata、MCP registry metadata、docs/tool count 同步 gate。\n- wheel/sdist/container 建置 manifest，記錄 source SHA、dependency lock、SBOM 與 SHA-256。\n- 先安裝 build artifact 再跑 MCP stdio/HTTP smoke，不只在 source checkout 測試。\n- docs site、README、wiki mirror、skills、Copilot/Cline assets 以生成或 drift tests 保持一致。\n- release promotion 與 mutable latest 分離；失敗保留 partial record，不把半成功狀態當 release。\n\n不需照搬 BioMCP 的全平台簽章矩陣才開始受益；先確保「測試的是即將發布的 exact artifact」即可大幅降低風險。\n\n## 12. 本專案逐項對照與採用矩陣\n\n| BioMCP 概念 | 本專案已有 | 主要缺口 | 決策 | 以本專案方式落地 |\n| --- | --- | --- | --- | --- |\n| One grammar | capability groups、單一 literature gateway | 各 docs/skills 的用語仍可能漂移 | **採用語意** | `unified_search` + typed follow-ups；不以 shell string 取代 typed MCP schema |\n| Entity/source catalog | centralized source/tool registry；已加入 mode/paging/limit/batch/data-plane capabilities | 通用 rights、quota、health/freshness metadata 尚未完成 | **已落地核心，持續深化** | `SourceCapabilities` + infrastructure adapter registration |\n| Article federation | PubMed、OpenAlex、S2、Europe PMC、CORE 等 parallel legs；OA semantic/cursor 與 S2 bulk 已由 planner 選擇 | planner/executor 仍在 presentation；另缺 distributed budget/fair-share planning | **已落地 provider modes，DDD 遷移待完成** | 先維持單一 `unified_search`，再把純 planning/execution core 下移 application |\n| Front-door validation | source expression、limits、query analysis | filter/source compatibility matrix | **採用** | 執行前產生 bounded query plan 與 validation errors |\n| Cross-ID dedup | PMID/DOI 等 normalized article merge | conflict observations、source-local rank 可更完整 | **採用** | domain identity evidence，保留 matched sources/conflicts |\n| Source balancing/ranking | RRF、quality、disagreement、reproducibility | merge/cap/signals audit 可更明確 | **採用** | policy-driven ranking trace，不能讓 merge order 成為偏好 |\n| Counts-first | `options=\"counts_first\"` | approximate/available/materialized count 語意 | **已有，補強** | 同一 `unified_search` envelope 與 artifact |\n| Progressive sections | compact output、follow-up tools、artifacts | 跨工具 section outcome type 未完全一致 | **已有，收斂** | canonical `section_provenance` + omission/artifact contract |\n| `next_commands` | `next_tools`、`next_commands` | typed args 與字串投影需固定優先順序 | **已有，補強** | typed next action 為真源，字串只是 rendering |\n| Cross-entity pivots | discovery、NCBI entity tools、pipeline | pivot provenance/query handoff 尚可統一 | **採用概念** | suggestions/pipeline/Chronicle，不新增大量 helper tools |\n| Bounded batch | pipeline/parallel execution、S2 500-ID ordered batch、OA cursor/S2 token bounds | 跨 provider 的共用 batch outcome 與 coalescing | **已部分落地** | 固定上限、partial/null slots 與 repeated continuation 防護 |\n| Local study/data plane | sessions、artifacts、pipeline、Chronicle；S2 release/dataset/diff metadata client | partition ingestion、checkpoint、local index/runtime adapter | **metadata plane 已落地，index 待辦** | 聚焦 scholarly datasets；不直接擴張 cohort analytics |\n| Health/source readiness | HTTP probes、source errors | capability/key/quota/freshness 的統一快照 | **採用並深化** | probe 輕量，詳細 source health 需授權且不洩漏 tenant 狀態 |\n| Process-local rate limiting | source clients 已有限速/retry | 多 tenant 共用 key 的公平與全域 budget | **不接受為終態** | shared broker/global limiter + per-tenant fairness |\n| Host allowlist | local/service Host/Origin policies | 需持續 edge tests | **採用但不視為 auth** | service bearer + HTTPS + trusted proxy + allowlists |\n| Remote no-auth core | 本 repo service 已 fail closed | 無 | **不採用** | local 與 service profiles 明確分離 |\n| Source licensing inventory | `access_tier`、source docs、ClinicalKey operation/retention allowlist | 所有來源共用的 machine-readable rights/retention/redistribution | **restricted adapter 已落地，通用 schema 待辦** | rights profile 與 source contract/tests |\n| Embedded skills/playbooks | Claude/Cline/Copilot/Codex assets | bundle version/hash/stale state | **採用** | canonical source + generated copies + skill audit |\n| Executable Markdown specs | docs/tests sync、pytest contracts | 少數跨層 user journey 可更可讀 | **選擇性採用** | 關鍵 journey 用 executable examples；domain logic 留 pytest |\n| Deterministic/live split | 多數 tests 可 mock；已有 smoke | provider fixtures與 live classification 可更一致 | **採用** | routine offline，live opt-in/release |\n| Sealed release promotion | uv lock、CI、release docs | exact artifact manifest/platform install smoke | **分階段採用** | hash/SBOM/wheel-container smoke，之後再加 signing |\n| Rust rewrite | Python DDD 與 MCP SDK v2 | 無正當收益證據 | **不採用** | 先優化 async clients、broker、contracts；以測量決定熱點 |\n\n## 13. 建議的 DDD 目標架構\n\n```mermaid\nflowchart LR\n    Client[MCP / Python API / HTTP client]\n    Presentation[Presentation\\nunified_search schema\\nfollow-up tools]\n    Application[Application\\nquery planner · broker policy\\nmerge/rank · pipeline · Chronicle]\n    Domain[Domain contracts\\nSourceCapability · QueryPlan\\nEvidenceSection · RightsProfile\\nSourceOutcome · SnapshotRef]\n    Infra[Infrastructure adapters\\nPubMed · OpenAlex · S2 · Europe PMC\\nCORE · commercial/institutional\\nbulk snapshots · cache · rate broker]\n    Tenant[Tenant-scoped stores\\nsession · artifacts · export\\nchronicle · pipeline]\n\n    Client --> Presentation\n    Presentation --> Application\n    Application --> Domain\n    Application --> Infra\n    Application --> Tenant\n    Infra --> Domain\n```\n\n### 13.1 Presentation\n\n- `unified_search` 維持唯一 generic literature search tool。\n- `sources` 與 `options` 只表達 intent；不承載 provider business logic。\n- MCP response 以 typed envelope 回傳 plan summary、source outcomes、articles、counts、next actions、section provenance 與 artifact summary。\n- source-specific operator/bulk sync 若需要公開入口，優先做 CLI/admin API，不能偽裝成第二個文獻搜尋 MCP tool。\n\n### 13.2 Application（目標與現況差距）\n\n- Query planner 已能根據 query analysis、registered search capabilities 與 requested mode/depth 產生 legs，但實作目前仍在 presentation package；application service 只是 injected-runner facade。下一階段應先抽出不依賴 MCP Context/session formatting 的 planner/broker core，再由 presentation adapter 注入 progress、session 與 renderer callbacks。\n- Broker 已協調同 process provider limiter、parallel legs、retry/partial failure 與 bounded provider paging；它同樣仍有 presentation ownership 技術債，且跨 process global quota、tenant provider fairness 與通用 coalescing尚待完成。\n- Aggregator 負責 identity observations、dedup、source balancing、ranking、disagreement 與 reproducibility。\n- Pipeline 保存可重跑 DAG；Research Chronicle 保存版本化縱向證據；兩者不依賴 presentation transport。\n\n### 13.3 Domain\n\n已落地與目標核心型別：\n\n- `SourceCapabilities`（已落地）：search modes、paging/batch、page/mode limits、count/provenance 與 operator data-plane status；filters、credential、rate/quota、health、rights 尚待擴充或由獨立 policy 組合。\n- `UnifiedSearchPlan` / source leg（已落地核心）：normalized intent、route、limits、requested retrieval mode；budget/fallback decision trace 尚待補強。\n- `SourceSearchPage` / `SourceAdapterResult`（已落地）：raw items、total/continuation、query/mode/cost/warnings 與 adapter status/metadata；latency/attempts/retrieved_at 尚未完全統一。\n- `EvidenceIdentity`：PMID/PMCID/DOI/S2/OpenAlex IDs 與 observation/conflict。\n- `EvidenceSection`：直接/間接/衍生來源、fields、omission、rights、snapshot。\n- `SourceDataGovernancePolicy`（ClinicalKey 已落地）：allowed operations/output fields、retention 與 entitlement/end-user gates。\n- `RightsProfile`（後續）：跨來源 access、retention、redistribution、attribution、commercial/institutional restrictions。\n- `SnapshotRef`（後續）：release、diff range、hash、schema/index version。\n\n### 13.4 Infrastructure\n\n- Provider clients 只實作 plan execution 與 normalization，不決定產品層 source routing。\n- OpenAlex cursor/select/semantic 與 Semantic Scholar bulk 能力已經 capability 宣告供 planner 使用；S2 batch/dataset metadata client 已存在，但不是公開 search tool 或 local-index runtime。\n- ClinicalKey RAG/clinical answer API 不等同 article index；本輪 adapter 已 credential/entitlement/contract/end-user gated、explicit opt in、只回引用 metadata，且不把生成答案混入 canonical article ranking 或任何 persistence。\n- 對 provider-returned URLs、redirect、download、archive、response size 與 XML/JSON parsing 統一套用 SSRF、bounded-body 與 content-type policy。\n\n## 14. `unified_search` 唯一入口的不變量\n\n### 14.1 定義\n\n「唯一 generic search」是指：對任意一般生醫／學術文字查詢，搜尋多個文獻索引並回傳文章集合的 MCP tool 只有 `unified_search`。\n\n以下不是 generic literature search，因此不構成違反：\n\n- `search_gene`、`search_compound`、`search_clinvar`：查 NCBI structured entities。\n- `search_biomedical_images`：搜尋視覺資產，不回傳一般 article result set。\n- citations/references/related tools：從已知 seed article 做 graph navigation。\n- query intelligence：產生／驗證查詢，不自行建立平行 article-search result universe。\n- fulltext/export/session/pipeline/Chronicle：對既有證據做取得、保存、分析或交付。\n\n### 14.2 必要 regression contracts\n\n每次 tool surface、source 或 MCP SDK 更新後都應驗證：\n\n1. `TOOL_CATEGORIES[\"search\"][\"tools\"] == [\"unified_search\"]`。\n2. runtime `tools/list` 與 registry 完全同步，且只有一個被標記為 generic literature search。\n3. hook/policy、tools index、README、docs site、wiki mirror、skills examples 都只教 `unified_search` 作為文獻搜尋入口。\n4. legacy names 如 `search_literature`、`search_pubmed`、`search_core` 不再註冊；文件中的歷史說明要清楚標為 deprecated/non-runtime。\n5. 新 source integration 測試必須從 `unified_search(sources=...)` 或 planner/application facade 進入，不以新增 MCP tool 作捷徑。\n6. Python SDK 使用穩定 `pubmed_search.api` facade，不直接匯入 presentation tool function。\n\n## 15. Research Chronicle：不應被 BioMCP entity model 取代\n\nBioMCP 擅長由已知 entity 進行即時橫向 pivot；Research Chronicle 解的是另一個問題：某一研究主題如何隨時間形成、分支、產生 milestone，且後續資料更新後有哪些**可證明的變化**。\n\n本專案應維持下列 Chronicle invariants：\n\n- revision immutable，index/visualization 是可重建衍生物。\n- 每個 event 有 PMID/DOI/source/query/snapshot evidence，不以 LLM 記憶補齊。\n- `diff` 的 absence 表示 `not_observed_in_revision`，不是研究已被撤回或淘汰。\n- milestone、lineage branch 與 narrative 要揭露 heuristic/fallback/coverage diagnostics。\n- Mermaid/SVG 簡化時，完整 chronicle map/audit 仍可讀。\n- authenticated service 下 revisions、artifacts、comparisons 與 saved pipelines 全部 tenant scoped。\n\nBioMCP 可提供的學習點是把 entity pivots、section sources 與 local snapshot 版本送進 Chronicle evidence；不應把 Chronicle 縮成 `next_commands`，也不應以一次 `search all` counts 取代版本化研究史。\n\n## 16. 明確不採用的設計\n\n| 不採用項目 | 原因 | 可接受替代 |\n| --- | --- | --- |\n| 為每個 provider 新增 search MCP tool | 造成 tool 選擇歧義、docs 漂移、來源結果宇宙分裂 | `unified_search(sources=...)` + planner capability |\n| 直接複製 BioMCP entity/tool breadth | 本產品核心是文獻證據生命週期，不是全生醫資料 CLI | structured entity 作 query/pivot input，必要時獨立 plugin |\n| 以自由 shell command 字串作主要 MCP schema | 難做 typed validation、policy、telemetry redaction 與 client discovery | typed MCP tools；字串只作 human-readable next command |\n| 因效能印象全面重寫 Rust | 高遷移成本，未證明 Python async 是主要瓶頸 | 先量測 client/broker/parser；只優化明確熱點 |\n| 遠端只做 Host allowlist | Host policy 不提供身分、TLS 或 tenant authorization | authenticated service + HTTPS + principal-scoped state |\n| 多人環境維持 process-local limiter | 多 process/replica 可一起超過 provider quota且不公平 | shared/global broker budget + per-tenant scheduling |\n| 將 local bulk dataset 視為任意可重散布 cache | API access 不等於 redistribution license | rights manifest、operator opt in、tenant/provider policy |\n| routine CI 依賴 live public API | flaky、不可重現、容易耗 quota | deterministic request/fixture contracts + opt-in live smoke |\n| 把缺失 adverse-event/interaction row解讀為安全 | coverage 與 reporting bias 不支持否定結論 | explicit unknown/coverage limitation/provenance |\n| 立即加入完整 cohort/survival/chart product | 超出 literature-search bounded context | export/pipeline integration 或獨立分析服務 |\n\n## 17. 分階段落地狀態與驗收條件\n\n### P0：鎖定表面與來源合約（本輪核心完成）\n\n- 已將唯一 generic search invariant、runtime registry sync、hook policy 與 legacy-name absence 寫入 regression tests。\n- 已為主要 search sources 加入 mode/paging/limit/batch/data-plane capabilities；ClinicalKey 另有 fail-closed governance policy。\n- 已以 `SourceSearchPage` / `SourceAdapterResult` 定義 typed page/outcome seam；跨來源通用 rights/health schema 仍留在後續。\n\n**驗收**：tool count 不因 provider 增加而新增 generic search；每個 source 可說明 filter、paging、credential、rate、rights 與 failure state。\n\n### P1：深化 federation 與 agent envelope（本輪 provider 核心完成）\n\n- OpenAlex semantic/cursor 與 Semantic Scholar bulk 已由 `unified_search` planner 選擇；S2 batch 與 dataset metadata 保持 infrastructure/operator capability。\n- `retrieval_mode`、`source_metadata`、logical/physical query、continuation、cost/rate 與 warnings 已進 structured output/artifact。\n- 已加入 capability mismatch、Boolean compiler、paging termination、raw-page mapping、HTTP error/redaction 與 single-search surface tests；跨 provider dedup conflict trace 仍可深化。\n\n**驗收**：任一 source timeout/429 不會抹掉其他 legs；回應能精確解釋 queried/responded/materialized/deduplicated counts 與 degraded reason。\n\n### P2：offline snapshot、distributed quota、rights 與 operations（後續）\n\n- 在已完成的 S2 metadata manifest client 上建立 operator-only partition ingestion、checkpoint/atomic publish 與 local index interface；為 OpenAlex snapshot 建立相同 contract。\n- 加入跨 process/replica shared quota ledger 與 per-tenant provider fairness。\n- 建立跨來源 machine-readable rights/retention/redistribution profile。\n- Chronicle revision 綁定 source snapshot/query plan；diff 可辨識來源更新與新增證據。\n- health/readiness 顯示 capability、credential、quota/freshness 的安全摘要。\n- release artifact 加入 manifest/hash、installed wheel/container smoke 與 docs/skill drift gates。\n\n**驗收**：同一 query + 同一 snapshot 可重現；跨 snapshot 差異有 provenance；多人 service 不跨 tenant 讀取 snapshot-derived artifact 或受限來源 payload。\n\n## 18. 最終判斷\n\nBioMCP 證明「生醫 MCP 的價值不只是 API 數量」：真正的產品層在於 capability honesty、低噪音定向、可追蹤 pivot、來源級 provenance、local/live 資料協作，以及可執行的操作與發行合約。\n\nPubMed Search MCP 應把這些概念吸收到既有優勢中，而不是變成 BioMCP 的 Python 複製版：\n\n- 對使用者，保留一個清楚的文獻入口：`unified_search`。\n- 對 application，把目前 presentation-hosted 的 capability-aware planner/broker core 正式下移，再深化成跨 process 公平 quota 協調器。\n- 對證據，保留 identifier observations、section provenance、rights 與 snapshot version。\n- 對長期研究，讓 pipeline、artifact 與 Research Chronicle 提供可重跑、可 diff、可稽核的生命週期。\n- 對多人部署，認證、tenant isolation、全域 quota 與資料權利優先於「可連上就算完成」。\n- 對工程交付，以 deterministic contracts 驗證行為，以 opt-in live smoke 驗證外部世界，以 exact artifact smoke 驗證真正要發布的產品。\n\n這樣的採用方式保留 BioMCP 最成熟的思想，同時維持本專案在文獻搜尋、研究演進、可重現性與多人安全上的獨立產品定位。\n",
-  "troubleshooting": "<!-- Generated from docs/INTEGRATIONS.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# Integrations & Operations Guide\n\nThe complete operator-facing extension of the README: choose a runtime contract,\nconnect an AI client, configure the multi-source and browser brokers, verify the\nmodern MCP SDK v2 protocol, and recover common failures.\n\n> **Quick Start**: For minimal configuration snippets, see the main [README.md](#/overview#configuration).\n\n---\n\n## Table of Contents\n\n- [Integrations & Operations Guide](#integrations--operations-guide)\n  - [Table of Contents](#table-of-contents)\n  - [Runtime and Transport Contracts](#runtime-and-transport-contracts)\n    - [MCP SDK v2 Protocol Baseline](#mcp-sdk-v2-protocol-baseline)\n    - [stdio (Default)](#stdio-default)\n    - [Local Loopback Streamable HTTP](#local-loopback-streamable-http)\n    - [Multi-User Service](#multi-user-service-auth-and-tenant-isolation)\n    - [Auxiliary HTTP APIs](#auxiliary-http-apis)\n    - [Python SDK Facade](#python-sdk-facade)\n    - [Persistent Artifact Retrieval](#persistent-artifact-retrieval)\n  - [Environment Variables](#environment-variables)\n    - [Source Selection and Source Gating](#source-selection-and-source-gating)\n    - [Commercial Connectors](#commercial-connectors)\n    - [Getting API Keys](#getting-api-keys)\n  - [Client Configurations](#client-configurations)\n    - [VS Code / Cursor](#vs-code--cursor)\n    - [Claude Desktop](#claude-desktop)\n    - [Claude Code](#claude-code)\n    - [Zed AI](#zed-ai)\n    - [OpenClaw 🦞](#openclaw-)\n    - [Cline](#cline)\n    - [Microsoft Copilot Studio](#microsoft-copilot-studio)\n    - [Other MCP Clients](#other-mcp-clients)\n  - [Verification \\& Troubleshooting](#verification--troubleshooting)\n    - [Quick Health Check](#quick-health-check)\n    - [Common Issues](#common-issues)\n    - [Debug Mode](#debug-mode)\n  - [Advanced: Proxy \\& Network](#advanced-proxy--network)\n  - [Advanced: Docker Deployment](#advanced-docker-deployment)\n\n---\n\n## Runtime and Transport Contracts\n\nChoose the trust boundary before choosing client-specific options:\n\n![Client integration and deployment workflow](images/integration-deployment-workflow.svg)\n\n| Contract | Entry point | State and network boundary |\n| --- | --- | --- |\n| **Local stdio** | `uvx pubmed-search-mcp` | One local OS user, durable local store, no MCP listening port |\n| **Local loopback HTTP** | `pubmed-search-mcp-http --mode local --host 127.0.0.1` | Trusted single-user integration; MCP requests share the durable `default` tenant |\n| **Multi-user service** | `pubmed-search-mcp-http --mode service` | Remote/team use behind HTTPS; bearer principal and Host/Origin allowlists are mandatory |\n\n### MCP SDK v2 Protocol Baseline\n\nThis release uses `mcp>=2.0,<3` and the modern 2026-07-28 MCP request model.\nA current HTTP client sends JSON-RPC `tools/list` and `tools/call` requests\ndirectly; it does **not** begin with `initialize` and does not depend on\n`Mcp-Session-Id`. Service clients must send their bearer credential on every\nprotected request. Legacy protocol compatibility, when used by an older client,\nnever becomes an identity, authorization, or persistence boundary.\n\nUse Streamable HTTP for current remote clients. The legacy SSE transport remains\navailable only as a compatibility surface. See the\n[MCP protocol update](https://blog.modelcontextprotocol.io/posts/2026-07-28/)\nand the repository's [deployment smoke checklist](#/deployment#10-%E9%A9%97%E8%AD%89%E6%B8%85%E5%96%AE).\n\n### stdio (Default)\n\nThe client spawns the server as a subprocess and communicates via stdin/stdout.\nNo networking configuration is needed. The stdio entry point always uses local\nmode and does not start an auxiliary HTTP listener unless\n`PUBMED_STDIO_AUX_HTTP=1` is explicitly set.\n\n```bash\nuvx pubmed-search-mcp\n```\n\n### Local Loopback Streamable HTTP\n\nFor a local connector or protocol smoke test:\n\n```bash\n# Local loopback HTTP\npubmed-search-mcp-http --mode local --transport streamable-http \\\n  --host 127.0.0.1 --port 8765\n\n# Via run_copilot.py (12-tool primitive-schema smoke for Copilot Studio)\nuv run python run_copilot.py --port 8765\n```\n\nThe simplified inventory includes `unified_search` plus primitive-schema\n`read_session`, so a Copilot smoke can inspect durable search runs, obtain\nnon-executing replay arguments, and read a persisted artifact without switching\nto the full schema.\n\nThe MCP endpoint is available at `http://localhost:8765/mcp`. Do not change only\nthe bind address and treat this as a remote service. Explicit local mode is a\ntrusted single-user contract: its loopback MCP requests use the durable\n`default` tenant, so `pmids=\"last\"`, sessions, article cache, and exports survive\nacross requests and reconnects. The launcher-enforced loopback bind and\nHost/Origin allowlists are the security boundary.\n\n> **Note**: Legacy SSE (`--transport sse`) is retained for older integrations;\n> new deployments should use Streamable HTTP.\n\n### Multi-User Service (Auth and Tenant Isolation)\n\nService mode is fail closed. It refuses startup unless bearer credentials, the\npublic resource-server URL, and Host/Origin allowlists are all configured:\n\n```bash\nexport PUBMED_SERVER_MODE=service\nexport PUBMED_AUTH_TOKENS=\"team-a:$(openssl rand -hex 32),team-b:$(openssl rand -hex 32)\"\nexport PUBMED_AUTH_RESOURCE_SERVER_URL=\"https://mcp.example.org/mcp\"\nexport PUBMED_AUTH_ISSUER_URL=\"https://mcp.example.org\"  # optional; defaults to resource origin\nexport PUBMED_ALLOWED_HOSTS=\"mcp.example.org\"\nexport PUBMED_ALLOWED_ORIGINS=\"https://mcp.example.org\"\nexport PUBMED_TRUSTED_PROXY_IPS=\"127.0.0.1\"  # only the actual TLS proxy\npubmed-search-mcp-http --mode service --transport streamable-http --host 0.0.0.0 --port 8765\n```\n\nClients then present the token as a bearer credential:\n\n```jsonc\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"http\",\n      \"url\": \"https://mcp.example.org/mcp\",\n      \"headers\": { \"Authorization\": \"Bearer <your token>\" }\n    }\n  }\n}\n```\n\nEach authenticated principal gets its **own** session, article cache, search\nhistory, `pmids=\"last\"`, artifacts, exports, chronicles, and pipelines. An MCP\ntransport session identifier is protocol lifecycle state, not tenant identity or\nauthorization, and never grants persistence.\n\nFilesystem-facing capabilities are deliberately narrower for authenticated\nservice callers:\n\n| Capability | Local stdio / loopback HTTP | Authenticated service |\n| --- | --- | --- |\n| Saved pipelines | `workspace`, `global`, or `auto`; caller may load `file:path.yaml` | Tenant-derived store only; `auto` resolves below that principal's data root and `file:` reads are rejected |\n| Literature notes | Caller may choose `output_dir` and `template_file` | Caller cannot choose host paths or read a template file; built-in formats write below `<tenant-root>/references/` |\n| Scheduler | May be enabled for a trusted local process | Disabled by `docker-compose.service.yml`; future scheduling needs one leader/lease, not one scheduler per request worker |\n| Institutional settings | Local user may configure process-owned access settings | Authenticated callers cannot mutate process-global institutional configuration |\n| Server-local paths | May be exposed explicitly to a trusted local client | Redacted by default; remote clients retrieve artifacts through `read_session` |\n\nThe word `workspace` never means a shared team directory in service mode. A\ntenant-derived pipeline store intentionally drops the process-wide workspace\nroot so one principal cannot read another principal's repository files.\nAuthenticated service callers cannot read `file:` paths from the server\nfilesystem; save the pipeline in the current tenant store and load it by name.\nThey also cannot choose `output_dir` or `template_file` for notes; use a built-in\nformat in the principal-scoped `references/` directory.\n\nFor containers, use `docker-compose.yml` only as a single-user loopback demo and\n`docker-compose.service.yml` for the authenticated, persistent, single-replica\nservice. See [DEPLOYMENT.md](#/deployment) for the complete contract.\n\n### Auxiliary HTTP APIs\n\n![Session cache and auxiliary HTTP API workflow](images/session-cache-and-http-api.svg)\n\nBesides the primary MCP contract at `/mcp`, the packaged HTTP CLI exposes\nauxiliary routes. Only liveness/readiness metadata is public in service mode;\ntenant data and exports require the same bearer principal as MCP:\n\n| Endpoint | Purpose |\n| --- | --- |\n| `/health` | Liveness probe (open) |\n| `/ready` | Readiness probe: transport, whether auth is enforced, active tenant count (open) |\n| `/api/cached_article/{pmid}` | Read one cached article, optionally fetch on miss |\n| `/api/cached_articles?pmids=...` | Read multiple cached articles |\n| `/api/session/summary` | Read current session summary |\n| `/exports` | List opaque export ids belonging to the current local or authenticated tenant |\n| `/download/{export_id}` | Download one opaque export id belonging to that tenant |\n\nIn service mode, `/api/*`, `/exports`, and `/download/*` require the same bearer\ntoken as `/mcp` and return only that principal's data. `/health` and `/ready`\nstay open for orchestrator probes. In explicit local mode these routes use the\nsame durable single-user `default` tenant as `/mcp`; in service mode an\nanonymous request is always rejected and never falls back to local state.\n\nThis auxiliary API is a convenience for cache and session reads; it is **not** the\nprimary MCP tool contract. For agent tool discovery and normal runtime usage,\n`/mcp` remains the canonical external interface.\n\n### Python SDK Facade\n\nFor in-process Python integrations, use the SDK facade instead of importing MCP\ntool modules or relying on auxiliary HTTP endpoints:\n\n```python\nfrom pubmed_search.api import PubMedSearchClient, PubMedSearchConfig\n\nclient = PubMedSearchClient(PubMedSearchConfig(email=\"your@email.com\"))\nresult = await client.unified_search(\"remimazolam ICU sedation\", limit=20)\n\narticles = result.articles\nsource_counts = result.source_counts\nartifact = result.artifact\n```\n\nUse `/mcp` for agent tool discovery and task-oriented MCP calls. Use\n`pubmed_search.api` for Python package, notebook, or application code that wants\nan in-process object contract.\n\n### Persistent Artifact Retrieval\n\nWhen session persistence is enabled, `unified_search` and `get_fulltext` write\ncomplete reusable outputs to local artifact files and return a compact\n`artifact` locator in the MCP response. Local path fields are redacted by\ndefault; set `PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true` for local MCP clients\nthat should receive `local_path` and `manifest_path` directly. Remote clients\nshould use the MCP session facade:\n\n```text\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_id=\"...\", artifact_file=\"payload.json\", offset=0, max_chars=200000)\nread_session(action=\"list_artifacts\", include_local_paths=true)\n```\n\n`read_session(action=\"artifact\")` reads existing artifact files only; it does\nnot repeat upstream source calls. Use `offset` and `max_chars` to page through a\nlarge artifact from remote clients. `read_session` redacts local paths by\ndefault; pass `include_local_paths=true` for local-server workflows.\nThe `local_path` and `manifest_path` fields are paths on the MCP server host,\nnot portable client paths. Full-text artifacts can contain copyrighted,\nsubscription, or institutionally accessed article text; keep redistribution and\nretention aligned with the applicable publisher, license, and institutional\nterms.\nLarge `get_fulltext` responses are capped inline when an artifact is available;\nuse `read_session(action=\"artifact\", ...)` to retrieve the saved full content.\n\n`unified_search` can also return partial source diagnostics without failing the\nwhole query. JSON responses use `source_errors`; markdown responses include a\n`Source warnings` line. Semantic Scholar HTTP 429 warnings recommend setting\n`S2_API_KEY` / `SEMANTIC_SCHOLAR_API_KEY`, retrying later, or excluding the\nsource with `sources=\"auto,-semantic_scholar\"` /\n`PUBMED_SEARCH_DISABLED_SOURCES=semantic_scholar`.\n\n---\n\n## Environment Variables\n\nSemantic Scholar accepts either `S2_API_KEY` or `SEMANTIC_SCHOLAR_API_KEY`.\nIf repeated 429 responses appear in Cline or other MCP clients, set a key or\ntemporarily disable the source with `PUBMED_SEARCH_DISABLED_SOURCES=semantic_scholar`.\n\nLive provider queries and bulk datasets are intentionally separate. Semantic\nScholar release/manifest/diff inspection is an operator data-plane workflow;\nit never downloads a dataset partition during `unified_search`. OpenAlex cursor\nand native semantic modes are likewise bounded broker capabilities, while an\nentire-corpus mirror must use the operator snapshot path. See\n[Semantic Scholar data plane](#/semantic-scholar-api),\n[OpenAlex search/data plane](#/openalex-api), and the\n[ClinicalKey AI licensed boundary](#/clinicalkey-ai).\n\nProvider-native execution stays behind the single literature-search facade:\n\n```text\nunified_search(query=\"treatment resistance\",\n               sources=\"openalex\",\n               options=\"native_semantic\")\n\nunified_search(query=\"melanoma AND immunotherapy\",\n               sources=\"pubmed,openalex,semantic_scholar\",\n               options=\"systematic\")\n```\n\nThe flags are mutually exclusive and disable multi-strategy deep expansion.\nExplicit unsupported source/mode pairs fail before I/O; automatic mode keeps\ncapable sources only. The per-source MCP `limit` stays at most 100. Inspect\n`source_metadata` and the artifact's `query_strategy.json` for the actual\nprovider mode, compiled/canonical query, continuation, cost/rate fields, and\nwarnings. This bounded mode is not an exhaustive systematic-review claim.\n\n| Variable | Required | Description | Default |\n| --- | --- | --- | --- |\n| `NCBI_EMAIL` | **Yes** | Email for NCBI API policy compliance | `pubmed-search@example.com` |\n| `NCBI_API_KEY` | No | NCBI API key for higher rate limits (10 req/s vs 3 req/s) | — |\n| `CORE_API_KEY` | No | [CORE API](https://core.ac.uk/services/api) key for open access search | — |\n| `S2_API_KEY` / `SEMANTIC_SCHOLAR_API_KEY` | No | Semantic Scholar `x-api-key`; improves live quota stability and is required to obtain dataset partition/diff URLs | — |\n| `OPENALEX_API_KEY` | No | OpenAlex API key for a higher credit budget; runtime decisions still use response rate/cost metadata | — |\n| `CLINICALKEY_AI_ENABLED` | No | Enables only the default-off ClinicalKey application/data-plane adapter; it never adds an MCP tool/source | `false` |\n| `CLINICALKEY_AI_ENTITLEMENT_CONFIRMED` | ClinicalKey adapter | Operator assertion that licensed API entitlement is active | `false` |\n| `CLINICALKEY_AI_CONTRACT_ACKNOWLEDGED` | ClinicalKey adapter | Operator assertion that MCP/retention/use terms were reviewed for this deployment | `false` |\n| `CLINICALKEY_AI_CLIENT_ID` | ClinicalKey adapter | OAuth client id held by the operator secret store | — |\n| `CLINICALKEY_AI_CLIENT_SECRET` | ClinicalKey adapter | OAuth client secret; never logged or persisted | — |\n| `CROSSREF_EMAIL` | No | Optional CrossRef polite-pool email override. Defaults to the runtime server contact email. | `NCBI_EMAIL`, CLI `--email`, or detected git email |\n| `UNPAYWALL_EMAIL` | No | Optional Unpaywall email override. Defaults to the runtime server contact email. | `NCBI_EMAIL`, CLI `--email`, or detected git email |\n| `PUBMED_SEARCH_DISABLED_SOURCES` | No | Comma-separated source keys to globally disable in unified_search and cross-search | — |\n| `PUBMED_SERVER_MODE` | HTTP only | `local` for loopback development or `service` for fail-closed remote/team use | `local` |\n| `PUBMED_LOCAL_ALLOW_CONTAINER_BIND` | No | Explicit local-container exception permitting an internal `0.0.0.0` bind; the host port must still publish only to loopback | `false` |\n| `PUBMED_STDIO_AUX_HTTP` | No | Opt in to the stdio process's loopback auxiliary HTTP API | `false` |\n| `PUBMED_AUTH_TOKENS` | **Service: yes** | Comma-separated `principal:token` credentials; inject from a secret store | — |\n| `PUBMED_AUTH_RESOURCE_SERVER_URL` | **Service: yes** | Public HTTPS MCP resource-server URL, including `/mcp` | — |\n| `PUBMED_AUTH_ISSUER_URL` | No | Issuer advertised in auth metadata; defaults to the public resource URL origin | Resource URL origin |\n| `PUBMED_ALLOWED_HOSTS` | **Service: yes** | Comma-separated public Host allowlist | Safe loopback defaults in local mode |\n| `PUBMED_ALLOWED_ORIGINS` | **Service: yes** | Comma-separated HTTPS Origin allowlist | Safe loopback defaults in local mode |\n| `PUBMED_TRUSTED_PROXY_IPS` | No | Exact reverse-proxy IP allowlist; empty means forwarded headers are not trusted | — |\n| `PUBMED_TENANT_ISOLATION` | Service forces `true` | Keep authenticated principals in separate state/storage scopes | `true` |\n| `PUBMED_TENANT_MAX_CONCURRENCY` | No | Maximum in-flight requests per authenticated principal | `8` |\n| `PUBMED_NOTES_DIR` | No | Local wiki/Foam-compatible/Markdown/MedPaper-style note export directory used by `save_literature_notes` | `PUBMED_WORKSPACE_DIR/references`, `PUBMED_DATA_DIR/references`, then `~/.pubmed-search-mcp/references` |\n| `PUBMED_WORKSPACE_DIR` | No | Workspace root used for pipeline persistence and note export fallback | — |\n| `PUBMED_DATA_DIR` | No | User-level data root used for cache/persistence and note export fallback | `~/.pubmed-search-mcp` |\n| `PUBMED_PROFILING` | No | Enable runtime profiling diagnostics | `false` |\n| `PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS` | No | Include server-local artifact paths for trusted local clients | `false` |\n| `PUBMED_FULLTEXT_INLINE_MAX_CHARS` | No | Maximum inline full-text characters before artifact paging | `20000` |\n| `PUBMED_SCHEDULER_ENABLED` | No | Enable the saved-pipeline scheduler for a trusted local process; the authenticated service Compose profile forces it off | `true` |\n| `PUBMED_SCHEDULER_TIMEZONE` | No | Scheduler timezone | `UTC` |\n| `PUBMED_SCHEDULER_MAX_INSTANCES` | No | Maximum scheduler instances per process; it does not provide distributed leader election | `1` |\n| `SCOPUS_ENABLED` | No | Enable the default-off Scopus connector (`true/false`) | `false` |\n| `SCOPUS_API_KEY` | No | Elsevier Scopus API key. Required when `SCOPUS_ENABLED=true` | — |\n| `SCOPUS_INSTTOKEN` | No | Optional Elsevier institutional token for Scopus | — |\n| `WEB_OF_SCIENCE_ENABLED` | No | Enable the default-off Web of Science connector (`true/false`) | `false` |\n| `WEB_OF_SCIENCE_API_KEY` | No | Clarivate Web of Science API key. Required when `WEB_OF_SCIENCE_ENABLED=true` | — |\n| `OPENURL_RESOLVER` | No | Institutional link resolver base URL | — |\n| `OPENURL_PRESET` | No | Preset name for institutional resolver | — |\n| `OPENURL_ENABLED` | No | Enable/disable OpenURL resolver | `true` |\n| `INSTITUTIONAL_DIRECT_FETCH` | No | Try direct DOI / EZproxy fulltext retrieval inside `get_fulltext` before CORE fallback | `true` |\n| `EZPROXY_ENABLED` | No | Enable EZproxy fulltext retrieval after setting host and cookie | `false` |\n| `EZPROXY_HOST` | No | EZproxy hostname, e.g. `ezproxy.lib.example.edu` | — |\n| `EZPROXY_COOKIE_FILE` | No | Browser-exported cookies JSON file for EZproxy requests | — |\n| `EZPROXY_COOKIE` | No | Inline cookie header string for EZproxy requests | — |\n| `BROWSER_FETCH_CONFIG` | No | Preferred single JSON setting for browser-session broker and auto mode | — |\n| `BROWSER_FETCH_ENABLED` | No | Enable browser-session broker via per-field envs | `false` |\n| `BROWSER_FETCH_AUTO` | No | Auto-use broker when tool call omits allow_browser_session | `false` |\n| `BROWSER_FETCH_BROKER_URL` | No | Local broker endpoint, e.g. `http://127.0.0.1:8766/fetch` | — |\n| `BROWSER_FETCH_TOKEN` | No | Shared bearer token for the local broker | — |\n| `BROWSER_FETCH_ALLOWED_HOSTS` | No | Comma-separated host allow-list for broker targets | — |\n| `BROWSER_FETCH_TIMEOUT` | No | Browser-session client and broker timeout in seconds | `45` |\n| `BROWSER_FETCH_MAX_BYTES` | No | Maximum PDF payload accepted from the broker | `52428800` |\n| `BROWSER_FETCH_REQUIRE_LOCAL` | No | Require the configured broker URL to be localhost | `true` |\n| `BROWSER_FETCH_VERIFY_TLS` | No | Verify TLS when calling an HTTPS broker URL | `true` |\n| `PUBMED_HTTP_API_PORT` | No | Port for background HTTP API (stdio mode) | `8765` |\n| `HTTP_PROXY` / `HTTPS_PROXY` | No | Proxy settings for outbound requests | — |\n| `BROWSER_FETCH_BROKER_TOKEN` | No | Bearer token expected by the local broker server | Falls back to `BROWSER_FETCH_TOKEN`; otherwise a high-entropy runtime token is generated and printed |\n| `BROWSER_FETCH_BROKER_HOST` | No | Broker bind host | `127.0.0.1` |\n| `BROWSER_FETCH_BROKER_PORT` | No | Broker bind port | `8766` |\n| `BROWSER_FETCH_BROKER_HEADLESS` | No | Run broker browser headless | `false` |\n| `BROWSER_FETCH_BROKER_USER_DATA_DIR` | No | Persistent browser profile directory for broker login state | `~/.pubmed-search-mcp/browser-broker-profile` |\n| `BROWSER_FETCH_BROKER_DOWNLOAD_DIR` | No | Temporary broker download directory | `~/.pubmed-search-mcp/browser-broker-downloads` |\n\n### Source Selection and Source Gating\n\n![Search and query intelligence workflow](images/search-query-workflow.svg)\n\n`unified_search` now supports source expressions such as:\n\n```text\nsources=\"pubmed,openalex\"\nsources=\"auto,-semantic_scholar\"\nsources=\"all,-crossref\"\n```\n\nYou can also globally disable sources without changing prompts or client config:\n\n```bash\nPUBMED_SEARCH_DISABLED_SOURCES=semantic_scholar,core\n```\n\nThis applies to unified multi-source dispatch and internal alternate-source cross-search.\n\n### Commercial Connectors\n\nCommercial sources should be wired as **default-off** connectors.\n\nCurrent status:\n\n- `scopus`: connector skeleton is implemented, but it stays unavailable unless both\n  `SCOPUS_ENABLED=true` and `SCOPUS_API_KEY` are present.\n- `web_of_science`: connector skeleton is implemented, but it stays unavailable unless\n  both `WEB_OF_SCIENCE_ENABLED=true` and `WEB_OF_SCIENCE_API_KEY` are present.\n\nRecommended practice for future commercial sources:\n\n- Keep the connector disabled by default.\n- Gate it behind explicit env vars and credentials.\n- Cover behavior with mocked unit tests in CI.\n- Add opt-in live integration tests only in licensed environments.\n\n### Getting API Keys\n\n| Service | How to Get | Benefit |\n| --- | --- | --- |\n| [NCBI API Key](https://www.ncbi.nlm.nih.gov/account/settings/) | Create NCBI account → Settings → API Key | 10 req/s (vs 3 req/s) |\n| [CORE API Key](https://core.ac.uk/services/api) | Register at core.ac.uk | Access 200M+ open access papers |\n| [Semantic Scholar API Key](https://www.semanticscholar.org/product/api) | Request through the official API page | More stable live quota; dataset file/diff manifests require a key |\n| [OpenAlex API Key](https://help.openalex.org/api/authentication/) | Follow the official authentication guide | Higher credit budget; actual rate/cost remains response-driven |\n| Scopus API Key | Elsevier Developer Portal / licensed institutional access | Adds Scopus as an explicit or `all` source when enabled |\n| Web of Science API Key | Clarivate Developer Portal / licensed institutional access | Adds Web of Science as an explicit or `all` source when enabled |\n\n---\n\n## Client Configurations\n\n### VS Code / Cursor\n\n**Config file**: `.vscode/mcp.json` (project-level) or User Settings\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"NCBI_API_KEY\": \"your_api_key\"\n      }\n    }\n  }\n}\n```\n\n**With all optional keys**:\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"NCBI_API_KEY\": \"your_api_key\",\n        \"CORE_API_KEY\": \"your_core_key\",\n        \"S2_API_KEY\": \"your_semantic_scholar_key\",\n        \"OPENALEX_API_KEY\": \"your_openalex_key\",\n        \"CROSSREF_EMAIL\": \"your@email.com\",\n        \"UNPAYWALL_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n**One-time browser-session auto mode**:\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"BROWSER_FETCH_CONFIG\": \"{\\\"enabled\\\":true,\\\"auto_enabled\\\":true,\\\"broker_url\\\":\\\"http://127.0.0.1:8766/fetch\\\",\\\"token\\\":\\\"<random-32-byte-token>\\\",\\\"allowed_hosts\\\":[\\\"jamanetwork.com\\\",\\\"*.jamanetwork.com\\\"]}\"\n      }\n    }\n  }\n}\n```\n\nThis is the recommended VS Code / Cursor setup when you want a single setting that enables authenticated browser fallback automatically. If you prefer separate values, `BROWSER_FETCH_ENABLED`, `BROWSER_FETCH_AUTO`, `BROWSER_FETCH_BROKER_URL`, `BROWSER_FETCH_TOKEN`, and `BROWSER_FETCH_ALLOWED_HOSTS` still work and override the JSON setting.\n\n### Running the local browser broker\n\nThe MCP server only contains the broker client. To eliminate manual browser download prompts, run the companion local broker that intercepts Playwright download events and streams PDF bytes back to MCP.\n\n```bash\nuv sync --extra browser-broker\nuv run playwright install chromium\nuv run python -c \"import secrets; print(secrets.token_urlsafe(32))\"\nuv run pubmed-browser-fetch-broker --token \"<same-random-32-byte-token>\"\n```\n\nUse the generated value in both the broker command and MCP client config; do\nnot reuse a published example token. When `--token` is omitted, the broker\ngenerates and prints a high-entropy runtime token. It always rejects non-loopback\nbinds, Host headers, and browser Origins.\n\nRecommended first run:\n\n1. Start the broker in non-headless mode.\n2. Let the broker open its persistent browser profile.\n3. Sign in to the target publisher or institution once in that browser.\n4. Keep the broker running while MCP issues `get_fulltext` requests.\n\nBecause downloads are intercepted inside the Playwright-controlled browser, publisher PDF flows no longer rely on the operating system's native Save As dialog.\n\n**Verification**: Open Copilot Chat → type `@pubmed-search` → you should see the server listed.\n\n---\n\n### Claude Desktop\n\n**Config file**: `claude_desktop_config.json`\n\n| OS | Path |\n| --- | --- |\n| macOS | `~/Library/Application Support/Claude/claude_desktop_config.json` |\n| Windows | `%APPDATA%\\Claude\\claude_desktop_config.json` |\n| Linux | `~/.config/Claude/claude_desktop_config.json` |\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n**Verification**: Open Claude Desktop → Settings → Developer → you should see \"pubmed-search\" listed and running.\n\n> **Tip**: If `uvx` is not found, use the full path (e.g., `/Users/you/.local/bin/uvx` or `C:\\Users\\you\\.local\\bin\\uvx.exe`).\n\n---\n\n### Claude Code\n\n**Quick setup** (one command):\n\n```bash\nclaude mcp add pubmed-search -- uvx pubmed-search-mcp\n```\n\n**Or via `.mcp.json`** in your project root:\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n**Verification**: Run `claude mcp list` → should show `pubmed-search` as connected.\n\n---\n\n### Zed AI\n\n[Zed](https://zed.dev) supports MCP servers natively via **Custom Server** configuration.\n\n**Config file**: Zed `settings.json` (Command Palette → `zed: open settings`)\n\n```json\n{\n  \"context_servers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n**Alternative setup**: Agent Panel → Settings icon → \"Add Custom Server\"\n\n**Verification**: Open the Agent Panel → the server should appear in the context server list.\n\n**Zed-specific notes**:\n\n- Zed uses `context_servers` (not `mcpServers`)\n- Supports stdio transport only\n- MCP tools are available in Assistant Panel conversations\n- See [Zed MCP docs](https://zed.dev/docs/ai/mcp) for more details\n\n**Using profiles** for different research contexts:\n\n```json\n{\n  \"context_servers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  },\n  \"assistant\": {\n    \"profiles\": {\n      \"literature-review\": {\n        \"name\": \"Literature Review\",\n        \"context_servers\": {\n          \"pubmed-search\": { \"enabled\": true }\n        }\n      },\n      \"coding\": {\n        \"name\": \"Coding\",\n        \"context_servers\": {\n          \"pubmed-search\": { \"enabled\": false }\n        }\n      }\n    }\n  }\n}\n```\n\n---\n\n### OpenClaw 🦞\n\n[OpenClaw](https://docs.openclaw.ai/) uses MCP servers via the [mcp-adapter plugin](https://github.com/androidStern-personal/openclaw-mcp-adapter).\n\n**Step 1**: Install the adapter\n\n```bash\nopenclaw plugins install mcp-adapter\n```\n\n**Step 2**: Configure `~/.openclaw/openclaw.json`\n\n```json\n{\n  \"plugins\": {\n    \"entries\": {\n      \"mcp-adapter\": {\n        \"enabled\": true,\n        \"config\": {\n          \"servers\": [\n            {\n              \"name\": \"pubmed-search\",\n              \"transport\": \"stdio\",\n              \"command\": \"uvx\",\n              \"args\": [\"pubmed-search-mcp\"],\n              \"env\": {\n                \"NCBI_EMAIL\": \"your@email.com\"\n              }\n            }\n          ]\n        }\n      }\n    }\n  }\n}\n```\n\n**Step 3**: Restart and verify\n\n```bash\nopenclaw gateway restart\nopenclaw plugins list  # Should show: mcp-adapter | loaded\n```\n\n---\n\n### Cline\n\nPubMed Search MCP now ships a workspace-scoped Cline overlay so project users do not need to recreate rules by hand:\n\n- `AGENTS.md`: shared baseline used to avoid duplicating common rules across agents\n- `.clinerules/*.md`: Cline-only rules, mostly path-scoped to keep context lean\n- `.clinerules/workflows/*.md`: reusable harness workflows for validation, MCP sync, and dual-agent setup\n- `.vscode/extensions.json`: recommended VS Code extensions for Copilot + Cline + Python support\n- `scripts/setup-vscode-ai-harness.sh`: installs the recommended extension set with one command\n\nThis split keeps shared behavior in one place while leaving Copilot-specific behavior in `.github/` and Cline-specific automation in `.clinerules/`.\n\n**Config file**: `cline_mcp_settings.json`\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"S2_API_KEY\": \"your_semantic_scholar_key\",\n        \"PUBMED_SEARCH_DISABLED_SOURCES\": \"\"\n      },\n      \"alwaysAllow\": [],\n      \"disabled\": false\n    }\n  }\n}\n```\n\nFor repeated Semantic Scholar 429 responses, either provide `S2_API_KEY` /\n`SEMANTIC_SCHOLAR_API_KEY` or set `PUBMED_SEARCH_DISABLED_SOURCES` to\n`semantic_scholar`.\n\nRecommended first-run sequence:\n\n```bash\n./scripts/setup-vscode-ai-harness.sh\n```\n\nThen restart VS Code, confirm Cline sees the workspace rules/workflows, and confirm Copilot Chat lists the `pubmed-search` MCP server from `.vscode/mcp.json`.\n\n---\n\n### Microsoft Copilot Studio\n\n![Copilot Studio deployment flow](images/copilot-studio-deployment-flow.svg)\n\nCopilot Studio requires **Streamable HTTP** transport with a public URL.\n\n**Architecture**:\n\n```text\nCopilot Studio ──HTTPS──▶ ngrok ──HTTP──▶ MCP Server (localhost:8765)\n```\n\n**Step 1**: Start the MCP server with HTTP transport\n\n```bash\n# Option A: Full 45-tool primary MCP surface with an assigned ngrok dev/custom domain\nexport PUBMED_AUTH_TOKENS=\"copilot:$(openssl rand -hex 32)\"\nexport NGROK_DOMAIN=\"your-domain.ngrok.dev\"\n./scripts/start-copilot-studio.sh --with-ngrok\n\n# Option B: the same authenticated service with an assigned ngrok domain\nexport PUBMED_AUTH_TOKENS=\"copilot:$(openssl rand -hex 32)\"\nexport NGROK_DOMAIN=\"your-domain.ngrok.dev\"\n./scripts/start-copilot-ngrok.sh\n\n# Option C: simplified 12-tool local schema smoke (never tunnel this mode)\nuv run python run_copilot.py --port 8765\n\n# Option D: manual service when the public URL is already known\nexport PUBMED_AUTH_TOKENS=\"copilot:$(openssl rand -hex 32)\"\nexport PUBMED_AUTH_RESOURCE_SERVER_URL=\"https://your-domain.ngrok.dev/mcp\"\nexport PUBMED_ALLOWED_HOSTS=\"your-domain.ngrok.dev\"\nexport PUBMED_ALLOWED_ORIGINS=\"https://your-domain.ngrok.dev\"\npubmed-search-mcp-http --mode service --transport streamable-http \\\n  --copilot-compatible --host 127.0.0.1 --port 8765\n```\n\n**Step 2**: Expose the already configured service via ngrok (if not using a\nscript)\n\n```bash\nngrok http --url=your-domain.ngrok.dev 8765\n```\n\n**Step 3**: Configure in Copilot Studio\n\n| Setting | Value |\n| --- | --- |\n| Server name | `PubMed Search` |\n| Server URL | `https://your-domain.ngrok.dev/mcp` |\n| Authentication | Bearer token for service mode; `None` only during an unpublished local smoke test |\n\n**Environment variables** for the authenticated custom-domain ngrok wrapper:\n\n```bash\nexport NGROK_DOMAIN=\"your-domain.ngrok.dev\"\nexport COPILOT_PORT=8765\nexport PUBMED_AUTH_TOKENS=\"copilot:$(openssl rand -hex 32)\"\n./scripts/start-copilot-ngrok.sh\n```\n\nBoth tunnel scripts converge on the same fail-closed `--mode service` launcher.\nThey require bearer credentials plus an assigned `NGROK_DOMAIN`, reject an\nalready occupied backend port, start the loopback service first, and verify\n`/ready` plus unauthenticated `/mcp` rejection before ngrok is started. The\nresource URL and Host/Origin allowlists are derived from that known HTTPS\ndomain. `run_copilot.py` remains loopback-only and must not be tunneled.\n\nThe simplified surface still exposes the generic search as `unified_search`,\nnot a PubMed-only alias. Its primitive schema accepts `query`, `limit`,\n`min_year`, `max_year`, `sources`, and `options`, then delegates to the\nsame unified runner as the primary surface. This keeps the single-search\ncontract while avoiding Copilot Studio `anyOf` / `$ref` schema problems.\n\n> See [copilot-studio/README.md](https://github.com/u9401066/pubmed-search-mcp/blob/master/copilot-studio/README.md) for the full OpenAPI schema and Copilot Studio setup walkthrough.\n\n---\n\n### Other MCP Clients\n\nAny MCP-compatible client can use this server via stdio:\n\n```bash\n# Basic\nuvx pubmed-search-mcp\n\n# With environment variables\nNCBI_EMAIL=your@email.com NCBI_API_KEY=your_key uvx pubmed-search-mcp\n\n# From source (development, stdio)\ncd pubmed-search-mcp\nuv run python -m pubmed_search.presentation.mcp_server\n```\n\n---\n\n## Verification & Troubleshooting\n\n### Quick Health Check\n\nAfter configuring any client, verify the server is working:\n\n1. **Local stdio**: ask the AI to list PubMed tools; it should enumerate 45 tools in the primary MCP surface.\n2. **HTTP probes**: confirm `/health`, `/ready`, and `/info`; a service-mode health probe must use an allowed `Host`.\n3. **Modern MCP call**: send authenticated `tools/list` directly, without `initialize` or `Mcp-Session-Id`.\n4. **Simple search**: ask for \"CRISPR gene therapy\" and confirm `unified_search` reports source counts or explicit source warnings.\n5. **Isolation check**: in service mode, verify two bearer principals cannot read each other's session, export, artifact, chronicle, note, or pipeline state.\n\n### Common Issues\n\n| Problem | Solution |\n| --- | --- |\n| `uvx` not found | Install uv: `curl -LsSf https://astral.sh/uv/install.sh \\| sh` |\n| Server not connecting | Check the config file path and JSON syntax |\n| `NCBI_EMAIL` warning | Set the `NCBI_EMAIL` environment variable in the config |\n| Slow responses | Add `NCBI_API_KEY` for 10 req/s (vs 3 req/s default) |\n| Tool output shows `Canceled: Canceled` during progress reporting | Update to a build with non-cancelling best-effort progress callbacks. If a specific broad search still exceeds your client's own tool timeout, retry with `options=\"shallow\"` or specify narrower `sources`. |\n| Source API uses placeholder email | Set `NCBI_EMAIL` or pass `--email`; CrossRef, Unpaywall, and OpenAlex reuse that runtime contact unless a source-specific override/API key is configured |\n| CORE search fails | Set `CORE_API_KEY` — [get one free](https://core.ac.uk/services/api) |\n| Behind proxy | Set `HTTP_PROXY` / `HTTPS_PROXY` environment variables |\n| Modern client waits for an MCP session id | Remove the obsolete initialize/session-id handshake; send `tools/list` or `tools/call` directly |\n| Service note export rejects `output_dir` or `template_file` | This is intentional; omit host paths and use a built-in note format in the tenant's isolated `references/` directory |\n| Service pipeline rejects `file:` or `workspace` scope | Save the YAML into the authenticated tenant store and load it as `saved:<name>`; service callers cannot read process-wide workspace files |\n| Scheduled service pipeline does not run | The service Compose profile disables the in-process scheduler; run manually or design a single external leader/lease before enabling schedules |\n\n### Debug Mode\n\nRun the server directly to see logs:\n\n```bash\nNCBI_EMAIL=your@email.com uvx pubmed-search-mcp 2>server.log\n```\n\n---\n\n## Advanced: Proxy & Network\n\nIf you're behind a corporate proxy:\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"HTTP_PROXY\": \"http://proxy.corp.com:8080\",\n        \"HTTPS_PROXY\": \"http://proxy.corp.com:8080\"\n      }\n    }\n  }\n}\n```\n\n---\n\n## Advanced: Docker Deployment\n\nThe default Compose file is a single-user loopback demo. Team/remote use has a\nseparate fail-closed service profile:\n\n```bash\n# Local loopback demo\ndocker compose up -d\n\n# Local self-signed HTTPS smoke test\ndocker compose -f docker-compose.https.yml up -d\n\n# Authenticated service (populate the ignored .env from the example first)\ncp .env.service.example .env\ndocker compose --env-file .env -f docker-compose.service.yml up -d\n```\n\nThe service profile uses a persistent volume, one replica/server process, a\ndisabled in-process scheduler, and a host-loopback application port intended for\na trusted same-host TLS proxy. See\n[DEPLOYMENT.md](#/deployment) for proxy, secret, backup, and readiness\nrequirements.\n",
-  "deployment": "<!-- Generated from DEPLOYMENT.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP 部署指南\n\n這份文件描述目前仍受支援、且已與實際程式碼對齊的部署方式。\n\n## 三種部署合約\n\n![Client integration and deployment workflow](images/integration-deployment-workflow.svg)\n\n| 合約 | 入口 | 適用情境 | 安全邊界 |\n| --- | --- | --- | --- |\n| **本機 stdio** | `uvx pubmed-search-mcp` | VS Code、Claude Desktop、Cursor | 單一本機使用者；無 MCP listening port |\n| **本機 loopback HTTP** | `pubmed-search-mcp-http --mode local --host 127.0.0.1` | 本機開發、connector smoke | 可信單使用者 durable `default` tenant；僅 loopback，不可對外 |\n| **多使用者 service** | `pubmed-search-mcp-http --mode service` | 團隊、雲端、Copilot Studio | HTTPS + bearer principal + Host/Origin allowlist；啟動時 fail closed |\n\nCopilot compatibility 只是 HTTP response/schema 的變體，不是第四種信任模型。\nService mode 即使加上 `--copilot-compatible`，仍然強制認證與 allowlist。\n\n```mermaid\nflowchart TD\n  Start[選擇執行邊界]\n  One{只有一位本機使用者?}\n  NeedHTTP{需要 HTTP connector?}\n  StdIO[本機 stdio\\nuvx pubmed-search-mcp]\n  LocalHTTP[本機 loopback HTTP\\n--mode local]\n  Service[多使用者 service\\n--mode service + HTTPS + bearer]\n\n  Start --> One\n  One -->|是| NeedHTTP\n  NeedHTTP -->|否| StdIO\n  NeedHTTP -->|是| LocalHTTP\n  One -->|否| Service\n```\n\n## 0. 多使用者 service（Multi-Agent Service Mode）\n\n本機 profile 刻意維持低設定成本，但不是遠端授權邊界。只要 port\n會被另一台機器、共用 runner 或多位 agent 存取，就必須使用 service mode。\n\n### 0.1 Compose 啟動\n\n```bash\ncp .env.service.example .env\n# 編輯 .env；真實 token/API key 不可 commit\ndocker compose --env-file .env -f docker-compose.service.yml up -d\n```\n\n`docker-compose.service.yml` 會強制必要變數、掛載 persistent volume，並將\napplication port 只 publish 至 host loopback，供同一台 host 上的可信 TLS reverse proxy\n使用。它固定單副本/單 server process，因為目前尚無共享 session backend。\n\n不使用 Compose 時，等價設定為：\n\n```bash\nexport PUBMED_SERVER_MODE=service\nexport PUBMED_AUTH_TOKENS=\"team-a:$(openssl rand -hex 32),team-b:$(openssl rand -hex 32)\"\nexport PUBMED_AUTH_RESOURCE_SERVER_URL=\"https://mcp.example.org/mcp\"\n# Optional; defaults to the public resource URL origin (https://mcp.example.org)\nexport PUBMED_AUTH_ISSUER_URL=\"https://mcp.example.org\"\nexport PUBMED_ALLOWED_HOSTS=\"mcp.example.org\"\nexport PUBMED_ALLOWED_ORIGINS=\"https://mcp.example.org\"\nexport PUBMED_TRUSTED_PROXY_IPS=\"127.0.0.1\"\nexport PUBMED_TENANT_MAX_CONCURRENCY=8\nexport PUBMED_DATA_DIR=/var/lib/pubmed-search-mcp\nexport NCBI_EMAIL=\"ops@example.org\"\n\npubmed-search-mcp-http --mode service --transport streamable-http --host 0.0.0.0 --port 8765\n```\n\nAgent 端帶上 bearer token：\n\n```jsonc\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"url\": \"https://mcp.example.org/mcp\",\n      \"headers\": { \"Authorization\": \"Bearer <team-a token>\" }\n    }\n  }\n}\n```\n\n### 0.2 身分、隔離與持久化\n\n| 合約 | 身分/隔離依據 | 可持久化 |\n| --- | --- | --- |\n| 本機 stdio | 當前 OS 使用者與 local process | ✅ local store |\n| 本機 loopback HTTP | 顯式 local profile 的單使用者 `default` tenant | ✅ local durable store，跨 MCP requests/reconnects |\n| service | 已驗證 bearer principal | ✅ `PUBMED_DATA_DIR/tenants/<principal>/` |\n| service anonymous | 無可驗證身分 | ❌ 啟動/請求即拒絕 |\n\nLocal stdio 與 local loopback HTTP 都使用 `PUBMED_DATA_DIR` 下的 durable `default`\ntenant。MCP transport session identifier 只屬於 protocol lifecycle，**不是 service tenant\n身分或授權邊界**。Service 的 session、article cache、搜尋歷史、`pmids=\"last\"`、artifacts、\nexports、chronicles 與 pipelines 全部依已驗證 principal 分區。\n\nMCP SDK v2 的 2026-07-28 request model 會直接送 `tools/list` / `tools/call`，\n不使用 `initialize` handshake 或 `Mcp-Session-Id`。Service 仍必須在每個 protected\nrequest 驗證 bearer principal；legacy compatibility 不是身分或持久化來源。\n\n| Filesystem 能力 | 本機 stdio / loopback | Authenticated service |\n| --- | --- | --- |\n| Pipeline store | `workspace` / `global` / `auto` | tenant-derived store；`auto` 只解析到該 principal root |\n| Pipeline file | 可讀 `file:path.yaml` | 拒絕 server-host `file:` read |\n| Chronicle revisions | `<tenant-root>/chronicles/` 下不可變 revision | 同一路徑按 principal 隔離；index 可由 revision 重建 |\n| Chronicle artifacts | `<tenant-root>/artifacts/` 下的 manifest、JSON 與純 `.mmd` source | 同一路徑按 principal 隔離；不需 server-side Node.js |\n| Note output | 可選 `output_dir` 與 `template_file` | 不接受 host path；使用內建 format 寫入 `<tenant-root>/references/` |\n| Scheduler | 可在可信 local process 啟用 | Service Compose 停用；未來需單一 leader/lease |\n\nService 中的 pipeline `workspace` 不代表共用 repo；tenant-derived store 刻意不繼承\nprocess-wide workspace root，避免一個 principal 讀到另一個 principal 的 host files。\nChronicle revision 以原子發布保存，權威 revision 檔不會被後續寫入覆蓋；損壞或遺失的\n衍生 index 可由 revision 重建。Artifact bundle 若因 I/O 失敗而未完成，已提交的\nrevision 仍有效，MCP 回應會明確回報 artifact warning。客戶端應顯示\n`mermaid_validation` warning，並以完整的 `chronicle_map.json`／`snapshot.json` 作為\n圖形簡化時的可稽核資料來源。\n\n### 0.3 Service 環境變數\n\n| 環境變數 | Service 要求 | 說明 |\n| --- | --- | --- |\n| `PUBMED_SERVER_MODE` | `service` | 啟用遠端 fail-closed profile |\n| `PUBMED_AUTH_TOKENS` | **必填** | `principal:token` 逗號分隔清單；不可 commit |\n| `PUBMED_AUTH_RESOURCE_SERVER_URL` | **必填** | 公開 HTTPS MCP endpoint，包含 `/mcp` |\n| `PUBMED_AUTH_ISSUER_URL` | 選填 | Metadata 公告的 issuer；未設定時從 resource URL 導出同一 public origin |\n| `PUBMED_ALLOWED_HOSTS` | **必填** | 逗號分隔的對外 host names |\n| `PUBMED_ALLOWED_ORIGINS` | **必填** | 逗號分隔的 HTTPS origins |\n| `PUBMED_TRUSTED_PROXY_IPS` | 視拓撲 | 只列實際 TLS proxy IP；空值不信任 forwarded headers |\n| `PUBMED_TENANT_ISOLATION` | 強制 `true` | service 不允許關閉 tenant isolation |\n| `PUBMED_TENANT_MAX_CONCURRENCY` | 預設 `8` | 單一 tenant 同時在途的請求上限 |\n| `PUBMED_DATA_DIR` | persistent volume | tenant storage 根目錄 |\n\nToken 只以 digest 比對，不應出現在 log 或 object repr。正式環境應由\norchestrator secret store 注入，不要把 `.env` 或 token 寫進 image。\n\n### 0.4 配額與上游速率\n\n- **上游速率限制是全域的**（每個外部 API 一組），因為 NCBI 等來源依\n  API key 計量。\n- **每租戶並行上限**負責公平性，避免單一 agent 吃光全域預算。\n\n### 0.5 健康檢查與 auxiliary routes\n\n| 端點 | Service 認證 | 用途 |\n| --- | --- | --- |\n| `/health` | 開放 | liveness probe |\n| `/ready` | 開放 | readiness probe |\n| `/info` | 開放 | transport 與 endpoint metadata；不回傳 tenant 資料 |\n| `/mcp` | **bearer** | primary Streamable HTTP MCP contract |\n| `/api/*` | **bearer** | principal-scoped cache/session reads |\n| `/exports`, `/download/*` | **bearer** | principal-scoped export listing/download |\n\nMCP SDK v2 可與 OpenTelemetry tracer provider 整合；實際 exporter、retention 與私密過濾應由\n部署環境明確設定。\n\n### 0.6 擴充限制\n\n目前 session、scheduler 與部分持久狀態是 process/filesystem scoped。在尚無共享\nsession backend、distributed lock 與 scheduler leader election 前：\n\n- 保持單副本、單 server process（service Compose 已固定 `replicas: 1`）。\n- `docker-compose.service.yml` 預設停用 pipeline scheduler；若未來需要排程，請用\n  單獨的 leader process/分散式 lease 啟用，不能讓每個 request worker 各自執行。\n- 使用 persistent `PUBMED_DATA_DIR` volume 並建立備份/retention 政策。\n- 不要以複製 container 當作無狀態水平擴充。\n\n## 1. 前置需求\n\n本專案一律使用 uv。\n\n```bash\nuv sync\n```\n\n必要環境變數：\n\n```bash\nNCBI_EMAIL=your@email.com\n```\n\n可選：\n\n```bash\nNCBI_API_KEY=your_api_key\nCORE_API_KEY=your_core_key\nCROSSREF_EMAIL=your@email.com\nUNPAYWALL_EMAIL=your@email.com\n```\n\n## 2. 本機 stdio 模式\n\n給本機 MCP client 使用時，不需要額外部署 HTTP。stdio entrypoint 會強制\nlocal mode，而且預設不啟動 auxiliary HTTP port。\n\n```bash\nuvx pubmed-search-mcp\n```\n\n或在 repo 內開發測試：\n\n```bash\nuv run python -m pubmed_search.presentation.mcp_server\n```\n\n只有明確需要與本機其他 process 共用 read-only cache API 時，才設定\n`PUBMED_STDIO_AUX_HTTP=1`；該 API 仍只能綁定 loopback。\n\n## 3. 本機 loopback HTTP\n\n### 標準 streamable-http\n\n```bash\npubmed-search-mcp-http --mode local --transport streamable-http \\\n  --host 127.0.0.1 --port 8765 --email your@email.com\n```\n\n主要端點：\n\n- MCP: `http://localhost:8765/mcp`\n- Health: `http://localhost:8765/health`\n- Ready: `http://localhost:8765/ready`\n- Info: `http://localhost:8765/info`\n- Exports: `http://localhost:8765/exports`\n\n這個 profile 給單一可信本機操作者，不可把 port publish 至 LAN/公網。Docker\n本機示範請直接用 `docker compose up -d`；Compose 會顯式開啟 container-bind\n例外，同時只把 port publish 至 host `127.0.0.1`。\n\n顯式 `--mode local` 是可信單使用者合約。所有 loopback MCP requests 共用\ndurable `default` tenant，因此 `pmids=\"last\"`、session、article cache 與 export 在同一\nserver 重連後仍可讀取。這不是遠端認證模型；安全性來自 launcher 強制\nloopback bind 與 Host/Origin allowlist。Service mode 不會映射到 `default` tenant，且無\nbearer token 時會拒絕請求。\n\n### Copilot 相容 HTTP 語意，但保留完整工具面\n\n```bash\npubmed-search-mcp-http --mode local --transport streamable-http \\\n  --copilot-compatible --host 127.0.0.1 --port 8765 --email your@email.com\n```\n\n這條路線的用途是：\n\n- 保留完整 45-tool primary MCP surface\n- 啟用 Copilot 所需的 JSON response/HTTP compatibility，不改變安全合約\n- 適合先嘗試完整面，再視 Copilot Studio schema 狀況回退到簡化模式\n\n遠端 Copilot 不可使用上述 local 指令；請套用第 0 節的 service 環境，並改用\n`--mode service --copilot-compatible`。\n\n## 4. Copilot Studio 專用模式\n\n若 Copilot Studio 對完整 schema 仍有解析限制，可在本機使用簡化模式做\nschema compatibility 測試：\n\n```bash\nuv run python run_copilot.py --port 8765 --email your@email.com\n```\n\n這個入口會：\n\n- 固定使用 streamable-http\n- 開啟 Copilot compatibility middleware\n- 暴露 12 個 Copilot Studio 友善、只用 primitive parameters 的精簡工具\n- 保持 generic literature search 名稱為 `unified_search`，並呼叫共用 unified runner；不是 PubMed-only 或第二套搜尋宇宙\n- 在精簡 schema 仍提供 string 型 `sources` 與 `options`，可使用相同的 source expression 與 broker retrieval flags\n- 提供 primitive-schema `read_session`，可回讀 search runs、取得不自動執行的 replay arguments，或讀取 persisted artifact\n\n`run_copilot.py` 是 source-tree compatibility wrapper，不取代 service-mode auth 合約。多使用者\n部署優先使用 packaged `pubmed-search-mcp-http --mode service --copilot-compatible`。\n\n## 5. HTTPS 部署\n\n### 本機 HTTPS 測試\n\n這兩組 script 與自簽憑證只是 local smoke test，不是 production TLS profile。\n\n```bash\n./scripts/start-https-local.sh\n```\n\n端點：\n\n- MCP: `https://localhost:8443/mcp`\n- Health: `https://localhost:8443/health`\n- Ready: `https://localhost:8443/ready`\n- Info: `https://localhost:8443/info`\n\n停止：\n\n```bash\n./scripts/start-https-local.sh stop\n```\n\n### Docker + Nginx 本機 HTTPS 示範\n\n```bash\n./scripts/start-https-docker.sh up\n```\n\n端點：\n\n- MCP: `https://localhost/mcp`\n- Info: `https://localhost/info`\n- Health: `https://localhost/health`\n- Ready: `https://localhost/ready`\n- Exports: `https://localhost/exports`\n\n其他指令：\n\n```bash\n./scripts/start-https-docker.sh logs\n./scripts/start-https-docker.sh status\n./scripts/start-https-docker.sh down\n```\n\n### 拓撲圖\n\n```mermaid\nflowchart LR\n    Client[MCP Client / Copilot Studio]\n    Proxy[HTTPS Reverse Proxy]\n    Server[PubMed Search MCP\\npubmed-search-mcp-http]\n    Endpoint[\"/mcp\"]\n    Utility[\"/health · /ready · /info · /exports\"]\n\n    Client --> Proxy\n    Proxy --> Endpoint\n    Proxy --> Utility\n    Endpoint --> Server\n    Utility --> Server\n```\n\n### Service TLS reverse proxy 要求\n\n正式 service 請使用可信 CA 憑證與獍立 reverse proxy/load balancer。代理必須：\n\n- 把 `/mcp` request/response buffering 關閉，並保留長連線 timeout。\n- 轉送 `Authorization`，且只從 `PUBMED_TRUSTED_PROXY_IPS` 列出的 proxy 接受 forwarded headers。\n- 代理 `/health` 與 `/ready`；不要用需認證或會建立 session 的端點當 probe。\n- 不公開 app container port；`docker-compose.service.yml` 只 publish host loopback。\n\n## 6. Docker 啟動\n\n```bash\n# 單使用者 loopback demo\ndocker compose up -d\n\n# 多使用者 service（先完成 .env）\ndocker compose --env-file .env -f docker-compose.service.yml up -d\n```\n\nService profile 必須使用 persistent volume、單副本，並在外層做 TLS termination。\nImage 固定在 Python `3.11.15-slim-trixie` 的 multi-platform digest，uv 固定為\n`0.11.24`，local HTTPS demo 也固定 Nginx `1.31.3-alpine` digest；runtime 使用\n非 root UID/GID `10001`；\n`PUBMED_DATA_DIR=/var/lib/pubmed-search-mcp` 必須掛載成該使用者可寫的 volume。\n\n## 7. 雲端部署\n\n### Railway\n\n```bash\nrailway up\n```\n\n必要環境/秘密：\n\n```bash\nNCBI_EMAIL=your@email.com\nPUBMED_SERVER_MODE=service\nPUBMED_AUTH_TOKENS=<secret reference>\nPUBMED_AUTH_RESOURCE_SERVER_URL=https://mcp.example.org/mcp\nPUBMED_AUTH_ISSUER_URL=https://mcp.example.org  # optional; defaults to resource origin\nPUBMED_ALLOWED_HOSTS=mcp.example.org\nPUBMED_ALLOWED_ORIGINS=https://mcp.example.org\nPUBMED_TRUSTED_PROXY_IPS=<platform ingress IPs>\nPUBMED_DATA_DIR=/var/lib/pubmed-search-mcp\n```\n\n### Azure Container Apps\n\n```bash\n# This repository does not currently publish a public GHCR image. Build the\n# reviewed source into your own Azure Container Registry first.\naz acr build \\\n  --registry myregistry \\\n  --image pubmed-search-mcp:0.6.5 \\\n  .\n\naz containerapp create \\\n  --name pubmed-mcp \\\n  --resource-group myRG \\\n  --image myregistry.azurecr.io/pubmed-search-mcp:0.6.5 \\\n  --target-port 8765 \\\n  --ingress external\n```\n\n請先設定 Container Apps 對該 registry 的 pull identity，再透過 secret references\n注入上述 service 變數；不要把 token 寫在 shell history 或版本控制的 YAML。同時固定\n單 replica，並掛載可備份的持久儲存。不要引用本 repo 未發布的 `ghcr.io/...:latest`\n映像。\n\n## 8. GitHub Pages 文件網站\n\n本 repo 的文件網站是 committed static site，來源 Markdown 仍是 canonical source：\n\n```bash\nuv run python scripts/count_mcp_tools.py --update-docs\nuv run python scripts/build_docs_site.py\n```\n\n網站入口與 generated payload：\n\n- `docs/index.html`\n- `docs/site.js`\n- `docs/site.css`\n- `docs/site-content/*.md`\n- `docs/site-content.js`\n\n`Deploy Docs Site` GitHub Actions workflow 會在 `main` / `master` 的 docs 相關變更後自動重建 tool docs 與 docs site payload，然後把 `docs/` 發布到 GitHub Pages。若不用 Actions，也可以在 GitHub repo Settings → Pages 選擇 Deploy from branch，branch 選 `main` 或 `master`，folder 選 `/docs`。\n\n## 9. 已不建議的路線\n\n以下路線仍可能存在於舊文件或歷史腳本中，但不應再當成主要部署方式：\n\n- `/sse` + `/messages` 作為主要遠端入口；新部署請使用 `/mcp` streamable-http\n- 舊的 module 路徑，例如 `uv run python -m pubmed_search.mcp`\n- `pip install -e \".[all]\"` 這類非 uv 指令\n- 舊版公開工具名稱，例如 `search_literature`、`search_core`、`merge_search_results`\n\n## 10. 驗證清單\n\n部署後至少驗證以下項目：\n\n1. `GET /health` 回傳 `status: ok`\n2. `GET /ready` 回傳 ready，`GET /info` 顯示正確 transport/endpoint\n3. Service 未帶 bearer 的 `POST /mcp`、`/api/*`、`/exports` 回傳 401/403\n4. 有效 bearer 可直接完成現代 MCP `tools/list` 與一次 `unified_search`；2026-07-28 transport 不再送 `initialize` 或 `Mcp-Session-Id`\n5. 不同 principal 無法互讀 session、artifact、export、chronicle 或 pipeline\n6. 若是 Copilot Studio，確認 45-tool primary surface 正確被發現\n\n## 相關文件\n\n- [ARCHITECTURE.md](#/architecture)\n- [docs/INTEGRATIONS.md](#/troubleshooting)\n- [copilot-studio/README.md](https://github.com/u9401066/pubmed-search-mcp/blob/master/copilot-studio/README.md)\n"
+  "troubleshooting": "<!-- Generated from docs/INTEGRATIONS.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# Integrations & Operations Guide\n\nThe complete operator-facing extension of the README: choose a runtime contract,\nconnect an AI client, configure the multi-source and browser brokers, verify the\nmodern MCP SDK v2 protocol, and recover common failures.\n\n> **Quick Start**: For minimal configuration snippets, see the main [README.md](#/overview#configuration).\n\n---\n\n## Table of Contents\n\n- [Integrations & Operations Guide](#integrations--operations-guide)\n  - [Table of Contents](#table-of-contents)\n  - [Runtime and Transport Contracts](#runtime-and-transport-contracts)\n    - [MCP SDK v2 Protocol Baseline](#mcp-sdk-v2-protocol-baseline)\n    - [stdio (Default)](#stdio-default)\n    - [Local Loopback Streamable HTTP](#local-loopback-streamable-http)\n    - [Multi-User Service](#multi-user-service-auth-and-tenant-isolation)\n    - [Auxiliary HTTP APIs](#auxiliary-http-apis)\n    - [Python SDK Facade](#python-sdk-facade)\n    - [Persistent Artifact Retrieval](#persistent-artifact-retrieval)\n  - [Environment Variables](#environment-variables)\n    - [Source Selection and Source Gating](#source-selection-and-source-gating)\n    - [Commercial Connectors](#commercial-connectors)\n    - [Getting API Keys](#getting-api-keys)\n  - [Client Configurations](#client-configurations)\n    - [VS Code / Cursor](#vs-code--cursor)\n    - [Claude Desktop](#claude-desktop)\n    - [Claude Code](#claude-code)\n    - [Zed AI](#zed-ai)\n    - [OpenClaw 🦞](#openclaw-)\n    - [Cline](#cline)\n    - [Microsoft Copilot Studio](#microsoft-copilot-studio)\n    - [Other MCP Clients](#other-mcp-clients)\n  - [Verification \\& Troubleshooting](#verification--troubleshooting)\n    - [Quick Health Check](#quick-health-check)\n    - [Common Issues](#common-issues)\n    - [Debug Mode](#debug-mode)\n  - [Advanced: Proxy \\& Network](#advanced-proxy--network)\n  - [Advanced: Docker Deployment](#advanced-docker-deployment)\n\n---\n\n## Runtime and Transport Contracts\n\nChoose the trust boundary before choosing client-specific options:\n\n![Client integration and deployment workflow](images/integration-deployment-workflow.svg)\n\n| Contract | Entry point | State and network boundary |\n| --- | --- | --- |\n| **Local stdio** | `uvx pubmed-search-mcp` | One local OS user, durable local store, no MCP listening port |\n| **Local loopback HTTP** | `pubmed-search-mcp-http --mode local --host 127.0.0.1` | Trusted single-user integration; MCP requests share the durable `default` tenant |\n| **Multi-user service** | `pubmed-search-mcp-http --mode service` | Remote/team use behind HTTPS; bearer principal and Host/Origin allowlists are mandatory |\n\n### MCP SDK v2 Protocol Baseline\n\nThis release uses `mcp>=2.0,<3` and the modern 2026-07-28 MCP request model.\nA current HTTP client sends JSON-RPC `tools/list` and `tools/call` requests\ndirectly; it does **not** begin with `initialize` and does not depend on\n`Mcp-Session-Id`. Service clients must send their bearer credential on every\nprotected request. Legacy protocol compatibility, when used by an older client,\nnever becomes an identity, authorization, or persistence boundary.\n\nUse Streamable HTTP for current remote clients. The legacy SSE transport remains\navailable only as a compatibility surface. See the\n[MCP protocol update](https://blog.modelcontextprotocol.io/posts/2026-07-28/)\nand the repository's [deployment smoke checklist](#/deployment#10-%E9%A9%97%E8%AD%89%E6%B8%85%E5%96%AE).\n\n### stdio (Default)\n\nThe client spawns the server as a subprocess and communicates via stdin/stdout.\nNo networking configuration is needed. The stdio entry point always uses local\nmode and does not start an auxiliary HTTP listener unless\n`PUBMED_STDIO_AUX_HTTP=1` is explicitly set.\n\n```bash\nuvx pubmed-search-mcp\n```\n\n### Local Loopback Streamable HTTP\n\nFor a local connector or protocol smoke test:\n\n```bash\n# Local loopback HTTP\npubmed-search-mcp-http --mode local --transport streamable-http \\\n  --host 127.0.0.1 --port 8765\n\n# Via run_copilot.py (12-tool primitive-schema smoke for Copilot Studio)\nuv run python run_copilot.py --port 8765\n```\n\nThe simplified inventory includes `unified_search` plus primitive-schema\n`read_session`, so a Copilot smoke can inspect durable search runs, obtain\nnon-executing replay arguments, and read a persisted artifact without switching\nto the full schema.\n\nThe MCP endpoint is available at `http://localhost:8765/mcp`. Do not change only\nthe bind address and treat this as a remote service. Explicit local mode is a\ntrusted single-user contract: its loopback MCP requests use the durable\n`default` tenant, so `pmids=\"last\"`, sessions, article cache, and exports survive\nacross requests and reconnects. The launcher-enforced loopback bind and\nHost/Origin allowlists are the security boundary.\n\n> **Note**: Legacy SSE (`--transport sse`) is retained for older integrations;\n> new deployments should use Streamable HTTP.\n\n### Multi-User Service (Auth and Tenant Isolation)\n\nService mode is fail closed. It refuses startup unless bearer credentials, the\npublic resource-server URL, and Host/Origin allowlists are all configured:\n\n```bash\nexport PUBMED_SERVER_MODE=service\nexport PUBMED_AUTH_TOKENS=\"team-a:$(openssl rand -hex 32),team-b:$(openssl rand -hex 32)\"\nexport PUBMED_AUTH_RESOURCE_SERVER_URL=\"https://mcp.example.org/mcp\"\nexport PUBMED_AUTH_ISSUER_URL=\"https://mcp.example.org\"  # optional; defaults to resource origin\nexport PUBMED_ALLOWED_HOSTS=\"mcp.example.org\"\nexport PUBMED_ALLOWED_ORIGINS=\"https://mcp.example.org\"\nexport PUBMED_TRUSTED_PROXY_IPS=\"127.0.0.1\"  # only the actual TLS proxy\npubmed-search-mcp-http --mode service --transport streamable-http --host 0.0.0.0 --port 8765\n```\n\nClients then present the token as a bearer credential:\n\n```jsonc\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"http\",\n      \"url\": \"https://mcp.example.org/mcp\",\n      \"headers\": { \"Authorization\": \"Bearer <your token>\" }\n    }\n  }\n}\n```\n\nEach authenticated principal gets its **own** session, article cache, search\nhistory, `pmids=\"last\"`, artifacts, exports, chronicles, and pipelines. An MCP\ntransport session identifier is protocol lifecycle state, not tenant identity or\nauthorization, and never grants persistence.\n\nFilesystem-facing capabilities are deliberately narrower for authenticated\nservice callers:\n\n| Capability | Local stdio / loopback HTTP | Authenticated service |\n| --- | --- | --- |\n| Saved pipelines | `workspace`, `global`, or `auto`; caller may load `file:path.yaml` | Tenant-derived store only; `auto` resolves below that principal's data root and `file:` reads are rejected |\n| Literature notes | Caller may choose `output_dir` and `template_file` | Caller cannot choose host paths or read a template file; built-in formats write below `<tenant-root>/references/` |\n| Scheduler | May be enabled for a trusted local process | Disabled by `docker-compose.service.yml`; future scheduling needs one leader/lease, not one scheduler per request worker |\n| Institutional settings | Local user may configure process-owned access settings | Authenticated callers cannot mutate process-global institutional configuration |\n| Server-local paths | May be exposed explicitly to a trusted local client | Redacted by default; remote clients retrieve artifacts through `read_session` |\n\nThe word `workspace` never means a shared team directory in service mode. A\ntenant-derived pipeline store intentionally drops the process-wide workspace\nroot so one principal cannot read another principal's repository files.\nAuthenticated service callers cannot read `file:` paths from the server\nfilesystem; save the pipeline in the current tenant store and load it by name.\nThey also cannot choose `output_dir` or `template_file` for notes; use a built-in\nformat in the principal-scoped `references/` directory.\n\nFor containers, use `docker-compose.yml` only as a single-user loopback demo and\n`docker-compose.service.yml` for the authenticated, persistent, single-replica\nservice. See [DEPLOYMENT.md](#/deployment) for the complete contract.\n\n### Auxiliary HTTP APIs\n\n![Session cache and auxiliary HTTP API workflow](images/session-cache-and-http-api.svg)\n\nBesides the primary MCP contract at `/mcp`, the packaged HTTP CLI exposes\nauxiliary routes. Only liveness/readiness metadata is public in service mode;\ntenant data and exports require the same bearer principal as MCP:\n\n| Endpoint | Purpose |\n| --- | --- |\n| `/health` | Liveness probe (open) |\n| `/ready` | Readiness probe: transport, whether auth is enforced, active tenant count (open) |\n| `/api/cached_article/{pmid}` | Read one cached article, optionally fetch on miss |\n| `/api/cached_articles?pmids=...` | Read multiple cached articles |\n| `/api/session/summary` | Read current session summary |\n| `/api/circuit_breakers` | Inspect upstream circuit breaker states (this process and, when enabled, the shared store) |\n| `/exports` | List opaque export ids belonging to the current local or authenticated tenant |\n| `/download/{export_id}` | Download one opaque export id belonging to that tenant |\n\nIn service mode, `/api/*`, `/exports`, and `/download/*` require the same bearer\ntoken as `/mcp` and return only that principal's data. `/health` and `/ready`\nstay open for orchestrator probes. In explicit local mode these routes use the\nsame durable single-user `default` tenant as `/mcp`; in service mode an\nanonymous request is always rejected and never falls back to local state.\n\nThis auxiliary API is a convenience for cache and session reads; it is **not** the\nprimary MCP tool contract. For agent tool discovery and normal runtime usage,\n`/mcp` remains the canonical external interface.\n\n### Python SDK Facade\n\nFor in-process Python integrations, use the SDK facade instead of importing MCP\ntool modules or relying on auxiliary HTTP endpoints:\n\n```python\nfrom pubmed_search.api import PubMedSearchClient, PubMedSearchConfig\n\nclient = PubMedSearchClient(PubMedSearchConfig(email=\"your@email.com\"))\nresult = await client.unified_search(\"remimazolam ICU sedation\", limit=20)\n\narticles = result.articles\nsource_counts = result.source_counts\nartifact = result.artifact\n```\n\nUse `/mcp` for agent tool discovery and task-oriented MCP calls. Use\n`pubmed_search.api` for Python package, notebook, or application code that wants\nan in-process object contract.\n\n### Persistent Artifact Retrieval\n\nWhen session persistence is enabled, `unified_search` and `get_fulltext` write\ncomplete reusable outputs to local artifact files and return a compact\n`artifact` locator in the MCP response. Local path fields are redacted by\ndefault; set `PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS=true` for local MCP clients\nthat should receive `local_path` and `manifest_path` directly. Remote clients\nshould use the MCP session facade:\n\n```text\nread_session(action=\"list_artifacts\")\nread_session(action=\"artifact\", artifact_id=\"...\")\nread_session(action=\"artifact\", artifact_uri=\"artifact://...\")\nread_session(action=\"artifact\", artifact_id=\"...\", artifact_file=\"payload.json\", offset=0, max_chars=200000)\nread_session(action=\"list_artifacts\", include_local_paths=true)\n```\n\n`read_session(action=\"artifact\")` reads existing artifact files only; it does\nnot repeat upstream source calls. Use `offset` and `max_chars` to page through a\nlarge artifact from remote clients. `read_session` redacts local paths by\ndefault; pass `include_local_paths=true` for local-server workflows.\nThe `local_path` and `manifest_path` fields are paths on the MCP server host,\nnot portable client paths. Full-text artifacts can contain copyrighted,\nsubscription, or institutionally accessed article text; keep redistribution and\nretention aligned with the applicable publisher, license, and institutional\nterms.\nLarge `get_fulltext` responses are capped inline when an artifact is available;\nuse `read_session(action=\"artifact\", ...)` to retrieve the saved full content.\n\n`unified_search` can also return partial source diagnostics without failing the\nwhole query. JSON responses use `source_errors`; markdown responses include a\n`Source warnings` line. Semantic Scholar HTTP 429 warnings recommend setting\n`S2_API_KEY` / `SEMANTIC_SCHOLAR_API_KEY`, retrying later, or excluding the\nsource with `sources=\"auto,-semantic_scholar\"` /\n`PUBMED_SEARCH_DISABLED_SOURCES=semantic_scholar`.\n\n---\n\n## Environment Variables\n\nSemantic Scholar accepts either `S2_API_KEY` or `SEMANTIC_SCHOLAR_API_KEY`.\nIf repeated 429 responses appear in Cline or other MCP clients, set a key or\ntemporarily disable the source with `PUBMED_SEARCH_DISABLED_SOURCES=semantic_scholar`.\n\nLive provider queries and bulk datasets are intentionally separate. Semantic\nScholar release/manifest/diff inspection is an operator data-plane workflow;\nit never downloads a dataset partition during `unified_search`. OpenAlex cursor\nand native semantic modes are likewise bounded broker capabilities, while an\nentire-corpus mirror must use the operator snapshot path. See\n[Semantic Scholar data plane](#/semantic-scholar-api),\n[OpenAlex search/data plane](#/openalex-api), and the\n[ClinicalKey AI licensed boundary](#/clinicalkey-ai).\n\nProvider-native execution stays behind the single literature-search facade:\n\n```text\nunified_search(query=\"treatment resistance\",\n               sources=\"openalex\",\n               options=\"native_semantic\")\n\nunified_search(query=\"melanoma AND immunotherapy\",\n               sources=\"pubmed,openalex,semantic_scholar\",\n               options=\"systematic\")\n```\n\nThe flags are mutually exclusive and disable multi-strategy deep expansion.\nExplicit unsupported source/mode pairs fail before I/O; automatic mode keeps\ncapable sources only. The per-source MCP `limit` stays at most 100. Inspect\n`source_metadata` and the artifact's `query_strategy.json` for the actual\nprovider mode, compiled/canonical query, continuation, cost/rate fields, and\nwarnings. This bounded mode is not an exhaustive systematic-review claim.\n\n| Variable | Required | Description | Default |\n| --- | --- | --- | --- |\n| `NCBI_EMAIL` | **Yes** | Email for NCBI API policy compliance | `pubmed-search@example.com` |\n| `NCBI_API_KEY` | No | NCBI API key for higher rate limits (10 req/s vs 3 req/s) | — |\n| `CORE_API_KEY` | No | [CORE API](https://core.ac.uk/services/api) key for open access search | — |\n| `S2_API_KEY` / `SEMANTIC_SCHOLAR_API_KEY` | No | Semantic Scholar `x-api-key`; improves live quota stability and is required to obtain dataset partition/diff URLs | — |\n| `OPENALEX_API_KEY` | No | OpenAlex API key for a higher credit budget; runtime decisions still use response rate/cost metadata | — |\n| `CLINICALKEY_AI_ENABLED` | No | Enables only the default-off ClinicalKey application/data-plane adapter; it never adds an MCP tool/source | `false` |\n| `CLINICALKEY_AI_ENTITLEMENT_CONFIRMED` | ClinicalKey adapter | Operator assertion that licensed API entitlement is active | `false` |\n| `CLINICALKEY_AI_CONTRACT_ACKNOWLEDGED` | ClinicalKey adapter | Operator assertion that MCP/retention/use terms were reviewed for this deployment | `false` |\n| `CLINICALKEY_AI_CLIENT_ID` | ClinicalKey adapter | OAuth client id held by the operator secret store | — |\n| `CLINICALKEY_AI_CLIENT_SECRET` | ClinicalKey adapter | OAuth client secret; never logged or persisted | — |\n| `CROSSREF_EMAIL` | No | Optional CrossRef polite-pool email override. Defaults to the runtime server contact email. | `NCBI_EMAIL`, CLI `--email`, or detected git email |\n| `UNPAYWALL_EMAIL` | No | Optional Unpaywall email override. Defaults to the runtime server contact email. | `NCBI_EMAIL`, CLI `--email`, or detected git email |\n| `PUBMED_SEARCH_DISABLED_SOURCES` | No | Comma-separated source keys to globally disable in unified_search and cross-search | — |\n| `PUBMED_SERVER_MODE` | HTTP only | `local` for loopback development or `service` for fail-closed remote/team use | `local` |\n| `PUBMED_LOCAL_ALLOW_CONTAINER_BIND` | No | Explicit local-container exception permitting an internal `0.0.0.0` bind; the host port must still publish only to loopback | `false` |\n| `PUBMED_STDIO_AUX_HTTP` | No | Opt in to the stdio process's loopback auxiliary HTTP API | `false` |\n| `PUBMED_AUTH_TOKENS` | **Service: yes** | Comma-separated `principal:token` credentials; inject from a secret store | — |\n| `PUBMED_AUTH_RESOURCE_SERVER_URL` | **Service: yes** | Public HTTPS MCP resource-server URL, including `/mcp` | — |\n| `PUBMED_AUTH_ISSUER_URL` | No | Issuer advertised in auth metadata; defaults to the public resource URL origin | Resource URL origin |\n| `PUBMED_ALLOWED_HOSTS` | **Service: yes** | Comma-separated public Host allowlist | Safe loopback defaults in local mode |\n| `PUBMED_ALLOWED_ORIGINS` | **Service: yes** | Comma-separated HTTPS Origin allowlist | Safe loopback defaults in local mode |\n| `PUBMED_TRUSTED_PROXY_IPS` | No | Exact reverse-proxy IP allowlist; empty means forwarded headers are not trusted | — |\n| `PUBMED_TENANT_ISOLATION` | Service forces `true` | Keep authenticated principals in separate state/storage scopes | `true` |\n| `PUBMED_TENANT_MAX_CONCURRENCY` | No | Maximum in-flight requests per authenticated principal | `8` |\n| `PUBMED_NOTES_DIR` | No | Local wiki/Foam-compatible/Markdown/MedPaper-style note export directory used by `save_literature_notes` | `PUBMED_WORKSPACE_DIR/references`, `PUBMED_DATA_DIR/references`, then `~/.pubmed-search-mcp/references` |\n| `PUBMED_WORKSPACE_DIR` | No | Workspace root used for pipeline persistence and note export fallback | — |\n| `PUBMED_DATA_DIR` | No | User-level data root used for cache/persistence and note export fallback | `~/.pubmed-search-mcp` |\n| `PUBMED_PROFILING` | No | Enable runtime profiling diagnostics | `false` |\n| `PUBMED_HTTP_CASSETTE_MODE` | No | Record (`record`) or replay (`replay`) upstream HTTP and E-utility responses for offline benchmarks; `off` talks to the network | `off` |\n| `PUBMED_HTTP_CASSETTE_DIR` | No | Directory holding recorded cassette entries | `PUBMED_DATA_DIR/cassettes` |\n| `PUBMED_HTTP_CASSETTE_LATENCY_SCALE` | No | Replay delay as a multiple of each recorded response time (`0` disables latency injection) | `0` |\n| `PUBMED_HTTP2` | No | Negotiate HTTP/2 on outbound connection pools (requires `pip install \"httpx[http2]\"`) | `false` |\n| `PUBMED_HTTP_POOL_IDLE_SECONDS` | No | Close a host's connection pool after this many idle seconds (`0` keeps pools open) | `120` |\n| `PUBMED_TOOL_DEADLINE_SECONDS` | No | End-to-end budget for one MCP tool call; nested retries, backoff and parallel source calls stop at it (`0` disables) | `300` |\n| `PUBMED_CIRCUIT_BREAKER_STORE` | No | Persist circuit breaker state (open/half-open, failure counts) under `<PUBMED_DATA_DIR>/cache/circuit_breakers.json` so workers share it and restarts keep it | `false` |\n| `PUBMED_IDF_STORE` | No | Count the terms of every article entering the article cache in `<PUBMED_DATA_DIR>/cache/idf_stats.tsv` and blend those global document frequencies into BM25 IDF (used once 1000 articles are counted) | `false` |\n| `PUBMED_IDF_PRIOR_WEIGHT` | No | Weight of the global IDF prior against the result-set IDF (`0` = result set only, `1` = global only) | `0.5` |\n| `PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS` | No | Include server-local artifact paths for trusted local clients | `false` |\n| `PUBMED_FULLTEXT_INLINE_MAX_CHARS` | No | Maximum inline full-text characters before artifact paging | `20000` |\n| `PUBMED_SCHEDULER_ENABLED` | No | Enable the saved-pipeline scheduler for a trusted local process; the authenticated service Compose profile forces it off | `true` |\n| `PUBMED_SCHEDULER_TIMEZONE` | No | Scheduler timezone | `UTC` |\n| `PUBMED_SCHEDULER_MAX_INSTANCES` | No | Maximum scheduler instances per process; it does not provide distributed leader election | `1` |\n| `SCOPUS_ENABLED` | No | Enable the default-off Scopus connector (`true/false`) | `false` |\n| `SCOPUS_API_KEY` | No | Elsevier Scopus API key. Required when `SCOPUS_ENABLED=true` | — |\n| `SCOPUS_INSTTOKEN` | No | Optional Elsevier institutional token for Scopus | — |\n| `WEB_OF_SCIENCE_ENABLED` | No | Enable the default-off Web of Science connector (`true/false`) | `false` |\n| `WEB_OF_SCIENCE_API_KEY` | No | Clarivate Web of Science API key. Required when `WEB_OF_SCIENCE_ENABLED=true` | — |\n| `OPENURL_RESOLVER` | No | Institutional link resolver base URL | — |\n| `OPENURL_PRESET` | No | Preset name for institutional resolver | — |\n| `OPENURL_ENABLED` | No | Enable/disable OpenURL resolver | `true` |\n| `INSTITUTIONAL_DIRECT_FETCH` | No | Try direct DOI / EZproxy fulltext retrieval inside `get_fulltext` before CORE fallback | `true` |\n| `EZPROXY_ENABLED` | No | Enable EZproxy fulltext retrieval after setting host and cookie | `false` |\n| `EZPROXY_HOST` | No | EZproxy hostname, e.g. `ezproxy.lib.example.edu` | — |\n| `EZPROXY_COOKIE_FILE` | No | Browser-exported cookies JSON file for EZproxy requests | — |\n| `EZPROXY_COOKIE` | No | Inline cookie header string for EZproxy requests | — |\n| `BROWSER_FETCH_CONFIG` | No | Preferred single JSON setting for browser-session broker and auto mode | — |\n| `BROWSER_FETCH_ENABLED` | No | Enable browser-session broker via per-field envs | `false` |\n| `BROWSER_FETCH_AUTO` | No | Auto-use broker when tool call omits allow_browser_session | `false` |\n| `BROWSER_FETCH_BROKER_URL` | No | Local broker endpoint, e.g. `http://127.0.0.1:8766/fetch` | — |\n| `BROWSER_FETCH_TOKEN` | No | Shared bearer token for the local broker | — |\n| `BROWSER_FETCH_ALLOWED_HOSTS` | No | Comma-separated host allow-list for broker targets | — |\n| `BROWSER_FETCH_TIMEOUT` | No | Browser-session client and broker timeout in seconds | `45` |\n| `BROWSER_FETCH_MAX_BYTES` | No | Maximum PDF payload accepted from the broker | `52428800` |\n| `BROWSER_FETCH_REQUIRE_LOCAL` | No | Require the configured broker URL to be localhost | `true` |\n| `BROWSER_FETCH_VERIFY_TLS` | No | Verify TLS when calling an HTTPS broker URL | `true` |\n| `PUBMED_HTTP_API_PORT` | No | Port for background HTTP API (stdio mode) | `8765` |\n| `HTTP_PROXY` / `HTTPS_PROXY` | No | Proxy settings for outbound requests | — |\n| `BROWSER_FETCH_BROKER_TOKEN` | No | Bearer token expected by the local broker server | Falls back to `BROWSER_FETCH_TOKEN`; otherwise a high-entropy runtime token is generated and printed |\n| `BROWSER_FETCH_BROKER_HOST` | No | Broker bind host | `127.0.0.1` |\n| `BROWSER_FETCH_BROKER_PORT` | No | Broker bind port | `8766` |\n| `BROWSER_FETCH_BROKER_HEADLESS` | No | Run broker browser headless | `false` |\n| `BROWSER_FETCH_BROKER_USER_DATA_DIR` | No | Persistent browser profile directory for broker login state | `~/.pubmed-search-mcp/browser-broker-profile` |\n| `BROWSER_FETCH_BROKER_DOWNLOAD_DIR` | No | Temporary broker download directory | `~/.pubmed-search-mcp/browser-broker-downloads` |\n\n### Source Selection and Source Gating\n\n![Search and query intelligence workflow](images/search-query-workflow.svg)\n\n`unified_search` now supports source expressions such as:\n\n```text\nsources=\"pubmed,openalex\"\nsources=\"auto,-semantic_scholar\"\nsources=\"all,-crossref\"\n```\n\nYou can also globally disable sources without changing prompts or client config:\n\n```bash\nPUBMED_SEARCH_DISABLED_SOURCES=semantic_scholar,core\n```\n\nThis applies to unified multi-source dispatch and internal alternate-source cross-search.\n\n### Commercial Connectors\n\nCommercial sources should be wired as **default-off** connectors.\n\nCurrent status:\n\n- `scopus`: connector skeleton is implemented, but it stays unavailable unless both\n  `SCOPUS_ENABLED=true` and `SCOPUS_API_KEY` are present.\n- `web_of_science`: connector skeleton is implemented, but it stays unavailable unless\n  both `WEB_OF_SCIENCE_ENABLED=true` and `WEB_OF_SCIENCE_API_KEY` are present.\n\nRecommended practice for future commercial sources:\n\n- Keep the connector disabled by default.\n- Gate it behind explicit env vars and credentials.\n- Cover behavior with mocked unit tests in CI.\n- Add opt-in live integration tests only in licensed environments.\n\n### Getting API Keys\n\n| Service | How to Get | Benefit |\n| --- | --- | --- |\n| [NCBI API Key](https://www.ncbi.nlm.nih.gov/account/settings/) | Create NCBI account → Settings → API Key | 10 req/s (vs 3 req/s) |\n| [CORE API Key](https://core.ac.uk/services/api) | Register at core.ac.uk | Access 200M+ open access papers |\n| [Semantic Scholar API Key](https://www.semanticscholar.org/product/api) | Request through the official API page | More stable live quota; dataset file/diff manifests require a key |\n| [OpenAlex API Key](https://help.openalex.org/api/authentication/) | Follow the official authentication guide | Higher credit budget; actual rate/cost remains response-driven |\n| Scopus API Key | Elsevier Developer Portal / licensed institutional access | Adds Scopus as an explicit or `all` source when enabled |\n| Web of Science API Key | Clarivate Developer Portal / licensed institutional access | Adds Web of Science as an explicit or `all` source when enabled |\n\n---\n\n## Client Configurations\n\n### VS Code / Cursor\n\n**Config file**: `.vscode/mcp.json` (project-level) or User Settings\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"NCBI_API_KEY\": \"your_api_key\"\n      }\n    }\n  }\n}\n```\n\n**With all optional keys**:\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"NCBI_API_KEY\": \"your_api_key\",\n        \"CORE_API_KEY\": \"your_core_key\",\n        \"S2_API_KEY\": \"your_semantic_scholar_key\",\n        \"OPENALEX_API_KEY\": \"your_openalex_key\",\n        \"CROSSREF_EMAIL\": \"your@email.com\",\n        \"UNPAYWALL_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n**One-time browser-session auto mode**:\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"BROWSER_FETCH_CONFIG\": \"{\\\"enabled\\\":true,\\\"auto_enabled\\\":true,\\\"broker_url\\\":\\\"http://127.0.0.1:8766/fetch\\\",\\\"token\\\":\\\"<random-32-byte-token>\\\",\\\"allowed_hosts\\\":[\\\"jamanetwork.com\\\",\\\"*.jamanetwork.com\\\"]}\"\n      }\n    }\n  }\n}\n```\n\nThis is the recommended VS Code / Cursor setup when you want a single setting that enables authenticated browser fallback automatically. If you prefer separate values, `BROWSER_FETCH_ENABLED`, `BROWSER_FETCH_AUTO`, `BROWSER_FETCH_BROKER_URL`, `BROWSER_FETCH_TOKEN`, and `BROWSER_FETCH_ALLOWED_HOSTS` still work and override the JSON setting.\n\n### Running the local browser broker\n\nThe MCP server only contains the broker client. To eliminate manual browser download prompts, run the companion local broker that intercepts Playwright download events and streams PDF bytes back to MCP.\n\n```bash\nuv sync --extra browser-broker\nuv run playwright install chromium\nuv run python -c \"import secrets; print(secrets.token_urlsafe(32))\"\nuv run pubmed-browser-fetch-broker --token \"<same-random-32-byte-token>\"\n```\n\nUse the generated value in both the broker command and MCP client config; do\nnot reuse a published example token. When `--token` is omitted, the broker\ngenerates and prints a high-entropy runtime token. It always rejects non-loopback\nbinds, Host headers, and browser Origins.\n\nRecommended first run:\n\n1. Start the broker in non-headless mode.\n2. Let the broker open its persistent browser profile.\n3. Sign in to the target publisher or institution once in that browser.\n4. Keep the broker running while MCP issues `get_fulltext` requests.\n\nBecause downloads are intercepted inside the Playwright-controlled browser, publisher PDF flows no longer rely on the operating system's native Save As dialog.\n\n**Verification**: Open Copilot Chat → type `@pubmed-search` → you should see the server listed.\n\n---\n\n### Claude Desktop\n\n**Config file**: `claude_desktop_config.json`\n\n| OS | Path |\n| --- | --- |\n| macOS | `~/Library/Application Support/Claude/claude_desktop_config.json` |\n| Windows | `%APPDATA%\\Claude\\claude_desktop_config.json` |\n| Linux | `~/.config/Claude/claude_desktop_config.json` |\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n**Verification**: Open Claude Desktop → Settings → Developer → you should see \"pubmed-search\" listed and running.\n\n> **Tip**: If `uvx` is not found, use the full path (e.g., `/Users/you/.local/bin/uvx` or `C:\\Users\\you\\.local\\bin\\uvx.exe`).\n\n---\n\n### Claude Code\n\n**Quick setup** (one command):\n\n```bash\nclaude mcp add pubmed-search -- uvx pubmed-search-mcp\n```\n\n**Or via `.mcp.json`** in your project root:\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n**Verification**: Run `claude mcp list` → should show `pubmed-search` as connected.\n\n---\n\n### Zed AI\n\n[Zed](https://zed.dev) supports MCP servers natively via **Custom Server** configuration.\n\n**Config file**: Zed `settings.json` (Command Palette → `zed: open settings`)\n\n```json\n{\n  \"context_servers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  }\n}\n```\n\n**Alternative setup**: Agent Panel → Settings icon → \"Add Custom Server\"\n\n**Verification**: Open the Agent Panel → the server should appear in the context server list.\n\n**Zed-specific notes**:\n\n- Zed uses `context_servers` (not `mcpServers`)\n- Supports stdio transport only\n- MCP tools are available in Assistant Panel conversations\n- See [Zed MCP docs](https://zed.dev/docs/ai/mcp) for more details\n\n**Using profiles** for different research contexts:\n\n```json\n{\n  \"context_servers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\"\n      }\n    }\n  },\n  \"assistant\": {\n    \"profiles\": {\n      \"literature-review\": {\n        \"name\": \"Literature Review\",\n        \"context_servers\": {\n          \"pubmed-search\": { \"enabled\": true }\n        }\n      },\n      \"coding\": {\n        \"name\": \"Coding\",\n        \"context_servers\": {\n          \"pubmed-search\": { \"enabled\": false }\n        }\n      }\n    }\n  }\n}\n```\n\n---\n\n### OpenClaw 🦞\n\n[OpenClaw](https://docs.openclaw.ai/) uses MCP servers via the [mcp-adapter plugin](https://github.com/androidStern-personal/openclaw-mcp-adapter).\n\n**Step 1**: Install the adapter\n\n```bash\nopenclaw plugins install mcp-adapter\n```\n\n**Step 2**: Configure `~/.openclaw/openclaw.json`\n\n```json\n{\n  \"plugins\": {\n    \"entries\": {\n      \"mcp-adapter\": {\n        \"enabled\": true,\n        \"config\": {\n          \"servers\": [\n            {\n              \"name\": \"pubmed-search\",\n              \"transport\": \"stdio\",\n              \"command\": \"uvx\",\n              \"args\": [\"pubmed-search-mcp\"],\n              \"env\": {\n                \"NCBI_EMAIL\": \"your@email.com\"\n              }\n            }\n          ]\n        }\n      }\n    }\n  }\n}\n```\n\n**Step 3**: Restart and verify\n\n```bash\nopenclaw gateway restart\nopenclaw plugins list  # Should show: mcp-adapter | loaded\n```\n\n---\n\n### Cline\n\nPubMed Search MCP now ships a workspace-scoped Cline overlay so project users do not need to recreate rules by hand:\n\n- `AGENTS.md`: shared baseline used to avoid duplicating common rules across agents\n- `.clinerules/*.md`: Cline-only rules, mostly path-scoped to keep context lean\n- `.clinerules/workflows/*.md`: reusable harness workflows for validation, MCP sync, and dual-agent setup\n- `.vscode/extensions.json`: recommended VS Code extensions for Copilot + Cline + Python support\n- `scripts/setup-vscode-ai-harness.sh`: installs the recommended extension set with one command\n\nThis split keeps shared behavior in one place while leaving Copilot-specific behavior in `.github/` and Cline-specific automation in `.clinerules/`.\n\n**Config file**: `cline_mcp_settings.json`\n\n```json\n{\n  \"mcpServers\": {\n    \"pubmed-search\": {\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"S2_API_KEY\": \"your_semantic_scholar_key\",\n        \"PUBMED_SEARCH_DISABLED_SOURCES\": \"\"\n      },\n      \"alwaysAllow\": [],\n      \"disabled\": false\n    }\n  }\n}\n```\n\nFor repeated Semantic Scholar 429 responses, either provide `S2_API_KEY` /\n`SEMANTIC_SCHOLAR_API_KEY` or set `PUBMED_SEARCH_DISABLED_SOURCES` to\n`semantic_scholar`.\n\nRecommended first-run sequence:\n\n```bash\n./scripts/setup-vscode-ai-harness.sh\n```\n\nThen restart VS Code, confirm Cline sees the workspace rules/workflows, and confirm Copilot Chat lists the `pubmed-search` MCP server from `.vscode/mcp.json`.\n\n---\n\n### Microsoft Copilot Studio\n\n![Copilot Studio deployment flow](images/copilot-studio-deployment-flow.svg)\n\nCopilot Studio requires **Streamable HTTP** transport with a public URL.\n\n**Architecture**:\n\n```text\nCopilot Studio ──HTTPS──▶ ngrok ──HTTP──▶ MCP Server (localhost:8765)\n```\n\n**Step 1**: Start the MCP server with HTTP transport\n\n```bash\n# Option A: Full 46-tool primary MCP surface with an assigned ngrok dev/custom domain\nexport PUBMED_AUTH_TOKENS=\"copilot:$(openssl rand -hex 32)\"\nexport NGROK_DOMAIN=\"your-domain.ngrok.dev\"\n./scripts/start-copilot-studio.sh --with-ngrok\n\n# Option B: the same authenticated service with an assigned ngrok domain\nexport PUBMED_AUTH_TOKENS=\"copilot:$(openssl rand -hex 32)\"\nexport NGROK_DOMAIN=\"your-domain.ngrok.dev\"\n./scripts/start-copilot-ngrok.sh\n\n# Option C: simplified 12-tool local schema smoke (never tunnel this mode)\nuv run python run_copilot.py --port 8765\n\n# Option D: manual service when the public URL is already known\nexport PUBMED_AUTH_TOKENS=\"copilot:$(openssl rand -hex 32)\"\nexport PUBMED_AUTH_RESOURCE_SERVER_URL=\"https://your-domain.ngrok.dev/mcp\"\nexport PUBMED_ALLOWED_HOSTS=\"your-domain.ngrok.dev\"\nexport PUBMED_ALLOWED_ORIGINS=\"https://your-domain.ngrok.dev\"\npubmed-search-mcp-http --mode service --transport streamable-http \\\n  --copilot-compatible --host 127.0.0.1 --port 8765\n```\n\n**Step 2**: Expose the already configured service via ngrok (if not using a\nscript)\n\n```bash\nngrok http --url=your-domain.ngrok.dev 8765\n```\n\n**Step 3**: Configure in Copilot Studio\n\n| Setting | Value |\n| --- | --- |\n| Server name | `PubMed Search` |\n| Server URL | `https://your-domain.ngrok.dev/mcp` |\n| Authentication | Bearer token for service mode; `None` only during an unpublished local smoke test |\n\n**Environment variables** for the authenticated custom-domain ngrok wrapper:\n\n```bash\nexport NGROK_DOMAIN=\"your-domain.ngrok.dev\"\nexport COPILOT_PORT=8765\nexport PUBMED_AUTH_TOKENS=\"copilot:$(openssl rand -hex 32)\"\n./scripts/start-copilot-ngrok.sh\n```\n\nBoth tunnel scripts converge on the same fail-closed `--mode service` launcher.\nThey require bearer credentials plus an assigned `NGROK_DOMAIN`, reject an\nalready occupied backend port, start the loopback service first, and verify\n`/ready` plus unauthenticated `/mcp` rejection before ngrok is started. The\nresource URL and Host/Origin allowlists are derived from that known HTTPS\ndomain. `run_copilot.py` remains loopback-only and must not be tunneled.\n\nThe simplified surface still exposes the generic search as `unified_search`,\nnot a PubMed-only alias. Its primitive schema accepts `query`, `limit`,\n`min_year`, `max_year`, `sources`, and `options`, then delegates to the\nsame unified runner as the primary surface. This keeps the single-search\ncontract while avoiding Copilot Studio `anyOf` / `$ref` schema problems.\n\n> See [copilot-studio/README.md](https://github.com/u9401066/pubmed-search-mcp/blob/master/copilot-studio/README.md) for the full OpenAPI schema and Copilot Studio setup walkthrough.\n\n---\n\n### Other MCP Clients\n\nAny MCP-compatible client can use this server via stdio:\n\n```bash\n# Basic\nuvx pubmed-search-mcp\n\n# With environment variables\nNCBI_EMAIL=your@email.com NCBI_API_KEY=your_key uvx pubmed-search-mcp\n\n# From source (development, stdio)\ncd pubmed-search-mcp\nuv run python -m pubmed_search.presentation.mcp_server\n```\n\n---\n\n## Verification & Troubleshooting\n\n### Quick Health Check\n\nAfter configuring any client, verify the server is working:\n\n1. **Local stdio**: ask the AI to list PubMed tools; it should enumerate 46 tools in the primary MCP surface.\n2. **HTTP probes**: confirm `/health`, `/ready`, and `/info`; a service-mode health probe must use an allowed `Host`.\n3. **Modern MCP call**: send authenticated `tools/list` directly, without `initialize` or `Mcp-Session-Id`.\n4. **Simple search**: ask for \"CRISPR gene therapy\" and confirm `unified_search` reports source counts or explicit source warnings.\n5. **Isolation check**: in service mode, verify two bearer principals cannot read each other's session, export, artifact, chronicle, note, or pipeline state.\n\n### Common Issues\n\n| Problem | Solution |\n| --- | --- |\n| `uvx` not found | Install uv: `curl -LsSf https://astral.sh/uv/install.sh \\| sh` |\n| Server not connecting | Check the config file path and JSON syntax |\n| `NCBI_EMAIL` warning | Set the `NCBI_EMAIL` environment variable in the config |\n| Slow responses | Add `NCBI_API_KEY` for 10 req/s (vs 3 req/s default) |\n| Tool output shows `Canceled: Canceled` during progress reporting | Update to a build with non-cancelling best-effort progress callbacks. If a specific broad search still exceeds your client's own tool timeout, retry with `options=\"shallow\"` or specify narrower `sources`. |\n| Source API uses placeholder email | Set `NCBI_EMAIL` or pass `--email`; CrossRef, Unpaywall, and OpenAlex reuse that runtime contact unless a source-specific override/API key is configured |\n| CORE search fails | Set `CORE_API_KEY` — [get one free](https://core.ac.uk/services/api) |\n| Behind proxy | Set `HTTP_PROXY` / `HTTPS_PROXY` environment variables |\n| Modern client waits for an MCP session id | Remove the obsolete initialize/session-id handshake; send `tools/list` or `tools/call` directly |\n| Service note export rejects `output_dir` or `template_file` | This is intentional; omit host paths and use a built-in note format in the tenant's isolated `references/` directory |\n| Service pipeline rejects `file:` or `workspace` scope | Save the YAML into the authenticated tenant store and load it as `saved:<name>`; service callers cannot read process-wide workspace files |\n| Scheduled service pipeline does not run | The service Compose profile disables the in-process scheduler; run manually or design a single external leader/lease before enabling schedules |\n\n### Debug Mode\n\nRun the server directly to see logs:\n\n```bash\nNCBI_EMAIL=your@email.com uvx pubmed-search-mcp 2>server.log\n```\n\n---\n\n## Advanced: Proxy & Network\n\nIf you're behind a corporate proxy:\n\n```json\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"type\": \"stdio\",\n      \"command\": \"uvx\",\n      \"args\": [\"pubmed-search-mcp\"],\n      \"env\": {\n        \"NCBI_EMAIL\": \"your@email.com\",\n        \"HTTP_PROXY\": \"http://proxy.corp.com:8080\",\n        \"HTTPS_PROXY\": \"http://proxy.corp.com:8080\"\n      }\n    }\n  }\n}\n```\n\n---\n\n## Advanced: Docker Deployment\n\nThe default Compose file is a single-user loopback demo. Team/remote use has a\nseparate fail-closed service profile:\n\n```bash\n# Local loopback demo\ndocker compose up -d\n\n# Local self-signed HTTPS smoke test\ndocker compose -f docker-compose.https.yml up -d\n\n# Authenticated service (populate the ignored .env from the example first)\ncp .env.service.example .env\ndocker compose --env-file .env -f docker-compose.service.yml up -d\n```\n\nThe service profile uses a persistent volume, one replica/server process, a\ndisabled in-process scheduler, and a host-loopback application port intended for\na trusted same-host TLS proxy. See\n[DEPLOYMENT.md](#/deployment) for proxy, secret, backup, and readiness\nrequirements.\n",
+  "deployment": "<!-- Generated from DEPLOYMENT.md by scripts/build_docs_site.py -->\n<!-- markdownlint-configure-file {\"MD051\": false} -->\n<!-- markdownlint-disable MD051 -->\n\n# PubMed Search MCP 部署指南\n\n這份文件描述目前仍受支援、且已與實際程式碼對齊的部署方式。\n\n## 三種部署合約\n\n![Client integration and deployment workflow](images/integration-deployment-workflow.svg)\n\n| 合約 | 入口 | 適用情境 | 安全邊界 |\n| --- | --- | --- | --- |\n| **本機 stdio** | `uvx pubmed-search-mcp` | VS Code、Claude Desktop、Cursor | 單一本機使用者；無 MCP listening port |\n| **本機 loopback HTTP** | `pubmed-search-mcp-http --mode local --host 127.0.0.1` | 本機開發、connector smoke | 可信單使用者 durable `default` tenant；僅 loopback，不可對外 |\n| **多使用者 service** | `pubmed-search-mcp-http --mode service` | 團隊、雲端、Copilot Studio | HTTPS + bearer principal + Host/Origin allowlist；啟動時 fail closed |\n\nCopilot compatibility 只是 HTTP response/schema 的變體，不是第四種信任模型。\nService mode 即使加上 `--copilot-compatible`，仍然強制認證與 allowlist。\n\n```mermaid\nflowchart TD\n  Start[選擇執行邊界]\n  One{只有一位本機使用者?}\n  NeedHTTP{需要 HTTP connector?}\n  StdIO[本機 stdio\\nuvx pubmed-search-mcp]\n  LocalHTTP[本機 loopback HTTP\\n--mode local]\n  Service[多使用者 service\\n--mode service + HTTPS + bearer]\n\n  Start --> One\n  One -->|是| NeedHTTP\n  NeedHTTP -->|否| StdIO\n  NeedHTTP -->|是| LocalHTTP\n  One -->|否| Service\n```\n\n## 0. 多使用者 service（Multi-Agent Service Mode）\n\n本機 profile 刻意維持低設定成本，但不是遠端授權邊界。只要 port\n會被另一台機器、共用 runner 或多位 agent 存取，就必須使用 service mode。\n\n### 0.1 Compose 啟動\n\n```bash\ncp .env.service.example .env\n# 編輯 .env；真實 token/API key 不可 commit\ndocker compose --env-file .env -f docker-compose.service.yml up -d\n```\n\n`docker-compose.service.yml` 會強制必要變數、掛載 persistent volume，並將\napplication port 只 publish 至 host loopback，供同一台 host 上的可信 TLS reverse proxy\n使用。它固定單副本/單 server process，因為目前尚無共享 session backend。\n\n不使用 Compose 時，等價設定為：\n\n```bash\nexport PUBMED_SERVER_MODE=service\nexport PUBMED_AUTH_TOKENS=\"team-a:$(openssl rand -hex 32),team-b:$(openssl rand -hex 32)\"\nexport PUBMED_AUTH_RESOURCE_SERVER_URL=\"https://mcp.example.org/mcp\"\n# Optional; defaults to the public resource URL origin (https://mcp.example.org)\nexport PUBMED_AUTH_ISSUER_URL=\"https://mcp.example.org\"\nexport PUBMED_ALLOWED_HOSTS=\"mcp.example.org\"\nexport PUBMED_ALLOWED_ORIGINS=\"https://mcp.example.org\"\nexport PUBMED_TRUSTED_PROXY_IPS=\"127.0.0.1\"\nexport PUBMED_TENANT_MAX_CONCURRENCY=8\nexport PUBMED_DATA_DIR=/var/lib/pubmed-search-mcp\nexport NCBI_EMAIL=\"ops@example.org\"\n\npubmed-search-mcp-http --mode service --transport streamable-http --host 0.0.0.0 --port 8765\n```\n\nAgent 端帶上 bearer token：\n\n```jsonc\n{\n  \"servers\": {\n    \"pubmed-search\": {\n      \"url\": \"https://mcp.example.org/mcp\",\n      \"headers\": { \"Authorization\": \"Bearer <team-a token>\" }\n    }\n  }\n}\n```\n\n### 0.2 身分、隔離與持久化\n\n| 合約 | 身分/隔離依據 | 可持久化 |\n| --- | --- | --- |\n| 本機 stdio | 當前 OS 使用者與 local process | ✅ local store |\n| 本機 loopback HTTP | 顯式 local profile 的單使用者 `default` tenant | ✅ local durable store，跨 MCP requests/reconnects |\n| service | 已驗證 bearer principal | ✅ `PUBMED_DATA_DIR/tenants/<principal>/` |\n| service anonymous | 無可驗證身分 | ❌ 啟動/請求即拒絕 |\n\nLocal stdio 與 local loopback HTTP 都使用 `PUBMED_DATA_DIR` 下的 durable `default`\ntenant。MCP transport session identifier 只屬於 protocol lifecycle，**不是 service tenant\n身分或授權邊界**。Service 的 session、article cache、搜尋歷史、`pmids=\"last\"`、artifacts、\nexports、chronicles 與 pipelines 全部依已驗證 principal 分區。\n\nMCP SDK v2 的 2026-07-28 request model 會直接送 `tools/list` / `tools/call`，\n不使用 `initialize` handshake 或 `Mcp-Session-Id`。Service 仍必須在每個 protected\nrequest 驗證 bearer principal；legacy compatibility 不是身分或持久化來源。\n\n| Filesystem 能力 | 本機 stdio / loopback | Authenticated service |\n| --- | --- | --- |\n| Pipeline store | `workspace` / `global` / `auto` | tenant-derived store；`auto` 只解析到該 principal root |\n| Pipeline file | 可讀 `file:path.yaml` | 拒絕 server-host `file:` read |\n| Chronicle revisions | `<tenant-root>/chronicles/` 下不可變 revision | 同一路徑按 principal 隔離；index 可由 revision 重建 |\n| Chronicle artifacts | `<tenant-root>/artifacts/` 下的 manifest、JSON 與純 `.mmd` source | 同一路徑按 principal 隔離；不需 server-side Node.js |\n| Note output | 可選 `output_dir` 與 `template_file` | 不接受 host path；使用內建 format 寫入 `<tenant-root>/references/` |\n| Scheduler | 可在可信 local process 啟用 | Service Compose 停用；未來需單一 leader/lease |\n\nService 中的 pipeline `workspace` 不代表共用 repo；tenant-derived store 刻意不繼承\nprocess-wide workspace root，避免一個 principal 讀到另一個 principal 的 host files。\nChronicle revision 以原子發布保存，權威 revision 檔不會被後續寫入覆蓋；損壞或遺失的\n衍生 index 可由 revision 重建。Artifact bundle 若因 I/O 失敗而未完成，已提交的\nrevision 仍有效，MCP 回應會明確回報 artifact warning。客戶端應顯示\n`mermaid_validation` warning，並以完整的 `chronicle_map.json`／`snapshot.json` 作為\n圖形簡化時的可稽核資料來源。\n\n### 0.3 Service 環境變數\n\n| 環境變數 | Service 要求 | 說明 |\n| --- | --- | --- |\n| `PUBMED_SERVER_MODE` | `service` | 啟用遠端 fail-closed profile |\n| `PUBMED_AUTH_TOKENS` | **必填** | `principal:token` 逗號分隔清單；不可 commit |\n| `PUBMED_AUTH_RESOURCE_SERVER_URL` | **必填** | 公開 HTTPS MCP endpoint，包含 `/mcp` |\n| `PUBMED_AUTH_ISSUER_URL` | 選填 | Metadata 公告的 issuer；未設定時從 resource URL 導出同一 public origin |\n| `PUBMED_ALLOWED_HOSTS` | **必填** | 逗號分隔的對外 host names |\n| `PUBMED_ALLOWED_ORIGINS` | **必填** | 逗號分隔的 HTTPS origins |\n| `PUBMED_TRUSTED_PROXY_IPS` | 視拓撲 | 只列實際 TLS proxy IP；空值不信任 forwarded headers |\n| `PUBMED_TENANT_ISOLATION` | 強制 `true` | service 不允許關閉 tenant isolation |\n| `PUBMED_TENANT_MAX_CONCURRENCY` | 預設 `8` | 單一 tenant 同時在途的請求上限 |\n| `PUBMED_DATA_DIR` | persistent volume | tenant storage 根目錄 |\n\nToken 只以 digest 比對，不應出現在 log 或 object repr。正式環境應由\norchestrator secret store 注入，不要把 `.env` 或 token 寫進 image。\n\n### 0.4 配額與上游速率\n\n- **上游速率限制是全域的**（每個外部 API 一組），因為 NCBI 等來源依\n  API key 計量。\n- **每租戶並行上限**負責公平性，避免單一 agent 吃光全域預算。\n\n### 0.5 健康檢查與 auxiliary routes\n\n| 端點 | Service 認證 | 用途 |\n| --- | --- | --- |\n| `/health` | 開放 | liveness probe |\n| `/ready` | 開放 | readiness probe |\n| `/info` | 開放 | transport 與 endpoint metadata；不回傳 tenant 資料 |\n| `/mcp` | **bearer** | primary Streamable HTTP MCP contract |\n| `/api/*` | **bearer** | principal-scoped cache/session reads |\n| `/exports`, `/download/*` | **bearer** | principal-scoped export listing/download |\n\nMCP SDK v2 可與 OpenTelemetry tracer provider 整合；實際 exporter、retention 與私密過濾應由\n部署環境明確設定。\n\n### 0.6 擴充限制\n\n目前 session、scheduler 與部分持久狀態是 process/filesystem scoped。在尚無共享\nsession backend、distributed lock 與 scheduler leader election 前：\n\n- 保持單副本、單 server process（service Compose 已固定 `replicas: 1`）。\n- `docker-compose.service.yml` 預設停用 pipeline scheduler；若未來需要排程，請用\n  單獨的 leader process/分散式 lease 啟用，不能讓每個 request worker 各自執行。\n- 使用 persistent `PUBMED_DATA_DIR` volume 並建立備份/retention 政策。\n- 不要以複製 container 當作無狀態水平擴充。\n\n## 1. 前置需求\n\n本專案一律使用 uv。\n\n```bash\nuv sync\n```\n\n必要環境變數：\n\n```bash\nNCBI_EMAIL=your@email.com\n```\n\n可選：\n\n```bash\nNCBI_API_KEY=your_api_key\nCORE_API_KEY=your_core_key\nCROSSREF_EMAIL=your@email.com\nUNPAYWALL_EMAIL=your@email.com\n```\n\n## 2. 本機 stdio 模式\n\n給本機 MCP client 使用時，不需要額外部署 HTTP。stdio entrypoint 會強制\nlocal mode，而且預設不啟動 auxiliary HTTP port。\n\n```bash\nuvx pubmed-search-mcp\n```\n\n或在 repo 內開發測試：\n\n```bash\nuv run python -m pubmed_search.presentation.mcp_server\n```\n\n只有明確需要與本機其他 process 共用 read-only cache API 時，才設定\n`PUBMED_STDIO_AUX_HTTP=1`；該 API 仍只能綁定 loopback。\n\n## 3. 本機 loopback HTTP\n\n### 標準 streamable-http\n\n```bash\npubmed-search-mcp-http --mode local --transport streamable-http \\\n  --host 127.0.0.1 --port 8765 --email your@email.com\n```\n\n主要端點：\n\n- MCP: `http://localhost:8765/mcp`\n- Health: `http://localhost:8765/health`\n- Ready: `http://localhost:8765/ready`\n- Info: `http://localhost:8765/info`\n- Exports: `http://localhost:8765/exports`\n\n這個 profile 給單一可信本機操作者，不可把 port publish 至 LAN/公網。Docker\n本機示範請直接用 `docker compose up -d`；Compose 會顯式開啟 container-bind\n例外，同時只把 port publish 至 host `127.0.0.1`。\n\n顯式 `--mode local` 是可信單使用者合約。所有 loopback MCP requests 共用\ndurable `default` tenant，因此 `pmids=\"last\"`、session、article cache 與 export 在同一\nserver 重連後仍可讀取。這不是遠端認證模型；安全性來自 launcher 強制\nloopback bind 與 Host/Origin allowlist。Service mode 不會映射到 `default` tenant，且無\nbearer token 時會拒絕請求。\n\n### Copilot 相容 HTTP 語意，但保留完整工具面\n\n```bash\npubmed-search-mcp-http --mode local --transport streamable-http \\\n  --copilot-compatible --host 127.0.0.1 --port 8765 --email your@email.com\n```\n\n這條路線的用途是：\n\n- 保留完整 46-tool primary MCP surface\n- 啟用 Copilot 所需的 JSON response/HTTP compatibility，不改變安全合約\n- 適合先嘗試完整面，再視 Copilot Studio schema 狀況回退到簡化模式\n\n遠端 Copilot 不可使用上述 local 指令；請套用第 0 節的 service 環境，並改用\n`--mode service --copilot-compatible`。\n\n## 4. Copilot Studio 專用模式\n\n若 Copilot Studio 對完整 schema 仍有解析限制，可在本機使用簡化模式做\nschema compatibility 測試：\n\n```bash\nuv run python run_copilot.py --port 8765 --email your@email.com\n```\n\n這個入口會：\n\n- 固定使用 streamable-http\n- 開啟 Copilot compatibility middleware\n- 暴露 12 個 Copilot Studio 友善、只用 primitive parameters 的精簡工具\n- 保持 generic literature search 名稱為 `unified_search`，並呼叫共用 unified runner；不是 PubMed-only 或第二套搜尋宇宙\n- 在精簡 schema 仍提供 string 型 `sources` 與 `options`，可使用相同的 source expression 與 broker retrieval flags\n- 提供 primitive-schema `read_session`，可回讀 search runs、取得不自動執行的 replay arguments，或讀取 persisted artifact\n\n`run_copilot.py` 是 source-tree compatibility wrapper，不取代 service-mode auth 合約。多使用者\n部署優先使用 packaged `pubmed-search-mcp-http --mode service --copilot-compatible`。\n\n## 5. HTTPS 部署\n\n### 本機 HTTPS 測試\n\n這兩組 script 與自簽憑證只是 local smoke test，不是 production TLS profile。\n\n```bash\n./scripts/start-https-local.sh\n```\n\n端點：\n\n- MCP: `https://localhost:8443/mcp`\n- Health: `https://localhost:8443/health`\n- Ready: `https://localhost:8443/ready`\n- Info: `https://localhost:8443/info`\n\n停止：\n\n```bash\n./scripts/start-https-local.sh stop\n```\n\n### Docker + Nginx 本機 HTTPS 示範\n\n```bash\n./scripts/start-https-docker.sh up\n```\n\n端點：\n\n- MCP: `https://localhost/mcp`\n- Info: `https://localhost/info`\n- Health: `https://localhost/health`\n- Ready: `https://localhost/ready`\n- Exports: `https://localhost/exports`\n\n其他指令：\n\n```bash\n./scripts/start-https-docker.sh logs\n./scripts/start-https-docker.sh status\n./scripts/start-https-docker.sh down\n```\n\n### 拓撲圖\n\n```mermaid\nflowchart LR\n    Client[MCP Client / Copilot Studio]\n    Proxy[HTTPS Reverse Proxy]\n    Server[PubMed Search MCP\\npubmed-search-mcp-http]\n    Endpoint[\"/mcp\"]\n    Utility[\"/health · /ready · /info · /exports\"]\n\n    Client --> Proxy\n    Proxy --> Endpoint\n    Proxy --> Utility\n    Endpoint --> Server\n    Utility --> Server\n```\n\n### Service TLS reverse proxy 要求\n\n正式 service 請使用可信 CA 憑證與獍立 reverse proxy/load balancer。代理必須：\n\n- 把 `/mcp` request/response buffering 關閉，並保留長連線 timeout。\n- 轉送 `Authorization`，且只從 `PUBMED_TRUSTED_PROXY_IPS` 列出的 proxy 接受 forwarded headers。\n- 代理 `/health` 與 `/ready`；不要用需認證或會建立 session 的端點當 probe。\n- 不公開 app container port；`docker-compose.service.yml` 只 publish host loopback。\n\n## 6. Docker 啟動\n\n```bash\n# 單使用者 loopback demo\ndocker compose up -d\n\n# 多使用者 service（先完成 .env）\ndocker compose --env-file .env -f docker-compose.service.yml up -d\n```\n\nService profile 必須使用 persistent volume、單副本，並在外層做 TLS termination。\nImage 固定在 Python `3.11.15-slim-trixie` 的 multi-platform digest，uv 固定為\n`0.11.24`，local HTTPS demo 也固定 Nginx `1.31.3-alpine` digest；runtime 使用\n非 root UID/GID `10001`；\n`PUBMED_DATA_DIR=/var/lib/pubmed-search-mcp` 必須掛載成該使用者可寫的 volume。\n\n## 7. 雲端部署\n\n### Railway\n\n```bash\nrailway up\n```\n\n必要環境/秘密：\n\n```bash\nNCBI_EMAIL=your@email.com\nPUBMED_SERVER_MODE=service\nPUBMED_AUTH_TOKENS=<secret reference>\nPUBMED_AUTH_RESOURCE_SERVER_URL=https://mcp.example.org/mcp\nPUBMED_AUTH_ISSUER_URL=https://mcp.example.org  # optional; defaults to resource origin\nPUBMED_ALLOWED_HOSTS=mcp.example.org\nPUBMED_ALLOWED_ORIGINS=https://mcp.example.org\nPUBMED_TRUSTED_PROXY_IPS=<platform ingress IPs>\nPUBMED_DATA_DIR=/var/lib/pubmed-search-mcp\n```\n\n### Azure Container Apps\n\n```bash\n# This repository does not currently publish a public GHCR image. Build the\n# reviewed source into your own Azure Container Registry first.\naz acr build \\\n  --registry myregistry \\\n  --image pubmed-search-mcp:0.6.5 \\\n  .\n\naz containerapp create \\\n  --name pubmed-mcp \\\n  --resource-group myRG \\\n  --image myregistry.azurecr.io/pubmed-search-mcp:0.6.5 \\\n  --target-port 8765 \\\n  --ingress external\n```\n\n請先設定 Container Apps 對該 registry 的 pull identity，再透過 secret references\n注入上述 service 變數；不要把 token 寫在 shell history 或版本控制的 YAML。同時固定\n單 replica，並掛載可備份的持久儲存。不要引用本 repo 未發布的 `ghcr.io/...:latest`\n映像。\n\n## 8. GitHub Pages 文件網站\n\n本 repo 的文件網站是 committed static site，來源 Markdown 仍是 canonical source：\n\n```bash\nuv run python scripts/count_mcp_tools.py --update-docs\nuv run python scripts/build_docs_site.py\n```\n\n網站入口與 generated payload：\n\n- `docs/index.html`\n- `docs/site.js`\n- `docs/site.css`\n- `docs/site-content/*.md`\n- `docs/site-content.js`\n\n`Deploy Docs Site` GitHub Actions workflow 會在 `main` / `master` 的 docs 相關變更後自動重建 tool docs 與 docs site payload，然後把 `docs/` 發布到 GitHub Pages。若不用 Actions，也可以在 GitHub repo Settings → Pages 選擇 Deploy from branch，branch 選 `main` 或 `master`，folder 選 `/docs`。\n\n## 9. 已不建議的路線\n\n以下路線仍可能存在於舊文件或歷史腳本中，但不應再當成主要部署方式：\n\n- `/sse` + `/messages` 作為主要遠端入口；新部署請使用 `/mcp` streamable-http\n- 舊的 module 路徑，例如 `uv run python -m pubmed_search.mcp`\n- `pip install -e \".[all]\"` 這類非 uv 指令\n- 舊版公開工具名稱，例如 `search_literature`、`search_core`、`merge_search_results`\n\n## 10. 驗證清單\n\n部署後至少驗證以下項目：\n\n1. `GET /health` 回傳 `status: ok`\n2. `GET /ready` 回傳 ready，`GET /info` 顯示正確 transport/endpoint\n3. Service 未帶 bearer 的 `POST /mcp`、`/api/*`、`/exports` 回傳 401/403\n4. 有效 bearer 可直接完成現代 MCP `tools/list` 與一次 `unified_search`；2026-07-28 transport 不再送 `initialize` 或 `Mcp-Session-Id`\n5. 不同 principal 無法互讀 session、artifact、export、chronicle 或 pipeline\n6. 若是 Copilot Studio，確認 46-tool primary surface 正確被發現\n\n## 相關文件\n\n- [ARCHITECTURE.md](#/architecture)\n- [docs/INTEGRATIONS.md](#/troubleshooting)\n- [copilot-studio/README.md](https://github.com/u9401066/pubmed-search-mcp/blob/master/copilot-studio/README.md)\n"
 };
@@ -6,7 +6,7 @@ const DOC_PAGES = [
     audience: "start",
     title: "Overview",
     blurb: "Quick install, MCP SDK v2 runtime choice, supported clients, and the complete product map.",
-    keywords: "MCP 2.0 MCP SDK v2 local stdio loopback service 45 tools broker security",
+    keywords: "MCP 2.0 MCP SDK v2 local stdio loopback service 46 tools broker security",
     file: "site-content/overview.md",
   },
   {
@@ -16,7 +16,7 @@ const DOC_PAGES = [
     audience: "start",
     title: "總覽",
     blurb: "快速安裝、MCP SDK v2 runtime 選擇、支援 client 與完整產品地圖。",
-    keywords: "MCP 2.0 MCP SDK v2 本機 stdio loopback 多人 service 45 工具 broker 安全",
+    keywords: "MCP 2.0 MCP SDK v2 本機 stdio loopback 多人 service 46 工具 broker 安全",
     file: "site-content/overview-zh.md",
   },
   {
@@ -162,9 +162,9 @@ const DOC_PAGES = [
     audience: "developer",
     title: "Quick Reference",
     titleByLang: { zh: "快速索引" },
-    blurb: "Fast lookup for all 45 MCP tools across 16 registry categories.",
-    blurbByLang: { zh: "45 個 MCP tools 與 16 個 registry categories 的快速查找。" },
-    keywords: "45 tools 16 categories tool index parameters",
+    blurb: "Fast lookup for all 46 MCP tools across 16 registry categories.",
+    blurbByLang: { zh: "46 個 MCP tools 與 16 個 registry categories 的快速查找。" },
+    keywords: "46 tools 16 categories tool index parameters",
     file: "site-content/quick-reference.md",
   },
   {
@@ -253,7 +253,7 @@ const DOC_PAGES = [
   },
 ];
 
-// Complete 45 Tools Rich Database for Interactive Tool Explorer
+// Complete 46 Tools Rich Database for Interactive Tool Explorer
 const MCP_TOOLS_DATA = [
   {
     name: "unified_search",
@@ -267,6 +267,18 @@ const MCP_TOOLS_DATA = [
     example: 'unified_search(query="remimazolam ICU sedation", limit=10)',
     docLink: "user-guide",
   },
+  {
+    name: "unified_search_batch",
+    cat: "search",
+    catName: { zh: "核心搜尋", en: "Search" },
+    icon: "🔍",
+    summary: {
+      zh: "一次執行多個查詢變體：共用來源併發預算，跨變體去重後只做一次 enrichment，並以 RRF 融合排序。",
+      en: "Run several query variants under one source concurrency budget, dedupe across variants before enrichment, and fuse rankings with RRF.",
+    },
+    example: 'unified_search_batch(queries=["remimazolam ICU sedation", "remimazolam[tiab] AND delirium"], limit=10)',
+    docLink: "tools-usage-guide",
+  },
   {
     name: "parse_pico",
     cat: "query",
@@ -813,7 +825,7 @@ const UI_COPY = {
     sidebarNote: "Use the language switch for translated pages. Reference pages without a separate translation stay visible in both modes.",
     heroKicker: "Current MCP SDK v2 handbook",
     heroCopy:
-      "Start with a working local search, then move through all 45 tools, broker/source behavior, evidence workflows, authenticated service deployment, troubleshooting, architecture, testing, and release operations under the modern MCP 2.0 request model.",
+      "Start with a working local search, then move through all 46 tools, broker/source behavior, evidence workflows, authenticated service deployment, troubleshooting, architecture, testing, and release operations under the modern MCP 2.0 request model.",
     menu: "Menu",
     outlineTitle: "On This Page",
     noPages: "No pages match this filter.",
@@ -831,22 +843,22 @@ const UI_COPY = {
     journeyLocalTitle: "Run locally",
     journeyLocalCopy: "Install with uvx, connect an AI client, and make the first search.",
     journeyResearchKicker: "Research handbook",
-    journeyResearchTitle: "Use the 45 tools",
+    journeyResearchTitle: "Use the 46 tools",
     journeyResearchCopy: "Choose a capability, search multiple sources, read full text, and preserve evidence.",
     journeyServiceKicker: "Operator runbook",
     journeyServiceTitle: "Deploy safely",
     journeyServiceCopy: "Keep local and authenticated multi-user service contracts separate.",
     journeyLabel: "Documentation quick paths",
-    globalSearchPlaceholder: "Search docs & 45 tools... (Ctrl+K)",
+    globalSearchPlaceholder: "Search docs & 46 tools... (Ctrl+K)",
     topbarSearchLabel: "Search Docs & Tools",
-    toolExplorerTitle: "🛠️ 45 MCP Tools Interactive Explorer",
+    toolExplorerTitle: "🛠️ 46 MCP Tools Interactive Explorer",
     toolExplorerSubtitle: "Filter tools by capability, search keywords in English or Chinese, and copy execution examples with one click.",
     toolSearchPlaceholder: "Search tool name, keyword (e.g. pmid, fulltext, pico, figure, 基因, rct, export)...",
-    allToolsCategory: "All (45)",
+    allToolsCategory: "All (46)",
     copyToolCode: "Copy",
     copiedToolCode: "Copied!",
     hubAll: "All Sections",
-    hubTools: "45 Tools Explorer",
+    hubTools: "46 Tools Explorer",
     hubUser: "User Guides",
     hubChronicle: "Research Chronicle",
     hubPipeline: "Pipelines",
@@ -867,7 +879,7 @@ const UI_COPY = {
     sidebarNote: "使用語言切換查看翻譯頁；沒有獨立翻譯的 reference 頁會在兩種語言模式都顯示。",
     heroKicker: "當前 MCP SDK v2 完整手冊",
     heroCopy:
-      "從可立即使用的本機搜尋開始，再在現代 MCP 2.0 request model 下完整掌握 45 個工具、broker/source 行為、證據工作流、認證多人服務部署、疑難排解、架構、測試與發佈操作。",
+      "從可立即使用的本機搜尋開始，再在現代 MCP 2.0 request model 下完整掌握 46 個工具、broker/source 行為、證據工作流、認證多人服務部署、疑難排解、架構、測試與發佈操作。",
     menu: "選單",
     outlineTitle: "本頁目錄",
     noPages: "沒有符合篩選條件的頁面。",
@@ -885,22 +897,22 @@ const UI_COPY = {
     journeyLocalTitle: "本機執行",
     journeyLocalCopy: "用 uvx 安裝、接上 AI client，並完成第一次搜尋。",
     journeyResearchKicker: "研究操作手冊",
-    journeyResearchTitle: "使用 45 個工具",
+    journeyResearchTitle: "使用 46 個工具",
     journeyResearchCopy: "依能力選工具、平行查多來源、取得全文並保存證據。",
     journeyServiceKicker: "維運手冊",
     journeyServiceTitle: "安全部署",
     journeyServiceCopy: "完整分開本機與認證多人 service 的信任合約。",
     journeyLabel: "文件快速路徑",
-    globalSearchPlaceholder: "搜尋文檔與 45 個工具... (Ctrl+K)",
+    globalSearchPlaceholder: "搜尋文檔與 46 個工具... (Ctrl+K)",
     topbarSearchLabel: "搜尋文檔與工具",
-    toolExplorerTitle: "🛠️ 45 個 MCP 工具互動索引庫",
+    toolExplorerTitle: "🛠️ 46 個 MCP 工具互動索引庫",
     toolExplorerSubtitle: "依能力分類篩選、支援中英文關鍵字即時搜尋，一鍵複製呼叫範例與工具名稱。",
     toolSearchPlaceholder: "搜尋工具名稱、關鍵字（如 pmid, 全文, pico, 圖表, 基因, rct, export）...",
-    allToolsCategory: "全部 (45)",
+    allToolsCategory: "全部 (46)",
     copyToolCode: "複製",
     copiedToolCode: "已複製！",
     hubAll: "全部章節",
-    hubTools: "45 工具庫",
+    hubTools: "46 工具庫",
     hubUser: "使用手冊",
     hubChronicle: "研究編年史",
     hubPipeline: "Pipeline 流程",
@@ -1601,11 +1613,11 @@ function renderNav(filter = "") {
 }
 
 // ──────────────────────────────────────────────────────────────────────────
-// Interactive 45-Tool Explorer
+// Interactive 46-Tool Explorer
 // ──────────────────────────────────────────────────────────────────────────
 
 const TOOL_CATEGORIES_LIST = [
-  { key: "all", labelZh: "全部 (45)", labelEn: "All (45)" },
+  { key: "all", labelZh: "全部 (46)", labelEn: "All (46)" },
   { key: "search", labelZh: "🔍 核心搜尋 (1)", labelEn: "🔍 Search (1)" },
   { key: "query", labelZh: "🧠 查詢智能 (3)", labelEn: "🧠 Query Intel (3)" },
   { key: "discovery", labelZh: "📑 文章探索 (5)", labelEn: "📑 Discovery (5)" },
@@ -1739,7 +1751,7 @@ function renderSearchResults(query) {
   if (!q) {
     modalSearchResults.innerHTML = `
       <p class="modal-search-hint">
-        💡 ${activeLang === "zh" ? "輸入關鍵字搜尋文檔章節、概念或 45 個 MCP 工具..." : "Type a keyword to search across documents, headings, and all 45 tools..."}
+        💡 ${activeLang === "zh" ? "輸入關鍵字搜尋文檔章節、概念或 46 個 MCP 工具..." : "Type a keyword to search across documents, headings, and all 46 tools..."}
       </p>
     `;
     return;
@@ -13,6 +13,7 @@ from dataclasses import dataclass, field
 from typing import Any, Literal
 
 from pubmed_search.application.unified import (
+    UnifiedSearchBatchRequest,
     UnifiedSearchRunner,
     UnifiedSearchRunRequest,
     UnifiedSearchService,
@@ -82,12 +83,13 @@ class PubMedSearchClient:
         *,
         searcher: Any | None = None,
         unified_search_runner: UnifiedSearchRunner | None = None,
+        unified_search_batch_runner: UnifiedSearchRunner | None = None,
     ) -> None:
         self.config = config or PubMedSearchConfig()
         self._searcher = searcher
-        self._unified_search_service = (
-            UnifiedSearchService(unified_search_runner) if unified_search_runner is not None else None
-        )
+        self._unified_search_runner = unified_search_runner
+        self._unified_search_batch_runner = unified_search_batch_runner
+        self._unified_search_service: UnifiedSearchService | None = None
 
     @property
     def searcher(self) -> Any:
@@ -127,11 +129,14 @@ class PubMedSearchClient:
         pipeline: str | None = None,
         dry_run: bool = False,
         stop_at: str = "",
+        cursor: str = "",
     ) -> UnifiedSearchResult:
         """Run unified_search and return an SDK result object.
 
         `output_format` defaults to JSON for Python callers. Markdown remains
-        available for callers that want the MCP-style human response.
+        available for callers that want the MCP-style human response. Pass a
+        previous response's `search_status.page.next_cursor` as `cursor` to
+        read the next page of its ranked candidates without new source calls.
         """
         service = self._get_unified_search_service()
         raw = await service.search(
@@ -146,15 +151,57 @@ class PubMedSearchClient:
                 pipeline=pipeline,
                 dry_run=dry_run,
                 stop_at=stop_at,
+                cursor=cursor,
+            )
+        )
+        return UnifiedSearchResult(raw=raw, output_format=output_format)
+
+    async def unified_search_batch(
+        self,
+        queries: list[str],
+        *,
+        limit: int | str = 10,
+        sources: str | None = None,
+        ranking: Literal["balanced", "impact", "recency", "quality"] = "balanced",
+        output_format: Literal["markdown", "json", "toon"] = "json",
+        filters: str | None = None,
+        options: str | None = None,
+    ) -> UnifiedSearchResult:
+        """Run several query variants as one unified_search batch.
+
+        The variants share one source concurrency budget, are deduplicated
+        across each other before enrichment, and come back both per variant
+        (`structured["variants"]`) and as one fused ranking (`articles`).
+        """
+        service = self._get_unified_search_service()
+        raw = await service.search_batch(
+            UnifiedSearchBatchRequest(
+                queries=tuple(queries),
+                limit=limit,
+                sources=sources,
+                ranking=ranking,
+                output_format=output_format,
+                filters=filters,
+                options=options,
             )
         )
         return UnifiedSearchResult(raw=raw, output_format=output_format)
 
     def _get_unified_search_service(self) -> UnifiedSearchService:
         if self._unified_search_service is None:
-            from pubmed_search.presentation.mcp_server.tools.unified_runner import make_mcp_unified_search_runner
-
-            self._unified_search_service = UnifiedSearchService(make_mcp_unified_search_runner(self.searcher))
+            runner = self._unified_search_runner
+            batch_runner = self._unified_search_batch_runner
+            if runner is None:
+                from pubmed_search.presentation.mcp_server.tools.unified_runner import make_mcp_unified_search_runner
+
+                runner = make_mcp_unified_search_runner(self.searcher)
+            if batch_runner is None and self._unified_search_runner is None:
+                from pubmed_search.presentation.mcp_server.tools.unified_batch import (
+                    make_mcp_unified_search_batch_runner,
+                )
+
+                batch_runner = make_mcp_unified_search_batch_runner(self.searcher)
+            self._unified_search_service = UnifiedSearchService(runner, batch_runner)
         return self._unified_search_service
 
 
@@ -28,6 +28,7 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "TimelineBuilder": ("pubmed_search.application.timeline", "TimelineBuilder"),
     "MilestoneDetector": ("pubmed_search.application.timeline", "MilestoneDetector"),
     # Unified search service contracts
+    "UnifiedSearchBatchRequest": ("pubmed_search.application.unified", "UnifiedSearchBatchRequest"),
     "UnifiedSearchRunRequest": ("pubmed_search.application.unified", "UnifiedSearchRunRequest"),
     "UnifiedSearchService": ("pubmed_search.application.unified", "UnifiedSearchService"),
 }
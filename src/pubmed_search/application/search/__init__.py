@@ -36,6 +36,9 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     # Ranking algorithms
     "BM25Corpus": ("pubmed_search.application.search.ranking_algorithms", "BM25Corpus"),
     "bm25_score": ("pubmed_search.application.search.ranking_algorithms", "bm25_score"),
+    "bm25_scores": ("pubmed_search.application.search.ranking_algorithms", "bm25_scores"),
+    "ArticleTermIndex": ("pubmed_search.application.search.term_index", "ArticleTermIndex"),
+    "CorpusStatistics": ("pubmed_search.application.search.corpus_statistics", "CorpusStatistics"),
     "bm25_score_normalized": ("pubmed_search.application.search.ranking_algorithms", "bm25_score_normalized"),
     "RRFResult": ("pubmed_search.application.search.ranking_algorithms", "RRFResult"),
     "reciprocal_rank_fusion": ("pubmed_search.application.search.ranking_algorithms", "reciprocal_rank_fusion"),
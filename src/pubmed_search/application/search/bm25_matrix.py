@@ -0,0 +1,160 @@
+"""
+Vectorized BM25 over a sparse term-document matrix.
+
+``bm25_score`` walks every article and every query term in Python. For deep
+searches that merge thousands of candidates, ``BM25Matrix`` instead lays the
+result set's :class:`~pubmed_search.application.search.term_index.ArticleTermIndex`
+out as a CSR matrix:
+
+- rows are interned term ids, so a row is the postings list of one term;
+- each stored entry holds the document id, the combined term frequency and the
+  field boost BM25 applies to that document (title > keyword/MeSH > abstract);
+- per-document BM25 length normalization is computed once.
+
+A query then needs only its few term rows: the caller passes one IDF per query
+term and every document is scored in one ``bincount`` pass. Entries for a document
+are accumulated in query-term order, like the scalar loop, so results match
+``bm25_score`` to floating-point rounding.
+
+NumPy is optional. :func:`numpy_available` reports whether it is installed, and
+``bm25_scores`` falls back to the pure-Python scorer without it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import ModuleType
+
+    import numpy as np
+    import numpy.typing as npt
+
+    from pubmed_search.application.search.term_index import ArticleTermIndex
+
+_numpy: ModuleType | None = None
+_numpy_checked = False
+
+
+def _load_numpy() -> ModuleType | None:
+    """Import NumPy on first use (it is an optional dependency)."""
+    global _numpy, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy as np
+        except ImportError:
+            _numpy = None
+        else:
+            _numpy = np
+        _numpy_checked = True
+    return _numpy
+
+
+def _require_numpy() -> ModuleType:
+    np = _load_numpy()
+    if np is None:
+        raise RuntimeError("BM25Matrix requires numpy")
+    return np
+
+
+def numpy_available() -> bool:
+    """Return whether the optional ``numpy`` dependency is installed."""
+    return _load_numpy() is not None
+
+
+class BM25Matrix:
+    """CSR term-document matrix with BM25 field boosts for one term index."""
+
+    __slots__ = ("avg_doc_length", "boosts", "doc_ids", "indptr", "length_norm", "n_docs", "tfs")
+
+    def __init__(
+        self,
+        indptr: npt.NDArray[np.int64],
+        doc_ids: npt.NDArray[np.int64],
+        tfs: npt.NDArray[np.float64],
+        boosts: npt.NDArray[np.float64],
+        length_norm: npt.NDArray[np.float64],
+        *,
+        avg_doc_length: float,
+    ) -> None:
+        self.indptr = indptr
+        self.doc_ids = doc_ids
+        self.tfs = tfs
+        self.boosts = boosts
+        self.length_norm = length_norm
+        self.avg_doc_length = avg_doc_length
+        self.n_docs = len(length_norm)
+
+    @classmethod
+    def from_index(
+        cls,
+        index: ArticleTermIndex,
+        *,
+        k1: float,
+        b: float,
+        avg_doc_length: float,
+        title_boost: float,
+        keyword_boost: float,
+    ) -> BM25Matrix:
+        """Build the matrix from *index*. Requires NumPy."""
+        np = _require_numpy()
+
+        n_docs = len(index)
+        n_terms = len(index.terms)
+
+        sizes = np.fromiter(map(len, index.term_tf), dtype=np.int64, count=n_docs)
+        docs = np.repeat(np.arange(n_docs, dtype=np.int64), sizes)
+        terms = np.array(index.flat_terms, dtype=np.int64)
+        tfs = np.array(index.flat_tfs, dtype=np.float64)
+
+        # Field boost per entry. Each combined map lists title terms first, then
+        # the remaining keyword/MeSH terms, then abstract-only terms.
+        starts = np.zeros(n_docs, dtype=np.int64)
+        np.cumsum(sizes[:-1], out=starts[1:])
+        rank_in_doc = np.arange(len(terms), dtype=np.int64) - np.repeat(starts, sizes)
+        title_counts = np.fromiter(map(len, index.title_tf), dtype=np.int64, count=n_docs)
+        title_keyword_counts = np.array(index.title_keyword_counts, dtype=np.int64)
+        boosts = np.where(
+            rank_in_doc < np.repeat(title_counts, sizes),
+            title_boost,
+            np.where(rank_in_doc < np.repeat(title_keyword_counts, sizes), keyword_boost, 1.0),
+        )
+
+        # Group entries by term to form CSR rows (stable, so documents stay in
+        # order; a 16-bit key lets NumPy use radix sort).
+        sort_keys = terms.astype(np.uint16) if n_terms <= 1 << 16 else terms
+        order = np.argsort(sort_keys, kind="stable")
+        indptr = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum(np.bincount(terms, minlength=n_terms), out=indptr[1:])
+
+        doc_lengths = np.asarray(index.doc_lengths, dtype=np.float64)
+        length_norm = k1 * (1 - b + b * doc_lengths / max(avg_doc_length, 1))
+        return cls(indptr, docs[order], tfs[order], boosts[order], length_norm, avg_doc_length=avg_doc_length)
+
+    def score(self, term_ids: Sequence[int | None], idfs: Sequence[float], *, k1: float) -> list[float]:
+        """Score every document for the query terms *term_ids* (``None`` = unseen term).
+
+        *idfs* gives each query term's IDF, aligned with *term_ids*.
+        """
+        np = _require_numpy()
+        rows = [(term_id, idf) for term_id, idf in zip(term_ids, idfs) if term_id is not None]
+        if not rows:
+            return [0.0] * self.n_docs
+
+        starts = np.array([self.indptr[term_id] for term_id, _idf in rows], dtype=np.int64)
+        stops = np.array([self.indptr[term_id + 1] for term_id, _idf in rows], dtype=np.int64)
+        idf = np.array([row_idf for _term_id, row_idf in rows], dtype=np.float64)
+
+        # Gather the query rows' entries in query-term order.
+        lengths = stops - starts
+        entries = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(int(lengths.sum()))
+        docs = self.doc_ids[entries]
+        tf = self.tfs[entries]
+        tf_norm = (tf * (k1 + 1)) / (tf + self.length_norm[docs])
+        contributions = np.repeat(idf, lengths) * tf_norm * self.boosts[entries]
+        scores: list[float] = np.bincount(docs, weights=contributions, minlength=self.n_docs).tolist()
+        return scores
+
+
+__all__ = ["BM25Matrix", "numpy_available"]
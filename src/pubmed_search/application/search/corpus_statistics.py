@@ -0,0 +1,214 @@
+"""
+Persistent corpus statistics — a global IDF prior for BM25.
+
+``BM25Corpus`` derives IDF from the current result set only. For small result
+sets that estimate is noisy: a term found in 2 of 5 results looks common even
+when it is rare across the literature. ``CorpusStatistics`` accumulates
+document frequencies from every article that enters ``ArticleCache`` and keeps
+them in a compact on-disk table, so BM25 can blend the result-set IDF with a
+stable global IDF (see ``BM25Corpus.from_index``).
+
+On-disk format (``<data_dir>/cache/idf_stats.tsv``, UTF-8)::
+
+    #corpus-statistics/v1<TAB><total_docs>
+    <term><TAB><df>
+    ...
+
+Counts added by this process are kept as pending deltas. ``flush`` re-reads
+the table, adds the deltas and atomically replaces the file, so several
+workers can feed the same table without losing each other's counts. When the
+table exceeds ``max_terms`` the rarest terms are dropped; a missing term reads
+as ``df = 0``, which gives almost the same IDF as ``df = 1``.
+
+Enabled by ``PUBMED_IDF_STORE``; ``PUBMED_IDF_PRIOR_WEIGHT`` sets the blend.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import math
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pubmed_search.application.search.term_index import MIN_TERM_LENGTH, tokenize
+from pubmed_search.shared.file_io import atomic_write_text
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+logger = logging.getLogger(__name__)
+
+CORPUS_STATISTICS_FILENAME = "idf_stats.tsv"
+DEFAULT_FLUSH_EVERY = 1000  # Documents added before pending counts are written out
+DEFAULT_MAX_TERMS = 500_000  # Keep the most frequent terms when the table grows past this
+MIN_PRIOR_DOCS = 1000  # The prior is ignored until this many documents were counted
+
+_HEADER = "#corpus-statistics/v1"
+
+
+def document_terms(title: str | None, abstract: str | None, phrases: Iterable[str] = ()) -> set[str]:
+    """Distinct indexable terms of one document, tokenized like ``ArticleTermIndex``."""
+    tokens = tokenize(title or "") + tokenize(abstract or "") + tokenize(" ".join(phrases))
+    return {token for token in tokens if len(token) >= MIN_TERM_LENGTH}
+
+
+class CorpusStatistics:
+    """Document frequencies accumulated across searches, optionally persisted."""
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+        max_terms: int = DEFAULT_MAX_TERMS,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.flush_every = flush_every
+        self.max_terms = max_terms
+        self.total_docs = 0
+        self._doc_freq: dict[str, int] = {}
+        self._pending_freq: dict[str, int] = {}
+        self._pending_docs = 0
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self.total_docs, self._doc_freq = self._read_table()
+
+    def __len__(self) -> int:
+        return len(self._doc_freq)
+
+    def document_frequency(self, term: str) -> int:
+        """Number of counted documents containing *term*."""
+        return self._doc_freq.get(term, 0)
+
+    def idf(self, term: str) -> float:
+        """BM25 IDF of *term* over the accumulated corpus (same form as ``bm25_score``)."""
+        df = self._doc_freq.get(term, 0)
+        return math.log(1.0 + (self.total_docs - df + 0.5) / (df + 0.5))
+
+    # -------------------------------------------------------------------------
+    # Accumulation
+    # -------------------------------------------------------------------------
+
+    def add_document(self, title: str | None, abstract: str | None, phrases: Iterable[str] = ()) -> None:
+        """Count one document's distinct terms."""
+        terms = document_terms(title, abstract, phrases)
+        with self._lock:
+            doc_freq = self._doc_freq
+            pending = self._pending_freq
+            for term in terms:
+                doc_freq[term] = doc_freq.get(term, 0) + 1
+                pending[term] = pending.get(term, 0) + 1
+            self.total_docs += 1
+            self._pending_docs += 1
+            should_flush = self.path is not None and self._pending_docs >= self.flush_every
+        if should_flush:
+            self.flush()
+
+    def add_article_data(self, article_data: Mapping[str, Any]) -> None:
+        """Count an article payload as stored by ``ArticleCache`` (title, abstract, keywords, MeSH)."""
+        phrases = [
+            phrase
+            for field_name in ("keywords", "mesh_terms")
+            for phrase in article_data.get(field_name) or []
+            if isinstance(phrase, str)
+        ]
+        title = article_data.get("title")
+        abstract = article_data.get("abstract")
+        self.add_document(
+            title if isinstance(title, str) else None,
+            abstract if isinstance(abstract, str) else None,
+            phrases,
+        )
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def _read_table(self) -> tuple[int, dict[str, int]]:
+        if self.path is None or not self.path.exists():
+            return 0, {}
+        doc_freq: dict[str, int] = {}
+        try:
+            with self.path.open(encoding="utf-8") as handle:
+                header = handle.readline().rstrip("\n").split("\t")
+                if len(header) != 2 or header[0] != _HEADER:
+                    logger.warning("Ignoring corpus statistics with unknown format: %s", self.path)
+                    return 0, {}
+                total_docs = int(header[1])
+                for line in handle:
+                    term, _, df = line.rstrip("\n").rpartition("\t")
+                    if term:
+                        doc_freq[term] = int(df)
+        except (OSError, ValueError) as exc:
+            logger.warning("Failed to read corpus statistics %s: %s", self.path, exc)
+            return 0, {}
+        return total_docs, doc_freq
+
+    def flush(self) -> bool:
+        """Merge pending counts into the on-disk table. Returns ``True`` if a file was written."""
+        if self.path is None:
+            return False
+        with self._lock:
+            if not self._pending_docs:
+                return False
+            total_docs, doc_freq = self._read_table()
+            for term, count in self._pending_freq.items():
+                doc_freq[term] = doc_freq.get(term, 0) + count
+            total_docs += self._pending_docs
+            if len(doc_freq) > self.max_terms:
+                kept = sorted(doc_freq.items(), key=lambda item: item[1], reverse=True)[: self.max_terms]
+                doc_freq = dict(kept)
+            lines = [f"{_HEADER}\t{total_docs}"]
+            lines.extend(f"{term}\t{df}" for term, df in doc_freq.items())
+            try:
+                atomic_write_text(self.path, "\n".join(lines) + "\n")
+            except OSError as exc:
+                logger.warning("Failed to persist corpus statistics %s: %s", self.path, exc)
+                return False
+            self.total_docs = total_docs
+            self._doc_freq = doc_freq
+            self._pending_freq = {}
+            self._pending_docs = 0
+            return True
+
+
+_store_lock = threading.Lock()
+_settings_store: CorpusStatistics | None = None
+_settings_path: Path | None = None
+
+
+def get_corpus_statistics() -> CorpusStatistics | None:
+    """Return the store configured by settings, or ``None`` when ``PUBMED_IDF_STORE`` is off."""
+    global _settings_store, _settings_path
+    from pubmed_search.shared.settings import get_settings
+
+    settings = get_settings()
+    if not getattr(settings, "idf_store_enabled", False):
+        return None
+    path = Path(settings.data_dir) / "cache" / CORPUS_STATISTICS_FILENAME
+    with _store_lock:
+        if _settings_store is None or _settings_path != path:
+            if _settings_store is not None:
+                _settings_store.flush()
+            _settings_store = CorpusStatistics(path)
+            _settings_path = path
+            atexit.register(_settings_store.flush)
+        return _settings_store
+
+
+def get_idf_prior_weight() -> float:
+    """Blend weight of the global IDF prior, clamped to ``[0, 1]``."""
+    from pubmed_search.shared.settings import get_settings
+
+    return min(max(float(getattr(get_settings(), "idf_prior_weight", 0.5)), 0.0), 1.0)
+
+
+__all__ = [
+    "MIN_PRIOR_DOCS",
+    "CorpusStatistics",
+    "document_terms",
+    "get_corpus_statistics",
+    "get_idf_prior_weight",
+]
@@ -0,0 +1,237 @@
+"""
+Near-Duplicate Detection — MinHash signatures with LSH banding.
+
+Exact deduplication in ``ResultAggregator`` merges on normalized DOI, PMID,
+provider IDs or identical normalized titles. Records that describe the same
+work but differ slightly still survive as duplicates, for example:
+
+- a bioRxiv preprint and its published version (different DOIs);
+- the same paper from OpenAlex, Semantic Scholar, CORE and Europe PMC, where
+  titles differ in punctuation, casing or a word or two.
+
+This module finds such pairs in near-linear time:
+
+1. Each title is reduced to a set of character shingles.
+2. A MinHash signature estimates Jaccard similarity between shingle sets.
+3. LSH banding buckets signatures so that only likely-similar titles become
+   candidate pairs (no O(n²) comparison).
+4. Candidates are confirmed with the exact shingle Jaccard, publication year
+   and author checks, and must not carry conflicting identifiers (except a
+   preprint paired with its published version).
+
+Architecture:
+    Stateless helpers called by ``ResultAggregator`` for
+    ``DeduplicationStrategy.NEAR_DUPLICATE``; confirmed pairs are fed into the
+    existing Union-Find.
+"""
+
+from __future__ import annotations
+
+import random
+import unicodedata
+import zlib
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from pubmed_search.shared.article_identity import normalize_article_doi, normalize_article_title
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from pubmed_search.domain.entities.article import UnifiedArticle
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+SHINGLE_SIZE = 4  # Character n-gram length over the normalized title
+NUM_PERMUTATIONS = 32  # MinHash signature length
+LSH_BANDS = 8  # 8 bands x 4 rows: candidate threshold around Jaccard 0.6
+LSH_BUCKET_WINDOW = 16  # Pair each bucket member with at most this many earlier members
+NEAR_DUPLICATE_THRESHOLD = 0.8  # Exact shingle Jaccard needed to confirm a pair
+NO_AUTHOR_THRESHOLD = 0.9  # Stricter bar when either record has no authors
+MAX_YEAR_GAP = 1  # Same work indexed in adjacent years
+MAX_PREPRINT_YEAR_GAP = 2  # Preprint posted up to two years before publication
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_PERMUTATION_SEED = 0x5EED_D0C5
+
+_PREPRINT_DOI_PREFIXES = ("10.1101/", "10.48550/", "10.26434/", "10.2139/", "10.20944/", "10.21203/")
+_PREPRINT_SOURCES = frozenset({"arxiv", "medrxiv", "biorxiv", "chemrxiv", "ssrn", "preprints.org", "research square"})
+
+_rng = random.Random(_PERMUTATION_SEED)  # noqa: S311 - fixed hash permutations, not security
+_PERMUTATIONS: tuple[tuple[int, int], ...] = tuple(
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERMUTATIONS)
+)
+del _rng
+
+
+# =============================================================================
+# MinHash / LSH
+# =============================================================================
+
+
+def title_shingles(title: str | None, size: int = SHINGLE_SIZE) -> frozenset[str]:
+    """Character shingles of the normalized title (punctuation and case removed)."""
+    return _shingles(normalize_article_title(title), size)
+
+
+def _shingles(normalized: str, size: int = SHINGLE_SIZE) -> frozenset[str]:
+    if len(normalized) <= size:
+        return frozenset({normalized}) if normalized else frozenset()
+    return frozenset(normalized[i : i + size] for i in range(len(normalized) - size + 1))
+
+
+@lru_cache(maxsize=65536)
+def _permuted_hashes(shingle: str) -> tuple[int, ...]:
+    """The shingle's hash under every permutation (titles share most shingles)."""
+    h = zlib.crc32(shingle.encode("utf-8"))
+    prime = _MERSENNE_PRIME
+    return tuple((a * h + b) % prime for a, b in _PERMUTATIONS)
+
+
+def minhash_signature(shingles: frozenset[str]) -> tuple[int, ...]:
+    """MinHash signature of *shingles* (deterministic across processes)."""
+    return tuple(map(min, zip(*map(_permuted_hashes, shingles))))
+
+
+def lsh_candidate_pairs(signatures: Sequence[tuple[int, ...] | None], bands: int = LSH_BANDS) -> set[tuple[int, int]]:
+    """Index pairs ``(i, j)`` with ``i < j`` whose signatures share at least one band.
+
+    Within one bucket, each member is paired with its ``LSH_BUCKET_WINDOW``
+    predecessors only. Buckets of many near-identical titles therefore cost
+    O(m) rather than O(m²); the Union-Find still joins the whole chain.
+    """
+    candidates: set[tuple[int, int]] = set()
+    if not signatures:
+        return candidates
+    rows = NUM_PERMUTATIONS // bands
+    for band in range(bands):
+        start = band * rows
+        buckets: dict[tuple[int, ...], list[int]] = {}
+        for i, signature in enumerate(signatures):
+            if signature is not None:
+                buckets.setdefault(signature[start : start + rows], []).append(i)
+        for members in buckets.values():
+            for offset in range(1, len(members)):
+                j = members[offset]
+                for i in members[max(0, offset - LSH_BUCKET_WINDOW) : offset]:
+                    candidates.add((i, j))
+    return candidates
+
+
+# =============================================================================
+# Candidate Confirmation
+# =============================================================================
+
+
+def _is_preprint(article: UnifiedArticle) -> bool:
+    article_type = getattr(article, "article_type", None)
+    if getattr(article_type, "value", None) == "preprint":
+        return True
+    if getattr(article, "arxiv_id", None) and not article.pmid:
+        return True
+    if (article.primary_source or "").lower() in _PREPRINT_SOURCES:
+        return True
+    return (article.doi or "").lower().startswith(_PREPRINT_DOI_PREFIXES)
+
+
+def _family_from_full_name(full_name: str) -> str:
+    """Family name from "Smith, John", "Smith J" (PubMed) or "John Smith"."""
+    if "," in full_name:
+        return full_name.split(",", 1)[0]
+    tokens = full_name.split()
+    if not tokens:
+        return ""
+    return tokens[0] if len(tokens) > 1 and len(tokens[-1].rstrip(".")) <= 2 else tokens[-1]
+
+
+def _family_names(article: UnifiedArticle) -> list[str]:
+    names: list[str] = []
+    for author in getattr(article, "authors", None) or []:
+        name = author.family_name or _family_from_full_name(author.full_name or "")
+        folded = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode().lower()
+        folded = "".join(ch for ch in folded if ch.isalnum())
+        if folded:
+            names.append(folded)
+    return names
+
+
+def _identifiers_conflict(a: UnifiedArticle, b: UnifiedArticle) -> bool:
+    """Different records by identity, unless one is the preprint of the other."""
+    if a.pmid and b.pmid and a.pmid != b.pmid:
+        return True
+    doi_a = normalize_article_doi(a.doi)
+    doi_b = normalize_article_doi(b.doi)
+    if doi_a and doi_b and doi_a != doi_b:
+        return _is_preprint(a) == _is_preprint(b)
+    return False
+
+
+def _years_compatible(a: UnifiedArticle, b: UnifiedArticle) -> bool:
+    if a.year is None or b.year is None:
+        return True
+    gap = MAX_PREPRINT_YEAR_GAP if _is_preprint(a) != _is_preprint(b) else MAX_YEAR_GAP
+    return abs(a.year - b.year) <= gap
+
+
+def _confirm_pair(a: UnifiedArticle, b: UnifiedArticle, similarity: float) -> bool:
+    if similarity < NEAR_DUPLICATE_THRESHOLD:
+        return False
+    if _identifiers_conflict(a, b) or not _years_compatible(a, b):
+        return False
+    names_a = _family_names(a)
+    names_b = _family_names(b)
+    if not names_a or not names_b:
+        return similarity >= NO_AUTHOR_THRESHOLD
+    return not set(names_a).isdisjoint(names_b)
+
+
+def find_near_duplicates(
+    articles: Sequence[UnifiedArticle],
+    *,
+    min_title_length: int = 0,
+    already_merged: Callable[[int, int], bool] | None = None,
+) -> list[tuple[int, int]]:
+    """
+    Find confirmed near-duplicate index pairs among *articles*.
+
+    Args:
+        articles: Articles to compare (any order).
+        min_title_length: Skip titles whose normalized form is shorter, as
+            short generic titles ("Editorial", "Reply") are not distinctive.
+        already_merged: Optional predicate to skip pairs already known to be
+            duplicates (e.g. ``UnionFind`` roots are equal).
+
+    Returns:
+        Sorted list of ``(i, j)`` pairs with ``i < j``.
+    """
+    shingle_sets: list[frozenset[str]] = []
+    signatures: list[tuple[int, ...] | None] = []
+    for article in articles:
+        normalized = normalize_article_title(article.title)
+        shingles = _shingles(normalized) if len(normalized) >= max(min_title_length, 1) else frozenset()
+        shingle_sets.append(shingles)
+        signatures.append(minhash_signature(shingles) if shingles else None)
+
+    confirmed: list[tuple[int, int]] = []
+    for i, j in sorted(lsh_candidate_pairs(signatures)):
+        if already_merged is not None and already_merged(i, j):
+            continue
+        a_shingles = shingle_sets[i]
+        b_shingles = shingle_sets[j]
+        intersection = len(a_shingles & b_shingles)
+        similarity = intersection / (len(a_shingles) + len(b_shingles) - intersection)
+        if _confirm_pair(articles[i], articles[j], similarity):
+            confirmed.append((i, j))
+    return confirmed
+
+
+__all__ = [
+    "NEAR_DUPLICATE_THRESHOLD",
+    "find_near_duplicates",
+    "lsh_candidate_pairs",
+    "minhash_signature",
+    "title_shingles",
+]
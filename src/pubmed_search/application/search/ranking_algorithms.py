@@ -25,18 +25,29 @@ References:
 Architecture:
     These algorithms are stateless functions called by ResultAggregator.
     They operate on UnifiedArticle objects and return scored/reranked lists.
+    Each accepts an optional ``ArticleTermIndex`` (see ``term_index``) so one
+    result set is tokenized once and shared by BM25, MMR and the analyses.
 """
 
 from __future__ import annotations
 
+import heapq
 import math
+import random
 import re
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from pubmed_search.application.search.bm25_matrix import BM25Matrix, numpy_available
+from pubmed_search.application.search.corpus_statistics import MIN_PRIOR_DOCS
+from pubmed_search.application.search.term_index import ArticleTermIndex, query_terms, tokenize
 from pubmed_search.shared.article_identity import canonical_article_key
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from collections.abc import Set as AbstractSet
+
+    from pubmed_search.application.search.corpus_statistics import CorpusStatistics
     from pubmed_search.domain.entities.article import UnifiedArticle
 
 
@@ -50,6 +61,11 @@ _BM25_B = 0.75  # Document length normalization parameter
 _BM25_TITLE_BOOST = 2.0  # Title match gets 2x IDF weight
 _BM25_MESH_BOOST = 1.5  # MeSH/keyword match gets 1.5x IDF weight
 _MIN_TERM_LENGTH = 3  # Minimum term length for indexing
+_BM25_VECTORIZE_MIN_DOCS = 1000  # Below this, building the matrix costs more than it saves
+
+# Average pairwise distance: above this many pairs, estimate from a fixed sample
+_PAIRWISE_DISTANCE_MAX_PAIRS = 20_000  # Exact up to 200 documents; sample SE ~0.002
+_PAIRWISE_SAMPLE_SEED = 0x5A3D1E
 
 
 @dataclass
@@ -58,12 +74,17 @@ class BM25Corpus:
     Corpus statistics for BM25 scoring.
 
     Built from the current search result set (micro-corpus).
-    Each search creates a fresh corpus from its results.
+    Each search creates a fresh corpus from its results. An optional
+    persistent ``prior`` (global document frequencies, see
+    ``corpus_statistics``) is blended into every IDF with ``prior_weight``.
     """
 
     total_docs: int = 0
     avg_doc_length: float = 0.0
     doc_freq: dict[str, int] = field(default_factory=dict)  # term → number of docs containing term
+    term_index: ArticleTermIndex | None = field(default=None, repr=False, compare=False)
+    prior: CorpusStatistics | None = field(default=None, repr=False, compare=False)
+    prior_weight: float = 0.0  # 0 = result-set IDF only, 1 = global IDF only
 
     @classmethod
     def from_articles(cls, articles: list[UnifiedArticle]) -> BM25Corpus:
@@ -73,39 +94,46 @@ class BM25Corpus:
         Indexes title + abstract + keywords + MeSH terms.
         Time complexity: O(n × avg_doc_length).
         """
-        corpus = cls(total_docs=len(articles))
-        total_length = 0
-
-        for article in articles:
-            # Extract all terms from article
-            terms = _extract_article_terms(article)
-            total_length += len(terms)
+        return cls.from_index(ArticleTermIndex(articles))
 
-            # Count document frequency (each term counted once per doc)
-            unique_terms = set(terms)
-            for term in unique_terms:
-                corpus.doc_freq[term] = corpus.doc_freq.get(term, 0) + 1
+    @classmethod
+    def from_index(
+        cls,
+        index: ArticleTermIndex,
+        *,
+        prior: CorpusStatistics | None = None,
+        prior_weight: float = 0.5,
+    ) -> BM25Corpus:
+        """Derive corpus statistics from an already built term index.
+
+        The *prior* is only used once it has counted ``MIN_PRIOR_DOCS``
+        documents; until then IDF comes from the result set alone.
+        """
+        use_prior = prior is not None and prior.total_docs >= MIN_PRIOR_DOCS and prior_weight > 0
+        return cls(
+            total_docs=len(index),
+            avg_doc_length=index.avg_indexed_length,
+            doc_freq=index.string_doc_freq(),
+            term_index=index,
+            prior=prior if use_prior else None,
+            prior_weight=prior_weight if use_prior else 0.0,
+        )
 
-        corpus.avg_doc_length = total_length / max(corpus.total_docs, 1)
-        return corpus
+    def idf(self, term: str) -> float:
+        """IDF of *term*: ``ln(1 + (N - df + 0.5) / (df + 0.5))``, blended with the prior if set."""
+        df = self.doc_freq.get(term, 0)
+        idf = math.log(1.0 + (self.total_docs - df + 0.5) / (df + 0.5))
+        if self.prior is not None:
+            idf = (1.0 - self.prior_weight) * idf + self.prior_weight * self.prior.idf(term)
+        return idf
 
 
 def _extract_article_terms(article: UnifiedArticle) -> list[str]:
     """Extract all indexable terms from an article."""
-    text_parts: list[str] = []
-
-    if article.title:
-        text_parts.append(article.title.lower())
-    if article.abstract:
-        text_parts.append(article.abstract.lower())
-
     keywords = getattr(article, "keywords", []) or []
     mesh_terms = getattr(article, "mesh_terms", []) or []
-    for kw in keywords + mesh_terms:
-        text_parts.append(kw.lower())
-
-    full_text = " ".join(text_parts)
-    return [t for t in re.findall(r"\b\w+\b", full_text) if len(t) >= _MIN_TERM_LENGTH]
+    text_parts = [article.title or "", article.abstract or "", *keywords, *mesh_terms]
+    return [t for t in tokenize(" ".join(text_parts)) if len(t) >= _MIN_TERM_LENGTH]
 
 
 def bm25_score(
@@ -137,10 +165,15 @@ def bm25_score(
     Returns:
         BM25 score (raw, not normalized). Higher = more relevant.
     """
-    query_terms = [t.lower() for t in re.findall(r"\b\w+\b", query) if len(t) >= _MIN_TERM_LENGTH]
-    if not query_terms or corpus.total_docs == 0:
+    terms = query_terms(query)
+    if not terms or corpus.total_docs == 0:
         return 0.0
 
+    index = corpus.term_index
+    position = index.position(article) if index is not None else None
+    if index is not None and position is not None:
+        return _bm25_indexed(index, position, index.query_term_ids(query), [corpus.idf(qt) for qt in terms], corpus)
+
     # Extract terms from different fields
     title_terms = re.findall(r"\b\w+\b", (article.title or "").lower())
     abstract_terms = re.findall(r"\b\w+\b", (article.abstract or "").lower())
@@ -163,16 +196,12 @@ def bm25_score(
     title_set = set(title_terms)
     keyword_set = set(keyword_terms)
 
-    total_docs = corpus.total_docs
     avgdl = corpus.avg_doc_length
 
     score = 0.0
-    for qt in query_terms:
-        # Document frequency
-        df = corpus.doc_freq.get(qt, 0)
-
+    for qt in terms:
         # IDF with log(1+x) form (always non-negative)
-        idf = math.log(1.0 + (total_docs - df + 0.5) / (df + 0.5))
+        idf = corpus.idf(qt)
 
         # Term frequency in document
         tf = tf_map.get(qt, 0)
@@ -192,6 +221,74 @@ def bm25_score(
     return score
 
 
+def _bm25_indexed(
+    index: ArticleTermIndex,
+    position: int,
+    term_ids: Sequence[int | None],
+    idfs: Sequence[float],
+    corpus: BM25Corpus,
+) -> float:
+    """``bm25_score`` for an indexed article, with the query terms' IDF precomputed."""
+    tf_map = index.term_tf[position]
+    title_tf = index.title_tf[position]
+    keyword_tf = index.keyword_tf[position]
+    length_norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * index.doc_lengths[position] / max(corpus.avg_doc_length, 1))
+
+    score = 0.0
+    for term_id, idf in zip(term_ids, idfs):
+        if term_id is None:
+            continue  # tf = 0 contributes nothing
+        tf = tf_map.get(term_id, 0)
+        if tf == 0:
+            continue
+        tf_norm = (tf * (_BM25_K1 + 1)) / (tf + length_norm)
+        if term_id in title_tf:
+            boost = _BM25_TITLE_BOOST
+        elif term_id in keyword_tf:
+            boost = _BM25_MESH_BOOST
+        else:
+            boost = 1.0
+        score += idf * tf_norm * boost
+    return score
+
+
+def bm25_scores(query: str, corpus: BM25Corpus, *, vectorize: bool | None = None) -> list[float]:
+    """Score every article of the corpus's term index against *query*, in index order.
+
+    Query terms are parsed, resolved to ids and given their IDF once for the
+    whole result set.
+    Large result sets are scored in one pass over a sparse term-document
+    matrix (see ``bm25_matrix``) when NumPy is installed; otherwise, or when
+    *vectorize* is ``False``, the pure-Python scorer is used.
+    """
+    index = corpus.term_index
+    if index is None:
+        raise ValueError("bm25_scores needs a corpus built from an ArticleTermIndex")
+    terms = query_terms(query)
+    if not terms or corpus.total_docs == 0:
+        return [0.0] * len(index)
+    term_ids = index.query_term_ids(query)
+    idfs = [corpus.idf(term) for term in terms]
+
+    if vectorize is None:
+        vectorize = len(index) >= _BM25_VECTORIZE_MIN_DOCS and numpy_available()
+    if vectorize:
+        matrix = index.bm25_matrix
+        if matrix is None or matrix.avg_doc_length != corpus.avg_doc_length:
+            matrix = BM25Matrix.from_index(
+                index,
+                k1=_BM25_K1,
+                b=_BM25_B,
+                avg_doc_length=corpus.avg_doc_length,
+                title_boost=_BM25_TITLE_BOOST,
+                keyword_boost=_BM25_MESH_BOOST,
+            )
+            index.bm25_matrix = matrix
+        return matrix.score(term_ids, idfs, k1=_BM25_K1)
+
+    return [_bm25_indexed(index, position, term_ids, idfs, corpus) for position in range(len(index))]
+
+
 def bm25_score_normalized(
     article: UnifiedArticle,
     query: str,
@@ -240,6 +337,9 @@ def reciprocal_rank_fusion(
     dimension_rankings: dict[str, list[str]],
     k: int = _RRF_K,
     dimension_weights: dict[str, float] | None = None,
+    *,
+    term_index: ArticleTermIndex | None = None,
+    top_k: int | None = None,
 ) -> RRFResult:
     """
     Apply Reciprocal Rank Fusion to combine multiple ranking dimensions.
@@ -261,15 +361,17 @@ def reciprocal_rank_fusion(
         k: RRF constant (default 60, proven optimal in TREC evaluations)
         dimension_weights: Optional per-dimension weights. When omitted,
             all dimensions contribute equally.
+        term_index: Optional index of the result set; its precomputed
+            article keys are reused.
+        top_k: Only return the ``top_k`` best articles, selected with a heap
+            (same order as the full sort). Scores cover every article.
 
     Returns:
         RRFResult with fused ranking, scores, and per-dimension contributions
     """
     # Build article key lookup
-    article_map: dict[str, UnifiedArticle] = {}
-    for article in articles:
-        key = _article_key(article)
-        article_map[key] = article
+    keys = _article_keys(articles, term_index)
+    article_map: dict[str, UnifiedArticle] = dict(zip(keys, articles))
 
     # Build rank lookup for each dimension
     dim_rank_maps: dict[str, dict[str, int]] = {}
@@ -311,11 +413,14 @@ def reciprocal_rank_fusion(
         contributions[akey] = dim_contribs
 
     # Sort articles by RRF score (descending)
-    sorted_articles = sorted(
-        articles,
-        key=lambda a: rrf_scores.get(_article_key(a), 0),
-        reverse=True,
-    )
+    def fused_score(i: int) -> float:
+        return rrf_scores.get(keys[i], 0)
+
+    if top_k is None:
+        order = sorted(range(len(articles)), key=fused_score, reverse=True)
+    else:
+        order = heapq.nlargest(top_k, range(len(articles)), key=fused_score)
+    sorted_articles = [articles[i] for i in order]
 
     return RRFResult(
         ranked_articles=sorted_articles,
@@ -343,6 +448,8 @@ def mmr_diversify(
     query: str,
     lambda_param: float = 0.7,
     top_k: int | None = None,
+    *,
+    term_index: ArticleTermIndex | None = None,
 ) -> MMRResult:
     """
     Apply Maximal Marginal Relevance for result diversification.
@@ -353,12 +460,18 @@ def mmr_diversify(
     Uses MeSH term + keyword Jaccard similarity (no ML embeddings needed).
     This is both efficient and domain-appropriate for biomedical literature.
 
+    Term sets are encoded as integer bitsets, and each candidate's maximum
+    similarity to the selected set is updated only against the newly selected
+    article, so selection costs O(n·k) Jaccard evaluations instead of O(n·k²).
+
     Args:
         articles: Pre-ranked articles (by relevance score)
         query: Original search query (for relevance component)
         lambda_param: Balance between relevance (1.0) and diversity (0.0).
             Default 0.7 = slight preference for relevance.
         top_k: Number of results to select. None = all articles.
+        term_index: Optional index of the result set; similarity term sets
+            and article keys are read from it instead of re-tokenizing.
 
     Returns:
         MMRResult with diversified article list and diagnostics
@@ -372,65 +485,63 @@ def mmr_diversify(
 
     n = len(articles)
     top_k = top_k or n
+    keys = _article_keys(articles, term_index)
 
     # Pre-compute term sets for each article (MeSH + keywords + title terms)
-    term_sets: list[set[str]] = []
-    for article in articles:
-        terms = set()
-        for mesh in getattr(article, "mesh_terms", []) or []:
-            terms.add(mesh.lower())
-        for kw in getattr(article, "keywords", []) or []:
-            terms.add(kw.lower())
-        # Add significant title tokens (>= 4 chars to skip stop words)
-        if article.title:
-            for token in re.findall(r"\b\w{4,}\b", article.title.lower()):
-                terms.add(token)
-        term_sets.append(terms)
-
-    # Query term set
-    query_terms = set(re.findall(r"\b\w{3,}\b", query.lower()))
+    term_sets: list[AbstractSet[Any]] = [_similarity_terms(article, term_index) for article in articles]
+
+    # Query term set (interned ids where the index knows the term)
+    query_set: set[Any] = set(re.findall(r"\b\w{3,}\b", query.lower()))
+    if term_index is not None:
+        query_set = {term_index.term_id(term) if term in term_index.vocabulary else term for term in query_set}
 
     # Pre-compute relevance scores (use existing ranking_score if available)
     relevance_scores: list[float] = []
-    for article in articles:
+    for idx, article in enumerate(articles):
         score = getattr(article, "ranking_score", None)
         if score is not None:
             relevance_scores.append(score)
         else:
             # Fallback: Jaccard with query
-            relevance_scores.append(_jaccard_similarity(term_sets[articles.index(article)], query_terms))
+            relevance_scores.append(_jaccard_similarity(term_sets[idx], query_set))
 
     # Normalize relevance to [0, 1]
     max_rel = max(relevance_scores) if relevance_scores else 1.0
     norm_relevance = [r / max_rel for r in relevance_scores] if max_rel > 0 else [0.5] * n
 
+    # Bitset encoding: |A ∩ B| = popcount(a & b), |A ∪ B| = |A| + |B| - |A ∩ B|
+    bitsets = _term_bitsets(term_sets)
+    sizes = [len(terms) for terms in term_sets]
+
     # MMR greedy selection
     selected_indices: list[int] = []
-    remaining = set(range(n))
+    remaining = list(range(n))  # ascending, so ties resolve to the earlier article
     diversity_scores: dict[str, float] = {}
 
     # Start with highest relevance article
     first_idx = max(range(n), key=lambda i: norm_relevance[i])
     selected_indices.append(first_idx)
     remaining.remove(first_idx)
-    diversity_scores[_article_key(articles[first_idx])] = norm_relevance[first_idx]
+    diversity_scores[keys[first_idx]] = norm_relevance[first_idx]
+
+    # Max similarity of each candidate to any already-selected article
+    max_sim = [0.0] * n
+    newest = first_idx
 
     while remaining and len(selected_indices) < top_k:
+        newest_bits = bitsets[newest]
+        newest_size = sizes[newest]
         best_idx = -1
         best_mmr = -float("inf")
 
         for idx in remaining:
-            # Relevance component
-            rel = norm_relevance[idx]
-
-            # Diversity component: max similarity to any already-selected article
-            max_sim = 0.0
-            for sel_idx in selected_indices:
-                sim = _jaccard_similarity(term_sets[idx], term_sets[sel_idx])
-                max_sim = max(max_sim, sim)
+            # Diversity component: only the newly selected article can raise it
+            if newest_bits and (intersection := (bitsets[idx] & newest_bits).bit_count()):
+                sim = intersection / (sizes[idx] + newest_size - intersection)
+                max_sim[idx] = max(max_sim[idx], sim)
 
             # MMR formula
-            mmr = lambda_param * rel - (1 - lambda_param) * max_sim
+            mmr = lambda_param * norm_relevance[idx] - (1 - lambda_param) * max_sim[idx]
 
             if mmr > best_mmr:
                 best_mmr = mmr
@@ -439,11 +550,13 @@ def mmr_diversify(
         if best_idx >= 0:
             selected_indices.append(best_idx)
             remaining.remove(best_idx)
-            diversity_scores[_article_key(articles[best_idx])] = best_mmr
+            diversity_scores[keys[best_idx]] = best_mmr
+            newest = best_idx
 
     # Calculate average pairwise distance in selected set
-    avg_dist = _average_pairwise_distance(
-        [term_sets[i] for i in selected_indices],
+    avg_dist = _average_pairwise_bitset_distance(
+        [bitsets[i] for i in selected_indices],
+        [sizes[i] for i in selected_indices],
     )
 
     selected_articles = [articles[i] for i in selected_indices]
@@ -491,6 +604,8 @@ class SourceDisagreement:
 def analyze_source_disagreement(
     articles: list[UnifiedArticle],
     _source_rankings: dict[str, list[str]] | None = None,
+    *,
+    term_index: ArticleTermIndex | None = None,
 ) -> SourceDisagreement:
     """
     Analyze disagreement between different academic data sources.
@@ -511,35 +626,12 @@ def analyze_source_disagreement(
         articles: Deduplicated articles with source tracking
         source_rankings: Optional pre-computed {source: [article_keys]} rankings.
             If not provided, inferred from article.sources metadata.
+        term_index: Optional index of the result set; its precomputed
+            article keys are reused.
 
     Returns:
         SourceDisagreement with all metrics
     """
-    # Classify articles by source coverage
-    source_to_articles: dict[str, list[str]] = {}
-    article_to_sources: dict[str, list[str]] = {}
-
-    for article in articles:
-        key = _article_key(article)
-        sources: list[str] = []
-
-        # Get sources from SourceMetadata
-        source_metas = getattr(article, "sources", []) or []
-        for sm in source_metas:
-            src_name = sm.source if hasattr(sm, "source") else str(sm)
-            sources.append(src_name)
-
-        # Always include primary_source
-        if article.primary_source and article.primary_source not in sources:
-            sources.append(article.primary_source)
-
-        article_to_sources[key] = sources
-
-        for src in sources:
-            if src not in source_to_articles:
-                source_to_articles[src] = []
-            source_to_articles[src].append(key)
-
     total = len(articles)
     if total == 0:
         return SourceDisagreement(
@@ -551,34 +643,50 @@ def analyze_source_disagreement(
             rank_correlation={},
         )
 
+    # One slot per distinct article key; each source's coverage is a bitmap
+    # over slots, so overlaps are popcounts of ANDed integers.
+    slot_of: dict[str, int] = {}
+    slot_sources: list[list[str]] = []
+    source_slots: dict[str, list[int]] = {}
+    for key, article in zip(_article_keys(articles, term_index), articles):
+        sources = _article_sources(article)
+        slot = slot_of.get(key)
+        if slot is None:
+            slot = slot_of[key] = len(slot_sources)
+            slot_sources.append(sources)
+        else:
+            slot_sources[slot] = sources
+        for src in sources:
+            source_slots.setdefault(src, []).append(slot)
+
+    source_bits = {src: _slot_bitmap(slots, len(slot_sources)) for src, slots in source_slots.items()}
+    single_slots = [slot for slot, sources in enumerate(slot_sources) if len(sources) == 1]
+    single_mask = _slot_bitmap(single_slots, len(slot_sources))
+
     # Count cross-source vs single-source
-    cross_source = sum(1 for sources in article_to_sources.values() if len(sources) > 1)
+    cross_source = sum(1 for sources in slot_sources if len(sources) > 1)
     single_source = total - cross_source
 
     # Per-source unique (articles found ONLY by this source)
-    per_source_unique: dict[str, int] = {}
-    for src, art_keys in source_to_articles.items():
-        unique_count = sum(1 for k in art_keys if len(article_to_sources.get(k, [])) == 1)
-        per_source_unique[src] = unique_count
+    per_source_unique = {src: (bits & single_mask).bit_count() for src, bits in source_bits.items()}
 
     # Source complementarity = fraction of articles from only 1 source
-    complementarity = single_source / total if total > 0 else 0.0
+    complementarity = single_source / total
 
     # Source Agreement Score: based on overlap between all source pairs
     rank_correlation: dict[str, float] = {}
     all_sas_values: list[float] = []
 
-    source_names = sorted(source_to_articles.keys())
+    source_names = sorted(source_bits)
+    sizes = {src: bits.bit_count() for src, bits in source_bits.items()}
     for i in range(len(source_names)):
         for j in range(i + 1, len(source_names)):
             src_a = source_names[i]
             src_b = source_names[j]
-            set_a = set(source_to_articles[src_a])
-            set_b = set(source_to_articles[src_b])
 
             # Overlap coefficient: |A ∩ B| / min(|A|, |B|)
-            intersection = len(set_a & set_b)
-            min_size = min(len(set_a), len(set_b))
+            intersection = (source_bits[src_a] & source_bits[src_b]).bit_count()
+            min_size = min(sizes[src_a], sizes[src_b])
             overlap = intersection / max(min_size, 1)
 
             pair_key = f"{src_a}↔{src_b}"
@@ -603,6 +711,25 @@ def analyze_source_disagreement(
     )
 
 
+def _article_sources(article: UnifiedArticle) -> list[str]:
+    """Source names recorded on *article* (``SourceMetadata``), plus its primary source."""
+    sources: list[str] = []
+    for sm in getattr(article, "sources", []) or []:
+        sources.append(sm.source if hasattr(sm, "source") else str(sm))
+    # Always include primary_source
+    if article.primary_source and article.primary_source not in sources:
+        sources.append(article.primary_source)
+    return sources
+
+
+def _slot_bitmap(slots: Sequence[int], n_slots: int) -> int:
+    """Integer bitmap with the given slot bits set, built in O(n) via a byte buffer."""
+    buffer = bytearray((n_slots + 7) // 8)
+    for slot in slots:
+        buffer[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(buffer, "little")
+
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
@@ -613,7 +740,35 @@ def _article_key(article: UnifiedArticle) -> str:
     return canonical_article_key(article)
 
 
-def _jaccard_similarity(set_a: set[str], set_b: set[str]) -> float:
+def _article_keys(articles: Sequence[UnifiedArticle], term_index: ArticleTermIndex | None) -> list[str]:
+    """Canonical keys for *articles*, reusing the index's precomputed keys."""
+    if term_index is None:
+        return [canonical_article_key(article) for article in articles]
+    return [term_index.key_for(article) for article in articles]
+
+
+def _similarity_terms(article: UnifiedArticle, term_index: ArticleTermIndex | None) -> AbstractSet[Any]:
+    """MMR similarity set for *article*: MeSH/keyword phrases plus title tokens of 4+ chars."""
+    if term_index is not None:
+        position = term_index.position(article)
+        if position is not None:
+            return term_index.similarity_terms(position)
+
+    terms: set[Any] = set()
+    for mesh in getattr(article, "mesh_terms", []) or []:
+        terms.add(mesh.lower())
+    for kw in getattr(article, "keywords", []) or []:
+        terms.add(kw.lower())
+    # Add significant title tokens (>= 4 chars to skip stop words)
+    if article.title:
+        terms.update(re.findall(r"\b\w{4,}\b", article.title.lower()))
+    if term_index is not None:
+        # Compare in the index's id space so mixed indexed/unindexed sets still overlap.
+        return {term_index.term_id(term) if term in term_index.vocabulary else term for term in terms}
+    return terms
+
+
+def _jaccard_similarity(set_a: AbstractSet[Any], set_b: AbstractSet[Any]) -> float:
     """Jaccard similarity coefficient: |A ∩ B| / |A ∪ B|."""
     if not set_a and not set_b:
         return 0.0
@@ -622,18 +777,69 @@ def _jaccard_similarity(set_a: set[str], set_b: set[str]) -> float:
     return intersection / union if union > 0 else 0.0
 
 
-def _average_pairwise_distance(term_sets: list[set[str]]) -> float:
-    """Average pairwise Jaccard distance in a set of documents."""
-    n = len(term_sets)
+def _term_bitsets(term_sets: Sequence[AbstractSet[Any]]) -> list[int]:
+    """Encode term sets as integer bitsets over their shared vocabulary."""
+    bit_of: dict[Any, int] = {}
+    bitsets: list[int] = []
+    for terms in term_sets:
+        bits = 0
+        for term in terms:
+            bit = bit_of.get(term)
+            if bit is None:
+                bit = bit_of[term] = len(bit_of)
+            bits |= 1 << bit
+        bitsets.append(bits)
+    return bitsets
+
+
+def _average_pairwise_bitset_distance(
+    bitsets: Sequence[int],
+    sizes: Sequence[int],
+    *,
+    max_pairs: int = _PAIRWISE_DISTANCE_MAX_PAIRS,
+) -> float:
+    """``_average_pairwise_distance`` over bitset-encoded term sets.
+
+    Exact while there are at most *max_pairs* pairs. Larger sets are estimated
+    from *max_pairs* pairs drawn with a fixed seed, so the result stays
+    deterministic while the cost stops growing quadratically.
+    """
+    n = len(bitsets)
     if n < 2:
         return 1.0
 
+    def distance(i: int, j: int) -> float:
+        union = sizes[i] + sizes[j]
+        if union == 0:
+            return 1.0  # Two empty sets: similarity 0
+        intersection = (bitsets[i] & bitsets[j]).bit_count()
+        return 1.0 - intersection / (union - intersection)
+
+    n_pairs = n * (n - 1) // 2
+    if n_pairs > max_pairs:
+        rng = random.Random(_PAIRWISE_SAMPLE_SEED)  # noqa: S311 - reproducible sample, not security
+        total_distance = 0.0
+        for _ in range(max_pairs):
+            i = rng.randrange(n)
+            j = rng.randrange(n - 1)
+            total_distance += distance(i, j + 1 if j >= i else j)
+        return total_distance / max_pairs
+
     total_distance = 0.0
-    count = 0
     for i in range(n):
+        bits_i = bitsets[i]
+        size_i = sizes[i]
         for j in range(i + 1, n):
-            sim = _jaccard_similarity(term_sets[i], term_sets[j])
-            total_distance += 1.0 - sim  # Distance = 1 - similarity
-            count += 1
+            union = size_i + sizes[j]
+            if union == 0:
+                total_distance += 1.0  # Two empty sets: similarity 0
+                continue
+            intersection = (bits_i & bitsets[j]).bit_count()
+            total_distance += 1.0 - intersection / (union - intersection)
+
+    return total_distance / n_pairs
 
-    return total_distance / count if count > 0 else 1.0
+
+def _average_pairwise_distance(term_sets: Sequence[AbstractSet[Any]]) -> float:
+    """Average pairwise Jaccard distance in a set of documents."""
+    return _average_pairwise_bitset_distance(_term_bitsets(term_sets), [len(terms) for terms in term_sets])
@@ -0,0 +1,201 @@
+"""
+Columnar ranking inputs — a struct-of-arrays view of a candidate set.
+
+``ResultAggregator.rank`` scores every candidate on quality, recency, impact
+and source trust. Computing those per article means reading a dozen
+``UnifiedArticle`` attributes through ``getattr`` for each dimension.
+``RankingColumns`` reads them once into parallel lists (year, citation
+metrics, source count, article type, open-access flag, ...). Each dimension is
+then computed for the whole candidate set in one pass over its columns.
+
+The per-value formulas live here as small scalar functions, shared with the
+per-article ``ResultAggregator._calculate_*`` methods, so both paths produce
+bit-identical scores. Most columns hold only a few distinct values (years,
+article types, source counts), so transforms are evaluated once per distinct
+value and mapped back. The columns are plain lists rather than NumPy arrays:
+NumPy is optional here, and its vectorized ``power``/``log10`` may differ from
+``math`` in the last bit, which could reorder tied rankings.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from pubmed_search.application.search.result_aggregator import RankingConfig
+    from pubmed_search.domain.entities.article import UnifiedArticle
+
+UNKNOWN_YEAR_SCORE = 0.3  # Recency of an article without a publication year
+UNKNOWN_IMPACT_SCORE = 0.3  # Impact of an article without citation metrics
+COMPLETENESS_FIELDS = 7  # abstract, DOI, journal, volume, issue, pages, year
+
+DIMENSIONS = ("relevance", "quality", "recency", "impact", "source_trust", "entity_match")
+
+
+# =============================================================================
+# Scalar Formulas
+# =============================================================================
+
+
+def article_type_name(article: UnifiedArticle) -> str:
+    """The article type value used for quality weights (``"unknown"`` if unset)."""
+    return article.article_type.value if hasattr(article, "article_type") and article.article_type else "unknown"
+
+
+def filled_field_count(article: UnifiedArticle) -> int:
+    """Number of bibliographic fields present, out of ``COMPLETENESS_FIELDS``."""
+    fields = (
+        article.abstract,
+        article.doi,
+        article.journal,
+        article.volume,
+        article.issue,
+        article.pages,
+        article.year,
+    )
+    return len(list(filter(None, fields)))
+
+
+def quality_score(type_weight: float, filled_fields: int, open_access: bool) -> float:
+    """Base 0.5, plus the article-type weight, metadata completeness and an open-access boost."""
+    score = 0.5 + type_weight
+    score += filled_fields / COMPLETENESS_FIELDS * 0.1
+    if open_access:
+        score += 0.05
+    return min(score, 1.0)
+
+
+def recency_score(year: int | None, current_year: int, half_life: float) -> float:
+    """Exponential decay by publication age with the given half-life (years)."""
+    if not year:
+        return UNKNOWN_YEAR_SCORE
+    age = max(current_year - year, 0)  # Future publication (preprint?)
+    return float(0.5 ** (age / half_life))
+
+
+def impact_score(nih_percentile: Any, rcr: Any, citation_count: Any) -> float:
+    """Impact from NIH percentile, else Relative Citation Ratio, else log-scaled citations."""
+    if nih_percentile is not None:
+        return float(nih_percentile) / 100
+    if rcr is not None:
+        rcr_val = float(rcr)
+        return min(rcr_val / (rcr_val + 2.0), 1.0)  # 0 → 0, 2 → 0.5, 4 → 0.67, 10 → 0.83
+    if citation_count is not None:
+        if citation_count <= 0:
+            return 0.1
+        # Log transformation: 1 → 0.1, 10 → 0.4, 100 → 0.7, 1000 → 1.0
+        return min(math.log10(float(citation_count) + 1) / 3, 1.0)
+    return UNKNOWN_IMPACT_SCORE
+
+
+def citation_inputs(article: UnifiedArticle) -> tuple[Any, Any, Any]:
+    """``(nih_percentile, relative_citation_ratio, citation_count)`` of an article, ``None`` when absent."""
+    metrics = getattr(article, "citation_metrics", None)
+    if not metrics:
+        return None, None, None
+    return (
+        getattr(metrics, "nih_percentile", None),
+        getattr(metrics, "relative_citation_ratio", None),
+        getattr(metrics, "citation_count", None),
+    )
+
+
+def source_trust_score(base_trust: float, source_count: int) -> float:
+    """Configured source trust, boosted 0.1 per extra source (at most 0.2)."""
+    if source_count > 1:
+        boost = min(0.1 * (source_count - 1), 0.2)
+        return min(base_trust + boost, 1.0)
+    return base_trust
+
+
+def weighted_sum(columns: Mapping[str, Sequence[float]], weights: Mapping[str, float]) -> list[float]:
+    """Combine dimension columns with normalized weights, in ``DIMENSIONS`` order."""
+    w_relevance, w_quality, w_recency, w_impact, w_trust, w_entity = (weights[name] for name in DIMENSIONS)
+    return [
+        relevance * w_relevance
+        + quality * w_quality
+        + recency * w_recency
+        + impact * w_impact
+        + trust * w_trust
+        + entity * w_entity
+        for relevance, quality, recency, impact, trust, entity in zip(*(columns[name] for name in DIMENSIONS))
+    ]
+
+
+# =============================================================================
+# Struct of Arrays
+# =============================================================================
+
+
+class RankingColumns:
+    """Per-article ranking inputs of a candidate set, one list per attribute."""
+
+    __slots__ = (
+        "article_types",
+        "citation_counts",
+        "filled_fields",
+        "nih_percentiles",
+        "open_access",
+        "primary_sources",
+        "rcrs",
+        "source_counts",
+        "years",
+    )
+
+    def __init__(self, articles: Sequence[UnifiedArticle]) -> None:
+        article_types = [getattr(article, "article_type", None) for article in articles]
+        type_names = {value: value.value if value else "unknown" for value in set(article_types)}
+        citations = [citation_inputs(article) for article in articles]
+
+        self.years: list[int | None] = [article.year for article in articles]
+        self.article_types: list[str] = [type_names[value] for value in article_types]
+        self.filled_fields: list[int] = [filled_field_count(article) for article in articles]
+        self.open_access: list[bool] = [bool(getattr(article, "has_open_access", False)) for article in articles]
+        self.nih_percentiles: list[Any] = [nih_percentile for nih_percentile, _rcr, _count in citations]
+        self.rcrs: list[Any] = [rcr for _nih_percentile, rcr, _count in citations]
+        self.citation_counts: list[Any] = [count for _nih_percentile, _rcr, count in citations]
+        self.primary_sources: list[str] = [article.primary_source for article in articles]
+        self.source_counts: list[int] = [len(getattr(article, "sources", []) or []) for article in articles]
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    def quality(self, config: RankingConfig) -> list[float]:
+        """``quality_score`` of every article."""
+        type_weights = {name: config.get_article_type_weight(name) for name in set(self.article_types)}
+        keys = list(zip(self.article_types, self.filled_fields, self.open_access))
+        scores = {key: quality_score(type_weights[key[0]], key[1], key[2]) for key in set(keys)}
+        return [scores[key] for key in keys]
+
+    def recency(self, config: RankingConfig) -> list[float]:
+        """``recency_score`` of every article, relative to the current year."""
+        current_year = datetime.now(tz=timezone.utc).year
+        half_life = config.recency_half_life_years
+        scores = {year: recency_score(year, current_year, half_life) for year in set(self.years)}
+        return [scores[year] for year in self.years]
+
+    def impact(self) -> list[float]:
+        """``impact_score`` of every article."""
+        return list(map(impact_score, self.nih_percentiles, self.rcrs, self.citation_counts))
+
+    def source_trust(self, config: RankingConfig) -> list[float]:
+        """``source_trust_score`` of every article under the configured trust levels."""
+        trust_levels = config.source_trust_levels
+        keys = list(zip(self.primary_sources, self.source_counts))
+        scores = {key: source_trust_score(trust_levels.get(key[0], 0.5), key[1]) for key in set(keys)}
+        return [scores[key] for key in keys]
+
+
+__all__ = [
+    "DIMENSIONS",
+    "RankingColumns",
+    "impact_score",
+    "quality_score",
+    "recency_score",
+    "source_trust_score",
+    "weighted_sum",
+]
@@ -31,13 +31,24 @@ Example:
 
 from __future__ import annotations
 
-import math
+import heapq
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, Any, cast
 
+from pubmed_search.application.search.ranking_columns import (
+    RankingColumns,
+    article_type_name,
+    citation_inputs,
+    filled_field_count,
+    impact_score,
+    quality_score,
+    recency_score,
+    source_trust_score,
+    weighted_sum,
+)
 from pubmed_search.shared.article_identity import (
     canonical_article_key,
     normalize_article_doi,
@@ -46,8 +57,15 @@ from pubmed_search.shared.article_identity import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pubmed_search.application.search.corpus_statistics import CorpusStatistics
+    from pubmed_search.application.search.term_index import ArticleTermIndex
     from pubmed_search.domain.entities.article import UnifiedArticle
 
+# Words that count as terms for the term-overlap relevance estimates
+_QUERY_TERM = re.compile(r"\b\w{3,}\b")
+
 # Lazy imports for ranking algorithms (avoid circular)
 _ranking_algorithms: Any | None = None
 
@@ -76,6 +94,17 @@ def _get_unified_article() -> type[UnifiedArticle]:
     return cast("type[UnifiedArticle]", _UnifiedArticle)
 
 
+def _sort_by_ranking_score(articles: list[UnifiedArticle], k: int | None) -> list[UnifiedArticle]:
+    """Stable descending sort by ``ranking_score``; with ``k``, a heap selects just the top k."""
+
+    def score(article: UnifiedArticle) -> float:
+        return getattr(article, "ranking_score", 0) or 0
+
+    if k is None:
+        return sorted(articles, key=score, reverse=True)
+    return heapq.nlargest(k, articles, key=score)
+
+
 def _article_key(article: UnifiedArticle) -> str:
     """Get a stable ranking key for an article."""
     return canonical_article_key(article)
@@ -140,11 +169,15 @@ class DeduplicationStrategy(Enum):
     STRICT: Only DOI/PMID exact matches are considered duplicates
     MODERATE: DOI/PMID + normalized title match
     AGGRESSIVE: Include fuzzy title matching (shorter title threshold)
+    NEAR_DUPLICATE: MODERATE + MinHash/LSH near-duplicate titles confirmed by
+        year and authors (catches preprint/published pairs and cross-source
+        title variants)
     """
 
     STRICT = "strict"
     MODERATE = "moderate"
     AGGRESSIVE = "aggressive"
+    NEAR_DUPLICATE = "near_duplicate"
 
 
 # =============================================================================
@@ -303,6 +336,7 @@ class AggregationStats:
     dedup_by_pmid: int = 0
     dedup_by_identifier: int = 0
     dedup_by_title: int = 0
+    dedup_by_near_title: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -316,6 +350,7 @@ class AggregationStats:
             "dedup_by_pmid": self.dedup_by_pmid,
             "dedup_by_identifier": self.dedup_by_identifier,
             "dedup_by_title": self.dedup_by_title,
+            "dedup_by_near_title": self.dedup_by_near_title,
         }
 
 
@@ -340,6 +375,7 @@ class UnionFind:
         self.parent = list(range(n))
         self.rank = [0] * n
         self.size = [1] * n
+        self.groups = n  # Number of disjoint sets
 
     def find(self, x: int) -> int:
         """Find root with path compression."""
@@ -364,8 +400,17 @@ class UnionFind:
         if self.rank[px] == self.rank[py]:
             self.rank[px] += 1
 
+        self.groups -= 1
         return True
 
+    def add(self) -> int:
+        """Append a new singleton element and return its index."""
+        self.parent.append(len(self.parent))
+        self.rank.append(0)
+        self.size.append(1)
+        self.groups += 1
+        return len(self.parent) - 1
+
     def get_groups(self) -> dict[int, list[int]]:
         """Get all groups as {root: [members]}."""
         groups: dict[int, list[int]] = {}
@@ -407,14 +452,28 @@ class ResultAggregator:
         ranked = aggregator.rank(articles, config)
     """
 
-    def __init__(self, config: RankingConfig | None = None):
+    def __init__(
+        self,
+        config: RankingConfig | None = None,
+        *,
+        corpus_statistics: CorpusStatistics | None = None,
+        idf_prior_weight: float | None = None,
+    ):
         """
         Initialize ResultAggregator.
 
         Args:
             config: Default ranking configuration (can be overridden per call)
+            corpus_statistics: Global document frequencies blended into BM25
+                IDF (default: the ``PUBMED_IDF_STORE`` store, if enabled)
+            idf_prior_weight: Blend weight of that prior
+                (default: ``PUBMED_IDF_PRIOR_WEIGHT``)
         """
         self._config = config or RankingConfig.default()
+        self._corpus_statistics = corpus_statistics
+        self._idf_prior_weight = idf_prior_weight
+        # Term index of the last ranked result set, for follow-up analyses
+        self.last_term_index: ArticleTermIndex | None = None
 
     def aggregate(
         self,
@@ -463,6 +522,8 @@ class ResultAggregator:
         articles: list[UnifiedArticle],
         config: RankingConfig | None = None,
         query: str | None = None,
+        *,
+        top_k: int | None = None,
     ) -> list[UnifiedArticle]:
         """
         Rank articles using multi-dimensional scoring.
@@ -473,10 +534,18 @@ class ResultAggregator:
         3. RRF fusion across dimensions (replaces weighted sum if enabled)
         4. MMR diversification (optional post-processing)
 
+        With ``top_k`` only the best ``top_k`` articles are returned, in the
+        same order the full ranking would give them. Selection uses a heap
+        instead of a full sort. For weighted-sum ranking, the cheap
+        dimensions bound each article's best achievable score, and only
+        articles that can still reach the top ``top_k`` get the expensive
+        relevance and entity-match scoring.
+
         Args:
             articles: Articles to rank
             config: Ranking configuration (uses default if not provided)
             query: Original query (used for relevance scoring)
+            top_k: Only return the best ``top_k`` articles (None = all)
 
         Returns:
             Sorted list of articles (highest score first)
@@ -485,119 +554,125 @@ class ResultAggregator:
         weights = config.normalized_weights()
         ra = _get_ranking_algorithms()
 
+        self.last_term_index = None
         if not articles:
             return []
 
+        # Tokenize the result set once; BM25, relevance and MMR all read from it
+        term_index = ra.ArticleTermIndex(articles) if ra and query else None
+        self.last_term_index = term_index
+        keys = list(term_index.keys) if term_index is not None else [_article_key(a) for a in articles]
+
         # === Step 1: BM25 corpus statistics (if enabled) ===
-        bm25_corpus = None
         bm25_scores: dict[str, float] = {}
         if config.use_bm25 and query and ra:
-            bm25_corpus = ra.BM25Corpus.from_articles(articles)
+            prior, prior_weight = self._resolve_idf_prior()
+            bm25_corpus = ra.BM25Corpus.from_index(term_index, prior=prior, prior_weight=prior_weight)
             # Pre-compute raw BM25 scores for all articles
-            for article in articles:
-                key = _article_key(article)
-                bm25_scores[key] = ra.bm25_score(article, query, bm25_corpus)
+            bm25_scores = dict(zip(keys, ra.bm25_scores(query, bm25_corpus)))
             max_bm25 = max(bm25_scores.values()) if bm25_scores else 1.0
         else:
             max_bm25 = 1.0
 
-        # === Step 2: Calculate dimension scores for each article ===
-        article_dim_scores: dict[str, dict[str, float]] = {}
         use_bm25_relevance = bool(config.use_bm25 and query and ra and max_bm25 > 0)
-        for article in articles:
-            key = _article_key(article)
-            bm25_relevance = None
-            if use_bm25_relevance:
-                raw_bm25 = bm25_scores.get(key, 0.0)
-                bm25_relevance = min(raw_bm25 / max_bm25, 1.0)
-
-            scores = self._calculate_dimension_scores(article, config, query, relevance_score=bm25_relevance)
 
-            article_dim_scores[key] = scores
+        def relevance_at(position: int) -> float | None:
+            if use_bm25_relevance:
+                return min(bm25_scores.get(keys[position], 0.0) / max_bm25, 1.0)
+            if term_index is not None and query:
+                return self._calculate_indexed_relevance(term_index, position, query)
+            return None
+
+        # Top-k selection: MMR re-orders the whole ranked list, so it takes the
+        # cut itself (its greedy picks form a prefix) unless a score filter
+        # follows, which would no longer select a prefix.
+        use_mmr = bool(config.use_mmr and ra and query)
+        select_k = top_k if top_k is not None and top_k < len(articles) and not use_mmr else None
+        if select_k is not None and config.max_results:
+            select_k = min(select_k, config.max_results)
+        use_rrf = bool(config.use_rrf and ra and len(articles) > 1)
+
+        if (
+            select_k is not None
+            and not use_rrf
+            and len(set(keys)) == len(keys)
+            and all(weight >= 0 for weight in weights.values())
+        ):
+            top_articles = self._rank_weighted_top_k(
+                articles,
+                config,
+                query,
+                weights,
+                relevance_at=relevance_at,
+                k=select_k,
+                exact_relevance=use_bm25_relevance,
+            )
+            if config.min_score > 0:
+                top_articles = [a for a in top_articles if (getattr(a, "ranking_score", 0) or 0) >= config.min_score]
+            return top_articles
 
+        # === Step 2: Calculate dimension scores, one column per dimension ===
+        dimension_columns = self._calculate_dimension_columns(
+            articles, config, query, relevance=[relevance_at(position) for position in range(len(articles))]
+        )
+        for article, relevance, quality in zip(articles, dimension_columns["relevance"], dimension_columns["quality"]):
             # Store individual scores on article
-            article.relevance_score = scores.get("relevance", 0.5)
-            article.quality_score = scores.get("quality", 0.5)
+            article.relevance_score = relevance
+            article.quality_score = quality
+
+        # Articles sharing a key are scored as one: the first occurrence fixes
+        # the key's rank order, the last occurrence supplies its scores.
+        key_positions = {key: position for position, key in enumerate(keys)}
 
         # === Step 3: Ranking — RRF or weighted sum ===
         sorted_articles: list[UnifiedArticle]
-        if config.use_rrf and ra and len(articles) > 1:
+        dimension_rankings: dict[str, list[str]] = {}
+        if use_rrf:
             # Build per-dimension rankings
-            dimension_rankings: dict[str, list[str]] = {}
-            for dim_name in ("relevance", "quality", "recency", "impact", "source_trust", "entity_match"):
-                dimension_values = [article_dim_scores[key].get(dim_name, 0.0) for key in article_dim_scores]
-                if len({round(value, 12) for value in dimension_values}) <= 1:
+            for dim_name, column in dimension_columns.items():
+                key_scores = {key: column[position] for key, position in key_positions.items()}
+                if len({round(value, 12) for value in key_scores.values()}) <= 1:
                     continue
 
                 # Sort article keys by this dimension's score (descending)
-                sorted_keys = sorted(
-                    article_dim_scores.keys(),
-                    key=lambda k: article_dim_scores[k].get(dim_name, 0.0),
-                    reverse=True,
-                )
-                dimension_rankings[dim_name] = sorted_keys
-
-            if dimension_rankings:
-                rrf_result = ra.reciprocal_rank_fusion(
-                    articles,
-                    dimension_rankings,
-                    dimension_weights=weights,
-                )
-
-                # Store RRF score as ranking_score
-                max_rrf = max(rrf_result.rrf_scores.values()) if rrf_result.rrf_scores else 1.0
-                for article in rrf_result.ranked_articles:
-                    key = _article_key(article)
-                    raw_rrf = rrf_result.rrf_scores.get(key, 0.0)
-                    article.ranking_score = raw_rrf / max_rrf if max_rrf > 0 else 0.0
-
-                sorted_articles = cast("list[UnifiedArticle]", rrf_result.ranked_articles)
-            else:
-                for article in articles:
-                    key = _article_key(article)
-                    scores = article_dim_scores.get(key, {})
-                    final_score = (
-                        scores.get("relevance", 0.5) * weights["relevance"]
-                        + scores.get("quality", 0.5) * weights["quality"]
-                        + scores.get("recency", 0.5) * weights["recency"]
-                        + scores.get("impact", 0.5) * weights["impact"]
-                        + scores.get("source_trust", 0.5) * weights["source_trust"]
-                        + scores.get("entity_match", 0.5) * weights["entity_match"]
-                    )
-                    article.ranking_score = final_score
-
-                sorted_articles = sorted(
-                    articles,
-                    key=lambda a: getattr(a, "ranking_score", 0) or 0,
-                    reverse=True,
-                )
-        else:
-            # Fallback: weighted sum (original method)
-            for article in articles:
-                key = _article_key(article)
-                scores = article_dim_scores.get(key, {})
-                final_score = (
-                    scores.get("relevance", 0.5) * weights["relevance"]
-                    + scores.get("quality", 0.5) * weights["quality"]
-                    + scores.get("recency", 0.5) * weights["recency"]
-                    + scores.get("impact", 0.5) * weights["impact"]
-                    + scores.get("source_trust", 0.5) * weights["source_trust"]
-                    + scores.get("entity_match", 0.5) * weights["entity_match"]
-                )
-                article.ranking_score = final_score
-
-            sorted_articles = sorted(
+                dimension_rankings[dim_name] = sorted(key_scores, key=key_scores.__getitem__, reverse=True)
+
+        if dimension_rankings:
+            rrf_result = ra.reciprocal_rank_fusion(
                 articles,
-                key=lambda a: getattr(a, "ranking_score", 0) or 0,
-                reverse=True,
+                dimension_rankings,
+                dimension_weights=weights,
+                term_index=term_index,
+                top_k=select_k,
             )
 
+            # Store RRF score as ranking_score
+            max_rrf = max(rrf_result.rrf_scores.values()) if rrf_result.rrf_scores else 1.0
+            for article in rrf_result.ranked_articles:
+                key = term_index.key_for(article) if term_index is not None else _article_key(article)
+                raw_rrf = rrf_result.rrf_scores.get(key, 0.0)
+                article.ranking_score = raw_rrf / max_rrf if max_rrf > 0 else 0.0
+
+            sorted_articles = cast("list[UnifiedArticle]", rrf_result.ranked_articles)
+        else:
+            # Weighted sum (also the RRF fallback when no dimension discriminates)
+            final_scores = weighted_sum(dimension_columns, weights)
+            for key, article in zip(keys, articles):
+                article.ranking_score = final_scores[key_positions[key]]
+
+            sorted_articles = _sort_by_ranking_score(articles, select_k)
+
         # === Step 4: MMR Diversification (optional) ===
-        if config.use_mmr and ra and query and len(sorted_articles) > 1:
+        if use_mmr and len(sorted_articles) > 1:
+            mmr_top_k = top_k if top_k is not None and config.min_score <= 0 else None
+            if mmr_top_k is not None and config.max_results:
+                mmr_top_k = min(mmr_top_k, config.max_results)
             mmr_result = ra.mmr_diversify(
                 sorted_articles,
                 query,
                 lambda_param=config.mmr_lambda,
+                top_k=mmr_top_k,
+                term_index=term_index,
             )
             sorted_articles = cast("list[UnifiedArticle]", mmr_result.articles)
 
@@ -608,9 +683,83 @@ class ResultAggregator:
         # Limit results
         if config.max_results:
             sorted_articles = sorted_articles[: config.max_results]
+        if top_k is not None:
+            sorted_articles = sorted_articles[:top_k]
 
         return sorted_articles
 
+    def _resolve_idf_prior(self) -> tuple[CorpusStatistics | None, float]:
+        """Global IDF prior for BM25: the injected store, else the settings-configured one."""
+        from pubmed_search.application.search.corpus_statistics import get_corpus_statistics, get_idf_prior_weight
+
+        prior = self._corpus_statistics if self._corpus_statistics is not None else get_corpus_statistics()
+        if prior is None:
+            return None, 0.0
+        weight = self._idf_prior_weight if self._idf_prior_weight is not None else get_idf_prior_weight()
+        return prior, weight
+
+    def _rank_weighted_top_k(
+        self,
+        articles: list[UnifiedArticle],
+        config: RankingConfig,
+        query: str | None,
+        weights: dict[str, float],
+        *,
+        relevance_at: Callable[[int], float | None],
+        k: int,
+        exact_relevance: bool = False,
+    ) -> list[UnifiedArticle]:
+        """
+        Weighted-sum ranking of only the best ``k`` articles.
+
+        Quality, recency, impact and source trust are cheap, so they are
+        computed for every article as columns, as is relevance when it comes
+        from the precomputed BM25 scores (``exact_relevance``). Otherwise
+        relevance, and entity match when entities are set, are replaced by
+        their maximum (1.0) to get an upper bound with the same arithmetic as
+        the final score. Candidates are then fully scored in descending bound
+        order until no remaining bound can beat the k-th best exact score.
+        Ties keep input order, as the stable full sort does.
+        """
+        n = len(articles)
+        columns = RankingColumns(articles)
+        cheap = {
+            "quality": columns.quality(config),
+            "recency": columns.recency(config),
+            "impact": columns.impact(),
+            "source_trust": columns.source_trust(config),
+        }
+        relevance_bounds = [relevance_at(position) if exact_relevance else None for position in range(n)]
+        bounds = weighted_sum(
+            {
+                "relevance": [1.0 if bound is None else bound for bound in relevance_bounds],
+                **cheap,
+                "entity_match": [1.0 if config.matched_entities else 0.5] * n,
+            },
+            weights,
+        )
+
+        # Min-heap of (score, -position): the root is the worst of the current top k
+        heap: list[tuple[float, int]] = []
+        for position in sorted(range(len(articles)), key=bounds.__getitem__, reverse=True):
+            if len(heap) == k and bounds[position] < heap[0][0]:
+                break
+            article = articles[position]
+            relevance = relevance_at(position)
+            scores = {name: [column[position]] for name, column in cheap.items()}
+            scores["relevance"] = [relevance if relevance is not None else self._calculate_relevance(article, query)]
+            scores["entity_match"] = [self._calculate_entity_match(article, config)]
+            article.relevance_score = scores["relevance"][0]
+            article.quality_score = scores["quality"][0]
+            article.ranking_score = weighted_sum(scores, weights)[0]
+            entry = (article.ranking_score or 0, -position)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        return [articles[-neg_position] for _score, neg_position in sorted(heap, reverse=True)]
+
     def aggregate_and_rank(
         self,
         article_lists: list[list[UnifiedArticle]],
@@ -632,6 +781,49 @@ class ResultAggregator:
         ranked = self.rank(articles, config, query)
         return ranked, stats
 
+    def aggregate_across(
+        self,
+        article_lists: list[list[UnifiedArticle]],
+        dedup_strategy: DeduplicationStrategy | None = None,
+    ) -> tuple[list[UnifiedArticle], list[list[UnifiedArticle]], AggregationStats]:
+        """
+        Deduplicate separate result lists against each other, keeping the lists.
+
+        Used for batches of query variants: each list is mapped onto the
+        merged articles (in its own order, without repeats), so every article
+        shared by several lists is one object that can be enriched once,
+        while the lists can still be ranked separately.
+
+        Args:
+            article_lists: Result lists (e.g. one aggregated list per query variant)
+            dedup_strategy: Override default deduplication strategy
+
+        Returns:
+            Tuple of (unique articles, each input list as unique articles, statistics)
+        """
+        strategy = dedup_strategy or self._config.dedup_strategy
+        stats = AggregationStats()
+
+        all_articles: list[UnifiedArticle] = []
+        for articles in article_lists:
+            all_articles.extend(articles)
+            for article in articles:
+                source = article.primary_source
+                stats.by_source[source] = stats.by_source.get(source, 0) + 1
+        stats.total_input = len(all_articles)
+
+        unique, representatives = self._merge_duplicate_groups(all_articles, strategy, stats)
+        stats.unique_articles = len(unique)
+        stats.duplicates_removed = stats.total_input - stats.unique_articles
+
+        mapped_lists: list[list[UnifiedArticle]] = []
+        start = 0
+        for articles in article_lists:
+            end = start + len(articles)
+            mapped_lists.append(list({id(article): article for article in representatives[start:end]}.values()))
+            start = end
+        return unique, mapped_lists, stats
+
     # =========================================================================
     # Deduplication (Union-Find based)
     # =========================================================================
@@ -642,89 +834,67 @@ class ResultAggregator:
         strategy: DeduplicationStrategy,
         stats: AggregationStats,
     ) -> list[UnifiedArticle]:
+        """Deduplicate articles using Union-Find (see ``_merge_duplicate_groups``)."""
+        unique, _representatives = self._merge_duplicate_groups(articles, strategy, stats)
+        return unique
+
+    def _merge_duplicate_groups(
+        self,
+        articles: list[UnifiedArticle],
+        strategy: DeduplicationStrategy,
+        stats: AggregationStats,
+    ) -> tuple[list[UnifiedArticle], list[UnifiedArticle]]:
         """
         Deduplicate articles using Union-Find for O(n) complexity.
 
+        Returns the unique (merged) articles and, for each input position,
+        the unique article it was merged into.
+
         Algorithm:
         1. Build indexes (DOI, PMID, Title) - O(n)
         2. For each index, union articles with same key - O(n × α(n))
-        3. Get groups and merge - O(n)
+        3. NEAR_DUPLICATE only: union confirmed MinHash/LSH title pairs
+        4. Get groups and merge - O(n)
 
         Total: O(n) instead of O(n²)
         """
         n = len(articles)
         if n == 0:
-            return []
+            return [], []
 
         uf = UnionFind(n)
 
         # Build indexes and union
-        doi_to_idx: dict[str, int] = {}
-        pmid_to_idx: dict[str, int] = {}
-        identifier_to_idx: dict[tuple[str, str], int] = {}
-        title_to_idx: dict[str, int] = {}
-
-        min_title_len = self._config.title_min_length
-        use_title = strategy in (
-            DeduplicationStrategy.MODERATE,
-            DeduplicationStrategy.AGGRESSIVE,
-        )
-
-        # Adjust title threshold for aggressive mode
-        if strategy == DeduplicationStrategy.AGGRESSIVE:
-            min_title_len = 15
-
+        dedup_index = self._new_dedup_index(strategy)
         for i, article in enumerate(articles):
-            # DOI matching
-            if article.doi:
-                normalized_doi = self._normalize_doi(article.doi)
-                if normalized_doi in doi_to_idx:
-                    if uf.union(i, doi_to_idx[normalized_doi]):
-                        stats.dedup_by_doi += 1
-                else:
-                    doi_to_idx[normalized_doi] = i
+            self._index_for_dedup(dedup_index, uf, i, article, stats)
+        return self._merge_union_find_groups(articles, uf, strategy, dedup_index.min_title_len, stats)
 
-            # PMID matching
-            if article.pmid:
-                if article.pmid in pmid_to_idx:
-                    if uf.union(i, pmid_to_idx[article.pmid]):
-                        stats.dedup_by_pmid += 1
-                else:
-                    pmid_to_idx[article.pmid] = i
-
-            # Provider identifiers are strong identities too.  Indexing them
-            # prevents records carrying OpenAlex/S2/CORE/arXiv/PMC IDs from
-            # being excluded from both identifier and title deduplication.
-            for attr, kind in (
-                ("pmc", "pmc"),
-                ("openalex_id", "openalex"),
-                ("s2_id", "s2"),
-                ("core_id", "core"),
-                ("arxiv_id", "arxiv"),
+    def _merge_union_find_groups(
+        self,
+        articles: list[UnifiedArticle],
+        uf: UnionFind,
+        strategy: DeduplicationStrategy,
+        min_title_len: int,
+        stats: AggregationStats,
+    ) -> tuple[list[UnifiedArticle], list[UnifiedArticle]]:
+        """Steps 3 and 4 of ``_merge_duplicate_groups`` on an already indexed Union-Find."""
+        # Near-duplicate titles (MinHash/LSH candidates, confirmed by year/authors)
+        if strategy == DeduplicationStrategy.NEAR_DUPLICATE:
+            from pubmed_search.application.search.near_duplicates import find_near_duplicates
+
+            for i, j in find_near_duplicates(
+                articles,
+                min_title_length=min_title_len,
+                already_merged=lambda a, b: uf.find(a) == uf.find(b),
             ):
-                identifier = normalize_article_identifier(kind, getattr(article, attr, None))
-                if not identifier:
-                    continue
-                key = (kind, identifier)
-                if key in identifier_to_idx:
-                    if uf.union(i, identifier_to_idx[key]):
-                        stats.dedup_by_identifier += 1
-                else:
-                    identifier_to_idx[key] = i
-
-            # Title matching (if enabled)
-            if use_title and article.title and not self._has_strong_identifier(article):
-                normalized_title = self._normalize_title(article.title)
-                if len(normalized_title) >= min_title_len:
-                    if normalized_title in title_to_idx:
-                        if uf.union(i, title_to_idx[normalized_title]):
-                            stats.dedup_by_title += 1
-                    else:
-                        title_to_idx[normalized_title] = i
+                if uf.union(i, j):
+                    stats.dedup_by_near_title += 1
 
         # Get groups and merge
         groups = uf.get_groups()
         unique: list[UnifiedArticle] = []
+        representatives: list[UnifiedArticle] = list(articles)
 
         for member_indices in groups.values():
             if len(member_indices) == 1:
@@ -745,8 +915,94 @@ class ResultAggregator:
                         stats.merged_records += 1
 
                 unique.append(primary)
+                for i in member_indices:
+                    representatives[i] = primary
 
-        return unique
+        return unique, representatives
+
+    def incremental(self, dedup_strategy: DeduplicationStrategy | None = None) -> IncrementalAggregation:
+        """Start an aggregation that deduplicates source pages as they arrive."""
+        strategy = dedup_strategy or self._config.dedup_strategy
+        return IncrementalAggregation(
+            self._new_dedup_index(strategy),
+            self._index_for_dedup,
+            self._merge_union_find_groups,
+            strategy,
+        )
+
+    def _new_dedup_index(self, strategy: DeduplicationStrategy) -> _DedupIndex:
+        # Adjust title threshold for aggressive mode
+        min_title_len = 15 if strategy == DeduplicationStrategy.AGGRESSIVE else self._config.title_min_length
+        return _DedupIndex(
+            min_title_len=min_title_len,
+            use_title=strategy
+            in (
+                DeduplicationStrategy.MODERATE,
+                DeduplicationStrategy.AGGRESSIVE,
+                DeduplicationStrategy.NEAR_DUPLICATE,
+            ),
+        )
+
+    def _index_for_dedup(
+        self,
+        index: _DedupIndex,
+        uf: UnionFind,
+        i: int,
+        article: UnifiedArticle,
+        stats: AggregationStats,
+    ) -> None:
+        """Index element *i* and union it with any earlier article sharing an identity."""
+        doi_to_idx = index.doi_to_idx
+        pmid_to_idx = index.pmid_to_idx
+        identifier_to_idx = index.identifier_to_idx
+        title_to_idx = index.title_to_idx
+
+        # DOI matching
+        if article.doi:
+            normalized_doi = self._normalize_doi(article.doi)
+            if normalized_doi in doi_to_idx:
+                if uf.union(i, doi_to_idx[normalized_doi]):
+                    stats.dedup_by_doi += 1
+            else:
+                doi_to_idx[normalized_doi] = i
+
+        # PMID matching
+        if article.pmid:
+            if article.pmid in pmid_to_idx:
+                if uf.union(i, pmid_to_idx[article.pmid]):
+                    stats.dedup_by_pmid += 1
+            else:
+                pmid_to_idx[article.pmid] = i
+
+        # Provider identifiers are strong identities too.  Indexing them
+        # prevents records carrying OpenAlex/S2/CORE/arXiv/PMC IDs from
+        # being excluded from both identifier and title deduplication.
+        for attr, kind in (
+            ("pmc", "pmc"),
+            ("openalex_id", "openalex"),
+            ("s2_id", "s2"),
+            ("core_id", "core"),
+            ("arxiv_id", "arxiv"),
+        ):
+            identifier = normalize_article_identifier(kind, getattr(article, attr, None))
+            if not identifier:
+                continue
+            key = (kind, identifier)
+            if key in identifier_to_idx:
+                if uf.union(i, identifier_to_idx[key]):
+                    stats.dedup_by_identifier += 1
+            else:
+                identifier_to_idx[key] = i
+
+        # Title matching (if enabled)
+        if index.use_title and article.title and not self._has_strong_identifier(article):
+            normalized_title = self._normalize_title(article.title)
+            if len(normalized_title) >= index.min_title_len:
+                if normalized_title in title_to_idx:
+                    if uf.union(i, title_to_idx[normalized_title]):
+                        stats.dedup_by_title += 1
+                else:
+                    title_to_idx[normalized_title] = i
 
     def _has_strong_identifier(self, article: UnifiedArticle) -> bool:
         """Return True when the record already carries a high-confidence identity."""
@@ -812,22 +1068,37 @@ class ResultAggregator:
     # Scoring Functions
     # =========================================================================
 
-    def _calculate_dimension_scores(
+    def _calculate_dimension_columns(
         self,
-        article: UnifiedArticle,
+        articles: list[UnifiedArticle],
         config: RankingConfig,
         query: str | None,
         *,
-        relevance_score: float | None = None,
-    ) -> dict[str, float]:
-        """Calculate scores for each ranking dimension."""
+        relevance: list[float | None],
+    ) -> dict[str, list[float]]:
+        """
+        Calculate every ranking dimension for all articles, one column per dimension.
+
+        The cheap dimensions are computed from a ``RankingColumns`` view built
+        once. Relevance comes from *relevance* (``None`` falls back to
+        ``_calculate_relevance``); entity match needs the article text and is
+        only computed per article when entities are configured.
+        """
+        columns = RankingColumns(articles)
+        if config.matched_entities:
+            entity_match = [self._calculate_entity_match(article, config) for article in articles]
+        else:
+            entity_match = [0.5] * len(articles)
         return {
-            "relevance": relevance_score if relevance_score is not None else self._calculate_relevance(article, query),
-            "quality": self._calculate_quality(article, config),
-            "recency": self._calculate_recency(article, config),
-            "impact": self._calculate_impact(article),
-            "source_trust": self._calculate_source_trust(article, config),
-            "entity_match": self._calculate_entity_match(article, config),
+            "relevance": [
+                score if score is not None else self._calculate_relevance(article, query)
+                for article, score in zip(articles, relevance)
+            ],
+            "quality": columns.quality(config),
+            "recency": columns.recency(config),
+            "impact": columns.impact(),
+            "source_trust": columns.source_trust(config),
+            "entity_match": entity_match,
         }
 
     def _calculate_relevance(
@@ -871,6 +1142,26 @@ class ResultAggregator:
 
         return min(relevance, 1.0)
 
+    @staticmethod
+    def _calculate_indexed_relevance(term_index: ArticleTermIndex, position: int, query: str) -> float:
+        """``_calculate_relevance`` for an indexed article, without re-tokenizing it."""
+        query_terms = set(re.findall(r"\b\w{3,}\b", query.lower()))
+        if not query_terms:
+            return 0.5
+
+        term_ids = [term_id for term_id in map(term_index.term_id, query_terms) if term_id is not None]
+        title_tf = term_index.title_tf[position]
+        abstract_tf = term_index.abstract_tf[position]
+        keyword_tf = term_index.keyword_tf[position]
+        title_overlap = sum(term_id in title_tf for term_id in term_ids) / len(query_terms)
+        abstract_overlap = sum(term_id in abstract_tf for term_id in term_ids) / len(query_terms)
+        keywords_overlap = sum(term_id in keyword_tf for term_id in term_ids) / len(query_terms)
+
+        # Weighted combination (title most important)
+        relevance = title_overlap * 0.5 + abstract_overlap * 0.3 + keywords_overlap * 0.2
+
+        return min(relevance, 1.0)
+
     def _calculate_quality(
         self,
         article: UnifiedArticle,
@@ -885,38 +1176,11 @@ class ResultAggregator:
         - Metadata completeness
         - Open access (small boost)
         """
-        score = 0.5  # Base score
-
-        # Article type boost
-        article_type = (
-            article.article_type.value if hasattr(article, "article_type") and article.article_type else "unknown"
+        return quality_score(
+            config.get_article_type_weight(article_type_name(article)),
+            filled_field_count(article),
+            bool(getattr(article, "has_open_access", False)),
         )
-        score += config.get_article_type_weight(article_type)
-
-        # Metadata completeness boost
-        completeness = (
-            sum(
-                1
-                for x in [
-                    article.abstract,
-                    article.doi,
-                    article.journal,
-                    article.volume,
-                    article.issue,
-                    article.pages,
-                    article.year,
-                ]
-                if x
-            )
-            / 7
-        )
-        score += completeness * 0.1
-
-        # Open access boost (small)
-        if getattr(article, "has_open_access", False):
-            score += 0.05
-
-        return min(score, 1.0)
 
     def _calculate_recency(
         self,
@@ -928,17 +1192,8 @@ class ResultAggregator:
 
         Uses exponential decay with configurable half-life.
         """
-        if not article.year:
-            return 0.3  # Unknown year gets low score
-
         current_year = datetime.now(tz=timezone.utc).year
-        age = current_year - article.year
-
-        age = max(age, 0)  # Future publication (preprint?)
-
-        # Exponential decay
-        half_life = config.recency_half_life_years
-        return float(0.5 ** (age / half_life))
+        return recency_score(article.year, current_year, config.recency_half_life_years)
 
     def _calculate_impact(self, article: UnifiedArticle) -> float:
         """
@@ -949,33 +1204,7 @@ class ResultAggregator:
         - Relative Citation Ratio
         - Raw citation count
         """
-        metrics = getattr(article, "citation_metrics", None)
-        if not metrics:
-            return 0.3  # Unknown impact gets low-neutral score
-
-        # Use NIH percentile if available (0-100 → 0-1)
-        nih_percentile = getattr(metrics, "nih_percentile", None)
-        if nih_percentile is not None:
-            return float(nih_percentile) / 100
-
-        # Use RCR if available (normalize: 2.0 = average, 4.0 = excellent)
-        rcr = getattr(metrics, "relative_citation_ratio", None)
-        if rcr is not None:
-            # Sigmoid-like transformation
-            rcr_val = float(rcr)
-            score = rcr_val / (rcr_val + 2.0)  # 0 → 0, 2 → 0.5, 4 → 0.67, 10 → 0.83
-            return min(score, 1.0)
-
-        # Use raw citation count (log scale)
-        citation_count = getattr(metrics, "citation_count", None)
-        if citation_count is not None:
-            if citation_count <= 0:
-                return 0.1
-            # Log transformation: 1 → 0.1, 10 → 0.4, 100 → 0.7, 1000 → 1.0
-            score = math.log10(float(citation_count) + 1) / 3
-            return min(score, 1.0)
-
-        return 0.3
+        return impact_score(*citation_inputs(article))
 
     def _calculate_source_trust(
         self,
@@ -989,15 +1218,8 @@ class ResultAggregator:
         Multi-source articles get boosted trust.
         """
         base_trust = config.source_trust_levels.get(article.primary_source, 0.5)
-
         # Boost for multi-source verification
-        sources = getattr(article, "sources", []) or []
-        num_sources = len(sources)
-        if num_sources > 1:
-            boost = min(0.1 * (num_sources - 1), 0.2)  # Max 0.2 boost
-            base_trust = min(base_trust + boost, 1.0)
-
-        return base_trust
+        return source_trust_score(base_trust, len(getattr(article, "sources", []) or []))
 
     def _calculate_entity_match(
         self,
@@ -1069,6 +1291,150 @@ class ResultAggregator:
         return normalize_article_title(title)
 
 
+@dataclass
+class _DedupIndex:
+    """Identity indexes (DOI, PMID, provider IDs, title) built while deduplicating."""
+
+    min_title_len: int
+    use_title: bool
+    doi_to_idx: dict[str, int] = field(default_factory=dict)
+    pmid_to_idx: dict[str, int] = field(default_factory=dict)
+    identifier_to_idx: dict[tuple[str, str], int] = field(default_factory=dict)
+    title_to_idx: dict[str, int] = field(default_factory=dict)
+
+
+class IncrementalAggregation:
+    """
+    Union-Find deduplication fed one source page at a time.
+
+    ``ResultAggregator.aggregate`` starts only once every source has answered.
+    This keeps the identity indexes and the Union-Find between pages, so each
+    page is deduplicated against everything seen so far as soon as it arrives
+    and a provisional top-k can be reported while slower sources are pending.
+
+    Provisional results are not merged: each duplicate group is represented
+    by its member from the earliest source position, and near-duplicate
+    (MinHash) matching is left to :meth:`finish`. ``finish`` merges the groups
+    found while streaming, visiting the records in source order, so the
+    outcome does not depend on which source answered first.
+
+    Create one with ``ResultAggregator.incremental()``.
+    """
+
+    def __init__(
+        self,
+        dedup_index: _DedupIndex,
+        index_article: Callable[[_DedupIndex, UnionFind, int, UnifiedArticle, AggregationStats], None],
+        merge_groups: Callable[
+            [list[UnifiedArticle], UnionFind, DeduplicationStrategy, int, AggregationStats],
+            tuple[list[UnifiedArticle], list[UnifiedArticle]],
+        ],
+        dedup_strategy: DeduplicationStrategy,
+    ) -> None:
+        self._uf = UnionFind(0)
+        self._index = dedup_index
+        self._index_article = index_article
+        self._merge_groups = merge_groups
+        self._dedup_strategy = dedup_strategy
+        self._articles: list[UnifiedArticle] = []
+        self._order: list[tuple[int, int]] = []  # (source position, index within page)
+        self.stats = AggregationStats()
+
+    def add(self, position: int, articles: list[UnifiedArticle]) -> int:
+        """Deduplicate the page of source *position*; return how many new unique articles it added."""
+        before = self.unique_count
+        for offset, article in enumerate(articles):
+            i = self._uf.add()
+            self._articles.append(article)
+            self._order.append((position, offset))
+            self._index_article(self._index, self._uf, i, article, self.stats)
+            source = article.primary_source
+            self.stats.by_source[source] = self.stats.by_source.get(source, 0) + 1
+        self.stats.total_input = len(self._articles)
+        self.stats.unique_articles = self.unique_count
+        self.stats.duplicates_removed = self.stats.total_input - self.stats.unique_articles
+        return self.unique_count - before
+
+    @property
+    def unique_count(self) -> int:
+        """Number of duplicate groups seen so far."""
+        return self._uf.groups
+
+    def _representatives(self) -> dict[int, int]:
+        """Map each group root to its member from the earliest source position."""
+        representative: dict[int, int] = {}
+        order = self._order
+        for i in range(len(self._articles)):
+            root = self._uf.find(i)
+            current = representative.get(root)
+            if current is None or order[i] < order[current]:
+                representative[root] = i
+        return representative
+
+    def provisional(self) -> list[UnifiedArticle]:
+        """One unmerged representative per duplicate group, in source order."""
+        return [self._articles[i] for i in sorted(self._representatives().values(), key=self._order.__getitem__)]
+
+    def snapshot(self, query: str | None = None, top_k: int = 5) -> list[UnifiedArticle]:
+        """Cheap provisional top-k of everything received so far, for progress reporting.
+
+        Groups returned by more source records come first, then titles sharing
+        more query terms, then source order. This does not run :meth:`ResultAggregator.rank`
+        and leaves article scores and aggregator state untouched.
+        """
+        query_terms = set(_QUERY_TERM.findall(query.lower())) if query else set()
+
+        def title_overlap(article: UnifiedArticle) -> int:
+            if not query_terms or not article.title:
+                return 0
+            return len(query_terms.intersection(_QUERY_TERM.findall(article.title.lower())))
+
+        best = heapq.nsmallest(
+            top_k,
+            self._representatives().items(),
+            key=lambda item: (-self._uf.size[item[0]], -title_overlap(self._articles[item[1]]), self._order[item[1]]),
+        )
+        return [self._articles[i] for _root, i in best]
+
+    def finish(self) -> tuple[list[UnifiedArticle], AggregationStats]:
+        """Merge the duplicate groups found while streaming into the final unique articles.
+
+        The identity indexes and Union-Find built by :meth:`add` are reused;
+        only near-duplicate matching (for that strategy) and the merge run
+        here. Records are visited in source order, so groups, primaries and
+        output order match ``aggregate`` over the pages in source order. The
+        per-identifier breakdown in the stats counts matches in arrival order
+        and can attribute a record that matches on several identifiers
+        differently. Merging updates the primaries in place: call this once.
+        """
+        stats = self.stats
+        in_source_order = sorted(range(len(self._articles)), key=self._order.__getitem__)
+        stats.by_source = {}
+        for i in in_source_order:
+            source = self._articles[i].primary_source
+            stats.by_source[source] = stats.by_source.get(source, 0) + 1
+        if not in_source_order:
+            return [], stats
+
+        position_of = [0] * len(in_source_order)
+        for position, i in enumerate(in_source_order):
+            position_of[i] = position
+        uf = UnionFind(len(in_source_order))
+        for position, i in enumerate(in_source_order):
+            uf.union(position, position_of[self._uf.find(i)])
+
+        unique, _representatives = self._merge_groups(
+            [self._articles[i] for i in in_source_order],
+            uf,
+            self._dedup_strategy,
+            self._index.min_title_len,
+            stats,
+        )
+        stats.unique_articles = len(unique)
+        stats.duplicates_removed = stats.total_input - stats.unique_articles
+        return unique, stats
+
+
 # =============================================================================
 # Convenience Functions
 # =============================================================================
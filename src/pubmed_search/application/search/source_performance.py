@@ -0,0 +1,193 @@
+"""Rolling per-source latency and unique-yield statistics.
+
+Design:
+    Source dispatch is planned from query analysis, which says nothing about
+    how a provider is behaving right now. This tracker keeps two bounded,
+    time-windowed sample sets per source, fed from completed source searches:
+
+    - latency: wall time of each provider call (timeouts included, so a
+      provider that hangs shows up as slow rather than disappearing);
+    - unique yield: per query kind (the auto-dispatch profile), how many of
+      the unique articles of a search only this source returned.
+
+    Dispatch reads ``snapshot`` when a request sets a latency budget (see
+    ``DispatchStrategy.apply_latency_budget``).
+
+Maintenance:
+    The clock is injectable so tests can move time without sleeping. Keep
+    this module free of provider and presentation imports; recording happens
+    in unified search execution.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+DEFAULT_WINDOW_SECONDS = 900.0
+DEFAULT_MAX_SAMPLES = 50
+
+
+@dataclass(frozen=True)
+class SourcePerformanceSnapshot:
+    """Live statistics of one source (and query kind) inside the window."""
+
+    source: str
+    latency_samples: int
+    p95_latency_ms: float | None
+    yield_samples: int
+    # Share of the searches' unique articles that only this source returned
+    unique_yield_share: float | None
+
+
+class SourcePerformanceTracker:
+    """
+    Bounded, time-windowed latency and unique-yield samples per source.
+
+    Example:
+        tracker = SourcePerformanceTracker()
+        with tracker.measure("openalex"):
+            await search_openalex(...)
+        tracker.record_yield("openalex", "simple", unique=2, total=40)
+
+        snapshot = tracker.snapshot("openalex", "simple")
+    """
+
+    def __init__(
+        self,
+        *,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            window_seconds: Age after which a sample no longer counts
+            max_samples: Samples kept per source (and per source/query kind)
+            clock: Monotonic clock in seconds
+        """
+        self._window = window_seconds
+        self._max_samples = max_samples
+        self._clock = clock
+        self._latencies: dict[str, deque[tuple[float, float]]] = defaultdict(self._new_window)
+        # (source, query kind) -> (timestamp, unique, total)
+        self._yields: dict[tuple[str, str], deque[tuple[float, int, int]]] = defaultdict(self._new_window)
+        self._lock = threading.Lock()
+
+    def _new_window(self) -> deque:
+        return deque(maxlen=self._max_samples)
+
+    def record_latency(self, source: str, latency_ms: float) -> None:
+        """Record the wall time of one provider call."""
+        with self._lock:
+            self._latencies[source].append((self._clock(), latency_ms))
+
+    @contextmanager
+    def measure(self, source: str, *, discard: Callable[[], bool] | None = None) -> Iterator[None]:
+        """
+        Record the wall time of the enclosed call, also when it fails or is cancelled.
+
+        Args:
+            source: Source key
+            discard: Checked on exit; True drops the sample (e.g. a call
+                cancelled on purpose, whose wall time says nothing about the source)
+        """
+        started = self._clock()
+        try:
+            yield
+        finally:
+            if discard is None or not discard():
+                self.record_latency(source, (self._clock() - started) * 1000)
+
+    def record_yield(self, source: str, query_kind: str, *, unique: int, total: int) -> None:
+        """
+        Record one search's unique contribution of *source*.
+
+        Args:
+            source: Source key
+            query_kind: Kind of query (auto-dispatch profile)
+            unique: Articles of the search that only this source returned
+            total: Unique articles of the search across all sources
+        """
+        with self._lock:
+            self._yields[(source, query_kind)].append((self._clock(), unique, total))
+
+    def snapshot(self, source: str, query_kind: str | None = None) -> SourcePerformanceSnapshot:
+        """
+        Statistics of *source* from the samples still inside the window.
+
+        Args:
+            source: Source key
+            query_kind: Kind of query for the unique-yield share (None = no yield)
+        """
+        with self._lock:
+            cutoff = self._clock() - self._window
+            latencies = sorted(latency for timestamp, latency in self._latencies.get(source, ()) if timestamp >= cutoff)
+            yields = [
+                (unique, total)
+                for timestamp, unique, total in self._yields.get((source, query_kind or ""), ())
+                if timestamp >= cutoff
+            ]
+
+        p95 = latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)] if latencies else None
+        total = sum(sample_total for _unique, sample_total in yields)
+        share = sum(unique for unique, _total in yields) / total if total else None
+        return SourcePerformanceSnapshot(
+            source=source,
+            latency_samples=len(latencies),
+            p95_latency_ms=p95,
+            yield_samples=len(yields),
+            unique_yield_share=share,
+        )
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        with self._lock:
+            self._latencies.clear()
+            self._yields.clear()
+
+
+# ==================== Singleton Factory ====================
+
+_source_performance_tracker: SourcePerformanceTracker | None = None
+_source_performance_tracker_lock = threading.Lock()
+
+
+def get_source_performance_tracker() -> SourcePerformanceTracker:
+    """
+    Get singleton source performance tracker.
+
+    Returns:
+        Shared SourcePerformanceTracker instance
+    """
+    global _source_performance_tracker
+    with _source_performance_tracker_lock:
+        if _source_performance_tracker is None:
+            _source_performance_tracker = SourcePerformanceTracker()
+        return _source_performance_tracker
+
+
+def reset_source_performance_tracker() -> None:
+    """Reset singleton tracker (for testing)."""
+    global _source_performance_tracker
+    with _source_performance_tracker_lock:
+        _source_performance_tracker = None
+
+
+__all__ = [
+    "DEFAULT_MAX_SAMPLES",
+    "DEFAULT_WINDOW_SECONDS",
+    "SourcePerformanceSnapshot",
+    "SourcePerformanceTracker",
+    "get_source_performance_tracker",
+    "reset_source_performance_tracker",
+]
@@ -0,0 +1,219 @@
+"""
+Tokenize-once term index for one ranking result set.
+
+Ranking used to tokenize the same articles several times: once to build
+``BM25Corpus`` document frequencies, again inside ``bm25_score`` for every
+scored article, again for MMR similarity sets and again for the fallback
+term-overlap relevance.  ``ArticleTermIndex`` does it once per result set:
+
+- every distinct term (token or whole keyword/MeSH phrase) is interned to an
+  integer id shared by all articles in the set;
+- per-field term-frequency maps (title, abstract, keywords + MeSH) and their
+  combined map are kept per article, keyed by term id; the combined map lists
+  title terms first, then keyword/MeSH terms, then abstract-only terms;
+- document lengths are stored both over all tokens (what BM25 length
+  normalization uses) and over indexable tokens (what the corpus average uses);
+- canonical article keys are computed once.
+
+Everything that scores or compares the result set (``ResultAggregator.rank``,
+``bm25_score``, ``mmr_diversify``, ``analyze_source_disagreement``) accepts
+the index and falls back to its own tokenization for articles outside it.
+The tokenization rules mirror the original per-function ones exactly, so
+scores do not change.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from pubmed_search.shared.article_identity import canonical_article_key
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pubmed_search.domain.entities.article import UnifiedArticle
+
+
+MIN_TERM_LENGTH = 3  # Minimum term length for BM25 indexing and query terms
+SIMILARITY_TITLE_MIN_LENGTH = 4  # Title tokens used for MMR similarity (skips stop words)
+
+_TOKEN_PATTERN = re.compile(r"\b\w+\b")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-case *text* and split it into word tokens."""
+    return _TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+@lru_cache(maxsize=256)
+def query_terms(query: str) -> tuple[str, ...]:
+    """Return the query's lower-cased BM25 terms, in order (parsed once per query)."""
+    return tuple(term.lower() for term in _TOKEN_PATTERN.findall(query) if len(term) >= MIN_TERM_LENGTH)
+
+
+def _count(term_ids: list[int]) -> dict[int, int]:
+    counts: dict[int, int] = {}
+    for term_id in term_ids:
+        counts[term_id] = counts.get(term_id, 0) + 1
+    return counts
+
+
+class ArticleTermIndex:
+    """Interned per-field term statistics for one list of articles."""
+
+    __slots__ = (
+        "_positions",
+        "_similarity_terms",
+        "abstract_tf",
+        "articles",
+        "bm25_matrix",
+        "doc_freq",
+        "doc_lengths",
+        "flat_terms",
+        "flat_tfs",
+        "indexed_lengths",
+        "keys",
+        "keyword_phrases",
+        "keyword_tf",
+        "term_tf",
+        "terms",
+        "title_keyword_counts",
+        "title_tf",
+        "vocabulary",
+    )
+
+    def __init__(self, articles: Sequence[UnifiedArticle]) -> None:
+        self.articles: list[UnifiedArticle] = list(articles)
+        self.vocabulary: dict[str, int] = {}
+        self.terms: list[str] = []
+        self.keys: list[str] = []
+        self.title_tf: list[dict[int, int]] = []
+        self.abstract_tf: list[dict[int, int]] = []
+        self.keyword_tf: list[dict[int, int]] = []
+        self.term_tf: list[dict[int, int]] = []
+        self.keyword_phrases: list[tuple[int, ...]] = []
+        self.doc_lengths: list[int] = []
+        self.indexed_lengths: list[int] = []
+        self.doc_freq: dict[int, int] = {}
+        # Combined maps flattened in article order, and per article the number
+        # of distinct title or keyword/MeSH terms leading its combined map.
+        self.flat_terms: list[int] = []
+        self.flat_tfs: list[int] = []
+        self.title_keyword_counts: list[int] = []
+        self._similarity_terms: list[frozenset[int] | None] = []
+        # Vectorized BM25 layout, built on first use by ``bm25_scores``
+        self.bm25_matrix: Any | None = None
+        # Keyed by id(): the index keeps every article alive, so ids are stable.
+        self._positions: dict[int, int] = {}
+
+        for position, article in enumerate(self.articles):
+            self._positions.setdefault(id(article), position)
+            self._add(article)
+
+    def _intern_all(self, tokens: list[str]) -> list[int]:
+        vocabulary = self.vocabulary
+        ids: list[int] = []
+        for token in tokens:
+            term_id = vocabulary.get(token)
+            if term_id is None:
+                term_id = len(self.terms)
+                vocabulary[token] = term_id
+                self.terms.append(token)
+            ids.append(term_id)
+        return ids
+
+    def _add(self, article: UnifiedArticle) -> None:
+        keywords = list(getattr(article, "keywords", []) or [])
+        mesh_terms = list(getattr(article, "mesh_terms", []) or [])
+        phrases = keywords + mesh_terms
+
+        title_ids = self._intern_all(tokenize(article.title or ""))
+        abstract_ids = self._intern_all(tokenize(article.abstract or ""))
+        keyword_ids = self._intern_all(tokenize(" ".join(phrases)))
+        self.keyword_phrases.append(tuple(self._intern_all([phrase.lower() for phrase in phrases])))
+
+        title_tf = _count(title_ids)
+        abstract_tf = _count(abstract_ids)
+        keyword_tf = _count(keyword_ids)
+        # Title terms first, then keyword/MeSH, then abstract-only terms, so each
+        # term's highest-boost field can be read from its position in the map.
+        combined = dict(title_tf)
+        for term_id, count in keyword_tf.items():
+            combined[term_id] = combined.get(term_id, 0) + count
+        title_keyword_count = len(combined)
+        for term_id, count in abstract_tf.items():
+            combined[term_id] = combined.get(term_id, 0) + count
+
+        terms = self.terms
+        indexed_length = 0
+        doc_freq = self.doc_freq
+        for term_id, count in combined.items():
+            if len(terms[term_id]) >= MIN_TERM_LENGTH:
+                indexed_length += count
+                doc_freq[term_id] = doc_freq.get(term_id, 0) + 1
+
+        self.keys.append(canonical_article_key(article))
+        self.title_tf.append(title_tf)
+        self.abstract_tf.append(abstract_tf)
+        self.keyword_tf.append(keyword_tf)
+        self.term_tf.append(combined)
+        self.flat_terms.extend(combined)
+        self.flat_tfs.extend(combined.values())
+        self.title_keyword_counts.append(title_keyword_count)
+        self.doc_lengths.append(len(title_ids) + len(abstract_ids) + len(keyword_ids))
+        self.indexed_lengths.append(indexed_length)
+        self._similarity_terms.append(None)
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    @property
+    def avg_indexed_length(self) -> float:
+        """Average number of indexable terms per article (BM25 ``avgdl``)."""
+        return sum(self.indexed_lengths) / max(len(self.articles), 1)
+
+    def position(self, article: UnifiedArticle) -> int | None:
+        """Return the article's position in the index, or ``None`` if it is not indexed."""
+        return self._positions.get(id(article))
+
+    def key_for(self, article: UnifiedArticle) -> str:
+        """Return the canonical key of *article*, reusing the indexed one when possible."""
+        position = self._positions.get(id(article))
+        return self.keys[position] if position is not None else canonical_article_key(article)
+
+    def term_id(self, term: str) -> int | None:
+        """Look up an already interned term without adding it."""
+        return self.vocabulary.get(term)
+
+    def query_term_ids(self, query: str) -> list[int | None]:
+        """Map the query's indexable terms to ids (``None`` for terms no article contains)."""
+        vocabulary = self.vocabulary
+        return [vocabulary.get(term) for term in query_terms(query)]
+
+    def string_doc_freq(self) -> dict[str, int]:
+        """Document frequencies keyed by term string, as ``BM25Corpus`` exposes them."""
+        terms = self.terms
+        return {terms[term_id]: df for term_id, df in self.doc_freq.items()}
+
+    def similarity_terms(self, position: int) -> frozenset[int]:
+        """MMR similarity set: whole keyword/MeSH phrases plus significant title tokens."""
+        cached = self._similarity_terms[position]
+        if cached is None:
+            terms = self.terms
+            title_ids = {
+                term_id for term_id in self.title_tf[position] if len(terms[term_id]) >= SIMILARITY_TITLE_MIN_LENGTH
+            }
+            cached = frozenset(self.keyword_phrases[position]).union(title_ids)
+            self._similarity_terms[position] = cached
+        return cached
+
+
+__all__ = [
+    "MIN_TERM_LENGTH",
+    "SIMILARITY_TITLE_MIN_LENGTH",
+    "ArticleTermIndex",
+    "query_terms",
+    "tokenize",
+]
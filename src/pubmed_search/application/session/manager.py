@@ -24,12 +24,15 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from pubmed_search.application.search.corpus_statistics import CorpusStatistics
+
 from pubmed_search.application.session.artifacts import ArtifactStore
 from pubmed_search.shared.cache_substrate import CacheBackend, CacheStore, JsonFileCacheBackend, MemoryCacheBackend
 from pubmed_search.shared.credential_sanitizer import is_credential_field, redact_credential_assignments
 from pubmed_search.shared.datetime_utils import parse_iso8601_datetime
 from pubmed_search.shared.file_io import atomic_write_json
 from pubmed_search.shared.locking import synchronized
+from pubmed_search.shared.string_interning import get_intern_table
 
 logger = logging.getLogger(__name__)
 MAX_SESSION_EVENT_LOG = 200
@@ -163,7 +166,15 @@ class CachedArticle:
             pmc_id=payload.get("pmc_id", ""),
             cached_at=cached_at,
             full_data=payload,
-        )
+        ).intern_metadata()
+
+    def intern_metadata(self) -> CachedArticle:
+        """Share repeated metadata strings (journal, MeSH, affiliations, ...) with other cached articles."""
+        table = get_intern_table()
+        self.journal = table.intern(self.journal)
+        if isinstance(self.full_data, dict):
+            table.intern_payload(self.full_data)
+        return self
 
     def as_article_dict(self) -> dict[str, Any]:
         """Return a dict payload suitable for API/tools responses."""
@@ -304,16 +315,27 @@ class ResearchSession:
 
 
 class ArticleCache:
-    """Article cache wrapper using the shared cache substrate."""
+    """Article cache wrapper using the shared cache substrate.
+
+    Articles entering the cache for the first time are also counted in the
+    persistent corpus statistics (the BM25 IDF prior) when that store is
+    enabled.
+    """
 
     def __init__(
         self,
         cache_dir: str | None = None,
         max_age_days: int = 7,
         backend: CacheBackend | None = None,
+        corpus_statistics: CorpusStatistics | None = None,
     ):
         self.cache_dir = Path(cache_dir) if cache_dir else None
         self.max_age_days = max_age_days
+        if corpus_statistics is None:
+            from pubmed_search.application.search.corpus_statistics import get_corpus_statistics
+
+            corpus_statistics = get_corpus_statistics()
+        self.corpus_statistics = corpus_statistics
 
         if backend is None:
             if self.cache_dir:
@@ -338,7 +360,7 @@ class ArticleCache:
         if not isinstance(raw, dict):
             raise TypeError("Article cache payload must be a dict")
         try:
-            return CachedArticle(**raw)
+            return CachedArticle(**raw).intern_metadata()
         except TypeError:
             pmid = str(raw.get("pmid") or "")
             return CachedArticle.from_article_data(pmid, raw)
@@ -350,13 +372,19 @@ class ArticleCache:
         return self._store.get_many(pmids)
 
     def put(self, pmid: str, article_data: dict[str, Any]) -> None:
+        if self.corpus_statistics is not None and pmid not in self._store:
+            self.corpus_statistics.add_article_data(article_data)
         self._store.set(pmid, CachedArticle.from_article_data(pmid, article_data))
 
     def put_many(self, articles: list[dict[str, Any]]) -> int:
         entries: list[tuple[str, CachedArticle]] = []
+        counted: set[str] = set()
         for article in articles:
             pmid = article.get("pmid", "")
             if pmid:
+                if self.corpus_statistics is not None and pmid not in counted and pmid not in self._store:
+                    self.corpus_statistics.add_article_data(article)
+                    counted.add(pmid)
                 entries.append((pmid, CachedArticle.from_article_data(pmid, article)))
 
         return self._store.warmup(entries)
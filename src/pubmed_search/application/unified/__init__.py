@@ -8,9 +8,15 @@ execution is injected by adapters.
 from __future__ import annotations
 
 from .service import (
+    UnifiedSearchBatchRequest,
     UnifiedSearchRunner,
     UnifiedSearchRunRequest,
     UnifiedSearchService,
 )
 
-__all__ = ["UnifiedSearchRunRequest", "UnifiedSearchRunner", "UnifiedSearchService"]
+__all__ = [
+    "UnifiedSearchBatchRequest",
+    "UnifiedSearchRunRequest",
+    "UnifiedSearchRunner",
+    "UnifiedSearchService",
+]
@@ -29,6 +29,7 @@ class UnifiedSearchRunRequest:
     pipeline: str | None = None
     dry_run: bool = False
     stop_at: str = ""
+    cursor: str = ""
 
     def to_runner_kwargs(self) -> dict[str, Any]:
         """Return keyword arguments expected by a runtime unified-search runner."""
@@ -43,6 +44,32 @@ class UnifiedSearchRunRequest:
             "pipeline": self.pipeline,
             "dry_run": self.dry_run,
             "stop_at": self.stop_at,
+            "cursor": self.cursor,
+        }
+
+
+@dataclass(frozen=True)
+class UnifiedSearchBatchRequest:
+    """Stable application request for several unified-search query variants."""
+
+    queries: tuple[str, ...]
+    limit: int | str = 10
+    sources: str | None = None
+    ranking: Literal["balanced", "impact", "recency", "quality"] = "balanced"
+    output_format: Literal["markdown", "json", "toon"] = "json"
+    filters: str | None = None
+    options: str | None = None
+
+    def to_runner_kwargs(self) -> dict[str, Any]:
+        """Return keyword arguments expected by a runtime batch runner."""
+        return {
+            "queries": list(self.queries),
+            "limit": self.limit,
+            "sources": self.sources,
+            "ranking": self.ranking,
+            "output_format": self.output_format,
+            "filters": self.filters,
+            "options": self.options,
         }
 
 
@@ -56,13 +83,21 @@ class UnifiedSearchRunner(Protocol):
 class UnifiedSearchService:
     """Small application facade around an injected unified-search runner."""
 
-    def __init__(self, runner: UnifiedSearchRunner) -> None:
+    def __init__(self, runner: UnifiedSearchRunner, batch_runner: UnifiedSearchRunner | None = None) -> None:
         self._runner = runner
+        self._batch_runner = batch_runner
 
     async def search(self, request: UnifiedSearchRunRequest) -> str:
         """Run a unified search using the configured runtime adapter."""
         return await self._runner(**request.to_runner_kwargs())
 
+    async def search_batch(self, request: UnifiedSearchBatchRequest) -> str:
+        """Run a batch of query variants using the configured batch adapter."""
+        if self._batch_runner is None:
+            msg = "No unified-search batch runner is configured"
+            raise RuntimeError(msg)
+        return await self._batch_runner(**request.to_runner_kwargs())
+
 
 def make_noop_unified_search_runner(message: str) -> UnifiedSearchRunner:
     """Create a runner that reports why unified search is unavailable."""
@@ -74,6 +109,7 @@ def make_noop_unified_search_runner(message: str) -> UnifiedSearchRunner:
 
 
 __all__ = [
+    "UnifiedSearchBatchRequest",
     "UnifiedSearchRunRequest",
     "UnifiedSearchRunner",
     "UnifiedSearchService",
@@ -10,6 +10,15 @@ Architecture Decision:
     2. Performance - faster instantiation
     3. Simplicity - easy to understand and maintain
 
+Memory Layout:
+    Deep searches and session caches keep tens of thousands of articles
+    alive, so every entity is slotted (no per-instance ``__dict__``) and
+    list fields default to the shared empty tuple instead of a fresh list.
+    Read them as sequences; code that adds items rebinds the field to a
+    list first (see ``merge_from``). Article type and OA status are enum
+    members, and the enum-like strings of ``OpenAccessLink`` and
+    ``SourceMetadata`` are interned, so repeated values share one object.
+
 Supported Sources:
     - PubMed (NCBI E-utilities)
     - CrossRef (DOI metadata)
@@ -36,10 +45,14 @@ from __future__ import annotations
 
 import contextlib
 import re
+import sys
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Sequence
 
 MONTHS_PER_YEAR = 12
 
@@ -163,7 +176,12 @@ def _parse_pubmed_date(value: Any) -> tuple[int | None, date | None]:
     return year, pub_date
 
 
-def _append_unique_preserving_order(target: list[Any], values: list[Any]) -> None:
+def _as_list(values: Sequence[Any]) -> list[Any]:
+    """Return *values* itself if it is a list, else a list copy (e.g. of the empty-tuple default)."""
+    return values if isinstance(values, list) else list(values)
+
+
+def _append_unique_preserving_order(target: list[Any], values: Sequence[Any]) -> None:
     """Append values not already present, using a set when values are hashable."""
     try:
         seen: set[Any] | None = set(target)
@@ -219,7 +237,7 @@ class OpenAccessStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Author:
     """
     Author information.
@@ -288,7 +306,7 @@ class Author:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenAccessLink:
     """
     Open access link information.
@@ -302,13 +320,19 @@ class OpenAccessLink:
     license: str | None = None  # e.g., "cc-by", "cc-by-nc"
     is_best: bool = False  # Best available OA option
 
+    def __post_init__(self) -> None:
+        # Parsed JSON yields a new string per link; share one per distinct value.
+        self.version = sys.intern(self.version)  # type: ignore[assignment]
+        if self.host_type is not None:
+            self.host_type = sys.intern(self.host_type)  # type: ignore[assignment]
+
     @property
     def is_pdf(self) -> bool:
         """Check if URL likely points to PDF."""
         return self.url.lower().endswith(".pdf") or "/pdf/" in self.url.lower()
 
 
-@dataclass
+@dataclass(slots=True)
 class JournalMetrics:
     """
     Journal-level metrics from OpenAlex Sources API.
@@ -333,7 +357,7 @@ class JournalMetrics:
     cited_by_count: int | None = None
     is_in_doaj: bool | None = None
     source_type: str | None = None  # journal, repository, conference, etc.
-    subject_areas: list[str] = field(default_factory=list)
+    subject_areas: Sequence[str] = ()
 
     @property
     def impact_tier(self) -> str:
@@ -351,7 +375,7 @@ class JournalMetrics:
         return "minimal"
 
 
-@dataclass
+@dataclass(slots=True)
 class CitationMetrics:
     """
     Citation and impact metrics from various sources.
@@ -397,7 +421,7 @@ class CitationMetrics:
         return "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceMetadata:
     """
     Metadata about where article data came from.
@@ -412,8 +436,11 @@ class SourceMetadata:
     fetched_at: str | None = None  # ISO timestamp
     raw_data: dict[str, Any] | None = field(default=None, repr=False)
 
+    def __post_init__(self) -> None:
+        self.source = sys.intern(self.source)
+
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedArticle:
     """
     Unified article representation across all academic sources.
@@ -457,7 +484,7 @@ class UnifiedArticle:
     arxiv_id: str | None = None
 
     # === Bibliographic ===
-    authors: list[Author] = field(default_factory=list)
+    authors: Sequence[Author] = ()
     abstract: str | None = None
     journal: str | None = None
     journal_abbrev: str | None = None
@@ -469,12 +496,12 @@ class UnifiedArticle:
     publisher: str | None = None
     article_type: ArticleType = ArticleType.UNKNOWN
     language: str | None = None
-    keywords: list[str] = field(default_factory=list)
-    mesh_terms: list[str] = field(default_factory=list)
+    keywords: Sequence[str] = ()
+    mesh_terms: Sequence[str] = ()
 
     # === Open Access ===
     oa_status: OpenAccessStatus = OpenAccessStatus.UNKNOWN
-    oa_links: list[OpenAccessLink] = field(default_factory=list)
+    oa_links: Sequence[OpenAccessLink] = ()
     is_open_access: bool | None = None
 
     # === Metrics ===
@@ -487,13 +514,19 @@ class UnifiedArticle:
     similarity_details: dict[str, float] | None = field(default=None, repr=False)  # Multiple sources
 
     # === Source Tracking ===
-    sources: list[SourceMetadata] = field(default_factory=list)
+    sources: Sequence[SourceMetadata] = ()
 
     # === Internal (ranking scores, set by ResultAggregator) ===
     relevance_score: float | None = field(default=None, repr=False)
     quality_score: float | None = field(default=None, repr=False)
     ranking_score: float | None = field(default=None, repr=False)
 
+    # === Internal (serialization cache, see cached_serialization) ===
+    _revision: int = field(default=0, init=False, repr=False, compare=False)
+    _serialized: dict[Hashable, tuple[tuple[Any, ...], Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     # ===================================================================
     # Properties
     # ===================================================================
@@ -795,13 +828,15 @@ class UnifiedArticle:
 
         # Merge authors (if empty)
         if not self.authors and other.authors:
-            self.authors = other.authors.copy()
+            self.authors = list(other.authors)
 
         # Merge keywords/MeSH
         if other.keywords:
-            _append_unique_preserving_order(self.keywords, other.keywords)
+            self.keywords = keywords = _as_list(self.keywords)
+            _append_unique_preserving_order(keywords, other.keywords)
         if other.mesh_terms:
-            _append_unique_preserving_order(self.mesh_terms, other.mesh_terms)
+            self.mesh_terms = mesh_terms = _as_list(self.mesh_terms)
+            _append_unique_preserving_order(mesh_terms, other.mesh_terms)
 
         # Merge OA info
         if self.oa_status == OpenAccessStatus.UNKNOWN:
@@ -810,11 +845,13 @@ class UnifiedArticle:
             self.is_open_access = other.is_open_access
 
         # Merge OA links (dedupe by URL)
-        existing_urls = {link.url for link in self.oa_links}
-        for link in other.oa_links:
-            if link.url not in existing_urls:
-                self.oa_links.append(link)
-                existing_urls.add(link.url)
+        if other.oa_links:
+            self.oa_links = oa_links = _as_list(self.oa_links)
+            existing_urls = {link.url for link in oa_links}
+            for link in other.oa_links:
+                if link.url not in existing_urls:
+                    oa_links.append(link)
+                    existing_urls.add(link.url)
 
         # Merge citation metrics
         if other.citation_metrics:
@@ -858,11 +895,45 @@ class UnifiedArticle:
                     self.journal_metrics.i10_index = other.journal_metrics.i10_index
 
         # Track sources
-        existing_sources = {source.source for source in self.sources}
-        for source in other.sources:
-            if source.source not in existing_sources:
-                self.sources.append(source)
-                existing_sources.add(source.source)
+        if other.sources:
+            self.sources = sources = _as_list(self.sources)
+            existing_sources = {source.source for source in sources}
+            for source in other.sources:
+                if source.source not in existing_sources:
+                    sources.append(source)
+                    existing_sources.add(source.source)
+
+        self.mark_modified()
+
+    def mark_modified(self) -> None:
+        """Invalidate cached serialized forms after changing fields in place.
+
+        ``merge_from`` calls this itself, and score updates are detected
+        automatically; call it after other direct mutations (e.g. enrichment).
+        """
+        self._revision += 1
+        self._serialized = None
+
+    def cached_serialization(self, variant: Hashable, encode: Callable[[UnifiedArticle], Any]) -> Any:
+        """
+        Return ``encode(self)``, reusing the cached result while the article is unchanged.
+
+        Responses, artifacts and session saves serialize the same ranked
+        articles several times. Results are cached per *variant* (e.g. output
+        format and options) and are invalidated by ``merge_from``,
+        ``mark_modified`` and any change to the ranking or similarity scores.
+        """
+        state = (self._revision, self.ranking_score, self.similarity_score, self.similarity_source)
+        cache = self._serialized
+        if cache is None:
+            self._serialized = cache = {}
+        else:
+            entry = cache.get(variant)
+            if entry is not None and entry[0] == state:
+                return entry[1]
+        value = encode(self)
+        cache[variant] = (state, value)
+        return value
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -895,8 +966,8 @@ class UnifiedArticle:
             "publication_date": self.publication_date.isoformat() if self.publication_date else None,
             "publisher": self.publisher,
             "article_type": self.article_type.value,
-            "keywords": self.keywords,
-            "mesh_terms": self.mesh_terms,
+            "keywords": list(self.keywords),
+            "mesh_terms": list(self.mesh_terms),
             "open_access": {
                 "is_oa": self.has_open_access,
                 "status": self.oa_status.value,
@@ -948,7 +1019,7 @@ class UnifiedArticle:
             if jm.issn:
                 journal_data["issn"] = jm.issn
             if jm.subject_areas:
-                journal_data["subject_areas"] = jm.subject_areas
+                journal_data["subject_areas"] = list(jm.subject_areas)
             if jm.is_in_doaj is not None:
                 journal_data["is_in_doaj"] = jm.is_in_doaj
             if journal_data:
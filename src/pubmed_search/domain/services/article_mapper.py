@@ -9,6 +9,12 @@ Maintenance:
     When a source schema changes, update only its mapper function and preserve
     the normalized entity contract. Avoid adding network calls or persistence
     logic here so the mapping layer stays deterministic and easy to test.
+
+Memory:
+    Every mapper finishes with ``_with_interned_metadata``, which routes the
+    repeated metadata strings (journal, abbreviation, publisher, language,
+    keywords, MeSH, publication types, affiliations) of both the entity and
+    its raw payload through the shared bounded intern table.
 """
 
 from __future__ import annotations
@@ -28,6 +34,24 @@ from pubmed_search.domain.entities.article import (
     UnifiedArticle,
     _parse_pubmed_date,
 )
+from pubmed_search.shared.string_interning import get_intern_table
+
+
+def _with_interned_metadata(article: UnifiedArticle, data: dict[str, Any]) -> UnifiedArticle:
+    """Canonicalize repeated metadata strings of *article* and its raw payload in place."""
+    table = get_intern_table()
+    table.intern_payload(data)
+    article.journal = table.intern(article.journal)
+    article.journal_abbrev = table.intern(article.journal_abbrev)
+    article.publisher = table.intern(article.publisher)
+    article.language = table.intern(article.language)
+    if isinstance(article.keywords, list):
+        table.intern_list(article.keywords)
+    if isinstance(article.mesh_terms, list):
+        table.intern_list(article.mesh_terms)
+    for author in article.authors:
+        author.affiliation = table.intern(author.affiliation)
+    return article
 
 
 def article_from_pubmed(data: dict[str, Any]) -> UnifiedArticle:
@@ -82,13 +106,13 @@ def article_from_pubmed(data: dict[str, Any]) -> UnifiedArticle:
             )
         )
 
-    return UnifiedArticle(
+    article = UnifiedArticle(
         title=data.get("title", "Unknown Title"),
         primary_source="pubmed",
         pmid=data.get("pmid") or data.get("uid"),
         doi=data.get("doi"),
         pmc=data.get("pmc"),
-        authors=authors,
+        authors=authors or (),
         abstract=data.get("abstract"),
         journal=data.get("journal") or data.get("fulljournalname"),
         journal_abbrev=data.get("source"),
@@ -99,13 +123,14 @@ def article_from_pubmed(data: dict[str, Any]) -> UnifiedArticle:
         publication_date=pub_date,
         article_type=article_type,
         language=data.get("language"),
-        keywords=data.get("keywords", []),
-        mesh_terms=data.get("mesh_terms", []),
+        keywords=data.get("keywords") or (),
+        mesh_terms=data.get("mesh_terms") or (),
         oa_status=oa_status,
-        oa_links=oa_links,
+        oa_links=oa_links or (),
         is_open_access=is_oa,
         sources=[SourceMetadata(source="pubmed", raw_data=data)],
     )
+    return _with_interned_metadata(article, data)
 
 
 def article_from_crossref(data: dict[str, Any]) -> UnifiedArticle:
@@ -160,14 +185,14 @@ def article_from_crossref(data: dict[str, Any]) -> UnifiedArticle:
                 )
             )
 
-    return UnifiedArticle(
+    article = UnifiedArticle(
         title=data.get("title", ["Unknown Title"])[0]
         if isinstance(data.get("title"), list)
         else data.get("title", "Unknown Title"),
         primary_source="crossref",
         doi=data.get("DOI"),
         pmc=pmc,
-        authors=authors,
+        authors=authors or (),
         abstract=data.get("abstract"),
         journal=journal,
         journal_abbrev=journal_abbrev,
@@ -178,12 +203,13 @@ def article_from_crossref(data: dict[str, Any]) -> UnifiedArticle:
         publication_date=pub_date,
         publisher=data.get("publisher"),
         article_type=article_type,
-        oa_links=oa_links,
+        oa_links=oa_links or (),
         citation_metrics=CitationMetrics(citation_count=data.get("is-referenced-by-count"))
         if data.get("is-referenced-by-count")
         else None,
         sources=[SourceMetadata(source="crossref", raw_data=data)],
     )
+    return _with_interned_metadata(article, data)
 
 
 def _openalex_abstract(data: dict[str, Any]) -> str | None:
@@ -297,14 +323,14 @@ def article_from_openalex(data: dict[str, Any]) -> UnifiedArticle:
     }
     article_type = openalex_type_map.get(oa_type, ArticleType.UNKNOWN)
 
-    return UnifiedArticle(
+    article = UnifiedArticle(
         title=data.get("title") or data.get("display_name", "Unknown Title"),
         primary_source="openalex",
         openalex_id=data.get("id", "").replace("https://openalex.org/", ""),
         doi=doi,
         pmid=pmid,
         pmc=pmc,
-        authors=authors,
+        authors=authors or (),
         abstract=_openalex_abstract(data),
         journal=journal,
         year=year,
@@ -312,12 +338,13 @@ def article_from_openalex(data: dict[str, Any]) -> UnifiedArticle:
         article_type=article_type,
         is_open_access=is_oa,
         oa_status=oa_status,
-        oa_links=oa_links,
+        oa_links=oa_links or (),
         citation_metrics=CitationMetrics(citation_count=data.get("cited_by_count"))
         if data.get("cited_by_count")
         else None,
         sources=[SourceMetadata(source="openalex", raw_data=data)],
     )
+    return _with_interned_metadata(article, data)
 
 
 def article_from_semantic_scholar(data: dict[str, Any]) -> UnifiedArticle:
@@ -353,7 +380,7 @@ def article_from_semantic_scholar(data: dict[str, Any]) -> UnifiedArticle:
     elif arxiv and not pmid:
         article_type = ArticleType.PREPRINT
 
-    return UnifiedArticle(
+    article = UnifiedArticle(
         title=data.get("title", "Unknown Title"),
         primary_source="semantic_scholar",
         s2_id=data.get("paperId"),
@@ -361,13 +388,13 @@ def article_from_semantic_scholar(data: dict[str, Any]) -> UnifiedArticle:
         pmid=pmid,
         pmc=pmc,
         arxiv_id=arxiv,
-        authors=authors,
+        authors=authors or (),
         abstract=data.get("abstract"),
         journal=(publication_venue.get("name") if isinstance(publication_venue, dict) else None) or data.get("venue"),
         year=data.get("year"),
         article_type=article_type,
         is_open_access=is_oa,
-        oa_links=oa_links,
+        oa_links=oa_links or (),
         citation_metrics=CitationMetrics(
             citation_count=data.get("citationCount"),
             influential_citation_count=data.get("influentialCitationCount"),
@@ -376,6 +403,7 @@ def article_from_semantic_scholar(data: dict[str, Any]) -> UnifiedArticle:
         else None,
         sources=[SourceMetadata(source="semantic_scholar", raw_data=data)],
     )
+    return _with_interned_metadata(article, data)
 
 
 def article_from_core(data: dict[str, Any]) -> UnifiedArticle:
@@ -393,26 +421,27 @@ def article_from_core(data: dict[str, Any]) -> UnifiedArticle:
         if url:
             oa_links.append(OpenAccessLink(url=url, is_best=(url_key == "download_url")))
 
-    return UnifiedArticle(
+    article = UnifiedArticle(
         title=data.get("title") or "Unknown Title",
         primary_source="core",
         core_id=str(data["core_id"]) if data.get("core_id") else None,
         doi=data.get("doi"),
         pmid=data.get("pmid"),
         arxiv_id=data.get("arxiv_id"),
-        authors=authors,
+        authors=authors or (),
         abstract=data.get("abstract"),
         journal=data.get("journal"),
         year=data.get("year"),
         publisher=data.get("publisher"),
         language=data.get("language"),
         is_open_access=bool(data.get("has_fulltext") or data.get("download_url")),
-        oa_links=oa_links,
+        oa_links=oa_links or (),
         citation_metrics=CitationMetrics(citation_count=data.get("citation_count"))
         if data.get("citation_count")
         else None,
         sources=[SourceMetadata(source="core", raw_data=data)],
     )
+    return _with_interned_metadata(article, data)
 
 
 def article_from_scopus(data: dict[str, Any]) -> UnifiedArticle:
@@ -429,21 +458,22 @@ def article_from_scopus(data: dict[str, Any]) -> UnifiedArticle:
     if data.get("is_open_access") and link:
         oa_links.append(OpenAccessLink(url=link, is_best=True))
 
-    return UnifiedArticle(
+    article = UnifiedArticle(
         title=data.get("title") or "Unknown Title",
         primary_source="scopus",
         doi=data.get("doi"),
-        authors=authors,
+        authors=authors or (),
         abstract=data.get("abstract"),
         journal=data.get("journal") or data.get("journal_abbrev"),
         year=data.get("year"),
         is_open_access=bool(data.get("is_open_access")),
-        oa_links=oa_links,
+        oa_links=oa_links or (),
         citation_metrics=CitationMetrics(citation_count=data.get("cited_by_count"))
         if data.get("cited_by_count")
         else None,
         sources=[SourceMetadata(source="scopus", raw_data=data)],
     )
+    return _with_interned_metadata(article, data)
 
 
 def article_from_web_of_science(data: dict[str, Any]) -> UnifiedArticle:
@@ -460,21 +490,22 @@ def article_from_web_of_science(data: dict[str, Any]) -> UnifiedArticle:
     if data.get("is_open_access") and link:
         oa_links.append(OpenAccessLink(url=link, is_best=True))
 
-    return UnifiedArticle(
+    article = UnifiedArticle(
         title=data.get("title") or "Unknown Title",
         primary_source="web_of_science",
         doi=data.get("doi"),
-        authors=authors,
+        authors=authors or (),
         abstract=data.get("abstract"),
         journal=data.get("journal") or data.get("journal_abbrev"),
         year=data.get("year"),
         is_open_access=bool(data.get("is_open_access")),
-        oa_links=oa_links,
+        oa_links=oa_links or (),
         citation_metrics=CitationMetrics(citation_count=data.get("cited_by_count"))
         if data.get("cited_by_count")
         else None,
         sources=[SourceMetadata(source="web_of_science", raw_data=data)],
     )
+    return _with_interned_metadata(article, data)
 
 
 def article_from_europe_pmc(data: dict[str, Any]) -> UnifiedArticle:
@@ -542,23 +573,24 @@ def article_from_preprint(data: dict[str, Any]) -> UnifiedArticle:
             )
         )
 
-    return UnifiedArticle(
+    article = UnifiedArticle(
         title=data.get("title", "Unknown Title"),
         primary_source=source_key,
         doi=doi,
         arxiv_id=arxiv_id,
-        authors=authors,
+        authors=authors or (),
         abstract=data.get("abstract"),
         journal=journal_label,
         year=year,
         publication_date=pub_date,
         article_type=ArticleType.PREPRINT,
-        keywords=data.get("categories", []),
+        keywords=data.get("categories") or (),
         oa_status=OpenAccessStatus.GREEN,
-        oa_links=oa_links,
+        oa_links=oa_links or (),
         is_open_access=True,
         sources=[SourceMetadata(source=source_key, raw_data=data)],
     )
+    return _with_interned_metadata(article, data)
 
 
 __all__ = [
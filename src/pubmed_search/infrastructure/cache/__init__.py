@@ -2,8 +2,9 @@
 Cache infrastructure exports.
 
 Design:
-    This package exposes the shared cache substrate and the common entity cache
-    wrapper used by multiple infrastructure clients.
+    This package exposes the shared cache substrate, the common entity cache
+    wrapper used by multiple infrastructure clients, and the result-set cache
+    used by unified search.
 
 Maintenance:
     Keep this file focused on re-exporting stable cache primitives. Detailed
@@ -16,6 +17,10 @@ from pubmed_search.infrastructure.cache.entity_cache import (
     EntityCache,
     get_entity_cache,
 )
+from pubmed_search.infrastructure.cache.result_set_cache import (
+    ResultSetCache,
+    get_result_set_cache,
+)
 from pubmed_search.shared.cache_substrate import (
     CacheStats,
     CacheStore,
@@ -30,4 +35,6 @@ __all__ = [
     "get_entity_cache",
     "JsonFileCacheBackend",
     "MemoryCacheBackend",
+    "ResultSetCache",
+    "get_result_set_cache",
 ]
@@ -0,0 +1,247 @@
+"""Result-set cache for repeated unified searches.
+
+Design:
+    Agents often repeat the same unified_search call within a few minutes
+    (retries, re-formatting, follow-up turns). This cache stores the outcome
+    of a ranked search under a key derived from the normalized search plan
+    (see ``DispatchStrategy.result_cache_key``) so the repeat can skip the
+    source round-trips, aggregation, enrichment and ranking.
+
+    A cached result set keeps only the ranked canonical article keys, the
+    per-set ranking scores and the source metadata (counts, statuses, deep
+    search and relaxation diagnostics). The articles themselves live in a
+    shared article store keyed by ``canonical_article_key``, so result sets
+    that overlap share one stored copy of each article. Lookups rehydrate
+    fresh shallow copies carrying the scores of the requested set; if any
+    article has been evicted, the whole result set is treated as a miss.
+    ``get_page`` rehydrates a single window of a set, for cursor paging.
+
+Maintenance:
+    Both stores are bounded, TTL-based ``CacheStore`` instances from the
+    shared cache substrate. Keep this wrapper free of search logic: deciding
+    what to cache and what the key covers belongs to the unified search
+    execution and dispatch modules.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from pubmed_search.shared.article_identity import canonical_article_key
+from pubmed_search.shared.cache_substrate import CacheStats, CacheStore, MemoryCacheBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from pubmed_search.domain.entities.article import UnifiedArticle
+
+DEFAULT_RESULT_SET_TTL_SECONDS = 600.0
+DEFAULT_MAX_RESULT_SETS = 256
+DEFAULT_MAX_ARTICLES = 20_000
+
+# (ranking_score, relevance_score, quality_score) of one article in one result set
+_ArticleScores = tuple[float | None, float | None, float | None]
+
+
+@dataclass(frozen=True)
+class CachedResultSet:
+    """Ranked article keys and source metadata of one cached search."""
+
+    article_keys: tuple[str, ...]
+    scores: tuple[_ArticleScores, ...]
+    metadata: dict[str, Any]
+
+
+class ResultSetCache:
+    """
+    Bounded, TTL-based cache of ranked search result sets.
+
+    Example:
+        cache = ResultSetCache(ttl=600)
+        cache.put(plan_key, ranked_articles, {"stats": stats})
+
+        hit = cache.get(plan_key)
+        if hit is not None:
+            articles, metadata = hit
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_RESULT_SET_TTL_SECONDS,
+        max_result_sets: int = DEFAULT_MAX_RESULT_SETS,
+        max_articles: int = DEFAULT_MAX_ARTICLES,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Time-to-live of result sets and stored articles, in seconds
+            max_result_sets: Maximum number of cached result sets
+            max_articles: Maximum number of articles in the shared article store
+        """
+        self._result_sets = CacheStore[CachedResultSet](
+            MemoryCacheBackend(max_entries=max_result_sets),
+            default_ttl=ttl,
+            name="result-set-cache",
+        )
+        self._articles = CacheStore["UnifiedArticle"](
+            MemoryCacheBackend(max_entries=max_articles),
+            default_ttl=ttl,
+            name="result-set-articles",
+        )
+        self._lock = threading.RLock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Lookup statistics of the result-set store."""
+        return self._result_sets.stats
+
+    def get(self, key: str) -> tuple[list[UnifiedArticle], dict[str, Any]] | None:
+        """
+        Rehydrate a cached result set.
+
+        Args:
+            key: Result-set key
+
+        Returns:
+            Copies of the ranked articles (with this set's scores) and a copy
+            of the stored metadata, or None if the set is missing, expired or
+            one of its articles is no longer stored.
+        """
+        page = self.get_page(key, 0, None)
+        if page is None:
+            return None
+        articles, metadata, _total = page
+        return articles, metadata
+
+    def get_page(
+        self, key: str, offset: int, size: int | None
+    ) -> tuple[list[UnifiedArticle], dict[str, Any], int] | None:
+        """
+        Rehydrate one window of a cached result set.
+
+        Args:
+            key: Result-set key
+            offset: Rank position of the first article to return
+            size: Number of articles to return (None = all from *offset*)
+
+        Returns:
+            Copies of the articles in the window, a copy of the stored
+            metadata and the size of the whole set; None as for ``get``.
+        """
+        with self._lock:
+            entry = self._result_sets.get(key)
+            if entry is None:
+                return None
+            stored, missing = self._articles.get_many(list(entry.article_keys))
+            if missing:
+                self._result_sets.invalidate(key)
+                return None
+            stop = None if size is None else offset + size
+            articles = []
+            for article_key, (ranking_score, relevance_score, quality_score) in zip(
+                entry.article_keys[offset:stop], entry.scores[offset:stop], strict=True
+            ):
+                article = copy.copy(stored[article_key])
+                article.ranking_score = ranking_score
+                article.relevance_score = relevance_score
+                article.quality_score = quality_score
+                articles.append(article)
+            return articles, copy.deepcopy(entry.metadata), len(entry.article_keys)
+
+    def put(self, key: str, articles: Sequence[UnifiedArticle], metadata: Mapping[str, Any]) -> bool:
+        """
+        Store a ranked result set.
+
+        Articles are copied into the shared article store, so later changes
+        to the caller's objects do not leak into cached results.
+
+        Args:
+            key: Result-set key
+            articles: Ranked articles, best first
+            metadata: Source metadata to return with the set on a hit
+
+        Returns:
+            True if stored; False when two articles share a canonical key.
+        """
+        article_keys = tuple(canonical_article_key(article) for article in articles)
+        if len(set(article_keys)) != len(article_keys):
+            return False
+        entry = CachedResultSet(
+            article_keys=article_keys,
+            scores=tuple(
+                (article.ranking_score, article.relevance_score, article.quality_score) for article in articles
+            ),
+            metadata=copy.deepcopy(dict(metadata)),
+        )
+        with self._lock:
+            self._articles.warmup(
+                [(article_key, copy.copy(article)) for article_key, article in zip(article_keys, articles)]
+            )
+            self._result_sets.set(key, entry)
+        return True
+
+    def invalidate(self, key: str) -> bool:
+        """Drop one cached result set; its articles stay in the article store."""
+        with self._lock:
+            return self._result_sets.invalidate(key)
+
+    def clear(self) -> int:
+        """
+        Clear all result sets and stored articles.
+
+        Returns:
+            Number of result sets cleared
+        """
+        with self._lock:
+            self._articles.clear()
+            return self._result_sets.clear()
+
+    def __len__(self) -> int:
+        """Get number of live cached result sets."""
+        with self._lock:
+            return len(self._result_sets.keys())
+
+
+# ==================== Singleton Factory ====================
+
+_result_set_cache: ResultSetCache | None = None
+_result_set_cache_lock = threading.RLock()
+
+
+def get_result_set_cache() -> ResultSetCache:
+    """
+    Get singleton result-set cache.
+
+    Returns:
+        Shared ResultSetCache instance
+    """
+    global _result_set_cache
+    with _result_set_cache_lock:
+        if _result_set_cache is None:
+            _result_set_cache = ResultSetCache()
+        return _result_set_cache
+
+
+def reset_result_set_cache() -> None:
+    """Reset singleton cache (for testing)."""
+    global _result_set_cache
+    with _result_set_cache_lock:
+        if _result_set_cache is not None:
+            _result_set_cache.clear()
+        _result_set_cache = None
+
+
+__all__ = [
+    "DEFAULT_MAX_ARTICLES",
+    "DEFAULT_MAX_RESULT_SETS",
+    "DEFAULT_RESULT_SET_TTL_SECONDS",
+    "CachedResultSet",
+    "ResultSetCache",
+    "get_result_set_cache",
+    "reset_result_set_cache",
+]
@@ -102,6 +102,7 @@ def run_entrez_callable(
     **kwargs: Any,
 ) -> Any:
     """Execute a Bio.Entrez callable with isolated runtime configuration."""
+    from pubmed_search.shared.http_cassette import get_active_cassette
 
     with _entrez_runtime_lock:
         snapshot = {
@@ -118,6 +119,9 @@ def run_entrez_callable(
         entrez_module.max_tries = 1
         entrez_module.sleep_between_tries = 0
         try:
+            cassette = get_active_cassette()
+            if cassette is not None:
+                return cassette.call_entrez(callable_obj, args, kwargs)
             return callable_obj(*args, **kwargs)
         finally:
             for attr, value in snapshot.items():
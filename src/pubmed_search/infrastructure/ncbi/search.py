@@ -204,88 +204,21 @@ class SearchMixin:
             elif strategy == SearchStrategy.AGENT_DECIDED.value:
                 sort_param = "relevance"
 
-            # Construct advanced query
-            full_query = query
-
-            # Date range handling - prefer precise dates over year-only
-            if date_from or date_to:
-                # Use precise date format: YYYY/MM/DD
-                # date_type: edat (Entrez date), pdat (Publication date), mdat (Modification date)
-                start_date = date_from or "1900/01/01"
-                end_date = date_to or "3000/12/31"
-                date_range = f"{start_date}:{end_date}[{date_type}]"
-                full_query += f" AND {date_range}"
-            elif min_year or max_year:
-                # Legacy year-only format
-                date_range = f"{min_year or 1900}/01/01:{max_year or 3000}/12/31[dp]"
-                full_query += f" AND {date_range}"
-
-            if article_type:
-                full_query += f' AND "{article_type}"[pt]'
-
-            # === Advanced Filters (Phase 2.1) ===
-
-            # Age group filter
-            if age_group:
-                age_key = age_group.lower().replace(" ", "_").replace("-", "_")
-                if age_key in AGE_GROUP_FILTERS:
-                    full_query += f" AND {AGE_GROUP_FILTERS[age_key]}"
-                else:
-                    logger.warning(
-                        f"Unknown age_group: {age_group}. Valid options: {', '.join(AGE_GROUP_FILTERS.keys())}"
-                    )
-
-            # Sex filter
-            if sex:
-                sex_key = sex.lower()
-                if sex_key in SEX_FILTERS:
-                    full_query += f" AND {SEX_FILTERS[sex_key]}"
-                else:
-                    logger.warning(f"Unknown sex: {sex}. Valid options: male, female")
-
-            # Species filter
-            if species:
-                species_key = species.lower()
-                if species_key in SPECIES_FILTERS:
-                    full_query += f" AND {SPECIES_FILTERS[species_key]}"
-                else:
-                    logger.warning(f"Unknown species: {species}. Valid options: humans, animals")
-
-            # Language filter
-            if language:
-                lang_key = language.lower()
-                if lang_key in LANGUAGE_FILTERS:
-                    full_query += f" AND {LANGUAGE_FILTERS[lang_key]}"
-                else:
-                    # Try direct language code (e.g., "eng", "chi")
-                    full_query += f" AND {lang_key}[la]"
-                    logger.info(f"Using direct language code: {lang_key}[la]")
-
-            # Clinical query filter (validated PubMed search strategies)
-            if clinical_query:
-                cq_key = clinical_query.lower().replace(" ", "_").replace("-", "_")
-                if cq_key in CLINICAL_QUERY_FILTERS:
-                    full_query += f" AND {CLINICAL_QUERY_FILTERS[cq_key]}"
-                else:
-                    logger.warning(
-                        f"Unknown clinical_query: {clinical_query}. "
-                        f"Valid options: {', '.join(CLINICAL_QUERY_FILTERS.keys())}"
-                    )
-
-            # Pre-flight query validation
-            from pubmed_search.application.search.query_validator import (
-                validate_query,
+            full_query = self._compose_search_query(
+                query,
+                min_year=min_year,
+                max_year=max_year,
+                article_type=article_type,
+                date_from=date_from,
+                date_to=date_to,
+                date_type=date_type,
+                age_group=age_group,
+                sex=sex,
+                species=species,
+                language=language,
+                clinical_query=clinical_query,
             )
 
-            validation = validate_query(full_query)
-            if not validation.is_valid:
-                logger.warning("PubMed query syntax validation found %s issue(s)", len(validation.errors))
-                if validation.corrected_query:
-                    logger.info("Applied PubMed query syntax correction")
-                    full_query = validation.corrected_query
-            elif validation.has_warnings:
-                logger.debug("PubMed query syntax validation found %s warning(s)", len(validation.warnings))
-
             # Step 1: Search for IDs with retry (usehistory=y for large requests)
             executed_query = full_query
             query_executed = True
@@ -335,6 +268,148 @@ class SearchMixin:
                 }
             ]
 
+    async def search_count(
+        self,
+        query: str,
+        min_year: int | None = None,
+        max_year: int | None = None,
+        *,
+        age_group: str | None = None,
+        sex: str | None = None,
+        species: str | None = None,
+        language: str | None = None,
+        clinical_query: str | None = None,
+    ) -> int:
+        """
+        Count PubMed matches without fetching any records (ESearch, retmax=0).
+
+        The query is composed exactly like :meth:`search`, so a count predicts
+        whether the same search would return articles.
+
+        Args:
+            query: Search query string.
+            min_year: Minimum publication year.
+            max_year: Maximum publication year.
+            age_group, sex, species, language, clinical_query: Same filters as :meth:`search`.
+
+        Returns:
+            Total number of matching PubMed records.
+
+        Raises:
+            Exception: The ESearch failure, after retries (unlike :meth:`search`,
+                errors are not folded into the return value).
+        """
+        full_query = self._compose_search_query(
+            query,
+            min_year=min_year,
+            max_year=max_year,
+            age_group=age_group,
+            sex=sex,
+            species=species,
+            language=language,
+            clinical_query=clinical_query,
+        )
+        _id_list, total_count, _webenv, _query_key = await self._search_ids_with_retry(full_query, 0, "relevance")
+        return total_count
+
+    def _compose_search_query(
+        self,
+        query: str,
+        *,
+        min_year: int | None = None,
+        max_year: int | None = None,
+        article_type: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        date_type: str = "edat",
+        age_group: str | None = None,
+        sex: str | None = None,
+        species: str | None = None,
+        language: str | None = None,
+        clinical_query: str | None = None,
+    ) -> str:
+        """Append date and advanced filters to *query* and apply syntax correction."""
+        # Construct advanced query
+        full_query = query
+
+        # Date range handling - prefer precise dates over year-only
+        if date_from or date_to:
+            # Use precise date format: YYYY/MM/DD
+            # date_type: edat (Entrez date), pdat (Publication date), mdat (Modification date)
+            start_date = date_from or "1900/01/01"
+            end_date = date_to or "3000/12/31"
+            date_range = f"{start_date}:{end_date}[{date_type}]"
+            full_query += f" AND {date_range}"
+        elif min_year or max_year:
+            # Legacy year-only format
+            date_range = f"{min_year or 1900}/01/01:{max_year or 3000}/12/31[dp]"
+            full_query += f" AND {date_range}"
+
+        if article_type:
+            full_query += f' AND "{article_type}"[pt]'
+
+        # === Advanced Filters (Phase 2.1) ===
+
+        # Age group filter
+        if age_group:
+            age_key = age_group.lower().replace(" ", "_").replace("-", "_")
+            if age_key in AGE_GROUP_FILTERS:
+                full_query += f" AND {AGE_GROUP_FILTERS[age_key]}"
+            else:
+                logger.warning(f"Unknown age_group: {age_group}. Valid options: {', '.join(AGE_GROUP_FILTERS.keys())}")
+
+        # Sex filter
+        if sex:
+            sex_key = sex.lower()
+            if sex_key in SEX_FILTERS:
+                full_query += f" AND {SEX_FILTERS[sex_key]}"
+            else:
+                logger.warning(f"Unknown sex: {sex}. Valid options: male, female")
+
+        # Species filter
+        if species:
+            species_key = species.lower()
+            if species_key in SPECIES_FILTERS:
+                full_query += f" AND {SPECIES_FILTERS[species_key]}"
+            else:
+                logger.warning(f"Unknown species: {species}. Valid options: humans, animals")
+
+        # Language filter
+        if language:
+            lang_key = language.lower()
+            if lang_key in LANGUAGE_FILTERS:
+                full_query += f" AND {LANGUAGE_FILTERS[lang_key]}"
+            else:
+                # Try direct language code (e.g., "eng", "chi")
+                full_query += f" AND {lang_key}[la]"
+                logger.info(f"Using direct language code: {lang_key}[la]")
+
+        # Clinical query filter (validated PubMed search strategies)
+        if clinical_query:
+            cq_key = clinical_query.lower().replace(" ", "_").replace("-", "_")
+            if cq_key in CLINICAL_QUERY_FILTERS:
+                full_query += f" AND {CLINICAL_QUERY_FILTERS[cq_key]}"
+            else:
+                logger.warning(
+                    f"Unknown clinical_query: {clinical_query}. "
+                    f"Valid options: {', '.join(CLINICAL_QUERY_FILTERS.keys())}"
+                )
+
+        # Pre-flight query validation
+        from pubmed_search.application.search.query_validator import (
+            validate_query,
+        )
+
+        validation = validate_query(full_query)
+        if not validation.is_valid:
+            logger.warning("PubMed query syntax validation found %s issue(s)", len(validation.errors))
+            if validation.corrected_query:
+                logger.info("Applied PubMed query syntax correction")
+                full_query = validation.corrected_query
+        elif validation.has_warnings:
+            logger.debug("PubMed query syntax validation found %s warning(s)", len(validation.warnings))
+        return full_query
+
     async def _search_ids_with_retry(self, query: str, retmax: int, sort: str) -> tuple:
         """Search for PubMed IDs using History Server by default.
 
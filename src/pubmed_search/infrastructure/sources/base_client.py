@@ -4,7 +4,8 @@ Base API Client - Common HTTP request pattern with retry, rate limiting, and cir
 Eliminates duplicated _make_request() across 8 source clients by providing
 a reusable base class with:
 - Automatic retry on 429 (rate limit) with Retry-After support
-- Rate limiting (configurable interval between requests)
+- Rate limiting (configurable interval between requests), slowed further as
+  provider quota headers report a draining budget
 - Circuit breaker for fault tolerance
 - Consistent error handling and logging
 """
@@ -29,6 +30,7 @@ from pubmed_search.shared.async_utils import (
     get_transport_kernel,
     parse_retry_after,
 )
+from pubmed_search.shared.rate_limit_headers import parse_quota_headers, quota_pacing_interval
 from pubmed_search.shared.source_contracts import SourceExecutionSettings, build_request_execution_policy
 
 logger = logging.getLogger(__name__)
@@ -122,8 +124,19 @@ class BaseAPIClient:
         )
         # Fault tolerance stays per instance: an open breaker must not stop
         # unrelated callers, and the shared rate limiter above is what keeps us
-        # inside the upstream budget.
-        self._circuit_breaker = circuit_breaker or CircuitBreaker(failure_threshold=10, recovery_timeout=60.0)
+        # inside the upstream budget. The breaker is still named after the
+        # upstream so operators can inspect it, and when the shared breaker
+        # store is enabled, workers learn about an outage from each other.
+        if circuit_breaker is None:
+            from pubmed_search.shared.circuit_breaker_store import get_circuit_breaker_store
+
+            circuit_breaker = CircuitBreaker(
+                failure_threshold=10,
+                recovery_timeout=60.0,
+                name=self._rate_limiter_name,
+                store=get_circuit_breaker_store(),
+            )
+        self._circuit_breaker = circuit_breaker
         self._transport_kernel = get_transport_kernel()
         self._last_retryable_error: ContextVar[RetryableOperationError | None] = ContextVar(
             f"{self._service_name.lower().replace(' ', '_')}_last_retryable_error_{id(self)}",
@@ -233,15 +246,14 @@ class BaseAPIClient:
                 params=params,
                 headers=headers,
             )
-            self._last_rate_limit_headers.set(
-                {
-                    key.lower(): value
-                    for key, value in response.headers.items()
-                    if key.lower() == "retry-after"
-                    or key.lower().startswith("x-ratelimit-")
-                    or key.lower().startswith("ratelimit-")
-                }
-            )
+            rate_limit_headers = {
+                key.lower(): value
+                for key, value in response.headers.items()
+                if key.lower() == "retry-after"
+                or key.lower().startswith(("x-ratelimit-", "ratelimit-", "x-rate-limit-"))
+            }
+            self._last_rate_limit_headers.set(rate_limit_headers)
+            await self._pace_from_quota_headers(policy, rate_limit_headers)
 
             expected = self._handle_expected_status(response, full_url)
             if expected is not _CONTINUE:
@@ -326,6 +338,37 @@ class BaseAPIClient:
             error,
         )
 
+    @staticmethod
+    async def _pace_from_quota_headers(policy: RequestExecutionPolicy, headers: dict[str, str]) -> None:
+        """Slow the shared limiter as the provider's advertised quota drains.
+
+        An exhausted quota becomes a bounded cooldown until it resets, like an
+        exhausted 429 does. A low quota spreads the remaining requests over the
+        time left, so we slow down before the provider starts refusing us.
+        """
+        if policy.rate_limit is None or not headers:
+            return
+        snapshot = parse_quota_headers(headers)
+        if snapshot is None:
+            return
+
+        limiter = get_rate_limiter(
+            policy.rate_limit.name,
+            rate=policy.rate_limit.rate,
+            per=policy.rate_limit.per,
+            conservative=True,
+        )
+        if snapshot.remaining is not None and snapshot.remaining <= 0 and snapshot.reset_after:
+            await limiter.apply_cooldown(min(snapshot.reset_after, policy.retry.retry_after_cap))
+            return
+
+        pacing = quota_pacing_interval(snapshot, base_interval=limiter.per / limiter.rate)
+        if pacing is None:
+            limiter.set_quota_pacing(0.0, 0.0)
+            return
+        interval, duration = pacing
+        limiter.set_quota_pacing(min(interval, policy.retry.retry_after_cap), duration)
+
     @staticmethod
     async def _apply_rate_limit_cooldown(policy: RequestExecutionPolicy, cooldown: float) -> None:
         """Apply a bounded cooldown to the shared limiter after exhausted 429s."""
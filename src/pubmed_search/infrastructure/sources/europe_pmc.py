@@ -55,18 +55,19 @@ class EuropePMCClient(BaseAPIClient):
 
     _service_name = "Europe PMC"
 
-    def __init__(self, email: str | None = None, timeout: float = 30.0):
+    def __init__(self, email: str | None = None, timeout: float = 30.0, min_interval: float = 0.1):
         """
         Initialize client.
 
         Args:
             email: Contact email (for good citizenship)
             timeout: Request timeout in seconds
+            min_interval: Minimum seconds between requests (rate limiting)
         """
         self._email = email or DEFAULT_EMAIL
         super().__init__(
             timeout=timeout,
-            min_interval=0.1,
+            min_interval=min_interval,
             headers={
                 "User-Agent": f"pubmed-search-mcp/1.0 (mailto:{self._email})",
                 "Accept": "application/json",
@@ -22,7 +22,12 @@ from functools import partial
 from typing import TYPE_CHECKING, Any, Literal
 from urllib.parse import urlparse
 
-from pubmed_search.shared.async_utils import RequestExecutionPolicy, create_async_http_client, get_transport_kernel
+from pubmed_search.shared.async_utils import (
+    RequestExecutionPolicy,
+    cap_to_request_deadline,
+    create_async_http_client,
+    get_transport_kernel,
+)
 from pubmed_search.shared.source_contracts import (
     SourceAdapterCall,
     SourceExecutionSettings,
@@ -107,9 +112,8 @@ class FulltextDownloader:
 
     @staticmethod
     def _build_deadline(total_timeout: float | None) -> float | None:
-        if total_timeout is None:
-            return None
-        return time.monotonic() + total_timeout
+        own = None if total_timeout is None else time.monotonic() + total_timeout
+        return cap_to_request_deadline(own)
 
     @staticmethod
     def _remaining_budget(deadline: float | None) -> float | None:
@@ -158,6 +158,7 @@ def _mount_auxiliary_routes(
                         "cached_article": "/api/cached_article/{pmid}",
                         "cached_articles": "/api/cached_articles?pmids=...",
                         "session_summary": "/api/session/summary",
+                        "circuit_breakers": "/api/circuit_breakers",
                     },
                     "utility": {
                         "info": "/info",
@@ -284,6 +285,14 @@ def _mount_auxiliary_routes(
             return JSONResponse({"detail": outcome.detail}, status_code=outcome.status_code)
         return JSONResponse(guard.session_manager_for(outcome.identity).get_session_summary())
 
+    async def api_circuit_breakers(request: Any) -> Any:
+        outcome = await guard.authenticate(request)
+        if outcome.identity is None:
+            return JSONResponse({"detail": outcome.detail}, status_code=outcome.status_code)
+        from pubmed_search.shared.async_utils import circuit_breaker_states
+
+        return JSONResponse({"circuit_breakers": circuit_breaker_states()})
+
     app.router.routes[:0] = [
         StarletteRoute("/", info),
         StarletteRoute("/info", info),
@@ -296,6 +305,7 @@ def _mount_auxiliary_routes(
         StarletteRoute("/api/cached_article/{pmid}", api_get_cached_article),
         StarletteRoute("/api/cached_articles", api_get_multiple_articles),
         StarletteRoute("/api/session/summary", api_session_summary),
+        StarletteRoute("/api/circuit_breakers", api_circuit_breakers),
     ]
     app.add_middleware(TransportSecurityASGIMiddleware, settings=transport_security)
 
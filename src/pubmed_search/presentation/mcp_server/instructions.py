@@ -361,6 +361,7 @@ search_clinvar("BRCA1", limit=10)
 
 ### 搜尋工具
 - unified_search: Unified Search - Single entry point for multi-source academic search.
+- unified_search_batch: Run several unified_search query variants as one batch.
 
 ### 查詢智能
 - parse_pico: Validate agent-provided PICO elements and return a runnable search plan.
@@ -0,0 +1,49 @@
+"""Bound every MCP tool call with a request-scoped deadline.
+
+Each layer below a tool has its own timeout (per-source search timeouts,
+adapter ``per_call_timeout`` values, transport ``total_timeout`` budgets and
+fulltext downloader deadlines). None of them know when the MCP request that
+started the work has given up. This middleware sets one deadline in a
+contextvar at the tool entry point. The transport kernel, ``gather_with_errors``,
+``batch_process``, source adapter fan-out and the fulltext downloader all cap
+their own budgets to it. As a result, no retry or backoff is scheduled past it,
+and parallel work still running at the deadline is cancelled.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from pubmed_search.shared.async_utils import request_deadline
+
+if TYPE_CHECKING:
+    from mcp.server.context import CallNext, HandlerResult, ServerRequestContext
+
+logger = logging.getLogger(__name__)
+
+#: Only tool invocations start upstream work worth bounding.
+TOOL_CALL_METHOD = "tools/call"
+
+
+def build_request_deadline_middleware(timeout_seconds: float) -> Any:
+    """Build server middleware that scopes a deadline around each tool call.
+
+    Args:
+        timeout_seconds: End-to-end budget for one tool call. Values ``<= 0``
+            disable the deadline.
+
+    Returns:
+        A middleware callable suitable for ``MCPServer(middleware=[...])``.
+    """
+
+    async def request_deadline_middleware(ctx: ServerRequestContext[Any, Any], call_next: CallNext) -> HandlerResult:
+        if timeout_seconds <= 0 or getattr(ctx, "method", None) != TOOL_CALL_METHOD:
+            return await call_next(ctx)
+        with request_deadline(timeout_seconds):
+            return await call_next(ctx)
+
+    return request_deadline_middleware
+
+
+__all__ = ["TOOL_CALL_METHOD", "build_request_deadline_middleware"]
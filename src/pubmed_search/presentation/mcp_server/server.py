@@ -39,6 +39,7 @@ from pubmed_search.shared.settings import DEFAULT_DATA_DIR, DEFAULT_EMAIL, load_
 from .auth import build_auth
 from .http_security import is_allowed_host, is_allowed_origin
 from .instructions import SERVER_INSTRUCTIONS
+from .request_deadline import build_request_deadline_middleware
 from .tenancy import build_tenancy_middleware
 from .tool_registry import register_all_mcp_tools
 from .tools._common import get_session_manager, set_session_registry
@@ -330,7 +331,7 @@ def create_server(
         lifespan=_make_lifespan(_container),
         token_verifier=token_verifier,
         auth=auth_settings,
-        middleware=[tenancy_middleware],
+        middleware=[tenancy_middleware, build_request_deadline_middleware(settings.tool_deadline_seconds)],
     )
     setattr(
         mcp,
@@ -487,6 +488,13 @@ def start_http_api_background(session_manager, searcher, port: int = 8765):
                 self._send_json(session_manager.get_session_summary())
                 return
 
+            # Circuit breaker states (this process + shared store)
+            if path == "/api/circuit_breakers":
+                from pubmed_search.shared.async_utils import circuit_breaker_states
+
+                self._send_json({"circuit_breakers": circuit_breaker_states()})
+                return
+
             # Root - API info
             if path in {"/", ""}:
                 self._send_json(
@@ -498,6 +506,7 @@ def start_http_api_background(session_manager, searcher, port: int = 8765):
                             "/api/cached_article/{pmid}": "Read cached article",
                             "/api/cached_articles?pmids=...": "Read multiple cached articles",
                             "/api/session/summary": "Read current session summary",
+                            "/api/circuit_breakers": "Inspect upstream circuit breaker states",
                         },
                     }
                 )
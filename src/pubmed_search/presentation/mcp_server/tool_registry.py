@@ -104,6 +104,7 @@ TOOL_CATEGORIES: dict[str, dict[str, Any]] = {
         "description": "Unified multi-source literature search gateway",
         "tools": [
             "unified_search",
+            "unified_search_batch",
             # Note: search_literature, search_europe_pmc, search_core 已整合到 unified_search
         ],
     },
@@ -9,15 +9,34 @@ Maintenance:
     Keep schema-like payload shaping here so individual tools do not drift in
     their structured output contracts. When adding a new shared field, update
     these helpers first and let formatters consume the new contract.
+
+JSON encoding:
+    JSON output uses ``orjson`` when it is installed (``pip install orjson``)
+    and the standard library otherwise; both produce the same
+    two-space-indented layout. Large lists such as ranked
+    articles can be passed as a ``PreEncodedArray`` of per-item fragments
+    (see ``encode_json_fragment``), which are spliced into the response text
+    instead of being re-encoded. Size-capped responses are measured and
+    assembled from top-level entries (``encode_json_entry``,
+    ``json_object_length``, ``join_json_entries``) so that fallbacks reuse
+    the already encoded parts.
 """
 
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
+    from types import ModuleType
+
+# Indentation of the items of an array stored under a top-level payload key.
+_TOP_LEVEL_ITEM_INDENT = "    "
+
+_orjson: ModuleType | None = None
+_orjson_checked = False
 
 
 class SourceCountRow(TypedDict):
@@ -64,20 +83,124 @@ def is_structured_output_format(value: OutputFormat | str | None) -> bool:
     ) in {"json", "toon"}
 
 
+def _load_orjson() -> ModuleType | None:
+    """Import orjson on first use (it is an optional dependency)."""
+    global _orjson, _orjson_checked
+    if not _orjson_checked:
+        try:
+            import orjson
+        except ImportError:
+            _orjson = None
+        else:
+            _orjson = orjson
+        _orjson_checked = True
+    return _orjson
+
+
+def dumps_json(value: Any) -> str:
+    """Encode *value* as two-space-indented JSON, with orjson when available."""
+    orjson = _load_orjson()
+    if orjson is not None:
+        try:
+            return str(orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode())
+        except TypeError:
+            pass  # Values orjson rejects (e.g. integers beyond 64 bits) take the stdlib path
+    return json.dumps(value, ensure_ascii=False, indent=2)
+
+
+def encode_json_fragment(value: Any) -> str:
+    """Encode one item of a top-level ``PreEncodedArray`` at its final indentation."""
+    return dumps_json(value).replace("\n", "\n" + _TOP_LEVEL_ITEM_INDENT)
+
+
+@dataclass(frozen=True, slots=True)
+class PreEncodedArray:
+    """A JSON array under a top-level payload key whose items are already encoded.
+
+    Each fragment must come from ``encode_json_fragment``. JSON serialization
+    splices the fragments in verbatim; TOON decodes them first.
+    """
+
+    fragments: Sequence[str]
+
+    def decode(self) -> list[Any]:
+        """The array items as Python values."""
+        return [json.loads(fragment) for fragment in self.fragments]
+
+    def encoded_length(self) -> int:
+        """Length of the spliced array text, computed from the fragment lengths."""
+        if not self.fragments:
+            return 2
+        return sum(map(len, self.fragments)) + (2 + len(_TOP_LEVEL_ITEM_INDENT)) * len(self.fragments) + 4
+
+
+def _pre_encoded_array_text(array: PreEncodedArray) -> str:
+    if not array.fragments:
+        return "[]"
+    separator = ",\n" + _TOP_LEVEL_ITEM_INDENT
+    return "[\n" + _TOP_LEVEL_ITEM_INDENT + separator.join(array.fragments) + "\n  ]"
+
+
+def _json_entry_prefix(key: Any) -> str:
+    return dumps_json({key: None})[4:-6]
+
+
+def encode_json_entry(key: Any, value: Any) -> str:
+    """Encode ``"key": value`` as it appears at the top level of a serialized payload.
+
+    Entries can be measured and combined with ``join_json_entries`` without
+    re-encoding the values.
+    """
+    if isinstance(value, PreEncodedArray):
+        return _json_entry_prefix(key) + _pre_encoded_array_text(value)
+    return dumps_json({key: value})[4:-2]
+
+
+def pre_encoded_entry_length(key: Any, value: PreEncodedArray) -> int:
+    """``len(encode_json_entry(key, value))`` without splicing the fragments."""
+    return len(_json_entry_prefix(key)) + value.encoded_length()
+
+
+def join_json_entries(entries: Sequence[str]) -> str:
+    """The JSON object text made of top-level entries from ``encode_json_entry``."""
+    if not entries:
+        return "{}"
+    return "{\n  " + ",\n  ".join(entries) + "\n}"
+
+
+def json_object_length(entry_lengths: Sequence[int]) -> int:
+    """``len(join_json_entries(entries))`` from the lengths of the entries."""
+    if not entry_lengths:
+        return 2
+    return sum(entry_lengths) + 4 * len(entry_lengths) + 2
+
+
 def serialize_structured_payload(
     payload: Any,
     output_format: OutputFormat | StructuredOutputFormat | str = "json",
 ) -> str:
-    """Serialize a structured payload as JSON or TOON."""
+    """Serialize a structured payload as JSON or TOON.
+
+    Top-level ``PreEncodedArray`` values are spliced into JSON output as-is.
+    """
+    arrays = (
+        {key: value for key, value in payload.items() if isinstance(value, PreEncodedArray)}
+        if isinstance(payload, dict)
+        else {}
+    )
     normalized = preferred_structured_output_format(output_format)
     if normalized == "toon":
         try:
             import toons
         except ImportError as exc:  # pragma: no cover - guarded by runtime dependency
             raise RuntimeError("TOON output requested but the 'toons' package is not installed") from exc
+        if arrays:
+            payload = {key: arrays[key].decode() if key in arrays else value for key, value in payload.items()}
         return toons.dumps(payload)
 
-    return json.dumps(payload, ensure_ascii=False, indent=2)
+    if arrays:
+        return join_json_entries([encode_json_entry(key, value) for key, value in payload.items()])
+    return dumps_json(payload)
 
 
 def make_source_count_row(
@@ -302,6 +302,12 @@ class SearchRunJournal:
             str(error.get("source")): error for error in errors if isinstance(error, dict) and error.get("source")
         }
         sources = list(dict.fromkeys([*counts, *statuses, *metadata_by_source, *errors_by_source]))
+        # Sources pruned by a latency budget were never called; they have no attempt to record.
+        sources = [
+            source
+            for source in sources
+            if dict(dict(metadata_by_source.get(source) or {}).get("dispatch") or {}).get("decision") != "pruned"
+        ]
 
         for source in sources:
             returned, available = counts.get(source, (0, None))
@@ -316,6 +322,9 @@ class SearchRunJournal:
                 physical_query = None
             error_payload = errors_by_source.get(source)
             status = str((error_payload or {}).get("status") or statuses.get(source) or "error")
+            if status == "cancelled_early":
+                # Stopped by an early return; metadata["cancelled_early"] keeps the reason.
+                status = "cancelled"
             try:
                 await asyncio.to_thread(
                     self.manager.record_search_source_attempt,
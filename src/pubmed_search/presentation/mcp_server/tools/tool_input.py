@@ -13,6 +13,7 @@ Maintenance:
 
 from __future__ import annotations
 
+import json
 import logging
 import re
 from typing import Any, Union
@@ -164,6 +165,34 @@ class InputNormalizer:
 
         return query
 
+    @staticmethod
+    def normalize_query_list(value: Union[str, list, tuple, None]) -> list[str]:
+        """Normalize a list of queries (or a JSON array / newline-separated string), dropping blanks and repeats."""
+        if value is None:
+            return []
+
+        if isinstance(value, str):
+            stripped = value.strip()
+            if stripped.startswith("["):
+                try:
+                    parsed = json.loads(stripped)
+                except ValueError:
+                    parsed = None
+                if isinstance(parsed, list):
+                    return InputNormalizer.normalize_query_list(parsed)
+            items: list[Any] = stripped.splitlines()
+        elif isinstance(value, (list, tuple)):
+            items = list(value)
+        else:
+            return []
+
+        queries: dict[str, str] = {}
+        for item in items:
+            query = InputNormalizer.normalize_query(item) if isinstance(item, str) else ""
+            if query:
+                queries.setdefault(query.casefold(), query)
+        return list(queries.values())
+
     @staticmethod
     def normalize_doi(value: Union[str, None]) -> str | None:
         if value is None:
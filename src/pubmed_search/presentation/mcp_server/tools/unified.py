@@ -44,6 +44,7 @@ from pubmed_search.infrastructure.sources.registry import get_source_registry
 
 from .tool_input import InputNormalizer
 from .tool_response import ResponseFormatter
+from .unified_batch import run_unified_search_batch
 from .unified_enrichment import (
     _enrich_with_api_similarity,
     _enrich_with_crossref,
@@ -179,6 +180,7 @@ def register_unified_search_tools(mcp: MCPServer, searcher: LiteratureSearcher):
         pipeline: Union[str, None] = None,
         dry_run: bool = False,
         stop_at: str = "",
+        cursor: str = "",
         ctx: Context | None = None,
     ) -> str:
         """
@@ -305,6 +307,27 @@ def register_unified_search_tools(mcp: MCPServer, searcher: LiteratureSearcher):
                        systematic     → use deterministic bulk/cursor retrieval where
                                          supported (for example S2 and OpenAlex)
                        shallow        → disable deep search (faster, keyword-only)
+                       no_cache       → bypass the result-set cache; repeated
+                                        identical searches within 10 minutes
+                                        otherwise reuse the cached ranking
+                       latency_budget_ms=N → skip auto-selected sources whose
+                                        live p95 latency exceeds N ms, put
+                                        low-unique-yield sources last (with
+                                        early_return they start after the rest
+                                        and are skipped if results suffice), and
+                                        cap each source call at N ms; decisions
+                                        are reported per source in source_metadata
+                       early_return   → once merged results exceed the limit by half
+                                        and the pending sources historically add
+                                        few unique articles, cancel them (status
+                                        cancelled_early) and rank what arrived;
+                                        ignored with systematic; deep searches
+                                        report search_status.early_return =
+                                        "not_applied_deep_search"
+                       speculative_relax=K → when 0 results trigger auto-
+                                        relaxation, count the first K (2-6)
+                                        levels concurrently and fetch records
+                                        only for the least-relaxed level with hits
                      `native_semantic` and `systematic` are mutually exclusive
                      and automatically disable multi-strategy query expansion.
                      Example: "preprints, shallow" or "no_analysis, no_scores"
@@ -385,6 +408,14 @@ def register_unified_search_tools(mcp: MCPServer, searcher: LiteratureSearcher):
                        metrics     — enrich with iCite citation metrics (inputs only)
                        merge       — combine results (params: method=union|intersection|rrf)
                        filter      — post-filter (params: min_year, max_year, article_types, min_citations, has_abstract)
+            cursor: Opaque next_cursor from a previous response (JSON/TOON
+                    `search_status.page.next_cursor`, or the Markdown
+                    "More results" note). Serves the next page of that
+                    search's ranked candidates with no new source calls;
+                    `limit` sets the page size, `options`/`output_format`
+                    control presentation, and the other search parameters
+                    are ignored. Expired cursors return an error asking to
+                    re-run the search.
 
         Returns:
             Formatted search results with:
@@ -409,6 +440,7 @@ def register_unified_search_tools(mcp: MCPServer, searcher: LiteratureSearcher):
             pipeline=pipeline,
             dry_run=dry_run,
             stop_at=stop_at,
+            cursor=cursor,
             ctx=ctx,
             analyzer_factory=QueryAnalyzer,
             enhancer_factory=get_semantic_enhancer,
@@ -522,6 +554,60 @@ def register_unified_search_tools(mcp: MCPServer, searcher: LiteratureSearcher):
             },
         )
 
+    @mcp.tool()
+    async def unified_search_batch(
+        queries: Union[list[str], str],
+        limit: Union[int, str] = 10,
+        sources: Union[str, None] = None,
+        ranking: Literal["balanced", "impact", "recency", "quality"] = "balanced",
+        output_format: Literal["markdown", "json", "toon"] = "markdown",
+        filters: Union[str, None] = None,
+        options: Union[str, None] = None,
+        ctx: Context | None = None,
+    ) -> str:
+        """
+        Run several unified_search query variants as one batch.
+
+        Use after generate_search_queries or parse_pico instead of 5-10
+        separate unified_search calls. All variants share one provider
+        concurrency budget, articles found by several variants are
+        deduplicated before enrichment, and each unique article is enriched
+        (CrossRef, journal metrics, Unpaywall) only once.
+
+        Example:
+            unified_search_batch(queries=[
+                "remimazolam ICU sedation",
+                "remimazolam AND propofol AND critical care",
+            ], limit=20)
+
+        Args:
+            queries: 1-10 query variants (list, JSON array, or one per line).
+                     Repeated queries are searched once.
+            limit: Results per variant and in the fused list (default 10, max 100)
+            sources: Sources for every variant, as in unified_search
+            ranking: Ranking strategy for every variant, as in unified_search
+            output_format: "markdown", "json", or "toon"
+            filters: Filters for every variant, as in unified_search
+            options: Options for every variant, as in unified_search
+                     (`no_cache` has no effect: batches are not cached)
+
+        Returns:
+            A fused ranking of all variants (reciprocal rank fusion), with the
+            rank of each article in every variant, followed by each variant's
+            own ranked list and source status.
+        """
+        return await run_unified_search_batch(
+            searcher=searcher,
+            queries=queries,
+            limit=limit,
+            sources=sources,
+            ranking=ranking,
+            output_format=output_format,
+            filters=filters,
+            options=options,
+            ctx=ctx,
+        )
+
     @mcp.tool()
     async def analyze_search_query(query: str) -> str:
         """
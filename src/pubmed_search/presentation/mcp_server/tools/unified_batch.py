@@ -0,0 +1,393 @@
+"""Batch execution of unified_search query variants.
+
+Design:
+    Agents often follow generate_search_queries or parse_pico with several
+    unified_search calls whose results overlap heavily. A batch plans every
+    variant exactly like a single search, then:
+
+    1. retrieves all variants concurrently, drawing every provider call from
+       one shared concurrency budget;
+    2. deduplicates the candidates across variants
+       (``ResultAggregator.aggregate_across``), so an article found by several
+       variants is a single object;
+    3. runs each enrichment pass (CrossRef, journal metrics, Unpaywall) once,
+       over the unique articles of the variants whose plan asks for it;
+    4. filters and ranks each variant with its own plan, and fuses the
+       per-variant rankings with ``reciprocal_rank_fusion``.
+
+Maintenance:
+    Reuse the single-search stages of unified_execution.py instead of copying
+    them, so a variant ranks the way the same query would on its own. Ranking
+    writes scores onto articles, so each variant ranks its own shallow copies
+    of the shared articles. Batches bypass the result-set cache and the
+    search-run journal.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal, Union
+
+from pubmed_search.application.search.query_analyzer import QueryAnalyzer
+from pubmed_search.application.search.ranking_algorithms import reciprocal_rank_fusion
+from pubmed_search.application.search.result_aggregator import AggregationStats, ResultAggregator
+from pubmed_search.application.search.semantic_enhancer import get_semantic_enhancer
+from pubmed_search.infrastructure.sources.registry import SourceSelectionError, get_source_registry
+from pubmed_search.shared.article_identity import canonical_article_key
+
+from .agent_output import is_structured_output_format, serialize_structured_payload
+from .tool_input import InputNormalizer
+from .tool_response import ResponseFormatter
+from .tool_runtime import safe_report_progress
+from .unified_enrichment import _enrich_with_similarity_scores
+from .unified_execution import (
+    _enrich_candidates,
+    _filter_and_rank_candidates,
+    _planned_enrichments,
+    _retrieve_source_candidates,
+)
+from .unified_formatting import _compact_article_payload
+from .unified_planning import build_unified_search_plan
+from .unified_request import normalize_unified_search_request
+from .unified_runner import default_search_functions
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from mcp.server.mcpserver import Context
+
+    from pubmed_search.domain.entities.article import UnifiedArticle
+    from pubmed_search.infrastructure.ncbi import LiteratureSearcher
+
+    from .unified_execution import SearchRunner
+    from .unified_planning import ProgressReporter, UnifiedSearchPlan
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_QUERIES = 10
+DEFAULT_BATCH_CONCURRENCY = 6  # Provider calls in flight across all variants
+
+
+@dataclass
+class BatchVariantResult:
+    """Ranked results and source diagnostics of one query variant."""
+
+    plan: UnifiedSearchPlan
+    ranked: list[UnifiedArticle]
+    total_candidates: int
+    source_api_counts: dict[str, tuple[int, int | None]]
+    source_statuses: dict[str, str]
+    source_errors: list[dict[str, Any]]
+
+
+@dataclass
+class UnifiedSearchBatchResult:
+    """Per-variant rankings plus their reciprocal-rank fusion."""
+
+    variants: list[BatchVariantResult]
+    fused: list[UnifiedArticle]
+    # canonical article key -> 1-based rank in each variant (None = not ranked there)
+    variant_ranks: dict[str, list[int | None]]
+    stats: AggregationStats
+    enriched_articles: dict[str, int] = field(default_factory=dict)
+
+
+async def _no_progress(_current: float, _total: float, _message: str) -> None:
+    return None
+
+
+async def execute_unified_search_batch(
+    plans: list[UnifiedSearchPlan],
+    searcher: LiteratureSearcher,
+    *,
+    progress: ProgressReporter,
+    search_functions: Mapping[str, SearchRunner],
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    fused_limit: int | None = None,
+) -> UnifiedSearchBatchResult:
+    """Execute planned query variants with shared retrieval budget, deduplication and enrichment."""
+    # Slots are taken outside the latency measurement, so waiting for one
+    # is not recorded as provider latency.
+    budget = asyncio.Semaphore(max(1, max_concurrency))
+    aggregators = [ResultAggregator(plan.ranking_config) for plan in plans]
+
+    await progress(4, 10, f"Searching {len(plans)} query variants...")
+    outcomes = await asyncio.gather(
+        *(
+            _retrieve_source_candidates(
+                plan,
+                searcher,
+                aggregator,
+                progress=_no_progress,
+                search_functions=search_functions,
+                concurrency_budget=budget,
+            )
+            for plan, aggregator in zip(plans, aggregators)
+        )
+    )
+
+    await progress(5, 10, "Deduplicating across variants...")
+    _unique, variant_candidates, stats = ResultAggregator(plans[0].ranking_config).aggregate_across(
+        [outcome.ranked for outcome in outcomes]
+    )
+    logger.info("Batch aggregation: %s unique from %s candidates", stats.unique_articles, stats.total_input)
+
+    await progress(6, 10, "Enriching unique articles...")
+    articles_by_enrichment: dict[str, dict[int, UnifiedArticle]] = {}
+    for plan, candidates in zip(plans, variant_candidates):
+        for enrichment in _planned_enrichments(plan):
+            articles_by_enrichment.setdefault(enrichment, {}).update((id(article), article) for article in candidates)
+    await _enrich_candidates({name: list(articles.values()) for name, articles in articles_by_enrichment.items()})
+
+    await progress(8, 10, "Ranking variants...")
+    variants: list[BatchVariantResult] = []
+    dimension_rankings: dict[str, list[str]] = {}
+    fusion_pool: dict[str, UnifiedArticle] = {}
+    for index, (plan, aggregator, outcome, candidates) in enumerate(
+        zip(plans, aggregators, outcomes, variant_candidates)
+    ):
+        ranked, _unranked = _filter_and_rank_candidates(
+            plan, aggregator, [copy.copy(article) for article in candidates]
+        )
+        keys = [canonical_article_key(article) for article in ranked]
+        dimension_rankings[str(index)] = keys
+        for key, article in zip(keys, ranked):
+            fusion_pool.setdefault(key, article)
+        page = ranked[: plan.request.limit]
+        if plan.request.include_similarity_scores:
+            _enrich_with_similarity_scores(page, plan.query)
+        variants.append(
+            BatchVariantResult(
+                plan=plan,
+                ranked=page,
+                total_candidates=len(ranked),
+                source_api_counts=outcome.source_api_counts,
+                source_statuses=outcome.source_statuses,
+                source_errors=outcome.source_errors,
+            )
+        )
+
+    fused: list[UnifiedArticle] = []
+    if fusion_pool:
+        pool = [copy.copy(article) for article in fusion_pool.values()]
+        fusion = reciprocal_rank_fusion(pool, dimension_rankings, top_k=fused_limit)
+        max_score = max(fusion.rrf_scores.values())
+        for article in fusion.ranked_articles:
+            raw_score = fusion.rrf_scores.get(canonical_article_key(article), 0.0)
+            article.ranking_score = raw_score / max_score if max_score > 0 else 0.0
+            article.relevance_score = None
+            article.quality_score = None
+        fused = fusion.ranked_articles
+
+    rank_maps = [{key: rank for rank, key in enumerate(keys, 1)} for keys in dimension_rankings.values()]
+    variant_ranks: dict[str, list[int | None]] = {}
+    for article in fused:
+        key = canonical_article_key(article)
+        variant_ranks[key] = [rank_map.get(key) for rank_map in rank_maps]
+
+    return UnifiedSearchBatchResult(
+        variants=variants,
+        fused=fused,
+        variant_ranks=variant_ranks,
+        stats=stats,
+        enriched_articles={name: len(articles) for name, articles in articles_by_enrichment.items()},
+    )
+
+
+def _format_batch_payload(result: UnifiedSearchBatchResult, *, include_scores: bool) -> dict[str, Any]:
+    """Structured batch response: fused articles first, then each variant."""
+    fused_articles = []
+    for article in result.fused:
+        payload = _compact_article_payload(article, include_scores=include_scores)
+        payload["variant_ranks"] = result.variant_ranks.get(canonical_article_key(article), [])
+        fused_articles.append(payload)
+    return {
+        "tool": "unified_search_batch",
+        "fusion": {"method": "reciprocal_rank_fusion", "variants": len(result.variants)},
+        "articles": fused_articles,
+        "variants": [
+            {
+                "query": variant.plan.request.query,
+                "sources": list(variant.source_api_counts),
+                "source_statuses": variant.source_statuses,
+                "source_errors": variant.source_errors,
+                "total_candidates": variant.total_candidates,
+                "articles": [
+                    _compact_article_payload(article, include_scores=include_scores) for article in variant.ranked
+                ],
+            }
+            for variant in result.variants
+        ],
+        "batch_stats": {
+            "total_input": result.stats.total_input,
+            "unique_articles": result.stats.unique_articles,
+            "cross_variant_duplicates": result.stats.duplicates_removed,
+            "enriched_articles": result.enriched_articles,
+        },
+    }
+
+
+def _format_batch_markdown(result: UnifiedSearchBatchResult) -> str:
+    """Markdown batch response: fused ranking, then a short summary per variant."""
+    stats = result.stats
+    duplicates = f"{stats.duplicates_removed} cross-variant duplicates"
+    lines = [
+        f"## Batch search: {len(result.variants)} query variants",
+        "",
+        f"**Unique articles**: {stats.unique_articles} (from {stats.total_input} candidates, {duplicates})",
+        "",
+        "### Fused ranking (reciprocal rank fusion)",
+        "",
+    ]
+    for rank, article in enumerate(result.fused, 1):
+        ranks = result.variant_ranks.get(canonical_article_key(article), [])
+        found_by = ", ".join(f"Q{index}" for index, variant_rank in enumerate(ranks, 1) if variant_rank is not None)
+        details = ", ".join(str(part) for part in (article.journal, article.year) if part)
+        identifier = f"PMID: {article.pmid}" if article.pmid else f"DOI: {article.doi}" if article.doi else ""
+        line = f"{rank}. **{article.title}**"
+        if details:
+            line += f" ({details})"
+        if identifier:
+            line += f" — {identifier}"
+        lines.append(f"{line} · found by {found_by}")
+    if not result.fused:
+        lines.append("_No results for any variant._")
+
+    lines.extend(["", "### Variants", ""])
+    for index, variant in enumerate(result.variants, 1):
+        summary = f"- **Q{index}** `{variant.plan.request.query}`: {variant.total_candidates} candidates"
+        if variant.source_errors:
+            summary += f" ({len(variant.source_errors)} source error(s))"
+        lines.append(summary)
+    return "\n".join(lines)
+
+
+async def run_unified_search_batch(
+    *,
+    searcher: LiteratureSearcher,
+    queries: Union[list[str], str],
+    limit: Union[int, str] = 10,
+    sources: Union[str, None] = None,
+    ranking: Literal["balanced", "impact", "recency", "quality"] = "balanced",
+    output_format: Literal["markdown", "json", "toon"] = "markdown",
+    filters: Union[str, None] = None,
+    options: Union[str, None] = None,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ctx: Context | None = None,
+    analyzer_factory: Callable[[], Any] = QueryAnalyzer,
+    enhancer_factory: Callable[[], Any] = get_semantic_enhancer,
+    source_registry_factory: Callable[[], Any] = get_source_registry,
+    search_functions: Mapping[str, SearchRunner] | None = None,
+) -> str:
+    """Run several unified_search query variants as one batch."""
+
+    async def _progress(progress: float, total: float, message: str) -> None:
+        await safe_report_progress(ctx, progress, total, message)
+
+    query_list = InputNormalizer.normalize_query_list(queries)
+    if not query_list or len(query_list) > MAX_BATCH_QUERIES:
+        return ResponseFormatter.error(
+            "No queries provided" if not query_list else f"Too many queries ({len(query_list)})",
+            suggestion=f"Pass 1-{MAX_BATCH_QUERIES} query variants, e.g. from generate_search_queries.",
+            example='unified_search_batch(queries=["remimazolam sedation", "remimazolam ICU"])',
+            tool_name="unified_search_batch",
+            output_format=output_format,
+        )
+
+    try:
+        requests = [
+            normalize_unified_search_request(
+                query=query,
+                limit=limit,
+                sources=sources,
+                ranking=ranking,
+                output_format=output_format,
+                filters=filters,
+                options=options,
+            )
+            for query in query_list
+        ]
+    except ValueError as exc:
+        return ResponseFormatter.error(
+            str(exc),
+            suggestion="Correct the invalid limit, filters or options and retry.",
+            tool_name="unified_search_batch",
+            output_format=output_format,
+        )
+
+    try:
+        await _progress(1, 10, f"Planning {len(requests)} query variants...")
+        plans = list(
+            await asyncio.gather(
+                *(
+                    build_unified_search_plan(
+                        request,
+                        progress=_no_progress,
+                        analyzer_factory=analyzer_factory,
+                        enhancer_factory=enhancer_factory,
+                        source_registry_factory=source_registry_factory,
+                    )
+                    for request in requests
+                )
+            )
+        )
+    except (SourceSelectionError, ValueError) as exc:
+        return ResponseFormatter.error(
+            str(exc),
+            suggestion='Specify enabled sources, e.g. sources="pubmed,openalex".',
+            tool_name="unified_search_batch",
+            output_format=output_format,
+        )
+
+    try:
+        result = await execute_unified_search_batch(
+            plans,
+            searcher,
+            progress=_progress,
+            search_functions=search_functions or default_search_functions(searcher),
+            max_concurrency=max_concurrency,
+            fused_limit=requests[0].limit,
+        )
+    except Exception as exc:
+        logger.error("Batch unified search failed (%s)", type(exc).__name__)  # noqa: TRY400 - traceback may leak query
+        return ResponseFormatter.error(
+            "Batch search could not be completed.",
+            suggestion="Review source availability and retry.",
+            tool_name="unified_search_batch",
+            output_format=output_format,
+        )
+
+    await _progress(9, 10, "Formatting output...")
+    if is_structured_output_format(requests[0].output_format):
+        return serialize_structured_payload(
+            _format_batch_payload(result, include_scores=requests[0].include_similarity_scores),
+            requests[0].output_format,
+        )
+    return _format_batch_markdown(result)
+
+
+def make_mcp_unified_search_batch_runner(
+    searcher: LiteratureSearcher,
+    *,
+    ctx: Context | None = None,
+) -> Callable[..., Any]:
+    """Return a batch runner compatible with `UnifiedSearchService`."""
+
+    async def _runner(**kwargs: Any) -> str:
+        return await run_unified_search_batch(searcher=searcher, ctx=ctx, **kwargs)
+
+    return _runner
+
+
+__all__ = [
+    "DEFAULT_BATCH_CONCURRENCY",
+    "MAX_BATCH_QUERIES",
+    "BatchVariantResult",
+    "UnifiedSearchBatchResult",
+    "execute_unified_search_batch",
+    "make_mcp_unified_search_batch_runner",
+    "run_unified_search_batch",
+]
@@ -147,6 +147,7 @@ async def _enrich_with_journal_metrics(articles: list[UnifiedArticle]) -> None:
 
             for idx in article_indices:
                 articles[idx].journal_metrics = journal_metrics
+                articles[idx].mark_modified()
 
         enriched = sum(1 for a in articles if a.journal_metrics is not None)
         if enriched > 0:
@@ -232,6 +233,7 @@ async def _enrich_with_unpaywall(articles: list[UnifiedArticle]) -> None:
                     )
 
                     articles[idx].is_open_access = True
+                    articles[idx].mark_modified()
 
                     # Map OA status
                     status_map = {
@@ -246,9 +248,10 @@ async def _enrich_with_unpaywall(articles: list[UnifiedArticle]) -> None:
                     )
 
                     # Add OA links
+                    articles[idx].oa_links = oa_links = list(articles[idx].oa_links)
                     for link_data in oa_info.get("oa_links", []):
                         if link_data.get("url"):
-                            articles[idx].oa_links.append(
+                            oa_links.append(
                                 OpenAccessLink(
                                     url=link_data["url"],
                                     version=link_data.get("version", "unknown"),
@@ -14,19 +14,24 @@ Maintenance:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 from collections.abc import Awaitable, Callable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from pubmed_search.application.search.result_aggregator import ResultAggregator
+from pubmed_search.application.search.source_performance import get_source_performance_tracker
 from pubmed_search.application.timeline import TimelineBuilder, build_research_tree
 from pubmed_search.domain.entities.article import UnifiedArticle
+from pubmed_search.infrastructure.cache.result_set_cache import get_result_set_cache
+from pubmed_search.shared.article_identity import canonical_article_key
 from pubmed_search.shared.source_contracts import (
     SourceAdapterCall,
     SourceAdapterResult,
     format_source_adapter_error,
     gather_source_adapter_calls,
+    iter_source_adapter_calls,
 )
 
 from .agent_output import is_structured_output_format
@@ -39,20 +44,27 @@ from .unified_enrichment import (
 )
 from .unified_helpers import DispatchStrategy, RelaxationResult, SearchDepthMetrics
 from .unified_source_search import (
+    DEEP_SEARCH_STRATEGY_TIMEOUT_SECONDS,
     _auto_relax_search,
     _execute_deep_search,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from mcp.server.mcpserver import Context
 
     from pubmed_search.application.search.ranking_algorithms import SourceDisagreement
+    from pubmed_search.application.search.result_aggregator import IncrementalAggregation
+    from pubmed_search.application.search.source_performance import SourcePerformanceTracker
     from pubmed_search.infrastructure.ncbi import LiteratureSearcher
 
     from .unified_planning import ProgressReporter, UnifiedSearchPlan
 
 logger = logging.getLogger(__name__)
 SOURCE_SEARCH_TIMEOUT_SECONDS = 25.0
+PROVISIONAL_TOP_K = 3  # Provisional results reported while sources are pending
+PROVISIONAL_TITLE_CHARS = 80
 CLINICAL_TRIALS_PREFETCH_TIMEOUT_SECONDS = 0.5
 _PREPRINT_SOURCE_KEYS = frozenset({"arxiv", "medrxiv", "biorxiv"})
 
@@ -78,6 +90,45 @@ class UnifiedSearchExecutionResult:
     source_errors: list[dict[str, Any]]
     source_statuses: dict[str, str]
     source_metadata: dict[str, dict[str, Any]]
+    # "hit", "miss", "bypass" (no_cache option) or "not_stored" (see result_set_cache)
+    cache_status: str = "miss"
+    # Key of the cached candidate list, for cursor paging (see unified_paging)
+    result_set_key: str | None = None
+    total_candidates: int = 0
+    # "applied" or "not_applied_deep_search" when early_return was requested
+    early_return: str | None = None
+
+
+@dataclass
+class _SourceSearchOutcome:
+    """Ranked candidates of one pass over the planned sources, with source diagnostics."""
+
+    ranked: list[UnifiedArticle]
+    stats: Any
+    pubmed_total_count: int | None
+    source_api_counts: dict[str, tuple[int, int | None]]
+    deep_search_metrics: SearchDepthMetrics | None
+    relaxation_result: RelaxationResult | None
+    source_errors: list[dict[str, Any]]
+    source_statuses: dict[str, str]
+    source_metadata: dict[str, dict[str, Any]]
+    # Candidates past the ranked first page, in aggregation order; ranked by
+    # the first cursor request that reaches them (see unified_paging)
+    unranked: list[UnifiedArticle] = field(default_factory=list)
+    early_return: str | None = None
+
+    def cacheable_metadata(self) -> dict[str, Any]:
+        """Everything but the articles and errors, as stored with a cached result set."""
+        return {
+            "stats": self.stats,
+            "pubmed_total_count": self.pubmed_total_count,
+            "source_api_counts": self.source_api_counts,
+            "deep_search_metrics": self.deep_search_metrics,
+            "relaxation_result": self.relaxation_result,
+            "source_statuses": self.source_statuses,
+            "source_metadata": self.source_metadata,
+            "early_return": self.early_return,
+        }
 
 
 def _source_error_payload(error: Any) -> dict[str, Any]:
@@ -167,17 +218,209 @@ async def _search_single_source(
     )
 
 
-async def execute_unified_search(
+def _provisional_summary(titles: list[str]) -> str:
+    return " | ".join(
+        title if len(title) <= PROVISIONAL_TITLE_CHARS else title[: PROVISIONAL_TITLE_CHARS - 1] + "…"
+        for title in titles
+    )
+
+
+async def _stream_source_searches(
+    calls: list[SourceAdapterCall[UnifiedArticle]],
+    streaming: IncrementalAggregation,
+    plan: UnifiedSearchPlan,
+    progress: ProgressReporter,
+    *,
+    per_call_timeout: float = SOURCE_SEARCH_TIMEOUT_SECONDS,
+    sufficient: Callable[[int, list[str]], bool] | None = None,
+    cancelled_early: set[str] | None = None,
+    deferred: Collection[str] = (),
+) -> list[SourceAdapterResult[UnifiedArticle]]:
+    """Run source searches, deduplicating each page into *streaming* as it arrives.
+
+    Call *i*'s page is added at source position *i*. While other sources are
+    still pending, every arrival is reported with a provisional top-k of
+    everything received so far. Results are returned in call order once the
+    last source settles or times out (the per-source timeout is clamped to the
+    request deadline); ``streaming.finish()`` then merges in source order, so
+    the outcome does not depend on arrival order.
+
+    With a *sufficient* policy (``early_return`` option), the stream stops as
+    soon as the policy accepts the unique candidates merged so far and the
+    still-pending sources. Those sources are added to *cancelled_early* before
+    their calls are cancelled and come back as empty results marked
+    ``cancelled_early``.
+
+    Calls of *deferred* sources (deprioritized by the latency budget) start
+    only once every other call has settled, so a sufficient result set skips
+    them without issuing their provider requests at all.
+    """
+    settled: dict[int, SourceAdapterResult[UnifiedArticle]] = {}
+    waves = [
+        [position for position, call in enumerate(calls) if call.source not in deferred],
+        [position for position, call in enumerate(calls) if call.source in deferred],
+    ]
+    stopped = False
+    for wave in waves:
+        if stopped or not wave:
+            continue
+        stream = iter_source_adapter_calls([calls[position] for position in wave], per_call_timeout=per_call_timeout)
+        async with contextlib.aclosing(stream):
+            async for index, result in stream:
+                position = wave[index]
+                settled[position] = result
+                new_unique = streaming.add(position, result.items) if result.items else 0
+                pending = len(calls) - len(settled)
+                if not pending:
+                    break
+                if sufficient is not None:
+                    pending_sources = [call.source for other, call in enumerate(calls) if other not in settled]
+                    if sufficient(streaming.unique_count, pending_sources):
+                        if cancelled_early is not None:
+                            cancelled_early.update(pending_sources)
+                        message = (
+                            f"{streaming.unique_count} unique results are sufficient; "
+                            f"cancelled {pending} straggler source(s): {', '.join(pending_sources)}"
+                        )
+                        await progress(5, 10, message)
+                        stopped = True
+                        break
+                message = (
+                    f"{result.source}: {len(result.items)} results ({new_unique} new), {pending} source(s) pending"
+                )
+                if streaming.unique_count:
+                    top_k = min(PROVISIONAL_TOP_K, plan.request.limit or PROVISIONAL_TOP_K)
+                    top = streaming.snapshot(plan.query, top_k=top_k)
+                    message += f"; provisional top {len(top)}: {_provisional_summary([a.title or '' for a in top])}"
+                await progress(4 + len(settled) / len(calls), 10, message)
+    for position, call in enumerate(calls):
+        if position not in settled:
+            settled[position] = SourceAdapterResult.empty(
+                source=call.source,
+                operation=call.operation,
+                metadata={
+                    "cancelled_early": True,
+                    "query_executed": False,
+                    "physical_query": None,
+                    "provider_mode": "cancelled_early",
+                },
+            )
+    return [settled[position] for position in range(len(calls))]
+
+
+def _measured(
+    source: str,
+    runner: SearchRunner,
+    tracker: SourcePerformanceTracker,
+    cancelled_early: set[str],
+    concurrency_budget: asyncio.Semaphore | None = None,
+) -> SearchRunner:
+    """Wrap a source runner so the tracker records the wall time of each call.
+
+    Calls cancelled by an early return are not recorded: they were cut short
+    on purpose, not slow. With a ``concurrency_budget`` each call first takes
+    a slot of it, and only the provider call after that is timed.
+    """
+
+    async def _run(query: str, limit: int, min_year: int | None, max_year: int | None, options: dict[str, Any]) -> Any:
+        async with concurrency_budget or contextlib.nullcontext():
+            with tracker.measure(source, discard=lambda: source in cancelled_early):
+                return await runner(query, limit, min_year, max_year, options)
+
+    return _run
+
+
+def _sufficiency_policy(
+    plan: UnifiedSearchPlan,
+    tracker: SourcePerformanceTracker,
+    query_kind: str,
+) -> Callable[[int, list[str]], bool] | None:
+    """Early-return check for ``_stream_source_searches`` (None unless the request opted in)."""
+    if not plan.request.early_return:
+        return None
+
+    def _sufficient(unique_count: int, pending_sources: list[str]) -> bool:
+        return DispatchStrategy.results_are_sufficient(
+            unique_count, plan.request.limit, pending_sources, tracker=tracker, query_kind=query_kind
+        )
+
+    return _sufficient
+
+
+def _deferred_sources(plan: UnifiedSearchPlan) -> set[str]:
+    """Deprioritized sources whose calls wait for the others (only with ``early_return``).
+
+    Without an early-return policy every source is awaited anyway, so holding
+    one back would only add latency; deprioritized sources then start with
+    the rest and only lose merge precedence (they are dispatched last).
+    """
+    if not plan.request.early_return:
+        return set()
+    return {source for source, entry in plan.dispatch_decisions.items() if entry["decision"] == "deprioritized"}
+
+
+def _record_unique_yield(
+    results: list[SourceAdapterResult[UnifiedArticle]],
+    tracker: SourcePerformanceTracker,
+    query_kind: str,
+) -> None:
+    """Record how many of the search's unique articles each responding source alone returned."""
+    keys_by_source: dict[str, set[str]] = {}
+    for result in results:
+        if result.status != "error":
+            keys_by_source.setdefault(result.source, set()).update(
+                canonical_article_key(article) for article in result.items
+            )
+    if len(keys_by_source) < 2:
+        return
+    all_keys = set().union(*keys_by_source.values())
+    if not all_keys:
+        return
+    for source, keys in keys_by_source.items():
+        others = set().union(*(other for name, other in keys_by_source.items() if name != source))
+        tracker.record_yield(source, query_kind, unique=len(keys - others), total=len(all_keys))
+
+
+async def _search_and_rank_sources(
     plan: UnifiedSearchPlan,
     searcher: LiteratureSearcher,
+    aggregator: ResultAggregator,
     *,
     progress: ProgressReporter,
-    ctx: Context | None = None,
     search_functions: Mapping[str, SearchRunner],
-    timeline_builder_cls: type[TimelineBuilder] = TimelineBuilder,
-    research_tree_builder: Callable[[Any], Any] = build_research_tree,
-) -> UnifiedSearchExecutionResult:
-    """Execute a planned unified search and return normalized output state."""
+) -> _SourceSearchOutcome:
+    """Query the planned sources, then aggregate, enrich, filter and rank their results."""
+    outcome = await _retrieve_source_candidates(
+        plan,
+        searcher,
+        aggregator,
+        progress=progress,
+        search_functions=search_functions,
+    )
+    await progress(6, 10, "Enriching results...")
+    await _enrich_candidates(dict.fromkeys(_planned_enrichments(plan), outcome.ranked))
+    await progress(8, 10, "Ranking results...")
+    outcome.ranked, outcome.unranked = _filter_and_rank_candidates(
+        plan, aggregator, outcome.ranked, top_k=plan.request.limit or None
+    )
+    return outcome
+
+
+async def _retrieve_source_candidates(
+    plan: UnifiedSearchPlan,
+    searcher: LiteratureSearcher,
+    aggregator: ResultAggregator,
+    *,
+    progress: ProgressReporter,
+    search_functions: Mapping[str, SearchRunner],
+    concurrency_budget: asyncio.Semaphore | None = None,
+) -> _SourceSearchOutcome:
+    """Query the planned sources and aggregate their results.
+
+    The returned outcome's ``ranked`` list holds the deduplicated candidates,
+    not yet enriched, filtered or ranked. ``concurrency_budget`` caps the
+    provider calls in flight when several searches share one budget.
+    """
     request = plan.request
     analysis = plan.analysis
     all_results: list[list[UnifiedArticle]] = []
@@ -188,33 +431,32 @@ async def execute_unified_search(
     source_errors: list[dict[str, Any]] = []
     source_statuses: dict[str, str] = {}
     source_metadata: dict[str, dict[str, Any]] = {}
-
-    clinical_trials_task: asyncio.Task | None = None
-    clinical_trials_query: str | None = None
-    clinical_trials_status = "not_requested"
-    if request.include_clinical_trials and is_structured_output_format(request.output_format):
-        clinical_trials_status = "not_run_structured_output"
-    if request.include_clinical_trials and not is_structured_output_format(request.output_format):
-        clinical_trials_status = "starting"
-        try:
-            from pubmed_search.infrastructure.sources.clinical_trials import search_related_trials
-
-            clinical_trials_query = " ".join(plan.provider_neutral_query.split()[:5])
-            clinical_trials_task = asyncio.create_task(search_related_trials(clinical_trials_query, limit=3))
-            clinical_trials_status = "pending"
-            parent_task = asyncio.current_task()
-            if parent_task is not None:
-
-                def _cancel_orphaned_trials(_completed_parent: asyncio.Task[Any]) -> None:
-                    if clinical_trials_task is not None and not clinical_trials_task.done():
-                        clinical_trials_task.cancel()
-
-                parent_task.add_done_callback(_cancel_orphaned_trials)
-        except Exception:
-            clinical_trials_status = "unavailable"
-            logger.debug("Clinical trials module not available, skipping")
-
-    if request.deep_search and plan.enhanced_query and plan.deep_strategies:
+    streaming: IncrementalAggregation | None = None
+
+    tracker = get_source_performance_tracker()
+    query_kind = DispatchStrategy.get_auto_dispatch_profile(analysis)
+    cancelled_early: set[str] = set()
+    search_functions = {
+        source: _measured(source, runner, tracker, cancelled_early, concurrency_budget)
+        for source, runner in search_functions.items()
+    }
+    source_timeout = SOURCE_SEARCH_TIMEOUT_SECONDS
+    strategy_timeout = DEEP_SEARCH_STRATEGY_TIMEOUT_SECONDS
+    if request.latency_budget_ms is not None:
+        # The budget also caps each provider call, so a source kept for lack
+        # of history cannot overrun it (and its timeout is recorded as latency).
+        source_timeout = min(source_timeout, request.latency_budget_ms / 1000)
+        strategy_timeout = min(strategy_timeout, request.latency_budget_ms / 1000)
+
+    early_return: str | None = None
+    if request.early_return:
+        # Deep strategies are budgeted per strategy rather than streamed per
+        # source, so the early-return policy only applies to the plain fan-out
+        # (which is also the only branch feeding the unique-yield history the
+        # policy reads: expanded strategy queries are not comparable to it).
+        early_return = "not_applied_deep_search" if plan.uses_deep_search else "applied"
+
+    if plan.uses_deep_search and plan.enhanced_query is not None:
         enhanced_query = plan.enhanced_query
         await progress(4, 10, f"Deep search: {len(plan.deep_strategies)} strategies...")
         logger.info("Executing DEEP SEARCH with %s strategies", len(plan.deep_strategies))
@@ -233,6 +475,7 @@ async def execute_unified_search(
             request.advanced_filters,
             strategies=plan.deep_strategies,
             search_functions=search_functions,
+            strategy_timeout=strategy_timeout,
         )
         for error in deep_source_errors:
             logger.warning("Deep search source warning: %s", format_source_adapter_error(error))
@@ -311,10 +554,19 @@ async def execute_unified_search(
 
             return SourceAdapterCall(source=source, operation="search", execute=_execute)
 
-        search_results = await gather_source_adapter_calls(
+        streaming = aggregator.incremental()
+        search_results = await _stream_source_searches(
             [_build_search_call(source) for source in search_sources],
-            per_call_timeout=SOURCE_SEARCH_TIMEOUT_SECONDS,
+            streaming,
+            plan,
+            progress,
+            per_call_timeout=source_timeout,
+            sufficient=_sufficiency_policy(plan, tracker, query_kind),
+            cancelled_early=cancelled_early,
+            deferred=_deferred_sources(plan),
         )
+        if cancelled_early:
+            logger.info("Early return: cancelled straggler sources %s", sorted(cancelled_early))
 
         # A default simple/lookup search often has one fast primary leg. If
         # that leg failed (rather than returning a valid empty set), make one
@@ -357,7 +609,7 @@ async def execute_unified_search(
                 )
                 fallback_results: list[SourceAdapterResult[UnifiedArticle]] = await gather_source_adapter_calls(
                     [fallback_call],
-                    per_call_timeout=SOURCE_SEARCH_TIMEOUT_SECONDS,
+                    per_call_timeout=source_timeout,
                 )
                 fallback_result = fallback_results[0]
                 fallback_result.metadata.update(
@@ -368,8 +620,13 @@ async def execute_unified_search(
                         "fallback_limit": min(request.limit, 20),
                     }
                 )
+                streaming.add(len(search_results), fallback_result.items)
                 search_results.append(fallback_result)
 
+        _record_unique_yield(
+            [result for result in search_results if result.source not in cancelled_early], tracker, query_kind
+        )
+
         for result in search_results:
             attempt_metadata = dict(result.metadata)
             logical_query = plan.query if result.source == "pubmed" else plan.provider_neutral_query
@@ -415,7 +672,7 @@ async def execute_unified_search(
             if articles:
                 all_results.append(articles)
             source_api_counts[result.source] = (len(articles), total_count)
-            source_statuses[result.source] = result.status
+            source_statuses[result.source] = "cancelled_early" if result.source in cancelled_early else result.status
             source_metadata[result.source] = attempt_metadata
             if result.source == "pubmed" and total_count is not None:
                 pubmed_total_count = total_count
@@ -429,8 +686,8 @@ async def execute_unified_search(
     # versions via DOI/title matching.
 
     await progress(5, 10, "Aggregating results...")
-    aggregator = ResultAggregator(plan.ranking_config)
-    articles, stats = aggregator.aggregate(all_results)
+    # Streamed pages were deduplicated on arrival; only the merge is left.
+    articles, stats = streaming.finish() if streaming is not None else aggregator.aggregate(all_results)
     logger.info("Aggregation: %s unique from %s total", stats.unique_articles, stats.total_input)
 
     if (
@@ -448,6 +705,7 @@ async def execute_unified_search(
             request.min_year or analysis.year_from,
             request.max_year or analysis.year_to,
             request.advanced_filters,
+            speculative_levels=request.speculative_relax or 0,
         )
         if relaxation_result and relaxation_result.successful_step:
             step = relaxation_result.successful_step
@@ -471,17 +729,66 @@ async def execute_unified_search(
             }
             logger.info("Auto-relaxation: %s results at level %s (%s)", stats.unique_articles, step.level, step.action)
 
-    await progress(6, 10, "Enriching results...")
-    enrichment_tasks: list[asyncio.Task] = []  # type: ignore[type-arg]
+    for source, decision in plan.dispatch_decisions.items():
+        if source in source_metadata:
+            source_metadata[source]["dispatch"] = dict(decision)
+        elif decision["decision"] == "pruned":
+            source_metadata[source] = {"dispatch": dict(decision), "query_executed": False, "provider_mode": "skipped"}
+
+    return _SourceSearchOutcome(
+        ranked=articles,
+        stats=stats,
+        pubmed_total_count=pubmed_total_count,
+        source_api_counts=source_api_counts,
+        deep_search_metrics=deep_search_metrics,
+        relaxation_result=relaxation_result,
+        source_errors=source_errors,
+        source_statuses=source_statuses,
+        source_metadata=source_metadata,
+        early_return=early_return,
+    )
+
+
+def _planned_enrichments(plan: UnifiedSearchPlan) -> tuple[str, ...]:
+    """Enrichment passes the candidates of *plan* receive (see ``_enrich_candidates``)."""
+    enrichments: list[str] = []
     if "crossref" in plan.dispatch_sources:
-        enrichment_tasks.append(asyncio.create_task(_enrich_with_crossref(articles)))
+        enrichments.append("crossref")
     if "openalex" in plan.dispatch_sources:
-        enrichment_tasks.append(asyncio.create_task(_enrich_with_journal_metrics(articles)))
-    if request.include_oa_links and DispatchStrategy.should_enrich_with_unpaywall(analysis):
-        enrichment_tasks.append(asyncio.create_task(_enrich_with_unpaywall(articles)))
+        enrichments.append("journal_metrics")
+    if plan.request.include_oa_links and DispatchStrategy.should_enrich_with_unpaywall(plan.analysis):
+        enrichments.append("unpaywall")
+    return tuple(enrichments)
+
+
+async def _enrich_candidates(articles_by_enrichment: Mapping[str, list[UnifiedArticle]]) -> None:
+    """Run the named enrichment passes concurrently; each updates its articles in place."""
+    enrichers = {
+        "crossref": _enrich_with_crossref,
+        "journal_metrics": _enrich_with_journal_metrics,
+        "unpaywall": _enrich_with_unpaywall,
+    }
+    enrichment_tasks = [
+        asyncio.create_task(enrichers[enrichment](articles)) for enrichment, articles in articles_by_enrichment.items()
+    ]
     if enrichment_tasks:
         await asyncio.gather(*enrichment_tasks, return_exceptions=True)
 
+
+def _filter_and_rank_candidates(
+    plan: UnifiedSearchPlan,
+    aggregator: ResultAggregator,
+    articles: list[UnifiedArticle],
+    *,
+    top_k: int | None = None,
+) -> tuple[list[UnifiedArticle], list[UnifiedArticle]]:
+    """Apply the peer-review filter, then rank the remaining candidates.
+
+    Returns the ranked articles and the candidates left unranked. With
+    ``top_k`` only the first page is ranked (a top-k selection); the rest are
+    returned in aggregation order so a cursor request can rank them later.
+    """
+    request = plan.request
     if (
         request.peer_reviewed_only
         and articles
@@ -498,10 +805,96 @@ async def execute_unified_search(
         if filtered_count > 0:
             logger.info("Peer-review filter: removed %s non-peer-reviewed articles", filtered_count)
 
-    await progress(8, 10, "Ranking results...")
-    ranked = aggregator.rank(articles, plan.ranking_config, plan.query)
-    if request.limit and len(ranked) > request.limit:
-        ranked = ranked[: request.limit]
+    ranked = aggregator.rank(articles, plan.ranking_config, plan.query, top_k=top_k)
+    if top_k is None or len(ranked) == len(articles):
+        return ranked, []
+    ranked_ids = {id(article) for article in ranked}
+    return ranked, [article for article in articles if id(article) not in ranked_ids]
+
+
+async def execute_unified_search(
+    plan: UnifiedSearchPlan,
+    searcher: LiteratureSearcher,
+    *,
+    progress: ProgressReporter,
+    ctx: Context | None = None,
+    search_functions: Mapping[str, SearchRunner],
+    timeline_builder_cls: type[TimelineBuilder] = TimelineBuilder,
+    research_tree_builder: Callable[[Any], Any] = build_research_tree,
+) -> UnifiedSearchExecutionResult:
+    """Execute a planned unified search and return normalized output state."""
+    request = plan.request
+    analysis = plan.analysis
+    aggregator = ResultAggregator(plan.ranking_config)
+
+    clinical_trials_task: asyncio.Task | None = None
+    clinical_trials_query: str | None = None
+    clinical_trials_status = "not_requested"
+    if request.include_clinical_trials and is_structured_output_format(request.output_format):
+        clinical_trials_status = "not_run_structured_output"
+    if request.include_clinical_trials and not is_structured_output_format(request.output_format):
+        clinical_trials_status = "starting"
+        try:
+            from pubmed_search.infrastructure.sources.clinical_trials import search_related_trials
+
+            clinical_trials_query = " ".join(plan.provider_neutral_query.split()[:5])
+            clinical_trials_task = asyncio.create_task(search_related_trials(clinical_trials_query, limit=3))
+            clinical_trials_status = "pending"
+            parent_task = asyncio.current_task()
+            if parent_task is not None:
+
+                def _cancel_orphaned_trials(_completed_parent: asyncio.Task[Any]) -> None:
+                    if clinical_trials_task is not None and not clinical_trials_task.done():
+                        clinical_trials_task.cancel()
+
+                parent_task.add_done_callback(_cancel_orphaned_trials)
+        except Exception:
+            clinical_trials_status = "unavailable"
+            logger.debug("Clinical trials module not available, skipping")
+
+    result_cache = get_result_set_cache()
+    cache_key = DispatchStrategy.result_cache_key(plan)
+    cached = result_cache.get(cache_key) if request.use_result_cache else None
+    if cached is not None:
+        cached_articles, cached_metadata = cached
+        await progress(8, 10, "Reusing cached ranked results...")
+        logger.info("Result-set cache hit: %s ranked articles", len(cached_articles))
+        ranked_count = cached_metadata["ranked_count"]
+        outcome = _SourceSearchOutcome(
+            ranked=cached_articles[:ranked_count],
+            unranked=cached_articles[ranked_count:],
+            source_errors=[],
+            **cached_metadata["source_outcome"],
+        )
+        cache_status = "hit"
+        stored = True
+    else:
+        outcome = await _search_and_rank_sources(
+            plan,
+            searcher,
+            aggregator,
+            progress=progress,
+            search_functions=search_functions,
+        )
+        stored = not outcome.source_errors and result_cache.put(
+            cache_key,
+            outcome.ranked + outcome.unranked,
+            {
+                "source_outcome": outcome.cacheable_metadata(),
+                "analysis": plan.analysis,
+                "query": plan.query,
+                "ranking_config": plan.ranking_config,
+                "ranked_count": len(outcome.ranked),
+            },
+        )
+        cache_status = "miss" if stored else "not_stored"
+        if not request.use_result_cache:
+            cache_status = "bypass"
+
+    ranked = outcome.ranked[: request.limit]
+    stats = outcome.stats
+    source_api_counts = outcome.source_api_counts
+    source_statuses = outcome.source_statuses
 
     if request.include_similarity_scores:
         _enrich_with_similarity_scores(ranked, plan.query)
@@ -510,7 +903,7 @@ async def execute_unified_search(
     if request.show_analysis and len(source_api_counts) > 1:
         from pubmed_search.application.search.ranking_algorithms import analyze_source_disagreement
 
-        source_disagreement = analyze_source_disagreement(ranked)
+        source_disagreement = analyze_source_disagreement(ranked, term_index=aggregator.last_term_index)
 
     reproducibility = None
     if request.show_analysis:
@@ -576,10 +969,10 @@ async def execute_unified_search(
     return UnifiedSearchExecutionResult(
         ranked=ranked,
         stats=stats,
-        pubmed_total_count=pubmed_total_count,
+        pubmed_total_count=outcome.pubmed_total_count,
         source_api_counts=source_api_counts,
-        deep_search_metrics=deep_search_metrics,
-        relaxation_result=relaxation_result,
+        deep_search_metrics=outcome.deep_search_metrics,
+        relaxation_result=outcome.relaxation_result,
         source_disagreement=source_disagreement,
         reproducibility_score=reproducibility,
         research_context_preview=research_context_preview,
@@ -587,9 +980,13 @@ async def execute_unified_search(
         prefetched_trials=prefetched_trials,
         clinical_trials_query=clinical_trials_query,
         clinical_trials_status=clinical_trials_status,
-        source_errors=source_errors,
+        source_errors=outcome.source_errors,
         source_statuses=source_statuses,
-        source_metadata=source_metadata,
+        source_metadata=outcome.source_metadata,
+        cache_status=cache_status,
+        result_set_key=cache_key if stored else None,
+        total_candidates=len(outcome.ranked) + len(outcome.unranked),
+        early_return=outcome.early_return,
     )
 
 
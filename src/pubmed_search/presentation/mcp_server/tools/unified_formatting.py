@@ -19,18 +19,24 @@ from pubmed_search.infrastructure.sources.openurl import (
 
 from .agent_output import (
     OutputFormat,
+    PreEncodedArray,
     SourceCountRow,
+    encode_json_entry,
+    encode_json_fragment,
     finalize_next_tools,
+    join_json_entries,
+    json_object_length,
     make_next_tool,
     make_section_provenance,
     make_source_count_row,
+    pre_encoded_entry_length,
     preferred_structured_output_format,
     serialize_structured_payload,
     sort_source_count_rows,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterator, Mapping, Sequence
 
     from pubmed_search.application.search.query_analyzer import AnalyzedQuery
     from pubmed_search.application.search.ranking_algorithms import SourceDisagreement
@@ -344,6 +350,7 @@ async def _format_unified_results(
     source_metadata: dict[str, dict[str, Any]] | None = None,
     research_context_preview: str | None = None,
     counts_first: bool = False,
+    first_rank: int = 1,
 ) -> str:
     """Format unified search results for MCP response.
 
@@ -351,6 +358,7 @@ async def _format_unified_results(
         source_api_counts: Per-source raw API counts {source: (returned, total_available)}.
             - returned: how many articles the API actually returned to us
             - total_available: how many total matches the API reports (None if unknown)
+        first_rank: Rank number of the first article (greater than 1 for later pages).
     """
     output_parts: list[str] = []
     source_rows = _serialize_source_counts(source_api_counts, stats)
@@ -471,7 +479,7 @@ async def _format_unified_results(
 
     output_parts.append("---\n")
 
-    for i, article in enumerate(articles, 1):
+    for i, article in enumerate(articles, first_rank):
         # Article header
         score_str = (
             f" (score: {article.ranking_score:.2f})" if include_similarity_scores and article.ranking_score else ""
@@ -712,6 +720,47 @@ def _article_payload(
     return payload
 
 
+def _structured_article_payloads(
+    articles: list[UnifiedArticle],
+    *,
+    structured_output_format: str,
+    compact_output: bool,
+    include_scores: bool,
+) -> list[dict[str, Any]] | PreEncodedArray:
+    """Article entries of a structured response.
+
+    For JSON each article is encoded once per option set and cached on the
+    article, so repeated responses over the same ranked results only splice
+    the cached fragments together.
+    """
+    if structured_output_format != "json":
+        return [
+            _article_payload(article, compact_output=compact_output, include_scores=include_scores)
+            for article in articles
+        ]
+
+    return PreEncodedArray(
+        _article_json_fragments(articles, compact_output=compact_output, include_scores=include_scores)
+    )
+
+
+def _article_json_fragments(
+    articles: Sequence[UnifiedArticle],
+    *,
+    compact_output: bool,
+    include_scores: bool,
+) -> list[str]:
+    """The cached ``encode_json_fragment`` of each article's structured payload."""
+
+    def encode(article: UnifiedArticle) -> str:
+        return encode_json_fragment(
+            _article_payload(article, compact_output=compact_output, include_scores=include_scores)
+        )
+
+    variant = ("json", compact_output, include_scores)
+    return [article.cached_serialization(variant, encode) for article in articles]
+
+
 def _should_pretruncate_structured_response(
     articles: list[UnifiedArticle],
     *,
@@ -725,25 +774,28 @@ def _should_pretruncate_structured_response(
     return not compact_output and len(articles) > 3 and max_response_chars <= PRETRUNCATE_STRUCTURED_RESPONSE_CAP_CHARS
 
 
-def _serialize_truncated_response_payload(
+def _truncated_response_candidates(
     payload: dict[str, Any],
     *,
     articles: list[UnifiedArticle],
     stats: AggregationStats,
-    output_format: OutputFormat,
-    max_response_chars: int | None,
     include_next_tools: bool,
-) -> str:
+) -> Iterator[dict[str, Any]]:
+    """Size-capped fallbacks of a structured response, largest first.
+
+    First the truncated summary with three, two, one and zero compact
+    preview articles, then progressively smaller status-only payloads.
+    """
     total_available = max(len(articles), int(getattr(stats, "unique_articles", 0) or 0))
-    preview_count = min(len(articles), 3)
+    fragments = _article_json_fragments(articles[:3], compact_output=True, include_scores=False)
     truncated_payload: dict[str, Any] = {
         "tool": "unified_search",
         "status": "truncated",
         "reason": "response_size_exceeded",
         "result_id": "last",
-        "returned_articles": preview_count,
+        "returned_articles": len(fragments),
         "total_available": total_available,
-        "articles": [_compact_article_payload(article, include_scores=False) for article in articles[:preview_count]],
+        "articles": PreEncodedArray(fragments),
         "source_counts": payload.get("source_counts", []),
     }
     if include_next_tools:
@@ -763,73 +815,111 @@ def _serialize_truncated_response_payload(
     if payload.get("search_run"):
         truncated_payload["search_run"] = payload["search_run"]
 
-    capped = serialize_structured_payload(truncated_payload, output_format)
-    while max_response_chars is not None and len(capped) > max_response_chars and preview_count > 0:
-        preview_count -= 1
-        truncated_payload["returned_articles"] = preview_count
-        truncated_payload["articles"] = [
-            _compact_article_payload(article, include_scores=False) for article in articles[:preview_count]
+    for preview_count in range(len(fragments), -1, -1):
+        yield {
+            **truncated_payload,
+            "returned_articles": preview_count,
+            "articles": PreEncodedArray(fragments[:preview_count]),
+        }
+
+    minimal_payload: dict[str, Any] = {"status": "truncated"}
+    if payload.get("search_run"):
+        search_run = payload["search_run"]
+        minimal_payload["search_run"] = {
+            key: search_run.get(key)
+            for key in ("run_id", "status", "recoverable")
+            if search_run.get(key) not in (None, "", [])
+        }
+    if payload.get("source_errors"):
+        minimal_payload["source_errors"] = [
+            {
+                key: error.get(key)
+                for key in ("source", "status", "status_code", "suggestion")
+                if error.get(key) not in (None, "", [])
+            }
+            for error in payload["source_errors"]
+            if isinstance(error, dict)
         ]
-        capped = serialize_structured_payload(truncated_payload, output_format)
-
-    minimal_payload: dict[str, Any] | None = None
-    if max_response_chars is not None and len(capped) > max_response_chars:
-        minimal_payload = {"status": "truncated"}
-        if payload.get("search_run"):
-            search_run = payload["search_run"]
-            minimal_payload["search_run"] = {
-                key: search_run.get(key)
-                for key in ("run_id", "status", "recoverable")
-                if search_run.get(key) not in (None, "", [])
+    if payload.get("artifact"):
+        artifact = payload["artifact"]
+        candidate_artifacts = [
+            {
+                "artifact_id": artifact.get("artifact_id"),
+                "artifact_uri": artifact.get("artifact_uri"),
+                "primary_file": artifact.get("primary_file"),
+                "read_via": artifact.get("read_via"),
+            },
+            {"artifact_id": artifact.get("artifact_id"), "artifact_uri": artifact.get("artifact_uri")},
+            {"artifact_id": artifact.get("artifact_id")},
+        ]
+        for candidate_artifact in candidate_artifacts:
+            yield {
+                **minimal_payload,
+                "artifact": {key: value for key, value in candidate_artifact.items() if value not in (None, "", [])},
             }
-        if payload.get("source_errors"):
-            minimal_payload["source_errors"] = [
-                {
-                    key: error.get(key)
-                    for key in ("source", "status", "status_code", "suggestion")
-                    if error.get(key) not in (None, "", [])
-                }
-                for error in payload["source_errors"]
-                if isinstance(error, dict)
-            ]
-        if payload.get("artifact"):
-            artifact = payload["artifact"]
-            candidate_artifacts = [
-                {
-                    "artifact_id": artifact.get("artifact_id"),
-                    "artifact_uri": artifact.get("artifact_uri"),
-                    "primary_file": artifact.get("primary_file"),
-                    "read_via": artifact.get("read_via"),
-                },
-                {"artifact_id": artifact.get("artifact_id"), "artifact_uri": artifact.get("artifact_uri")},
-                {"artifact_id": artifact.get("artifact_id")},
-            ]
-            for candidate_artifact in candidate_artifacts:
-                minimal_payload["artifact"] = {
-                    key: value for key, value in candidate_artifact.items() if value not in (None, "", [])
-                }
-                capped = serialize_structured_payload(minimal_payload, output_format)
-                if max_response_chars is None or len(capped) <= max_response_chars:
-                    break
-            else:
-                minimal_payload.pop("artifact", None)
-                capped = serialize_structured_payload(minimal_payload, output_format)
-        else:
-            capped = serialize_structured_payload(minimal_payload, output_format)
+    yield minimal_payload
+    if payload.get("source_errors"):
+        yield {key: value for key, value in minimal_payload.items() if key != "source_errors"}
+    yield {"status": "truncated"}
+
+
+def _encoded_json_entry(entry_cache: dict[str, list[tuple[Any, str]]], key: str, value: Any) -> str:
+    """``encode_json_entry`` of a top-level entry, reused while the value is the same object."""
+    cached = entry_cache.setdefault(key, [])
+    for cached_value, entry in cached:
+        if cached_value is value:
+            return entry
+    entry = encode_json_entry(key, value)
+    cached.append((value, entry))
+    return entry
+
+
+def _json_entry_lengths(entry_cache: dict[str, list[tuple[Any, str]]], payload: dict[str, Any]) -> list[int]:
+    """Encoded lengths of the top-level entries; pre-encoded arrays are measured, not spliced."""
+    return [
+        pre_encoded_entry_length(key, value)
+        if isinstance(value, PreEncodedArray)
+        else len(_encoded_json_entry(entry_cache, key, value))
+        for key, value in payload.items()
+    ]
 
-    if (
-        max_response_chars is not None
-        and len(capped) > max_response_chars
-        and payload.get("source_errors")
-        and minimal_payload is not None
-    ):
-        minimal_payload.pop("source_errors", None)
-        capped = serialize_structured_payload(minimal_payload, output_format)
 
-    if max_response_chars is not None and len(capped) > max_response_chars:
-        capped = serialize_structured_payload({"status": "truncated"}, output_format)
+def _serialize_truncated_response_payload(
+    payload: dict[str, Any],
+    *,
+    articles: list[UnifiedArticle],
+    stats: AggregationStats,
+    output_format: OutputFormat,
+    max_response_chars: int | None,
+    include_next_tools: bool,
+    entry_cache: dict[str, list[tuple[Any, str]]] | None = None,
+) -> str:
+    """Serialize the largest truncated fallback that fits ``max_response_chars``.
 
-    return capped
+    JSON candidates are measured from the lengths of their encoded top-level
+    entries, which are shared between candidates (and with the full response
+    through *entry_cache*), so only the chosen candidate is assembled. TOON
+    candidates are serialized in turn.
+    """
+    candidates = _truncated_response_candidates(
+        payload, articles=articles, stats=stats, include_next_tools=include_next_tools
+    )
+    if max_response_chars is None:
+        return serialize_structured_payload(next(candidates), output_format)
+
+    if preferred_structured_output_format(output_format) != "json":
+        for candidate in candidates:
+            capped = serialize_structured_payload(candidate, output_format)
+            if len(capped) <= max_response_chars:
+                break
+        return capped
+
+    if entry_cache is None:
+        entry_cache = {}
+    for candidate in candidates:
+        if json_object_length(_json_entry_lengths(entry_cache, candidate)) <= max_response_chars:
+            break
+    return join_json_entries([_encoded_json_entry(entry_cache, key, value) for key, value in candidate.items()])
 
 
 def _serialize_with_response_cap(
@@ -841,9 +931,15 @@ def _serialize_with_response_cap(
     max_response_chars: int | None,
     include_next_tools: bool,
 ) -> str:
-    serialized = serialize_structured_payload(payload, output_format)
-    if max_response_chars is None or len(serialized) <= max_response_chars:
-        return serialized
+    entry_cache: dict[str, list[tuple[Any, str]]] = {}
+    if preferred_structured_output_format(output_format) == "json":
+        lengths = _json_entry_lengths(entry_cache, payload)
+        if max_response_chars is None or json_object_length(lengths) <= max_response_chars:
+            return join_json_entries([_encoded_json_entry(entry_cache, key, value) for key, value in payload.items()])
+    else:
+        serialized = serialize_structured_payload(payload, output_format)
+        if max_response_chars is None or len(serialized) <= max_response_chars:
+            return serialized
 
     return _serialize_truncated_response_payload(
         payload,
@@ -852,6 +948,7 @@ def _serialize_with_response_cap(
         output_format=output_format,
         max_response_chars=max_response_chars,
         include_next_tools=include_next_tools,
+        entry_cache=entry_cache,
     )
 
 
@@ -906,6 +1003,9 @@ def _build_search_status(
     source_errors: list[dict[str, Any]] | None,
     source_metadata: dict[str, dict[str, Any]] | None,
     source_statuses: Mapping[str, str] | None = None,
+    cache_status: str | None = None,
+    page: Mapping[str, Any] | None = None,
+    early_return: str | None = None,
 ) -> dict[str, Any]:
     """Build a truthful, machine-oriented bounded-search outcome summary."""
     errors = [error for error in list(source_errors or []) if isinstance(error, dict)]
@@ -922,10 +1022,16 @@ def _build_search_status(
     for source in failed_sources:
         if source not in attempted_sources:
             attempted_sources.append(source)
+    # Sources an early return cut short neither answered nor failed.
+    cancelled_early_sources = sorted(source for source, status in statuses.items() if status == "cancelled_early")
     successful_sources = [
         source
         for source in attempted_sources
-        if statuses.get(source) in responding_statuses or (source not in error_sources and source not in failed_sources)
+        if source not in cancelled_early_sources
+        and (
+            statuses.get(source) in responding_statuses
+            or (source not in error_sources and source not in failed_sources)
+        )
     ]
     continuation_sources = sorted(
         source
@@ -945,7 +1051,7 @@ def _build_search_status(
     else:
         state = "empty"
 
-    return {
+    search_status: dict[str, Any] = {
         "state": state,
         "bounded": True,
         "exhaustive": False,
@@ -957,6 +1063,15 @@ def _build_search_status(
         "continuation_available_sources": continuation_sources,
         "unknown_completeness_sources": unknown_completeness_sources,
     }
+    if early_return is not None:
+        search_status["early_return"] = early_return
+    if cancelled_early_sources:
+        search_status["cancelled_early_sources"] = cancelled_early_sources
+    if cache_status is not None:
+        search_status["cache_status"] = cache_status
+    if page is not None:
+        search_status["page"] = dict(page)
+    return search_status
 
 
 def _format_as_json(
@@ -982,6 +1097,9 @@ def _format_as_json(
     output_format: OutputFormat = "json",
     artifact_manifest: dict[str, Any] | None = None,
     search_run_handoff: dict[str, Any] | None = None,
+    cache_status: str | None = None,
+    page: Mapping[str, Any] | None = None,
+    early_return: str | None = None,
 ) -> str:
     """Format results as JSON or TOON for programmatic access."""
     source_rows = _serialize_source_counts(source_api_counts, stats)
@@ -992,6 +1110,9 @@ def _format_as_json(
         source_errors=source_errors,
         source_metadata=source_metadata,
         source_statuses=source_statuses,
+        cache_status=cache_status,
+        page=page,
+        early_return=early_return,
     )
     if _should_pretruncate_structured_response(
         articles,
@@ -1025,13 +1146,15 @@ def _format_as_json(
     structured_output_format = preferred_structured_output_format(output_format)
     next_actions = _build_next_actions(articles, analysis, source_rows, None, structured_output_format)
     next_tools, next_commands = finalize_next_tools(next_actions)
-    result = {
+    result: dict[str, Any] = {
         "tool": "unified_search",
         "statistics": stats.to_dict(),
-        "articles": [
-            _article_payload(a, compact_output=compact_output, include_scores=include_similarity_scores)
-            for a in articles
-        ],
+        "articles": _structured_article_payloads(
+            articles,
+            structured_output_format=structured_output_format,
+            compact_output=compact_output,
+            include_scores=include_similarity_scores,
+        ),
         "source_counts": source_rows,
         "search_status": search_status,
     }
@@ -9,9 +9,12 @@ Extracted from unified.py to keep each module under 400 lines.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import math
 import re
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from pubmed_search.application.search.query_analyzer import (
@@ -28,8 +31,13 @@ from pubmed_search.infrastructure.sources.registry import (
 from .icd import lookup_icd_to_mesh
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from pubmed_search.application.search.source_performance import SourcePerformanceTracker
     from pubmed_search.domain.entities.article import UnifiedArticle
 
+    from .unified_planning import UnifiedSearchPlan
+
 logger = logging.getLogger(__name__)
 
 
@@ -122,6 +130,15 @@ def detect_and_expand_icd_codes(query: str) -> tuple[str, list[dict]]:
 # Dispatch Strategy Matrix
 # ============================================================================
 
+# Latency-budgeted dispatch (see DispatchStrategy.apply_latency_budget)
+MIN_LATENCY_SAMPLES = 5  # Calls before a source's p95 is trusted
+MIN_YIELD_SAMPLES = 3  # Searches before a source's unique-yield share is trusted
+LOW_UNIQUE_YIELD_SHARE = 0.02  # Below this share of unique articles a source is deprioritized
+
+# Early return (see DispatchStrategy.results_are_sufficient)
+EARLY_RETURN_MARGIN = 1.5  # Unique candidates needed, as a multiple of the limit
+EARLY_RETURN_MAX_PENDING_YIELD = 0.05  # Combined unique-yield share the pending sources may still add
+
 
 class DispatchStrategy:
     """
@@ -208,6 +225,138 @@ class DispatchStrategy:
         # Enrich for complex queries
         return analysis.complexity == QueryComplexity.COMPLEX
 
+    @staticmethod
+    def apply_latency_budget(
+        sources: list[str],
+        budget_ms: int,
+        *,
+        tracker: SourcePerformanceTracker,
+        query_kind: str,
+        primary_sources: Collection[str],
+        user_selected: bool,
+    ) -> tuple[list[str], dict[str, dict[str, Any]]]:
+        """Prune or deprioritize primary sources by their live latency and unique yield.
+
+        A primary source whose rolling p95 latency exceeds the budget is
+        pruned when it was auto-dispatched, and moved to the end when the
+        user selected it (explicit choices are never silently dropped). A
+        source within budget that has contributed almost no unique articles
+        to this kind of query is also moved to the end. Sources without
+        enough latency history are kept. At least one primary source always
+        survives: if all would be pruned, the fastest is kept, deprioritized.
+
+        Sources are searched concurrently, so moving one last only changes
+        its merge precedence, unless the search opted into ``early_return``:
+        then deprioritized sources start after the others have settled and
+        are skipped when those results already suffice.
+
+        Returns:
+            Tuple of (reordered sources without pruned ones, decision per
+            primary source for ``source_metadata``)
+        """
+        decisions: dict[str, dict[str, Any]] = {}
+        for source in sources:
+            if source not in primary_sources:
+                continue
+            snapshot = tracker.snapshot(source, query_kind)
+            p95 = snapshot.p95_latency_ms if snapshot.latency_samples >= MIN_LATENCY_SAMPLES else None
+            share = snapshot.unique_yield_share if snapshot.yield_samples >= MIN_YIELD_SAMPLES else None
+            if p95 is None:
+                decision, reason = "kept", "insufficient_latency_history"
+            elif p95 > budget_ms:
+                decision = "deprioritized" if user_selected else "pruned"
+                reason = "over_latency_budget"
+            elif share is not None and share < LOW_UNIQUE_YIELD_SHARE:
+                decision, reason = "deprioritized", "low_unique_yield"
+            else:
+                decision, reason = "kept", "within_latency_budget"
+            decisions[source] = {
+                "decision": decision,
+                "reason": reason,
+                "latency_budget_ms": budget_ms,
+                "p95_latency_ms": None if p95 is None else round(p95, 1),
+                "latency_samples": snapshot.latency_samples,
+                "unique_yield_share": None if share is None else round(share, 3),
+                "yield_samples": snapshot.yield_samples,
+                "query_kind": query_kind,
+            }
+
+        if decisions and all(entry["decision"] == "pruned" for entry in decisions.values()):
+            fastest = min(decisions, key=lambda source: decisions[source]["p95_latency_ms"])
+            decisions[fastest].update(decision="deprioritized", reason="over_latency_budget_last_source")
+
+        def _decision(source: str) -> str:
+            return decisions[source]["decision"] if source in decisions else "kept"
+
+        kept = [source for source in sources if _decision(source) == "kept"]
+        deprioritized = [source for source in sources if _decision(source) == "deprioritized"]
+        return kept + deprioritized, decisions
+
+    @staticmethod
+    def results_are_sufficient(
+        unique_count: int,
+        limit: int,
+        pending_sources: Collection[str],
+        *,
+        tracker: SourcePerformanceTracker,
+        query_kind: str,
+    ) -> bool:
+        """Whether a search may stop waiting for its still-pending sources.
+
+        True once the merged unique candidates exceed the limit by
+        ``EARLY_RETURN_MARGIN`` and the pending sources have, together,
+        historically contributed at most ``EARLY_RETURN_MAX_PENDING_YIELD`` of
+        the unique articles for this kind of query. A pending source without
+        enough yield history counts as a possible large contribution, so
+        sources are only cut short once they have been observed in full.
+        """
+        if not pending_sources or unique_count < math.ceil(limit * EARLY_RETURN_MARGIN):
+            return False
+        pending_yield = 0.0
+        for source in pending_sources:
+            snapshot = tracker.snapshot(source, query_kind)
+            if snapshot.yield_samples < MIN_YIELD_SAMPLES or snapshot.unique_yield_share is None:
+                return False
+            pending_yield += snapshot.unique_yield_share
+        return pending_yield <= EARLY_RETURN_MAX_PENDING_YIELD
+
+    @staticmethod
+    def result_cache_key(plan: UnifiedSearchPlan) -> str:
+        """Stable key of everything in a plan that shapes its ranked result set.
+
+        Covers the dispatched queries and sources, retrieval mode, filters,
+        limit, ranking configuration and the options that change retrieval,
+        enrichment or filtering. Presentation-only options (output format,
+        compact output, analysis sections) are deliberately left out so they
+        can share one cached result set.
+        """
+        request = plan.request
+        canonical = {
+            "query": plan.query,
+            "provider_neutral_query": plan.provider_neutral_query,
+            "user_sources": plan.user_sources,
+            "dispatch_sources": plan.dispatch_sources,
+            "retrieval_mode": request.retrieval_mode,
+            "min_year": plan.effective_min_year,
+            "max_year": plan.effective_max_year,
+            "filters": request.advanced_filters,
+            "limit": request.limit,
+            "ranking": asdict(plan.ranking_config),
+            "peer_reviewed_only": request.peer_reviewed_only,
+            "include_preprints": request.include_preprints,
+            "include_oa_links": request.include_oa_links,
+            "auto_relax": request.auto_relax,
+            "deep_search": request.deep_search,
+            "latency_budget_ms": request.latency_budget_ms,
+            # Deep searches ignore early_return (see _retrieve_source_candidates)
+            "early_return": request.early_return and not plan.uses_deep_search,
+            "deep_strategies": [
+                [strategy.name, strategy.source, strategy.query, strategy.priority] for strategy in plan.deep_strategies
+            ],
+        }
+        encoded = json.dumps(canonical, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
 
 # ============================================================================
 # Composite Parameter Parsers (Agent-Centric Design)
@@ -375,6 +524,8 @@ _OPTION_FLAGS: dict[str, tuple[str, bool]] = {
     "native_semantic": ("native_semantic", True),
     "native-semantic": ("native_semantic", True),
     "systematic": ("systematic_search", True),
+    "early_return": ("early_return", True),
+    "early-return": ("early_return", True),
     # Turn OFF features (default ON)
     "all_types": ("peer_reviewed_only", False),
     "no_peer_review": ("peer_reviewed_only", False),
@@ -385,6 +536,7 @@ _OPTION_FLAGS: dict[str, tuple[str, bool]] = {
     "no_provenance": ("include_section_provenance", False),
     "no_relax": ("auto_relax", False),
     "shallow": ("deep_search", False),
+    "no_cache": ("use_result_cache", False),
 }
 _COMPACT_OPTION_FLAGS = {"compact", "minimal"}
 _COMPACT_OPTION_DEFAULTS: dict[str, bool] = {
@@ -397,26 +549,53 @@ _COMPACT_OPTION_DEFAULTS: dict[str, bool] = {
 }
 
 
-def _parse_options_detailed(options_str: str | None) -> tuple[dict[str, bool], tuple[str, ...]]:
-    """Parse option flags while retaining unknown tokens for validation."""
+# Options that carry a value ("name=value" or "name:value") and their allowed range
+_VALUE_OPTIONS: dict[str, tuple[int, int]] = {
+    "latency_budget_ms": (100, 120_000),
+    "speculative_relax": (2, 6),
+}
+
+
+def _parse_options_detailed(
+    options_str: str | None,
+) -> tuple[dict[str, bool], dict[str, int], tuple[str, ...]]:
+    """Parse option flags and value options while retaining unknown tokens for validation.
+
+    Returns:
+        Tuple of (boolean flags by internal key, integer value options by
+        name, diagnostics)
+    """
     if not options_str:
-        return {}, ()
+        return {}, {}, ()
 
     flags = {flag.strip().lower() for flag in options_str.split(",") if flag.strip()}
     result: dict[str, bool] = {}
+    values: dict[str, int] = {}
     diagnostics: list[str] = []
     for flag in flags:
-        if flag in _COMPACT_OPTION_FLAGS:
+        name, separator, raw_value = flag.replace(":", "=", 1).partition("=")
+        name = name.strip()
+        if separator and name in _VALUE_OPTIONS:
+            low, high = _VALUE_OPTIONS[name]
+            try:
+                value = int(raw_value.strip())
+            except ValueError:
+                value = None
+            if value is None or not low <= value <= high:
+                diagnostics.append(f"{name} must be an integer from {low} to {high}")
+            else:
+                values[name] = value
+        elif flag in _COMPACT_OPTION_FLAGS:
             result.update(_COMPACT_OPTION_DEFAULTS)
         elif flag in _OPTION_FLAGS:
             internal_key, value = _OPTION_FLAGS[flag]
             result[internal_key] = value
         else:
             diagnostics.append(f"unknown option '{flag}'")
-    return result, tuple(diagnostics)
+    return result, values, tuple(diagnostics)
 
 
-def _parse_options(options_str: str | None) -> dict[str, bool]:
+def _parse_options(options_str: str | None) -> dict[str, bool | int]:
     """Parse composite options string into boolean flags.
 
     Format: "flag1, flag2, ..."
@@ -428,6 +607,7 @@ def _parse_options(options_str: str | None) -> dict[str, bool]:
         counts_first   → front-load source counts and next-tool recommendations
         native_semantic → use a provider's native semantic retrieval capability
         systematic     → prefer reproducible bulk/cursor retrieval capabilities
+        early_return   → stop waiting for straggler sources once results suffice
         all_types      → include non-peer-reviewed articles
         no_oa          → skip Unpaywall OA link enrichment
         no_analysis    → hide query analysis section in output
@@ -437,14 +617,22 @@ def _parse_options(options_str: str | None) -> dict[str, bool]:
         no_provenance  → hide structured section provenance
         no_relax       → disable auto-relaxation on 0 results
         shallow        → disable deep search (faster, keyword-only)
+        no_cache       → bypass the result-set cache and query sources again
+
+    Supported value options:
+        latency_budget_ms=N → skip auto-dispatched sources whose live p95
+                              latency exceeds N ms and cap source calls at N ms
+        speculative_relax=K → count the first K auto-relaxation levels
+                              concurrently, then fetch only the first with hits
 
     Returns:
-        Dict with boolean values for each recognized flag.
+        Dict with boolean values for each recognized flag (integers for value options).
     """
-    result, diagnostics = _parse_options_detailed(options_str)
+    flags, values, diagnostics = _parse_options_detailed(options_str)
     if diagnostics:
-        available = sorted([*_OPTION_FLAGS.keys(), *_COMPACT_OPTION_FLAGS])
+        available = sorted([*_OPTION_FLAGS.keys(), *_COMPACT_OPTION_FLAGS, *_VALUE_OPTIONS])
         logger.warning("%s (available: %s)", "; ".join(diagnostics), ", ".join(available))
+    result: dict[str, bool | int] = {**flags, **values}
     return result
 
 
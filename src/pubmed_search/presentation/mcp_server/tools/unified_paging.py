@@ -0,0 +1,265 @@
+"""Cursor paging over materialized unified_search result sets.
+
+Design:
+    unified_search ranks only its first page (a top-k selection) and keeps
+    every deduplicated candidate in the result-set cache (canonical article
+    keys and scores, see infrastructure/cache/result_set_cache.py): the
+    ranked page first, then the unranked rest. The first response returns
+    ``limit`` articles plus an opaque ``next_cursor`` in
+    ``search_status.page``; passing that cursor back serves the following
+    page straight from the cached set, without provider calls or
+    aggregation. The first cursor that reaches past the ranked prefix ranks
+    the remaining candidates once and stores the set back, so searches nobody
+    pages through never pay for a full ranking. Pages are bounded by the
+    candidate pool the original search retrieved; a cursor stops working
+    once its result set expires.
+
+Maintenance:
+    The cursor encodes only the result-set key and the rank offset. Keep page
+    formatting on the same JSON/TOON/Markdown formatters as full searches so
+    paged responses stay shape-compatible with the first page.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import logging
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, Union
+
+from pubmed_search.application.search.result_aggregator import ResultAggregator
+from pubmed_search.infrastructure.cache.result_set_cache import get_result_set_cache
+from pubmed_search.shared.article_identity import canonical_article_key
+
+from .agent_output import is_structured_output_format
+from .tool_response import ResponseFormatter
+from .unified_enrichment import _enrich_with_similarity_scores
+from .unified_formatting import _format_as_json, _format_unified_results
+from .unified_request import normalize_unified_search_request
+
+if TYPE_CHECKING:
+    from pubmed_search.infrastructure.cache.result_set_cache import ResultSetCache
+
+    from .unified_execution import UnifiedSearchExecutionResult
+
+logger = logging.getLogger(__name__)
+
+_CURSOR_VERSION = "p1"
+_RESULT_SET_KEY_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Position in a cached ranked result set."""
+
+    result_set_key: str
+    offset: int
+
+    def encode(self) -> str:
+        """Opaque, URL-safe cursor string."""
+        raw = f"{_CURSOR_VERSION}:{self.result_set_key}:{self.offset}".encode("ascii")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> PageCursor:
+        """Parse a cursor produced by ``encode``; raise ValueError if it is malformed."""
+        text = cursor.strip()
+        try:
+            raw = base64.urlsafe_b64decode(text + "=" * (-len(text) % 4)).decode("ascii")
+        except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+            msg = "invalid cursor"
+            raise ValueError(msg) from exc
+        version, _, rest = raw.partition(":")
+        result_set_key, _, offset = rest.partition(":")
+        if version != _CURSOR_VERSION or not _RESULT_SET_KEY_PATTERN.fullmatch(result_set_key) or not offset.isdigit():
+            msg = "invalid cursor"
+            raise ValueError(msg)
+        return cls(result_set_key=result_set_key, offset=int(offset))
+
+
+def build_page_status(result_set_key: str | None, *, offset: int, returned: int, total: int) -> dict[str, Any]:
+    """``search_status.page`` entry: the window served and the cursor of the next one."""
+    next_offset = offset + returned
+    next_cursor = None
+    if result_set_key is not None and returned > 0 and next_offset < total:
+        next_cursor = PageCursor(result_set_key, next_offset).encode()
+    return {
+        "offset": offset,
+        "returned": returned,
+        "total_candidates": total,
+        "has_more": next_cursor is not None,
+        "next_cursor": next_cursor,
+    }
+
+
+def execution_page_status(execution: UnifiedSearchExecutionResult) -> dict[str, Any] | None:
+    """Page entry of a full search, or None when its candidates were not materialized."""
+    result_set_key = getattr(execution, "result_set_key", None)
+    if result_set_key is None:
+        return None
+    return build_page_status(
+        result_set_key,
+        offset=0,
+        returned=len(execution.ranked),
+        total=execution.total_candidates,
+    )
+
+
+def page_markdown_note(page: dict[str, Any] | None, query: str) -> str:
+    """Markdown footer pointing at the next page, if there is one."""
+    if not page or not page.get("next_cursor"):
+        return ""
+    remaining = page["total_candidates"] - page["offset"] - page["returned"]
+    escaped_query = query.replace("\\", "\\\\").replace('"', '\\"')
+    return (
+        f"\n\n**More results**: {remaining} more ranked candidates. Next page (no new source calls): "
+        f'`unified_search(query="{escaped_query}", cursor="{page["next_cursor"]}")`'
+    )
+
+
+def _rank_cached_tail(cache: ResultSetCache, result_set_key: str) -> None:
+    """Rank the unranked candidates of a cached result set and store the set back.
+
+    The ranked prefix already served as earlier pages keeps its order and
+    scores; the full ranking only orders the candidates after it.
+    """
+    cached = cache.get(result_set_key)
+    if cached is None:
+        return
+    articles, metadata = cached
+    config = metadata["ranking_config"]
+    prefix = articles[: metadata["ranked_count"]]
+    prefix_keys = {canonical_article_key(article) for article in prefix}
+    # Ranking re-scores every article in place; the served prefix keeps its scores.
+    prefix_scores = [(article.ranking_score, article.relevance_score, article.quality_score) for article in prefix]
+    tail = [
+        article
+        for article in ResultAggregator(config).rank(articles, config, metadata["query"])
+        if canonical_article_key(article) not in prefix_keys
+    ]
+    for article, (ranking_score, relevance_score, quality_score) in zip(prefix, prefix_scores):
+        article.ranking_score = ranking_score
+        article.relevance_score = relevance_score
+        article.quality_score = quality_score
+    metadata["ranked_count"] = len(prefix) + len(tail)
+    cache.put(result_set_key, prefix + tail, metadata)
+
+
+async def run_unified_search_page(
+    *,
+    cursor: str,
+    query: str,
+    limit: Union[int, str] = 10,
+    output_format: Literal["markdown", "json", "toon"] = "markdown",
+    options: Union[str, None] = None,
+) -> str:
+    """Serve one page of a cached unified_search result set.
+
+    ``limit`` sets the page size and ``options``/``output_format`` control
+    presentation; the query, sources, filters and ranking are those of the
+    search that produced the cursor.
+    """
+    try:
+        page_cursor = PageCursor.decode(cursor)
+    except ValueError as exc:
+        return ResponseFormatter.error(
+            str(exc),
+            suggestion="Pass the next_cursor value from a previous unified_search response unchanged.",
+            tool_name="unified_search",
+            output_format=output_format,
+        )
+
+    try:
+        request = normalize_unified_search_request(
+            query=query or "cursor",
+            limit=limit,
+            output_format=output_format,
+            options=options,
+        )
+    except ValueError as exc:
+        return ResponseFormatter.error(
+            str(exc),
+            suggestion="Correct the invalid limit or options and retry with the same cursor.",
+            tool_name="unified_search",
+            output_format=output_format,
+        )
+
+    cache = get_result_set_cache()
+    cached_page = cache.get_page(page_cursor.result_set_key, page_cursor.offset, request.limit)
+    if cached_page is not None:
+        _articles, cached_metadata, total = cached_page
+        if cached_metadata["ranked_count"] < min(page_cursor.offset + request.limit, total):
+            logger.info("Ranking the unranked tail of a cached result set (offset %s)", page_cursor.offset)
+            _rank_cached_tail(cache, page_cursor.result_set_key)
+            cached_page = cache.get_page(page_cursor.result_set_key, page_cursor.offset, request.limit)
+    if cached_page is None:
+        return ResponseFormatter.error(
+            "cursor expired: the cached result set is no longer available",
+            suggestion="Re-run the original unified_search call (without cursor) to rebuild the result set.",
+            tool_name="unified_search",
+            output_format=output_format,
+        )
+    articles, metadata, total = cached_page
+    outcome = metadata["source_outcome"]
+    analysis = metadata["analysis"]
+    logger.info("Serving cached result-set page: offset=%s, size=%s", page_cursor.offset, len(articles))
+
+    if request.include_similarity_scores:
+        _enrich_with_similarity_scores(articles, metadata["query"])
+    page = build_page_status(
+        page_cursor.result_set_key,
+        offset=page_cursor.offset,
+        returned=len(articles),
+        total=total,
+    )
+
+    if is_structured_output_format(request.output_format):
+        return _format_as_json(
+            articles,
+            analysis,
+            outcome["stats"],
+            outcome["relaxation_result"],
+            outcome["deep_search_metrics"],
+            source_api_counts=outcome["source_api_counts"] or None,
+            source_metadata=outcome["source_metadata"],
+            source_statuses=outcome["source_statuses"],
+            counts_first=request.counts_first,
+            compact_output=request.compact_output,
+            include_analysis=request.show_analysis,
+            include_similarity_scores=request.include_similarity_scores,
+            include_next_tools=request.include_next_tools,
+            include_section_provenance=request.include_section_provenance,
+            output_format=request.output_format,
+            cache_status="hit",
+            page=page,
+            early_return=outcome["early_return"],
+        )
+
+    markdown_response = await _format_unified_results(
+        articles,
+        analysis,
+        outcome["stats"],
+        request.show_analysis,
+        outcome["pubmed_total_count"],
+        include_trials=False,
+        include_similarity_scores=request.include_similarity_scores,
+        original_query=analysis.original_query,
+        relaxation_result=outcome["relaxation_result"],
+        deep_search_metrics=outcome["deep_search_metrics"],
+        source_api_counts=outcome["source_api_counts"] or None,
+        source_metadata=outcome["source_metadata"],
+        counts_first=request.counts_first,
+        first_rank=page_cursor.offset + 1,
+    )
+    return markdown_response + page_markdown_note(page, analysis.original_query)
+
+
+__all__ = [
+    "PageCursor",
+    "build_page_status",
+    "execution_page_status",
+    "page_markdown_note",
+    "run_unified_search_page",
+]
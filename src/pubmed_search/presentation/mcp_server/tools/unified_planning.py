@@ -17,12 +17,13 @@ import asyncio
 import logging
 import re
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any
 
 from pubmed_search.application.search.query_analyzer import AnalyzedQuery, QueryAnalyzer
 from pubmed_search.application.search.result_aggregator import RankingConfig
 from pubmed_search.application.search.semantic_enhancer import EnhancedQuery, SearchPlan, get_semantic_enhancer
+from pubmed_search.application.search.source_performance import get_source_performance_tracker
 from pubmed_search.infrastructure.sources.registry import SourceSelectionError, get_source_registry
 
 from .unified_helpers import DispatchStrategy, detect_and_expand_icd_codes
@@ -52,6 +53,13 @@ class UnifiedSearchPlan:
     ranking_config: RankingConfig
     effective_min_year: int | None
     effective_max_year: int | None
+    # Per primary source: latency-budget dispatch decision (latency_budget_ms option)
+    dispatch_decisions: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def uses_deep_search(self) -> bool:
+        """Whether execution runs the multi-strategy deep search instead of one call per source."""
+        return bool(self.request.deep_search and self.enhanced_query and self.deep_strategies)
 
 
 def _build_provider_neutral_icd_query(
@@ -206,6 +214,7 @@ async def build_unified_search_plan(
     analyzer_factory: Callable[[], QueryAnalyzer] = QueryAnalyzer,
     enhancer_factory: Callable[[], Any] = get_semantic_enhancer,
     source_registry_factory: Callable[[], Any] = get_source_registry,
+    source_performance_factory: Callable[[], Any] = get_source_performance_tracker,
 ) -> UnifiedSearchPlan:
     """Analyze the query and resolve an execution plan."""
     query = request.query
@@ -288,6 +297,24 @@ async def build_unified_search_plan(
         registry=registry,
     )
 
+    dispatch_decisions: dict[str, dict[str, Any]] = {}
+    if request.latency_budget_ms is not None:
+        dispatch_sources, dispatch_decisions = DispatchStrategy.apply_latency_budget(
+            dispatch_sources,
+            request.latency_budget_ms,
+            tracker=source_performance_factory(),
+            query_kind=DispatchStrategy.get_auto_dispatch_profile(analysis),
+            primary_sources={
+                source
+                for source in dispatch_sources
+                if (definition := registry.get(source)) is not None and definition.supports_primary_search
+            },
+            user_selected=user_sources is not None,
+        )
+        pruned = [source for source, entry in dispatch_decisions.items() if entry["decision"] == "pruned"]
+        if pruned:
+            logger.info("Latency budget %sms pruned sources: %s", request.latency_budget_ms, pruned)
+
     deep_strategies = _build_deep_strategies(
         query=query,
         provider_neutral_query=provider_neutral_query,
@@ -325,6 +352,7 @@ async def build_unified_search_plan(
         ranking_config=ranking_config,
         effective_min_year=request.min_year or analysis.year_from,
         effective_max_year=request.max_year or analysis.year_to,
+        dispatch_decisions=dispatch_decisions,
     )
 
 
@@ -54,6 +54,10 @@ class UnifiedSearchRequest:
     peer_reviewed_only: bool
     auto_relax: bool
     deep_search: bool
+    use_result_cache: bool = True
+    latency_budget_ms: int | None = None
+    early_return: bool = False
+    speculative_relax: int | None = None
 
     @property
     def retrieval_mode(self) -> Literal["auto", "semantic", "systematic"]:
@@ -120,7 +124,7 @@ def normalize_unified_search_request(
         raise ValueError(msg)
 
     parsed_filters, filter_diagnostics = _parse_filters_detailed(filters)
-    parsed_options, option_diagnostics = _parse_options_detailed(options)
+    parsed_options, option_values, option_diagnostics = _parse_options_detailed(options)
     diagnostics = (*filter_diagnostics, *option_diagnostics)
     if diagnostics:
         msg = "Invalid unified_search input: " + "; ".join(diagnostics)
@@ -167,6 +171,12 @@ def normalize_unified_search_request(
         # change both recall semantics and source provenance.
         auto_relax=False if systematic_search else parsed_options.get("auto_relax", True),
         deep_search=False if explicit_provider_mode else parsed_options.get("deep_search", True),
+        use_result_cache=parsed_options.get("use_result_cache", True),
+        latency_budget_ms=option_values.get("latency_budget_ms"),
+        # Cutting sources short trades recall for latency, which a systematic
+        # plan's completeness contract does not allow.
+        early_return=False if systematic_search else parsed_options.get("early_return", False),
+        speculative_relax=option_values.get("speculative_relax"),
     )
 
 
@@ -34,6 +34,7 @@ from .tool_response import ResponseFormatter
 from .tool_runtime import safe_report_progress
 from .unified_execution import execute_unified_search
 from .unified_formatting import _format_as_json, _format_unified_results
+from .unified_paging import execution_page_status, page_markdown_note, run_unified_search_page
 from .unified_pipeline import _execute_pipeline_mode_outcome
 from .unified_planning import build_unified_search_plan
 from .unified_request import normalize_unified_search_request
@@ -161,6 +162,95 @@ def persist_unified_search_artifact(
     )
 
 
+def default_search_functions(searcher: LiteratureSearcher) -> dict[str, Any]:
+    """Source adapters used by unified_search when no search functions are injected."""
+    return {
+        "pubmed": lambda search_query, search_limit, min_year, max_year, advanced_filters: _search_pubmed_adapter(
+            searcher,
+            search_query,
+            search_limit,
+            min_year,
+            max_year,
+            advanced_filters,
+        ),
+        "openalex": lambda search_query, search_limit, min_year, max_year, advanced_filters: _search_openalex_adapter(
+            search_query,
+            search_limit,
+            min_year,
+            max_year,
+            advanced_filters,
+        ),
+        "europe_pmc": lambda search_query,
+        search_limit,
+        min_year,
+        max_year,
+        advanced_filters: _search_europe_pmc_adapter(
+            search_query,
+            search_limit,
+            min_year,
+            max_year,
+            advanced_filters,
+        ),
+        "semantic_scholar": lambda search_query,
+        search_limit,
+        min_year,
+        max_year,
+        advanced_filters: _search_semantic_scholar_adapter(
+            search_query,
+            search_limit,
+            min_year,
+            max_year,
+            advanced_filters,
+        ),
+        "core": lambda search_query, search_limit, min_year, max_year, advanced_filters: _search_core_adapter(
+            search_query,
+            search_limit,
+            min_year,
+            max_year,
+            advanced_filters,
+        ),
+        "scopus": lambda search_query, search_limit, min_year, max_year, advanced_filters: _search_scopus_adapter(
+            search_query,
+            search_limit,
+            min_year,
+            max_year,
+            advanced_filters,
+        ),
+        "web_of_science": lambda search_query,
+        search_limit,
+        min_year,
+        max_year,
+        advanced_filters: _search_web_of_science_adapter(
+            search_query,
+            search_limit,
+            min_year,
+            max_year,
+            advanced_filters,
+        ),
+        "arxiv": lambda search_query, search_limit, min_year, max_year, advanced_filters: _search_arxiv_adapter(
+            search_query,
+            search_limit,
+            min_year,
+            max_year,
+            advanced_filters,
+        ),
+        "medrxiv": lambda search_query, search_limit, min_year, max_year, advanced_filters: _search_medrxiv_adapter(
+            search_query,
+            search_limit,
+            min_year,
+            max_year,
+            advanced_filters,
+        ),
+        "biorxiv": lambda search_query, search_limit, min_year, max_year, advanced_filters: _search_biorxiv_adapter(
+            search_query,
+            search_limit,
+            min_year,
+            max_year,
+            advanced_filters,
+        ),
+    }
+
+
 async def run_unified_search(
     *,
     searcher: LiteratureSearcher,
@@ -174,6 +264,7 @@ async def run_unified_search(
     pipeline: Union[str, None] = None,
     dry_run: bool = False,
     stop_at: str = "",
+    cursor: str = "",
     ctx: Context | None = None,
     analyzer_factory: Callable[[], Any] = QueryAnalyzer,
     enhancer_factory: Callable[[], Any] = get_semantic_enhancer,
@@ -195,6 +286,15 @@ async def run_unified_search(
     async def _progress(progress: float, total: float, message: str) -> None:
         await safe_report_progress(ctx, progress, total, message)
 
+    if cursor:
+        return await run_unified_search_page(
+            cursor=cursor,
+            query=query,
+            limit=limit,
+            output_format=output_format,
+            options=options,
+        )
+
     journal: SearchRunJournal | None = None
     try:
         if pipeline:
@@ -361,112 +461,7 @@ async def run_unified_search(
             searcher,
             progress=_progress,
             ctx=ctx,
-            search_functions=search_functions
-            or {
-                "pubmed": lambda search_query,
-                search_limit,
-                min_year,
-                max_year,
-                advanced_filters: _search_pubmed_adapter(
-                    searcher,
-                    search_query,
-                    search_limit,
-                    min_year,
-                    max_year,
-                    advanced_filters,
-                ),
-                "openalex": lambda search_query,
-                search_limit,
-                min_year,
-                max_year,
-                advanced_filters: _search_openalex_adapter(
-                    search_query,
-                    search_limit,
-                    min_year,
-                    max_year,
-                    advanced_filters,
-                ),
-                "europe_pmc": lambda search_query,
-                search_limit,
-                min_year,
-                max_year,
-                advanced_filters: _search_europe_pmc_adapter(
-                    search_query,
-                    search_limit,
-                    min_year,
-                    max_year,
-                    advanced_filters,
-                ),
-                "semantic_scholar": lambda search_query,
-                search_limit,
-                min_year,
-                max_year,
-                advanced_filters: _search_semantic_scholar_adapter(
-                    search_query,
-                    search_limit,
-                    min_year,
-                    max_year,
-                    advanced_filters,
-                ),
-                "core": lambda search_query, search_limit, min_year, max_year, advanced_filters: _search_core_adapter(
-                    search_query,
-                    search_limit,
-                    min_year,
-                    max_year,
-                    advanced_filters,
-                ),
-                "scopus": lambda search_query,
-                search_limit,
-                min_year,
-                max_year,
-                advanced_filters: _search_scopus_adapter(
-                    search_query,
-                    search_limit,
-                    min_year,
-                    max_year,
-                    advanced_filters,
-                ),
-                "web_of_science": lambda search_query,
-                search_limit,
-                min_year,
-                max_year,
-                advanced_filters: _search_web_of_science_adapter(
-                    search_query,
-                    search_limit,
-                    min_year,
-                    max_year,
-                    advanced_filters,
-                ),
-                "arxiv": lambda search_query, search_limit, min_year, max_year, advanced_filters: _search_arxiv_adapter(
-                    search_query,
-                    search_limit,
-                    min_year,
-                    max_year,
-                    advanced_filters,
-                ),
-                "medrxiv": lambda search_query,
-                search_limit,
-                min_year,
-                max_year,
-                advanced_filters: _search_medrxiv_adapter(
-                    search_query,
-                    search_limit,
-                    min_year,
-                    max_year,
-                    advanced_filters,
-                ),
-                "biorxiv": lambda search_query,
-                search_limit,
-                min_year,
-                max_year,
-                advanced_filters: _search_biorxiv_adapter(
-                    search_query,
-                    search_limit,
-                    min_year,
-                    max_year,
-                    advanced_filters,
-                ),
-            },
+            search_functions=search_functions or default_search_functions(searcher),
             timeline_builder_cls=timeline_builder_cls,
             research_tree_builder=research_tree_builder,
         )
@@ -514,6 +509,9 @@ async def run_unified_search(
                 output_format=request.output_format,
                 artifact_manifest=artifact,
                 search_run_handoff=search_run_handoff,
+                cache_status=execution.cache_status,
+                page=execution_page_status(execution),
+                early_return=execution.early_return,
             )
 
         markdown_response = await _format_unified_results(
@@ -550,7 +548,12 @@ async def run_unified_search(
             journal.warnings.append("Search artifact persistence failed")
         completed_run = await journal.complete(execution, artifact=artifact)
         await notify_session_resources_updated(ctx)
-        return markdown_response + artifact_markdown_note(artifact) + search_run_markdown_note(completed_run)
+        return (
+            markdown_response
+            + page_markdown_note(execution_page_status(execution), plan.analysis.original_query)
+            + artifact_markdown_note(artifact)
+            + search_run_markdown_note(completed_run)
+        )
 
     except asyncio.CancelledError:
         if journal is not None:
@@ -589,4 +592,9 @@ def make_mcp_unified_search_runner(
     return _runner
 
 
-__all__ = ["make_mcp_unified_search_runner", "persist_unified_search_artifact", "run_unified_search"]
+__all__ = [
+    "default_search_functions",
+    "make_mcp_unified_search_runner",
+    "persist_unified_search_artifact",
+    "run_unified_search",
+]
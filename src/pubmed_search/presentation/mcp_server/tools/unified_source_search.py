@@ -48,6 +48,7 @@ from pubmed_search.shared.source_contracts import (
 
 from .unified_helpers import (
     RelaxationResult,
+    RelaxationStep,
     SearchDepthMetrics,
     StrategyResult,
     _generate_relaxation_steps,
@@ -105,6 +106,35 @@ def _require_result_list(value: object, *, service: str) -> list[Any]:
 # ============================================================================
 
 
+async def _count_empty_relaxation_levels(searcher: LiteratureSearcher, steps: list[RelaxationStep]) -> int:
+    """Count the leading relaxation levels that PubMed reports as empty.
+
+    All levels are counted concurrently with count-only ESearch calls. The
+    scan stops at the first level with hits or whose count failed, so the
+    caller never skips a level that might have returned articles.
+    """
+    counts = await asyncio.gather(
+        *(
+            searcher.search_count(
+                step.query,
+                step.min_year,
+                step.max_year,
+                **{key: value for key, value in step.advanced_filters.items() if not key.startswith("_")},
+            )
+            for step in steps
+        ),
+        return_exceptions=True,
+    )
+    empty = 0
+    for step, count in zip(steps, counts, strict=True):
+        if not isinstance(count, int) or count:
+            if isinstance(count, BaseException):
+                logger.warning("Relaxation level %s count failed (%s)", step.level, type(count).__name__)
+            break
+        empty += 1
+    return empty
+
+
 async def _auto_relax_search(
     searcher: LiteratureSearcher,
     query: str,
@@ -112,11 +142,19 @@ async def _auto_relax_search(
     min_year: int | None,
     max_year: int | None,
     advanced_filters: dict,
+    *,
+    speculative_levels: int = 0,
 ) -> RelaxationResult | None:
     """Progressively relax search query until results are found.
 
     Only re-searches PubMed (primary source) for efficiency.
 
+    With *speculative_levels* > 1, the first that many levels are counted
+    concurrently first (``retmax=0``). Leading levels with no hits are
+    recorded as tried without a records search, and the sequential search
+    resumes at the least-relaxed level that has hits, so the chosen level
+    and the steps reported are the same as without speculation.
+
     Returns:
         RelaxationResult if relaxation was attempted, None if no steps available.
     """
@@ -133,7 +171,16 @@ async def _auto_relax_search(
         total_results=0,
     )
 
-    for step in steps:
+    first_step = 0
+    if speculative_levels > 1:
+        first_step = await _count_empty_relaxation_levels(searcher, steps[:speculative_levels])
+        for step in steps[:first_step]:
+            step.result_count = 0
+            result.steps_tried.append(step)
+        if first_step:
+            logger.info("Speculative relaxation: %s level(s) have no PubMed hits by count", first_step)
+
+    for step in steps[first_step:]:
         try:
             articles, total_count = await _search_pubmed(
                 searcher,
@@ -38,6 +38,7 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "gather_with_errors": ("pubmed_search.shared.async_utils", "gather_with_errors"),
     "batch_process": ("pubmed_search.shared.async_utils", "batch_process"),
     "CircuitBreaker": ("pubmed_search.shared.async_utils", "CircuitBreaker"),
+    "circuit_breaker_states": ("pubmed_search.shared.async_utils", "circuit_breaker_states"),
     "get_shared_async_client": ("pubmed_search.shared.async_utils", "get_shared_async_client"),
     "close_shared_async_client": ("pubmed_search.shared.async_utils", "close_shared_async_client"),
     "timeout_with_fallback": ("pubmed_search.shared.async_utils", "timeout_with_fallback"),
@@ -46,6 +47,9 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "normalize_article_doi": ("pubmed_search.shared.article_identity", "normalize_article_doi"),
     "normalize_article_identifier": ("pubmed_search.shared.article_identity", "normalize_article_identifier"),
     "normalize_article_title": ("pubmed_search.shared.article_identity", "normalize_article_title"),
+    # String interning
+    "InternTable": ("pubmed_search.shared.string_interning", "InternTable"),
+    "get_intern_table": ("pubmed_search.shared.string_interning", "get_intern_table"),
     # Settings
     "AppSettings": ("pubmed_search.shared.settings", "AppSettings"),
     "get_settings": ("pubmed_search.shared.settings", "get_settings"),
@@ -21,15 +21,16 @@ Note:
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import logging
 import random
 import time
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from typing import TYPE_CHECKING, Any, TypeVar
-from weakref import WeakKeyDictionary
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
 from typing_extensions import Self
 
@@ -40,7 +41,9 @@ from .exceptions import (
 
 if TYPE_CHECKING:
     from asyncio import AbstractEventLoop
-    from collections.abc import AsyncIterator, Awaitable, Callable, MutableMapping, Sequence
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, MutableMapping, Sequence
+
+    from .circuit_breaker_store import BreakerRecord, CircuitBreakerStore
 
 logger = logging.getLogger(__name__)
 
@@ -175,6 +178,9 @@ class RateLimiter:
     _tokens: float = field(init=False)
     _last_update: float = field(init=False)
     _cooldown_until: float = field(init=False, default=0.0)
+    _quota_interval: float = field(init=False, default=0.0)
+    _quota_until: float = field(init=False, default=0.0)
+    _last_grant: float = field(init=False, default=0.0)
     _lock: asyncio.Lock = field(init=False, default_factory=asyncio.Lock)
 
     def __post_init__(self) -> None:
@@ -195,6 +201,16 @@ class RateLimiter:
                 await asyncio.sleep(wait_time)
                 now = time.monotonic()
 
+            if self._quota_interval > 0.0:
+                if now >= self._quota_until:
+                    self._quota_interval = 0.0
+                else:
+                    wait_time = self._last_grant + self._quota_interval - now
+                    if wait_time > 0:
+                        logger.debug(f"Quota pacing: waiting {wait_time:.2f}s")
+                        await asyncio.sleep(wait_time)
+                        now = time.monotonic()
+
             elapsed = now - self._last_update
             self._tokens = min(self.rate, self._tokens + elapsed * (self.rate / self.per))
             self._last_update = now
@@ -214,6 +230,7 @@ class RateLimiter:
                 self._last_update = after_wait
             else:
                 self._tokens -= 1
+            self._last_grant = time.monotonic()
 
     async def apply_cooldown(self, retry_after: float) -> None:
         """Apply a server-directed cooldown window such as Retry-After."""
@@ -223,6 +240,28 @@ class RateLimiter:
         async with self._lock:
             self._cooldown_until = max(self._cooldown_until, time.monotonic() + retry_after)
 
+    def set_quota_pacing(self, interval: float, duration: float) -> None:
+        """Space grants at least *interval* seconds apart for the next *duration* seconds.
+
+        Used to slow down ahead of an upstream quota running out (see
+        :mod:`pubmed_search.shared.rate_limit_headers`). The latest call wins,
+        so pacing relaxes again as soon as the provider reports more headroom;
+        a non-positive *interval* clears it.
+        """
+        if interval <= 0 or duration <= 0:
+            self._quota_interval = 0.0
+            self._quota_until = 0.0
+            return
+        self._quota_interval = interval
+        self._quota_until = time.monotonic() + duration
+
+    @property
+    def quota_interval(self) -> float:
+        """Current quota-driven spacing in seconds (``0.0`` when not pacing)."""
+        if self._quota_interval > 0.0 and time.monotonic() < self._quota_until:
+            return self._quota_interval
+        return 0.0
+
     def reconfigure(self, *, rate: float, per: float = 1.0) -> None:
         """Update limiter throughput for an existing shared limiter."""
         self.rate = rate
@@ -251,6 +290,11 @@ _rate_limiters_no_loop: dict[str, RateLimiter] = {}
 _circuit_breakers_no_loop: dict[str, CircuitBreaker] = {}
 _bulkheads_no_loop: dict[str, asyncio.Semaphore] = {}
 
+# Every live named breaker, whichever loop or client owns it, for operator
+# inspection. Keyed by id() only because breakers are unhashable dataclasses;
+# the weak values drop an entry before its id can be reused.
+_named_breakers: WeakValueDictionary[int, CircuitBreaker] = WeakValueDictionary()
+
 _PrimitiveT = TypeVar("_PrimitiveT")
 
 
@@ -323,19 +367,69 @@ def get_circuit_breaker(
     recovery_timeout: float = 30.0,
     half_open_max_calls: int = 3,
 ) -> CircuitBreaker:
-    """Get or create a shared circuit breaker for a service."""
+    """Get or create a shared circuit breaker for a service.
+
+    When ``PUBMED_CIRCUIT_BREAKER_STORE`` is enabled the breaker also shares
+    its state with other worker processes through the persisted store.
+    """
     table = _loop_scoped(_circuit_breakers, _circuit_breakers_no_loop)
     breaker = table.get(name)
     if breaker is None:
+        from .circuit_breaker_store import get_circuit_breaker_store
+
         breaker = CircuitBreaker(
             failure_threshold=failure_threshold,
             recovery_timeout=recovery_timeout,
             half_open_max_calls=half_open_max_calls,
+            name=name,
+            store=get_circuit_breaker_store(),
         )
         table[name] = breaker
     return breaker
 
 
+_BREAKER_SEVERITY = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def circuit_breaker_states() -> dict[str, dict[str, Any]]:
+    """Report named circuit breakers for operators.
+
+    Breakers live in this process are merged with the records other workers
+    published to the shared store (when enabled). When several local breakers
+    share a name, the most severe one is reported. The top-level ``state`` is
+    the local state if this process has the breaker, else the shared one.
+    """
+    from .circuit_breaker_store import get_circuit_breaker_store
+
+    states: dict[str, dict[str, Any]] = {}
+    for breaker in list(_named_breakers.values()):
+        name = breaker.name or ""
+        age = breaker.last_failure_age()
+        local: dict[str, Any] = {
+            "state": breaker.state,
+            "failure_count": breaker.failure_count,
+            "failure_threshold": breaker.failure_threshold,
+            "recovery_timeout": breaker.recovery_timeout,
+            "last_failure_age_seconds": None if age is None else round(age, 3),
+        }
+        current = states.get(name)
+        if current is not None:
+            previous = current["local"]
+            if (_BREAKER_SEVERITY[local["state"]], local["failure_count"]) <= (
+                _BREAKER_SEVERITY[previous["state"]],
+                previous["failure_count"],
+            ):
+                continue
+        states[name] = {"state": local["state"], "local": local, "shared": None}
+
+    store = get_circuit_breaker_store()
+    if store is not None:
+        for name, record in store.records().items():
+            entry = states.setdefault(name, {"state": record.state, "local": None, "shared": None})
+            entry["shared"] = record.to_dict()
+    return dict(sorted(states.items()))
+
+
 def get_bulkhead(name: str, limit: int) -> asyncio.Semaphore:
     """Get or create a shared concurrency limiter for a service."""
     table = _loop_scoped(_bulkheads, _bulkheads_no_loop)
@@ -396,22 +490,112 @@ def create_async_http_client(
     max_connections: int = 20,
     max_keepalive_connections: int = 10,
     keepalive_expiry: float = 30.0,
+    http2: bool | None = None,
 ) -> Any:
-    """Create a configured httpx.AsyncClient with consistent transport defaults."""
+    """Create a configured httpx.AsyncClient with consistent transport defaults.
+
+    Connection limits apply per origin: the client routes each host to its
+    own pool (see :mod:`pubmed_search.shared.http_pools`) so a slow host
+    cannot starve requests to another.  ``http2=None`` follows the
+    ``PUBMED_HTTP2`` setting.  Proxy environment variables are honoured per
+    origin by that transport.
+
+    When an HTTP cassette is active (see :mod:`pubmed_search.shared.http_cassette`)
+    the client transport records to or replays from it instead of talking to
+    the network directly.
+    """
     import httpx
 
-    return httpx.AsyncClient(
-        timeout=timeout,
-        headers=headers or {},
-        follow_redirects=follow_redirects,
-        limits=httpx.Limits(
+    from .http_cassette import CassetteTransport, get_active_cassette
+    from .http_pools import HostPooledTransport, HostPoolLimits
+    from .settings import get_settings
+
+    settings = get_settings()
+    pooled = HostPooledTransport(
+        limits=HostPoolLimits(
             max_connections=max_connections,
             max_keepalive_connections=max_keepalive_connections,
             keepalive_expiry=keepalive_expiry,
         ),
+        http2=settings.http2_enabled if http2 is None else http2,
+        idle_timeout=settings.http_pool_idle_seconds or None,
+    )
+    transport: httpx.AsyncBaseTransport = pooled
+    cassette = get_active_cassette()
+    if cassette is not None:
+        transport = CassetteTransport(cassette, pooled if cassette.recording else None)
+
+    return httpx.AsyncClient(
+        timeout=timeout,
+        headers=headers or {},
+        follow_redirects=follow_redirects,
+        transport=transport,
     )
 
 
+# =============================================================================
+# Request-scoped Deadlines
+# =============================================================================
+
+_request_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "pubmed_request_deadline",
+    default=None,
+)
+
+
+def get_request_deadline() -> float | None:
+    """Return the ``time.monotonic()`` deadline of the current request, if any."""
+    return _request_deadline.get()
+
+
+def remaining_request_budget() -> float | None:
+    """Seconds left before the current request deadline (``None`` when unbounded)."""
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def _earliest_deadline(first: float | None, second: float | None) -> float | None:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return min(first, second)
+
+
+@contextmanager
+def request_deadline(timeout: float | None) -> Iterator[float | None]:
+    """Bound all nested work in this context to *timeout* seconds from now.
+
+    The deadline lives in a contextvar, so tasks spawned inside the block
+    inherit it.  Nested scopes can only tighten the deadline, never extend
+    it past an enclosing one.  ``timeout=None`` (or ``<= 0``) keeps the
+    enclosing deadline unchanged.
+    """
+    own = time.monotonic() + timeout if timeout is not None and timeout > 0 else None
+    effective = _earliest_deadline(_request_deadline.get(), own)
+    token = _request_deadline.set(effective)
+    try:
+        yield effective
+    finally:
+        _request_deadline.reset(token)
+
+
+def cap_to_request_deadline(deadline: float | None) -> float | None:
+    """Return the earlier of *deadline* and the current request deadline."""
+    return _earliest_deadline(deadline, _request_deadline.get())
+
+
+def clamp_timeout_to_request_deadline(timeout: float | None) -> float | None:
+    """Shrink *timeout* so it never outlives the current request deadline."""
+    remaining = remaining_request_budget()
+    if remaining is None:
+        return timeout
+    remaining = max(0.0, remaining)
+    return remaining if timeout is None else min(timeout, remaining)
+
+
 class TransportExecutionKernel:
     """Unified execution kernel for resilient external operations."""
 
@@ -471,9 +655,8 @@ class TransportExecutionKernel:
 
     @staticmethod
     def _build_deadline(total_timeout: float | None) -> float | None:
-        if total_timeout is None:
-            return None
-        return time.monotonic() + total_timeout
+        own = None if total_timeout is None else time.monotonic() + total_timeout
+        return cap_to_request_deadline(own)
 
     @staticmethod
     def _remaining_budget(deadline: float | None) -> float | None:
@@ -494,6 +677,9 @@ class TransportExecutionKernel:
 
     @staticmethod
     def _budget_message(policy: RequestExecutionPolicy, phase: str) -> str:
+        request_remaining = remaining_request_budget()
+        if request_remaining is not None and (policy.total_timeout is None or request_remaining < policy.total_timeout):
+            return f"{policy.service_name} stopped at the request deadline during {phase}"
         if policy.total_timeout is None:
             return f"{policy.service_name} timed out during {phase}"
         return f"{policy.service_name} exceeded total timeout of {policy.total_timeout:.2f}s during {phase}"
@@ -703,6 +889,11 @@ async def gather_with_errors(
     ``Exception`` instances are returned in place when ``return_exceptions`` is
     enabled; cancellation is always propagated.
 
+    When a request deadline is active (see :func:`request_deadline`), children
+    still running at the deadline are cancelled.  They are reported as
+    :class:`OperationBudgetExceeded` in place when ``return_exceptions`` is
+    enabled; otherwise that error is raised.
+
     Args:
         *coros: Coroutines to execute
         return_exceptions: If True, return exceptions instead of raising
@@ -730,7 +921,10 @@ async def gather_with_errors(
 
     tasks = [asyncio.ensure_future(run(coro)) for coro in coros]
     try:
-        return list(await asyncio.gather(*tasks))
+        remaining = remaining_request_budget()
+        if remaining is None:
+            return list(await asyncio.gather(*tasks))
+        return await _gather_until_deadline(tasks, remaining, return_exceptions=return_exceptions)
     except BaseException:
         for task in tasks:
             if not task.done():
@@ -739,6 +933,40 @@ async def gather_with_errors(
         raise
 
 
+async def _gather_until_deadline(
+    tasks: Sequence[asyncio.Future[T | Exception]],
+    remaining: float,
+    *,
+    return_exceptions: bool,
+) -> list[T | Exception]:
+    """Collect *tasks* in order, abandoning whatever misses the request deadline."""
+    if remaining > 0:
+        _done, pending = await asyncio.wait(tasks, timeout=remaining, return_when=asyncio.FIRST_EXCEPTION)
+    else:
+        pending = {task for task in tasks if not task.done()}
+
+    if not return_exceptions:
+        for task in tasks:
+            error = task.exception() if task.done() and not task.cancelled() else None
+            if error is not None:
+                raise error
+    if pending:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if not return_exceptions:
+            msg = f"{len(pending)} of {len(tasks)} parallel operations ran past the request deadline"
+            raise OperationBudgetExceeded(msg)
+
+    results: list[T | Exception] = []
+    for task in tasks:
+        if task in pending:
+            results.append(OperationBudgetExceeded("Abandoned at the request deadline"))
+        else:
+            results.append(task.result())
+    return results
+
+
 async def batch_process(
     items: Sequence[T],
     processor: Callable[[T], Awaitable[R]],
@@ -748,6 +976,9 @@ async def batch_process(
     """
     Process items in batches with rate limiting.
 
+    Batches that would start after the request deadline are not started;
+    their items are reported as :class:`OperationBudgetExceeded`.
+
     Args:
         items: Items to process
         processor: Async function to process each item
@@ -768,6 +999,14 @@ async def batch_process(
     all_results: list[R | Exception] = []
 
     for i in range(0, len(items), batch_size):
+        remaining = remaining_request_budget()
+        if remaining is not None and remaining <= 0:
+            # Do not start batches nobody will wait for.
+            all_results.extend(
+                OperationBudgetExceeded("Skipped at the request deadline") for _ in range(len(items) - i)
+            )
+            break
+
         batch = items[i : i + batch_size]
 
         async def process_with_limit(item: T) -> R:
@@ -780,7 +1019,7 @@ async def batch_process(
 
         # Small delay between batches
         if i + batch_size < len(items):
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(clamp_timeout_to_request_deadline(0.1) or 0.0)
 
     return all_results
 
@@ -808,18 +1047,33 @@ class CircuitBreaker:
 
         async with breaker:
             result = await risky_api_call()
+
+    A breaker with a ``name`` and a ``store`` shares its state with other
+    workers: it pulls newer state from the store before admitting a call and
+    publishes every state or failure-count change back to it.  Store I/O runs
+    in a worker thread and outside the breaker lock; changes made while a
+    write is in flight are coalesced into the next write.
     """
 
     failure_threshold: int = 5
     recovery_timeout: float = 30.0
     half_open_max_calls: int = 3
+    name: str | None = None
+    store: CircuitBreakerStore | None = field(default=None, repr=False, compare=False)
 
     _failure_count: int = field(init=False, default=0)
     _last_failure_time: float | None = field(init=False, default=None)
     _state: str = field(init=False, default="closed")
     _half_open_calls: int = field(init=False, default=0)
+    _synced_at: float = field(init=False, default=0.0)
+    _publishing: bool = field(init=False, default=False)
+    _publish_pending: bool = field(init=False, default=False)
     _lock: asyncio.Lock = field(init=False, default_factory=asyncio.Lock)
 
+    def __post_init__(self) -> None:
+        if self.name:
+            _named_breakers[id(self)] = self
+
     @property
     def state(self) -> str:
         """Current circuit breaker state."""
@@ -833,8 +1087,75 @@ class CircuitBreaker:
         # Check if recovery timeout passed
         return not (self._last_failure_time and time.monotonic() - self._last_failure_time > self.recovery_timeout)
 
+    @property
+    def failure_count(self) -> int:
+        """Consecutive failures counted towards opening the circuit."""
+        return self._failure_count
+
+    def last_failure_age(self) -> float | None:
+        """Seconds since the last recorded failure, if any."""
+        if self._last_failure_time is None:
+            return None
+        return max(0.0, time.monotonic() - self._last_failure_time)
+
+    async def _load_shared_record(self) -> BreakerRecord | None:
+        store = self.store
+        if store is None or not self.name:
+            return None
+        if not store.refresh_due():
+            # Within the refresh interval the load is an in-memory lookup.
+            return store.load(self.name)
+        return await asyncio.to_thread(store.load, self.name)
+
+    def _apply_shared_record(self, record: BreakerRecord | None) -> None:
+        if record is None or record.updated_at <= self._synced_at:
+            return
+        self._synced_at = record.updated_at
+        if record.state != self._state:
+            self._half_open_calls = 0
+        self._state = record.state
+        self._failure_count = record.failure_count
+        if record.last_failure_at is None:
+            self._last_failure_time = None
+        else:
+            # Wall-clock stamps survive restarts; monotonic ones do not.
+            self._last_failure_time = time.monotonic() - max(0.0, time.time() - record.last_failure_at)
+
+    async def _publish_shared_state(self) -> None:
+        """Write the current state to the store, coalescing changes made meanwhile."""
+        store = self.store
+        if store is None or not self.name:
+            return
+        if self._publishing:
+            self._publish_pending = True
+            return
+        from .circuit_breaker_store import build_breaker_record
+
+        self._publishing = True
+        try:
+            while True:
+                self._publish_pending = False
+                age = self.last_failure_age()
+                record = build_breaker_record(
+                    self.name,
+                    state=self._state,
+                    failure_count=self._failure_count,
+                    last_failure_at=None if age is None else time.time() - age,
+                )
+                # Mark the record as seen before writing it, so a concurrent
+                # load that reads it back does not roll local state back to it.
+                self._synced_at = max(self._synced_at, record.updated_at)
+                await asyncio.to_thread(store.save, record)
+                if not self._publish_pending:
+                    break
+        finally:
+            self._publishing = False
+
     async def __aenter__(self) -> Self:
+        record = await self._load_shared_record()
         async with self._lock:
+            self._apply_shared_record(record)
+            previous = (self._state, self._failure_count)
             if self.is_open:
                 raise RateLimitError("Circuit breaker is open", retry_after=self.recovery_timeout)
 
@@ -849,7 +1170,10 @@ class CircuitBreaker:
                         retry_after=self.recovery_timeout / 2,
                     )
                 self._half_open_calls += 1
+            changed = previous != (self._state, self._failure_count)
 
+        if changed:
+            await self._publish_shared_state()
         return self
 
     async def __aexit__(
@@ -859,6 +1183,7 @@ class CircuitBreaker:
         exc_tb: object,
     ) -> None:
         async with self._lock:
+            previous = (self._state, self._failure_count)
             if exc_val is not None:
                 self._failure_count += 1
                 self._last_failure_time = time.monotonic()
@@ -873,6 +1198,10 @@ class CircuitBreaker:
                 logger.info("Circuit breaker closed (recovered)")
             elif self._state == "closed":
                 self._failure_count = max(0, self._failure_count - 1)
+            changed = previous != (self._state, self._failure_count)
+
+        if changed:
+            await self._publish_shared_state()
 
 
 # =============================================================================
@@ -894,7 +1223,8 @@ def get_shared_async_client() -> Any:
     The client is configured with:
     - follow_redirects=True (needed by most callers)
     - 30 s default timeout (override per-request with ``timeout=`` kwarg)
-    - Connection pool limits matching BaseAPIClient
+    - Per-origin connection pools with limits matching BaseAPIClient, so a
+      slow publisher host cannot hold connections needed by other hosts
 
     Returns:
         A reusable ``httpx.AsyncClient`` instance.
@@ -18,6 +18,7 @@ import asyncio
 import contextlib
 import json
 import logging
+import os
 import threading
 from abc import ABC, abstractmethod
 from collections import OrderedDict
@@ -243,14 +244,22 @@ class JsonFileCacheBackend(CacheBackend):
         self._max_entries = max_entries
         self._entries: OrderedDict[str, StoredCacheEntry] = OrderedDict()
         self._lock = threading.RLock()
+        self._loaded_mtime_ns: int | None = None
         self._load()
 
+    def _file_mtime_ns(self) -> int | None:
+        try:
+            return self._file_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def _load(self) -> None:
         with self._lock:
             if not self._file_path.exists():
                 return
 
             try:
+                self._loaded_mtime_ns = self._file_mtime_ns()
                 with self._file_path.open(encoding="utf-8") as handle:
                     raw = json.load(handle)
             except (OSError, ValueError, json.JSONDecodeError) as exc:
@@ -266,16 +275,31 @@ class JsonFileCacheBackend(CacheBackend):
 
     def _save(self) -> None:
         payload = {key: entry.to_dict() for key, entry in self._entries.items()}
-        tmp_path = self._file_path.with_name(f"{self._file_path.name}.tmp")
+        # Per-process temp name: several workers may share one backing file.
+        tmp_path = self._file_path.with_name(f"{self._file_path.name}.{os.getpid()}.tmp")
         try:
             with tmp_path.open("w", encoding="utf-8") as handle:
                 json.dump(payload, handle, ensure_ascii=False, indent=2)
             tmp_path.replace(self._file_path)
+            self._loaded_mtime_ns = self._file_mtime_ns()
         except (OSError, TypeError, ValueError) as exc:
             with contextlib.suppress(OSError):
                 tmp_path.unlink(missing_ok=True)
             logger.warning("Failed to persist cache backend %s: %s", self._file_path, exc)
 
+    def refresh(self) -> bool:
+        """Reload entries when another process has replaced the backing file.
+
+        Returns ``True`` when the in-memory view was reloaded.
+        """
+        with self._lock:
+            mtime = self._file_mtime_ns()
+            if mtime is None or mtime == self._loaded_mtime_ns:
+                return False
+            self._entries.clear()
+            self._load()
+            return True
+
     def get_entry(self, key: str) -> StoredCacheEntry | None:
         with self._lock:
             entry = self._entries.get(key)
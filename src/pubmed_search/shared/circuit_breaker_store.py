@@ -0,0 +1,204 @@
+"""Shared, persisted circuit-breaker state.
+
+Every worker process keeps its own :class:`~pubmed_search.shared.async_utils.CircuitBreaker`
+objects, so when an upstream goes down each worker has to discover it on its
+own, and a restart forgets that the upstream was failing. When
+``PUBMED_CIRCUIT_BREAKER_STORE`` is enabled, named breakers publish their state
+(closed / open / half-open, failure count and the wall-clock time of the last
+failure) into ``<data_dir>/cache/circuit_breakers.json``. The file uses the same
+:class:`~pubmed_search.shared.cache_substrate.JsonFileCacheBackend` as the
+persistent caches. Before admitting a call, a breaker pulls any newer state
+another worker has written.
+
+The store is advisory and last-writer-wins. It narrows the window in which
+workers disagree but does not provide cross-process locking. Failure to read or
+write the file never blocks a request.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .cache_substrate import CacheBackend, JsonFileCacheBackend, StoredCacheEntry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_BREAKER_STORE_FILENAME = "circuit_breakers.json"
+DEFAULT_REFRESH_INTERVAL_SECONDS = 1.0
+
+_VALID_STATES = frozenset({"closed", "open", "half_open"})
+
+
+@dataclass(frozen=True)
+class BreakerRecord:
+    """Snapshot of one named breaker as last published by any worker."""
+
+    name: str
+    state: str
+    failure_count: int
+    last_failure_at: float | None
+    updated_at: float
+    pid: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "state": self.state,
+            "failure_count": self.failure_count,
+            "last_failure_at": self.last_failure_at,
+            "updated_at": self.updated_at,
+            "pid": self.pid,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Any) -> BreakerRecord | None:
+        if not isinstance(data, dict):
+            return None
+        name = data.get("name")
+        state = data.get("state")
+        if not isinstance(name, str) or state not in _VALID_STATES:
+            return None
+        try:
+            last_failure_at = data.get("last_failure_at")
+            return cls(
+                name=name,
+                state=state,
+                failure_count=max(0, int(data.get("failure_count", 0))),
+                last_failure_at=float(last_failure_at) if last_failure_at is not None else None,
+                updated_at=float(data.get("updated_at", 0.0)),
+                pid=int(data.get("pid", 0)),
+            )
+        except (TypeError, ValueError):
+            return None
+
+
+class CircuitBreakerStore:
+    """Persist breaker records in a cache backend shared by worker processes."""
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        *,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._backend = backend
+        self._refresh_interval = refresh_interval
+        self._clock = clock
+        self._last_refresh: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend
+
+    def refresh_due(self) -> bool:
+        """Whether the next :meth:`load` would re-read the shared backend.
+
+        While this is ``False`` a load only touches the in-memory view, so
+        callers on an event loop can skip the thread hop.
+        """
+        if getattr(self._backend, "refresh", None) is None:
+            return False
+        last = self._last_refresh
+        return last is None or self._clock() - last >= self._refresh_interval
+
+    def _refresh(self, *, force: bool = False) -> None:
+        if not force and not self.refresh_due():
+            return
+        refresh = getattr(self._backend, "refresh", None)
+        if refresh is None:
+            return
+        self._last_refresh = self._clock()
+        try:
+            refresh()
+        except Exception as exc:  # noqa: BLE001 - shared state is advisory
+            logger.debug("Failed to refresh circuit breaker store: %s", exc)
+
+    def load(self, name: str) -> BreakerRecord | None:
+        """Return the latest published record for *name*, if any."""
+        with self._lock:
+            self._refresh()
+            entry = self._backend.get_entry(name)
+        return BreakerRecord.from_dict(entry.value) if entry is not None else None
+
+    def save(self, record: BreakerRecord) -> None:
+        """Publish *record*, merging with whatever other workers wrote since the last read."""
+        with self._lock:
+            self._refresh(force=True)
+            try:
+                self._backend.set_entry(record.name, StoredCacheEntry(value=record.to_dict()))
+            except Exception as exc:  # noqa: BLE001 - shared state is advisory
+                logger.debug("Failed to persist circuit breaker %s: %s", record.name, exc)
+
+    def records(self) -> dict[str, BreakerRecord]:
+        """Return every published record keyed by breaker name."""
+        with self._lock:
+            self._refresh(force=True)
+            items = self._backend.items()
+        records: dict[str, BreakerRecord] = {}
+        for _key, entry in items:
+            record = BreakerRecord.from_dict(entry.value)
+            if record is not None:
+                records[record.name] = record
+        return records
+
+    def clear(self) -> int:
+        with self._lock:
+            return self._backend.clear()
+
+
+def build_breaker_record(
+    name: str,
+    *,
+    state: str,
+    failure_count: int,
+    last_failure_at: float | None,
+) -> BreakerRecord:
+    """Stamp a record with the current wall-clock time and this process id."""
+    return BreakerRecord(
+        name=name,
+        state=state,
+        failure_count=failure_count,
+        last_failure_at=last_failure_at,
+        updated_at=time.time(),
+        pid=os.getpid(),
+    )
+
+
+_store_lock = threading.Lock()
+_settings_store: CircuitBreakerStore | None = None
+_settings_path: Path | None = None
+
+
+def get_circuit_breaker_store() -> CircuitBreakerStore | None:
+    """Return the store configured by settings, or ``None`` when sharing is disabled."""
+    global _settings_store, _settings_path
+    from .settings import get_settings
+
+    settings = get_settings()
+    if not getattr(settings, "circuit_breaker_store_enabled", False):
+        return None
+    path = Path(settings.data_dir) / "cache" / CIRCUIT_BREAKER_STORE_FILENAME
+    with _store_lock:
+        if _settings_store is None or _settings_path != path:
+            _settings_store = CircuitBreakerStore(JsonFileCacheBackend(path))
+            _settings_path = path
+        return _settings_store
+
+
+__all__ = [
+    "BreakerRecord",
+    "CircuitBreakerStore",
+    "build_breaker_record",
+    "get_circuit_breaker_store",
+]
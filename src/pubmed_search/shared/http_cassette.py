@@ -0,0 +1,469 @@
+"""Record/replay cassettes for outbound HTTP and NCBI E-utility traffic.
+
+Benchmarks and regression runs need the exact same upstream responses on every
+execution.  A cassette captures each outbound request under a stable
+fingerprint and later serves the stored response without touching the network:
+
+- ``record`` performs the real request and writes one JSON file per fingerprint.
+- ``replay`` serves stored responses and raises :class:`CassetteMissError` for
+  anything that was never recorded, so an offline run cannot silently go live.
+
+Fingerprints cover method, URL (query parameters sorted) and a hash of the
+request body.  Credential-like parameters such as ``api_key`` or ``email`` are
+excluded, so a cassette recorded with one key replays under another and never
+stores the secret itself.
+
+Replay can optionally sleep for the recorded upstream duration (scaled by
+``latency_scale``) so latency-sensitive code paths such as timeouts, early
+returns and streaming aggregation see realistic timings.
+
+Configuration comes from ``PUBMED_HTTP_CASSETTE_MODE``,
+``PUBMED_HTTP_CASSETTE_DIR`` and ``PUBMED_HTTP_CASSETTE_LATENCY_SCALE``; tests
+and benchmarks can instead install a cassette explicitly with
+:func:`use_cassette`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+
+from .file_io import atomic_write_json
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+CassetteMode = Literal["off", "record", "replay"]
+CASSETTE_FORMAT_VERSION = 1
+ENTREZ_SCHEME = "entrez"
+
+# Query/body parameters that identify the caller rather than the request.
+_VOLATILE_PARAMS = frozenset(
+    {
+        "api_key",
+        "apikey",
+        "access_token",
+        "email",
+        "mailto",
+        "tool",
+        "insttoken",
+        "key",
+        "token",
+    }
+)
+_MODES: dict[str, CassetteMode] = {"off": "off", "record": "record", "replay": "replay"}
+_SENSITIVE_HEADERS = frozenset({"authorization", "cookie", "set-cookie", "x-api-key", "x-els-apikey"})
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a request has no recorded response."""
+
+    def __init__(self, fingerprint: str, description: str) -> None:
+        super().__init__(f"No cassette entry for {description} (fingerprint {fingerprint[:12]})")
+        self.fingerprint = fingerprint
+        self.description = description
+
+
+@dataclass
+class CassetteEntry:
+    """One recorded upstream response."""
+
+    fingerprint: str
+    method: str
+    url: str
+    status_code: int
+    headers: list[tuple[str, str]] = field(default_factory=list)
+    body: str = ""
+    body_encoding: Literal["utf-8", "base64"] = "utf-8"
+    text_mode: bool = False
+    elapsed_ms: float = 0.0
+    recorded_at: str = ""
+    version: int = CASSETTE_FORMAT_VERSION
+
+    @property
+    def content(self) -> bytes:
+        if self.body_encoding == "base64":
+            return base64.b64decode(self.body)
+        return self.body.encode("utf-8")
+
+    @staticmethod
+    def encode_body(content: bytes) -> tuple[str, Literal["utf-8", "base64"]]:
+        try:
+            return content.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            return base64.b64encode(content).decode("ascii"), "base64"
+
+    def to_dict(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload["headers"] = [list(item) for item in self.headers]
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> CassetteEntry:
+        return cls(
+            fingerprint=str(payload["fingerprint"]),
+            method=str(payload.get("method", "GET")),
+            url=str(payload.get("url", "")),
+            status_code=int(payload.get("status_code", 200)),
+            headers=[(str(name), str(value)) for name, value in payload.get("headers", [])],
+            body=str(payload.get("body", "")),
+            body_encoding="base64" if payload.get("body_encoding") == "base64" else "utf-8",
+            text_mode=bool(payload.get("text_mode", False)),
+            elapsed_ms=float(payload.get("elapsed_ms", 0.0)),
+            recorded_at=str(payload.get("recorded_at", "")),
+            version=int(payload.get("version", CASSETTE_FORMAT_VERSION)),
+        )
+
+
+def parse_cassette_mode(value: object) -> CassetteMode:
+    """Validate a configured cassette mode (case-insensitive) and narrow it to :data:`CassetteMode`."""
+    mode = _MODES.get(str(value).strip().lower())
+    if mode is None:
+        msg = f"Unknown HTTP cassette mode {value!r}; expected one of: {', '.join(_MODES)}"
+        raise ValueError(msg)
+    return mode
+
+
+def canonicalize_url(url: str) -> str:
+    """Return *url* with sorted query parameters and volatile credentials removed."""
+    parsed = urlsplit(url)
+    params = sorted(
+        (name, value)
+        for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if name.lower() not in _VOLATILE_PARAMS
+    )
+    return urlunsplit((parsed.scheme.lower(), parsed.netloc.lower(), parsed.path, urlencode(params), ""))
+
+
+def request_fingerprint(method: str, url: str, body: bytes = b"") -> str:
+    """Stable fingerprint for a request independent of credentials and param order."""
+    digest = hashlib.sha256()
+    digest.update(method.upper().encode("ascii"))
+    digest.update(b"\n")
+    digest.update(canonicalize_url(url).encode("utf-8"))
+    digest.update(b"\n")
+    digest.update(hashlib.sha256(body).digest())
+    return digest.hexdigest()
+
+
+def entrez_request_url(callable_obj: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    """Describe a Bio.Entrez call as a pseudo-URL suitable for fingerprinting."""
+    name = getattr(callable_obj, "__name__", type(callable_obj).__name__)
+    params: list[tuple[str, str]] = [(f"_arg{index}", str(value)) for index, value in enumerate(args)]
+    for key, value in kwargs.items():
+        if value is None:
+            continue
+        rendered = ",".join(str(item) for item in value) if isinstance(value, (list, tuple)) else str(value)
+        params.append((key, rendered))
+    return canonicalize_url(f"{ENTREZ_SCHEME}://eutils/{name}?{urlencode(params)}")
+
+
+class HttpCassette:
+    """Directory-backed store of recorded upstream responses."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        mode: CassetteMode = "replay",
+        latency_scale: float = 0.0,
+    ) -> None:
+        self.directory = Path(directory)
+        self.mode = parse_cassette_mode(mode)
+        self.latency_scale = max(0.0, latency_scale)
+        self._lock = threading.Lock()
+        self._memory: dict[str, CassetteEntry] = {}
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def path_for(self, fingerprint: str) -> Path:
+        return self.directory / fingerprint[:2] / f"{fingerprint}.json"
+
+    def load(self, fingerprint: str) -> CassetteEntry | None:
+        with self._lock:
+            cached = self._memory.get(fingerprint)
+        if cached is not None:
+            return cached
+        path = self.path_for(fingerprint)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable cassette entry %s: %s", path.name, exc)
+            return None
+        entry = CassetteEntry.from_dict(payload)
+        with self._lock:
+            self._memory[fingerprint] = entry
+        return entry
+
+    def save(self, entry: CassetteEntry) -> None:
+        atomic_write_json(self.path_for(entry.fingerprint), entry.to_dict())
+        with self._lock:
+            self._memory[entry.fingerprint] = entry
+            self.recorded += 1
+
+    def lookup(self, fingerprint: str, description: str) -> CassetteEntry:
+        """Return the recorded entry or raise :class:`CassetteMissError`."""
+        entry = self.load(fingerprint)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if entry is None:
+            raise CassetteMissError(fingerprint, description)
+        return entry
+
+    def replay_delay(self, entry: CassetteEntry) -> float:
+        """Seconds to wait before serving *entry* to mimic recorded latency."""
+        if self.latency_scale <= 0:
+            return 0.0
+        return entry.elapsed_ms / 1000.0 * self.latency_scale
+
+    def build_entry(
+        self,
+        *,
+        fingerprint: str,
+        method: str,
+        url: str,
+        status_code: int,
+        headers: list[tuple[str, str]],
+        content: bytes,
+        elapsed_ms: float,
+        text_mode: bool = False,
+    ) -> CassetteEntry:
+        body, encoding = CassetteEntry.encode_body(content)
+        return CassetteEntry(
+            fingerprint=fingerprint,
+            method=method.upper(),
+            url=canonicalize_url(url),
+            status_code=status_code,
+            headers=[(name, value) for name, value in headers if name.lower() not in _SENSITIVE_HEADERS],
+            body=body,
+            body_encoding=encoding,
+            text_mode=text_mode,
+            elapsed_ms=round(elapsed_ms, 3),
+            recorded_at=datetime.now(timezone.utc).isoformat(),
+        )
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "directory": str(self.directory),
+            "latency_scale": self.latency_scale,
+            "hits": self.hits,
+            "misses": self.misses,
+            "recorded": self.recorded,
+        }
+
+    # ------------------------------------------------------------------
+    # Bio.Entrez integration
+    # ------------------------------------------------------------------
+
+    def call_entrez(
+        self,
+        callable_obj: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Run or replay a Bio.Entrez callable that returns a readable handle.
+
+        Callers still parse the handle with ``Entrez.read`` and close it, so a
+        replayed response is returned as an in-memory handle of the same kind
+        (text or binary) that Bio.Entrez produced while recording.
+        """
+        url = entrez_request_url(callable_obj, args, kwargs)
+        fingerprint = request_fingerprint("GET", url)
+
+        if self.replaying:
+            entry = self.lookup(fingerprint, url)
+            delay = self.replay_delay(entry)
+            if delay > 0:
+                time.sleep(delay)
+            return _entrez_handle(entry)
+
+        started = time.perf_counter()
+        handle = callable_obj(*args, **kwargs)
+        try:
+            raw = handle.read()
+        finally:
+            handle.close()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        text_mode = isinstance(raw, str)
+        content = raw.encode("utf-8") if text_mode else bytes(raw)
+        entry = self.build_entry(
+            fingerprint=fingerprint,
+            method="GET",
+            url=url,
+            status_code=200,
+            headers=[],
+            content=content,
+            elapsed_ms=elapsed_ms,
+            text_mode=text_mode,
+        )
+        self.save(entry)
+        return _entrez_handle(entry)
+
+
+def _entrez_handle(entry: CassetteEntry) -> io.StringIO | io.BytesIO:
+    if entry.text_mode:
+        return io.StringIO(entry.content.decode("utf-8"))
+    return io.BytesIO(entry.content)
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """httpx async transport that records to or replays from an :class:`HttpCassette`."""
+
+    def __init__(self, cassette: HttpCassette, inner: httpx.AsyncBaseTransport | None = None) -> None:
+        self.cassette = cassette
+        self._inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        url = str(request.url)
+        fingerprint = request_fingerprint(request.method, url, body)
+
+        if self.cassette.replaying:
+            entry = self.cassette.lookup(fingerprint, f"{request.method} {canonicalize_url(url)}")
+            delay = self.cassette.replay_delay(entry)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return httpx.Response(
+                entry.status_code,
+                headers=_replay_headers(entry.headers),
+                content=entry.content,
+                request=request,
+            )
+
+        if self._inner is None:
+            msg = "Cassette transport in record mode requires an inner transport"
+            raise RuntimeError(msg)
+        started = time.perf_counter()
+        response = await self._inner.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        headers = list(response.headers.multi_items())
+        self.cassette.save(
+            self.cassette.build_entry(
+                fingerprint=fingerprint,
+                method=request.method,
+                url=url,
+                status_code=response.status_code,
+                headers=headers,
+                content=content,
+                elapsed_ms=elapsed_ms,
+            )
+        )
+        return httpx.Response(
+            response.status_code,
+            headers=_replay_headers(headers),
+            content=content,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        if self._inner is not None:
+            await self._inner.aclose()
+
+
+def _replay_headers(headers: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    # The stored body is already decoded, so transfer/compression headers
+    # would make httpx try to decode or re-frame it a second time.
+    dropped = {"content-encoding", "transfer-encoding", "content-length"}
+    return [(name, value) for name, value in headers if name.lower() not in dropped]
+
+
+# ============================================================================
+# Active cassette resolution
+# ============================================================================
+
+_override_lock = threading.Lock()
+_override: HttpCassette | None = None
+_settings_cassette: HttpCassette | None = None
+_settings_key: tuple[str, str, float] | None = None
+
+
+def _cassette_from_settings() -> HttpCassette | None:
+    global _settings_cassette, _settings_key
+    from .settings import get_settings
+
+    settings = get_settings()
+    mode = parse_cassette_mode(getattr(settings, "http_cassette_mode", "off"))
+    if mode == "off":
+        return None
+    directory = settings.http_cassette_dir or str(Path(settings.data_dir) / "cassettes")
+    latency_scale = float(settings.http_cassette_latency_scale)
+    key = (mode, directory, latency_scale)
+    with _override_lock:
+        if _settings_key != key or _settings_cassette is None:
+            _settings_cassette = HttpCassette(directory, mode=mode, latency_scale=latency_scale)
+            _settings_key = key
+        return _settings_cassette
+
+
+def get_active_cassette() -> HttpCassette | None:
+    """Return the explicitly installed cassette, else the one configured by settings."""
+    with _override_lock:
+        override = _override
+    if override is not None:
+        return override
+    return _cassette_from_settings()
+
+
+@contextmanager
+def use_cassette(cassette: HttpCassette) -> Iterator[HttpCassette]:
+    """Install *cassette* for clients and Entrez calls created inside the block."""
+    global _override
+    with _override_lock:
+        previous = _override
+        _override = cassette
+    try:
+        yield cassette
+    finally:
+        with _override_lock:
+            _override = previous
+
+
+__all__ = [
+    "CassetteEntry",
+    "CassetteMissError",
+    "CassetteMode",
+    "CassetteTransport",
+    "HttpCassette",
+    "canonicalize_url",
+    "entrez_request_url",
+    "get_active_cassette",
+    "parse_cassette_mode",
+    "request_fingerprint",
+    "use_cassette",
+]
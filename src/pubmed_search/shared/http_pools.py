@@ -0,0 +1,350 @@
+"""Per-origin HTTP connection pools with saturation metrics.
+
+A single ``httpx.AsyncClient`` pool is shared by every host it talks to, so a
+slow origin (for example a publisher PDF site) can hold all connections while
+requests for fast APIs queue behind it.  :class:`HostPooledTransport` keeps a
+separate ``httpx.AsyncHTTPTransport`` per origin, each with its own limits:
+
+- Per-host limits default to the client's limits and can be overridden per
+  host with :func:`configure_host_pool`.
+- HTTP/2 multiplexing is negotiated per connection when enabled
+  (``PUBMED_HTTP2``) and the optional ``h2`` package is installed; servers
+  without HTTP/2 support keep using HTTP/1.1.
+- Origins that have been idle for longer than ``idle_timeout`` are reaped so
+  their keep-alive sockets do not linger for the life of the process.
+- Proxy environment variables (``HTTP_PROXY``, ``HTTPS_PROXY``, ``ALL_PROXY``
+  and ``NO_PROXY``) are honoured per origin.  httpx ignores them once a custom
+  transport is installed, so each origin's pool connects through the proxy
+  that the environment selects for it.
+
+Every transport registers itself so :func:`http_pool_snapshot` can report
+pool saturation (active, queued/waiting, idle) per origin for the profiling
+surface.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import urllib.request
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT_SECONDS = 120.0
+DEFAULT_REAP_INTERVAL_SECONDS = 15.0
+
+
+@dataclass(frozen=True)
+class HostPoolLimits:
+    """Connection limits applied to a single origin."""
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+
+    def to_httpx(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+_host_limit_overrides: dict[str, HostPoolLimits] = {}
+_transports: weakref.WeakSet[HostPooledTransport] = weakref.WeakSet()
+_registry_lock = threading.Lock()
+_http2_warning_logged = False
+
+
+def configure_host_pool(host: str, limits: HostPoolLimits | None) -> None:
+    """Override (or with ``None`` clear) the connection limits for *host*.
+
+    Overrides apply to pools created after the call; existing pools keep their
+    limits until they are reaped or their client is closed.
+    """
+    key = host.strip().lower()
+    with _registry_lock:
+        if limits is None:
+            _host_limit_overrides.pop(key, None)
+        else:
+            _host_limit_overrides[key] = limits
+
+
+def http2_available() -> bool:
+    """Return whether the optional ``h2`` dependency for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _resolve_http2(requested: bool) -> bool:
+    global _http2_warning_logged
+    if not requested:
+        return False
+    if http2_available():
+        return True
+    if not _http2_warning_logged:
+        logger.info("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+        _http2_warning_logged = True
+    return False
+
+
+def _environment_proxies() -> dict[str, str]:
+    """Proxy settings from the environment, keyed by lower-case scheme (plus ``no``)."""
+    return {scheme: url for scheme, url in urllib.request.getproxies_environment().items() if url}
+
+
+def _bypasses_proxy(host: str, no_proxy: str) -> bool:
+    """Match *host* against a ``NO_PROXY`` list (``*``, hosts and domain suffixes)."""
+    host = host.lower()
+    for raw_entry in no_proxy.split(","):
+        entry = raw_entry.strip().lower().lstrip(".")
+        if entry.count(":") == 1:  # host:port; IPv6 literals keep their colons
+            entry = entry.partition(":")[0]
+        if entry == "*" or (entry and (host == entry or host.endswith(f".{entry}"))):
+            return True
+    return False
+
+
+def _proxy_for(url: httpx.URL, proxies: dict[str, str]) -> str | None:
+    if not proxies or _bypasses_proxy(url.host, proxies.get("no", "")):
+        return None
+    return proxies.get(url.scheme) or proxies.get("all")
+
+
+def _origin_of(url: httpx.URL) -> str:
+    port = url.port
+    return f"{url.scheme}://{url.host}" if port is None else f"{url.scheme}://{url.host}:{port}"
+
+
+class _TrackedByteStream(httpx.AsyncByteStream):
+    """Response stream that reports when the underlying connection is released."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_close: Callable[[], None] | None = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        if self._on_close is not None:
+            callback, self._on_close = self._on_close, None
+            callback()
+
+
+class _HostPool:
+    __slots__ = (
+        "http2",
+        "in_flight",
+        "last_used",
+        "limits",
+        "origin",
+        "peak_in_flight",
+        "proxied",
+        "requests",
+        "transport",
+    )
+
+    def __init__(self, origin: str, limits: HostPoolLimits, *, http2: bool, proxy: str | None = None) -> None:
+        self.origin = origin
+        self.limits = limits
+        self.http2 = http2
+        self.proxied = proxy is not None
+        self.transport = httpx.AsyncHTTPTransport(limits=limits.to_httpx(), http2=http2, proxy=proxy)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+        self.last_used = time.monotonic()
+
+    def snapshot(self) -> dict[str, Any]:
+        pool = getattr(self.transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []) or [])
+        idle = sum(1 for connection in connections if _safe_call(connection, "is_idle"))
+        queued_requests = getattr(pool, "_requests", None)
+        if queued_requests is not None:
+            waiters = sum(1 for request in list(queued_requests) if _safe_call(request, "is_queued"))
+        else:
+            waiters = max(0, self.in_flight - self.limits.max_connections)
+        return {
+            "origin": self.origin,
+            "http2": self.http2,
+            "proxied": self.proxied,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "active": len(connections) - idle,
+            "idle": idle,
+            "waiters": waiters,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "requests": self.requests,
+            "saturation": round(min(1.0, self.in_flight / max(1, self.limits.max_connections)), 3),
+        }
+
+
+def _safe_call(obj: Any, method: str) -> bool:
+    try:
+        return bool(getattr(obj, method)())
+    except Exception:  # noqa: BLE001 - metrics must never break a request
+        return False
+
+
+class HostPooledTransport(httpx.AsyncBaseTransport):
+    """Route requests to a dedicated connection pool per origin.
+
+    With ``trust_env`` (the httpx default) proxy settings are read from the
+    environment once, when the transport is created, as httpx itself does.
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: HostPoolLimits | None = None,
+        http2: bool = False,
+        idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        reap_interval: float = DEFAULT_REAP_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        trust_env: bool = True,
+    ) -> None:
+        self.default_limits = limits or HostPoolLimits()
+        self.http2 = _resolve_http2(http2)
+        self._proxies = _environment_proxies() if trust_env else {}
+        self.idle_timeout = idle_timeout
+        self.reap_interval = reap_interval
+        self._clock = clock
+        self._pools: dict[str, _HostPool] = {}
+        self._last_reap = clock()
+        self.reaped = 0
+        with _registry_lock:
+            _transports.add(self)
+
+    def _limits_for(self, url: httpx.URL) -> HostPoolLimits:
+        with _registry_lock:
+            return _host_limit_overrides.get(url.host.lower(), self.default_limits)
+
+    def _pool_for(self, url: httpx.URL) -> _HostPool:
+        origin = _origin_of(url)
+        pool = self._pools.get(origin)
+        if pool is None:
+            pool = _HostPool(
+                origin,
+                self._limits_for(url),
+                http2=self.http2,
+                proxy=_proxy_for(url, self._proxies),
+            )
+            self._pools[origin] = pool
+        return pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._maybe_reap()
+        pool = self._pool_for(request.url)
+        pool.requests += 1
+        pool.in_flight += 1
+        pool.peak_in_flight = max(pool.peak_in_flight, pool.in_flight)
+        pool.last_used = self._clock()
+
+        def release() -> None:
+            pool.in_flight -= 1
+            pool.last_used = self._clock()
+
+        try:
+            response = await pool.transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        stream = response.stream
+        if not isinstance(stream, httpx.AsyncByteStream):
+            release()
+            return response
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_TrackedByteStream(stream, release),
+            extensions=response.extensions,
+        )
+
+    async def _maybe_reap(self) -> None:
+        if self.idle_timeout is None:
+            return
+        now = self._clock()
+        if now - self._last_reap < self.reap_interval:
+            return
+        self._last_reap = now
+        await self.reap_idle(now=now)
+
+    async def reap_idle(self, *, now: float | None = None) -> int:
+        """Close pools for origins that have been idle longer than ``idle_timeout``."""
+        if self.idle_timeout is None:
+            return 0
+        current = self._clock() if now is None else now
+        expired = [
+            origin
+            for origin, pool in self._pools.items()
+            if pool.in_flight == 0 and current - pool.last_used >= self.idle_timeout
+        ]
+        for origin in expired:
+            pool = self._pools.pop(origin)
+            await pool.transport.aclose()
+        if expired:
+            self.reaped += len(expired)
+            logger.debug("Reaped %d idle HTTP connection pool(s)", len(expired))
+        return len(expired)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        return [pool.snapshot() for pool in list(self._pools.values())]
+
+    async def aclose(self) -> None:
+        pools = list(self._pools.values())
+        self._pools.clear()
+        for pool in pools:
+            await pool.transport.aclose()
+
+
+def http_pool_snapshot() -> dict[str, dict[str, Any]]:
+    """Aggregate pool saturation per origin across every live pooled transport."""
+    with _registry_lock:
+        transports = list(_transports)
+    summary: dict[str, dict[str, Any]] = {}
+    for transport in transports:
+        for entry in transport.snapshot():
+            origin = entry["origin"]
+            bucket = summary.get(origin)
+            if bucket is None:
+                summary[origin] = {key: value for key, value in entry.items() if key != "origin"} | {"pools": 1}
+                continue
+            bucket["pools"] += 1
+            bucket["http2"] = bucket["http2"] or entry["http2"]
+            bucket["proxied"] = bucket["proxied"] or entry["proxied"]
+            for key in ("max_connections", "max_keepalive_connections", "active", "idle", "waiters", "in_flight"):
+                bucket[key] += entry[key]
+            bucket["requests"] += entry["requests"]
+            bucket["peak_in_flight"] = max(bucket["peak_in_flight"], entry["peak_in_flight"])
+            bucket["saturation"] = round(min(1.0, bucket["in_flight"] / max(1, bucket["max_connections"])), 3)
+    return dict(sorted(summary.items()))
+
+
+__all__ = [
+    "HostPoolLimits",
+    "HostPooledTransport",
+    "configure_host_pool",
+    "http2_available",
+    "http_pool_snapshot",
+]
@@ -8,6 +8,7 @@ Features:
 - HTTP API time separation via contextvars
 - In-memory rolling window (last N calls per tool)
 - Zero overhead when disabled (early return)
+- Per-origin HTTP connection pool saturation (active / waiters / idle)
 
 Usage:
     # In server.py after create_server():
@@ -147,6 +148,30 @@ def reset_metrics() -> None:
     _metrics.clear()
 
 
+def get_http_pool_metrics() -> dict[str, dict[str, Any]]:
+    """Per-origin connection pool saturation (active, waiters, idle)."""
+    from pubmed_search.shared.http_pools import http_pool_snapshot
+
+    return http_pool_snapshot()
+
+
+def format_http_pool_report() -> str:
+    """Format per-origin connection pool saturation as a compact table."""
+    pools = get_http_pool_metrics()
+    if not pools:
+        return ""
+    lines = ["🔌 **HTTP Connection Pools**\n"]
+    lines.append(f"{'Origin':<45} {'Active':>6} {'Wait':>5} {'Idle':>5} {'Max':>5} {'Peak':>5} {'Reqs':>6}")
+    lines.append("-" * 83)
+    for origin, stats in pools.items():
+        label = f"{origin} (h2)" if stats["http2"] else origin
+        lines.append(
+            f"{label[:45]:<45} {stats['active']:>6} {stats['waiters']:>5} {stats['idle']:>5} "
+            f"{stats['max_connections']:>5} {stats['peak_in_flight']:>5} {stats['requests']:>6}"
+        )
+    return "\n".join(lines)
+
+
 def format_metrics_report() -> str:
     """Format a human-readable performance report."""
     if not _metrics:
@@ -175,6 +200,11 @@ def format_metrics_report() -> str:
     lines.append("\n*HTTP% = percentage of time spent on external API calls*")
     lines.append("*Lower HTTP% means more processing overhead in our code*")
 
+    pool_report = format_http_pool_report()
+    if pool_report:
+        lines.append("")
+        lines.append(pool_report)
+
     return "\n".join(lines)
 
 
@@ -232,9 +262,12 @@ def install_profiling(mcp: MCPServer) -> bool:
         Only available when PUBMED_PROFILING=1.
 
         Args:
-            tool_name: Filter to specific tool (empty = all tools)
+            tool_name: Filter to specific tool (empty = all tools), or
+                "http_pools" for per-origin connection pool saturation
             reset: Reset all metrics after reporting
         """
+        if tool_name == "http_pools":
+            return format_http_pool_report() or "No HTTP connection pools have been used yet"
         if tool_name:
             stats = _metrics.get(tool_name)
             if not stats:
@@ -0,0 +1,162 @@
+"""Turn provider quota headers into limiter pacing.
+
+Credit-based providers advertise how much of their budget is left on every
+response. Without this module those headers only produce warnings, and the
+limiter keeps its configured spacing until a 429 arrives. The helpers here
+parse the headers and derive a pacing interval. The interval slows the
+provider's shared :class:`~pubmed_search.shared.async_utils.RateLimiter`
+smoothly as the quota drains.
+
+Recognised headers:
+
+- ``X-RateLimit-Remaining`` / ``X-RateLimit-Limit`` / ``X-RateLimit-Reset``
+  (OpenAlex, Scopus, Semantic Scholar) and the IETF ``RateLimit-*`` draft
+  names. The reset value may be seconds from now, a Unix epoch timestamp
+  (Scopus) or an ISO-8601 timestamp (OpenAlex).
+- ``X-Rate-Limit-Limit`` / ``X-Rate-Limit-Interval`` (Crossref), an advertised
+  request rate rather than a draining quota.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass
+from datetime import timezone
+from typing import TYPE_CHECKING
+
+from .async_utils import parse_retry_after
+from .datetime_utils import parse_iso8601_datetime
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+#: Pacing starts once this fraction of the advertised limit is left.
+QUOTA_PACING_FRACTION = 0.25
+
+# Reset values above this are Unix timestamps, not relative seconds.
+_EPOCH_THRESHOLD = 1_000_000_000.0
+
+_NUMBER = re.compile(r"\s*(-?\d+(?:\.\d+)?)")
+_LEADING_DELTA = re.compile(r"(\d+(?:\.\d+)?)\s*[,;]")
+_INTERVAL = re.compile(r"\s*(\d+(?:\.\d+)?)\s*(ms|s|m|h)?\s*$", re.IGNORECASE)
+_INTERVAL_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+@dataclass(frozen=True)
+class QuotaSnapshot:
+    """Quota state advertised by one upstream response."""
+
+    remaining: float | None = None
+    limit: float | None = None
+    reset_after: float | None = None
+    window: float | None = None
+
+
+def _first_number(headers: Mapping[str, str], *names: str) -> float | None:
+    for name in names:
+        raw = headers.get(name)
+        if raw is None:
+            continue
+        match = _NUMBER.match(raw)
+        if match is not None:
+            return float(match.group(1))
+    return None
+
+
+def _parse_reset(raw: str | None, now: float) -> float | None:
+    if raw is None:
+        return None
+    text = raw.strip()
+    try:
+        value = float(text)
+    except ValueError:
+        # IETF draft values such as "30, 60;w=3600" lead with the nearest reset.
+        match = _LEADING_DELTA.match(text)
+        if match is None:
+            return _parse_reset_timestamp(text, now)
+        value = float(match.group(1))
+    if value >= _EPOCH_THRESHOLD:
+        value -= now
+    return max(0.0, value)
+
+
+def _parse_reset_timestamp(text: str, now: float) -> float | None:
+    """Parse an ISO-8601 (OpenAlex) or HTTP-date reset time into seconds from *now*."""
+    try:
+        reset_at = parse_iso8601_datetime(text)
+    except ValueError:
+        return parse_retry_after(text)
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, reset_at.timestamp() - now)
+
+
+def _parse_interval(raw: str | None) -> float | None:
+    if raw is None:
+        return None
+    match = _INTERVAL.match(raw)
+    if match is None:
+        return None
+    return float(match.group(1)) * _INTERVAL_UNITS[(match.group(2) or "s").lower()]
+
+
+def parse_quota_headers(headers: Mapping[str, str], *, now: float | None = None) -> QuotaSnapshot | None:
+    """Parse lower-cased response headers into a :class:`QuotaSnapshot`.
+
+    Returns ``None`` when the response advertises nothing usable.
+    """
+    current = time.time() if now is None else now
+    remaining = _first_number(headers, "x-ratelimit-remaining", "ratelimit-remaining")
+    limit = _first_number(headers, "x-ratelimit-limit", "ratelimit-limit")
+    reset_raw = headers.get("x-ratelimit-reset", headers.get("ratelimit-reset"))
+    reset_after = _parse_reset(reset_raw, current)
+
+    window = _parse_interval(headers.get("x-rate-limit-interval"))
+    if window is not None and limit is None:
+        limit = _first_number(headers, "x-rate-limit-limit")
+
+    if remaining is None and (window is None or limit is None):
+        return None
+    return QuotaSnapshot(remaining=remaining, limit=limit, reset_after=reset_after, window=window)
+
+
+def quota_pacing_interval(snapshot: QuotaSnapshot, *, base_interval: float) -> tuple[float, float] | None:
+    """Return ``(interval, duration)`` pacing for *snapshot*, or ``None``.
+
+    With a draining quota, the spacing ramps linearly. It starts at the
+    configured *base_interval* when ``QUOTA_PACING_FRACTION`` of the limit is
+    left. It reaches an even spread of the remaining requests over the time to
+    reset as the quota approaches zero. Without an advertised limit, the even
+    spread is used directly. An advertised request rate (Crossref) becomes its
+    per-request spacing. Pacing never speeds a limiter up: intervals at or
+    below *base_interval* return ``None``.
+    """
+    if snapshot.remaining is not None and snapshot.reset_after:
+        remaining = max(snapshot.remaining, 0.0)
+        spread = snapshot.reset_after / max(remaining, 1.0)
+        if snapshot.limit and snapshot.limit > 0:
+            low_water = snapshot.limit * QUOTA_PACING_FRACTION
+            if remaining >= low_water:
+                return None
+            drained = 1.0 - remaining / low_water
+            interval = base_interval + (spread - base_interval) * drained
+        else:
+            interval = spread
+        if interval > base_interval:
+            return interval, snapshot.reset_after
+        return None
+
+    if snapshot.window and snapshot.limit and snapshot.limit > 0:
+        interval = snapshot.window / snapshot.limit
+        if interval > base_interval:
+            return interval, snapshot.window
+    return None
+
+
+__all__ = [
+    "QUOTA_PACING_FRACTION",
+    "QuotaSnapshot",
+    "parse_quota_headers",
+    "quota_pacing_interval",
+]
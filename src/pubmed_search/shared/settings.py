@@ -14,6 +14,7 @@ DEFAULT_DATA_DIR = str(Path.home() / ".pubmed-search-mcp")
 DEFAULT_HTTP_API_PORT = 8765
 DEFAULT_FULLTEXT_INLINE_MAX_CHARS = 20_000
 DEFAULT_TENANT_MAX_CONCURRENCY = 8
+DEFAULT_TOOL_DEADLINE_SECONDS = 300.0
 
 
 class AppSettings(BaseSettings):
@@ -36,6 +37,18 @@ class AppSettings(BaseSettings):
     local_allow_container_bind: bool = Field(default=False, alias="PUBMED_LOCAL_ALLOW_CONTAINER_BIND")
 
     profiling_enabled: bool = Field(default=False, alias="PUBMED_PROFILING")
+    # Record/replay of upstream HTTP and E-utility traffic for offline benchmarks.
+    http_cassette_mode: Literal["off", "record", "replay"] = Field(default="off", alias="PUBMED_HTTP_CASSETTE_MODE")
+    http_cassette_dir: str | None = Field(default=None, alias="PUBMED_HTTP_CASSETTE_DIR")
+    http_cassette_latency_scale: float = Field(default=0.0, alias="PUBMED_HTTP_CASSETTE_LATENCY_SCALE")
+    # Outbound connection pools are kept per origin; HTTP/2 needs the optional h2 package.
+    http2_enabled: bool = Field(default=False, alias="PUBMED_HTTP2")
+    http_pool_idle_seconds: float = Field(default=120.0, alias="PUBMED_HTTP_POOL_IDLE_SECONDS")
+    # Share breaker state across workers and restarts via <data_dir>/cache/circuit_breakers.json.
+    circuit_breaker_store_enabled: bool = Field(default=False, alias="PUBMED_CIRCUIT_BREAKER_STORE")
+    # Accumulate document frequencies of cached articles in <data_dir>/cache/idf_stats.tsv as a BM25 IDF prior.
+    idf_store_enabled: bool = Field(default=False, alias="PUBMED_IDF_STORE")
+    idf_prior_weight: float = Field(default=0.5, alias="PUBMED_IDF_PRIOR_WEIGHT")
     disabled_sources_raw: str = Field(default="", alias="PUBMED_SEARCH_DISABLED_SOURCES")
     artifact_include_local_paths: bool = Field(default=False, alias="PUBMED_ARTIFACT_INCLUDE_LOCAL_PATHS")
     fulltext_inline_max_chars: int = Field(
@@ -57,6 +70,11 @@ class AppSettings(BaseSettings):
         default=DEFAULT_TENANT_MAX_CONCURRENCY,
         alias="PUBMED_TENANT_MAX_CONCURRENCY",
     )
+    # End-to-end budget for one MCP tool call; nested retries and fan-out stop at it.
+    tool_deadline_seconds: float = Field(
+        default=DEFAULT_TOOL_DEADLINE_SECONDS,
+        alias="PUBMED_TOOL_DEADLINE_SECONDS",
+    )
 
     crossref_email: str | None = Field(default=None, alias="CROSSREF_EMAIL")
     unpaywall_email: str | None = Field(default=None, alias="UNPAYWALL_EMAIL")
@@ -138,6 +156,7 @@ class AppSettings(BaseSettings):
     @field_validator(
         "workspace_dir",
         "notes_dir",
+        "http_cassette_dir",
         "crossref_email",
         "unpaywall_email",
         "openalex_api_key",
@@ -165,7 +184,7 @@ class AppSettings(BaseSettings):
             return stripped or None
         return value
 
-    @field_validator("server_mode", mode="before")
+    @field_validator("server_mode", "http_cassette_mode", mode="before")
     @classmethod
     def _normalize_server_mode(cls, value: object) -> object:
         if isinstance(value, str):
@@ -26,10 +26,11 @@ from pubmed_search.shared.async_utils import (
     RequestExecutionPolicy,
     RetryableOperationError,
     RetryPolicy,
+    clamp_timeout_to_request_deadline,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import AsyncGenerator, Awaitable, Callable
 
     import httpx
 else:
@@ -402,11 +403,48 @@ async def gather_source_adapter_calls(
     *,
     per_call_timeout: float | None = None,
 ) -> list[SourceAdapterResult[AdapterItem]]:
-    """Execute adapter calls concurrently and always return normalized results."""
+    """Execute adapter calls concurrently and always return normalized results.
+
+    ``per_call_timeout`` is clamped to the active request deadline, so a
+    source that would finish after the caller has given up reports a timeout
+    instead.
+    """
     if not calls:
         return []
+    per_call_timeout = clamp_timeout_to_request_deadline(per_call_timeout)
     if per_call_timeout is None:
         return await asyncio.gather(*(execute_source_adapter_call(call) for call in calls))
     return await asyncio.gather(
         *(_execute_source_adapter_call_with_timeout(call, timeout=per_call_timeout) for call in calls)
     )
+
+
+async def iter_source_adapter_calls(
+    calls: list[SourceAdapterCall[AdapterItem]],
+    *,
+    per_call_timeout: float | None = None,
+) -> AsyncGenerator[tuple[int, SourceAdapterResult[AdapterItem]], None]:
+    """Execute adapter calls concurrently and yield ``(position, result)`` as each settles.
+
+    Results are normalized exactly like :func:`gather_source_adapter_calls`,
+    but arrive in completion order so callers can start on the fastest
+    sources. Calls still running when the iterator is closed are cancelled;
+    wrap it in ``contextlib.aclosing`` when the loop may stop early.
+    """
+    if not calls:
+        return
+    per_call_timeout = clamp_timeout_to_request_deadline(per_call_timeout)
+
+    async def _run(position: int, call: SourceAdapterCall[AdapterItem]) -> tuple[int, SourceAdapterResult[AdapterItem]]:
+        if per_call_timeout is None:
+            return position, await execute_source_adapter_call(call)
+        return position, await _execute_source_adapter_call_with_timeout(call, timeout=per_call_timeout)
+
+    tasks = [asyncio.ensure_future(_run(position, call)) for position, call in enumerate(calls)]
+    try:
+        for settled in asyncio.as_completed(tasks):
+            yield await settled
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,146 @@
+"""Bounded intern table for repeated article metadata strings.
+
+A session's cached articles repeat the same journal names, abbreviations,
+MeSH headings, keywords, publication types and affiliations thousands of
+times, and every parsed JSON payload carries its own copy of each. The
+intern table maps each distinct value to one canonical ``str`` so equal
+metadata strings share a single object.
+
+Unlike ``sys.intern`` the table is bounded: it holds at most ``max_entries``
+strings (oldest evicted first) and ignores long values such as titles and
+abstracts, which rarely repeat. Evicting an entry never changes a value; it
+only means later copies stop sharing with earlier ones.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, TypeVar, overload
+
+DEFAULT_MAX_ENTRIES = 50_000
+MAX_INTERNED_LENGTH = 300  # Long affiliations still fit; titles/abstracts are skipped upstream
+
+# Flat metadata keys of article payload dicts (PubMed records, cached
+# articles, source-normalized dicts) whose values repeat across articles.
+ARTICLE_METADATA_KEYS = (
+    "journal",
+    "journal_abbrev",
+    "fulljournalname",
+    "source",
+    "publisher",
+    "language",
+    "keywords",
+    "mesh_terms",
+    "publication_types",
+    "article_type",
+    "categories",
+)
+
+_ValueT = TypeVar("_ValueT")
+
+
+class InternTable:
+    """Canonicalize equal strings to one shared object, up to ``max_entries`` of them."""
+
+    __slots__ = ("_lock", "_table", "hits", "max_entries", "max_length", "misses")
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, *, max_length: int = MAX_INTERNED_LENGTH) -> None:
+        self.max_entries = max_entries
+        self.max_length = max_length
+        self._table: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @overload
+    def intern(self, value: str) -> str: ...
+
+    @overload
+    def intern(self, value: _ValueT) -> _ValueT: ...
+
+    def intern(self, value: object) -> object:
+        """Return the canonical copy of a string; other values pass through unchanged."""
+        if type(value) is not str or len(value) > self.max_length:
+            return value
+        canonical = self._table.get(value)
+        if canonical is not None:
+            self.hits += 1
+            return canonical
+        if self.max_entries <= 0:
+            return value
+        with self._lock:
+            self.misses += 1
+            canonical = self._table.setdefault(value, value)
+            if len(self._table) > self.max_entries:
+                del self._table[next(iter(self._table))]
+        return canonical
+
+    def intern_list(self, values: list[Any]) -> list[Any]:
+        """Canonicalize the strings of a list in place and return it."""
+        intern = self.intern
+        values[:] = [intern(value) for value in values]
+        return values
+
+    def intern_payload(self, payload: dict[str, Any], keys: tuple[str, ...] = ARTICLE_METADATA_KEYS) -> dict[str, Any]:
+        """Canonicalize the metadata values of an article payload dict in place.
+
+        String values and lists of strings under *keys* are interned, as are
+        the per-author ``affiliation``/``affiliations`` of ``authors_full``.
+        Values stay equal, so callers holding the payload see no difference.
+        """
+        for key in keys:
+            value = payload.get(key)
+            if type(value) is str:
+                payload[key] = self.intern(value)
+            elif type(value) is list and value:
+                self.intern_list(value)
+        authors = payload.get("authors_full")
+        if type(authors) is list:
+            for author in authors:
+                if type(author) is not dict:
+                    continue
+                if "affiliation" in author:
+                    author["affiliation"] = self.intern(author["affiliation"])
+                affiliations = author.get("affiliations")
+                if type(affiliations) is list and affiliations:
+                    self.intern_list(affiliations)
+        return payload
+
+    def clear(self) -> None:
+        """Drop every entry and reset the hit/miss counters."""
+        with self._lock:
+            self._table.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Entry count, capacity and lookup counters."""
+        return {
+            "entries": len(self._table),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._table
+
+
+_metadata_intern_table = InternTable()
+
+
+def get_intern_table() -> InternTable:
+    """The process-wide intern table used for article metadata."""
+    return _metadata_intern_table
+
+
+__all__ = [
+    "ARTICLE_METADATA_KEYS",
+    "DEFAULT_MAX_ENTRIES",
+    "MAX_INTERNED_LENGTH",
+    "InternTable",
+    "get_intern_table",
+]
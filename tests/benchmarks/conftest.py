@@ -0,0 +1,162 @@
+"""
+Regression baselines for the benchmark suite.
+
+Benchmarks that request the ``regression_guard`` fixture are compared against
+``baselines.json``. Timings are stored relative to a fixed pure-Python
+calibration workload timed around each benchmark, so a baseline recorded on
+one machine remains meaningful on another. A benchmark fails when its best
+round is more than twice as slow as the baseline (``--benchmark-regression-threshold``).
+
+Record or refresh baselines after an intended performance change::
+
+    uv run pytest tests/benchmarks/ --benchmark-only -p no:xdist --update-benchmark-baselines
+
+The guard only enforces with ``--benchmark-only``; plain test runs (and xdist,
+where benchmarks are disabled) execute the benchmark bodies as smoke tests and
+skip the ``slow`` sizes.
+
+Benchmarks that talk to an upstream API request the ``http_cassette`` fixture,
+which replays the responses stored under ``cassettes/`` so they run offline
+and without network jitter. Re-record them from the live APIs with::
+
+    uv run pytest tests/benchmarks/ --benchmark-only -p no:xdist --record-benchmark-cassettes
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pubmed_search.shared.http_cassette import HttpCassette, use_cassette
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Iterator
+
+BASELINES_FILE = Path(__file__).with_name("baselines.json")
+CASSETTE_DIR = Path(__file__).with_name("cassettes")
+DEFAULT_REGRESSION_THRESHOLD = 1.0  # Fail when more than twice as slow as the baseline
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("pubmed-benchmarks")
+    group.addoption(
+        "--update-benchmark-baselines",
+        action="store_true",
+        default=False,
+        help="Record the measured timings as the new benchmark baselines.",
+    )
+    group.addoption(
+        "--benchmark-regression-threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="Allowed slowdown over the baseline before a benchmark fails (1.0 = twice as slow).",
+    )
+    group.addoption(
+        "--record-benchmark-cassettes",
+        action="store_true",
+        default=False,
+        help="Record upstream responses for cassette-backed benchmarks from the live APIs.",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Only time the ``slow`` (largest) benchmark sizes when benchmarking."""
+    if config.getoption("benchmark_only"):
+        return
+    skip_slow = pytest.mark.skip(reason="large benchmark size; run with --benchmark-only")
+    benchmarks_dir = Path(__file__).parent
+    for item in items:
+        if "slow" in item.keywords and benchmarks_dir in item.path.parents:
+            item.add_marker(skip_slow)
+
+
+def _calibration_workload() -> int:
+    """Dict, string and sort work resembling deduplication and ranking."""
+    keys = [f"10.{i % 9973}/bench.{i}" for i in range(20_000)]
+    index: dict[str, int] = {}
+    for position, key in enumerate(keys):
+        index.setdefault(key.lower(), position)
+    return len(sorted(index, key=len))
+
+
+def _calibration_seconds(repeat: int = 5) -> float:
+    """Best-of-*repeat* time of the calibration workload, as the machine runs right now."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _calibration_workload()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@pytest.fixture(scope="session")
+def benchmark_baselines(request: pytest.FixtureRequest) -> Iterator[dict[str, float]]:
+    """Baselines keyed by test name; written back at session end when updating."""
+    baselines: dict[str, float] = (
+        json.loads(BASELINES_FILE.read_text(encoding="utf-8")) if BASELINES_FILE.exists() else {}
+    )
+    yield baselines
+    if request.config.getoption("update_benchmark_baselines"):
+        BASELINES_FILE.write_text(json.dumps(dict(sorted(baselines.items())), indent=2) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def http_cassette(request: pytest.FixtureRequest) -> Iterator[HttpCassette]:
+    """Serve upstream HTTP responses from ``cassettes/`` for the duration of a benchmark.
+
+    HTTP clients pick up the active cassette when they are created, so create
+    them inside the test, not at import time or in a wider-scoped fixture.
+    """
+    mode = "record" if request.config.getoption("record_benchmark_cassettes") else "replay"
+    with use_cassette(HttpCassette(CASSETTE_DIR, mode=mode)) as cassette:
+        yield cassette
+
+
+@pytest.fixture
+def run_async() -> Iterator[Callable[[Coroutine[Any, Any, Any]], Any]]:
+    """Run coroutines to completion on one event loop kept for the whole test.
+
+    Benchmarked callables are synchronous; async client calls go through this
+    runner so every round reuses the same loop (and the client's pools).
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop.run_until_complete
+    finally:
+        loop.close()
+
+
+@pytest.fixture
+def regression_guard(
+    request: pytest.FixtureRequest,
+    benchmark: pytest.BenchmarkFixture,
+    benchmark_baselines: dict[str, float],
+) -> Iterator[None]:
+    """Compare this test's benchmark against its stored baseline after it runs.
+
+    The calibration workload is timed just before and just after the
+    benchmark, so load or clock changes during the session affect both sides.
+    """
+    config = request.config
+    enforce = config.getoption("benchmark_only") and not benchmark.disabled
+    before = _calibration_seconds() if enforce else 0.0
+    yield
+    if not enforce or benchmark.stats is None:
+        return
+    relative = benchmark.stats.stats.min / ((before + _calibration_seconds()) / 2)
+    name = request.node.name
+    if config.getoption("update_benchmark_baselines"):
+        benchmark_baselines[name] = float(f"{relative:.4g}")
+        return
+    baseline = benchmark_baselines.get(name)
+    threshold = config.getoption("benchmark_regression_threshold")
+    if baseline is not None and relative > baseline * (1 + threshold):
+        pytest.fail(
+            f"{name} regressed: {relative:.3g}x calibration vs baseline {baseline:.3g}x "
+            f"(threshold +{threshold:.0%}); rerun with --update-benchmark-baselines if intended"
+        )
@@ -0,0 +1,119 @@
+"""
+Ranking and deduplication benchmarks on synthetic multi-source corpora.
+
+Each benchmark runs at 100, 1k, 10k and 50k source records (50k is marked
+``slow``) built by :mod:`tests.fixtures.synthetic_corpus`, and is checked
+against ``baselines.json`` by the ``regression_guard`` fixture (see
+``conftest.py``).
+
+Run with::
+
+    uv run pytest tests/benchmarks/test_aggregation_benchmarks.py --benchmark-only -p no:xdist
+"""
+
+from __future__ import annotations
+
+from functools import cache
+
+import pytest
+
+from pubmed_search.application.search.ranking_algorithms import mmr_diversify, reciprocal_rank_fusion
+from pubmed_search.application.search.result_aggregator import RankingConfig, ResultAggregator
+from pubmed_search.application.search.term_index import ArticleTermIndex
+from tests.fixtures.synthetic_corpus import synthetic_source_results, synthetic_work_groups
+
+QUERY = "sepsis mortality in ICU patients randomized controlled trial"
+
+SIZES = [100, 1_000, 10_000, pytest.param(50_000, marks=pytest.mark.slow)]
+
+# Timed rounds per size: enough for a stable minimum without slowing large runs.
+_ROUNDS = {100: 30, 1_000: 10, 10_000: 3, 50_000: 3}
+
+pytestmark = pytest.mark.usefixtures("regression_guard")
+
+
+@cache
+def _ranked(size: int) -> tuple:
+    """Deduplicated, ranked articles of the corpus (shared read-only input)."""
+    aggregator = ResultAggregator()
+    articles, _stats = aggregator.aggregate(synthetic_source_results(size))
+    return tuple(aggregator.rank(articles, query=QUERY))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_aggregate(benchmark: pytest.BenchmarkFixture, size: int) -> None:
+    """Union-find deduplication and merge of every source's records."""
+
+    def setup() -> tuple[tuple, dict]:
+        return (synthetic_source_results(size),), {}
+
+    articles, stats = benchmark.pedantic(ResultAggregator().aggregate, setup=setup, rounds=_ROUNDS[size])
+    assert stats.total_input == size
+    assert 0 < len(articles) < size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_rank(benchmark: pytest.BenchmarkFixture, size: int) -> None:
+    """BM25 + RRF ranking of the deduplicated result set."""
+    articles = list(_ranked(size))
+    config = RankingConfig()
+
+    ranked = benchmark.pedantic(ResultAggregator(config).rank, args=(articles, config, QUERY), rounds=_ROUNDS[size])
+    assert len(ranked) == len(articles)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_mmr_diversify(benchmark: pytest.BenchmarkFixture, size: int) -> None:
+    """MMR selection of the top 50 over the shared term index."""
+    articles = list(_ranked(size))
+    index = ArticleTermIndex(articles)
+
+    result = benchmark.pedantic(
+        mmr_diversify,
+        args=(articles, QUERY, 0.7, 50),
+        kwargs={"term_index": index},
+        rounds=_ROUNDS[size],
+    )
+    assert len(result.articles) == min(50, len(articles))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_reciprocal_rank_fusion(benchmark: pytest.BenchmarkFixture, size: int) -> None:
+    """Weighted RRF over three precomputed dimension rankings."""
+    articles = list(_ranked(size))
+    index = ArticleTermIndex(articles)
+    keys = list(index.keys)
+    by_key = dict(zip(keys, articles))
+    rankings = {
+        "relevance": keys,
+        "recency": sorted(keys, key=lambda key: by_key[key].year or 0, reverse=True),
+        "impact": sorted(keys, key=lambda key: len(by_key[key].authors), reverse=True),
+    }
+    weights = {"relevance": 0.5, "recency": 0.25, "impact": 0.25}
+
+    result = benchmark.pedantic(
+        reciprocal_rank_fusion,
+        args=(articles, rankings),
+        kwargs={"dimension_weights": weights, "term_index": index},
+        rounds=_ROUNDS[size],
+    )
+    assert len(result.ranked_articles) == len(articles)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_merge_from(benchmark: pytest.BenchmarkFixture, size: int) -> None:
+    """Merging every duplicate record into the first record of its work."""
+
+    def setup() -> tuple[tuple, dict]:
+        return (synthetic_work_groups(size),), {}
+
+    def merge_all(groups: list[list]) -> int:
+        merged = 0
+        for primary, *duplicates in groups:
+            for duplicate in duplicates:
+                primary.merge_from(duplicate)
+                merged += 1
+        return merged
+
+    merged = benchmark.pedantic(merge_all, setup=setup, rounds=_ROUNDS[size])
+    assert 0 < merged < size
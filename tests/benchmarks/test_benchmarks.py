@@ -158,3 +158,162 @@ class TestQueryAnalysisBenchmarks:
         query = '"Artificial Intelligence"[MeSH] AND "Anesthesiology"[MeSH] AND clinical trial[pt]'
 
         benchmark(analyzer.analyze, query)
+
+
+# ============================================================================
+# Benchmark: Ranking (shared term index)
+# ============================================================================
+
+
+def _ranking_corpus(size: int) -> list:
+    """Synthetic result set with overlapping vocabulary across articles."""
+    from pubmed_search.domain.entities.article import UnifiedArticle
+
+    topics = ["anesthesia", "sepsis", "radiology", "oncology", "cardiology", "genomics", "pediatrics", "imaging"]
+    methods = ["randomized trial", "cohort study", "meta-analysis", "deep learning", "case series"]
+    return [
+        UnifiedArticle(
+            title=f"{methods[i % 5].title()} of {topics[i % 8]} outcomes in cohort {i % 97}",
+            primary_source="pubmed",
+            pmid=str(10_000_000 + i),
+            abstract=(
+                f"We evaluated {topics[(i + 3) % 8]} and {topics[i % 8]} outcomes using {methods[(i + 1) % 5]}. "
+                f"Patients receiving intervention {i % 13} showed improved survival and reduced complications."
+            ),
+            year=2000 + i % 25,
+            keywords=[topics[i % 8], methods[i % 5]],
+            mesh_terms=[topics[(i + 1) % 8].title(), "Humans"],
+        )
+        for i in range(size)
+    ]
+
+
+class TestRankingBenchmarks:
+    """Benchmark tokenize-once ranking over large merged result sets."""
+
+    QUERY = "deep learning radiology imaging outcomes"
+
+    @pytest.mark.parametrize("size", [1_000, 10_000])
+    def test_term_index_bm25(self, benchmark: pytest.BenchmarkFixture, size: int) -> None:
+        """Index build + BM25 for every result: < 100 ms at 1k, < 1 s at 10k."""
+        from pubmed_search.application.search.ranking_algorithms import BM25Corpus, bm25_scores
+        from pubmed_search.application.search.term_index import ArticleTermIndex
+
+        articles = _ranking_corpus(size)
+
+        def _score() -> list[float]:
+            return bm25_scores(self.QUERY, BM25Corpus.from_index(ArticleTermIndex(articles)))
+
+        scores = benchmark(_score)
+        assert len(scores) == size
+
+    @pytest.mark.parametrize("vectorize", [False, True], ids=["python", "numpy"])
+    def test_bm25_rescore_10k(self, benchmark: pytest.BenchmarkFixture, vectorize: bool) -> None:
+        """Re-scoring 10k indexed results: < 150 ms in Python, < 10 ms vectorized."""
+        if vectorize:
+            pytest.importorskip("numpy")
+        from pubmed_search.application.search.ranking_algorithms import BM25Corpus, bm25_scores
+        from pubmed_search.application.search.term_index import ArticleTermIndex
+
+        corpus = BM25Corpus.from_index(ArticleTermIndex(_ranking_corpus(10_000)))
+        bm25_scores(self.QUERY, corpus, vectorize=vectorize)  # build the matrix once
+
+        scores = benchmark(bm25_scores, self.QUERY, corpus, vectorize=vectorize)
+        assert len(scores) == 10_000
+
+    def test_mmr_diversify_2000_top200(self, benchmark: pytest.BenchmarkFixture) -> None:
+        """Incremental MMR selecting k=200 of n=2000 results should be < 1 s."""
+        from pubmed_search.application.search.ranking_algorithms import mmr_diversify
+        from pubmed_search.application.search.term_index import ArticleTermIndex
+
+        articles = _ranking_corpus(2_000)
+        index = ArticleTermIndex(articles)
+
+        result = benchmark(mmr_diversify, articles, self.QUERY, 0.7, 200, term_index=index)
+        assert len(result.articles) == 200
+
+    def test_source_disagreement_5000(self, benchmark: pytest.BenchmarkFixture) -> None:
+        """Per-source bitmaps: disagreement over 5k multi-source results should be < 50 ms."""
+        from pubmed_search.application.search.ranking_algorithms import analyze_source_disagreement
+        from pubmed_search.application.search.term_index import ArticleTermIndex
+        from pubmed_search.domain.entities.article import SourceMetadata
+
+        names = ["pubmed", "europe_pmc", "openalex", "semantic_scholar", "core", "crossref"]
+        articles = _ranking_corpus(5_000)
+        for i, article in enumerate(articles):
+            article.sources = [
+                SourceMetadata(source=name) for bit, name in enumerate(names) if (i * 37) % 64 & (1 << bit)
+            ]
+        index = ArticleTermIndex(articles)
+
+        result = benchmark(analyze_source_disagreement, articles, term_index=index)
+        assert result.cross_source_articles > 0
+
+    def test_average_pairwise_distance_2000(self, benchmark: pytest.BenchmarkFixture) -> None:
+        """Diversity of 2k results is estimated from a fixed 20k-pair sample instead of 2M pairs."""
+        from pubmed_search.application.search.ranking_algorithms import _average_pairwise_distance
+        from pubmed_search.application.search.term_index import ArticleTermIndex
+
+        index = ArticleTermIndex(_ranking_corpus(2_000))
+        term_sets = [index.similarity_terms(position) for position in range(len(index))]
+
+        distance = benchmark(_average_pairwise_distance, term_sets)
+        assert 0.0 < distance < 1.0
+
+    @pytest.mark.parametrize("size", [1_000, 10_000])
+    def test_aggregator_rank(self, benchmark: pytest.BenchmarkFixture, size: int) -> None:
+        """Full BM25 + RRF ranking without MMR: < 150 ms at 1k, < 1.5 s at 10k."""
+        from pubmed_search.application.search.result_aggregator import RankingConfig, ResultAggregator
+
+        articles = _ranking_corpus(size)
+        config = RankingConfig.default()
+        config.use_mmr = False
+
+        ranked = benchmark(ResultAggregator(config).rank, articles, config, self.QUERY)
+        assert len(ranked) == size
+
+    @pytest.mark.parametrize("use_rrf", [False, True], ids=["weighted", "rrf"])
+    def test_aggregator_rank_top_k(self, benchmark: pytest.BenchmarkFixture, use_rrf: bool) -> None:
+        """Top-20 of 10k with entity matching: weighted ranking fully scores ~50 articles."""
+        from pubmed_search.application.search.result_aggregator import RankingConfig, ResultAggregator
+
+        articles = _ranking_corpus(10_000)
+        config = RankingConfig(use_rrf=use_rrf, matched_entities=["radiology", "deep learning"])
+
+        ranked = benchmark(ResultAggregator(config).rank, articles, config, self.QUERY, top_k=20)
+        assert len(ranked) == 20
+
+    @pytest.mark.parametrize("columnar", [False, True], ids=["per_article", "columns"])
+    @pytest.mark.parametrize("size", [500, 5_000])
+    def test_dimension_scores(self, benchmark: pytest.BenchmarkFixture, size: int, columnar: bool) -> None:
+        """Quality/recency/impact/trust for every result: columns beat per-article scoring, same scores."""
+        from pubmed_search.application.search.result_aggregator import RankingConfig, ResultAggregator
+        from pubmed_search.domain.entities.article import CitationMetrics
+
+        articles = _ranking_corpus(size)
+        for i, article in enumerate(articles):
+            article.citation_metrics = CitationMetrics(
+                citation_count=i % 500,
+                relative_citation_ratio=(i % 40) / 10 if i % 3 else None,
+            )
+        aggregator = ResultAggregator()
+        config = RankingConfig()
+        relevance = [0.5] * size
+
+        def _per_article() -> list[tuple[float, ...]]:
+            return [
+                (
+                    aggregator._calculate_quality(article, config),
+                    aggregator._calculate_recency(article, config),
+                    aggregator._calculate_impact(article),
+                    aggregator._calculate_source_trust(article, config),
+                )
+                for article in articles
+            ]
+
+        def _columns() -> list[tuple[float, ...]]:
+            columns = aggregator._calculate_dimension_columns(articles, config, None, relevance=relevance)
+            return list(zip(columns["quality"], columns["recency"], columns["impact"], columns["source_trust"]))
+
+        scores = benchmark(_columns if columnar else _per_article)
+        assert scores == (_per_article() if columnar else _columns())
@@ -0,0 +1,127 @@
+"""
+Memory footprint of article entities, measured with ``tracemalloc``.
+
+Deep searches and session caches keep tens of thousands of ``UnifiedArticle``
+objects alive, so the retained size per article matters as much as speed.
+Each benchmark builds a synthetic multi-source corpus (see
+:mod:`tests.fixtures.synthetic_corpus`), times the construction, and
+separately measures the bytes still allocated once the corpus is built. The
+per-article figure is stored in the benchmark's ``extra_info`` and checked
+against a ceiling.
+
+With the slotted entities and shared empty-tuple defaults, 50k articles retain
+about 1.0 KB each (titles, abstracts, authors and source metadata included);
+the previous ``__dict__``-backed dataclasses retained about 2.5 KB.
+
+``test_mapped_article_memory`` maps PubMed-shaped JSON payloads through
+``article_from_pubmed`` (the payload stays alive as ``raw_data``) and reports
+the retained size with the metadata intern table enabled and disabled.
+
+Run with::
+
+    uv run pytest tests/benchmarks/test_memory_benchmarks.py --benchmark-only -p no:xdist
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import tracemalloc
+from functools import cache
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pubmed_search.domain.services import article_mapper
+from pubmed_search.shared.string_interning import InternTable
+from tests.fixtures.synthetic_corpus import synthetic_work_groups
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Retained bytes per article the slotted layout must stay under.
+MAX_BYTES_PER_ARTICLE = 1_400
+
+_AFFILIATIONS = (
+    "Department of Anesthesiology, National Taiwan University Hospital, Taipei, Taiwan",
+    "Division of Critical Care Medicine, Mayo Clinic, Rochester, MN, USA",
+    "Institute of Epidemiology, University College London, London, UK",
+    "Department of Radiology, Charité - Universitätsmedizin Berlin, Berlin, Germany",
+)
+
+
+def retained_bytes(build: Callable[[], object]) -> int:
+    """Bytes still allocated after ``build()`` returns, while its result is alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        current, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current
+
+
+@pytest.mark.parametrize("size", [1_000, pytest.param(50_000, marks=pytest.mark.slow)])
+def test_article_corpus_memory(benchmark: pytest.BenchmarkFixture, size: int) -> None:
+    """Retained memory of *size* source records built as ``UnifiedArticle`` entities."""
+    groups = benchmark.pedantic(synthetic_work_groups, args=(size,), rounds=1)
+    assert sum(map(len, groups)) == size
+    del groups
+
+    per_article = retained_bytes(lambda: synthetic_work_groups(size)) / size
+    benchmark.extra_info["bytes_per_article"] = round(per_article)
+    assert per_article < MAX_BYTES_PER_ARTICLE
+
+
+@cache
+def _pubmed_payload_json(size: int) -> str:
+    """PubMed-style record dicts of the synthetic corpus, as one JSON document."""
+    payloads = [
+        {
+            "pmid": article.pmid or f"9{position:07d}",
+            "title": article.title,
+            "abstract": article.abstract,
+            "journal": article.journal,
+            "source": article.journal,
+            "year": article.year,
+            "language": "eng",
+            "authors": [author.display_name for author in article.authors],
+            "authors_full": [
+                {"last_name": author.family_name, "affiliations": [_AFFILIATIONS[index % len(_AFFILIATIONS)]]}
+                for index, author in enumerate(article.authors)
+            ],
+            "keywords": list(article.keywords),
+            "mesh_terms": list(article.mesh_terms),
+            "article_type": ["Journal Article"],
+        }
+        for position, article in enumerate(record for group in synthetic_work_groups(size) for record in group)
+    ]
+    return json.dumps(payloads)
+
+
+@pytest.mark.parametrize("size", [1_000, pytest.param(50_000, marks=pytest.mark.slow)])
+def test_mapped_article_memory(
+    benchmark: pytest.BenchmarkFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    size: int,
+) -> None:
+    """Retained memory of mapped PubMed payloads, with and without metadata interning."""
+    text = _pubmed_payload_json(size)
+
+    def build() -> list:
+        return [article_mapper.article_from_pubmed(payload) for payload in json.loads(text)]
+
+    articles = benchmark.pedantic(build, rounds=1)
+    assert len(articles) == size
+    del articles
+
+    interned = retained_bytes(build) / size
+    with monkeypatch.context() as patch:
+        patch.setattr(article_mapper, "get_intern_table", lambda: InternTable(max_entries=0))
+        uninterned = retained_bytes(build) / size
+    benchmark.extra_info["bytes_per_article"] = round(interned)
+    benchmark.extra_info["bytes_per_article_uninterned"] = round(uninterned)
+    assert interned < uninterned
@@ -0,0 +1,104 @@
+"""
+Structured (JSON) response serialization benchmarks for ranked result sets.
+
+``_format_as_json`` encodes each article once per option set and caches the
+fragment on the article (``UnifiedArticle.cached_serialization``). The
+``cold`` benchmarks invalidate every article before each round, as on the
+first response for a search, once with the standard library encoder and once
+with the optional ``orjson`` one (skipped when it is not installed); the
+``warm`` ones reuse the cached fragments, as when the same ranked results are
+formatted again (pagination, retries, artifact and session saves). Responses
+of 50, 200 and 1000 articles are checked against ``baselines.json`` by the
+``regression_guard`` fixture.
+
+``capped`` formats 1000 and 10000 ranked articles under a tight
+``max_response_chars``, where the truncated fallback is packed from the
+encoded sizes of the response entries and article fragments.
+
+Run with::
+
+    uv run pytest tests/benchmarks/test_serialization_benchmarks.py --benchmark-only -p no:xdist
+"""
+
+from __future__ import annotations
+
+import json
+from functools import cache
+
+import pytest
+
+from pubmed_search.application.search.query_analyzer import QueryAnalyzer
+from pubmed_search.application.search.result_aggregator import ResultAggregator
+from pubmed_search.presentation.mcp_server.tools import agent_output
+from pubmed_search.presentation.mcp_server.tools.unified_formatting import _format_as_json
+from tests.fixtures.synthetic_corpus import synthetic_source_results
+
+QUERY = "sepsis mortality in ICU patients randomized controlled trial"
+
+SIZES = [50, 200, 1_000]
+
+_ROUNDS = {50: 50, 200: 20, 1_000: 10, 10_000: 5}
+
+# A cap well below the size of the full responses.
+TIGHT_CAP_CHARS = 20_000
+
+pytestmark = pytest.mark.usefixtures("regression_guard")
+
+
+@cache
+def _response_inputs(size: int) -> tuple:
+    """The top *size* ranked articles of a larger corpus, with their stats and analysis."""
+    aggregator = ResultAggregator()
+    articles, stats = aggregator.aggregate(synthetic_source_results(size * 2))
+    ranked = aggregator.rank(articles, query=QUERY)[:size]
+    return ranked, stats, QueryAnalyzer().analyze(QUERY)
+
+
+def _format(articles: list, stats: object, analysis: object, max_response_chars: int | None = None) -> str:
+    return _format_as_json(articles, analysis, stats, max_response_chars=max_response_chars)
+
+
+@pytest.fixture(autouse=True)
+def json_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """The JSON encoder in use: stdlib unless a test is parametrized with ``orjson``."""
+    backend = getattr(request, "param", "stdlib")
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(agent_output, "_load_orjson", lambda: None)
+    return backend
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("json_backend", ["stdlib", "orjson"], indirect=True)
+def test_format_response_cold(benchmark: pytest.BenchmarkFixture, size: int) -> None:
+    """Every article encoded from scratch, with each JSON encoder."""
+    articles, stats, analysis = _response_inputs(size)
+
+    def setup() -> tuple[tuple, dict]:
+        for article in articles:
+            article.mark_modified()
+        return (articles, stats, analysis), {}
+
+    text = benchmark.pedantic(_format, setup=setup, rounds=_ROUNDS[size])
+    assert len(json.loads(text)["articles"]) == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_format_response_warm(benchmark: pytest.BenchmarkFixture, size: int) -> None:
+    """Cached article fragments spliced into a new response."""
+    articles, stats, analysis = _response_inputs(size)
+    expected = _format(articles, stats, analysis)
+
+    text = benchmark.pedantic(_format, args=(articles, stats, analysis), rounds=_ROUNDS[size])
+    assert text == expected
+
+
+@pytest.mark.parametrize("size", [1_000, 10_000])
+def test_format_response_capped(benchmark: pytest.BenchmarkFixture, size: int) -> None:
+    """Truncated fallback of a large result set under a tight response cap."""
+    articles, stats, analysis = _response_inputs(size)
+
+    text = benchmark.pedantic(_format, args=(articles, stats, analysis, TIGHT_CAP_CHARS), rounds=_ROUNDS[size])
+    assert len(text) <= TIGHT_CAP_CHARS
+    assert json.loads(text)["status"] == "truncated"
@@ -0,0 +1,50 @@
+"""
+Source client benchmarks on replayed upstream responses.
+
+The ``http_cassette`` fixture (see ``conftest.py``) serves the recorded
+response through the normal client stack: URL building, the transport kernel,
+JSON decoding and article normalization are timed, the network is not.
+
+Run with::
+
+    uv run pytest tests/benchmarks/test_source_client_benchmarks.py --benchmark-only -p no:xdist
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pubmed_search.infrastructure.sources.europe_pmc import EuropePMCClient
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+    from pubmed_search.shared.http_cassette import HttpCassette
+
+QUERY = "sepsis mortality in ICU patients randomized controlled trial"
+LIMIT = 100
+
+pytestmark = pytest.mark.usefixtures("regression_guard")
+
+
+async def _search_core_page(client: EuropePMCClient) -> dict[str, Any]:
+    return await client.search(QUERY, limit=LIMIT, result_type="core", strict=True)
+
+
+def test_europe_pmc_search_replayed(
+    benchmark: pytest.BenchmarkFixture,
+    http_cassette: HttpCassette,
+    run_async: Callable[[Coroutine[Any, Any, Any]], Any],
+) -> None:
+    """One 100-result ``core`` page: request, replay and normalization."""
+    # Replayed responses need no upstream pacing
+    client = EuropePMCClient(email="bench@test.com", min_interval=0.0)
+    try:
+        result = benchmark(lambda: run_async(_search_core_page(client)))
+    finally:
+        run_async(client.close())
+
+    assert len(result["results"]) == LIMIT
+    assert http_cassette.misses == 0
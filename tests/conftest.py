@@ -22,6 +22,26 @@ def temp_dir():
         yield Path(tmpdir)
 
 
+@pytest.fixture(autouse=True)
+def _reset_result_set_cache():
+    """Keep unified_search result sets from leaking between tests."""
+    from pubmed_search.infrastructure.cache.result_set_cache import reset_result_set_cache
+
+    reset_result_set_cache()
+    yield
+    reset_result_set_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_source_performance_tracker():
+    """Keep live source latency/yield samples from leaking between tests."""
+    from pubmed_search.application.search.source_performance import reset_source_performance_tracker
+
+    reset_source_performance_tracker()
+    yield
+    reset_source_performance_tracker()
+
+
 @pytest.fixture
 def mock_email():
     """Provide a mock email for NCBI API."""
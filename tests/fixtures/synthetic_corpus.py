@@ -0,0 +1,185 @@
+"""
+Seeded synthetic multi-source corpora for ranking and deduplication benchmarks.
+
+Real unified searches return the same work from several sources, each with
+its own quirks. The generator reproduces the patterns ``ResultAggregator``
+has to handle:
+
+- the same DOI in different case or as a ``https://doi.org/`` URL;
+- PMIDs only on PubMed / Europe PMC copies (sometimes on OpenAlex);
+- near-duplicate titles (case, punctuation, a dropped word, a trailing period);
+- missing abstracts, years, journals and DOIs;
+- a bioRxiv/medRxiv preprint of some published works;
+- citation metrics only where a source provides them.
+
+The output depends only on ``size`` and ``seed``, so benchmark runs compare
+like with like.
+"""
+
+from __future__ import annotations
+
+import random
+
+from pubmed_search.domain.entities.article import (
+    ArticleType,
+    Author,
+    CitationMetrics,
+    SourceMetadata,
+    UnifiedArticle,
+)
+
+DEFAULT_SEED = 20_240_601
+SOURCES = ("pubmed", "europe_pmc", "openalex", "semantic_scholar", "crossref", "core")
+
+_TOPICS = (
+    "sepsis",
+    "anesthesia",
+    "delirium",
+    "radiology",
+    "oncology",
+    "cardiology",
+    "genomics",
+    "pediatrics",
+    "stroke",
+    "diabetes",
+    "asthma",
+    "obesity",
+)
+_METHODS = (
+    "randomized controlled trial",
+    "cohort study",
+    "systematic review and meta-analysis",
+    "deep learning model",
+    "case series",
+    "cross-sectional survey",
+)
+_OUTCOMES = ("mortality", "readmission", "quality of life", "length of stay", "complications", "survival")
+_POPULATIONS = ("adults", "children", "older adults", "ICU patients", "surgical patients", "pregnant women")
+_FAMILY_NAMES = ("Smith", "Chen", "Garcia", "Müller", "Tanaka", "Okafor", "Rossi", "Kim", "Nguyen", "Silva")
+_JOURNALS = ("Crit Care", "Lancet", "JAMA", "BMJ", "Anesthesiology", "Radiology", "N Engl J Med")
+_TYPES = (
+    ArticleType.JOURNAL_ARTICLE,
+    ArticleType.JOURNAL_ARTICLE,
+    ArticleType.REVIEW,
+    ArticleType.RANDOMIZED_CONTROLLED_TRIAL,
+    ArticleType.META_ANALYSIS,
+    ArticleType.UNKNOWN,
+)
+# Number of sources per work: most works come from one or two sources.
+_COPIES = (1, 1, 1, 1, 2, 2, 2, 3, 3, 4)
+
+
+def _title_variant(rng: random.Random, title: str) -> str:
+    roll = rng.random()
+    if roll < 0.15:
+        return title.upper() if rng.random() < 0.3 else title.lower()
+    if roll < 0.30:
+        return title.replace(":", " -").replace(",", "") + "."
+    if roll < 0.38:
+        words = title.split()
+        del words[rng.randrange(1, len(words))]
+        return " ".join(words)
+    return title
+
+
+def _doi_variant(rng: random.Random, doi: str) -> str | None:
+    roll = rng.random()
+    if roll < 0.15:
+        return None
+    if roll < 0.30:
+        return f"https://doi.org/{doi}"
+    if roll < 0.40:
+        return doi.upper()
+    return doi
+
+
+def _work_copies(rng: random.Random, work_id: int) -> list[UnifiedArticle]:
+    """All source records of one synthetic work."""
+    topic = rng.choice(_TOPICS)
+    title = (
+        f"{rng.choice(_METHODS).capitalize()} of {topic} and {rng.choice(_OUTCOMES)} "
+        f"in {rng.choice(_POPULATIONS)}: {rng.choice(_TOPICS)} cohort {work_id}"
+    )
+    doi = f"10.{1000 + work_id % 8000}/bench.{work_id}"
+    pmid = str(30_000_000 + work_id) if rng.random() < 0.7 else None
+    year = rng.randint(1995, 2025)
+    authors = [
+        Author(family_name=rng.choice(_FAMILY_NAMES), given_name=chr(65 + rng.randrange(26)))
+        for _ in range(rng.randint(1, 6))
+    ]
+    abstract = (
+        f"We studied {topic} in {rng.choice(_POPULATIONS)} using a {rng.choice(_METHODS)}. "
+        f"The primary outcome was {rng.choice(_OUTCOMES)}; secondary outcomes included {rng.choice(_OUTCOMES)}."
+    )
+    article_type = rng.choice(_TYPES)
+    journal = rng.choice(_JOURNALS)
+    citations = int(rng.paretovariate(1.2)) - 1
+
+    records: list[UnifiedArticle] = []
+    for source in rng.sample(SOURCES, rng.choice(_COPIES)):
+        has_pmid = source in {"pubmed", "europe_pmc"} or (source == "openalex" and rng.random() < 0.5)
+        metrics = None
+        if source in {"openalex", "semantic_scholar"}:
+            metrics = CitationMetrics(citation_count=citations)
+        elif source == "pubmed" and rng.random() < 0.5:
+            metrics = CitationMetrics(relative_citation_ratio=round(rng.uniform(0.1, 6.0), 2))
+        records.append(
+            UnifiedArticle(
+                title=_title_variant(rng, title),
+                primary_source=source,
+                pmid=pmid if has_pmid else None,
+                doi=_doi_variant(rng, doi),
+                authors=list(authors) if rng.random() < 0.9 else (),
+                abstract=abstract if rng.random() < 0.7 else None,
+                journal=journal if rng.random() < 0.85 else None,
+                year=year if rng.random() < 0.95 else None,
+                article_type=article_type if source in {"pubmed", "europe_pmc"} else ArticleType.UNKNOWN,
+                keywords=[topic] if rng.random() < 0.5 else (),
+                mesh_terms=[topic.title(), "Humans"] if source == "pubmed" else (),
+                citation_metrics=metrics,
+                sources=[SourceMetadata(source=source)],
+            )
+        )
+
+    if rng.random() < 0.03:  # Preprint of the published version
+        server = rng.choice(("biorxiv", "medrxiv"))
+        records.append(
+            UnifiedArticle(
+                title=_title_variant(rng, title),
+                primary_source="europe_pmc",
+                doi=f"10.1101/{year - 1}.{work_id:06d}",
+                authors=list(authors),
+                abstract=abstract,
+                journal=server,
+                year=year - 1,
+                article_type=ArticleType.PREPRINT,
+                sources=[SourceMetadata(source="europe_pmc")],
+            )
+        )
+    return records
+
+
+def synthetic_work_groups(size: int, *, seed: int = DEFAULT_SEED) -> list[list[UnifiedArticle]]:
+    """Source records grouped by the work they describe, *size* records in total."""
+    rng = random.Random(seed)
+    groups: list[list[UnifiedArticle]] = []
+    remaining = size
+    work_id = 0
+    while remaining > 0:
+        copies = _work_copies(rng, work_id)[:remaining]
+        groups.append(copies)
+        remaining -= len(copies)
+        work_id += 1
+    return groups
+
+
+def synthetic_source_results(size: int, *, seed: int = DEFAULT_SEED) -> list[list[UnifiedArticle]]:
+    """Per-source result lists (the input of ``ResultAggregator.aggregate``), *size* records in total."""
+    by_source: dict[str, list[UnifiedArticle]] = {source: [] for source in SOURCES}
+    for group in synthetic_work_groups(size, seed=seed):
+        for record in group:
+            by_source[record.primary_source].append(record)
+    return [records for records in by_source.values() if records]
+
+
+__all__ = ["DEFAULT_SEED", "SOURCES", "synthetic_source_results", "synthetic_work_groups"]
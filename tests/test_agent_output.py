@@ -0,0 +1,71 @@
+"""Tests for the shared structured-output encoders in agent_output."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+import toons
+
+from pubmed_search.presentation.mcp_server.tools import agent_output
+from pubmed_search.presentation.mcp_server.tools.agent_output import (
+    PreEncodedArray,
+    dumps_json,
+    encode_json_entry,
+    encode_json_fragment,
+    join_json_entries,
+    json_object_length,
+    pre_encoded_entry_length,
+    serialize_structured_payload,
+)
+
+ITEMS = [
+    {"title": "Sepsis in the ICU — a cohort", "pmid": "1", "score": 0.8125, "authors": ["Müller A", "Chen B"]},
+    {"title": "Empty fields", "pmid": None, "keywords": [], "metadata": {}, "flags": [True, False]},
+]
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def json_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    if request.param:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(agent_output, "_load_orjson", lambda: None)
+
+
+@pytest.mark.usefixtures("json_backend")
+class TestJsonEncoding:
+    def test_dumps_json_matches_stdlib_layout(self):
+        payload = {"articles": ITEMS, "count": 2, "nested": {"empty": [], "text": "naïve"}}
+        assert dumps_json(payload) == json.dumps(payload, ensure_ascii=False, indent=2)
+
+    def test_pre_encoded_array_is_byte_identical(self):
+        payload = {"tool": "unified_search", "articles": ITEMS, "source_counts": [{"source": "pubmed"}]}
+        spliced = {**payload, "articles": PreEncodedArray([encode_json_fragment(item) for item in ITEMS])}
+        assert serialize_structured_payload(spliced) == json.dumps(payload, ensure_ascii=False, indent=2)
+
+    def test_empty_pre_encoded_array(self):
+        payload = {"articles": PreEncodedArray([]), "tool": "unified_search"}
+        expected = json.dumps({"articles": [], "tool": "unified_search"}, ensure_ascii=False, indent=2)
+        assert serialize_structured_payload(payload) == expected
+
+    def test_json_entries_join_to_the_serialized_payload(self):
+        payload = {"tool": "unified_search", "count": 2, "articles": ITEMS, "empty": {}}
+        entries = [encode_json_entry(key, value) for key, value in payload.items()]
+        assert join_json_entries(entries) == json.dumps(payload, ensure_ascii=False, indent=2)
+        assert json_object_length([len(entry) for entry in entries]) == len(join_json_entries(entries))
+        assert join_json_entries([]) == "{}"
+        assert json_object_length([]) == 2
+
+    @pytest.mark.parametrize("count", [0, 1, 2])
+    def test_pre_encoded_entry_length_matches_spliced_text(self, count):
+        array = PreEncodedArray([encode_json_fragment(item) for item in ITEMS[:count]])
+        assert pre_encoded_entry_length("articles", array) == len(encode_json_entry("articles", array))
+
+    def test_integers_beyond_64_bits_fall_back_to_stdlib(self):
+        assert json.loads(dumps_json({"value": 2**70})) == {"value": 2**70}
+
+
+def test_toon_output_decodes_pre_encoded_arrays():
+    payload = {"tool": "unified_search", "articles": PreEncodedArray([encode_json_fragment(item) for item in ITEMS])}
+    assert serialize_structured_payload(payload, "toon") == toons.dumps({"tool": "unified_search", "articles": ITEMS})
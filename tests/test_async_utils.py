@@ -11,6 +11,7 @@ import pytest
 from pubmed_search.infrastructure.sources.base_client import BaseAPIClient
 from pubmed_search.shared.async_utils import (
     CircuitBreaker,
+    OperationBudgetExceeded,
     RateLimiter,
     RateLimitPolicy,
     RequestExecutionPolicy,
@@ -23,6 +24,8 @@ from pubmed_search.shared.async_utils import (
     get_shared_async_client,
     get_transport_kernel,
     parse_retry_after,
+    remaining_request_budget,
+    request_deadline,
     timeout_with_fallback,
 )
 from pubmed_search.shared.exceptions import RateLimitError
@@ -569,3 +572,112 @@ class TestRateLimiterBoundaries:
         started = time.monotonic()
         await limiter.acquire()
         assert time.monotonic() - started >= 0.04
+
+
+# ============================================================
+# Request-scoped deadlines
+# ============================================================
+
+
+class TestRequestDeadline:
+    def test_nested_scopes_only_tighten(self):
+        assert remaining_request_budget() is None
+        with request_deadline(10.0) as outer:
+            with request_deadline(60.0) as inner:
+                assert inner == outer
+            with request_deadline(1.0) as tighter:
+                assert tighter is not None
+                assert outer is not None
+                assert tighter < outer
+            remaining = remaining_request_budget()
+            assert remaining is not None
+            assert 9.0 < remaining <= 10.0
+        assert remaining_request_budget() is None
+
+    @pytest.mark.asyncio
+    async def test_kernel_never_schedules_backoff_past_request_deadline(self):
+        kernel = get_transport_kernel()
+        attempts = 0
+
+        async def always_retry():
+            nonlocal attempts
+            attempts += 1
+            raise RetryableOperationError("busy", retry_after=0.2, status_code=503)
+
+        started = time.monotonic()
+        with request_deadline(0.1), pytest.raises(OperationBudgetExceeded, match="request deadline"):
+            await kernel.execute(
+                always_retry,
+                policy=RequestExecutionPolicy(
+                    service_name="test-request-deadline",
+                    timeout=5.0,
+                    total_timeout=30.0,
+                    retry=RetryPolicy(max_attempts=5, base_delay=0.2, max_delay=0.2, jitter=False),
+                ),
+            )
+
+        assert attempts == 1
+        assert time.monotonic() - started < 0.1
+
+    @pytest.mark.asyncio
+    async def test_kernel_operation_is_cut_at_request_deadline(self):
+        kernel = get_transport_kernel()
+        cancelled = False
+
+        async def slow():
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        with request_deadline(0.05), pytest.raises(OperationBudgetExceeded):
+            await kernel.execute(
+                slow,
+                policy=RequestExecutionPolicy(
+                    service_name="test-request-deadline-op",
+                    timeout=5.0,
+                    retry=RetryPolicy(max_attempts=1),
+                ),
+            )
+
+        assert cancelled is True
+
+    @pytest.mark.asyncio
+    async def test_gather_cancels_work_abandoned_at_deadline(self):
+        cancelled: list[str] = []
+
+        async def task(name: str, delay: float) -> str:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+            return name
+
+        with request_deadline(0.05):
+            results = await gather_with_errors(task("fast", 0.0), task("slow", 5.0), return_exceptions=True)
+        with request_deadline(0.05), pytest.raises(OperationBudgetExceeded):
+            await gather_with_errors(task("late", 5.0))
+
+        assert results[0] == "fast"
+        assert isinstance(results[1], OperationBudgetExceeded)
+        assert sorted(cancelled) == ["late", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_batch_process_skips_batches_after_deadline(self):
+        processed: list[int] = []
+
+        async def process(item: int) -> int:
+            processed.append(item)
+            await asyncio.sleep(0.04)
+            return item
+
+        with request_deadline(0.05):
+            results = await batch_process(list(range(6)), process, batch_size=2)
+
+        assert processed == [0, 1]
+        assert results[:2] == [0, 1]
+        assert all(isinstance(result, OperationBudgetExceeded) for result in results[2:])
+        assert len(results) == 6
@@ -278,6 +278,76 @@ class TestAutoRelaxSearch:
         assert result.successful_step.level == 1  # First step
         assert len(result.steps_tried) == 1
 
+    async def test_speculative_counts_skip_to_first_level_with_hits(self, mock_searcher):
+        """Empty levels are counted concurrently; records are fetched only for the first level with hits."""
+        from pubmed_search.domain.entities.article import UnifiedArticle
+
+        args = ("cancer AND treatment", 10, 2020, None, {"clinical_query": "therapy"})
+        steps = _generate_relaxation_steps("cancer AND treatment", 2020, None, {"clinical_query": "therapy"})
+        empty_levels = {(step.query, step.min_year) for step in steps[:2]}
+        mock_searcher.search_count = AsyncMock(
+            side_effect=lambda query, min_year, _max_year, **_filters: 0 if (query, min_year) in empty_levels else 7
+        )
+
+        async def mock_search(searcher, query, limit, min_year=None, max_year=None, **kwargs):
+            if (query, min_year) in empty_levels:
+                return ([], 0)
+            return ([UnifiedArticle(title="Test", primary_source="pubmed")], 7)
+
+        with patch(
+            "pubmed_search.presentation.mcp_server.tools.unified_source_search._search_pubmed",
+            side_effect=mock_search,
+        ) as search_pubmed:
+            sequential = await _auto_relax_search(mock_searcher, *args)
+            search_pubmed.reset_mock()
+            speculative = await _auto_relax_search(mock_searcher, *args, speculative_levels=3)
+
+        assert mock_searcher.search_count.await_count == 3
+        assert search_pubmed.await_count == 1
+        assert speculative.successful_step.level == sequential.successful_step.level == steps[2].level
+        assert [(step.level, step.result_count) for step in speculative.steps_tried] == [
+            (step.level, step.result_count) for step in sequential.steps_tried
+        ]
+        assert speculative.total_results == sequential.total_results
+
+    async def test_speculative_count_failure_resumes_sequential_search(self, mock_searcher):
+        """A failed count is not treated as empty: records are searched from that level on."""
+        steps = _generate_relaxation_steps("cancer AND treatment", 2020, None, {"clinical_query": "therapy"})
+
+        async def count(query, min_year, _max_year, **_filters):
+            if (query, min_year) == (steps[1].query, steps[1].min_year):
+                raise TimeoutError
+            return 0
+
+        mock_searcher.search_count = AsyncMock(side_effect=count)
+        with patch(
+            "pubmed_search.presentation.mcp_server.tools.unified_source_search._search_pubmed",
+            new_callable=AsyncMock,
+            return_value=([], 0),
+        ) as search_pubmed:
+            result = await _auto_relax_search(
+                mock_searcher,
+                "cancer AND treatment",
+                10,
+                2020,
+                None,
+                {"clinical_query": "therapy"},
+                speculative_levels=3,
+            )
+
+        assert search_pubmed.await_args_list[0].args[3] == steps[1].min_year
+        assert search_pubmed.await_count == len(steps) - 1
+        assert len(result.steps_tried) == len(steps)
+
+    def test_speculative_relax_option_is_bounded(self):
+        """speculative_relax=K is a request option limited to the available relaxation depth."""
+        from pubmed_search.presentation.mcp_server.tools.unified_request import normalize_unified_search_request
+
+        assert normalize_unified_search_request(query="cancer", options="speculative_relax=3").speculative_relax == 3
+        assert normalize_unified_search_request(query="cancer").speculative_relax is None
+        with pytest.raises(ValueError, match="speculative_relax must be an integer from 2 to 6"):
+            normalize_unified_search_request(query="cancer", options="speculative_relax=9")
+
     async def test_handles_search_exception(self, mock_searcher):
         """Should handle exceptions during relaxed search gracefully."""
         with patch(
@@ -63,7 +63,7 @@ class TestCacheStore:
 
         payload = json.loads(file_path.read_text(encoding="utf-8"))
         assert isinstance(payload, dict)
-        assert not file_path.with_name("cache.json.tmp").exists()
+        assert not list(tmp_path.glob("cache.json*.tmp"))
 
         reloaded = JsonFileCacheBackend(file_path)
         keys = reloaded.keys()
@@ -0,0 +1,227 @@
+"""Tests for persisted, cross-worker circuit breaker state."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import threading
+import time
+from http.client import HTTPConnection
+from unittest.mock import MagicMock
+
+import pytest
+
+from pubmed_search.shared.async_utils import CircuitBreaker, circuit_breaker_states
+from pubmed_search.shared.cache_substrate import JsonFileCacheBackend, StoredCacheEntry
+from pubmed_search.shared.circuit_breaker_store import (
+    BreakerRecord,
+    CircuitBreakerStore,
+    get_circuit_breaker_store,
+)
+from pubmed_search.shared.exceptions import RateLimitError
+from pubmed_search.shared.settings import reset_settings_cache
+
+
+def _worker_store(path) -> CircuitBreakerStore:
+    """A store as a separate worker process would open it."""
+    return CircuitBreakerStore(JsonFileCacheBackend(path), refresh_interval=0.0)
+
+
+async def _fail(breaker: CircuitBreaker) -> None:
+    with pytest.raises(ValueError):
+        async with breaker:
+            raise ValueError("upstream down")
+
+
+def test_json_backend_refresh_picks_up_other_writers(tmp_path) -> None:
+    path = tmp_path / "shared.json"
+    reader = JsonFileCacheBackend(path)
+    writer = JsonFileCacheBackend(path)
+
+    assert reader.refresh() is False
+    writer.set_entry("a", StoredCacheEntry(value=1))
+    assert reader.refresh() is True
+    assert reader.get_entry("a").value == 1
+    assert reader.refresh() is False
+
+
+async def test_open_state_is_shared_between_workers(tmp_path) -> None:
+    path = tmp_path / "circuit_breakers.json"
+    first = CircuitBreaker(
+        failure_threshold=2, recovery_timeout=60.0, name="source:openalex", store=_worker_store(path)
+    )
+    second = CircuitBreaker(
+        failure_threshold=2, recovery_timeout=60.0, name="source:openalex", store=_worker_store(path)
+    )
+
+    await _fail(first)
+    await _fail(first)
+    assert first.state == "open"
+
+    with pytest.raises(RateLimitError, match="Circuit breaker is open"):
+        async with second:
+            pass
+    assert second.failure_count == 2
+
+    record = BreakerRecord.from_dict(json.loads(path.read_text(encoding="utf-8"))["source:openalex"]["value"])
+    assert record is not None
+    assert record.state == "open"
+    assert record.pid == os.getpid()
+
+
+async def test_store_writes_run_off_the_event_loop_and_coalesce(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "circuit_breakers.json"
+    store = _worker_store(path)
+    save = store.save
+    writer_threads: list[int] = []
+
+    def slow_save(record: BreakerRecord) -> None:
+        writer_threads.append(threading.get_ident())
+        time.sleep(0.05)
+        save(record)
+
+    monkeypatch.setattr(store, "save", slow_save)
+    breaker = CircuitBreaker(failure_threshold=10, name="source:core", store=store)
+
+    await asyncio.gather(*(_fail(breaker) for _ in range(5)))
+
+    assert breaker.failure_count == 5
+    assert threading.get_ident() not in writer_threads
+    assert len(writer_threads) < 5
+    assert _worker_store(path).load("source:core").failure_count == 5
+
+
+async def test_store_reads_leave_the_event_loop_only_when_a_refresh_is_due(tmp_path, monkeypatch) -> None:
+    now = [100.0]
+    store = CircuitBreakerStore(
+        JsonFileCacheBackend(tmp_path / "circuit_breakers.json"), refresh_interval=1.0, clock=lambda: now[0]
+    )
+    load = store.load
+    loader_threads: list[int] = []
+
+    def tracking_load(name: str) -> BreakerRecord | None:
+        loader_threads.append(threading.get_ident())
+        return load(name)
+
+    monkeypatch.setattr(store, "load", tracking_load)
+    breaker = CircuitBreaker(name="source:crossref", store=store)
+    loop_thread = threading.get_ident()
+
+    for _ in range(3):
+        async with breaker:
+            pass
+    assert len(loader_threads) == 3
+    assert loader_threads[0] != loop_thread
+    assert loader_threads[1:] == [loop_thread, loop_thread]
+
+    now[0] += 1.0
+    async with breaker:
+        pass
+    assert loader_threads[-1] != loop_thread
+
+
+async def test_restart_resumes_recovery_from_persisted_failure_time(tmp_path) -> None:
+    path = tmp_path / "circuit_breakers.json"
+    seed = _worker_store(path)
+    seed.save(
+        BreakerRecord(
+            name="source:crossref",
+            state="open",
+            failure_count=5,
+            last_failure_at=time.time() - 90.0,
+            updated_at=time.time(),
+            pid=1,
+        )
+    )
+
+    restarted_store = _worker_store(path)
+    breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=60.0, name="source:crossref", store=restarted_store)
+    async with breaker:
+        assert breaker.state == "half_open"
+        assert restarted_store.load("source:crossref").state == "half_open"
+
+    assert breaker.state == "closed"
+    assert _worker_store(path).load("source:crossref").state == "closed"
+
+    still_open = _worker_store(tmp_path / "other.json")
+    still_open.save(
+        BreakerRecord(
+            name="source:crossref",
+            state="open",
+            failure_count=5,
+            last_failure_at=time.time() - 10.0,
+            updated_at=time.time(),
+            pid=1,
+        )
+    )
+    fresh = CircuitBreaker(failure_threshold=5, recovery_timeout=60.0, name="source:crossref", store=still_open)
+    with pytest.raises(RateLimitError):
+        async with fresh:
+            pass
+
+
+async def test_breaker_states_merge_local_and_shared(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("PUBMED_CIRCUIT_BREAKER_STORE", "true")
+    monkeypatch.setenv("PUBMED_DATA_DIR", str(tmp_path))
+    reset_settings_cache()
+    try:
+        store = get_circuit_breaker_store()
+        assert store is not None
+        local = CircuitBreaker(failure_threshold=1, name="source:scopus", store=store)
+        await _fail(local)
+        store.save(
+            BreakerRecord(
+                name="source:remote-only",
+                state="half_open",
+                failure_count=3,
+                last_failure_at=None,
+                updated_at=time.time(),
+                pid=4242,
+            )
+        )
+
+        states = circuit_breaker_states()
+        assert states["source:scopus"]["state"] == "open"
+        assert states["source:scopus"]["local"]["failure_count"] == 1
+        assert states["source:scopus"]["shared"]["state"] == "open"
+        assert states["source:remote-only"] == {
+            "state": "half_open",
+            "local": None,
+            "shared": store.load("source:remote-only").to_dict(),
+        }
+        assert (tmp_path / "cache" / "circuit_breakers.json").exists()
+    finally:
+        monkeypatch.delenv("PUBMED_CIRCUIT_BREAKER_STORE")
+        reset_settings_cache()
+    assert get_circuit_breaker_store() is None
+
+
+def test_background_http_api_exposes_breaker_states(tmp_path) -> None:
+    from pubmed_search.presentation.mcp_server.server import start_http_api_background
+
+    breaker = CircuitBreaker(name="source:endpoint-probe")
+    breaker._state = "open"
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = int(probe.getsockname()[1])
+    start_http_api_background(MagicMock(data_dir=str(tmp_path)), None, port=port)
+
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            connection = HTTPConnection("127.0.0.1", port, timeout=0.5)
+            connection.request("GET", "/api/circuit_breakers", headers={"Host": f"localhost:{port}"})
+            response = connection.getresponse()
+            payload = json.loads(response.read())
+            connection.close()
+            break
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.01)
+
+    assert response.status == 200
+    assert payload["circuit_breakers"]["source:endpoint-probe"]["state"] == "open"
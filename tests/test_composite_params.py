@@ -144,6 +144,10 @@ class TestParseOptions:
         result = _parse_options("no_relax")
         assert result["auto_relax"] is False
 
+    def test_no_cache(self):
+        result = _parse_options("no_cache")
+        assert result["use_result_cache"] is False
+
     def test_multiple_options(self):
         result = _parse_options("preprints, shallow, no_oa")
         assert result["include_preprints"] is True
@@ -45,8 +45,8 @@ class TestCopilotHookPolicy:
     def test_search_group_keeps_one_generic_literature_search_entry(self):
         policy = json.loads(POLICY_PATH.read_text(encoding="utf-8"))
 
-        assert TOOL_CATEGORIES["search"]["tools"] == ["unified_search"]
-        assert policy["toolGroups"]["search"] == ["unified_search"]
+        assert TOOL_CATEGORIES["search"]["tools"] == ["unified_search", "unified_search_batch"]
+        assert policy["toolGroups"]["search"] == ["unified_search", "unified_search_batch"]
 
     def test_runtime_contract_is_privacy_safe_advisory_and_recoverable(self):
         policy = json.loads(POLICY_PATH.read_text(encoding="utf-8"))
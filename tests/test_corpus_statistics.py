@@ -0,0 +1,140 @@
+"""Tests for the persistent corpus statistics used as a BM25 IDF prior."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from pubmed_search.application.search.corpus_statistics import (
+    MIN_PRIOR_DOCS,
+    CorpusStatistics,
+    get_corpus_statistics,
+)
+from pubmed_search.application.search.ranking_algorithms import BM25Corpus, bm25_score, bm25_scores
+from pubmed_search.application.search.term_index import ArticleTermIndex
+from pubmed_search.application.session.manager import ArticleCache
+from pubmed_search.domain.entities.article import UnifiedArticle
+from pubmed_search.shared.settings import reset_settings_cache
+
+
+def _background_prior(path=None) -> CorpusStatistics:
+    """A prior where "sepsis" is rare and "patients" appears in every document."""
+    stats = CorpusStatistics(path, flush_every=10**9)
+    for i in range(MIN_PRIOR_DOCS):
+        stats.add_document(f"Outcomes in patients cohort {i}", "sepsis" if i % 100 == 0 else "surgery", ["Humans"])
+    return stats
+
+
+def test_counts_distinct_terms_per_document() -> None:
+    stats = CorpusStatistics()
+    stats.add_article_data(
+        {"title": "Sepsis and sepsis shock", "abstract": "ICU sepsis", "keywords": ["Septic Shock"], "mesh_terms": None}
+    )
+    stats.add_document("Cardiac surgery", None)
+
+    assert stats.total_docs == 2
+    assert stats.document_frequency("sepsis") == 1
+    assert stats.document_frequency("shock") == 1
+    assert stats.document_frequency("septic") == 1
+    assert stats.document_frequency("icu") == 1
+    assert stats.document_frequency("and") == 1
+    assert stats.idf("missing") == pytest.approx(math.log(1.0 + 2.5 / 0.5))
+
+
+def test_flush_merges_counts_from_several_writers(tmp_path) -> None:
+    path = tmp_path / "cache" / "idf_stats.tsv"
+    first = CorpusStatistics(path, flush_every=2)
+    second = CorpusStatistics(path)
+
+    first.add_document("Sepsis mortality", None)
+    first.add_document("Sepsis bundles", None)  # reaches flush_every
+    second.add_document("Sepsis in children", None)
+    assert second.flush()
+    assert not second.flush()  # nothing pending
+
+    reloaded = CorpusStatistics(path)
+    assert reloaded.total_docs == 3
+    assert reloaded.document_frequency("sepsis") == 3
+    assert reloaded.document_frequency("children") == 1
+    assert path.read_text(encoding="utf-8").startswith("#corpus-statistics/v1\t3\n")
+
+
+def test_table_keeps_most_frequent_terms(tmp_path) -> None:
+    stats = CorpusStatistics(tmp_path / "idf_stats.tsv", max_terms=2)
+    stats.add_document("sepsis shock", None)
+    stats.add_document("sepsis shock", None)
+    stats.add_document("sepsis rare", None)
+    stats.flush()
+
+    assert len(stats) == 2
+    assert stats.document_frequency("rare") == 0
+    assert stats.document_frequency("sepsis") == 3
+
+
+def test_article_cache_counts_each_pmid_once() -> None:
+    stats = CorpusStatistics()
+    cache = ArticleCache(corpus_statistics=stats)
+
+    cache.put("1", {"pmid": "1", "title": "Sepsis mortality"})
+    cache.put("1", {"pmid": "1", "title": "Sepsis mortality (refreshed)"})
+    cache.put_many([{"pmid": "2", "title": "Sepsis care"}, {"pmid": "2", "title": "Sepsis care"}, {"title": "x"}])
+
+    assert stats.total_docs == 2
+    assert stats.document_frequency("sepsis") == 2
+
+
+def test_prior_blends_into_bm25_idf() -> None:
+    articles = [
+        UnifiedArticle(title="Sepsis outcomes in patients", primary_source="pubmed", pmid="1"),
+        UnifiedArticle(title="Sepsis care for patients", primary_source="pubmed", pmid="2"),
+        UnifiedArticle(title="Surgery outcomes", primary_source="pubmed", pmid="3"),
+    ]
+    index = ArticleTermIndex(articles)
+    prior = _background_prior()
+
+    local = BM25Corpus.from_index(index)
+    blended = BM25Corpus.from_index(index, prior=prior, prior_weight=0.5)
+    assert blended.idf("sepsis") == pytest.approx(0.5 * local.idf("sepsis") + 0.5 * prior.idf("sepsis"))
+    # Globally common terms lose weight, globally rare ones gain it.
+    assert blended.idf("patients") < local.idf("patients")
+    assert blended.idf("sepsis") > local.idf("sepsis")
+
+    scores = bm25_scores("sepsis patients", blended, vectorize=False)
+    assert scores == pytest.approx([bm25_score(article, "sepsis patients", blended) for article in articles])
+
+    thin = CorpusStatistics()
+    thin.add_document("sepsis", None)
+    assert BM25Corpus.from_index(index, prior=thin).prior is None
+
+
+def test_prior_blends_into_vectorized_bm25() -> None:
+    pytest.importorskip("numpy")
+    articles = [
+        UnifiedArticle(title=f"Sepsis outcomes in patients {i}", abstract="surgery", primary_source="pubmed")
+        for i in range(20)
+    ]
+    corpus = BM25Corpus.from_index(ArticleTermIndex(articles), prior=_background_prior(), prior_weight=0.7)
+
+    assert bm25_scores("sepsis surgery", corpus, vectorize=True) == pytest.approx(
+        bm25_scores("sepsis surgery", corpus, vectorize=False)
+    )
+
+
+def test_store_is_enabled_by_settings(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("PUBMED_IDF_STORE", "true")
+    monkeypatch.setenv("PUBMED_DATA_DIR", str(tmp_path))
+    reset_settings_cache()
+    try:
+        store = get_corpus_statistics()
+        assert store is not None
+        assert store is get_corpus_statistics()
+        assert ArticleCache().corpus_statistics is store
+
+        store.add_document("Sepsis", None)
+        store.flush()
+        assert (tmp_path / "cache" / "idf_stats.tsv").exists()
+    finally:
+        monkeypatch.delenv("PUBMED_IDF_STORE")
+        reset_settings_cache()
+    assert get_corpus_statistics() is None
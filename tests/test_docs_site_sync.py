@@ -129,7 +129,7 @@ def test_docs_site_shell_uses_current_assets_and_mobile_image_wrapping() -> None
     assert cache_keys == {"20260814-provider-broker"}
     assert 'id="sidebar-backdrop"' in index_html
     assert index_html.count('data-page-group="') == 3
-    assert "45</strong>" in index_html
+    assert "46</strong>" in index_html
     assert "runtime contracts" in index_html
     assert "function wrapLocalImages()" in site_js
     assert "sidebarBackdrop.addEventListener" in site_js
@@ -159,7 +159,7 @@ def test_docs_site_navigation_exposes_the_current_operating_handbook() -> None:
         "整合與維運",
         "Multi-source broker stages",
         "authenticated multi-user contracts",
-        "45 MCP tools across 16 registry categories",
+        "46 MCP tools across 16 registry categories",
         "Semantic Scholar Data Plane",
         "OpenAlex Search And Data Plane",
         "ClinicalKey AI Boundary",
@@ -131,7 +131,7 @@ def test_release_and_tool_metadata_stay_synchronized() -> None:
         REPO_ROOT / "docs/images/integration-deployment-workflow.svg",
         REPO_ROOT / "docs/images/copilot-studio-deployment-flow.svg",
     )
-    stale_tool_count = re.compile(r"\b46(?: tools?|-tool)|46 \u500b")
+    stale_tool_count = re.compile(r"\b45(?: tools?|-tool)|45 \u500b")
     assert [path for path in current_surfaces if stale_tool_count.search(path.read_text(encoding="utf-8"))] == []
 
     skill_count = len(tuple((REPO_ROOT / ".claude/skills").glob("*/SKILL.md")))
@@ -0,0 +1,143 @@
+"""Tests for the record/replay HTTP cassette layer."""
+
+from __future__ import annotations
+
+import io
+import time
+
+import httpx
+import pytest
+
+from pubmed_search.infrastructure.ncbi.base import run_entrez_callable
+from pubmed_search.shared.async_utils import create_async_http_client
+from pubmed_search.shared.http_cassette import (
+    CassetteMissError,
+    CassetteTransport,
+    HttpCassette,
+    canonicalize_url,
+    get_active_cassette,
+    parse_cassette_mode,
+    request_fingerprint,
+    use_cassette,
+)
+from pubmed_search.shared.settings import reset_settings_cache
+
+
+class FakeEntrezModule:
+    email = None
+    api_key = None
+    tool = None
+    max_tries = 3
+    sleep_between_tries = 15
+
+
+def test_fingerprint_ignores_param_order_and_credentials() -> None:
+    first = request_fingerprint("get", "https://API.example.org/works?b=2&a=1&api_key=secret")
+    second = request_fingerprint("GET", "https://api.example.org/works?a=1&mailto=x@y.org&b=2")
+
+    assert first == second
+    assert "secret" not in canonicalize_url("https://api.example.org/works?api_key=secret&q=x")
+    assert request_fingerprint("POST", "https://api.example.org/works", b"{}") != request_fingerprint(
+        "POST", "https://api.example.org/works", b"[]"
+    )
+
+
+async def test_record_then_replay_http_without_network(tmp_path) -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={"q": request.url.params["q"]}, headers={"x-ratelimit-remaining": "9"})
+
+    recorder = HttpCassette(tmp_path, mode="record")
+    async with httpx.AsyncClient(transport=CassetteTransport(recorder, httpx.MockTransport(handler))) as client:
+        recorded = await client.get("https://api.example.org/search", params={"q": "propofol", "api_key": "k1"})
+
+    assert recorded.json() == {"q": "propofol"}
+    assert recorder.recorded == 1
+
+    player = HttpCassette(tmp_path, mode="replay")
+    with use_cassette(player):
+        client = create_async_http_client(timeout=5.0)
+        async with client:
+            replayed = await client.get("https://api.example.org/search", params={"api_key": "k2", "q": "propofol"})
+            with pytest.raises(CassetteMissError):
+                await client.get("https://api.example.org/search", params={"q": "ketamine"})
+
+    assert calls == 1
+    assert replayed.status_code == 200
+    assert replayed.json() == {"q": "propofol"}
+    assert replayed.headers["x-ratelimit-remaining"] == "9"
+    assert player.hits == 1
+    assert player.misses == 1
+
+
+async def test_replay_injects_scaled_recorded_latency(tmp_path) -> None:
+    recorder = HttpCassette(tmp_path, mode="record")
+    fingerprint = request_fingerprint("GET", "https://api.example.org/slow")
+    recorder.save(
+        recorder.build_entry(
+            fingerprint=fingerprint,
+            method="GET",
+            url="https://api.example.org/slow",
+            status_code=200,
+            headers=[],
+            content=b"ok",
+            elapsed_ms=200.0,
+        )
+    )
+
+    player = HttpCassette(tmp_path, mode="replay", latency_scale=0.5)
+    async with httpx.AsyncClient(transport=CassetteTransport(player)) as client:
+        started = time.perf_counter()
+        response = await client.get("https://api.example.org/slow")
+        elapsed = time.perf_counter() - started
+
+    assert response.text == "ok"
+    assert player.replay_delay(player.lookup(fingerprint, "slow")) == pytest.approx(0.1)
+    assert elapsed >= 0.09
+
+
+def test_entrez_calls_round_trip_through_cassette(tmp_path) -> None:
+    calls: list[dict[str, object]] = []
+
+    def esearch(**kwargs: object) -> io.BytesIO:
+        calls.append(kwargs)
+        return io.BytesIO(b"<eSearchResult><Count>3</Count></eSearchResult>")
+
+    entrez = FakeEntrezModule()
+    with use_cassette(HttpCassette(tmp_path, mode="record")):
+        recorded = run_entrez_callable(entrez, esearch, db="pubmed", term="asthma", email="a@b.c", api_key="key")
+
+    with use_cassette(HttpCassette(tmp_path, mode="replay")):
+        replayed = run_entrez_callable(entrez, esearch, term="asthma", db="pubmed", email="d@e.f", api_key=None)
+        with pytest.raises(CassetteMissError):
+            run_entrez_callable(entrez, esearch, db="pubmed", term="copd", email=None, api_key=None)
+
+    assert len(calls) == 1
+    assert recorded.read() == replayed.read() == b"<eSearchResult><Count>3</Count></eSearchResult>"
+    assert entrez.max_tries == 3
+
+
+def test_settings_configure_cassette(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("PUBMED_HTTP_CASSETTE_MODE", "Replay")
+    monkeypatch.setenv("PUBMED_HTTP_CASSETTE_DIR", str(tmp_path))
+    monkeypatch.setenv("PUBMED_HTTP_CASSETTE_LATENCY_SCALE", "1.0")
+    reset_settings_cache()
+    try:
+        cassette = get_active_cassette()
+        assert cassette is not None
+        assert cassette.replaying
+        assert cassette.directory == tmp_path
+        assert cassette.latency_scale == 1.0
+    finally:
+        monkeypatch.delenv("PUBMED_HTTP_CASSETTE_MODE")
+        reset_settings_cache()
+
+
+def test_cassette_mode_is_validated() -> None:
+    assert parse_cassette_mode(" Record ") == "record"
+    assert HttpCassette("unused", mode="off").mode == "off"
+    with pytest.raises(ValueError, match="Unknown HTTP cassette mode"):
+        parse_cassette_mode("playback")
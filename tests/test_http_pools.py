@@ -0,0 +1,174 @@
+"""Tests for per-origin HTTP connection pools."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+
+import httpx
+import pytest
+
+from pubmed_search.shared.async_utils import create_async_http_client
+from pubmed_search.shared.http_pools import (
+    HostPooledTransport,
+    HostPoolLimits,
+    configure_host_pool,
+    http_pool_snapshot,
+)
+from pubmed_search.shared.profiling import format_http_pool_report
+
+
+async def _start_server(delay: float, release: asyncio.Event | None = None) -> tuple[asyncio.AbstractServer, str]:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                if not request:
+                    break
+                if release is not None:
+                    await release.wait()
+                await asyncio.sleep(delay)
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nContent-Type: text/plain\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_slow_host_does_not_starve_other_origins() -> None:
+    release_slow = asyncio.Event()
+    slow_server, slow_url = await _start_server(delay=0.0, release=release_slow)
+    fast_server, fast_url = await _start_server(delay=0.0)
+    transport = HostPooledTransport(limits=HostPoolLimits(max_connections=1, max_keepalive_connections=1))
+    try:
+        async with httpx.AsyncClient(transport=transport) as client:
+            slow_calls = [asyncio.create_task(client.get(f"{slow_url}/pdf/{index}")) for index in range(3)]
+
+            async def _all_slow_calls_in_flight() -> None:
+                while not any(
+                    entry["origin"] == slow_url and entry["in_flight"] == 3 for entry in transport.snapshot()
+                ):
+                    await asyncio.sleep(0.01)
+
+            await asyncio.wait_for(_all_slow_calls_in_flight(), timeout=5)
+
+            snapshot = {entry["origin"]: entry for entry in transport.snapshot()}
+            assert snapshot[slow_url]["in_flight"] == 3
+            assert snapshot[slow_url]["waiters"] >= 1
+            assert snapshot[slow_url]["saturation"] == 1.0
+
+            # The slow origin holds its only connection until released.
+            fast = await asyncio.wait_for(client.get(f"{fast_url}/api"), timeout=5)
+            assert fast.text == "ok"
+            assert all(not call.done() for call in slow_calls)
+
+            release_slow.set()
+            responses = await asyncio.gather(*slow_calls)
+            assert [response.status_code for response in responses] == [200, 200, 200]
+
+            after = {entry["origin"]: entry for entry in transport.snapshot()}
+            assert after[slow_url]["in_flight"] == 0
+            assert after[slow_url]["peak_in_flight"] == 3
+            assert after[slow_url]["idle"] == 1
+            assert after[fast_url]["requests"] == 1
+            assert slow_url in http_pool_snapshot()
+            assert "127.0.0.1" in format_http_pool_report()
+    finally:
+        for server in (slow_server, fast_server):
+            server.close()
+            with contextlib.suppress(Exception):
+                await server.wait_closed()
+
+
+async def test_idle_origins_are_reaped() -> None:
+    server, url = await _start_server(delay=0.0)
+    clock = FakeClock()
+    transport = HostPooledTransport(idle_timeout=60.0, reap_interval=5.0, clock=clock)
+    try:
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get(f"{url}/a")
+            assert len(transport.snapshot()) == 1
+
+            clock.now += 30.0
+            assert await transport.reap_idle() == 0
+
+            clock.now += 31.0
+            assert await transport.reap_idle() == 1
+            assert transport.snapshot() == []
+            assert transport.reaped == 1
+
+            response = await client.get(f"{url}/b")
+            assert response.status_code == 200
+            assert len(transport.snapshot()) == 1
+    finally:
+        server.close()
+        with contextlib.suppress(Exception):
+            await server.wait_closed()
+
+
+async def test_host_overrides_and_http2_fallback() -> None:
+    configure_host_pool("127.0.0.1", HostPoolLimits(max_connections=3, max_keepalive_connections=2))
+    server, url = await _start_server(delay=0.0)
+    try:
+        transport = HostPooledTransport(http2=True)
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get(f"{url}/x")
+            (entry,) = transport.snapshot()
+
+        assert response.status_code == 200
+        assert response.http_version == "HTTP/1.1"
+        assert entry["max_connections"] == 3
+        assert entry["max_keepalive_connections"] == 2
+        assert transport.snapshot() == []
+    finally:
+        configure_host_pool("127.0.0.1", None)
+        server.close()
+        with contextlib.suppress(Exception):
+            await server.wait_closed()
+
+
+async def test_environment_proxy_is_used_per_origin(monkeypatch: pytest.MonkeyPatch) -> None:
+    proxy_requests: list[str] = []
+
+    async def refuse_tunnel(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        head = await reader.readuntil(b"\r\n\r\n")
+        proxy_requests.append(head.split(b"\r\n", 1)[0].decode())
+        writer.write(b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\n\r\n")
+        await writer.drain()
+        writer.close()
+
+    proxy = await asyncio.start_server(refuse_tunnel, "127.0.0.1", 0)
+    direct_server, direct_url = await _start_server(delay=0.0)
+    for name in ("http_proxy", "https_proxy", "all_proxy", "no_proxy", "HTTP_PROXY", "ALL_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", f"http://127.0.0.1:{proxy.sockets[0].getsockname()[1]}")
+    monkeypatch.setenv("NO_PROXY", "localhost,127.0.0.1")
+    try:
+        async with create_async_http_client(timeout=5.0) as client:
+            with pytest.raises(httpx.ProxyError):
+                await client.get("https://api.example.org/works")
+            direct = await client.get(f"{direct_url}/api")
+            pools = {entry["origin"]: entry for entry in client._transport.snapshot()}
+
+        assert proxy_requests == ["CONNECT api.example.org:443 HTTP/1.1"]
+        assert direct.text == "ok"
+        assert pools["https://api.example.org"]["proxied"] is True
+        assert pools[direct_url]["proxied"] is False
+    finally:
+        for server in (proxy, direct_server):
+            server.close()
+            with contextlib.suppress(Exception):
+                await server.wait_closed()
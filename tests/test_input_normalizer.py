@@ -300,6 +300,18 @@ class TestInputNormalizerQuery:
         assert InputNormalizer.normalize_query("") == ""
         assert InputNormalizer.normalize_query(None) == ""
 
+    async def test_query_list_accepts_lists_json_and_lines(self):
+        """Query lists are normalized, deduplicated and stripped of blanks."""
+        from pubmed_search.presentation.mcp_server.tools._common import InputNormalizer
+
+        assert InputNormalizer.normalize_query_list(["  diabetes ", "", "Diabetes", "insulin Or metformin"]) == [
+            "diabetes",
+            "insulin OR metformin",
+        ]
+        assert InputNormalizer.normalize_query_list('["diabetes", "diabetes"]') == ["diabetes"]
+        assert InputNormalizer.normalize_query_list("diabetes\n\ninsulin") == ["diabetes", "insulin"]
+        assert InputNormalizer.normalize_query_list(None) == []
+
 
 class TestInputNormalizerDOI:
     """Tests for DOI normalization (v0.1.21)."""
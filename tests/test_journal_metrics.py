@@ -41,7 +41,7 @@ class TestJournalMetrics:
         assert jm.cited_by_count is None
         assert jm.is_in_doaj is None
         assert jm.source_type is None
-        assert jm.subject_areas == []
+        assert jm.subject_areas == ()
 
     def test_full_initialization(self):
         jm = JournalMetrics(
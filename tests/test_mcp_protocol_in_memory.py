@@ -9,11 +9,13 @@ from mcp.client import Client
 
 from pubmed_search.domain.entities.article import UnifiedArticle
 from pubmed_search.presentation.mcp_server import create_server
+from pubmed_search.presentation.mcp_server.request_deadline import build_request_deadline_middleware
 from pubmed_search.presentation.mcp_server.server import build_asgi_app
 from pubmed_search.presentation.mcp_server.tenancy import build_tenancy_middleware
 from pubmed_search.presentation.mcp_server.tool_registry import TOOL_CATEGORIES
 from pubmed_search.presentation.mcp_server.tools import chronicle as chronicle_tools
 from pubmed_search.presentation.mcp_server.tools import unified as unified_module
+from pubmed_search.shared.async_utils import remaining_request_budget
 from pubmed_search.shared.source_contracts import SourceAdapterResult
 from pubmed_search.shared.tenancy import TenantIdentity, bind_tenant, current_tenant
 
@@ -175,6 +177,25 @@ async def test_transport_session_caller_is_refused_through_the_middleware():
     assert "PUBMED_AUTH_TOKENS" in refusal
 
 
+@pytest.mark.asyncio
+async def test_tool_calls_run_under_a_request_deadline():
+    """Only tool invocations get the end-to-end budget nested work is capped to."""
+    middleware = build_request_deadline_middleware(30.0)
+
+    async def call_next(_ctx: object) -> float | None:
+        return remaining_request_budget()
+
+    tool_budget = await middleware(SimpleNamespace(method="tools/call"), call_next)
+    listing_budget = await middleware(SimpleNamespace(method="tools/list"), call_next)
+    disabled_budget = await build_request_deadline_middleware(0)(SimpleNamespace(method="tools/call"), call_next)
+
+    assert tool_budget is not None
+    assert 29.0 < tool_budget <= 30.0
+    assert listing_budget is None
+    assert disabled_budget is None
+    assert remaining_request_budget() is None
+
+
 @pytest.mark.parametrize("transport", ["streamable-http", "sse"])
 def test_asgi_app_builds_for_each_http_transport(transport):
     app = build_asgi_app(create_server(), transport, host="127.0.0.1")
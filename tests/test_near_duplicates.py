@@ -0,0 +1,112 @@
+"""Tests for MinHash/LSH near-duplicate detection and the NEAR_DUPLICATE strategy."""
+
+from __future__ import annotations
+
+from pubmed_search.application.search.near_duplicates import (
+    find_near_duplicates,
+    lsh_candidate_pairs,
+    minhash_signature,
+    title_shingles,
+)
+from pubmed_search.application.search.result_aggregator import (
+    DeduplicationStrategy,
+    RankingConfig,
+    ResultAggregator,
+)
+from pubmed_search.domain.entities.article import ArticleType, Author, UnifiedArticle
+
+
+def _article(title: str, source: str, *, year: int | None = 2023, authors: tuple[str, ...] = ("Chen",), **ids):
+    return UnifiedArticle(
+        title=title,
+        primary_source=source,
+        year=year,
+        authors=[Author(family_name=name) for name in authors],
+        **ids,
+    )
+
+
+def test_signatures_estimate_title_similarity() -> None:
+    a = title_shingles("Dexmedetomidine for delirium prevention after cardiac surgery: a randomized trial")
+    b = title_shingles("Dexmedetomidine for Delirium Prevention after Cardiac Surgery - A Randomised Trial")
+    c = title_shingles("Ketamine infusion and postoperative pain in spine surgery")
+
+    sig_a, sig_b, sig_c = minhash_signature(a), minhash_signature(b), minhash_signature(c)
+    agreement_ab = sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+    agreement_ac = sum(x == y for x, y in zip(sig_a, sig_c)) / len(sig_a)
+
+    assert agreement_ab > 0.7
+    assert agreement_ac < 0.2
+    assert minhash_signature(a) == sig_a  # deterministic
+    assert (0, 1) in lsh_candidate_pairs([sig_a, sig_b, sig_c])
+    assert not {(0, 2), (1, 2)} & lsh_candidate_pairs([sig_a, sig_b, sig_c])
+
+
+def test_preprint_and_published_version_are_paired() -> None:
+    preprint = _article(
+        "Gut microbiome signatures predict sepsis mortality in ICU patients",
+        "biorxiv",
+        year=2022,
+        doi="10.1101/2022.03.01.482001",
+        article_type=ArticleType.PREPRINT,
+    )
+    published = _article(
+        "Gut microbiome signatures predict sepsis mortality in ICU patients.",
+        "pubmed",
+        year=2023,
+        doi="10.1038/s41591-023-0001",
+        pmid="37000001",
+    )
+    other_journal = _article(
+        "Gut microbiome signatures predict sepsis mortality in ICU patients",
+        "crossref",
+        year=2023,
+        doi="10.1000/another-journal",
+    )
+
+    assert find_near_duplicates([preprint, published]) == [(0, 1)]
+    # Two different non-preprint DOIs are distinct records.
+    assert find_near_duplicates([published, other_journal]) == []
+
+
+def test_year_and_author_checks_reject_lookalikes() -> None:
+    base = _article("Annual report on antimicrobial resistance surveillance in Europe", "openalex", year=2019)
+    later_edition = _article("Annual report on antimicrobial resistance surveillance in Europe", "core", year=2022)
+    other_authors = _article(
+        "Annual report on antimicrobial resistance surveillance in Europe.",
+        "semantic_scholar",
+        year=2019,
+        authors=("Garcia", "Novak"),
+    )
+
+    assert find_near_duplicates([base, later_edition]) == []
+    assert find_near_duplicates([base, other_authors]) == []
+
+
+def test_near_duplicate_strategy_merges_cross_source_variants() -> None:
+    openalex = _article(
+        "Prone positioning in COVID-19 ARDS: a multicentre cohort study",
+        "openalex",
+        openalex_id="W4300000001",
+    )
+    s2 = _article(
+        "Prone Positioning in COVID-19 ARDS - A Multicenter Cohort Study",
+        "semantic_scholar",
+        s2_id="a" * 40,
+        authors=("Chen", "Smith"),
+    )
+    unrelated = _article("High-flow nasal oxygen versus noninvasive ventilation", "core", core_id="12345")
+
+    moderate = ResultAggregator(RankingConfig(dedup_strategy=DeduplicationStrategy.MODERATE))
+    unique, stats = moderate.aggregate([[openalex], [s2], [unrelated]])
+    assert len(unique) == 3
+    assert stats.dedup_by_near_title == 0
+
+    near = ResultAggregator(RankingConfig(dedup_strategy=DeduplicationStrategy.NEAR_DUPLICATE))
+    unique, stats = near.aggregate([[openalex], [s2], [unrelated]])
+    assert len(unique) == 2
+    assert stats.dedup_by_near_title == 1
+    assert stats.to_dict()["dedup_by_near_title"] == 1
+    merged = next(article for article in unique if article.primary_source != "core")
+    # Title-only evidence must not copy provider identifiers across records.
+    assert not (merged.openalex_id and merged.s2_id)
@@ -188,3 +188,41 @@ def test_tiny_capped_json_output_does_not_serialize_every_article() -> None:
     parsed = json.loads(result)
     assert parsed["status"] == "truncated"
     assert sum(getattr(article, "to_dict_calls", 0) for article in articles) == 0
+
+
+def test_capped_json_output_packs_without_reserializing(monkeypatch: pytest.MonkeyPatch) -> None:
+    from pubmed_search.presentation.mcp_server.tools import unified_formatting
+
+    articles = [
+        UnifiedArticle(
+            title=f"Article {index}",
+            primary_source="pubmed",
+            pmid=str(1000 + index),
+            abstract="Heavy abstract " * 200,
+        )
+        for index in range(200)
+    ]
+    encoded_keys: list[str] = []
+    encode_json_entry = unified_formatting.encode_json_entry
+
+    def counting_encode_json_entry(key: str, value: Any) -> str:
+        encoded_keys.append(key)
+        return encode_json_entry(key, value)
+
+    monkeypatch.setattr(unified_formatting, "encode_json_entry", counting_encode_json_entry)
+    monkeypatch.setattr(unified_formatting, "serialize_structured_payload", MagicMock(side_effect=AssertionError))
+
+    result = _format_as_json(
+        articles,
+        _analysis(),
+        _stats(unique_articles=len(articles)),
+        max_response_chars=20_000,
+        include_next_tools=False,
+    )
+
+    parsed = json.loads(result)
+    assert parsed["status"] == "truncated"
+    assert parsed["returned_articles"] == 3
+    assert len(result) <= 20_000
+    repeated = {key for key in encoded_keys if key != "articles" and encoded_keys.count(key) > 1}
+    assert not repeated
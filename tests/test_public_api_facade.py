@@ -61,6 +61,40 @@ async def test_public_api_unified_search_uses_injected_runner_without_mcp_server
     }
 
 
+async def test_public_api_unified_search_batch_uses_injected_batch_runner() -> None:
+    from pubmed_search.api import PubMedSearchClient, PubMedSearchConfig
+
+    async def _fake_batch_runner(**kwargs: Any) -> str:
+        assert kwargs["queries"] == ["remimazolam ICU sedation", "remimazolam delirium"]
+        assert kwargs["limit"] == 5
+        return json.dumps({"tool": "unified_search_batch", "articles": [{"pmid": "123"}], "variants": []})
+
+    client = PubMedSearchClient(
+        PubMedSearchConfig(email="test@example.com"),
+        searcher=object(),
+        unified_search_runner=_fake_unified_runner,
+        unified_search_batch_runner=_fake_batch_runner,
+    )
+
+    result = await client.unified_search_batch(["remimazolam ICU sedation", "remimazolam delirium"], limit=5)
+
+    assert result.articles == [{"pmid": "123"}]
+    assert result.structured["variants"] == []
+
+
+async def test_public_api_unified_search_batch_requires_a_batch_runner_with_injected_runner() -> None:
+    from pubmed_search.api import PubMedSearchClient, PubMedSearchConfig
+
+    client = PubMedSearchClient(
+        PubMedSearchConfig(email="test@example.com"),
+        searcher=object(),
+        unified_search_runner=_fake_unified_runner,
+    )
+
+    with pytest.raises(RuntimeError, match="batch runner"):
+        await client.unified_search_batch(["remimazolam ICU sedation"])
+
+
 async def test_public_api_search_pubmed_delegates_to_lazy_searcher() -> None:
     from pubmed_search.api import PubMedSearchClient, PubMedSearchConfig
 
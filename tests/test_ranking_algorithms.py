@@ -6,6 +6,8 @@ Covers:
 - RRF fusion across multiple dimensions
 - MMR diversification
 - Source Disagreement Analysis
+- Shared term index (same scores as per-function tokenization)
+- Vectorized BM25 over the sparse term-document matrix
 - Edge cases (empty inputs, single articles, etc.)
 """
 
@@ -21,15 +23,20 @@ from pubmed_search.application.search.ranking_algorithms import (
     RRFResult,
     SourceDisagreement,
     _article_key,
+    _average_pairwise_bitset_distance,
     _average_pairwise_distance,
     _extract_article_terms,
     _jaccard_similarity,
+    _term_bitsets,
     analyze_source_disagreement,
     bm25_score,
     bm25_score_normalized,
+    bm25_scores,
     mmr_diversify,
     reciprocal_rank_fusion,
 )
+from pubmed_search.application.search.result_aggregator import ResultAggregator
+from pubmed_search.application.search.term_index import ArticleTermIndex
 
 # =============================================================================
 # Fixtures
@@ -427,6 +434,42 @@ class TestMMRDiversify:
         # a3 should be selected before a2 due to diversity
         assert pmid_order.index("3") < pmid_order.index("2")
 
+    def test_incremental_selection_matches_full_recomputation(self):
+        """Cached max-similarity must reproduce the textbook O(n·k²) selection, ties included."""
+        topics = ["sepsis", "anesthesia", "radiology", "oncology"]
+        articles = [
+            _make_article(
+                title=f"{topics[i % 4].title()} outcomes trial {i % 3}",
+                pmid=str(i),
+                keywords=[topics[i % 4], topics[(i * 7) % 4]],
+                mesh_terms=["Humans"] if i % 5 else [],
+                ranking_score=round(1.0 - (i % 6) * 0.1, 1),
+            )
+            for i in range(30)
+        ]
+        lambda_param = 0.6
+        result = mmr_diversify(articles, "sepsis outcomes", lambda_param=lambda_param, top_k=12)
+
+        term_sets = [
+            {t.lower() for t in a.mesh_terms + a.keywords} | {t for t in a.title.lower().split() if len(t) >= 4}
+            for a in articles
+        ]
+        selected = [0]
+        while len(selected) < 12:
+            candidates = [i for i in range(len(articles)) if i not in selected]
+            selected.append(
+                max(
+                    candidates,
+                    key=lambda i: (
+                        lambda_param * articles[i].ranking_score
+                        - (1 - lambda_param) * max(_jaccard_similarity(term_sets[i], term_sets[j]) for j in selected)
+                    ),
+                )
+            )
+
+        assert [a.pmid for a in result.articles] == [articles[i].pmid for i in selected]
+        assert result.avg_pairwise_distance == _average_pairwise_distance([term_sets[i] for i in selected])
+
 
 # =============================================================================
 # Source Disagreement Tests
@@ -518,6 +561,29 @@ class TestSourceDisagreement:
         assert len(result.rank_correlation) == 3
         assert result.cross_source_articles >= 2  # articles 1 and 3
 
+    def test_bitmap_overlaps_match_set_arithmetic(self):
+        names = ["pubmed", "openalex", "core", "europe_pmc"]
+        articles = [
+            _make_article(
+                pmid=str(i),
+                sources=[name for bit, name in enumerate(names) if i % 11 & (1 << bit)] or ["pubmed"],
+                primary_source="pubmed" if i % 11 & 1 else "core",
+            )
+            for i in range(150)
+        ]
+        coverage: dict[str, set[int]] = {}
+        for i, article in enumerate(articles):
+            for name in {sm.source for sm in article.sources} | {article.primary_source}:
+                coverage.setdefault(name, set()).add(i)
+
+        result = analyze_source_disagreement(articles, term_index=ArticleTermIndex(articles))
+        assert result.cross_source_articles == sum(
+            1 for i in range(150) if sum(i in members for members in coverage.values()) > 1
+        )
+        for pair, overlap in result.rank_correlation.items():
+            a, b = pair.split("↔")
+            assert overlap == len(coverage[a] & coverage[b]) / min(len(coverage[a]), len(coverage[b]))
+
 
 # =============================================================================
 # Utility Function Tests
@@ -580,3 +646,149 @@ class TestAveragePairwiseDistance:
 
     def test_empty_list(self):
         assert _average_pairwise_distance([]) == 1.0
+
+    def test_bitset_variant_matches(self):
+        sets = [{"a", "b", "c"}, {"b", "c", "d"}, set(), set(), {"e"}]
+        bitsets = _term_bitsets(sets)
+        assert [bits.bit_count() for bits in bitsets] == [3, 3, 0, 0, 1]
+        assert _average_pairwise_bitset_distance(bitsets, [len(t) for t in sets]) == _average_pairwise_distance(sets)
+
+    def test_large_sets_use_a_reproducible_sample(self):
+        sets = [{f"t{i % 7}", f"u{i % 11}", f"v{i % 3}"} for i in range(300)]  # 44,850 pairs
+        bitsets = _term_bitsets(sets)
+        sizes = [len(t) for t in sets]
+
+        exact = _average_pairwise_bitset_distance(bitsets, sizes, max_pairs=10**6)
+        sampled = _average_pairwise_bitset_distance(bitsets, sizes)
+        assert sampled == pytest.approx(exact, abs=0.01)
+        assert sampled != exact
+        assert _average_pairwise_distance(sets) == sampled  # same fixed sample every call
+
+
+# =============================================================================
+# Shared Term Index Tests
+# =============================================================================
+
+
+class TestArticleTermIndex:
+    """The shared index must reproduce the per-function tokenization exactly."""
+
+    QUERY = "Machine learning for radiology and drug discovery"
+
+    @staticmethod
+    def _unindexed(corpus: BM25Corpus) -> BM25Corpus:
+        return BM25Corpus(
+            total_docs=corpus.total_docs,
+            avg_doc_length=corpus.avg_doc_length,
+            doc_freq=dict(corpus.doc_freq),
+        )
+
+    def test_terms_are_interned_once(self, sample_articles):
+        index = ArticleTermIndex(sample_articles)
+        learning = index.term_id("learning")
+        assert learning is not None
+        assert index.terms[learning] == "learning"
+        assert index.doc_freq[learning] == 2
+        assert index.title_tf[0][learning] == 1
+        assert index.keys == [_article_key(article) for article in sample_articles]
+
+    def test_corpus_statistics_match_per_article_extraction(self, sample_articles):
+        corpus = BM25Corpus.from_articles(sample_articles)
+        extracted = [_extract_article_terms(article) for article in sample_articles]
+        assert corpus.avg_doc_length == pytest.approx(sum(map(len, extracted)) / len(extracted))
+        for term in {term for terms in extracted for term in terms}:
+            assert corpus.doc_freq[term] == sum(term in terms for terms in extracted)
+
+    def test_indexed_bm25_matches_tokenizing_path(self, sample_articles):
+        corpus = BM25Corpus.from_articles(sample_articles)
+        expected = [bm25_score(article, self.QUERY, self._unindexed(corpus)) for article in sample_articles]
+
+        assert [bm25_score(article, self.QUERY, corpus) for article in sample_articles] == expected
+        assert bm25_scores(self.QUERY, corpus) == expected
+
+    def test_unindexed_article_falls_back(self, sample_articles):
+        corpus = BM25Corpus.from_articles(sample_articles[:2])
+        outsider = sample_articles[2]
+        assert bm25_score(outsider, self.QUERY, corpus) == bm25_score(outsider, self.QUERY, self._unindexed(corpus))
+
+    def test_bm25_scores_requires_index(self):
+        with pytest.raises(ValueError, match="ArticleTermIndex"):
+            bm25_scores("query", BM25Corpus())
+
+    def test_mmr_with_index_matches_without(self, sample_articles):
+        for article in sample_articles:
+            article.ranking_score = None
+        index = ArticleTermIndex(sample_articles)
+
+        plain = mmr_diversify(sample_articles, self.QUERY, lambda_param=0.4)
+        indexed = mmr_diversify(sample_articles, self.QUERY, lambda_param=0.4, term_index=index)
+
+        assert [a.pmid for a in indexed.articles] == [a.pmid for a in plain.articles]
+        assert indexed.diversity_scores == plain.diversity_scores
+        assert indexed.avg_pairwise_distance == plain.avg_pairwise_distance
+
+    def test_indexed_relevance_matches_term_overlap(self, sample_articles):
+        index = ArticleTermIndex(sample_articles)
+        aggregator = ResultAggregator()
+        for position, article in enumerate(sample_articles):
+            assert aggregator._calculate_indexed_relevance(index, position, self.QUERY) == pytest.approx(
+                aggregator._calculate_relevance(article, self.QUERY)
+            )
+
+    def test_disagreement_reads_keys_from_index(self):
+        articles = [
+            _make_article(title="A", pmid="1", sources=["pubmed", "openalex"]),
+            _make_article(title="B", pmid="2", sources=["openalex"]),
+        ]
+        index = ArticleTermIndex(articles)
+        assert analyze_source_disagreement(articles, term_index=index).to_dict() == (
+            analyze_source_disagreement(articles).to_dict()
+        )
+
+
+class TestVectorizedBM25:
+    """The NumPy scorer must match the pure-Python one and degrade without NumPy."""
+
+    QUERY = "machine learning radiology clinical notes discovery unseenterm learning"
+
+    @pytest.fixture
+    def corpus(self, sample_articles):
+        extra = [
+            _make_article(
+                title=f"Learning outcomes study {i}",
+                pmid=str(1000 + i),
+                abstract="Radiology radiology learning " * (i % 4) + "clinical cohort",
+                keywords=["clinical notes"] if i % 2 else [],
+                mesh_terms=["Radiology"] if i % 3 == 0 else [],
+            )
+            for i in range(40)
+        ]
+        return BM25Corpus.from_articles([*sample_articles, *extra])
+
+    def test_matches_python_scorer(self, corpus):
+        pytest.importorskip("numpy")
+        python_scores = bm25_scores(self.QUERY, corpus, vectorize=False)
+        vector_scores = bm25_scores(self.QUERY, corpus, vectorize=True)
+
+        assert vector_scores == pytest.approx(python_scores, rel=1e-12, abs=1e-12)
+        assert max(python_scores) > 0
+        assert corpus.term_index.bm25_matrix is not None
+        # The cached matrix serves later queries too.
+        assert bm25_scores("clinical", corpus, vectorize=True) == pytest.approx(
+            bm25_scores("clinical", corpus, vectorize=False)
+        )
+
+    def test_unknown_terms_score_zero(self, corpus):
+        pytest.importorskip("numpy")
+        assert bm25_scores("nonexistent vocabulary", corpus, vectorize=True) == [0.0] * corpus.total_docs
+
+    def test_falls_back_without_numpy(self, corpus, monkeypatch):
+        from pubmed_search.application.search import bm25_matrix
+
+        monkeypatch.setattr(bm25_matrix, "_numpy", None)
+        monkeypatch.setattr(bm25_matrix, "_numpy_checked", True)
+        monkeypatch.setattr("pubmed_search.application.search.ranking_algorithms._BM25_VECTORIZE_MIN_DOCS", 1)
+
+        assert not bm25_matrix.numpy_available()
+        assert bm25_scores(self.QUERY, corpus) == bm25_scores(self.QUERY, corpus, vectorize=False)
+        assert corpus.term_index.bm25_matrix is None
@@ -0,0 +1,79 @@
+"""Tests for the columnar (struct-of-arrays) ranking dimension scores."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from pubmed_search.application.search.ranking_columns import DIMENSIONS, RankingColumns, weighted_sum
+from pubmed_search.application.search.result_aggregator import RankingConfig, ResultAggregator
+from pubmed_search.domain.entities.article import (
+    ArticleType,
+    CitationMetrics,
+    OpenAccessStatus,
+    SourceMetadata,
+    UnifiedArticle,
+)
+
+
+def _varied_articles() -> list[UnifiedArticle]:
+    year = datetime.now(tz=timezone.utc).year
+    metrics = [
+        None,
+        CitationMetrics(nih_percentile=87.5),
+        CitationMetrics(relative_citation_ratio=3.1),
+        CitationMetrics(citation_count=0),
+        CitationMetrics(citation_count=412),
+        CitationMetrics(),
+    ]
+    articles = []
+    for i in range(36):
+        article = UnifiedArticle(
+            title=f"Sepsis outcomes {i}",
+            primary_source=("pubmed", "core", "unknown_source")[i % 3],
+            abstract="ICU sepsis" if i % 2 else None,
+            doi=f"10.1/{i}" if i % 3 else None,
+            journal="Crit Care" if i % 4 else None,
+            year=(None, 1995, year - 3, year, year + 1)[i % 5],
+            article_type=(ArticleType.META_ANALYSIS, ArticleType.PREPRINT, ArticleType.UNKNOWN)[i % 3],
+            citation_metrics=metrics[i % len(metrics)],
+            oa_status=OpenAccessStatus.GOLD if i % 7 == 0 else None,
+        )
+        article.sources = [SourceMetadata(source=name) for name in ("pubmed", "openalex", "core", "crossref")[: i % 5]]
+        articles.append(article)
+    return articles
+
+
+@pytest.mark.parametrize("config", [RankingConfig(), RankingConfig.recency_focused()])
+def test_columns_match_per_article_scores_exactly(config) -> None:
+    articles = _varied_articles()
+    aggregator = ResultAggregator(config)
+    columns = RankingColumns(articles)
+
+    assert len(columns) == len(articles)
+    assert columns.quality(config) == [aggregator._calculate_quality(a, config) for a in articles]
+    assert columns.recency(config) == [aggregator._calculate_recency(a, config) for a in articles]
+    assert columns.impact() == [aggregator._calculate_impact(a) for a in articles]
+    assert columns.source_trust(config) == [aggregator._calculate_source_trust(a, config) for a in articles]
+
+
+def test_dimension_columns_combine_with_normalized_weights() -> None:
+    articles = _varied_articles()
+    config = RankingConfig(matched_entities=["sepsis", "ICU"], impact_weight=0.6)
+    aggregator = ResultAggregator(config)
+    weights = config.normalized_weights()
+
+    columns = aggregator._calculate_dimension_columns(articles, config, "sepsis", relevance=[None] * len(articles))
+    assert tuple(columns) == DIMENSIONS
+    assert columns["relevance"] == [aggregator._calculate_relevance(a, "sepsis") for a in articles]
+    assert columns["entity_match"] == [aggregator._calculate_entity_match(a, config) for a in articles]
+
+    expected = [
+        sum(
+            score * weights[name]
+            for name, score in zip(DIMENSIONS, (columns[name][position] for name in DIMENSIONS), strict=True)
+        )
+        for position in range(len(articles))
+    ]
+    assert weighted_sum(columns, weights) == expected
@@ -0,0 +1,153 @@
+"""Tests for quota-header-driven pacing of provider rate limiters."""
+
+from __future__ import annotations
+
+import math
+import time
+
+import httpx
+import pytest
+
+from pubmed_search.infrastructure.sources.base_client import BaseAPIClient
+from pubmed_search.shared.async_utils import RateLimiter, get_rate_limiter
+from pubmed_search.shared.rate_limit_headers import (
+    QuotaSnapshot,
+    parse_quota_headers,
+    quota_pacing_interval,
+)
+
+
+class FakeQuotaProvider:
+    """Credit-based upstream: a fixed quota per window, then HTTP 429 until reset."""
+
+    def __init__(self, *, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self.window_end = time.monotonic() + window
+        self.used = 0
+        self.rejected = 0
+        self.served_at: list[float] = []
+
+    def respond(self, url: str) -> httpx.Response:
+        request = httpx.Request("GET", url)
+        now = time.monotonic()
+        if now >= self.window_end:
+            self.window_end = now + self.window
+            self.used = 0
+        reset = f"{math.ceil((self.window_end - now) * 1000) / 1000:.3f}"
+        if self.used >= self.limit:
+            self.rejected += 1
+            return httpx.Response(429, headers={"Retry-After": reset}, json={}, request=request)
+        self.used += 1
+        self.served_at.append(now)
+        return httpx.Response(
+            200,
+            headers={
+                "X-RateLimit-Limit": str(self.limit),
+                "X-RateLimit-Remaining": str(self.limit - self.used),
+                "X-RateLimit-Reset": reset,
+            },
+            json={"ok": True},
+            request=request,
+        )
+
+
+class FakeQuotaClient(BaseAPIClient):
+    _service_name = "Fake Quota"
+
+    def __init__(self, provider: FakeQuotaProvider) -> None:
+        super().__init__(base_url="https://quota.invalid", min_interval=0.001)
+        self.provider = provider
+
+    async def _execute_request(self, url: str, **_kwargs: object) -> httpx.Response:
+        return self.provider.respond(url)
+
+
+def test_parse_provider_header_dialects() -> None:
+    now = 1_800_000_000.0
+
+    scopus = parse_quota_headers(
+        {"x-ratelimit-limit": "20000", "x-ratelimit-remaining": "150", "x-ratelimit-reset": str(now + 60)},
+        now=now,
+    )
+    openalex = parse_quota_headers(
+        {"x-ratelimit-remaining": "7", "x-ratelimit-reset": "2027-01-15T08:00:30Z"},
+        now=1_800_000_000.0,
+    )
+    ietf = parse_quota_headers({"ratelimit-remaining": "3", "ratelimit-reset": "30, 60;w=3600"}, now=now)
+    crossref = parse_quota_headers({"x-rate-limit-limit": "50", "x-rate-limit-interval": "1s"}, now=now)
+
+    assert scopus == QuotaSnapshot(remaining=150.0, limit=20000.0, reset_after=60.0)
+    assert openalex is not None
+    assert openalex.reset_after == pytest.approx(30.0)
+    assert ietf == QuotaSnapshot(remaining=3.0, reset_after=30.0)
+    assert crossref == QuotaSnapshot(limit=50.0, window=1.0)
+    assert parse_quota_headers({"retry-after": "5"}) is None
+
+
+def test_pacing_ramps_smoothly_and_never_speeds_up() -> None:
+    def interval(remaining: float) -> float:
+        pacing = quota_pacing_interval(
+            QuotaSnapshot(remaining=remaining, limit=100.0, reset_after=10.0),
+            base_interval=0.1,
+        )
+        return 0.1 if pacing is None else pacing[0]
+
+    assert interval(80) == 0.1
+    assert interval(25) == 0.1
+    ramp = [interval(remaining) for remaining in (20, 15, 10, 5, 1)]
+    assert ramp == sorted(ramp)
+    assert ramp[0] < 0.2
+    assert ramp[-1] == pytest.approx(0.1 + (10.0 - 0.1) * (1 - 1 / 25))
+    assert quota_pacing_interval(QuotaSnapshot(limit=50.0, window=1.0), base_interval=0.1) is None
+    assert quota_pacing_interval(QuotaSnapshot(limit=5.0, window=1.0), base_interval=0.1) == (0.2, 1.0)
+
+
+async def test_rate_limiter_quota_pacing_spaces_grants() -> None:
+    limiter = RateLimiter(rate=1000.0, per=1.0)
+    limiter.set_quota_pacing(0.05, 10.0)
+    assert limiter.quota_interval == 0.05
+
+    started = time.monotonic()
+    for _ in range(3):
+        await limiter.acquire()
+    assert time.monotonic() - started >= 0.095
+
+    limiter.set_quota_pacing(0.0, 0.0)
+    assert limiter.quota_interval == 0.0
+
+
+async def test_draining_quota_slows_requests_before_provider_rejects() -> None:
+    provider = FakeQuotaProvider(limit=30, window=1.0)
+    client = FakeQuotaClient(provider)
+    try:
+        results = [await client._make_request("/works") for _ in range(34)]
+    finally:
+        await client.close()
+
+    assert all(result == {"ok": True} for result in results)
+    assert provider.rejected == 0
+
+    gaps = [later - earlier for earlier, later in zip(provider.served_at, provider.served_at[1:])]
+    assert sum(gaps[22:29]) > sum(gaps[:15])
+    # More requests than one window allows were served, so the client waited
+    # out the reset instead of burning retries on 429s.
+    assert len(provider.served_at) == 34 > provider.limit
+
+
+async def test_headroom_reported_by_provider_clears_pacing() -> None:
+    client = FakeQuotaClient(FakeQuotaProvider(limit=10, window=5.0))
+    policy = client._build_execution_policy()
+    limiter = get_rate_limiter(policy.rate_limit.name, rate=policy.rate_limit.rate, per=policy.rate_limit.per)
+    try:
+        await client._pace_from_quota_headers(
+            policy, {"x-ratelimit-limit": "100", "x-ratelimit-remaining": "2", "x-ratelimit-reset": "4"}
+        )
+        assert limiter.quota_interval > 1.0
+
+        await client._pace_from_quota_headers(
+            policy, {"x-ratelimit-limit": "100", "x-ratelimit-remaining": "90", "x-ratelimit-reset": "4"}
+        )
+        assert limiter.quota_interval == 0.0
+    finally:
+        await client.close()
@@ -484,6 +484,78 @@ class TestResultAggregator:
         assert len(articles) == 1
         assert stats.dedup_by_pmid == 1
 
+    async def test_incremental_aggregation_is_independent_of_arrival_order(self, mock_article):
+        """Pages deduplicate as they arrive; the final merge matches the batch aggregate."""
+        pubmed = [mock_article(title="A", pmid="1", primary_source="pubmed"), mock_article(title="B", pmid="2")]
+        europe_pmc = [
+            mock_article(title="A (EPMC)", pmid="1", doi="10.1/a", primary_source="europe_pmc"),
+            mock_article(title="C", doi="10.1/c", primary_source="europe_pmc"),
+        ]
+        openalex = [mock_article(title="C (OpenAlex)", doi="10.1/C", primary_source="openalex")]
+
+        streaming = ResultAggregator().incremental()
+        assert streaming.add(2, openalex) == 1
+        assert streaming.add(1, europe_pmc) == 1  # C is already known via DOI
+        assert [article.title for article in streaming.provisional()] == ["A (EPMC)", "C"]
+        assert streaming.add(0, pubmed) == 1
+        assert streaming.unique_count == 3
+        assert [article.title for article in streaming.provisional()] == ["A", "B", "C"]
+        assert len(streaming.snapshot(top_k=2)) == 2
+
+        final, stats = streaming.finish()
+        batch, batch_stats = ResultAggregator().aggregate([pubmed, europe_pmc, openalex])
+        assert final == batch
+        assert stats.to_dict() == batch_stats.to_dict()
+
+    async def test_incremental_finish_merges_streamed_groups_without_rededuplicating(self, mock_article):
+        """finish() reuses the streamed Union-Find and matches a batch aggregate for any arrival order."""
+
+        def pages():
+            return [
+                [mock_article(title="A", pmid="1", primary_source="pubmed"), mock_article(title="B", pmid="2")],
+                [
+                    mock_article(title="A (EPMC)", pmid="1", doi="10.1/a", primary_source="europe_pmc"),
+                    mock_article(title="C", doi="10.1/c", primary_source="europe_pmc"),
+                ],
+                [mock_article(title="C (OpenAlex)", doi="10.1/C", primary_source="openalex")],
+            ]
+
+        def summary(articles):
+            return [(a.title, a.pmid, a.doi, sorted(map(str, a.sources))) for a in articles]
+
+        batch, batch_stats = ResultAggregator().aggregate(pages())
+        for arrival in ((2, 1, 0), (1, 2, 0), (0, 1, 2)):
+            received = pages()
+            streaming = ResultAggregator().incremental()
+            for position in arrival:
+                streaming.add(position, received[position])
+            with patch.object(ResultAggregator, "_index_for_dedup", side_effect=AssertionError("re-indexed")):
+                final, stats = streaming.finish()
+
+            assert summary(final) == summary(batch)
+            assert list(stats.by_source) == list(batch_stats.by_source)
+            assert (stats.unique_articles, stats.duplicates_removed, stats.merged_records) == (3, 2, 2)
+
+    async def test_incremental_snapshot_does_not_rank_or_score(self, mock_article):
+        """The provisional top-k is a cheap estimate that leaves articles and the aggregator untouched."""
+        aggregator = ResultAggregator()
+        streaming = aggregator.incremental()
+        streaming.add(0, [mock_article(title="Unrelated cardiology cohort", pmid="1")])
+        streaming.add(
+            1,
+            [
+                mock_article(title="Sepsis fluid resuscitation trial", pmid="2", primary_source="europe_pmc"),
+                mock_article(title="Unrelated cardiology cohort", pmid="1", primary_source="europe_pmc"),
+            ],
+        )
+
+        with patch.object(ResultAggregator, "rank", side_effect=AssertionError("full ranking")):
+            top = streaming.snapshot("sepsis fluid resuscitation", top_k=2)
+
+        assert [article.pmid for article in top] == ["1", "2"]  # Two sources agree on PMID 1
+        assert all(article.ranking_score is None for article in top)
+        assert aggregator.last_term_index is None
+
     @pytest.mark.parametrize(
         ("field", "left", "right"),
         [
@@ -545,6 +617,24 @@ class TestResultAggregator:
         # Should NOT deduplicate by short title
         assert len(articles) == 2
 
+    async def test_aggregate_across_keeps_each_list_over_shared_articles(self, mock_article):
+        """Lists are deduplicated against each other but keep their own order."""
+        shared_pubmed = mock_article(title="Shared", pmid="1", primary_source="pubmed")
+        shared_europe_pmc = mock_article(title="Shared", pmid="1", primary_source="europe_pmc")
+        only_first = mock_article(title="First", pmid="2")
+        only_second = mock_article(title="Second", pmid="3")
+
+        aggregator = ResultAggregator()
+        unique, mapped, stats = aggregator.aggregate_across(
+            [[shared_pubmed, only_first], [only_second, shared_europe_pmc], []]
+        )
+
+        assert unique == [shared_pubmed, only_first, only_second]
+        assert mapped == [[shared_pubmed, only_first], [only_second, shared_pubmed], []]
+        assert stats.total_input == 4
+        assert stats.duplicates_removed == 1
+        assert stats.by_source == {"pubmed": 3, "europe_pmc": 1}
+
     async def test_aggregate_merge_called(self, mock_article):
         """Test merge_from is called for duplicates."""
         same_doi = "10.1/same"
@@ -771,21 +861,14 @@ class TestResultAggregator:
         article_recent = mock_article(title="Recent", pmid="1", year=datetime.now().year)
         article_impact = mock_article(title="Impact", pmid="2", year=2005)
 
-        scores_recent = {
-            "relevance": 0.5,
-            "quality": 0.5,
-            "recency": 1.0,
-            "impact": 0.1,
-            "source_trust": 0.5,
-            "entity_match": 0.5,
-        }
-        scores_impact = {
-            "relevance": 0.5,
-            "quality": 0.5,
-            "recency": 0.1,
-            "impact": 1.0,
-            "source_trust": 0.5,
-            "entity_match": 0.5,
+        # Columns in input order: [article_recent, article_impact]
+        dimension_columns = {
+            "relevance": [0.5, 0.5],
+            "quality": [0.5, 0.5],
+            "recency": [1.0, 0.1],
+            "impact": [0.1, 1.0],
+            "source_trust": [0.5, 0.5],
+            "entity_match": [0.5, 0.5],
         }
 
         config = RankingConfig.impact_focused()
@@ -793,13 +876,54 @@ class TestResultAggregator:
 
         with patch.object(
             ResultAggregator,
-            "_calculate_dimension_scores",
-            side_effect=[scores_recent, scores_impact],
+            "_calculate_dimension_columns",
+            return_value=dimension_columns,
         ):
             ranked = aggregator.rank([article_recent, article_impact], config=config)
 
         assert ranked[0].pmid == "2"
 
+    @pytest.mark.parametrize("use_rrf", [False, True])
+    async def test_rank_top_k_matches_full_ranking(self, mock_article, use_rrf):
+        """top_k returns exactly the full ranking's prefix, ties included."""
+
+        def build():
+            return [
+                mock_article(
+                    title=f"{'Sepsis mortality' if i % 3 == 0 else 'Cardiac surgery'} outcomes {i % 4}",
+                    pmid=str(i),
+                    abstract="Sepsis in the ICU" if i % 5 == 0 else None,
+                    year=2000 + (i * 7) % 25,
+                )
+                for i in range(40)
+            ]
+
+        config = RankingConfig(use_rrf=use_rrf, matched_entities=["sepsis", "ICU"])
+        full = [article.pmid for article in ResultAggregator(config).rank(build(), query="sepsis mortality")]
+
+        for top_k in (1, 5, 17, 40, 50):
+            ranked = ResultAggregator(config).rank(build(), query="sepsis mortality", top_k=top_k)
+            assert [article.pmid for article in ranked] == full[:top_k]
+
+    async def test_rank_top_k_skips_articles_that_cannot_reach_top(self, mock_article):
+        """Weighted-sum top-k only fully scores candidates whose bound can still qualify."""
+        year = datetime.now().year
+        recent = [mock_article(title="Sepsis trial", pmid=str(i), year=year) for i in range(3)]
+        old = [mock_article(title="Sepsis trial", pmid=str(100 + i), year=1950) for i in range(30)]
+        config = RankingConfig(use_rrf=False, matched_entities=["sepsis"])
+
+        with patch.object(
+            ResultAggregator,
+            "_calculate_entity_match",
+            autospec=True,
+            side_effect=ResultAggregator._calculate_entity_match,
+        ) as entity_match:
+            ranked = ResultAggregator(config).rank(old + recent, query="sepsis trial", top_k=3)
+
+        assert {article.pmid for article in ranked} == {"0", "1", "2"}
+        assert entity_match.call_count == 3
+        assert all(article.ranking_score is None for article in old)
+
     # =========================================================================
     # Scoring Tests
     # =========================================================================
@@ -1093,3 +1217,4 @@ class TestDeduplicationStrategy:
         assert DeduplicationStrategy.STRICT.value == "strict"
         assert DeduplicationStrategy.MODERATE.value == "moderate"
         assert DeduplicationStrategy.AGGRESSIVE.value == "aggressive"
+        assert DeduplicationStrategy.NEAR_DUPLICATE.value == "near_duplicate"
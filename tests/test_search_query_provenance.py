@@ -190,3 +190,16 @@ async def test_rxiv_records_date_request_and_explicit_local_filters() -> None:
         to_date="2025-04-01",
         strict=True,
     )
+
+
+@pytest.mark.asyncio
+async def test_pubmed_count_compiles_the_same_query_as_search() -> None:
+    searcher = _SearchMixinHarness()
+
+    await searcher.search(PRIVATE_QUERY, limit=5, min_year=2020, sex="female", clinical_query="therapy")
+    with patch.object(searcher, "_search_ids_with_retry", wraps=searcher._search_ids_with_retry) as esearch:
+        count = await searcher.search_count(PRIVATE_QUERY, 2020, sex="female", clinical_query="therapy")
+
+    assert count == 0
+    assert searcher.executed_queries[0] == searcher.executed_queries[1]
+    assert esearch.await_args.args[1] == 0
@@ -197,6 +197,34 @@ class TestArticleCache:
         assert payload["journal_abbrev"] == "J"
         assert payload["identifiers"]["doi"] == "10.1000/legacy"
 
+    async def test_persisted_articles_share_repeated_metadata_strings(self, temp_dir):
+        """Reloaded cache entries canonicalize journal, MeSH and affiliation strings."""
+        cache = ArticleCache(cache_dir=str(temp_dir))
+        for pmid in ("111", "222"):
+            cache.put(
+                pmid,
+                {
+                    "pmid": pmid,
+                    "title": f"Article {pmid}",
+                    "authors": ["Chen L"],
+                    "authors_full": [{"last_name": "Chen", "affiliations": ["Dept of Anesthesiology"]}],
+                    "abstract": "",
+                    "journal": "Critical Care Medicine",
+                    "year": "2024",
+                    "mesh_terms": ["Humans", "Sepsis"],
+                },
+            )
+
+        reloaded = ArticleCache(cache_dir=str(temp_dir))
+        first, second = reloaded.get("111"), reloaded.get("222")
+
+        assert first is not None
+        assert second is not None
+        assert first.journal is second.journal
+        assert first.full_data["mesh_terms"][1] is second.full_data["mesh_terms"][1]
+        first_affiliation = first.full_data["authors_full"][0]["affiliations"][0]
+        assert first_affiliation is second.full_data["authors_full"][0]["affiliations"][0]
+
     async def test_cache_miss(self):
         """Test cache miss returns None."""
         cache = ArticleCache()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 
 import httpx
 import pytest
@@ -10,6 +11,7 @@ from pubmed_search.shared.source_contracts import (
     SourceAdapterCall,
     _coerce_source_adapter_outcome,
     gather_source_adapter_calls,
+    iter_source_adapter_calls,
     normalize_source_adapter_error,
 )
 
@@ -43,6 +45,49 @@ async def test_gather_source_adapter_calls_soft_times_out_straggler() -> None:
     assert "0.01s" in results[1].errors[0].message
 
 
+@pytest.mark.asyncio
+async def test_iter_source_adapter_calls_yields_in_completion_order_and_cancels_leftovers() -> None:
+    release_slow = asyncio.Event()
+    abandoned = asyncio.Event()
+
+    async def _slow() -> list[str]:
+        await release_slow.wait()
+        return ["slow"]
+
+    async def _fast() -> list[str]:
+        return ["fast"]
+
+    async def _failing() -> list[str]:
+        raise RuntimeError("boom")
+
+    async def _never() -> list[str]:
+        try:
+            await asyncio.Event().wait()
+        finally:
+            abandoned.set()
+        return []
+
+    calls = [
+        SourceAdapterCall(source="slow", operation="search", execute=_slow),
+        SourceAdapterCall(source="fast", operation="search", execute=_fast),
+        SourceAdapterCall(source="failing", operation="search", execute=_failing),
+        SourceAdapterCall(source="never", operation="search", execute=_never),
+    ]
+    seen: list[tuple[int, str]] = []
+    stream = iter_source_adapter_calls(calls, per_call_timeout=5.0)
+    async with contextlib.aclosing(stream):
+        async for position, result in stream:
+            seen.append((position, result.status))
+            if len(seen) == 2:
+                release_slow.set()
+            if len(seen) == 3:
+                break
+
+    assert sorted(seen[:2]) == [(1, "ok"), (2, "error")]
+    assert seen[2] == (0, "ok")
+    await asyncio.wait_for(abandoned.wait(), timeout=1.0)
+
+
 class TestCoerceSourceAdapterOutcome:
     def test_list_outcome(self):
         result = _coerce_source_adapter_outcome("openalex", "search", [{"title": "A"}])
@@ -0,0 +1,309 @@
+"""Rolling source latency/yield tracking and latency-budget dispatch."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pubmed_search.application.search.query_analyzer import AnalyzedQuery, QueryComplexity, QueryIntent
+from pubmed_search.application.search.source_performance import (
+    SourcePerformanceTracker,
+    get_source_performance_tracker,
+)
+from pubmed_search.domain.entities.article import UnifiedArticle
+from pubmed_search.presentation.mcp_server.tools.unified import run_unified_search
+from pubmed_search.presentation.mcp_server.tools.unified_helpers import (
+    MIN_LATENCY_SAMPLES,
+    MIN_YIELD_SAMPLES,
+    DispatchStrategy,
+)
+from pubmed_search.presentation.mcp_server.tools.unified_planning import build_unified_search_plan
+from pubmed_search.presentation.mcp_server.tools.unified_request import normalize_unified_search_request
+from pubmed_search.shared.source_contracts import SourceAdapterResult
+
+QUERY = "remimazolam versus propofol sedation outcomes"
+PRIMARY = ("pubmed", "openalex", "semantic_scholar")
+
+
+@pytest.fixture(autouse=True)
+def _no_search_history():
+    """Keep run journaling off; other tests may leave a mock session manager installed."""
+    with patch("pubmed_search.presentation.mcp_server.tools.search_run_journal.get_session_manager", return_value=None):
+        yield
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _StaticAnalyzer:
+    def __init__(self, analysis: AnalyzedQuery) -> None:
+        self._analysis = analysis
+
+    def analyze(self, _query: str) -> AnalyzedQuery:
+        return self._analysis
+
+
+async def _ignore_progress(_current: float, _total: float, _message: str) -> None:
+    return None
+
+
+def _analysis() -> AnalyzedQuery:
+    return AnalyzedQuery(
+        original_query=QUERY,
+        normalized_query=QUERY,
+        complexity=QueryComplexity.COMPLEX,
+        intent=QueryIntent.COMPARISON,
+    )
+
+
+def _warm(tracker: SourcePerformanceTracker, source: str, latency_ms: float) -> None:
+    for _ in range(MIN_LATENCY_SAMPLES):
+        tracker.record_latency(source, latency_ms)
+
+
+class TestSourcePerformanceTracker:
+    def test_p95_uses_only_samples_inside_the_window(self):
+        clock = _FakeClock()
+        tracker = SourcePerformanceTracker(window_seconds=60, clock=clock)
+        tracker.record_latency("openalex", 9000)
+        clock.now += 61
+        for latency in range(100, 2100, 100):
+            tracker.record_latency("openalex", latency)
+
+        snapshot = tracker.snapshot("openalex")
+
+        assert snapshot.latency_samples == 20
+        assert snapshot.p95_latency_ms == 2000
+        clock.now += 61
+        assert tracker.snapshot("openalex").p95_latency_ms is None
+
+    def test_measure_records_failed_calls_with_the_fake_clock(self):
+        clock = _FakeClock()
+        tracker = SourcePerformanceTracker(clock=clock)
+
+        with pytest.raises(TimeoutError), tracker.measure("pubmed"):
+            clock.now += 2.5
+            raise TimeoutError
+
+        assert tracker.snapshot("pubmed").p95_latency_ms == 2500
+
+    def test_measure_can_discard_a_deliberately_cancelled_call(self):
+        clock = _FakeClock()
+        tracker = SourcePerformanceTracker(clock=clock)
+
+        with tracker.measure("openalex", discard=lambda: True):
+            clock.now += 0.1
+
+        assert tracker.snapshot("openalex").latency_samples == 0
+
+    def test_unique_yield_share_is_per_query_kind(self):
+        tracker = SourcePerformanceTracker(clock=_FakeClock())
+        tracker.record_yield("openalex", "complex", unique=1, total=40)
+        tracker.record_yield("openalex", "complex", unique=3, total=40)
+        tracker.record_yield("openalex", "simple", unique=40, total=40)
+
+        snapshot = tracker.snapshot("openalex", "complex")
+
+        assert snapshot.yield_samples == 2
+        assert snapshot.unique_yield_share == pytest.approx(0.05)
+
+    def test_sample_count_is_bounded(self):
+        tracker = SourcePerformanceTracker(max_samples=3, clock=_FakeClock())
+        for latency in (5000, 5000, 100, 100, 100):
+            tracker.record_latency("europe_pmc", latency)
+
+        snapshot = tracker.snapshot("europe_pmc")
+
+        assert snapshot.latency_samples == 3
+        assert snapshot.p95_latency_ms == 100
+
+
+class TestApplyLatencyBudget:
+    def _apply(self, tracker, sources, *, user_selected=False):
+        return DispatchStrategy.apply_latency_budget(
+            list(sources),
+            1000,
+            tracker=tracker,
+            query_kind="complex",
+            primary_sources=PRIMARY,
+            user_selected=user_selected,
+        )
+
+    def test_slow_auto_source_is_pruned_and_unknown_source_kept(self):
+        tracker = SourcePerformanceTracker(clock=_FakeClock())
+        _warm(tracker, "pubmed", 300)
+        _warm(tracker, "openalex", 4000)
+
+        sources, decisions = self._apply(tracker, ["pubmed", "openalex", "semantic_scholar", "crossref"])
+
+        assert sources == ["pubmed", "semantic_scholar", "crossref"]
+        assert decisions["openalex"]["decision"] == "pruned"
+        assert decisions["openalex"]["reason"] == "over_latency_budget"
+        assert decisions["openalex"]["p95_latency_ms"] == 4000
+        assert decisions["pubmed"]["reason"] == "within_latency_budget"
+        assert decisions["semantic_scholar"]["reason"] == "insufficient_latency_history"
+        assert "crossref" not in decisions
+
+    def test_user_selected_slow_source_is_only_moved_last(self):
+        tracker = SourcePerformanceTracker(clock=_FakeClock())
+        _warm(tracker, "openalex", 4000)
+        _warm(tracker, "pubmed", 300)
+
+        sources, decisions = self._apply(tracker, ["openalex", "pubmed"], user_selected=True)
+
+        assert sources == ["pubmed", "openalex"]
+        assert decisions["openalex"]["decision"] == "deprioritized"
+
+    def test_low_unique_yield_source_is_moved_last(self):
+        tracker = SourcePerformanceTracker(clock=_FakeClock())
+        _warm(tracker, "openalex", 300)
+        _warm(tracker, "pubmed", 300)
+        for _ in range(3):
+            tracker.record_yield("openalex", "complex", unique=0, total=50)
+
+        sources, decisions = self._apply(tracker, ["openalex", "pubmed"])
+
+        assert sources == ["pubmed", "openalex"]
+        assert decisions["openalex"] == {
+            "decision": "deprioritized",
+            "reason": "low_unique_yield",
+            "latency_budget_ms": 1000,
+            "p95_latency_ms": 300,
+            "latency_samples": MIN_LATENCY_SAMPLES,
+            "unique_yield_share": 0.0,
+            "yield_samples": 3,
+            "query_kind": "complex",
+        }
+
+    def test_fastest_source_survives_when_all_are_over_budget(self):
+        tracker = SourcePerformanceTracker(clock=_FakeClock())
+        _warm(tracker, "pubmed", 3000)
+        _warm(tracker, "openalex", 2000)
+
+        sources, decisions = self._apply(tracker, ["pubmed", "openalex"])
+
+        assert sources == ["openalex"]
+        assert decisions["pubmed"]["decision"] == "pruned"
+        assert decisions["openalex"]["decision"] == "deprioritized"
+        assert decisions["openalex"]["reason"] == "over_latency_budget_last_source"
+
+
+class TestLatencyBudgetOption:
+    def test_option_is_parsed_and_validated(self):
+        request = normalize_unified_search_request(query=QUERY, options="shallow, latency_budget_ms=2500")
+
+        assert request.latency_budget_ms == 2500
+        assert normalize_unified_search_request(query=QUERY).latency_budget_ms is None
+        with pytest.raises(ValueError, match="latency_budget_ms must be an integer"):
+            normalize_unified_search_request(query=QUERY, options="latency_budget_ms=fast")
+        with pytest.raises(ValueError, match="latency_budget_ms must be an integer"):
+            normalize_unified_search_request(query=QUERY, options="latency_budget_ms=10")
+
+    @pytest.mark.asyncio
+    async def test_plan_prunes_slow_auto_dispatched_source(self):
+        tracker = SourcePerformanceTracker(clock=_FakeClock())
+        _warm(tracker, "semantic_scholar", 8000)
+        request = normalize_unified_search_request(query=QUERY, options="shallow,latency_budget_ms=2000")
+
+        plan = await build_unified_search_plan(
+            request,
+            progress=_ignore_progress,
+            analyzer_factory=lambda: _StaticAnalyzer(_analysis()),
+            enhancer_factory=AsyncMock,
+            source_performance_factory=lambda: tracker,
+        )
+
+        assert "semantic_scholar" not in plan.dispatch_sources
+        assert "pubmed" in plan.dispatch_sources
+        assert plan.dispatch_decisions["semantic_scholar"]["decision"] == "pruned"
+
+    @pytest.mark.asyncio
+    async def test_execution_feeds_tracker_and_reports_decisions(self):
+        tracker = get_source_performance_tracker()
+        _warm(tracker, "semantic_scholar", 8000)
+
+        def _runner(source: str, pmids: tuple[str, ...]):
+            async def _search(*_args, **_kwargs):
+                items = [UnifiedArticle(title=f"Article {pmid}", primary_source=source, pmid=pmid) for pmid in pmids]
+                return SourceAdapterResult(source=source, operation="search", items=items, status="ok")
+
+            return AsyncMock(side_effect=_search)
+
+        functions = {
+            "pubmed": _runner("pubmed", ("1", "2", "3")),
+            "openalex": _runner("openalex", ("3",)),
+            "semantic_scholar": _runner("semantic_scholar", ("4",)),
+        }
+        text = await run_unified_search(
+            searcher=AsyncMock(),
+            query=QUERY,
+            output_format="json",
+            options="shallow,no_relax,no_oa,no_analysis,no_scores,latency_budget_ms=2000",
+            analyzer_factory=lambda: _StaticAnalyzer(_analysis()),
+            enhancer_factory=AsyncMock,
+            search_functions=functions,
+        )
+
+        functions["semantic_scholar"].assert_not_awaited()
+        metadata = json.loads(text)["source_metadata"]
+        assert metadata["semantic_scholar"]["dispatch"]["decision"] == "pruned"
+        assert metadata["semantic_scholar"]["query_executed"] is False
+        assert metadata["pubmed"]["dispatch"]["reason"] == "insufficient_latency_history"
+        kind = DispatchStrategy.get_auto_dispatch_profile(_analysis())
+        assert tracker.snapshot("pubmed").latency_samples == 1
+        assert tracker.snapshot("pubmed", kind).unique_yield_share == pytest.approx(2 / 3)
+        assert tracker.snapshot("openalex", kind).unique_yield_share == 0.0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("early_return", [True, False])
+    async def test_deprioritized_source_starts_last_only_with_early_return(self, early_return):
+        tracker = get_source_performance_tracker()
+        kind = DispatchStrategy.get_auto_dispatch_profile(_analysis())
+        for source in ("pubmed", "europe_pmc", "openalex"):
+            _warm(tracker, source, 300)
+        for _ in range(MIN_YIELD_SAMPLES):
+            tracker.record_yield("openalex", kind, unique=0, total=40)
+
+        def _runner(source: str, start: int, count: int):
+            async def _search(*_args, **_kwargs):
+                items = [
+                    UnifiedArticle(title=f"Article {pmid}", primary_source=source, pmid=str(pmid))
+                    for pmid in range(start, start + count)
+                ]
+                return SourceAdapterResult(source=source, operation="search", items=items, status="ok")
+
+            return AsyncMock(side_effect=_search)
+
+        functions = {
+            "pubmed": _runner("pubmed", 1, 12),
+            "europe_pmc": _runner("europe_pmc", 10, 8),
+            "openalex": _runner("openalex", 100, 3),
+        }
+        options = "shallow,no_relax,no_oa,no_analysis,no_scores,latency_budget_ms=2000"
+        text = await run_unified_search(
+            searcher=AsyncMock(),
+            query=QUERY,
+            limit=10,
+            sources="pubmed,europe_pmc,openalex",
+            output_format="json",
+            options=f"{options},early_return" if early_return else options,
+            analyzer_factory=lambda: _StaticAnalyzer(_analysis()),
+            enhancer_factory=AsyncMock,
+            search_functions=functions,
+        )
+
+        metadata = json.loads(text)["source_metadata"]
+        assert metadata["openalex"]["dispatch"]["reason"] == "low_unique_yield"
+        if early_return:
+            functions["openalex"].assert_not_awaited()
+            assert metadata["openalex"]["cancelled_early"] is True
+        else:
+            functions["openalex"].assert_awaited_once()
+            assert "cancelled_early" not in metadata["openalex"]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+
+from pubmed_search.domain.services.article_mapper import article_from_pubmed
+from pubmed_search.shared.string_interning import InternTable, get_intern_table
+
+
+def _fresh(value: str) -> str:
+    """An equal string that is a distinct object, as parsed JSON produces."""
+    return json.loads(json.dumps(value))
+
+
+class TestInternTable:
+    async def test_equal_strings_share_one_object(self):
+        table = InternTable()
+        first = table.intern(_fresh("Critical Care Medicine"))
+        second = table.intern(_fresh("Critical Care Medicine"))
+
+        assert first is second
+        assert table.stats() == {"entries": 1, "max_entries": table.max_entries, "hits": 1, "misses": 1}
+
+    async def test_non_strings_and_long_values_pass_through(self):
+        table = InternTable(max_length=10)
+        long_value = _fresh("A title that is far too long to intern")
+
+        assert table.intern(None) is None
+        assert table.intern(2024) == 2024
+        assert table.intern(long_value) is long_value
+        assert len(table) == 0
+
+    async def test_table_is_bounded_and_evicts_oldest(self):
+        table = InternTable(max_entries=2)
+        for value in ("alpha", "beta", "gamma"):
+            table.intern(_fresh(value))
+
+        assert len(table) == 2
+        assert "alpha" not in table
+        assert "gamma" in table
+        assert table.intern(_fresh("alpha")) == "alpha"
+
+    async def test_zero_capacity_disables_interning(self):
+        table = InternTable(max_entries=0)
+        value = _fresh("Lancet")
+
+        assert table.intern(value) is value
+        assert len(table) == 0
+
+    async def test_intern_payload_canonicalizes_metadata_in_place(self):
+        table = InternTable()
+        payloads = [
+            json.loads(
+                '{"title": "T", "journal": "JAMA", "mesh_terms": ["Humans", "Sepsis"], '
+                '"publication_types": ["Journal Article"], '
+                '"authors_full": [{"last_name": "Chen", "affiliations": ["Dept of Anesthesiology"]}]}'
+            )
+            for _ in range(2)
+        ]
+        for payload in payloads:
+            assert table.intern_payload(payload) is payload
+
+        first, second = payloads
+        assert first == second
+        assert first["journal"] is second["journal"]
+        assert first["mesh_terms"][0] is second["mesh_terms"][0]
+        assert first["publication_types"][0] is second["publication_types"][0]
+        assert first["authors_full"][0]["affiliations"][0] is second["authors_full"][0]["affiliations"][0]
+
+
+class TestMapperInterning:
+    async def test_mapped_articles_share_metadata_strings(self):
+        articles = [
+            article_from_pubmed(
+                json.loads(
+                    '{"pmid": "' + pmid + '", "title": "Sepsis outcomes", "journal": "Critical Care", '
+                    '"source": "Crit Care", "language": "eng", "keywords": ["sepsis"], "mesh_terms": ["Humans"]}'
+                )
+            )
+            for pmid in ("1", "2")
+        ]
+
+        first, second = articles
+        assert first.journal is second.journal
+        assert first.journal_abbrev is second.journal_abbrev
+        assert first.language is second.language
+        assert first.keywords[0] is second.keywords[0]
+        assert first.mesh_terms[0] is second.mesh_terms[0]
+        assert first.journal in get_intern_table()
@@ -49,10 +49,10 @@ class TestListRegisteredTools:
         assert "unified_search" in result["search"]
 
     async def test_unified_search_is_the_only_generic_literature_search_tool(self):
-        """Provider adapters and entity lookups must not expand the search facade."""
+        """Provider adapters and entity lookups must not expand the search facade; only its batch form may."""
         result = list_registered_tools()
 
-        assert result["search"] == ["unified_search"]
+        assert result["search"] == ["unified_search", "unified_search_batch"]
 
     async def test_legacy_merge_tool_is_not_primary_surface(self):
         result = list_registered_tools()
@@ -251,7 +251,7 @@ class TestValidateToolRegistry:
 
         assert result["valid"] is True
         assert "merge_search_results" not in result["registered"]
-        assert set(TOOL_CATEGORIES["search"]["tools"]) == {"unified_search"}
+        assert set(TOOL_CATEGORIES["search"]["tools"]) == {"unified_search", "unified_search_batch"}
 
 
 # ============================================================
@@ -7,6 +7,7 @@ Tests: Author, OpenAccessLink, CitationMetrics, SourceMetadata, UnifiedArticle
 
 from __future__ import annotations
 
+import json
 from datetime import date
 
 from pubmed_search.domain.entities.article import (
@@ -276,6 +277,24 @@ class TestUnifiedArticleBasic:
         assert article.doi == "10.1000/example"
         assert article.pmc == "PMC7096777"
 
+    async def test_entities_are_slotted(self):
+        """Entities have no per-instance __dict__ and share the empty list default."""
+        first = UnifiedArticle(title="A", primary_source="pubmed")
+        second = UnifiedArticle(title="B", primary_source="openalex")
+        for entity in (first, Author(full_name="A"), OpenAccessLink(url="u"), SourceMetadata(source="pubmed")):
+            assert not hasattr(entity, "__dict__")
+        assert first.authors == ()
+        assert first.keywords is second.keywords
+        assert getattr(first, "mesh_terms", None) == ()
+
+    async def test_enum_like_strings_are_interned(self):
+        """Repeated OA link and source values from parsed JSON share one string object."""
+        payload = json.loads('{"version": "publishedVersion", "host_type": "repository", "source": "pubmed"}')
+        link = OpenAccessLink(url="u", version=payload["version"], host_type=payload["host_type"])
+        assert link.version is OpenAccessLink(url="v", version="publishedVersion").version
+        assert link.host_type is OpenAccessLink(url="w", host_type="repository").host_type
+        assert SourceMetadata(source=payload["source"]).source is SourceMetadata(source="pubmed").source
+
 
 # =============================================================================
 # UnifiedArticle - Properties Tests
@@ -721,6 +740,27 @@ class TestUnifiedArticleMerge:
         article2 = UnifiedArticle(title="Test 2", primary_source="pubmed", pmid="456")
         assert article1.matches_identifier(article2) is False
 
+    async def test_merge_into_default_fields(self):
+        """Merging into empty defaults creates lists without touching the shared default."""
+        primary = UnifiedArticle(title="Test", primary_source="crossref")
+        other = UnifiedArticle(
+            title="Test",
+            primary_source="pubmed",
+            authors=[Author(full_name="John Smith")],
+            keywords=["sepsis"],
+            mesh_terms=["Sepsis"],
+            oa_links=[OpenAccessLink(url="https://example.org/a.pdf")],
+            sources=[SourceMetadata(source="pubmed")],
+        )
+        primary.merge_from(other)
+        assert primary.keywords == ["sepsis"]
+        assert primary.mesh_terms == ["Sepsis"]
+        assert [link.url for link in primary.oa_links] == ["https://example.org/a.pdf"]
+        assert [source.source for source in primary.sources] == ["pubmed"]
+        primary.authors.append(Author(full_name="Jane Doe"))
+        assert len(other.authors) == 1
+        assert UnifiedArticle(title="Fresh", primary_source="pubmed").keywords == ()
+
 
 # =============================================================================
 # UnifiedArticle - Serialization Tests
@@ -754,6 +794,14 @@ class TestUnifiedArticleSerialization:
         assert "authors" in data
         assert len(data["authors"]) == 1
 
+    async def test_to_dict_emits_lists_for_default_fields(self):
+        """Empty-tuple defaults serialize as JSON lists."""
+        data = UnifiedArticle(title="Test", primary_source="pubmed").to_dict()
+        assert data["keywords"] == []
+        assert data["mesh_terms"] == []
+        assert data["open_access"]["links"] == []
+        assert data["sources"] == []
+
     async def test_to_dict_metrics(self):
         """Test to_dict includes citation metrics."""
         article = UnifiedArticle(
@@ -764,6 +812,46 @@ class TestUnifiedArticleSerialization:
         data = article.to_dict()
         assert "citation_metrics" in data or "citation_count" in str(data)
 
+    async def test_cached_serialization_reuses_result(self):
+        """The encoder runs once per variant while the article is unchanged."""
+        article = UnifiedArticle(title="Test", primary_source="pubmed", pmid="1")
+        calls = []
+
+        def encode(item: UnifiedArticle) -> str:
+            calls.append(item)
+            return json.dumps(item.to_dict())
+
+        first = article.cached_serialization("json", encode)
+        assert article.cached_serialization("json", encode) is first
+        article.cached_serialization("compact", encode)
+        assert len(calls) == 2
+
+    async def test_cached_serialization_invalidation(self):
+        """Merges, score changes and mark_modified drop cached forms."""
+        article = UnifiedArticle(title="Test", primary_source="pubmed", pmid="1")
+
+        def encode(item: UnifiedArticle) -> dict:
+            return item.to_dict()
+
+        assert article.cached_serialization("json", encode)["keywords"] == []
+        article.merge_from(UnifiedArticle(title="Test", primary_source="openalex", pmid="1", keywords=["sepsis"]))
+        assert article.cached_serialization("json", encode)["keywords"] == ["sepsis"]
+
+        article.ranking_score = 0.75
+        assert article.cached_serialization("json", encode)["_ranking_score"] == 0.75
+
+        article.journal = "Crit Care"
+        assert article.cached_serialization("json", encode)["journal"] is None
+        article.mark_modified()
+        assert article.cached_serialization("json", encode)["journal"] == "Crit Care"
+
+    async def test_cached_serialization_ignored_by_equality(self):
+        """Cache state does not affect comparisons or repr."""
+        article = UnifiedArticle(title="Test", primary_source="pubmed", pmid="1")
+        article.cached_serialization("json", UnifiedArticle.to_dict)
+        assert article == UnifiedArticle(title="Test", primary_source="pubmed", pmid="1")
+        assert "_serialized" not in repr(article)
+
 
 # =============================================================================
 # ArticleType Enum Tests
@@ -0,0 +1,237 @@
+"""Batched unified_search over several query variants."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pubmed_search.application.search.query_analyzer import AnalyzedQuery, QueryComplexity, QueryIntent
+from pubmed_search.application.search.result_aggregator import RankingConfig
+from pubmed_search.application.search.source_performance import SourcePerformanceTracker
+from pubmed_search.domain.entities.article import UnifiedArticle
+from pubmed_search.presentation.mcp_server.tools.unified_batch import (
+    MAX_BATCH_QUERIES,
+    execute_unified_search_batch,
+    run_unified_search_batch,
+)
+from pubmed_search.presentation.mcp_server.tools.unified_planning import UnifiedSearchPlan
+from pubmed_search.presentation.mcp_server.tools.unified_request import normalize_unified_search_request
+from pubmed_search.shared.source_contracts import SourceAdapterResult
+
+SHARED_TITLE = "Remimazolam versus propofol for ICU sedation"
+
+
+async def _ignore_progress(_current: float, _total: float, _message: str) -> None:
+    return None
+
+
+def _plan(query: str, *, sources: tuple[str, ...] = ("pubmed",), limit: int = 5) -> UnifiedSearchPlan:
+    request = normalize_unified_search_request(
+        query=query, limit=limit, sources=",".join(sources), options="shallow,no_analysis,no_scores"
+    )
+    analysis = AnalyzedQuery(
+        original_query=query,
+        normalized_query=query,
+        complexity=QueryComplexity.SIMPLE,
+        intent=QueryIntent.EXPLORATION,
+    )
+    return UnifiedSearchPlan(
+        request=request,
+        query=query,
+        provider_neutral_query=query,
+        analysis=analysis,
+        icd_matches=[],
+        enhanced_query=None,
+        deep_strategies=[],
+        matched_entity_names=[],
+        user_sources=list(sources),
+        dispatch_sources=list(sources),
+        ranking_config=RankingConfig.default(),
+        effective_min_year=None,
+        effective_max_year=None,
+    )
+
+
+def _article(title: str, pmid: str, source: str = "pubmed") -> UnifiedArticle:
+    return UnifiedArticle(
+        title=title,
+        primary_source=source,
+        pmid=pmid,
+        abstract=f"{title}. Sedation outcomes in critically ill adults.",
+        year=2022,
+    )
+
+
+# Q1 and Q2 both find the shared article; each also finds one of its own.
+RESULTS = {
+    "remimazolam ICU sedation": [_article(SHARED_TITLE, "100"), _article("Remimazolam pharmacokinetics", "101")],
+    "remimazolam delirium": [_article("Delirium after remimazolam", "200"), _article(SHARED_TITLE, "100")],
+}
+
+
+def _runner(source: str = "pubmed", *, in_flight: list[int] | None = None) -> AsyncMock:
+    async def _search(query, _limit, _min_year, _max_year, _options):
+        if in_flight is not None:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+        items = [
+            UnifiedArticle(title=article.title, primary_source=source, pmid=article.pmid, abstract=article.abstract)
+            for article in RESULTS.get(query, [])
+        ]
+        return SourceAdapterResult(
+            source=source,
+            operation="search",
+            items=items,
+            status="ok" if items else "empty",
+            metadata={"physical_query": query, "query_executed": True, "total_available": len(items)},
+        )
+
+    return AsyncMock(side_effect=_search)
+
+
+class TestExecuteUnifiedSearchBatch:
+    @pytest.mark.asyncio
+    async def test_variants_are_ranked_separately_and_fused(self):
+        plans = [_plan(query) for query in RESULTS]
+
+        result = await execute_unified_search_batch(
+            plans, AsyncMock(), progress=_ignore_progress, search_functions={"pubmed": _runner()}
+        )
+
+        assert [{article.pmid for article in variant.ranked} for variant in result.variants] == [
+            {"100", "101"},
+            {"200", "100"},
+        ]
+        assert result.stats.total_input == 4
+        assert result.stats.unique_articles == 3
+        assert result.fused[0].pmid == "100"
+        assert result.fused[0].ranking_score == 1.0
+        assert {article.pmid for article in result.fused} == {"100", "101", "200"}
+        assert result.variant_ranks["pmid:100"][0] is not None
+        assert result.variant_ranks["pmid:100"][1] is not None
+        assert result.variant_ranks["pmid:101"][1] is None
+
+    @pytest.mark.asyncio
+    async def test_shared_articles_are_enriched_once(self):
+        sources = ("pubmed", "openalex")
+        plans = [_plan(query, sources=sources) for query in RESULTS]
+        functions = {"pubmed": _runner(), "openalex": _runner("openalex")}
+
+        with patch(
+            "pubmed_search.presentation.mcp_server.tools.unified_execution._enrich_with_journal_metrics",
+            new_callable=AsyncMock,
+        ) as journal_metrics:
+            result = await execute_unified_search_batch(
+                plans, AsyncMock(), progress=_ignore_progress, search_functions=functions
+            )
+
+        journal_metrics.assert_awaited_once()
+        enriched = journal_metrics.await_args.args[0]
+        assert sorted(article.pmid for article in enriched) == ["100", "101", "200"]
+        assert result.enriched_articles == {"journal_metrics": 3}
+
+    @pytest.mark.asyncio
+    async def test_provider_calls_share_one_concurrency_budget(self):
+        queries = [*RESULTS, "remimazolam hypotension"]
+        plans = [_plan(query, sources=("pubmed", "openalex")) for query in queries]
+        in_flight = [0, 0]
+        functions = {
+            "pubmed": _runner(in_flight=in_flight),
+            "openalex": _runner("openalex", in_flight=in_flight),
+        }
+
+        with patch(
+            "pubmed_search.presentation.mcp_server.tools.unified_execution._enrich_with_journal_metrics",
+            new_callable=AsyncMock,
+        ):
+            await execute_unified_search_batch(
+                plans, AsyncMock(), progress=_ignore_progress, search_functions=functions, max_concurrency=2
+            )
+
+        assert functions["pubmed"].await_count == 3
+        assert functions["openalex"].await_count == 3
+        assert in_flight[1] == 2
+
+    @pytest.mark.asyncio
+    async def test_waiting_for_a_budget_slot_is_not_recorded_as_latency(self):
+        now = [0.0]
+        tracker = SourcePerformanceTracker(clock=lambda: now[0])
+        search = _runner()
+
+        async def _one_second_search(*args):
+            await asyncio.sleep(0)
+            now[0] += 1.0
+            return await search(*args)
+
+        queries = [*RESULTS, "remimazolam hypotension", "remimazolam emergence"]
+        with (
+            patch(
+                "pubmed_search.presentation.mcp_server.tools.unified_execution.get_source_performance_tracker",
+                return_value=tracker,
+            ),
+            patch(
+                "pubmed_search.presentation.mcp_server.tools.unified_execution._enrich_with_journal_metrics",
+                new_callable=AsyncMock,
+            ),
+        ):
+            await execute_unified_search_batch(
+                [_plan(query) for query in queries],
+                AsyncMock(),
+                progress=_ignore_progress,
+                search_functions={"pubmed": AsyncMock(side_effect=_one_second_search)},
+                max_concurrency=1,
+            )
+
+        snapshot = tracker.snapshot("pubmed")
+        assert snapshot.latency_samples == 4
+        assert snapshot.p95_latency_ms == 1000.0
+
+
+class TestRunUnifiedSearchBatch:
+    @pytest.mark.asyncio
+    async def test_json_payload_has_fused_articles_and_variants(self):
+        text = await run_unified_search_batch(
+            searcher=AsyncMock(),
+            queries=list(RESULTS),
+            sources="pubmed",
+            output_format="json",
+            options="shallow,no_analysis",
+            search_functions={"pubmed": _runner()},
+        )
+
+        payload = json.loads(text)
+        assert payload["tool"] == "unified_search_batch"
+        assert payload["articles"][0]["variant_ranks"][0] is not None
+        assert payload["articles"][0]["variant_ranks"][1] is not None
+        assert [variant["query"] for variant in payload["variants"]] == list(RESULTS)
+        assert payload["batch_stats"]["cross_variant_duplicates"] == 1
+
+    @pytest.mark.asyncio
+    async def test_markdown_reports_which_variants_found_each_article(self):
+        text = await run_unified_search_batch(
+            searcher=AsyncMock(),
+            queries="\n".join(RESULTS),
+            sources="pubmed",
+            options="shallow,no_analysis",
+            search_functions={"pubmed": _runner()},
+        )
+
+        assert "## Batch search: 2 query variants" in text
+        assert "found by Q1, Q2" in text
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("queries", [[], ["  "], [f"query {index}" for index in range(MAX_BATCH_QUERIES + 1)]])
+    async def test_empty_or_oversized_batches_are_rejected(self, queries):
+        runner = _runner()
+
+        text = await run_unified_search_batch(
+            searcher=AsyncMock(), queries=queries, search_functions={"pubmed": runner}
+        )
+
+        assert "unified_search_batch" in text
+        runner.assert_not_awaited()
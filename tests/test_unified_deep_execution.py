@@ -343,6 +343,58 @@ async def test_explicit_failed_source_does_not_fallback_or_auto_relax() -> None:
     assert execution.source_statuses == {"pubmed": "error"}
 
 
+@pytest.mark.asyncio
+async def test_sources_are_deduplicated_as_they_arrive_with_provisional_progress() -> None:
+    plan = _simple_plan(explicit_sources=True)
+    plan.dispatch_sources = ["pubmed", "europe_pmc"]
+    europe_pmc_released = asyncio.Event()
+    messages: list[str] = []
+
+    async def record_progress(_current: float, _total: float, message: str) -> None:
+        messages.append(message)
+        if "provisional top" in message:
+            europe_pmc_released.set()
+
+    async def pubmed(*_args, **_kwargs):
+        # The slow source: it only answers after Europe PMC was reported.
+        await europe_pmc_released.wait()
+        return (
+            [
+                UnifiedArticle(title="Precision medicine in oncology", primary_source="pubmed", pmid="1"),
+                UnifiedArticle(title="Precision medicine economics", primary_source="pubmed", pmid="2"),
+            ],
+            2,
+        )
+
+    async def europe_pmc(*_args, **_kwargs):
+        return (
+            [
+                UnifiedArticle(title="Precision medicine in oncology", primary_source="europe_pmc", pmid="1"),
+                UnifiedArticle(title="Pharmacogenomics for precision medicine", primary_source="europe_pmc", pmid="3"),
+            ],
+            2,
+        )
+
+    execution = await asyncio.wait_for(
+        execute_unified_search(
+            plan,
+            AsyncMock(),
+            progress=record_progress,
+            search_functions={"pubmed": pubmed, "europe_pmc": europe_pmc},
+        ),
+        timeout=5.0,
+    )
+
+    provisional = [message for message in messages if "provisional top" in message]
+    assert len(provisional) == 1
+    assert provisional[0].startswith("europe_pmc: 2 results (2 new), 1 source(s) pending")
+    # The final merge follows source order, not arrival order.
+    assert execution.stats.by_source == {"pubmed": 2, "europe_pmc": 2}
+    assert execution.stats.unique_articles == 3
+    assert sorted(article.pmid for article in execution.ranked) == ["1", "2", "3"]
+    assert execution.source_statuses == {"pubmed": "ok", "europe_pmc": "ok"}
+
+
 @pytest.mark.asyncio
 async def test_deep_strategy_timeout_is_normalized_without_hanging() -> None:
     strategy = _strategy("slow", "pubmed", 1)
@@ -0,0 +1,199 @@
+"""Opt-in early return that cancels straggler sources once results suffice."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pubmed_search.application.search.query_analyzer import AnalyzedQuery, QueryComplexity, QueryIntent
+from pubmed_search.application.search.result_aggregator import RankingConfig
+from pubmed_search.application.search.semantic_enhancer import EnhancedQuery, SearchPlan
+from pubmed_search.application.search.source_performance import (
+    SourcePerformanceTracker,
+    get_source_performance_tracker,
+)
+from pubmed_search.domain.entities.article import UnifiedArticle
+from pubmed_search.presentation.mcp_server.tools.unified import run_unified_search
+from pubmed_search.presentation.mcp_server.tools.unified_execution import execute_unified_search
+from pubmed_search.presentation.mcp_server.tools.unified_helpers import MIN_YIELD_SAMPLES, DispatchStrategy
+from pubmed_search.presentation.mcp_server.tools.unified_planning import UnifiedSearchPlan
+from pubmed_search.presentation.mcp_server.tools.unified_request import normalize_unified_search_request
+from pubmed_search.shared.source_contracts import SourceAdapterResult
+
+QUERY = "remimazolam sedation"
+SOURCES = "pubmed,europe_pmc,openalex"
+
+
+@pytest.fixture(autouse=True)
+def _no_search_history():
+    """Keep run journaling off; other tests may leave a mock session manager installed."""
+    with patch("pubmed_search.presentation.mcp_server.tools.search_run_journal.get_session_manager", return_value=None):
+        yield
+
+
+class _StaticAnalyzer:
+    def analyze(self, _query: str) -> AnalyzedQuery:
+        return _analysis()
+
+
+def _analysis() -> AnalyzedQuery:
+    return AnalyzedQuery(
+        original_query=QUERY,
+        normalized_query=QUERY,
+        complexity=QueryComplexity.SIMPLE,
+        intent=QueryIntent.LOOKUP,
+    )
+
+
+def _history(tracker: SourcePerformanceTracker, source: str, *, unique: int) -> None:
+    kind = DispatchStrategy.get_auto_dispatch_profile(_analysis())
+    for _ in range(MIN_YIELD_SAMPLES):
+        tracker.record_yield(source, kind, unique=unique, total=40)
+
+
+def _runner(source: str, start: int, count: int, *, delay: float = 0.0):
+    async def _search(*_args, **_kwargs):
+        await asyncio.sleep(delay)
+        items = [
+            UnifiedArticle(title=f"Article {pmid}", primary_source=source, pmid=str(pmid))
+            for pmid in range(start, start + count)
+        ]
+        return SourceAdapterResult(source=source, operation="search", items=items, status="ok")
+
+    return AsyncMock(side_effect=_search)
+
+
+async def _search(functions, options: str = "shallow,no_relax,no_oa,no_analysis,no_scores,early_return") -> dict:
+    text = await run_unified_search(
+        searcher=AsyncMock(),
+        query=QUERY,
+        limit=10,
+        sources=SOURCES,
+        output_format="json",
+        options=options,
+        analyzer_factory=_StaticAnalyzer,
+        search_functions=functions,
+    )
+    return json.loads(text)
+
+
+class TestResultsAreSufficient:
+    def _sufficient(self, tracker, unique_count, pending=("openalex",)):
+        return DispatchStrategy.results_are_sufficient(
+            unique_count, 10, list(pending), tracker=tracker, query_kind="simple"
+        )
+
+    def test_needs_margin_over_limit_and_low_pending_yield(self):
+        tracker = SourcePerformanceTracker()
+        for _ in range(MIN_YIELD_SAMPLES):
+            tracker.record_yield("openalex", "simple", unique=1, total=100)
+
+        assert self._sufficient(tracker, 15)
+        assert not self._sufficient(tracker, 14)
+        assert not self._sufficient(tracker, 15, pending=())
+
+    def test_pending_source_without_history_or_with_high_yield_is_awaited(self):
+        tracker = SourcePerformanceTracker()
+        assert not self._sufficient(tracker, 50)
+
+        for _ in range(MIN_YIELD_SAMPLES):
+            tracker.record_yield("openalex", "simple", unique=20, total=100)
+        assert not self._sufficient(tracker, 50)
+
+
+class TestEarlyReturnExecution:
+    @pytest.mark.asyncio
+    async def test_straggler_is_cancelled_once_results_suffice(self):
+        tracker = get_source_performance_tracker()
+        _history(tracker, "openalex", unique=0)
+        cancelled = asyncio.Event()
+
+        async def _hanging(*_args, **_kwargs):
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        functions = {
+            "pubmed": _runner("pubmed", 1, 12),
+            "europe_pmc": _runner("europe_pmc", 10, 8),
+            "openalex": AsyncMock(side_effect=_hanging),
+        }
+
+        payload = await asyncio.wait_for(_search(functions), timeout=10)
+
+        assert cancelled.is_set()
+        assert len(payload["articles"]) == 10
+        assert payload["source_metadata"]["openalex"]["cancelled_early"] is True
+        assert payload["source_metadata"]["openalex"]["query_executed"] is False
+        assert payload["search_status"]["cancelled_early_sources"] == ["openalex"]
+        assert payload["search_status"]["early_return"] == "applied"
+        assert "openalex" not in payload["search_status"]["successful_sources"]
+        assert tracker.snapshot("openalex").latency_samples == 0
+        assert tracker.snapshot("pubmed").latency_samples == 1
+
+    @pytest.mark.asyncio
+    async def test_sources_without_yield_history_are_awaited(self):
+        functions = {
+            "pubmed": _runner("pubmed", 1, 12),
+            "europe_pmc": _runner("europe_pmc", 10, 8),
+            "openalex": _runner("openalex", 100, 3, delay=0.05),
+        }
+
+        payload = await _search(functions)
+
+        functions["openalex"].assert_awaited_once()
+        assert "cancelled_early" not in payload["source_metadata"]["openalex"]
+        assert "cancelled_early_sources" not in payload["search_status"]
+        assert payload["search_status"]["early_return"] == "applied"
+
+    def test_systematic_plans_ignore_the_option(self):
+        assert normalize_unified_search_request(query=QUERY, options="early_return").early_return is True
+        assert normalize_unified_search_request(query=QUERY, options="systematic,early_return").early_return is False
+
+
+def _deep_plan(options: str) -> UnifiedSearchPlan:
+    strategies = [
+        SearchPlan(name="exact", query=QUERY, source="pubmed", priority=1, expected_precision=0.5, expected_recall=0.5)
+    ]
+    return UnifiedSearchPlan(
+        request=normalize_unified_search_request(query=QUERY, sources="pubmed", options=options),
+        query=QUERY,
+        provider_neutral_query=QUERY,
+        analysis=_analysis(),
+        icd_matches=[],
+        enhanced_query=EnhancedQuery(original_query=QUERY, strategies=strategies),
+        deep_strategies=strategies,
+        matched_entity_names=[],
+        user_sources=["pubmed"],
+        dispatch_sources=["pubmed"],
+        ranking_config=RankingConfig.default(),
+        effective_min_year=None,
+        effective_max_year=None,
+    )
+
+
+class TestDeepSearchPlans:
+    def test_cache_key_ignores_the_option_it_cannot_apply(self):
+        assert _deep_plan("no_relax,early_return").uses_deep_search
+        assert DispatchStrategy.result_cache_key(_deep_plan("no_relax,early_return")) == (
+            DispatchStrategy.result_cache_key(_deep_plan("no_relax"))
+        )
+
+    @pytest.mark.asyncio
+    async def test_status_reports_that_early_return_was_not_applied(self):
+        async def _ignore_progress(_current: float, _total: float, _message: str) -> None:
+            return None
+
+        execution = await execute_unified_search(
+            _deep_plan("no_relax,no_analysis,no_scores,early_return"),
+            AsyncMock(),
+            progress=_ignore_progress,
+            search_functions={"pubmed": _runner("pubmed", 1, 5)},
+        )
+
+        assert execution.early_return == "not_applied_deep_search"
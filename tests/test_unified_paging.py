@@ -0,0 +1,233 @@
+"""Cursor paging over cached unified_search result sets."""
+
+from __future__ import annotations
+
+import base64
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pubmed_search.application.search.query_analyzer import AnalyzedQuery, QueryComplexity, QueryIntent
+from pubmed_search.application.search.result_aggregator import RankingConfig, ResultAggregator
+from pubmed_search.domain.entities.article import UnifiedArticle
+from pubmed_search.infrastructure.cache.result_set_cache import get_result_set_cache
+from pubmed_search.presentation.mcp_server.tools.unified_execution import execute_unified_search
+from pubmed_search.presentation.mcp_server.tools.unified_paging import (
+    PageCursor,
+    build_page_status,
+    execution_page_status,
+    page_markdown_note,
+    run_unified_search_page,
+)
+from pubmed_search.presentation.mcp_server.tools.unified_planning import UnifiedSearchPlan
+from pubmed_search.presentation.mcp_server.tools.unified_request import normalize_unified_search_request
+from pubmed_search.presentation.mcp_server.tools.unified_runner import run_unified_search
+from pubmed_search.shared.source_contracts import SourceAdapterResult
+
+QUERY = "precision medicine"
+KEY = "ab" * 32
+
+
+async def _ignore_progress(_current: float, _total: float, _message: str) -> None:
+    return None
+
+
+def _plan(*, limit: int = 2) -> UnifiedSearchPlan:
+    request = normalize_unified_search_request(
+        query=QUERY, limit=limit, sources="pubmed", options="shallow,no_analysis,no_scores"
+    )
+    analysis = AnalyzedQuery(
+        original_query=QUERY,
+        normalized_query=QUERY,
+        complexity=QueryComplexity.SIMPLE,
+        intent=QueryIntent.EXPLORATION,
+    )
+    return UnifiedSearchPlan(
+        request=request,
+        query=QUERY,
+        provider_neutral_query=QUERY,
+        analysis=analysis,
+        icd_matches=[],
+        enhanced_query=None,
+        deep_strategies=[],
+        matched_entity_names=[],
+        user_sources=["pubmed"],
+        dispatch_sources=["pubmed"],
+        ranking_config=RankingConfig.default(),
+        effective_min_year=None,
+        effective_max_year=None,
+    )
+
+
+def _pubmed_runner(count: int = 5) -> AsyncMock:
+    articles = [
+        UnifiedArticle(
+            title=f"Precision medicine in oncology, cohort {index}",
+            primary_source="pubmed",
+            pmid=str(1000 + index),
+            abstract="Precision medicine tailors treatment to patient biomarkers.",
+            year=2015 + index,
+        )
+        for index in range(count)
+    ]
+    return AsyncMock(
+        return_value=SourceAdapterResult(
+            source="pubmed",
+            operation="search",
+            items=articles,
+            status="ok",
+            metadata={"physical_query": QUERY, "query_executed": True, "total_available": 42},
+        )
+    )
+
+
+async def _first_page(pubmed: AsyncMock, *, limit: int = 2):
+    return await execute_unified_search(
+        _plan(limit=limit), AsyncMock(), progress=_ignore_progress, search_functions={"pubmed": pubmed}
+    )
+
+
+class TestPageCursor:
+    def test_round_trip(self):
+        cursor = PageCursor(KEY, 20)
+        encoded = cursor.encode()
+        assert "=" not in encoded
+        assert PageCursor.decode(encoded) == cursor
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "not base64!",
+            base64.urlsafe_b64encode(f"p0:{KEY}:2".encode()).decode(),
+            base64.urlsafe_b64encode(b"p1:short:2").decode(),
+            base64.urlsafe_b64encode(f"p1:{KEY}:-1".encode()).decode(),
+            "",
+        ],
+    )
+    def test_malformed_cursors_are_rejected(self, raw):
+        with pytest.raises(ValueError, match="invalid cursor"):
+            PageCursor.decode(raw)
+
+
+class TestPageStatus:
+    def test_next_cursor_points_past_the_returned_window(self):
+        page = build_page_status(KEY, offset=10, returned=10, total=25)
+        assert page["has_more"] is True
+        assert PageCursor.decode(page["next_cursor"]) == PageCursor(KEY, 20)
+
+    def test_last_or_unmaterialized_pages_have_no_cursor(self):
+        assert build_page_status(KEY, offset=20, returned=5, total=25)["next_cursor"] is None
+        assert build_page_status(None, offset=0, returned=5, total=25)["next_cursor"] is None
+        assert page_markdown_note(build_page_status(KEY, offset=20, returned=5, total=25), QUERY) == ""
+
+    def test_markdown_note_quotes_the_query(self):
+        note = page_markdown_note(build_page_status(KEY, offset=0, returned=10, total=25), 'say "hi"')
+        assert "15 more ranked candidates" in note
+        assert 'query="say \\"hi\\""' in note
+
+
+class TestExecutionMaterialization:
+    @pytest.mark.asyncio
+    async def test_full_candidate_list_is_cached_and_only_the_first_page_is_ranked(self):
+        execution = await _first_page(_pubmed_runner())
+
+        assert len(execution.ranked) == 2
+        assert execution.total_candidates == 5
+        assert execution.result_set_key is not None
+        articles, metadata, total = get_result_set_cache().get_page(execution.result_set_key, 0, None)
+        assert total == 5
+        assert metadata["ranked_count"] == 2
+        assert [article.pmid for article in articles[:2]] == [article.pmid for article in execution.ranked]
+
+        page = execution_page_status(execution)
+        assert page["has_more"] is True
+        assert PageCursor.decode(page["next_cursor"]) == PageCursor(execution.result_set_key, 2)
+
+
+class TestRunUnifiedSearchPage:
+    @pytest.mark.asyncio
+    async def test_next_page_is_served_from_the_cache(self):
+        pubmed = _pubmed_runner()
+        execution = await _first_page(pubmed)
+        cursor = execution_page_status(execution)["next_cursor"]
+        full_ranking = ResultAggregator().rank(list(pubmed.return_value.items), RankingConfig.default(), QUERY)
+
+        payload = json.loads(await run_unified_search_page(cursor=cursor, query=QUERY, limit=2, output_format="json"))
+
+        pubmed.assert_awaited_once()
+        assert [article["identifiers"]["pmid"] for article in payload["articles"]] == [
+            article.pmid for article in full_ranking[2:4]
+        ]
+        assert payload["search_status"]["cache_status"] == "hit"
+        page = payload["search_status"]["page"]
+        assert (page["offset"], page["returned"], page["total_candidates"]) == (2, 2, 5)
+        assert PageCursor.decode(page["next_cursor"]).offset == 4
+
+    @pytest.mark.asyncio
+    async def test_tail_is_ranked_once_and_the_first_page_keeps_its_order(self):
+        execution = await _first_page(_pubmed_runner())
+        cursor = execution_page_status(execution)["next_cursor"]
+
+        await run_unified_search_page(cursor=cursor, query=QUERY, limit=2, output_format="json")
+
+        articles, metadata, total = get_result_set_cache().get_page(execution.result_set_key, 0, None)
+        assert metadata["ranked_count"] == total == 5
+        assert [article.pmid for article in articles[:2]] == [article.pmid for article in execution.ranked]
+        assert len({article.pmid for article in articles}) == 5
+
+    @pytest.mark.asyncio
+    async def test_ranking_the_tail_keeps_the_first_page_scores(self, monkeypatch):
+        execution = await _first_page(_pubmed_runner())
+        cursor = execution_page_status(execution)["next_cursor"]
+        articles, _metadata, _total = get_result_set_cache().get_page(execution.result_set_key, 0, 2)
+        served = [(article.ranking_score, article.relevance_score, article.quality_score) for article in articles]
+        rank = ResultAggregator.rank
+
+        def rescoring_rank(self, *args, **kwargs):
+            # A full ranking normalises over a different set than the first page did.
+            ranked = rank(self, *args, **kwargs)
+            for article in ranked:
+                article.ranking_score = 0.0
+            return ranked
+
+        monkeypatch.setattr(ResultAggregator, "rank", rescoring_rank)
+
+        await run_unified_search_page(cursor=cursor, query=QUERY, limit=2, output_format="json")
+
+        articles, _metadata, _total = get_result_set_cache().get_page(execution.result_set_key, 0, 2)
+        assert [(article.ranking_score, article.relevance_score, article.quality_score) for article in articles] == (
+            served
+        )
+        assert [score for score, _relevance, _quality in served] == sorted(
+            (score for score, _relevance, _quality in served), reverse=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_markdown_page_continues_the_numbering(self):
+        execution = await _first_page(_pubmed_runner())
+        cursor = execution_page_status(execution)["next_cursor"]
+
+        text = await run_unified_search_page(cursor=cursor, query=QUERY, limit=2)
+
+        assert "### 3." in text
+        assert "### 1." not in text
+        assert "**More results**: 1 more ranked candidates" in text
+
+    @pytest.mark.asyncio
+    async def test_unknown_result_set_reports_an_expired_cursor(self):
+        text = await run_unified_search_page(cursor=PageCursor(KEY, 10).encode(), query=QUERY, output_format="json")
+        assert "cursor expired" in text
+
+    @pytest.mark.asyncio
+    async def test_runner_dispatches_cursor_calls_to_the_cache(self):
+        execution = await _first_page(_pubmed_runner())
+        cursor = execution_page_status(execution)["next_cursor"]
+        searcher = AsyncMock()
+
+        text = await run_unified_search(searcher=searcher, query=QUERY, limit=10, output_format="json", cursor=cursor)
+
+        payload = json.loads(text)
+        assert payload["search_status"]["page"]["returned"] == 3
+        assert payload["search_status"]["page"]["next_cursor"] is None
+        assert searcher.mock_calls == []
@@ -0,0 +1,239 @@
+"""Result-set cache for repeated unified searches."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pubmed_search.application.search.query_analyzer import AnalyzedQuery, QueryComplexity, QueryIntent
+from pubmed_search.application.search.result_aggregator import AggregationStats, RankingConfig
+from pubmed_search.domain.entities.article import UnifiedArticle
+from pubmed_search.infrastructure.cache.result_set_cache import ResultSetCache, get_result_set_cache
+from pubmed_search.presentation.mcp_server.tools.unified_execution import execute_unified_search
+from pubmed_search.presentation.mcp_server.tools.unified_formatting import _format_as_json
+from pubmed_search.presentation.mcp_server.tools.unified_helpers import DispatchStrategy
+from pubmed_search.presentation.mcp_server.tools.unified_planning import UnifiedSearchPlan
+from pubmed_search.presentation.mcp_server.tools.unified_request import normalize_unified_search_request
+from pubmed_search.shared.source_contracts import SourceAdapterError, SourceAdapterResult
+
+QUERY = "precision medicine"
+
+
+async def _ignore_progress(_current: float, _total: float, _message: str) -> None:
+    return None
+
+
+def _plan(*, options: str = "shallow,no_analysis,no_scores", limit: int = 10) -> UnifiedSearchPlan:
+    request = normalize_unified_search_request(query=QUERY, limit=limit, sources="pubmed", options=options)
+    analysis = AnalyzedQuery(
+        original_query=QUERY,
+        normalized_query=QUERY,
+        complexity=QueryComplexity.SIMPLE,
+        intent=QueryIntent.EXPLORATION,
+    )
+    return UnifiedSearchPlan(
+        request=request,
+        query=QUERY,
+        provider_neutral_query=QUERY,
+        analysis=analysis,
+        icd_matches=[],
+        enhanced_query=None,
+        deep_strategies=[],
+        matched_entity_names=[],
+        user_sources=["pubmed"],
+        dispatch_sources=["pubmed"],
+        ranking_config=RankingConfig.default(),
+        effective_min_year=None,
+        effective_max_year=None,
+    )
+
+
+def _articles() -> list[UnifiedArticle]:
+    return [
+        UnifiedArticle(
+            title=f"Precision medicine in oncology, cohort {index}",
+            primary_source="pubmed",
+            pmid=str(1000 + index),
+            abstract="Precision medicine tailors treatment to patient biomarkers.",
+            year=2020 + index,
+        )
+        for index in range(3)
+    ]
+
+
+def _pubmed_runner(articles: list[UnifiedArticle] | None = None) -> AsyncMock:
+    return AsyncMock(
+        return_value=SourceAdapterResult(
+            source="pubmed",
+            operation="search",
+            items=articles if articles is not None else _articles(),
+            status="ok",
+            metadata={"physical_query": QUERY, "query_executed": True, "total_available": 42},
+        )
+    )
+
+
+class TestResultSetCache:
+    def test_rehydrates_copies_with_the_scores_of_each_set(self):
+        cache = ResultSetCache()
+        articles = _articles()
+        for position, article in enumerate(articles):
+            article.ranking_score = 1.0 - position / 10
+        cache.put("first", articles, {"pubmed_total_count": 42, "source_metadata": {"pubmed": {"warnings": []}}})
+        reordered = [articles[2], articles[0]]
+        reordered[0].ranking_score = 0.9
+        reordered[1].ranking_score = 0.5
+        cache.put("second", reordered, {})
+
+        hit = cache.get("first")
+        assert hit is not None
+        cached, metadata = hit
+        assert [article.pmid for article in cached] == ["1000", "1001", "1002"]
+        assert [article.ranking_score for article in cached] == [1.0, 0.9, 0.8]
+        assert all(copy is not original for copy, original in zip(cached, articles))
+        assert metadata == {"pubmed_total_count": 42, "source_metadata": {"pubmed": {"warnings": []}}}
+
+        metadata["source_metadata"]["pubmed"]["warnings"].append("changed by a caller")
+        cached[0].title = "changed by a caller"
+        again, metadata_again = cache.get("first")
+        assert metadata_again["source_metadata"]["pubmed"]["warnings"] == []
+        assert again[0].title == articles[0].title
+
+        second, _ = cache.get("second")
+        assert [(article.pmid, article.ranking_score) for article in second] == [("1002", 0.9), ("1000", 0.5)]
+
+    def test_evicted_article_turns_the_set_into_a_miss(self):
+        cache = ResultSetCache(max_articles=3)
+        cache.put("first", _articles(), {})
+        cache.put("other", [UnifiedArticle(title="Unrelated work", primary_source="pubmed", pmid="9")], {})
+
+        assert cache.get("first") is None
+        assert len(cache) == 1
+
+    def test_expired_sets_are_misses(self):
+        cache = ResultSetCache(ttl=0)
+        cache.put("first", _articles(), {})
+        assert cache.get("first") is None
+
+    def test_duplicate_canonical_keys_are_not_stored(self):
+        cache = ResultSetCache()
+        article = _articles()[0]
+        assert cache.put("dup", [article, replace(article)], {}) is False
+        assert cache.get("dup") is None
+
+
+class TestResultCacheKey:
+    def test_presentation_options_share_a_key(self):
+        base = DispatchStrategy.result_cache_key(_plan())
+        assert DispatchStrategy.result_cache_key(_plan(options="shallow,no_analysis,no_scores,compact")) == base
+        assert DispatchStrategy.result_cache_key(_plan(options="shallow,no_cache")) == base
+
+    @pytest.mark.parametrize(
+        "options", ["shallow,no_oa", "shallow,all_types", "shallow,systematic", "shallow,preprints"]
+    )
+    def test_retrieval_options_change_the_key(self, options):
+        assert DispatchStrategy.result_cache_key(_plan(options=options)) != DispatchStrategy.result_cache_key(_plan())
+
+    def test_limit_filters_and_ranking_change_the_key(self):
+        base = DispatchStrategy.result_cache_key(_plan())
+        assert DispatchStrategy.result_cache_key(_plan(limit=20)) != base
+        assert DispatchStrategy.result_cache_key(replace(_plan(), effective_min_year=2020)) != base
+        assert (
+            DispatchStrategy.result_cache_key(replace(_plan(), ranking_config=RankingConfig.recency_focused())) != base
+        )
+        assert DispatchStrategy.result_cache_key(replace(_plan(), dispatch_sources=["pubmed", "openalex"])) != base
+
+
+class TestExecutionCache:
+    @pytest.mark.asyncio
+    async def test_repeat_search_is_served_from_the_cache(self):
+        pubmed = _pubmed_runner()
+        first = await execute_unified_search(
+            _plan(), AsyncMock(), progress=_ignore_progress, search_functions={"pubmed": pubmed}
+        )
+        second = await execute_unified_search(
+            _plan(options="shallow,compact"),
+            AsyncMock(),
+            progress=_ignore_progress,
+            search_functions={"pubmed": pubmed},
+        )
+
+        pubmed.assert_awaited_once()
+        assert (first.cache_status, second.cache_status) == ("miss", "hit")
+        assert [article.pmid for article in second.ranked] == [article.pmid for article in first.ranked]
+        assert [article.ranking_score for article in second.ranked] == [
+            article.ranking_score for article in first.ranked
+        ]
+        assert second.pubmed_total_count == first.pubmed_total_count == 42
+        assert second.source_api_counts == first.source_api_counts
+        assert second.source_statuses == first.source_statuses
+        assert second.source_metadata == first.source_metadata
+        assert second.stats.unique_articles == first.stats.unique_articles
+
+    @pytest.mark.asyncio
+    async def test_no_cache_option_bypasses_and_refreshes_the_cached_set(self):
+        await execute_unified_search(
+            _plan(), AsyncMock(), progress=_ignore_progress, search_functions={"pubmed": _pubmed_runner()}
+        )
+        fresh = _pubmed_runner(_articles()[:1])
+        bypassed = await execute_unified_search(
+            _plan(options="shallow,no_analysis,no_scores,no_cache"),
+            AsyncMock(),
+            progress=_ignore_progress,
+            search_functions={"pubmed": fresh},
+        )
+        repeated = await execute_unified_search(
+            _plan(), AsyncMock(), progress=_ignore_progress, search_functions={"pubmed": fresh}
+        )
+
+        fresh.assert_awaited_once()
+        assert bypassed.cache_status == "bypass"
+        assert repeated.cache_status == "hit"
+        assert [article.pmid for article in repeated.ranked] == ["1000"]
+
+    @pytest.mark.asyncio
+    async def test_results_with_source_errors_are_not_cached(self):
+        failing = AsyncMock(
+            return_value=SourceAdapterResult.failure(
+                source="pubmed",
+                operation="search",
+                error=SourceAdapterError(
+                    source="pubmed", operation="search", message="Request timed out", kind="timeout", retryable=True
+                ),
+            )
+        )
+        first = await execute_unified_search(
+            _plan(options="shallow,no_relax"),
+            AsyncMock(),
+            progress=_ignore_progress,
+            search_functions={"pubmed": failing},
+        )
+        second = await execute_unified_search(
+            _plan(options="shallow,no_relax"),
+            AsyncMock(),
+            progress=_ignore_progress,
+            search_functions={"pubmed": failing},
+        )
+
+        assert failing.await_count == 2
+        assert (first.cache_status, second.cache_status) == ("not_stored", "not_stored")
+        assert len(get_result_set_cache()) == 0
+
+
+def test_cache_status_is_reported_in_search_status():
+    analysis = AnalyzedQuery(
+        original_query=QUERY,
+        normalized_query=QUERY,
+        complexity=QueryComplexity.SIMPLE,
+        intent=QueryIntent.EXPLORATION,
+    )
+    stats = AggregationStats(total_input=3, unique_articles=3, by_source={"pubmed": 3})
+
+    payload = json.loads(
+        _format_as_json(_articles(), analysis, stats, source_api_counts={"pubmed": (3, 42)}, cache_status="hit")
+    )
+    assert payload["search_status"]["cache_status"] == "hit"
+    assert "cache_status" not in json.loads(_format_as_json(_articles(), analysis, stats))["search_status"]
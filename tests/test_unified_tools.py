@@ -475,6 +475,26 @@ class TestFormatAsJson:
         assert parsed == {"status": "truncated"}
         assert len(result) <= 50
 
+    async def test_cached_article_fragments_match_plain_serialization(self):
+        analysis = self._analysis()
+        stats = self._stats()
+        articles = [
+            UnifiedArticle(
+                title="Sepsis — cohort", primary_source="pubmed", pmid="1", authors=[Author(full_name="Müller A")]
+            ),
+            UnifiedArticle(title="Second", primary_source="openalex", doi="10.1/x"),
+        ]
+        articles[0].ranking_score = 0.5
+
+        first = _format_as_json(articles, analysis, stats, max_response_chars=None)
+        parsed = json.loads(first)
+        assert first == json.dumps(parsed, ensure_ascii=False, indent=2)
+        assert parsed["articles"] == [article.to_dict() for article in articles]
+
+        articles[0].ranking_score = 0.9
+        second = _format_as_json(articles, analysis, stats, max_response_chars=None)
+        assert json.loads(second)["articles"][0]["_ranking_score"] == 0.9
+
     async def test_counts_first_orientation_payload(self):
         analysis = MagicMock(spec=AnalyzedQuery)
         analysis.original_query = "remimazolam sedation"
@@ -489,6 +509,7 @@ class TestFormatAsJson:
         article.pmid = "12345678"
         article.pmc = "PMC1234567"
         article.to_dict.return_value = {"pmid": "12345678"}
+        article.cached_serialization.side_effect = lambda _variant, encode: encode(article)
 
         result = _format_as_json(
             [article],